@@ -0,0 +1,180 @@
+"""
+Kullanıcı hesabı endpoint'leri: kayıt, giriş, Google OAuth, favoriler, arama geçmişi, profil.
+Ağır SDK'ları ve veri setlerini import etmez.
+"""
+
+from rest_framework import viewsets, status, permissions
+from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.authtoken.models import Token
+from django.contrib.auth import authenticate
+from django.contrib.auth.models import User
+from django.conf import settings
+
+from .models import FavoriteVenue, SearchHistory, UserProfile
+from .serializers import (
+    UserSerializer, UserRegistrationSerializer,
+    FavoriteVenueSerializer, SearchHistorySerializer,
+    UserProfileSerializer
+)
+
+
+@api_view(['POST'])
+@permission_classes([permissions.AllowAny])
+def register(request):
+    """Kullanıcı kayıt endpoint'i"""
+    serializer = UserRegistrationSerializer(data=request.data)
+    if serializer.is_valid():
+        user = serializer.save()
+        token, _ = Token.objects.get_or_create(user=user)
+        return Response({
+            'token': token.key,
+            'user': UserSerializer(user).data
+        }, status=status.HTTP_201_CREATED)
+    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+@api_view(['POST'])
+@permission_classes([permissions.AllowAny])
+def login(request):
+    """Kullanıcı giriş endpoint'i"""
+    username = request.data.get('username')
+    password = request.data.get('password')
+    
+    user = authenticate(username=username, password=password)
+    if user:
+        token, _ = Token.objects.get_or_create(user=user)
+        return Response({
+            'token': token.key,
+            'user': UserSerializer(user).data
+        })
+    return Response({'error': 'Geçersiz kullanıcı adı veya şifre'}, status=status.HTTP_401_UNAUTHORIZED)
+
+
+@api_view(['POST'])
+def logout(request):
+    """Kullanıcı çıkış endpoint'i"""
+    request.user.auth_token.delete()
+    return Response({'message': 'Başarıyla çıkış yapıldı'})
+
+
+@api_view(['POST'])
+@permission_classes([permissions.AllowAny])
+def google_login(request):
+    """Google OAuth ile kullanıcı girişi"""
+    from google.oauth2 import id_token
+    from google.auth.transport import requests as google_requests
+
+    credential = request.data.get('credential')
+
+    if not credential:
+        return Response(
+            {'error': 'Google credential eksik'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        # Google ID token'i dogrula
+        idinfo = id_token.verify_oauth2_token(
+            credential,
+            google_requests.Request(),
+            settings.GOOGLE_OAUTH_CLIENT_ID
+        )
+
+        # Token'dan kullanici bilgilerini al
+        google_id = idinfo['sub']
+        email = idinfo.get('email', '')
+        first_name = idinfo.get('given_name', '')
+        last_name = idinfo.get('family_name', '')
+        picture = idinfo.get('picture', '')
+
+        # Kullaniciyi bul veya olustur (email'e gore)
+        user, created = User.objects.get_or_create(
+            email=email,
+            defaults={
+                'username': email.split('@')[0] + '_' + google_id[:8],
+                'first_name': first_name,
+                'last_name': last_name,
+            }
+        )
+
+        # Mevcut kullanici ise bilgilerini guncelle
+        if not created:
+            user.first_name = first_name or user.first_name
+            user.last_name = last_name or user.last_name
+            user.save()
+
+        # UserProfile olustur/guncelle
+        profile, _ = UserProfile.objects.get_or_create(user=user)
+
+        # Google avatar ve auth bilgilerini kaydet
+        if not profile.preferences:
+            profile.preferences = {}
+        profile.preferences['avatar_url'] = picture
+        profile.preferences['auth_provider'] = 'google'
+        profile.preferences['google_id'] = google_id
+        profile.save()
+
+        # Token olustur
+        token, _ = Token.objects.get_or_create(user=user)
+
+        return Response({
+            'token': token.key,
+            'user': {
+                'id': user.id,
+                'username': user.username,
+                'email': user.email,
+                'first_name': user.first_name,
+                'last_name': user.last_name,
+                'avatar_url': picture,
+            },
+            'created': created
+        }, status=status.HTTP_200_OK)
+
+    except ValueError as e:
+        return Response(
+            {'error': f'Gecersiz Google token: {str(e)}'},
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+    except Exception as e:
+        return Response(
+            {'error': f'Google giris hatasi: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+class FavoriteVenueViewSet(viewsets.ModelViewSet):
+    """Favori mekanlar CRUD işlemleri"""
+    serializer_class = FavoriteVenueSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return FavoriteVenue.objects.filter(user=self.request.user)
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+
+class SearchHistoryViewSet(viewsets.ReadOnlyModelViewSet):
+    """Arama geçmişi görüntüleme"""
+    serializer_class = SearchHistorySerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return SearchHistory.objects.filter(user=self.request.user)
+
+
+class UserProfileViewSet(viewsets.ModelViewSet):
+    """Kullanıcı profili yönetimi"""
+    serializer_class = UserProfileSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return UserProfile.objects.filter(user=self.request.user)
+
+    @action(detail=False, methods=['get'])
+    def me(self, request):
+        """Mevcut kullanıcının profilini getir"""
+        profile, _ = UserProfile.objects.get_or_create(user=request.user)
+        serializer = self.get_serializer(profile)
+        return Response(serializer.data)
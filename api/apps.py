@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # Benchmark / load test: OUTBOUND_STUBS=replay ile dış servisler stub'lanır
+        from .outbound_stubs import install_from_settings
+        install_from_settings()
@@ -0,0 +1,259 @@
+"""
+Async (ASGI) versions of the slow venue endpoints.
+
+Under ASGI one worker can hold many in-flight generations because outbound
+Google Places / Gemini I/O is awaited instead of blocking a worker thread.
+generate_venues is async for the Nearby Search category pipeline only; its
+other branches still run the sync view in the thread pool.
+Enabled via ASYNC_VIEWS (set automatically by maksat_backend/asgi.py).
+api/views.py is imported on first call, not at URLconf load.
+"""
+
+import asyncio
+import json
+import logging
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from .models import SearchHistory
+from .serializers import VenueGenerateSerializer, VenueSearchSerializer
+from .task_queue import defer
+from .similar_service import cache_similar, describe_places_async, get_cached_similar
+from .timing import span
+from .vibe_service import analyze_vibes_async
+from .venue_search import search_cached_venues
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+PLACES_TEXTSEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+PLACES_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+HTTP_TIMEOUT_SECONDS = 15
+PLACES_DETAILS_FIELDS = 'name,formatted_address,rating,photo,type,price_level'   # views.SEARCH_DETAILS_FIELDS
+
+
+def _json_response(data, status=200):
+    """DRF JSONRenderer ile aynı (UTF-8, ensure_ascii=False) çıktı."""
+    return JsonResponse(data, status=status, safe=False, json_dumps_params={'ensure_ascii': False})
+
+
+def _parse_body(request) -> dict:
+    try:
+        return json.loads(request.body or b'{}')
+    except (ValueError, UnicodeDecodeError):
+        return {}
+
+
+async def _authenticate(request):
+    """DRF TokenAuthentication'ı async view'da çalıştır; anonim ise None döner."""
+    try:
+        result = await sync_to_async(TokenAuthentication().authenticate)(request)
+    except AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+async def _fetch_place_details(client: httpx.AsyncClient, place_id: str) -> dict:
+    with span('places.details'):
+        response = await client.get(PLACES_DETAILS_URL, params={
+            'place_id': place_id,
+            'fields': PLACES_DETAILS_FIELDS,
+            'language': 'tr',
+            'key': settings.GOOGLE_MAPS_API_KEY,
+        })
+    response.raise_for_status()
+    return response.json().get('result', {})
+
+
+@csrf_exempt
+@require_POST
+async def generate_venues(request):
+    """
+    AI destekli mekan önerisi (ASGI).
+    Nearby Search kategorileri (venue_categories registry) AsyncVenuePipeline ile çalışır:
+    Places ve Gemini çağrıları beklenir, istek boyunca thread tutulmaz. Diğer dallar
+    (Fine Dining, varsayılan Text Search yolu, etkinlik / deneyim kategorileri) henüz
+    senkron; onlar için views.generate_venues thread pool'da çalıştırılır.
+    """
+    from . import views
+    from .opening_hours import public_venue
+    from .venue_categories import get_category_config
+    from .venue_pipeline import arun_category_pipeline
+
+    serializer = VenueGenerateSerializer(data=_parse_body(request))
+    config = get_category_config(serializer.validated_data['category']['name']) if serializer.is_valid() else None
+    if config is None:
+        return await sync_to_async(views.generate_venues, thread_sensitive=False)(request)
+
+    data = serializer.validated_data
+    try:
+        venues = await arun_category_pipeline(config, data['location'], data.get('filters', {}), set(data.get('excludeIds', [])))
+    except Exception as e:
+        logger.exception("❌ %s generation error: %s", config.name, e)
+        return _json_response({'error': f'{config.error_message}: {str(e)}'}, status=500)
+    return _json_response([public_venue(v) for v in venues])
+
+
+async def _search_response(request, query, location, venues, source):
+    """views._search_response'ın async karşılığı (arama geçmişi + cevap)."""
+    user = await _authenticate(request)
+    if user is not None:
+        defer(
+            SearchHistory.objects.create,
+            user=user,
+            query=query,
+            intent=query,
+            location=location,
+            results_count=len(venues)
+        )
+
+    return _json_response({
+        'query': query,
+        'location': location,
+        'source': source,
+        'results': venues
+    })
+
+
+@csrf_exempt
+@require_POST
+async def search_venues(request):
+    """Venue arama (ASGI) - önce yerel full-text indeks; yoksa Place Details + batch vibe eşzamanlı"""
+    from . import views
+    serializer = VenueSearchSerializer(data=_parse_body(request))
+    if not serializer.is_valid():
+        return _json_response(serializer.errors, status=400)
+
+    query = serializer.validated_data['query']
+    location = serializer.validated_data['location']
+    radius = serializer.validated_data['radius']
+
+    try:
+        # Önce cache'teki mekanlar üzerinde full-text arama; yeterli sonuç varsa Places'a gidilmez
+        with span('search.local'):
+            venues = await sync_to_async(search_cached_venues, thread_sensitive=False)(query, location)
+        if venues is not None:
+            return await _search_response(request, query, location, venues, source='cache')
+
+        if not settings.GOOGLE_MAPS_API_KEY:
+            return _json_response({'error': 'Google Maps API key eksik'}, status=503)
+
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS) as client:
+            with span('places.textsearch'):
+                response = await client.get(PLACES_TEXTSEARCH_URL, params={
+                    'query': query,
+                    'location': location,
+                    'radius': radius,
+                    'language': 'tr',
+                    'key': settings.GOOGLE_MAPS_API_KEY,
+                })
+            response.raise_for_status()
+            places = response.json().get('results', [])[:10]  # İlk 10 sonuç
+
+            # Tüm detay çağrıları ve tek batch vibe çağrısı (Text Search verisiyle) aynı anda
+            model = views.get_genai_model()
+            vibes, *details_list = await asyncio.gather(
+                analyze_vibes_async(model, [views.build_search_venue_data(p['place_id'], p) for p in places]),
+                *[_fetch_place_details(client, place['place_id']) for place in places]
+            )
+
+        venues = []
+        for place, details in zip(places, details_list):
+            venue_data = views.build_search_venue_data(place['place_id'], details)
+            venue_data['vibe_score'] = vibes.get(place['place_id'], {})
+            venues.append(venue_data)
+
+        return await _search_response(request, query, location, venues, source='places')
+
+    except Exception as e:
+        return _json_response({'error': f'Arama hatası: {str(e)}'}, status=500)
+
+
+@csrf_exempt
+@require_POST
+async def get_similar_venues(request):
+    """Benzer mekanlar (ASGI) - tek batch açıklama çağrısı, sonuçlar cache'li (similar_service)"""
+    from . import views
+    data = _parse_body(request)
+    venue_name = data.get('venueName')
+    venue_type = data.get('venueType')
+    location_query = data.get('location')
+
+    if not venue_name or not location_query:
+        return _json_response({'error': 'venueName ve location gerekli'}, status=400)
+
+    cached = await sync_to_async(get_cached_similar, thread_sensitive=False)(location_query, venue_type)
+    if cached is not None:
+        return _json_response(cached)
+
+    try:
+        search_type = views.SIMILAR_TYPE_QUERY_MAP.get(venue_type, 'restaurant cafe')
+
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS) as client:
+            with span('places.textsearch'):
+                response = await client.get(PLACES_TEXTSEARCH_URL, params={
+                    'query': f"{search_type} in {location_query}",
+                    'language': 'tr',
+                    'key': settings.GOOGLE_MAPS_API_KEY,
+                })
+
+        if response.status_code != 200:
+            return _json_response({'error': f'Google Places API hatası: {response.status_code}'}, status=503)
+
+        places = response.json().get('results', [])[:8]  # İlk 8 mekan
+        ai_data = await describe_places_async(views.get_genai_model(), places, venue_type)
+
+        similar_venues = [
+            views.build_similar_venue(idx, place, venue_type, location_query, ai_data.get(place.get('place_id')))
+            for idx, place in enumerate(places)
+        ]
+        # Açıklaması eksik (Gemini hatası) sonuç cache'lenmez, bir sonraki istek tekrar dener
+        if len(ai_data) == len(places):
+            await sync_to_async(cache_similar, thread_sensitive=False)(location_query, venue_type, similar_venues)
+        return _json_response(similar_venues)
+
+    except Exception as e:
+        import traceback
+        logger.warning("Similar venues hatası: %s", e)
+        logger.error("%s", traceback.format_exc())
+        return _json_response({'error': f'Benzer mekanlar getirilirken hata: {str(e)}'}, status=500)
+
+
+@csrf_exempt
+@require_POST
+async def stream_vacation_itinerary(request):
+    """Tatil rotası NDJSON stream'i (ASGI) - aralıklar async generator ile, worker thread'i tutmadan"""
+    from .itinerary import aiter_itinerary, chunk_line, done_line, error_line
+    from .venue_sources import get_genai_model
+    serializer = VenueGenerateSerializer(data=_parse_body(request))
+    if not serializer.is_valid():
+        return _json_response(serializer.errors, status=400)
+
+    data = serializer.validated_data
+    model = get_genai_model()
+    if not model:
+        return _json_response({'error': 'Gemini API key eksik'}, status=503)
+
+    async def lines():
+        total = 0
+        try:
+            async for days, activities in aiter_itinerary(model, data['location'], data.get('tripDuration'), data.get('filters', {})):
+                total += len(activities)
+                yield chunk_line(days, activities)
+        except Exception as e:
+            yield error_line(e)
+            return
+        yield done_line(total)
+
+    response = StreamingHttpResponse(lines(), content_type='application/x-ndjson; charset=utf-8')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx / Render proxy buffer'lamasın
+    return response
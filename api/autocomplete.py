@@ -0,0 +1,288 @@
+"""
+Mekan ve Semt Autocomplete İndeksi
+
+Frontend'de autocomplete olmadığı için yarım yazılmış sorgular tam generate_venues /
+search_venues çağrılarına dönüşüyordu. Burada bellekte sıralı diziler + bisect ile prefix
+araması yapılır:
+
+- Kaynaklar: CachedVenue isimleri, G&M (statik liste + GaultMillauVenue), POPULAR_VENUES,
+  LOCATION_DATA ilçe ve semtleri.
+- Her öneri için Türkçe normalize (ı→i, İ→i, ş→s, ...) tam isim ve kelime başları anahtar olur:
+  "Asmalı Cavit" → "asmali cavit", "cavit". Anahtarlar şehir ve sıralama katmanı (isim
+  başı / kelime başı × tür) başına ayrı sıralı dizilerde tutulur; "mod" için her katmanda
+  bisect_left(keys, "mod") .. bisect_left(keys, "mod\\uffff") aralığı, katmanlar skor sırasıyla
+  taranır ve limit dolunca durulur.
+- Artımlı güncelleme: save_venues_to_cache_swr yeni mekanları note_cache_write ile bildirir,
+  anahtarlar insort ile eklenir. Bayraklı mekanlar (SERVE_EXCLUDE_Q) önerilmez; sonradan
+  bayraklanan mekan aramada atlanır. Silinen kayıtlar INDEX_MAX_AGE_SECONDS sonra tam yeniden
+  kurulumda düşer.
+- Kurulum global kilidin dışında yapılır: ilk kurulumu sadece o anki ilk sorgular bekler,
+  yeniden kurulum task_queue.defer ile arka planda çalışır ve hazır olunca tek atamayla
+  değiştirilir; o sırada eski indeks servis edilir, gelen yazımlar yeni indekse de uygulanır.
+
+Kullanım:
+    suggestions = suggest('mod', city='İstanbul', limit=8)     # [Suggestion, ...]
+"""
+
+import bisect
+import logging
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .task_queue import defer
+from .venue_flags import SERVE_EXCLUDE_Q, is_served
+from .venue_search import fold, tokens
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+MIN_PREFIX_LEN = 2                  # Tek harfte binlerce eşleşme olur, frontend 2. harfte başlasın
+DEFAULT_LIMIT = 8
+MAX_LIMIT = 20
+MAX_SCAN = 400                      # Bir katmanın prefix aralığında en fazla bu kadar anahtar sıralanır
+INDEX_MAX_AGE_SECONDS = 6 * 3600    # Silinen kayıtları düşürmek için periyodik tam kurulum (arka planda)
+
+# Aynı skorda gösterim önceliği (küçük önce)
+KIND_PRIORITY = {'neighborhood': 0, 'district': 1, 'venue': 2, 'gault_millau': 3, 'popular': 4}
+UNKNOWN_KIND_PRIORITY = 9
+# Tarama sırası: isim başından eşleşme > kelime ortasından eşleşme, sonra tür önceliği
+TIERS = [(from_start, priority) for from_start in (0, 1)
+         for priority in sorted({*KIND_PRIORITY.values(), UNKNOWN_KIND_PRIORITY})]
+CITY_LABELS = {'istanbul': 'İstanbul', 'izmir': 'İzmir', 'mugla': 'Muğla'}
+
+
+class Suggestion(NamedTuple):
+    label: str
+    kind: str               # neighborhood | district | venue | gault_millau | popular
+    city: str
+    district: str = ''
+    place_id: str = ''
+    category: str = ''
+
+    def to_dict(self) -> dict:
+        data = {'label': self.label, 'type': self.kind, 'city': self.city}
+        if self.district:
+            data['district'] = self.district
+        if self.place_id:
+            data['placeId'] = self.place_id
+        if self.category:
+            data['category'] = self.category
+        return data
+
+
+def _title(name: str) -> str:
+    """POPULAR_VENUES anahtarları küçük harf: 'asmalı cavit' → 'Asmalı Cavit'."""
+    return ' '.join({'i': 'İ'}.get(word[0], word[0].upper()) + word[1:] for word in name.split() if word)
+
+
+class _KeyArray:
+    """Sıralı (anahtar, öneri no) dizisi; bisect ile prefix aralığı."""
+    __slots__ = ('keys', 'refs')
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.refs: List[int] = []
+
+    def add(self, key: str, number: int, bulk: bool) -> None:
+        if bulk:
+            self.keys.append(key)
+            self.refs.append(number)
+        else:
+            position = bisect.bisect_left(self.keys, key)
+            self.keys.insert(position, key)
+            self.refs.insert(position, number)
+
+    def sort(self) -> None:
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self.keys = [self.keys[i] for i in order]
+        self.refs = [self.refs[i] for i in order]
+
+    def matches(self, prefix: str) -> List[int]:
+        start = bisect.bisect_left(self.keys, prefix)
+        end = min(bisect.bisect_left(self.keys, prefix + '\uffff'), start + MAX_SCAN)
+        return self.refs[start:end]
+
+
+class AutocompleteIndex:
+    """
+    Şehir ve sıralama katmanı başına sıralı anahtar dizileri.
+
+    Katman = (isim başından mı, tür önceliği); katmanlar skor sırasıyla taranır, böylece 500
+    "Kaa Cafe N" anahtarı "Kadıköy"ün önüne geçemez ve başka şehrin mekanları MAX_SCAN'i
+    doldurmaz. MAX_SCAN sadece tek bir katman içindeki (uzunluk, isim) sırasını sınırlar.
+    """
+
+    def __init__(self):
+        self.arrays: Dict[Tuple[str, int, int], _KeyArray] = {}   # (şehir ya da '' = tümü, katman) → dizi
+        self.items: List[Suggestion] = []
+        self.seen: Dict[str, int] = {}      # 'kind:kimlik' → öneri no (tekrar ekleme yok)
+        self.removed: Set[int] = set()      # Bayraklanan mekanlar; anahtarları kalır, aramada atlanır
+        self.built_at = time.monotonic()
+
+    @property
+    def key_count(self) -> int:
+        return sum(len(array.keys) for (scope, *_), array in self.arrays.items() if not scope)
+
+    def _item_keys(self, label: str) -> List[str]:
+        words = tokens(label)
+        return list(dict.fromkeys(' '.join(words[i:]) for i in range(len(words))))
+
+    def add(self, identity: str, suggestion: Suggestion, bulk: bool = False) -> None:
+        if identity in self.seen:
+            self.removed.discard(self.seen[identity])
+            return
+        number = self.seen[identity] = len(self.items)
+        self.items.append(suggestion)
+        priority = KIND_PRIORITY.get(suggestion.kind, UNKNOWN_KIND_PRIORITY)
+        scopes = {'', fold(suggestion.city)}
+        for position, key in enumerate(self._item_keys(suggestion.label)):
+            # İlk anahtar tam isim (isim başından eşleşme), diğerleri kelime başları
+            tier = (0 if position == 0 else 1, priority)
+            for scope in scopes:
+                self.arrays.setdefault((scope, *tier), _KeyArray()).add(key, number, bulk)
+
+    def remove(self, identity: str) -> None:
+        if identity in self.seen:
+            self.removed.add(self.seen[identity])
+
+    def sort(self) -> None:
+        """Toplu eklemeden sonra bir kez sırala."""
+        for array in self.arrays.values():
+            array.sort()
+
+    def search(self, prefix: str, city: Optional[str], limit: int) -> List[Suggestion]:
+        scope = fold(city) if city else ''
+        found: List[int] = []
+        chosen = set(self.removed)
+        for tier in TIERS:
+            array = self.arrays.get((scope, *tier))
+            if array is None:
+                continue
+            numbers = set(array.matches(prefix)) - chosen
+            for number in sorted(numbers, key=lambda n: (len(self.items[n].label), self.items[n].label)):
+                found.append(number)
+                chosen.add(number)
+                if len(found) >= limit:
+                    return [self.items[n] for n in found]
+        return [self.items[n] for n in found]
+
+
+_index: Optional[AutocompleteIndex] = None
+_building = False
+_pending: List[Tuple[str, Optional[Suggestion]]] = []     # Kurulum sırasındaki yazımlar: (kimlik, öneri ya da None = düşür)
+_lock = threading.Lock()
+_build_lock = threading.Lock()
+
+
+def _build() -> AutocompleteIndex:
+    from .gault_millau_data import GAULT_MILLAU_RESTAURANTS_LIST
+    from .location_data import LOCATION_DATA
+    from .models import CachedVenue, GaultMillauVenue
+    from .popular_venues_data import POPULAR_VENUES
+
+    started = time.perf_counter()
+    index = AutocompleteIndex()
+    for city_key, city_data in LOCATION_DATA.items():
+        city = CITY_LABELS.get(city_key, city_key.title())
+        for district in city_data['ilceler']:
+            index.add(f"district:{city_key}:{fold(district['isim'])}", Suggestion(district['isim'], 'district', city), bulk=True)
+            for semt in district['semtler']:
+                index.add(f"neighborhood:{city_key}:{fold(semt)}",
+                          Suggestion(semt, 'neighborhood', city, district=district['isim']), bulk=True)
+
+    rows = CachedVenue.objects.exclude(SERVE_EXCLUDE_Q).values_list('place_id', 'name', 'city', 'district', 'category')
+    for place_id, name, city, district, category in rows.iterator(chunk_size=2000):
+        if name:
+            index.add(f"venue:{place_id}", Suggestion(name, 'venue', city, district, place_id, category), bulk=True)
+
+    # G&M ve popüler mekanlar: aynı isim + şehir cache'te varsa tekrar önerilmez
+    cached_names = {f"{fold(s.city)}:{fold(s.label)}" for s in index.items if s.kind == 'venue'}
+    gm_rows = [(r['name'], r.get('city', '')) for r in GAULT_MILLAU_RESTAURANTS_LIST]
+    gm_rows += list(GaultMillauVenue.objects.values_list('name', 'city'))
+    for name, city in gm_rows:
+        identity = f"{fold(city)}:{fold(name)}"
+        if identity not in cached_names:
+            index.add(f"gm:{identity}", Suggestion(name, 'gault_millau', city), bulk=True)
+            cached_names.add(identity)
+    for name, info in POPULAR_VENUES.items():
+        identity = f"{fold(info.get('city', ''))}:{fold(name)}"
+        if identity not in cached_names:
+            index.add(f"popular:{identity}", Suggestion(_title(name), 'popular', info.get('city', ''),
+                                                        category=info.get('category', '')), bulk=True)
+            cached_names.add(identity)
+
+    index.sort()
+    logger.info("🔤 Autocomplete indeksi kuruldu: %s öneri, %s anahtar (%.0fms)",
+                len(index.items), index.key_count, (time.perf_counter() - started) * 1000)
+    return index
+
+
+def _apply(index: AutocompleteIndex, identity: str, suggestion: Optional[Suggestion]) -> None:
+    if suggestion is None:
+        index.remove(identity)
+    else:
+        index.add(identity, suggestion)
+
+
+def _rebuild() -> None:
+    """Yeni indeksi kilitsiz kur; kurulum sırasında gelen yazımları uygulayıp kilit altında değiştir."""
+    global _index, _building
+    try:
+        index = _build()
+        with _lock:
+            for identity, suggestion in _pending:
+                _apply(index, identity, suggestion)
+            _index = index
+    finally:
+        with _lock:
+            _building = False
+            _pending.clear()
+
+
+def _current() -> AutocompleteIndex:
+    """Servisteki indeks; yoksa kurulur (eşzamanlı ilk sorgular tek kurulumu bekler), eskiyse arka planda yenilenir."""
+    global _building
+    with _lock:
+        index = _index
+        if index is not None and time.monotonic() - index.built_at > INDEX_MAX_AGE_SECONDS and not _building:
+            _building = True
+            defer(_rebuild)
+    if index is not None:
+        return index
+    with _build_lock:
+        with _lock:
+            if _index is not None:
+                return _index
+            _building = True
+        _rebuild()
+    return _index
+
+
+def suggest(query: str, city: Optional[str] = None, limit: int = DEFAULT_LIMIT) -> List[Suggestion]:
+    """Prefix önerileri; sorgu MIN_PREFIX_LEN'den kısaysa boş liste."""
+    prefix = ' '.join(tokens(query))
+    if len(prefix) < MIN_PREFIX_LEN:
+        return []
+    index = _current()
+    with _lock:
+        return index.search(prefix, city, max(1, min(limit, MAX_LIMIT)))
+
+
+def note_cache_write(venues: Sequence[dict], category_name: str, city: str, district: str = None) -> None:
+    """save_venues_to_cache_swr'dan: yeni mekan isimlerini (indeks kuruluysa) ekle."""
+    with _lock:
+        if _index is None and not _building:
+            return  # İndeks ilk sorguda DB'den kurulacak
+        for venue in venues:
+            if not venue.get('id') or not venue.get('name'):
+                continue
+            identity = f"venue:{venue['id']}"
+            suggestion = None       # Bayraklanan kayıt önerilmez
+            if is_served(venue, category_name):
+                suggestion = Suggestion(venue['name'], 'venue', city, district or '', venue['id'], category_name)
+            if _index is not None:
+                _apply(_index, identity, suggestion)
+            if _building:
+                _pending.append((identity, suggestion))
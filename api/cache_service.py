@@ -5,16 +5,29 @@ Freshness Rules:
 - 0-24 saat: FRESH (direkt cache'ten dön)
 - 24-96 saat: STALE (cache'ten dön, arka planda refresh)
 - 96+ saat: EXPIRED (API'ye git, yeni cache oluştur)
+
+Yavaş değişen kategoriler (park, mesire alanı) CATEGORY_CACHE_POLICY ile daha uzun pencere kullanır.
 """
 
+import logging
 import threading
 import hashlib
-import sys
 from datetime import timedelta
-from typing import Callable, List, Dict, Any, Tuple, Set, Optional
+from typing import Callable, List, Dict, Any, NamedTuple, Tuple, Set
 from django.utils import timezone
-from .gault_millau_data import enrich_venues_with_gault_millau
-from .popular_venues_data import enrich_venues_with_instagram
+from .lazy import lazy_callable
+from .task_queue import defer
+from .opening_hours import apply_open_status, filter_open_now, intervals_from_weekday_text
+from .venue_flags import SERVE_EXCLUDE_Q, compute_flags
+from .venue_search import build_search_text
+
+enrich_venues_with_gault_millau = lazy_callable('api.gault_millau_data', 'enrich_venues_with_gault_millau')
+enrich_venues_with_instagram = lazy_callable('api.popular_venues_data', 'enrich_venues_with_instagram')
+note_similarity_write = lazy_callable('api.similarity', 'note_cache_write')
+note_autocomplete_write = lazy_callable('api.autocomplete', 'note_cache_write')
+note_similarity_delete = lazy_callable('api.similarity', 'note_cache_delete')
+
+logger = logging.getLogger(__name__)
 
 
 # ===== CONFIGURATION =====
@@ -23,6 +36,20 @@ CACHE_FRESH_HOURS = 24      # 0-24 saat: Fresh (direkt cache'ten dön)
 CACHE_STALE_HOURS = 96      # 24-96 saat: Stale (cache'ten dön, arka planda refresh)
 CACHE_EXPIRED_HOURS = 96    # 96+ saat: Expired (API'ye git)
 
+
+class CachePolicy(NamedTuple):
+    """Kategori bazlı freshness penceresi."""
+    fresh_hours: float
+    stale_hours: float
+    enrich: bool = True         # Cache okumasında G&M / Instagram zenginleştirmesi
+
+
+DEFAULT_CACHE_POLICY = CachePolicy(CACHE_FRESH_HOURS, CACHE_STALE_HOURS)
+CATEGORY_CACHE_POLICY = {
+    # Tabiat parkı / mesire alanı neredeyse hiç değişmez; Instagram hesabı da yok
+    'Piknik': CachePolicy(fresh_hours=24 * 14, stale_hours=24 * 60, enrich=False),
+}
+
 # In-memory set to track ongoing refresh operations
 _refresh_in_progress: Set[str] = set()
 _refresh_lock = threading.Lock()
@@ -52,14 +79,18 @@ def get_cache_age_hours(last_api_call) -> float:
     return age.total_seconds() / 3600
 
 
-def get_cache_freshness(age_hours: float) -> str:
+def get_cache_policy(category_name: str) -> CachePolicy:
+    return CATEGORY_CACHE_POLICY.get(category_name, DEFAULT_CACHE_POLICY)
+
+
+def get_cache_freshness(age_hours: float, policy: CachePolicy = DEFAULT_CACHE_POLICY) -> str:
     """
     Determine cache freshness status.
     Returns: 'fresh', 'stale', or 'expired'
     """
-    if age_hours < CACHE_FRESH_HOURS:
+    if age_hours < policy.fresh_hours:
         return 'fresh'
-    elif age_hours < CACHE_STALE_HOURS:
+    elif age_hours < policy.stale_hours:
         return 'stale'
     else:
         return 'expired'
@@ -103,21 +134,21 @@ def trigger_background_refresh(
     """
     # Check if refresh is already in progress
     if not mark_refresh_started(cache_key):
-        print(f"🔄 SWR - Background refresh already in progress for: {cache_key}", file=sys.stderr, flush=True)
+        logger.info("🔄 SWR - Background refresh already in progress for: %s", cache_key)
         return
 
     def background_task():
         try:
-            print(f"🔄 SWR - Background refresh started for: {cache_key} ({category_name}/{city}/{district or 'ALL'})", file=sys.stderr, flush=True)
+            logger.info("🔄 SWR - Background refresh started for: %s (%s/%s/%s)", cache_key, category_name, city, district or 'ALL')
 
             # Execute the refresh callback
             new_venues = refresh_callback(category_name, city, district)
 
             venue_count = len(new_venues) if new_venues else 0
-            print(f"✅ SWR - Background refresh completed for: {cache_key}, {venue_count} venues updated", file=sys.stderr, flush=True)
+            logger.info("✅ SWR - Background refresh completed for: %s, %s venues updated", cache_key, venue_count)
 
         except Exception as e:
-            print(f"❌ SWR - Background refresh failed for {cache_key}: {e}", file=sys.stderr, flush=True)
+            logger.error("❌ SWR - Background refresh failed for %s: %s", cache_key, e)
         finally:
             mark_refresh_completed(cache_key)
 
@@ -134,7 +165,8 @@ def get_venues_with_swr(
     exclude_ids: Set[str] = None,
     limit: int = 5,
     fetch_and_cache_callback: Callable = None,
-    refresh_callback: Callable = None
+    refresh_callback: Callable = None,
+    open_now: bool = False
 ) -> Tuple[List[Dict[str, Any]], Set[str], str]:
     """
     Main SWR function to get venues with stale-while-revalidate strategy.
@@ -148,6 +180,7 @@ def get_venues_with_swr(
         limit: Maximum number of venues to return from cache
         fetch_and_cache_callback: Function to fetch fresh data from API
         refresh_callback: Function to call for background refresh
+        open_now: Only return venues open right now (computed from openIntervals)
 
     Returns:
         Tuple of (venues_list, all_cached_place_ids, freshness_status)
@@ -157,11 +190,11 @@ def get_venues_with_swr(
     location_key = generate_location_key(category_name, city, district, neighborhood)
 
     try:
-        # Build cache query
+        # Build cache query - kapanmış / zincir / bar olmayan kayıtlar ingest bayraklarıyla WHERE'de elenir
         cache_query = CachedVenue.objects.filter(
             category=category_name,
             city__iexact=city
-        )
+        ).exclude(SERVE_EXCLUDE_Q)
 
         if district:
             cache_query = cache_query.filter(district__iexact=district)
@@ -174,13 +207,14 @@ def get_venues_with_swr(
 
         if not cached_venues:
             # No cache exists - need to fetch from API
-            print(f"📭 SWR - No cache for: {location_key} ({category_name}/{city}/{district or 'ALL'})", file=sys.stderr, flush=True)
+            logger.info("📭 SWR - No cache for: %s (%s/%s/%s)", location_key, category_name, city, district or 'ALL')
             return [], set(), 'miss'
 
         # Get the oldest last_api_call to determine freshness
         oldest_api_call = min(v.last_api_call for v in cached_venues if v.last_api_call)
         age_hours = get_cache_age_hours(oldest_api_call)
-        freshness = get_cache_freshness(age_hours)
+        policy = get_cache_policy(category_name)
+        freshness = get_cache_freshness(age_hours, policy)
 
         # Collect all cached place_ids (for API exclusion)
         all_cached_ids = {v.place_id for v in cached_venues}
@@ -202,29 +236,36 @@ def get_venues_with_swr(
             cached_venues = [v for v in cached_venues if not should_exclude(v)]
             filtered_count = original_count - len(cached_venues)
             if filtered_count > 0:
-                print(f"🚫 SWR - Excluded {filtered_count} venues from cache (exclude_ids: {len(exclude_ids)})", file=sys.stderr, flush=True)
+                logger.info("🚫 SWR - Excluded %s venues from cache (exclude_ids: %s)", filtered_count, len(exclude_ids))
 
         # Sort by google_rating (descending) to show best venues first
         cached_venues.sort(key=lambda v: v.google_rating or 0, reverse=True)
 
-        # Get venue data (limited)
-        venues_data = [v.venue_data for v in cached_venues[:limit]]
-
-        # Apply Gault & Millau enrichment to cached venues
-        venues_data = enrich_venues_with_gault_millau(venues_data)
-
-        # Apply Instagram enrichment to cached venues - Google CSE ile arama
-        venues_data = enrich_venues_with_instagram(venues_data, city, district, neighborhood)
-
-        # Update last_accessed for all venues
-        CachedVenue.objects.filter(
-            category=category_name,
-            city__iexact=city,
-            **({"district__iexact": district} if district else {})
-        ).update(last_accessed=timezone.now())
+        # Get venue data (limited) - isOpenNow / openUntil are computed for the current time
+        if open_now:
+            venues_data = filter_open_now([v.venue_data for v in cached_venues])[:limit]
+        else:
+            venues_data = apply_open_status([v.venue_data for v in cached_venues[:limit]])
+
+        if policy.enrich:
+            # Apply Gault & Millau enrichment to cached venues
+            venues_data = enrich_venues_with_gault_millau(venues_data)
+
+            # Apply Instagram enrichment to cached venues - Google CSE ile arama
+            venues_data = enrich_venues_with_instagram(venues_data, city, district, neighborhood)
+
+        # Update last_accessed for all venues (response sonrası)
+        defer(
+            CachedVenue.objects.filter(
+                category=category_name,
+                city__iexact=city,
+                **({"district__iexact": district} if district else {})
+            ).update,
+            last_accessed=timezone.now()
+        )
 
         # Log cache status
-        print(f"📦 SWR - {freshness.upper()} cache ({age_hours:.1f}h old): {location_key} - {len(venues_data)} venues", file=sys.stderr, flush=True)
+        logger.info("📦 SWR - %s cache (%.1fh old): %s - %s venues", freshness.upper(), age_hours, location_key, len(venues_data))
 
         # Handle stale cache - trigger background refresh
         if freshness == 'stale' and refresh_callback:
@@ -238,12 +279,12 @@ def get_venues_with_swr(
 
         # Handle expired cache - caller should fetch fresh data
         if freshness == 'expired':
-            print(f"⏰ SWR - Cache expired, needs refresh: {location_key}", file=sys.stderr, flush=True)
+            logger.info("⏰ SWR - Cache expired, needs refresh: %s", location_key)
 
         return venues_data, all_cached_ids, freshness
 
     except Exception as e:
-        print(f"❌ SWR ERROR - {category_name}/{city}: {e}", file=sys.stderr, flush=True)
+        logger.error("❌ SWR ERROR - %s/%s: %s", category_name, city, e)
         return [], set(), 'error'
 
 
@@ -274,6 +315,10 @@ def save_venues_to_cache_swr(
             if not place_id:
                 continue
 
+            if 'openIntervals' not in venue:
+                # Açılış saatleri bir kez parse edilir; isOpenNow servis anında hesaplanır
+                venue = {**venue, 'openIntervals': intervals_from_weekday_text(venue.get('weeklyHours'))}
+
             try:
                 CachedVenue.objects.update_or_create(
                     place_id=place_id,
@@ -285,20 +330,26 @@ def save_venues_to_cache_swr(
                         'neighborhood': neighborhood or '',
                         'location_key': location_key,
                         'venue_data': venue,
+                        'search_text': build_search_text(venue, category_name, city, district, neighborhood),
                         'google_rating': venue.get('googleRating'),
                         'google_review_count': venue.get('googleReviewCount'),
                         'last_api_call': now,
-                        'last_accessed': now
+                        'last_accessed': now,
+                        # Kapanmış / zincir / bar olmayan / eksik alan - okumada tekrar taranmaz
+                        **compute_flags(venue, category_name)._asdict()
                     }
                 )
                 saved_count += 1
             except Exception as e:
-                print(f"⚠️ SWR save error for {place_id}: {e}", file=sys.stderr, flush=True)
+                logger.warning("⚠️ SWR save error for %s: %s", place_id, e)
 
-        print(f"💾 SWR SAVE - {saved_count}/{len(venues)} venues ({location_key})", file=sys.stderr, flush=True)
+        logger.info("💾 SWR SAVE - %s/%s venues (%s)", saved_count, len(venues), location_key)
+        if saved_count:
+            note_similarity_write(venues, category_name, city)
+            note_autocomplete_write(venues, category_name, city, district)
 
     except Exception as e:
-        print(f"❌ SWR SAVE FAILED - {category_name}/{city}: {e}", file=sys.stderr, flush=True)
+        logger.error("❌ SWR SAVE FAILED - %s/%s: %s", category_name, city, e)
 
     return saved_count
 
@@ -310,7 +361,8 @@ def get_cached_venues_for_hybrid_swr(
     neighborhood: str = None,
     exclude_ids: Set[str] = None,
     limit: int = 5,
-    refresh_callback: Callable = None
+    refresh_callback: Callable = None,
+    open_now: bool = False
 ) -> Tuple[List[Dict[str, Any]], Set[str], str]:
     """
     Backward-compatible function for hybrid cache system with SWR.
@@ -325,7 +377,8 @@ def get_cached_venues_for_hybrid_swr(
         neighborhood=neighborhood,
         exclude_ids=exclude_ids,
         limit=limit,
-        refresh_callback=refresh_callback
+        refresh_callback=refresh_callback,
+        open_now=open_now
     )
 
 
@@ -334,7 +387,7 @@ def get_cached_venues_for_hybrid_swr(
 def get_cache_stats() -> Dict[str, Any]:
     """Get cache statistics for monitoring."""
     from .models import CachedVenue
-    from django.db.models import Count, Min, Max
+    from django.db.models import Count
 
     now = timezone.now()
 
@@ -368,6 +421,16 @@ def get_cache_stats() -> Dict[str, Any]:
     return stats
 
 
+def delete_venues(queryset) -> int:
+    """Toplu DELETE; silinen place_id'ler benzerlik indeksinden de düşer."""
+    place_ids = list(queryset.values_list('place_id', flat=True))
+    if not place_ids:
+        return 0
+    deleted_count, _ = queryset.delete()
+    note_similarity_delete(place_ids)
+    return deleted_count
+
+
 def clear_expired_cache(older_than_hours: int = 72) -> int:
     """
     Clear cache entries older than specified hours.
@@ -375,9 +438,14 @@ def clear_expired_cache(older_than_hours: int = 72) -> int:
     """
     from .models import CachedVenue
 
-    cutoff = timezone.now() - timedelta(hours=older_than_hours)
-    deleted_count, _ = CachedVenue.objects.filter(last_api_call__lt=cutoff).delete()
-
-    print(f"🧹 SWR CLEANUP - Deleted {deleted_count} expired cache entries (>{older_than_hours}h old)", file=sys.stderr, flush=True)
+    now = timezone.now()
+    cutoff = now - timedelta(hours=older_than_hours)
+    deleted_count = delete_venues(CachedVenue.objects.filter(last_api_call__lt=cutoff).exclude(category__in=list(CATEGORY_CACHE_POLICY)))
+    # Uzun pencereli kategoriler kendi stale süreleri dolmadan silinmez
+    for category_name, policy in CATEGORY_CACHE_POLICY.items():
+        category_cutoff = now - timedelta(hours=max(older_than_hours, policy.stale_hours))
+        deleted_count += delete_venues(CachedVenue.objects.filter(category=category_name, last_api_call__lt=category_cutoff))
+
+    logger.info("🧹 SWR CLEANUP - Deleted %s expired cache entries (>%sh old)", deleted_count, older_than_hours)
 
     return deleted_count
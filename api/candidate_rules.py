@@ -0,0 +1,439 @@
+"""
+Phase 1 Aday Filtre Motoru (generate_venues varsayılan yolu)
+
+Red kuralları views.py içinde art arda if/continue blokları yerine burada bir kural
+tablosu (PHASE1_RULES) olarak tanımlanır. Tablo, istek parametreleri (kategori,
+alkol / bütçe filtresi, ilçe, mahalle) başına bir kez derlenir ve lru_cache'te tutulur:
+
+- kategoriye veya filtreye uymayan kurallar derleme sırasında elenir,
+- anahtar kelime listeleri normalize edilip modül yüklenirken tek bir regex'e çevrilir,
+- kalan predicate'ler maliyet sırasına (ucuzdan pahalıya) dizilir, ilk red kısa devre yapar.
+
+Mekan başına isim/adres/tip metinleri ve yorum zamanları bir kez hesaplanan kompakt bir
+Candidate kaydına çıkarılır; kurallar sadece bu kaydı okur. Kural başına red sayaçları
+process başına toplanır ve /api/filters/stats/ üzerinden izlenebilir.
+
+Bu modül sadece saf Python içerir; ağır SDK import etmez.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, FrozenSet, Iterable, NamedTuple, Optional, Sequence, Tuple
+
+from .venue_categories import normalize_tr
+from .venue_flags import CHAIN_STORE_BLACKLIST, GENERATOR_CLOSED_KEYWORDS, ROMANTIC_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+# ===== CONFIGURATION =====
+PLACES_REVIEW_MAX_AGE_DAYS = 180     # Places yorumları: en güncel yorum bundan eskiyse red (6 ay)
+DETAILS_REVIEW_MAX_AGE_DAYS = 210    # Place Details yorumları: en güncel yorum bundan eskiyse red (7 ay)
+REVIEW_AGE_EXEMPT_COUNT = 50         # Bu kadar ve üzeri yorumlu mekanlar güncellik kontrolünden muaf (sezonluk)
+REVIEW_TEXT_SAMPLE = 5               # Anahtar kelime taramasında kullanılan yorum sayısı
+COMPILED_RULES_CACHE_SIZE = 512      # Derlenmiş kural seti cache'i (kategori × filtre × ilçe × mahalle)
+
+
+class Candidate(NamedTuple):
+    """Kuralların okuduğu, mekan başına bir kez hesaplanan alanlar."""
+    name_norm: str                       # normalize_tr(name)
+    address_norm: str                    # normalize_tr(formatted_address | vicinity) - sadece in_area None ise
+    types: FrozenSet[str]
+    types_str: str                       # ' '.join(types).lower()
+    rating: float
+    review_count: int
+    price_level: int
+    business_status: str
+    review_text_norm: str                # Places yorumlarının (ilk 5) normalize metni
+    latest_review_ts: Optional[float]    # Places yorumlarındaki en güncel publishTime (epoch)
+    details_text_norm: str = ''          # Place Details yorumlarının (ilk 5) normalize metni
+    details_latest_ts: Optional[float] = None
+    in_area: Optional[bool] = None       # api/geo.py alan testi; None → koordinat / geocode yok
+
+
+class FilterContext(NamedTuple):
+    """Kural setini belirleyen istek parametreleri (compile_rules cache anahtarı)."""
+    category: str
+    alcohol: str = 'Any'
+    budget: str = ''
+    district: str = ''                   # Boş → ilçe adres kontrolü yok (Nearby Search'te de boş geçilir)
+    neighborhood: str = ''
+
+
+# Predicate True dönerse aday reddedilir; builder None dönerse kural bu istekte pasiftir
+Predicate = Callable[[Candidate], bool]
+Builder = Callable[[FilterContext], Optional[Predicate]]
+
+
+class Rule(NamedTuple):
+    """Kural tablosu satırı."""
+    label: str                                   # Log ve sayaç etiketi
+    stage: str                                   # 'places' (Place Details öncesi) | 'details' (yorumlar çekildikten sonra)
+    cost: int                                    # Değerlendirme sırası: küçük = ucuz, önce çalışır
+    build: Builder
+    categories: Optional[FrozenSet[str]] = None  # None → tüm kategoriler
+
+
+# ===== ADAY KAYDI =====
+
+def _review_text(review: dict) -> str:
+    # Places API (New) {'text': {'text': ...}}, Legacy API {'text': '...'}
+    text = review.get('text') or ''
+    if isinstance(text, dict):
+        text = text.get('text') or ''
+    return text
+
+
+def _joined_review_text(reviews: Iterable[dict]) -> str:
+    # Satır sonu ile birleştir: anahtar kelimeler iki yorumun sınırından eşleşmesin
+    return '\n'.join(normalize_tr(_review_text(r)) for r in reviews)
+
+
+def _publish_timestamp(value) -> Optional[float]:
+    # Format: "2024-12-10T14:30:00Z"
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def build_candidate(place: dict, in_area: Optional[bool] = None) -> Candidate:
+    """
+    Places sonucundan Candidate kaydı üret (metinler ve yorum zamanları bir kez).
+    in_area biliniyorsa (geo.measure) adres metni normalize edilmez; lokasyon kuralı maskeyi okur.
+    """
+    types = place.get('types') or []
+    reviews = place.get('reviews') or []
+    stamps = [ts for ts in map(_publish_timestamp, (r.get('publishTime') for r in reviews)) if ts is not None]
+    return Candidate(
+        name_norm=normalize_tr(place.get('name', '')),
+        address_norm=normalize_tr(place.get('formatted_address', '') or place.get('vicinity', '')) if in_area is None else '',
+        types=frozenset(types),
+        types_str=' '.join(types).lower(),
+        rating=place.get('rating') or 0,
+        review_count=place.get('user_ratings_total') or 0,
+        price_level=place.get('price_level', 2),
+        # Places API (New) businessStatus, Legacy API business_status
+        business_status=place.get('businessStatus') or place.get('business_status') or 'OPERATIONAL',
+        review_text_norm=_joined_review_text(reviews[:REVIEW_TEXT_SAMPLE]),
+        latest_review_ts=max(stamps) if stamps else None,
+        in_area=in_area,
+    )
+
+
+def with_details(candidate: Candidate, reviews: Sequence) -> Candidate:
+    """Place Details yorumlarını (candidates.Review kayıtları, UNIX time) kayda ekle."""
+    stamps = [r.time for r in reviews if isinstance(r.time, (int, float)) and r.time]
+    return candidate._replace(
+        details_text_norm='\n'.join(normalize_tr(r.text or '') for r in reviews[:REVIEW_TEXT_SAMPLE]),
+        details_latest_ts=max(stamps) if stamps else None,
+    )
+
+
+# ===== KURAL YAPI TAŞLARI =====
+
+def _keyword_pattern(words: Iterable[str]):
+    # Uzun kelimeler önce: alternation en spesifik eşleşmeyi dener
+    normalized = sorted({normalize_tr(w) for w in words}, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, normalized)))
+
+
+def below(field: str, threshold: float) -> Builder:
+    """Sayısal alan eşiğin altındaysa red."""
+    getter = attrgetter(field)
+    return lambda ctx: (lambda c: getter(c) < threshold)
+
+
+def one_of(field: str, values: Iterable) -> Builder:
+    """Alan değeri kümedeyse red."""
+    getter, values = attrgetter(field), frozenset(values)
+    return lambda ctx: (lambda c: getter(c) in values)
+
+
+def contains(field: str, keywords: Iterable[str]) -> Builder:
+    """Metin alanı anahtar kelimelerden birini (substring) içeriyorsa red."""
+    getter, search = attrgetter(field), _keyword_pattern(keywords).search
+    return lambda ctx: (lambda c: search(getter(c)) is not None)
+
+
+def has_type(place_types: Iterable[str]) -> Builder:
+    """Place types bu tiplerden birini (tam eşleşme) içeriyorsa red."""
+    place_types = frozenset(place_types)
+    return lambda ctx: (lambda c: not place_types.isdisjoint(c.types))
+
+
+def stale_reviews(field: str, max_age_days: int) -> Builder:
+    """En güncel yorum max_age_days'ten eskiyse red (REVIEW_AGE_EXEMPT_COUNT+ yorumlular muaf)."""
+    getter, max_age = attrgetter(field), max_age_days * 86400
+
+    def build(ctx):
+        def predicate(c):
+            latest = getter(c)
+            return latest is not None and c.review_count < REVIEW_AGE_EXEMPT_COUNT and time.time() - latest > max_age
+        return predicate
+    return build
+
+
+def outside_area() -> Builder:
+    """Koordinatı aranan alanın (ilçe / mahalle poligonu veya yarıçap) dışındaysa red."""
+    return lambda ctx: (lambda c: c.in_area is False)
+
+
+def address_lacks(context_field: str) -> Builder:
+    """
+    Alan testi yapılamayan adaylarda (koordinat yok) adres, context'teki ilçe/mahalle adını
+    içermiyorsa red (Türkçe karakter duyarsız).
+    """
+    def build(ctx):
+        value = getattr(ctx, context_field)
+        if not value:
+            return None
+        needle = normalize_tr(value)
+        return lambda c: c.in_area is None and needle not in c.address_norm
+    return build
+
+
+def price_outside(allowed_levels: dict) -> Builder:
+    """Bütçe filtresi seçiliyse fiyat seviyesi izin verilenler dışındaysa red."""
+    def build(ctx):
+        allowed = allowed_levels.get(ctx.budget)
+        if allowed is None:
+            return None
+        return lambda c: c.price_level not in allowed
+    return build
+
+
+def when(condition: Callable[[FilterContext], bool], builder: Builder) -> Builder:
+    """Kuralı sadece condition(ctx) sağlanan isteklerde etkinleştir."""
+    return lambda ctx: builder(ctx) if condition(ctx) else None
+
+
+def all_of(*builders: Builder) -> Builder:
+    def build(ctx):
+        predicates = tuple(b(ctx) for b in builders)
+        return lambda c: all(p(c) for p in predicates)
+    return build
+
+
+def any_of(*builders: Builder) -> Builder:
+    def build(ctx):
+        predicates = tuple(b(ctx) for b in builders)
+        return lambda c: any(p(c) for p in predicates)
+    return build
+
+
+def negate(builder: Builder) -> Builder:
+    def build(ctx):
+        predicate = builder(ctx)
+        return lambda c: not predicate(c)
+    return build
+
+
+# ===== KURAL VERİSİ =====
+
+BUDGET_PRICE_LEVELS = {'Ekonomik': (1, 2), 'Orta': (2, 3), 'Lüks': (3, 4)}
+ALCOHOL_FILTER_EXEMPT = frozenset({'Balıkçı', 'Meyhane'})   # Gemini karar verir
+
+COFFEE_KEYWORDS = ('cafe', 'coffee', 'kahve', 'kafe', 'bakery', 'tea_house', 'pastry', 'patisserie',
+                   'firin', 'borek', 'kahveci', 'pastane', 'tatlici', 'muhallebici', 'dondurma',
+                   'dessert', 'ice_cream', 'sweet', 'catering')
+COFFEE_NAME_KEYWORDS = ('cafe', 'coffee', 'kahve', 'kafe', 'kahveci', 'pastane', 'tatlici',
+                        'muhallebici', 'dondurma', 'patisserie', 'bakery', 'firin')
+BAR_NAME_KEYWORDS = ('bar', 'pub', 'bira', 'meyhane', 'wine', 'cocktail', 'beer')
+ALCOHOL_TYPE_KEYWORDS = ('bar', 'pub', 'nightclub', 'wine_bar', 'liquor', 'cocktail', 'meyhane', 'bira')
+ALCOHOL_NAME_KEYWORDS = ('bar', 'pub', 'meyhane', 'bira', 'wine', 'cocktail')
+
+CLOSED_STATUSES = ('CLOSED_PERMANENTLY', 'CLOSED_TEMPORARILY')
+TEKEL_KEYWORDS = ('tekel', 'market', 'bakkal', 'büfe', 'süpermarket', 'grocery',
+                  'liquor store', 'convenience', 'mini market', 'minimarket',
+                  'alcohol palace', 'içki', 'şarküteri', 'manav', 'kuruyemiş')
+TEKEL_TYPES = ('liquor_store', 'convenience_store', 'grocery_store', 'supermarket')
+
+RESTAURANT_CATEGORIES = frozenset({
+    'İlk Buluşma', 'Fine Dining', 'Özel Gün', 'İş Yemeği', 'Öğlen Yemeği',
+    'Esnaf Lokantası', 'Balıkçı', 'Meyhane', 'Muhabbet', 'Brunch',
+    'İş Çıkışı Bira & Kokteyl', 'Sokak Lezzeti',
+    'Burger & Fast', 'Pizzacı', '3. Nesil Kahveci',
+})
+PARTY = frozenset({'Eğlence & Parti'})
+MEYHANE = frozenset({'Meyhane'})
+BALIKCI = frozenset({'Balıkçı'})
+SOKAK_LEZZETI = frozenset({'Sokak Lezzeti'})
+
+# NOT: "gazino" bilerek yok - Türk kültüründe geleneksel eğlence mekanları (canlı müzik, fasıl)
+PAVYON_KEYWORDS = ('pavyon', 'konsomatris', 'casino', 'kabare', 'cabaret',
+                   'gece alemi', 'eglence merkezi', 'dans bar', 'show bar',
+                   'strip', 'striptiz', 'hostess', 'escort', 'masaj salonu',
+                   'gentlemen', 'club 18', 'club18', 'adult', 'yetiskin')
+SERVICE_KEYWORDS = ('dj team', 'dj hizmeti', 'dj kiralama', 'düğün dj', 'dugun dj',
+                    'organizasyon', 'event planner', 'etkinlik', 'after party',
+                    'ses sistemi', 'ışık sistemi', 'isik sistemi', 'sahne kiralama',
+                    'catering', 'ikram hizmeti', 'parti organizasyon')
+SERVICE_TYPES = ('event_planner', 'wedding_service', 'catering_service')
+ACTUAL_VENUE_TYPES = ('night_club', 'bar', 'restaurant', 'cafe')
+
+MEYHANE_NAME_KEYWORDS = ('meyhane', 'meyhanesi', 'rakı', 'fasıl')
+MEYHANE_TYPES = ('bar', 'restaurant', 'turkish_restaurant', 'meal_takeaway', 'meal_delivery')
+MEYHANE_REVIEW_KEYWORDS = ('rakı', 'raki', 'meyhane', 'meze', 'fasıl', 'fasil')
+BALIKCI_EXCLUDED_KEYWORDS = ('pişirici', 'balık ekmek', 'balıkekmek', 'tezgah', 'market', 'pazarı', 'hal')
+
+# ROMANTIC_CATEGORIES / CHAIN_STORE_BLACKLIST / GENERATOR_CLOSED_KEYWORDS: api/venue_flags.py (cache yazımındaki bayraklarla ortak)
+
+
+def _alcoholic(ctx: FilterContext) -> bool:
+    return ctx.alcohol == 'Alcoholic' and ctx.category not in ALCOHOL_FILTER_EXEMPT
+
+
+def _non_alcoholic(ctx: FilterContext) -> bool:
+    return ctx.alcohol == 'Non-Alcoholic' and ctx.category not in ALCOHOL_FILTER_EXEMPT
+
+
+# ===== KURAL TABLOSU =====
+# Sıra önemli değildir; compile_rules kuralları cost'a göre dizer.
+# cost: 1 sayısal karşılaştırma, 2 küme üyeliği, 3 kısa regex, 4 adres, 5 uzun regex, 6 yorum metni
+
+PHASE1_RULES: Tuple[Rule, ...] = (
+    # --- Lokasyon ---
+    Rule('ALAN DIŞI', 'places', 1, outside_area()),
+    Rule('İLÇE', 'places', 4, address_lacks('district')),
+    Rule('MAHALLE', 'places', 4, address_lacks('neighborhood')),
+
+    # --- Kullanıcı filtreleri ---
+    Rule('BÜTÇE', 'places', 1, price_outside(BUDGET_PRICE_LEVELS)),
+    Rule('ALKOL (type)', 'places', 3, when(_alcoholic, contains('types_str', COFFEE_KEYWORDS))),
+    Rule('ALKOL (isim)', 'places', 3, when(_alcoholic, all_of(
+        contains('name_norm', COFFEE_NAME_KEYWORDS),
+        negate(contains('name_norm', BAR_NAME_KEYWORDS)),
+    ))),
+    Rule('ALKOLSÜZ (type)', 'places', 3, when(_non_alcoholic, contains('types_str', ALCOHOL_TYPE_KEYWORDS))),
+    Rule('ALKOLSÜZ (isim)', 'places', 3, when(_non_alcoholic, contains('name_norm', ALCOHOL_NAME_KEYWORDS))),
+
+    # --- Tüm kategoriler ---
+    Rule('KAPALI MEKAN', 'places', 2, one_of('business_status', CLOSED_STATUSES)),
+    Rule('TEKEL/MARKET', 'places', 5, any_of(
+        contains('types_str', TEKEL_TYPES),
+        contains('name_norm', TEKEL_KEYWORDS),
+    )),
+
+    # --- Restoran kalite filtresi ---
+    Rule('RESTORAN RATING', 'places', 1, below('rating', 4.0), RESTAURANT_CATEGORIES),
+    Rule('RESTORAN REVIEW COUNT', 'places', 1, below('review_count', 10), RESTAURANT_CATEGORIES - SOKAK_LEZZETI),
+    Rule('RESTORAN REVIEW COUNT', 'places', 1, below('review_count', 20), SOKAK_LEZZETI),
+    Rule('RESTORAN ESKİ YORUM', 'places', 2,
+         stale_reviews('latest_review_ts', PLACES_REVIEW_MAX_AGE_DAYS), RESTAURANT_CATEGORIES),
+
+    # --- Eğlence & Parti ---
+    Rule('RATING', 'places', 1, below('rating', 3.5), PARTY),
+    Rule('REVIEW', 'places', 1, below('review_count', 5), PARTY),
+    Rule('HİZMET FİRMASI (type)', 'places', 2, has_type(SERVICE_TYPES), PARTY),
+    Rule('PAVYON', 'places', 5, any_of(
+        contains('name_norm', PAVYON_KEYWORDS),
+        contains('types_str', PAVYON_KEYWORDS),
+    ), PARTY),
+    Rule('HİZMET FİRMASI (isim)', 'places', 5, any_of(
+        contains('name_norm', SERVICE_KEYWORDS),
+        # "DJ" geçen ama night_club/bar/restaurant/cafe tipi olmayan → hizmet firması
+        all_of(contains('name_norm', ('dj',)), negate(has_type(ACTUAL_VENUE_TYPES))),
+    ), PARTY),
+
+    # --- Meyhane: isim, tip veya yorumlardan biri meyhane uyumlu olmalı (Gemini son kararı verir) ---
+    Rule('MEYHANE', 'places', 6, negate(any_of(
+        has_type(MEYHANE_TYPES),
+        contains('name_norm', MEYHANE_NAME_KEYWORDS),
+        contains('review_text_norm', MEYHANE_REVIEW_KEYWORDS),
+    )), MEYHANE),
+
+    # --- Balıkçı ---
+    Rule('BALIKÇI RATING', 'places', 1, below('rating', 3.9), BALIKCI),
+    Rule('BALIKÇI REVIEW', 'places', 1, below('review_count', 10), BALIKCI),
+    Rule('BALIKÇI', 'places', 3, contains('name_norm', BALIKCI_EXCLUDED_KEYWORDS), BALIKCI),
+
+    # --- Romantik kategoriler ---
+    Rule('ZİNCİR MEKAN', 'places', 5, contains('name_norm', CHAIN_STORE_BLACKLIST), ROMANTIC_CATEGORIES),
+
+    # --- Place Details yorumları çekildikten sonra ---
+    Rule('ESKİ YORUM', 'details', 2, stale_reviews('details_latest_ts', DETAILS_REVIEW_MAX_AGE_DAYS)),
+    Rule('KAPANMIŞ MEKAN (YORUM)', 'details', 6, contains('details_text_norm', GENERATOR_CLOSED_KEYWORDS)),
+)
+
+
+# ===== DERLEME =====
+
+class CompiledRules(NamedTuple):
+    """Bir FilterContext için derlenmiş, cost sırasına dizili (etiket, predicate) çiftleri."""
+    places: Tuple[Tuple[str, Predicate], ...]
+    details: Tuple[Tuple[str, Predicate], ...]
+
+
+@lru_cache(maxsize=COMPILED_RULES_CACHE_SIZE)
+def compile_rules(context: FilterContext) -> CompiledRules:
+    stages = {'places': [], 'details': []}
+    for rule in sorted(PHASE1_RULES, key=attrgetter('cost')):
+        if rule.categories is not None and context.category not in rule.categories:
+            continue
+        predicate = rule.build(context)
+        if predicate is not None:
+            stages[rule.stage].append((rule.label, predicate))
+    return CompiledRules(places=tuple(stages['places']), details=tuple(stages['details']))
+
+
+# ===== SAYAÇLAR =====
+
+_stats_lock = threading.Lock()
+_reject_counts: Counter = Counter()
+_totals: Counter = Counter()
+
+
+class CandidateFilter:
+    """
+    generate_venues isteği başına filtre: derlenmiş kural seti + istek içi sayaçlar.
+    finish() istek sonunda sayaçları process geneline ekler ve özet log'u yazar.
+    """
+
+    def __init__(self, context: FilterContext):
+        self.context = context
+        self.rules = compile_rules(context)
+        self.rejects = Counter()
+        self.evaluated = 0
+        self.passed = 0
+
+    def check(self, candidate: Candidate, stage: str = 'places') -> Optional[str]:
+        """Adayı reddeden ilk kuralın etiketini döndür (geçerse None)."""
+        if stage == 'places':
+            self.evaluated += 1
+        for label, predicate in getattr(self.rules, stage):
+            if predicate(candidate):
+                self.rejects[label] += 1
+                return label
+        if stage == 'details':
+            self.passed += 1
+        return None
+
+    def finish(self) -> None:
+        with _stats_lock:
+            _totals['requests'] += 1
+            _totals['evaluated'] += self.evaluated
+            _totals['passed'] += self.passed
+            _reject_counts.update(self.rejects)
+        logger.info(
+            "🧮 Phase 1 filtre (%s): %s aday → %s geçti | red: %s",
+            self.context.category, self.evaluated, self.passed,
+            ', '.join(f"{label}={count}" for label, count in self.rejects.most_common()) or '-',
+        )
+
+
+def get_filter_stats() -> dict:
+    """Kural başına red sayaçları (worker process başına, process başlangıcından beri)."""
+    with _stats_lock:
+        return {
+            'requests': _totals['requests'],
+            'evaluated': _totals['evaluated'],
+            'passed': _totals['passed'],
+            'rejects': dict(_reject_counts.most_common()),
+            'compiled_rule_sets': compile_rules.cache_info().currsize,
+        }
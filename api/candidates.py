@@ -0,0 +1,177 @@
+"""
+generate_venues Aday Kayıtları (filtre → Gemini zenginleştirme → sıralama)
+
+Varsayılan yolda her aday eskiden Places sonucu → filtered_places dict'i (yorum ve
+foodServices kopyalarıyla) → AI dict'i → venue dict'i olarak dört ayrı dict'te taşınıyordu.
+Artık filtreden geçen her mekan tek bir __slots__'lu VenueCandidate kaydıdır ve aynı kayıt
+zenginleştirme ve sıralama boyunca yeniden kullanılır; Place Details yorumları da Review
+kaydıdır. Kayıtlar ham API yanıtlarındaki string'lere referans tutar, kopyalamaz.
+
+Response ve cache'e giden JSON dict sadece serialization anında, sıralamadan sonra
+to_venue() ile üretilir (fotoğraf / Maps URL'leri dahil).
+
+Bu modül sadece saf Python içerir; ağır SDK import etmez.
+"""
+
+import urllib.parse
+from typing import Optional
+
+from .candidate_rules import Candidate
+from .opening_hours import intervals_from_opening_hours
+
+# ===== CONFIGURATION =====
+DEFAULT_IMAGE_URL = 'https://images.unsplash.com/photo-1517248135467-4c7edcad34c4?w=800'
+DEFAULT_MATCH_SCORE = 75             # Gemini contextScore dönmezse
+DEFAULT_RATING = 4.0                 # Google puanı yoksa response'ta gösterilen
+BEST_FOR_MIN_SCORE = 70              # bestFor'a eklenecek context skoru alt sınırı
+BEST_FOR_LIMIT = 4                   # bestFor en fazla etiket
+
+PRICE_RANGES = {0: '$', 1: '$', 2: '$$', 3: '$$$', 4: '$$$$'}   # Legacy API price_level 0-4
+CONTEXT_LABELS = {
+    'first_date': 'İlk Buluşma',
+    'romantic_dinner': 'Romantik Akşam',
+    'business_meal': 'İş Yemeği',
+    'friends_hangout': 'Arkadaşlarla',
+    'family_meal': 'Aile',
+    'special_occasion': 'Özel Gün',
+    'fine_dining': 'Fine Dining',
+    'breakfast_brunch': 'Kahvaltı',
+    'after_work': 'İş Çıkışı',
+}
+DEFAULT_ATMOSPHERE = {
+    'noiseLevel': 'Sohbet Dostu',
+    'lighting': 'Yumuşak',
+    'privacy': 'Yarı Özel',
+    'energy': 'Dengeli',
+    'idealFor': [],
+    'notIdealFor': [],
+    'oneLiner': '',
+}
+
+
+class Review:
+    """Place Details (Legacy API) yorumu."""
+    __slots__ = ('author_name', 'rating', 'text', 'relative_time', 'profile_photo_url', 'time')
+
+    def __init__(self, author_name: str, rating: int, text: str, relative_time: str,
+                 profile_photo_url: str, time: Optional[int]):
+        self.author_name = author_name
+        self.rating = rating
+        self.text = text
+        self.relative_time = relative_time
+        self.profile_photo_url = profile_photo_url
+        self.time = time                  # UNIX timestamp (eski yorum kontrolü)
+
+    @classmethod
+    def from_details(cls, raw: dict) -> 'Review':
+        return cls(
+            raw.get('author_name', ''),
+            raw.get('rating', 5),
+            raw.get('text', ''),
+            raw.get('relative_time_description', ''),
+            raw.get('profile_photo_url', ''),
+            raw.get('time'),
+        )
+
+    def to_dict(self) -> dict:
+        """get_place_details_extended ile aynı googleReviews formatı."""
+        return {
+            'authorName': self.author_name,
+            'rating': self.rating,
+            'text': self.text,
+            'relativeTime': self.relative_time,
+            'profilePhotoUrl': self.profile_photo_url,
+            'time': self.time,
+        }
+
+
+class VenueCandidate:
+    """Phase 1 filtresinden geçen mekan; Phase 2/3 boyunca aynı kayıt kullanılır."""
+    __slots__ = ('idx', 'place_id', 'name', 'address', 'features', 'types', 'photo_ref', 'opening_hours',
+                 'reviews', 'food_services', 'ai', 'match_score', 'instagram_url', 'is_michelin', 'distance_km')
+
+    def __init__(self, idx: int, place: dict, features: Candidate):
+        photos = place.get('photos') or ()
+        self.idx = idx
+        self.place_id = place.get('place_id', '')
+        self.name = place.get('name', '')
+        # Nearby Search'te formatted_address yok, vicinity var
+        self.address = place.get('formatted_address', '') or place.get('vicinity', '')
+        self.features = features          # Kural motorunun okuduğu kompakt kayıt (rating, review_count, price_level)
+        self.types = place.get('types') or []
+        self.photo_ref = photos[0].get('photo_reference', '') if photos else ''
+        self.opening_hours = place.get('opening_hours') or {}
+        self.reviews = ()                 # Tuple[Review, ...] - Place Details sonrası
+        self.food_services = {}
+        self.ai = None                    # Gemini sonucu (None → Gemini başarısız, fallback alanları)
+        self.match_score = DEFAULT_MATCH_SCORE
+        self.instagram_url = ''
+        self.is_michelin = False
+        self.distance_km = None           # Aranan lokasyonun merkezinden (api/geo.py), koordinat yoksa None
+
+    @property
+    def rating(self) -> float:
+        return self.features.rating
+
+    @property
+    def review_count(self) -> int:
+        return self.features.review_count
+
+    def attach_ai(self, ai_data: dict, context_key: str) -> None:
+        """Gemini batch sonucunu bağla; matchScore ilgili context skorundan gelir."""
+        self.ai = ai_data
+        self.match_score = ai_data.get('contextScore', {}).get(context_key, DEFAULT_MATCH_SCORE)
+
+    def to_venue(self, category_name: str, api_key: str) -> dict:
+        """Response / cache formatındaki venue dict'ini üret (serialization anında)."""
+        enriched = self.ai is not None
+        ai = self.ai or {}
+        rating = self.rating
+        weekly_hours = self.opening_hours.get('weekday_text', [])
+        image_url = DEFAULT_IMAGE_URL
+        if self.photo_ref:
+            image_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={self.photo_ref}&key={api_key}"
+        maps_query = urllib.parse.quote(f"{self.name} {self.address}")
+
+        venue = {
+            'id': f"v{self.idx + 1}",
+            'name': self.name,
+            'description': ai.get('description', f"{category_name} için harika bir mekan."
+                                  if enriched else f"{category_name} için harika bir mekan seçeneği."),
+            'imageUrl': image_url,
+            'category': category_name,
+            'vibeTags': ai.get('vibeTags', ['#Popüler', '#Kaliteli']),
+            'address': self.address,
+            'priceRange': PRICE_RANGES.get(self.features.price_level, '$$'),
+            'googleRating': rating if rating > 0 else DEFAULT_RATING,
+            'googleReviewCount': self.review_count,
+            'noiseLevel': ai.get('noiseLevel', 50),
+            'matchScore': self.match_score,
+        }
+        if self.distance_km is not None:
+            venue['distanceKm'] = self.distance_km
+        if enriched:
+            venue['contextScore'] = ai.get('contextScore', {})
+            venue['bestTimeSlots'] = ai.get('bestTimeSlots', [])
+        venue.update({
+            'googleMapsUrl': f"https://www.google.com/maps/search/?api=1&query={maps_query}",
+            'googleReviews': [review.to_dict() for review in self.reviews],
+            'website': '',                # Legacy API textsearch'ta website gelmez
+            'instagramUrl': self.instagram_url,
+            'phoneNumber': '',            # Legacy API textsearch'ta telefon gelmez
+            'hours': weekly_hours[0] if weekly_hours else '',
+            'weeklyHours': weekly_hours,
+            'isOpenNow': self.opening_hours.get('open_now'),
+            'openIntervals': intervals_from_opening_hours(self.opening_hours),
+            'isMichelinStarred': self.is_michelin,
+            'practicalInfo': ai.get('practicalInfo', {}),
+            'foodServices': self.food_services,
+            'atmosphereSummary': ai.get('atmosphereSummary', {**DEFAULT_ATMOSPHERE, 'idealFor': [], 'notIdealFor': []}),
+        })
+        if enriched:
+            # contextScore'dan bestFor oluştur (70+ skorlu context'ler)
+            venue['bestFor'] = [
+                CONTEXT_LABELS[ctx] for ctx, score in venue['contextScore'].items()
+                if score >= BEST_FOR_MIN_SCORE and ctx in CONTEXT_LABELS
+            ][:BEST_FOR_LIMIT]
+        return venue
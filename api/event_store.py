@@ -0,0 +1,242 @@
+"""
+Etkinlik Deposu (Yerel Festivaller, Konserler, Sahne Sanatları)
+
+Bu kategoriler her istekte Google Search grounding'li bir generate_content çağrısı yapıyordu
+(en yavaş ve en pahalı çağrımız); cevaplar ise gün ölçeğinde değişir. Artık:
+
+- Bulunan etkinlikler Event tablosuna upsert edilir (şehir / tür / başlangıç-bitiş tarihi indeksli).
+- EventCoverage, bir şehir + tür için hangi tarih penceresinin ne zaman arandığını tutar.
+  Pencereyi kapsayan taze bir kayıt varsa endpoint DB'den döner; grounded arama sadece
+  kapsanmayan pencerelerde çalışır.
+- Bitiş tarihi geçen etkinlikler okumada elenir ve arka planda silinir (expire_past_events).
+
+Aynı pencere için eşzamanlı istekler tek bir grounded çağrı yapar (anahtar başına kilit).
+
+Kullanım (views.py):
+    @serve_from_event_store('concert')
+    def generate_concerts(location, filters): ...
+"""
+
+import functools
+import hashlib
+import logging
+import re
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import Event, EventCoverage
+from .task_queue import defer
+from .timing import span
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+EVENT_COVERAGE_HOURS = 24           # Grounded arama sonucu bu kadar süre geçerli (etkinlikler gün ölçeğinde değişir)
+EMPTY_COVERAGE_HOURS = 3            # Sonuç boş döndüyse daha erken tekrar dene
+DATE_RANGE_DAYS = {'Today': 0, 'ThisWeek': 7, 'ThisMonth': 30}
+DEFAULT_WINDOW_DAYS = {             # dateRange 'Any' → generate_* fonksiyonlarındaki pencere
+    'festival': 90,
+    'concert': 60,
+    'performing_arts': 60,
+}
+GENRE_FILTERS = {                   # Tür filtresi (None → tür ayrımı yok)
+    'festival': None,
+    'concert': 'musicGenre',
+    'performing_arts': 'performanceGenre',
+}
+
+_MONTHS_TR = {
+    'ocak': 1, 'şubat': 2, 'mart': 3, 'nisan': 4, 'mayıs': 5, 'haziran': 6,
+    'temmuz': 7, 'ağustos': 8, 'eylül': 9, 'ekim': 10, 'kasım': 11, 'aralık': 12
+}
+
+_locks_guard = threading.Lock()
+_refresh_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+
+
+# ===== PENCERE VE TARİHLER =====
+
+def event_window(kind: str, filters: dict, today: date) -> Tuple[date, date]:
+    """dateRange filtresinden (başlangıç, bitiş) penceresi - generate_* ile aynı gün sayıları."""
+    days = DATE_RANGE_DAYS.get(filters.get('dateRange', 'Any'), DEFAULT_WINDOW_DAYS[kind])
+    return today, today + timedelta(days=days)
+
+
+def event_genre(kind: str, filters: dict) -> str:
+    field = GENRE_FILTERS[kind]
+    genre = filters.get(field, 'Any') if field else 'Any'
+    return '' if genre == 'Any' else genre
+
+
+def _parse_iso(value) -> Optional[date]:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_event_date(event_date: str, default_year: int) -> Optional[date]:
+    """'9-14 Aralık 2025' → 2025-12-09 (ilk gün)."""
+    if not event_date:
+        return None
+    lowered = event_date.lower()
+    month = next((num for name, num in _MONTHS_TR.items() if name in lowered), None)
+    if not month:
+        return None
+    year_match = re.search(r'20\d{2}', event_date)
+    day_match = re.search(r'(\d{1,2})', event_date)
+    try:
+        return date(int(year_match.group()) if year_match else default_year, month, int(day_match.group(1)) if day_match else 1)
+    except ValueError:
+        return None
+
+
+def event_dates(event: dict, today: date) -> Tuple[Optional[date], date]:
+    """
+    Etkinliğin (başlangıç, bitiş) tarihleri; generate_* filtreleriyle aynı kurallar:
+    startDate yoksa eventDate'ten, endDate yoksa '9-14 Aralık' aralığından, o da yoksa başlangıç.
+    Tarihsiz etkinlikler sadece bulundukları gün geçerlidir (bitiş = bugün).
+    """
+    start = _parse_iso(event.get('startDate')) or _parse_event_date(event.get('eventDate', ''), today.year)
+    end = _parse_iso(event.get('endDate'))
+    if not end and start:
+        end_match = re.search(r'-(\d{1,2})', event.get('eventDate', '') or '')
+        try:
+            end = start.replace(day=int(end_match.group(1))) if end_match else start
+        except ValueError:
+            end = start
+    return start, end or today
+
+
+# ===== OKUMA / YAZMA =====
+
+def _event_key(kind: str, city: str, genre: str, name: str, start: Optional[date]) -> str:
+    raw = f"{kind}:{city.lower()}:{genre}:{name.strip().lower()}:{start.isoformat() if start else ''}"
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def get_covered_events(kind: str, city: str, genre: str, window_start: date, window_end: date) -> Optional[List[dict]]:
+    """Pencereyi kapsayan taze bir arama varsa etkinlikleri (başlangıç tarihine göre) döndür, yoksa None."""
+    now = timezone.now()
+    covered = EventCoverage.objects.filter(
+        kind=kind, city=city, genre=genre,
+        window_start__lte=window_start, window_end__gte=window_end,
+        fetched_at__gte=now - timedelta(hours=EVENT_COVERAGE_HOURS),
+    ).exclude(
+        event_count=0, fetched_at__lt=now - timedelta(hours=EMPTY_COVERAGE_HOURS),
+    ).exists()
+    if not covered:
+        return None
+    return list(
+        Event.objects.filter(kind=kind, city=city, genre=genre, end_date__gte=window_start)
+        .filter(Q(start_date__lte=window_end) | Q(start_date__isnull=True))
+        .order_by(F('start_date').asc(nulls_last=True), 'id')
+        .values_list('event_data', flat=True)
+    )
+
+
+def save_events(kind: str, city: str, genre: str, window_start: date, window_end: date, events: List[dict]) -> None:
+    """
+    Grounded aramanın sonucunu pencere için yaz: etkinlikleri upsert et, bu pencerede olup yeni
+    sonuçta olmayanları (iptal / artık listelenmeyen) sil ve bu pencerenin coverage kaydını yenile.
+    Etkinlik silindiyse pencereye taşan daha geniş coverage kayıtları geçersiz olur (yeniden aranır).
+    """
+    rows = {}
+    for event in events:
+        start, end = event_dates(event, window_start)
+        key = _event_key(kind, city, genre, event.get('name', ''), start)
+        rows[key] = Event(
+            event_key=key, kind=kind, city=city, genre=genre, name=event.get('name', '')[:255],
+            start_date=start, end_date=end, event_data=event,
+        )
+
+    with transaction.atomic():
+        removed, _ = (Event.objects.filter(kind=kind, city=city, genre=genre, end_date__gte=window_start)
+                      .filter(Q(start_date__lte=window_end) | Q(start_date__isnull=True))
+                      .exclude(event_key__in=list(rows))
+                      .delete())
+        if removed:
+            # Bu pencereye taşan daha geniş kapsamlar (ör. Today yenilenirken ThisMonth) silinen
+            # etkinlikleri de sayıyordu: eksik listeyi "kapsanmış" diye servis etmesinler
+            EventCoverage.objects.filter(
+                kind=kind, city=city, genre=genre,
+                window_start__lte=window_end, window_end__gte=window_start,
+            ).exclude(window_start__gte=window_start, window_end__lte=window_end).delete()
+        Event.objects.bulk_create(
+            list(rows.values()),
+            update_conflicts=True,
+            unique_fields=['event_key'],
+            update_fields=['name', 'start_date', 'end_date', 'event_data', 'updated_at'],
+        )
+        # Pencere başına tek kayıt: diğer pencerelerin (ör. ThisMonth araması varken Today) taze
+        # kapsamı korunur, sadece aynı pencerenin eski kaydı ve süresi dolmuşlar silinir
+        EventCoverage.objects.filter(kind=kind, city=city, genre=genre).filter(
+            Q(window_start=window_start, window_end=window_end)
+            | Q(fetched_at__lt=timezone.now() - timedelta(hours=EVENT_COVERAGE_HOURS))
+        ).delete()
+        EventCoverage.objects.create(
+            kind=kind, city=city, genre=genre, window_start=window_start, window_end=window_end,
+            event_count=len(rows), fetched_at=timezone.now(),
+        )
+    logger.info("💾 EVENT STORE - %s %s (%s): %s etkinlik kaydedildi (%s → %s)", kind, city, genre or 'Any', len(rows), window_start, window_end)
+
+
+def expire_past_events(today: Optional[date] = None) -> int:
+    """Bitiş tarihi geçmiş etkinlikleri ve süresi dolmuş coverage kayıtlarını sil."""
+    today = today or date.today()
+    deleted, _ = Event.objects.filter(end_date__lt=today).delete()
+    EventCoverage.objects.filter(fetched_at__lt=timezone.now() - timedelta(hours=EVENT_COVERAGE_HOURS)).delete()
+    if deleted:
+        logger.info("🗑️ EVENT STORE - %s geçmiş etkinlik silindi", deleted)
+    return deleted
+
+
+def _refresh_lock(key: Tuple[str, str, str]) -> threading.Lock:
+    with _locks_guard:
+        return _refresh_locks.setdefault(key, threading.Lock())
+
+
+# ===== VIEW DEKORATÖRÜ =====
+
+def serve_from_event_store(kind: str) -> Callable:
+    """
+    generate_* etkinlik fonksiyonunu depo üzerinden çalıştır: kapsanan pencerede DB'den dön,
+    değilse (anahtar başına tek) grounded aramayı çalıştır ve 200 sonucunu kaydet.
+    """
+    def decorator(generate: Callable) -> Callable:
+        @functools.wraps(generate)
+        def wrapper(location, filters):
+            city = location['city']
+            genre = event_genre(kind, filters)
+            window_start, window_end = event_window(kind, filters, date.today())
+
+            with span('db.events'):
+                events = get_covered_events(kind, city, genre, window_start, window_end)
+            if events is not None:
+                logger.info("📦 EVENT STORE HIT - %s %s (%s): %s etkinlik", kind, city, genre or 'Any', len(events))
+                return Response(events, status=status.HTTP_200_OK)
+
+            with _refresh_lock((kind, city, genre)):
+                # Kilidi beklerken başka bir istek aynı pencereyi doldurmuş olabilir
+                events = get_covered_events(kind, city, genre, window_start, window_end)
+                if events is not None:
+                    return Response(events, status=status.HTTP_200_OK)
+
+                response = generate(location, filters)
+                if response.status_code == status.HTTP_200_OK and isinstance(response.data, list):
+                    try:
+                        save_events(kind, city, genre, window_start, window_end, response.data)
+                    except Exception as e:
+                        logger.warning("⚠️ Event store kayıt hatası: %s", e)
+                    defer(expire_past_events)
+                return response
+        return wrapper
+    return decorator
@@ -0,0 +1,471 @@
+"""
+Fine Dining Akışı (Michelin rehberi + Nearby Search + G&M)
+
+Fine Dining, venue_pipeline.VenuePipeline üzerinde kendi fetch / filter / rank / enrich / persist
+stage'leriyle çalışır; details ve Gemini yardımcıları (yorum kabulü, fallback alanları) ortaktır:
+
+    fetch    → cache + G&M (DB) ‖ ilçe başına geocode + keyword sorguları (paralel) ‖ Michelin rehberi detayları
+    filter   → isim dedupe (Michelin önce), rating eşiği, pastane / kafe REJECT, rating sırası
+    details  → Place Details (paralel) + eski yorum / kapanmış mekan kontrolü (venue_pipeline.details_stage)
+    rank     → Michelin restoranları + Places adayları, ilk api_limit mekan Gemini'ye
+    enrich   → tek Gemini batch çağrısı, response alanlarına indirgeme
+    persist  → cache'e kayıt + G&M / cache / API birleştirme, FINE_DINING sıralaması
+"""
+
+import logging
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from rest_framework.response import Response
+
+from .geo import GeoArea
+from .michelin_data import MICHELIN_GUIDE_BY_CITY
+from .opening_hours import filter_open_now
+from .ranking import FINE_DINING, rank_venues
+from .timing import bind
+from .venue_categories import PRACTICAL_REVIEW_KEYWORDS, CategoryConfig, PlaceText, photo_url_for
+from .venue_pipeline import (
+    COMBINED_LIMIT,
+    DETAILS_CONCURRENCY,
+    FETCH_CONCURRENCY,
+    PipelineContext,
+    VenuePipeline,
+    _ai_by_name,
+    _apply_enrichment,
+    _enrich_prompt,
+    _geocode,
+    _nearby_query,
+    _passes_filters,
+    badge_gm_venues,
+    details_stage,
+    review_excerpt,
+    run_pipeline,
+)
+from .venue_sources import (
+    CACHE_VENUES_LIMIT,
+    get_cached_venues_for_hybrid,
+    get_genai_model,
+    get_gm_venues_for_category,
+    is_michelin_restaurant,
+    save_venues_to_cache,
+    search_google_places,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+MICHELIN_LIMIT = 8                  # Rehberden en fazla bu kadar Michelin restoran
+EXTRA_CANDIDATES = 15               # Boş slot + bu kadar aday toplanınca kalan sorgular değerlendirilmez
+DEFAULT_IMAGE_URL = 'https://images.unsplash.com/photo-1414235077428-338989a2e8c0?w=800'
+MICHELIN_STATUS_ORDER = ('2 Yıldız', '1 Yıldız', 'Bib Gourmand')   # Rehber sırası; diğerleri (Selected) en sonda
+
+_FINE_DINING_EXCLUDED_KEYWORDS = (
+    'pastane', 'pasta atölyesi', 'butik pasta', 'patisserie',
+    'bakery', 'fırın', 'börek', 'simit', 'kafeterya'
+)
+_FINE_DINING_EXCLUDED_TYPES = ('bakery', 'cafe', 'meal_takeaway', 'fast_food_restaurant')
+
+# Response'taki Fine Dining alanları (iç alanlar - michelin_status, cuisine... - çıkarılır)
+_SERVED_FIELDS = (
+    'id', 'name', 'description', 'imageUrl', 'category', 'vibeTags', 'address', 'priceRange',
+    'googleRating', 'googleReviewCount', 'matchScore', 'noiseLevel', 'googleMapsUrl', 'isMichelinStarred',
+    'googleReviews', 'website', 'phoneNumber', 'hours', 'weeklyHours', 'isOpenNow', 'practicalInfo', 'atmosphereSummary',
+)
+
+
+def _reject_not_fine_dining(place: dict, text: PlaceText) -> Optional[str]:
+    excluded_type = any(t in text.types for t in _FINE_DINING_EXCLUDED_TYPES) and 'restaurant' not in text.types
+    if excluded_type or any(kw in text.lower for kw in _FINE_DINING_EXCLUDED_KEYWORDS):
+        return 'FINE DINING'
+    return None
+
+
+def _build_fine_dining_venue(place: dict, keyword: str, config: CategoryConfig, ctx: dict) -> dict:
+    place_id = place.get('place_id')
+    place_name = place.get('name', '')
+    opening_hours = place.get('opening_hours', {})
+    maps_query = urllib.parse.quote(f"{place_name} {ctx['city']}")
+    return {
+        'id': place_id,
+        'name': place_name,
+        'base_description': "Fine dining deneyimi sunan şık ve kaliteli bir restoran.",
+        'imageUrl': photo_url_for(place, ctx['api_key']) or DEFAULT_IMAGE_URL,
+        'category': config.name,
+        'vibeTags': ['#FineDining', '#Gourmet'],
+        'address': place.get('formatted_address', ''),
+        'priceRange': '$$$',
+        'googleRating': place.get('rating', 0),
+        'googleReviewCount': place.get('user_ratings_total', 0),
+        'matchScore': 85,
+        'noiseLevel': 35,
+        'googleMapsUrl': f"https://www.google.com/maps/search/?api=1&query={maps_query}",
+        'isMichelinStarred': is_michelin_restaurant(place_name) is not None,
+        'weeklyHours': opening_hours.get('weekday_text', []),
+        'isOpenNow': opening_hours.get('open_now', None),
+        'website': '',  # Legacy API nearbysearch'te website gelmez
+        'phoneNumber': '',  # Legacy API nearbysearch'te telefon gelmez
+    }
+
+
+def _build_fine_dining_prompt(venues: list, config: CategoryConfig, ctx: dict) -> str:
+    items = []
+    for i, v in enumerate(venues):
+        reviews_text = review_excerpt([r.get('text', '') for r in v.get('google_reviews') or []], config.practical_keywords)
+        michelin_note = f" | Michelin: {v['michelin_status']}" if v.get('michelin_status') else ""
+        items.append(f"{i+1}. {v['name']} | Rating: {v.get('googleRating', 'N/A')}{michelin_note}{reviews_text}")
+
+    return (
+        f"Kategori: {config.name}\n"
+        f"Kullanıcı Tercihleri: {config.prompt_preferences}\n\n"
+        f"Mekanlar ve Yorumları:\n" + "\n".join(items) + "\n\n" + config.prompt_schema
+    )
+
+
+_FINE_DINING_ATMOSPHERE = {
+    'noiseLevel': 'Sessiz',
+    'lighting': 'Loş',
+    'privacy': 'Özel',
+    'energy': 'Sakin',
+    'idealFor': ['romantik akşam', 'özel gün'],
+    'notIdealFor': [],
+    'oneLiner': 'Fine dining deneyimi sunan şık bir mekan.'
+}
+
+FINE_DINING_CONFIG = CategoryConfig(
+    name='Fine Dining',
+    emoji='🍽️',
+    queries=(
+        ('fine dining', 'Fine Dining'),
+        ('gourmet restaurant', 'Gourmet'),
+        ('upscale restaurant', 'Upscale'),
+        ('tasting menu', 'Tasting Menu'),
+        ('rooftop restaurant', 'Rooftop'),
+    ),
+    place_type='restaurant',
+    label_field='cuisine',
+    build_venue=_build_fine_dining_venue,
+    min_rating=4.2,
+    reject_rules=(_reject_not_fine_dining,),
+    gm_category_id='2',
+    default_vibe_tag='#FineDining',
+    default_atmosphere=_FINE_DINING_ATMOSPHERE,
+    fallback_atmosphere=_FINE_DINING_ATMOSPHERE,
+    error_message='Fine Dining restoranları getirilirken hata',
+    prompt_builder=_build_fine_dining_prompt,
+    prompt_preferences='Fine dining deneyimi, kaliteli restoran',
+    practical_keywords=PRACTICAL_REVIEW_KEYWORDS,
+    prompt_schema="""Her mekan için analiz yap ve JSON döndür:
+{
+  "name": "Mekan Adı",
+  "description": "2 cümle Türkçe - mekanın öne çıkan özelliği, fine dining atmosferi",
+  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
+  "practicalInfo": {
+    "reservationNeeded": "Tavsiye Edilir" | "Şart" | "Gerekli Değil" | null,
+    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
+    "waitTime": "Bekleme yok" | "10-15 dk" | "20-30 dk" | null,
+    "parking": "Kolay" | "Zor" | "Otopark var" | "Yok" | null,
+    "hasValet": true | false | null,
+    "outdoorSeating": true | false | null,
+    "kidFriendly": true | false | null,
+    "vegetarianOptions": true | false | null,
+    "alcoholServed": true | false | null,
+    "hasDelivery": true | false | null,
+    "hasTakeout": true | false | null,
+    "servesBreakfast": true | false | null,
+    "servesBrunch": true | false | null,
+    "serviceSpeed": "Hızlı" | "Normal" | "Yavaş" | null,
+    "priceFeeling": "Fiyatına Değer" | "Biraz Pahalı" | "Uygun" | null,
+    "mustTry": "Yorumlarda öne çıkan yemek/içecek" | null,
+    "headsUp": "Bilmeniz gereken önemli uyarı" | null
+  },
+  "atmosphereSummary": {
+    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı" | "Gürültülü",
+    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
+    "privacy": "Özel" | "Yarı Özel" | "Açık Alan",
+    "energy": "Sakin" | "Dengeli" | "Enerjik",
+    "idealFor": ["romantik akşam", "iş yemeği", "özel gün"],
+    "notIdealFor": ["aile yemeği"],
+    "oneLiner": "Tek cümle Türkçe atmosfer özeti"
+  }
+}
+
+practicalInfo Kuralları (YORUMLARDAN ÇIKAR):
+- reservationNeeded: Fine dining genelde "Şart" veya "Tavsiye Edilir"
+- crowdLevel: "Sakin", "sessiz", "rahat" → "Sakin". "Kalabalık", "gürültülü" → "Kalabalık"
+- parking: "Otopark", "park yeri" → "Otopark var". "Park zor", "park yok" → "Zor". "Park kolay" → "Kolay"
+- hasValet: "Vale", "valet" → true. Yoksa null
+- outdoorSeating: "Bahçe", "dış mekan", "teras" → true
+- kidFriendly: Fine dining genelde false, özellikle belirtilmemişse null
+- alcoholServed: Fine dining genelde true (şarap listesi vb.)
+- mustTry: Yorumlarda en çok övülen yemek/tasting menu
+- headsUp: Önemli uyarılar (dress code, nakit kabul etmeme vb.)
+
+atmosphereSummary Kuralları:
+- noiseLevel: Fine dining genelde "Sessiz" veya "Sohbet Dostu"
+- lighting: Fine dining genelde "Loş" veya "Yumuşak"
+- privacy: Fine dining genelde "Özel" veya "Yarı Özel"
+- energy: Fine dining genelde "Sakin" veya "Dengeli"
+- idealFor: Max 3 - "romantik akşam", "iş yemeği", "özel gün", "kutlama", "ilk buluşma"
+- notIdealFor: Max 2 - "aile yemeği", "hızlı yemek", "çocuklu gelmek"
+- oneLiner: Tek cümle atmosfer özeti
+
+SADECE JSON ARRAY döndür, başka açıklama yazma.""",
+)
+
+
+class FineDiningContext(PipelineContext):
+    """PipelineContext + birden fazla ilçe ve Michelin rehberi mekanları."""
+
+    def __init__(self, config: CategoryConfig, location: dict, filters: dict, exclude_ids):
+        super().__init__(config, location, filters, exclude_ids)
+        self.districts = location.get('districts', [])
+        # Birden fazla ilçe seçilebilir; her biri ayrı arama merkezi
+        self.search_locations = [f"{d}, {self.city}" for d in self.districts] or [self.city]
+        self.michelin_venues: List[dict] = []
+
+
+# ===== FETCH =====
+
+def _load_known_venues(ctx: FineDiningContext):
+    """SWR cache + G&M (DB; istek thread'inde). G&M, cache'te olan mekanları tekrar getirmez."""
+    config = ctx.config
+    ctx.cached_venues, all_cached_ids = get_cached_venues_for_hybrid(
+        category_name=config.name,
+        city=ctx.city,
+        district=ctx.district,
+        neighborhood=ctx.neighborhood,
+        exclude_ids=ctx.exclude_ids,
+        limit=CACHE_VENUES_LIMIT,
+        open_now=bool(ctx.filters.get('openNow'))
+    )
+    ctx.api_exclude_ids = ctx.exclude_ids | all_cached_ids
+    logger.info("🔀 HYBRID - Fine Dining Cache: %s, API exclude: %s", len(ctx.cached_venues), len(ctx.api_exclude_ids))
+
+    ctx.gm_venues = get_gm_venues_for_category(
+        category_id=config.gm_category_id,
+        category_name=config.name,
+        city=ctx.city,
+        exclude_ids=ctx.api_exclude_ids,
+        district=ctx.district
+    )
+    if ctx.gm_venues:
+        logger.info("🏆 G&M - Fine Dining kategorisinde %s G&M restoran bulundu (%s)", len(ctx.gm_venues), ctx.city)
+        ctx.api_exclude_ids |= {v.get('id') for v in ctx.gm_venues if v.get('id')}
+
+
+def _fetch_places(ctx: FineDiningContext) -> list:
+    """Arka plan thread'i: ilçe başına geocode, ardından (ilçe × keyword) sorguları paralel."""
+    config = ctx.config
+
+    def geocode(search_loc):
+        area = _geocode(search_loc, ctx.api_key, config.radius / 1000)
+        # Alan filtresi yok: merkez + sabit yarıçap (Nearby Search zaten kesin lokasyon filtresi yapar)
+        return GeoArea(area.center, config.radius / 1000) if area else None
+
+    with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as pool:
+        areas = list(pool.map(bind(geocode), ctx.search_locations))
+        jobs = [(area, keyword) for area in areas if area for keyword, _ in config.queries]
+        pages = list(pool.map(bind(lambda job: _nearby_query(config, job[0], job[1], ctx.api_key)), jobs))
+    # Sorgu sırası korunur (dedupe önceliği ve aday kesme noktası aynı kalsın)
+    return [(keyword, places) for (_, keyword), places in zip(jobs, pages)]
+
+
+def _guide_restaurants(ctx: FineDiningContext) -> List[dict]:
+    """Şehirdeki Michelin rehberi restoranları (ilçe filtresi, yıldız sırası)."""
+    restaurants = MICHELIN_GUIDE_BY_CITY.get(ctx.city, [])
+    if ctx.districts:
+        districts_lower = [d.lower() for d in ctx.districts]
+        restaurants = [r for r in restaurants if r['district'].lower() in districts_lower]
+
+    def order(r):
+        return next((i for i, s in enumerate(MICHELIN_STATUS_ORDER) if s in r['status']), len(MICHELIN_STATUS_ORDER))
+
+    return sorted(restaurants, key=order)[:MICHELIN_LIMIT]
+
+
+def _michelin_venue(idx: int, r: dict, city: str) -> dict:
+    status = r['status']
+    search_query = f"{r['name']} {r['district']} {city} restaurant"
+    venue = {
+        'id': f"michelin_fd_{idx+1}",
+        'name': r['name'],
+        'base_description': f"{r['cuisine']} mutfağı sunan {status} ödüllü restoran.",
+        'imageUrl': DEFAULT_IMAGE_URL,
+        'category': FINE_DINING_CONFIG.name,
+        'vibeTags': ['#MichelinGuide', f"#{status.replace(' ', '')}", f"#{r['cuisine'].replace(' ', '')}"],
+        'address': f"{r['district']}, {city}",
+        'priceRange': '$$$' if status == 'Selected' else '$$$$',
+        'matchScore': 98 if '2 Yıldız' in status else 95 if '1 Yıldız' in status else 92 if 'Bib' in status else 88,
+        'noiseLevel': 30,
+        'googleMapsUrl': f"https://www.google.com/maps/search/?api=1&query={urllib.parse.quote(search_query)}",
+        # Badge sadece yıldızlı veya Bib Gourmand için gösterilir (Selected için değil)
+        'isMichelinStarred': 'Yıldız' in status or 'Bib' in status,
+        'google_reviews': [],  # Gemini için
+        'michelin_status': status,
+        'cuisine': r['cuisine'],
+    }
+
+    # Google Places API ile detay al
+    try:
+        places_data = search_google_places(search_query, 1)
+        if places_data:
+            place = places_data[0]
+            venue['googleRating'] = place.get('rating', 4.5)
+            venue['googleReviewCount'] = place.get('user_ratings_total', 0)
+            venue['website'] = place.get('website', '')
+            venue['phoneNumber'] = place.get('formatted_phone_number', '')
+            venue['hours'] = place.get('hours', '')
+            venue['weeklyHours'] = place.get('weeklyHours', [])
+            venue['isOpenNow'] = place.get('isOpenNow', None)
+            if place.get('imageUrl'):
+                venue['imageUrl'] = place['imageUrl']
+            if place.get('reviews'):
+                venue['google_reviews'] = place['reviews'][:5]
+                venue['googleReviews'] = place['reviews'][:5]
+    except Exception as e:
+        logger.warning("⚠️ Google Places error for %s: %s", r['name'], e)
+        venue['googleRating'] = 4.5
+        venue['googleReviewCount'] = 0
+    return venue
+
+
+def fetch_stage(ctx: FineDiningContext):
+    logger.info("🍽️ Fine Dining + Michelin araması: %s", ctx.search_locations)
+    guide = _guide_restaurants(ctx)
+    with ThreadPoolExecutor(max_workers=DETAILS_CONCURRENCY) as pool:
+        places_future = pool.submit(bind(_fetch_places), ctx)
+        michelin_futures = [pool.submit(bind(_michelin_venue), idx, r, ctx.city) for idx, r in enumerate(guide)]
+        _load_known_venues(ctx)
+        ctx.michelin_venues = [future.result() for future in michelin_futures]
+        ctx.query_results = places_future.result()
+    logger.info("✅ %s Michelin restoran eklendi", len(ctx.michelin_venues))
+    ctx.count('fetched', sum(len(places) for _, places in ctx.query_results))
+
+
+# ===== FILTER =====
+
+def filter_stage(ctx: FineDiningContext):
+    config = ctx.config
+    added_names = {v['name'].lower() for v in ctx.michelin_venues}
+    remaining_slots = COMBINED_LIMIT - len(ctx.michelin_venues)
+    places = []
+
+    for _, results in ctx.query_results:
+        # Yeterli aday toplandıysa kalan sorgular değerlendirilmez
+        if len(places) >= remaining_slots + EXTRA_CANDIDATES:
+            break
+        for place in results:
+            name_lower = place.get('name', '').lower()
+            # İlçe kontrolü yok: Nearby Search koordinat + radius bazlı, vicinity ilçe adını içermiyor
+            if name_lower in added_names or not _passes_filters(ctx, place):
+                continue
+            places.append(place)
+            added_names.add(name_lower)
+    logger.info("📊 Toplam %s unique Google Places mekan bulundu", len(places))
+
+    places.sort(key=lambda p: p.get('rating', 0), reverse=True)
+    builder_ctx = ctx.builder_ctx
+    ctx.candidates = []
+    for idx, place in enumerate(places[:remaining_slots]):
+        venue = config.build_venue(place, '', config, builder_ctx)
+        venue['id'] = venue['id'] or f"fd_{idx+1}"   # place_id'siz sonuç (Places'te beklenmez)
+        ctx.candidates.append(venue)
+    ctx.count('candidates', len(ctx.candidates))
+
+
+# ===== RANK =====
+
+def rank_stage(ctx: FineDiningContext):
+    # Michelin restoranları önce, ardından rating sırasıyla Places adayları
+    venues = ctx.michelin_venues + ctx.venues
+    logger.info("✅ Gemini'ye gönderilecek toplam %s mekan", len(venues))
+    ctx.venues = venues[:ctx.config.api_limit]
+
+
+# ===== ENRICH =====
+
+def _served(venue: dict) -> dict:
+    """Venue'yu response alanlarına indirger; Places'ten gelmeyen alanlar varsayılanla doldurulur."""
+    defaults = {
+        'googleRating': 4.5, 'googleReviewCount': 0, 'isMichelinStarred': False, 'googleReviews': [],
+        'website': '', 'phoneNumber': '', 'hours': '', 'weeklyHours': [], 'isOpenNow': None,
+    }
+    return {key: venue[key] if key in venue else defaults[key] for key in _SERVED_FIELDS}
+
+
+def enrich_stage(ctx: FineDiningContext):
+    config = ctx.config
+    if not ctx.venues:
+        return
+
+    ai_by_name = None
+    try:
+        model = get_genai_model()
+        if model:
+            response = model.generate_content(_enrich_prompt(ctx))
+            ai_by_name = _ai_by_name(config, response.text)
+    except Exception as e:
+        logger.error("❌ Gemini Fine Dining hatası: %s", e)
+
+    _apply_enrichment(ctx, ai_by_name)
+    ctx.venues = [_served(venue) for venue in ctx.venues]
+    if ai_by_name is not None:
+        logger.info("✅ Gemini ile %s Fine Dining mekan zenginleştirildi", len(ctx.venues))
+
+
+# ===== PERSIST =====
+
+def persist_stage(ctx: FineDiningContext):
+    config = ctx.config
+    logger.info("✅ API'den %s fine dining restoran geldi", len(ctx.venues))
+    if ctx.venues:
+        save_venues_to_cache(
+            venues=ctx.venues,
+            category_name=config.name,
+            city=ctx.city,
+            district=ctx.district
+        )
+
+    # G&M restoranlarının hepsi, ardından cache ve API (ID ve isim bazlı duplicate kontrolü)
+    all_venues = badge_gm_venues(ctx.gm_venues, config.name) if ctx.gm_venues else []
+    existing_ids = {v.get('id') for v in all_venues}
+    existing_names = {v.get('name', '').lower().strip() for v in all_venues}
+    for venue in ctx.cached_venues + ctx.venues:
+        name = venue.get('name', '').lower().strip()
+        if venue.get('id') not in existing_ids and name not in existing_names:
+            all_venues.append(venue)
+            existing_ids.add(venue.get('id'))
+            existing_names.add(name)
+
+    # Michelin yıldız > Bib Gourmand > G&M (toque) > diğerleri (rating)
+    all_venues = rank_venues(all_venues, FINE_DINING)
+    # "Şu an açık": cache tarafı zaten filtreli, Michelin / G&M / API mekanları burada elenir
+    if ctx.filters.get('openNow'):
+        all_venues = filter_open_now(all_venues)
+    ctx.result = all_venues[:COMBINED_LIMIT]
+
+    michelin_count = sum(1 for v in ctx.result if v.get('isMichelinStarred'))
+    gm_count = sum(1 for v in ctx.result if v.get('gaultMillauToques') and not v.get('isMichelinStarred'))
+    logger.info(
+        "🔀 HYBRID Fine Dining - Michelin: %s, G&M: %s, Cache: %s, API: %s, Combined: %s",
+        michelin_count, gm_count, len(ctx.cached_venues), len(ctx.venues), len(ctx.result)
+    )
+
+
+# ===== ENGINE =====
+
+FINE_DINING_STAGES = (
+    ('fetch', fetch_stage),
+    ('filter', filter_stage),
+    ('details', details_stage),
+    ('rank', rank_stage),
+    ('enrich', enrich_stage),
+    ('persist', persist_stage),
+)
+
+
+def run_fine_dining_pipeline(location: dict, filters: dict, exclude_ids) -> Response:
+    """generate_venues Fine Dining dalı için giriş noktası."""
+    return run_pipeline(VenuePipeline(FINE_DINING_STAGES), FineDiningContext(FINE_DINING_CONFIG, location, filters, exclude_ids))
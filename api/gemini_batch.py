@@ -0,0 +1,99 @@
+"""
+Batch Gemini + place_id Cache'i (vibe_service, similar_service ortak altyapısı)
+
+Vibe skorları (search_venues) ve benzer mekan açıklamaları (get_similar_venues) aynı kalıbı
+kullanır: cache'te olmayan mekanlar tek bir numaralı prompt'ta Gemini'ye gider, cevap index'li
+JSON array olarak parse edilir ve sonuçlar place_id bazında cache'lenir. Servisler sadece
+prompt'u ve tek bir array elemanının parse'ını tanımlar (PlaceBatch); cache bölme, çağrı,
+parse ve yazma burada bir kez yapılır.
+
+Kullanım:
+    VIBES = PlaceBatch('vibe', 'vibe:', VIBE_CACHE_TTL, build_vibe_batch_prompt, parse_vibe_item)
+    vibes = run_batch(VIBES, model, venues)             # {place_id: sonuç}
+    vibes = await run_batch_async(VIBES, model, venues) # ASGI
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from django.core.cache import cache
+
+from .timing import span
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PlaceBatch:
+    """Bir batch servisinin tanımı: cache anahtarı, prompt ve array elemanı parse'ı."""
+    name: str                                           # Span (gemini.<name>) ve log etiketi
+    cache_prefix: str
+    ttl: int
+    build_prompt: Callable[[Sequence[dict]], str]       # Cache'te olmayan mekanlar → prompt
+    parse_item: Callable[[dict], Any]                   # JSON array elemanı → sonuç (boş → cache'lenmez)
+
+
+def parse_indexed_array(text: str, count: int, parse_item: Callable[[dict], Any]) -> List[Any]:
+    """Cevaptaki JSON array'i mekan sırasıyla listeye çevir ("index" 1'den başlar); eksikler None."""
+    text = text.strip()
+    results: List[Any] = [None] * count
+    if '[' not in text or ']' not in text:
+        return results
+    items = json.loads(text[text.index('['):text.rindex(']') + 1])
+    for position, item in enumerate(items):
+        if not isinstance(item, dict):
+            continue
+        index = item.get('index', position + 1)
+        if isinstance(index, int) and 1 <= index <= count:
+            results[index - 1] = parse_item(item)
+    return results
+
+
+def _split_cached(batch: PlaceBatch, places: Sequence[dict]) -> Tuple[Dict[str, Any], List[dict]]:
+    """(cache'teki sonuçlar, cache'te olmayan mekanlar); place_id'siz mekanlar atlanır."""
+    keys = {f"{batch.cache_prefix}{p['place_id']}": p['place_id'] for p in places if p.get('place_id')}
+    cached = {keys[key]: data for key, data in cache.get_many(list(keys)).items()}
+    return cached, [p for p in places if p.get('place_id') and p['place_id'] not in cached]
+
+
+def _store(batch: PlaceBatch, results: Dict[str, Any], missing: Sequence[dict], text: str) -> None:
+    try:
+        parsed = parse_indexed_array(text, len(missing), batch.parse_item)
+    except ValueError as e:
+        logger.warning("Gemini %s parse hatası: %s", batch.name, e)
+        return
+    # Boş sonuçlar cache'lenmez (bir sonraki istekte tekrar denenir)
+    fresh = {p['place_id']: data for p, data in zip(missing, parsed) if data}
+    results.update(fresh)
+    cache.set_many({f"{batch.cache_prefix}{pid}": data for pid, data in fresh.items()}, batch.ttl)
+
+
+def run_batch(batch: PlaceBatch, model, places: Sequence[dict]) -> Dict[str, Any]:
+    """place_id → sonuç; cache'te olmayanlar için tek Gemini çağrısı."""
+    results, missing = _split_cached(batch, places)
+    if missing and model:
+        try:
+            with span(f'gemini.{batch.name}'):
+                response = model.generate_content(batch.build_prompt(missing))
+            _store(batch, results, missing, response.text)
+        except Exception as e:
+            logger.warning("Gemini %s hatası: %s", batch.name, e)
+    logger.info("💬 Gemini %s: %s cache'ten, %s batch çağrıda", batch.name, len(places) - len(missing), len(missing))
+    return results
+
+
+async def run_batch_async(batch: PlaceBatch, model, places: Sequence[dict]) -> Dict[str, Any]:
+    """run_batch'in async (ASGI) karşılığı."""
+    from asgiref.sync import sync_to_async
+
+    results, missing = await sync_to_async(_split_cached, thread_sensitive=False)(batch, places)
+    if missing and model:
+        try:
+            with span(f'gemini.{batch.name}'):
+                response = await model.generate_content_async(batch.build_prompt(missing))
+            await sync_to_async(_store, thread_sensitive=False)(batch, results, missing, response.text)
+        except Exception as e:
+            logger.warning("Gemini %s hatası: %s", batch.name, e)
+    return results
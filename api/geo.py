@@ -0,0 +1,124 @@
+"""
+Konum Geometrisi (alan filtresi + mesafe)
+
+Lokasyon filtresi eskiden adres metnine bakıyordu: ilçe adı formatted_address / vicinity
+içinde geçiyor mu (Türkçe normalize edilerek, mekan başına). Nearby Search'te vicinity ilçe
+adını içermediği için kontrol tamamen atlanıyor, arama yarıçapı da sabit (2-3 km) kalıyordu.
+
+Places sonuçları zaten geometry.location taşıyor. Burada:
+
+1. area_from_geocode: geocode sonucundan GeoArea - merkez, yarıçap ve varsa bounds / viewport
+   dikdörtgeni (ilçe / mahalle poligonu). Arama yarıçapı alanın boyutundan türetilir ama
+   MAX_AREA_RADIUS_KM ile sınırlıdır: şehir seviyesinde (İstanbul bounds'u ~100 km) 50 km'lik
+   bir arama merkezden uzak, alakasız sonuçlar getirir. Bounds sadece alan içi filtresidir.
+2. measure: bir aday batch'inin tüm koordinatları için tek vektörel haversine geçişi ve
+   alan içi maskesi (poligon varsa ışın testi, yoksa yarıçap).
+
+Koordinatı olmayan mekanlar için sonuç bilinmez (None); çağıran taraf adres kontrolüne düşer.
+Mesafe (distanceKm) sıralama motorunda (api/ranking.py) feature olarak kullanılır.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# ===== CONFIGURATION =====
+EARTH_RADIUS_KM = 6371.0088
+MAX_SEARCH_RADIUS_M = 50000      # Places API radius üst sınırı
+MIN_AREA_RADIUS_KM = 1.0         # Viewport çok küçükse (tek sokak / nokta) alt sınır
+MAX_AREA_RADIUS_KM = 5.0         # Şehir / büyük ilçe bounds'unda arama yarıçapı üst sınırı (eski sabit 2-3 km'ye yakın)
+
+LatLng = Tuple[float, float]
+
+
+def haversine_km(lat: np.ndarray, lng: np.ndarray, center: LatLng) -> np.ndarray:
+    """Merkezden tüm noktalara büyük daire mesafesi (km), tek vektörel geçiş."""
+    lat1, lng1 = np.radians(center[0]), np.radians(center[1])
+    lat2, lng2 = np.radians(lat), np.radians(lng)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def points_in_polygon(lat: np.ndarray, lng: np.ndarray, polygon: Sequence[LatLng]) -> np.ndarray:
+    """Çift-tek ışın testi; kenar başına bir vektörel geçiş (n nokta × k köşe)."""
+    inside = np.zeros(len(lat), dtype=bool)
+    k = len(polygon)
+    for i in range(k):
+        (lat_a, lng_a), (lat_b, lng_b) = polygon[i], polygon[(i + 1) % k]
+        if lat_a == lat_b:
+            continue
+        crosses = (lat_a > lat) != (lat_b > lat)
+        edge_lng = lng_a + (lat - lat_a) * (lng_b - lng_a) / (lat_b - lat_a)
+        inside ^= crosses & (lng < edge_lng)
+    return inside
+
+
+@dataclass(frozen=True)
+class GeoArea:
+    """Aranan lokasyon: merkez + yarıçap, varsa ilçe / mahalle poligonu."""
+    center: LatLng
+    radius_km: float
+    polygon: Tuple[LatLng, ...] = ()     # Boş → sadece yarıçap kontrolü
+
+    def search_radius_m(self, minimum_m: int) -> int:
+        """Places API radius parametresi: alanı kapsayacak kadar, minimum_m'den az değil."""
+        return int(min(MAX_SEARCH_RADIUS_M, max(minimum_m, math.ceil(self.radius_km * 1000))))
+
+
+def area_from_geocode(result: dict, default_radius_km: float) -> GeoArea:
+    """
+    Geocode sonucundan GeoArea. bounds (yoksa viewport) dikdörtgeni poligon olarak alınır
+    (alan içi filtresi); yarıçap merkezden en uzak köşeye mesafedir, [MIN_AREA_RADIUS_KM,
+    MAX_AREA_RADIUS_KM] aralığına sıkıştırılır. İkisi de yoksa default_radius_km.
+    """
+    geometry = result.get('geometry') or {}
+    location = geometry['location']
+    center = (float(location['lat']), float(location['lng']))
+    box = geometry.get('bounds') or geometry.get('viewport')
+    if not box:
+        return GeoArea(center, default_radius_km)
+
+    north, east = box['northeast']['lat'], box['northeast']['lng']
+    south, west = box['southwest']['lat'], box['southwest']['lng']
+    polygon = ((south, west), (south, east), (north, east), (north, west))
+    corners = np.array(polygon, dtype=float)
+    radius_km = float(haversine_km(corners[:, 0], corners[:, 1], center).max())
+    return GeoArea(center, min(max(radius_km, MIN_AREA_RADIUS_KM), MAX_AREA_RADIUS_KM), polygon)
+
+
+def place_coordinates(places: Sequence[dict]) -> np.ndarray:
+    """Places sonuçlarının geometry.location değerleri (n × 2); eksikse NaN."""
+    locations = [(place.get('geometry') or {}).get('location') or {} for place in places]
+    # None → NaN (dtype=float dönüşümü)
+    return np.array([(loc.get('lat'), loc.get('lng')) for loc in locations], dtype=float).reshape(len(places), 2)
+
+
+class Placement(NamedTuple):
+    """Bir aday batch'inin alana göre konumu (measure çıktısı)."""
+    distance_km: np.ndarray              # Merkezden mesafe; koordinat yoksa NaN
+    inside: np.ndarray                   # Alan içinde mi (koordinat yoksa False)
+    known: np.ndarray                    # Koordinat var mı
+
+    def in_area(self, i: int) -> Optional[bool]:
+        return bool(self.inside[i]) if self.known[i] else None
+
+    def distance(self, i: int) -> Optional[float]:
+        return round(float(self.distance_km[i]), 2) if self.known[i] else None
+
+
+def measure(places: Sequence[dict], area: GeoArea) -> Placement:
+    """Tüm aday batch'i için mesafe ve alan içi maskesi (tek vektörel geçiş)."""
+    coords = place_coordinates(places)
+    known = ~np.isnan(coords).any(axis=1)
+    distance = np.full(len(places), np.nan)
+    inside = np.zeros(len(places), dtype=bool)
+    if known.any():
+        lat, lng = coords[known, 0], coords[known, 1]
+        distance[known] = haversine_km(lat, lng, area.center)
+        if area.polygon:
+            inside[known] = points_in_polygon(lat, lng, area.polygon)
+        else:
+            inside[known] = distance[known] <= area.radius_km
+    return Placement(distance, inside, known)
@@ -11,15 +11,19 @@ Yöntemler:
 4. Google Custom Search API ile ara (opsiyonel)
 """
 
+import logging
 import os
 import re
-import sys
 import requests
 from typing import Optional, Dict, List
 from functools import lru_cache
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from .timing import bind
+
+logger = logging.getLogger(__name__)
+
 # Google Custom Search API credentials
 # GOOGLE_MAPS_API_KEY kullanılıyor (Render'da bu isimle tanımlı)
 GOOGLE_API_KEY = os.environ.get('GOOGLE_MAPS_API_KEY')
@@ -228,7 +232,7 @@ def guess_instagram_from_name(venue_name: str, city: str = None) -> Optional[str
     with ThreadPoolExecutor(max_workers=3) as executor:
         futures = {}
         for username in variants[:6]:  # İlk 6 variant'ı dene
-            future = executor.submit(check_instagram_profile_exists, username)
+            future = executor.submit(bind(check_instagram_profile_exists), username)
             futures[future] = username
 
         for future in as_completed(futures, timeout=10):
@@ -236,7 +240,7 @@ def guess_instagram_from_name(venue_name: str, city: str = None) -> Optional[str
             try:
                 if future.result():
                     instagram_url = f"https://instagram.com/{username}"
-                    print(f"✅ INSTAGRAM - Guessed from name: {venue_name} -> {instagram_url}", file=sys.stderr, flush=True)
+                    logger.debug("✅ INSTAGRAM - Guessed from name: %s -> %s", venue_name, instagram_url)
                     return instagram_url
             except Exception:
                 continue
@@ -409,10 +413,10 @@ def search_instagram_google(venue_name: str, city: str, district: str = None, ne
 
                         if score > 0:
                             candidates.append((score, normalized, query))
-                            print(f"🔍 INSTAGRAM candidate: {username} (score={score}) from query: {query[:50]}...", file=sys.stderr, flush=True)
+                            logger.debug("🔍 INSTAGRAM candidate: %s (score=%s) from query: %s...", username, score, query[:50])
 
         except Exception as e:
-            print(f"⚠️ INSTAGRAM - Google CSE error ({query[:50]}...): {e}", file=sys.stderr, flush=True)
+            logger.warning("⚠️ INSTAGRAM - Google CSE error (%s...): %s", query[:50], e)
             continue
 
     # En yüksek skorlu adayı seç
@@ -422,10 +426,10 @@ def search_instagram_google(venue_name: str, city: str, district: str = None, ne
 
         # Minimum skor eşiği (çok düşük skorlu sonuçları kabul etme)
         if best_score >= 20:
-            print(f"✅ INSTAGRAM - Found via Google (score={best_score}): {venue_name} -> {best_url}", file=sys.stderr, flush=True)
+            logger.info("✅ INSTAGRAM - Found via Google (score=%s): %s -> %s", best_score, venue_name, best_url)
             return best_url
         else:
-            print(f"⚠️ INSTAGRAM - Best candidate score too low ({best_score}): {best_url}", file=sys.stderr, flush=True)
+            logger.warning("⚠️ INSTAGRAM - Best candidate score too low (%s): %s", best_score, best_url)
 
     return None
 
@@ -461,7 +465,7 @@ def find_instagram_from_website(website_url: str) -> Optional[str]:
                 for match in matches:
                     normalized = normalize_instagram_url(match)
                     if normalized:
-                        print(f"✅ INSTAGRAM - Found from website: {website_url} -> {normalized}", file=sys.stderr, flush=True)
+                        logger.debug("✅ INSTAGRAM - Found from website: %s -> %s", website_url, normalized)
                         return normalized
 
     except Exception:
@@ -512,7 +516,7 @@ def discover_instagram_url(
         if time.time() < expiry:
             cached = _instagram_cache[cache_key]
             if cached:
-                print(f"📦 INSTAGRAM - Cache hit: {venue_name} -> {cached}", file=sys.stderr, flush=True)
+                logger.info("📦 INSTAGRAM - Cache hit: %s -> %s", venue_name, cached)
             # Cache'deki değerler doğrulanmış kabul edilir
             if return_verified:
                 return cached, True
@@ -523,17 +527,17 @@ def discover_instagram_url(
 
     # 1. Google Custom Search ile ara - EN GÜVENİLİR YÖNTEM
     # "baristocrat istanbul" araması -> "baristocrat3rd" bulur
-    print(f"🔍 INSTAGRAM - CSE check: API_KEY={'YES' if GOOGLE_API_KEY else 'NO'}, CSE_ID={'YES' if GOOGLE_CSE_ID else 'NO'}", file=sys.stderr, flush=True)
+    logger.info("🔍 INSTAGRAM - CSE check: API_KEY=%s, CSE_ID=%s", 'YES' if GOOGLE_API_KEY else 'NO', 'YES' if GOOGLE_CSE_ID else 'NO')
     if GOOGLE_API_KEY and GOOGLE_CSE_ID:
-        print(f"🔍 INSTAGRAM - CSE araması başlıyor: {venue_name}", file=sys.stderr, flush=True)
+        logger.info("🔍 INSTAGRAM - CSE araması başlıyor: %s", venue_name)
         instagram_url = search_instagram_google(venue_name, city, district, neighborhood)
         if instagram_url:
             is_verified = True
-            print(f"✅ INSTAGRAM - Verified via Google Search: {venue_name} -> {instagram_url}", file=sys.stderr, flush=True)
+            logger.info("✅ INSTAGRAM - Verified via Google Search: %s -> %s", venue_name, instagram_url)
         else:
-            print(f"⚠️ INSTAGRAM - CSE sonuç bulamadı: {venue_name}", file=sys.stderr, flush=True)
+            logger.warning("⚠️ INSTAGRAM - CSE sonuç bulamadı: %s", venue_name)
     else:
-        print(f"❌ INSTAGRAM - CSE devre dışı (API key veya CSE ID eksik)", file=sys.stderr, flush=True)
+        logger.error("❌ INSTAGRAM - CSE devre dışı (API key veya CSE ID eksik)")
 
     # 2. Website'ten Instagram linki bul
     if not instagram_url and website:
@@ -548,14 +552,14 @@ def discover_instagram_url(
         if normalized:
             instagram_url = normalized
             is_verified = False  # Gemini'den gelen doğrulanmamış
-            print(f"⚠️ INSTAGRAM - Using unverified (from Gemini): {venue_name} -> {instagram_url}", file=sys.stderr, flush=True)
+            logger.warning("⚠️ INSTAGRAM - Using unverified (from Gemini): %s -> %s", venue_name, instagram_url)
 
     # 4. Mekan adından tahmin et (son çare - düşük güvenilirlik)
     if not instagram_url:
         instagram_url = guess_instagram_from_name(venue_name, city)
         if instagram_url:
             is_verified = False  # Tahmin, doğrulanmamış
-            print(f"⚠️ INSTAGRAM - Guessed (unverified): {venue_name} -> {instagram_url}", file=sys.stderr, flush=True)
+            logger.warning("⚠️ INSTAGRAM - Guessed (unverified): %s -> %s", venue_name, instagram_url)
 
     # Cache'e kaydet (None da dahil - negatif cache, ama daha kısa süre)
     _instagram_cache[cache_key] = instagram_url
@@ -564,7 +568,7 @@ def discover_instagram_url(
     _cache_expiry[cache_key] = time.time() + cache_duration
 
     if not instagram_url:
-        print(f"⚠️ INSTAGRAM - Not found: {venue_name}", file=sys.stderr, flush=True)
+        logger.warning("⚠️ INSTAGRAM - Not found: %s", venue_name)
 
     if return_verified:
         return instagram_url, is_verified
@@ -617,7 +621,7 @@ def clear_instagram_cache() -> dict:
     _instagram_cache = {}
     _cache_expiry = {}
 
-    print(f"🗑️ INSTAGRAM CACHE CLEARED - {cache_size} entries removed", file=sys.stderr, flush=True)
+    logger.info("🗑️ INSTAGRAM CACHE CLEARED - %s entries removed", cache_size)
 
     return {
         "cleared_entries": cache_size,
@@ -676,9 +680,9 @@ def find_instagram_simple(venue_name: str, neighborhood: str = None, city: str =
                     # Geçersiz path'leri filtrele
                     if username.lower() not in ['p', 'reel', 'reels', 'stories', 'explore']:
                         instagram_url = f"https://instagram.com/{username}"
-                        print(f"✅ INSTAGRAM (simple): {venue_name} -> {instagram_url}", file=sys.stderr, flush=True)
+                        logger.debug("✅ INSTAGRAM (simple): %s -> %s", venue_name, instagram_url)
                         return instagram_url
     except Exception as e:
-        print(f"⚠️ INSTAGRAM (simple) error: {e}", file=sys.stderr, flush=True)
+        logger.warning("⚠️ INSTAGRAM (simple) error: %s", e)
 
     return None
@@ -0,0 +1,227 @@
+"""
+Tatil Rotası (itinerary) Üretimi ve Cache'i
+
+generate_vacation_experiences eskiden tek prompt'ta `duration * 6` aktivite istiyordu: 7 günlük
+bir rota tek, yavaş bir completion'da 42 elemanlı JSON array demekti ve aynı
+(lokasyon, süre) her kullanıcı için baştan üretiliyordu. Artık:
+
+1. Rota, kanonik lokasyon + süre (+ prompt'a giren filtreler) anahtarıyla Django cache'te
+   tutulur (ITINERARY_CACHE_TTL). Redis varsa worker'lar arası paylaşılır.
+2. Uzun rotalar DAYS_PER_CHUNK günlük aralıklara bölünür; aralıklar paralel üretilip gün
+   sırasıyla birleştirilir. Toplam süre en yavaş aralık kadar olur.
+3. iter_itinerary aralıkları gün sırasıyla, hazır oldukça verir. Stream endpoint'i
+   (stream_vacation_itinerary) 1. günü, 7. gün hazır olmadan gönderebilir. ASGI'de
+   aiter_itinerary aynı akışı async generator olarak verir (worker thread'i tutmadan).
+
+Kullanım:
+    activities = build_itinerary(model, location, trip_duration, filters)
+    for days, activities in iter_itinerary(model, location, trip_duration, filters): ...
+    async for days, activities in aiter_itinerary(model, location, trip_duration, filters): ...
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, List, Tuple
+
+from django.core.cache import cache
+
+from .timing import bind, span
+from .venue_categories import normalize_tr
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+ITINERARY_CACHE_TTL = 60 * 60 * 24 * 3      # 3 gün - rota önerileri gün ölçeğinde değişmez
+ITINERARY_CACHE_PREFIX = 'itinerary:'
+DEFAULT_TRIP_DAYS = 3                       # tripDuration gelmezse
+MAX_TRIP_DAYS = 14                          # tripDuration üst sınırı (serializer + iter_itinerary)
+ACTIVITIES_PER_DAY = 6
+DAYS_PER_CHUNK = 2                          # Tek Gemini çağrısının üreteceği gün sayısı
+MAX_CHUNK_CONCURRENCY = 4                   # Aynı anda en fazla bu kadar aralık üretilir
+ITINERARY_FILTER_KEYS: Tuple[str, ...] = ()  # Prompt'a giren filtreler (şu an yok) - cache anahtarına girer
+
+DayRange = Tuple[int, int]
+
+
+def location_query(location: dict) -> str:
+    districts = location.get('districts', [])
+    return f"{districts[0]}, {location['city']}" if districts else location['city']
+
+
+def itinerary_cache_key(location: dict, duration: int, filters: dict) -> str:
+    """Kanonik lokasyon (Türkçe normalize) + süre + ITINERARY_FILTER_KEYS → cache anahtarı."""
+    canonical = normalize_tr(location_query(location).strip())
+    relevant = {key: filters.get(key) for key in ITINERARY_FILTER_KEYS}
+    raw = f"{canonical}:{duration}:{json.dumps(relevant, sort_keys=True, ensure_ascii=False)}"
+    return ITINERARY_CACHE_PREFIX + hashlib.md5(raw.encode()).hexdigest()
+
+
+def trip_days(trip_duration) -> int:
+    """tripDuration → [1, MAX_TRIP_DAYS] gün (serializer dışından gelen çağrılar için de sıkıştırılır)."""
+    return min(max(int(trip_duration or DEFAULT_TRIP_DAYS), 1), MAX_TRIP_DAYS)
+
+
+def day_ranges(duration: int) -> List[DayRange]:
+    """[1..duration] günlerini DAYS_PER_CHUNK'lık aralıklara böl: 7 → (1,2) (3,4) (5,6) (7,7)."""
+    return [(first, min(first + DAYS_PER_CHUNK - 1, duration)) for first in range(1, duration + 1, DAYS_PER_CHUNK)]
+
+
+def build_itinerary_prompt(query: str, duration: int, days: DayRange) -> str:
+    first, last = days
+    day_count = last - first + 1
+    scope = (
+        f"Bu {duration} günlük rotanın SADECE {first}-{last}. günlerini planla; diğer günler ayrı hazırlanıyor, "
+        f"bu yüzden her güne farklı bir semt / tema ver ve gün numaralarını {first}'den başlat."
+        if day_count < duration else ""
+    )
+    return f"""
+Sen "{query}" için {duration} günlük tatil rotası hazırlayan bir seyahat uzmanısın.
+{scope}
+Her gün için 6 aktivite öner: kahvaltı, sabah gezisi, öğle yemeği, öğleden sonra aktivitesi, akşam yemeği, gece aktivitesi.
+
+JSON ARRAY formatında döndür. Her aktivite şu alanlara sahip olmalı:
+- id: "day{first}_1", "day{first}_2" formatında
+- name: Aktivite adı (örn: "Pantheon'u ziyaret et")
+- description: 1-2 cümle açıklama
+- imageUrl: Unsplash URL (https://images.unsplash.com/photo-...)
+- category: "Tatil"
+- vibeTags: 3 hashtag array
+- address: Tam adres
+- priceRange: "$", "$$" veya "$$$"
+- googleRating: 4.0-5.0 arası
+- noiseLevel: 30-70 arası
+- matchScore: 75-95 arası
+- itineraryDay: Gün numarası ({first}, {first + 1}, ...)
+- timeSlot: "08:30-09:30" formatında
+- duration: "1 saat" formatında
+- isSpecificVenue: true/false
+- venueName: Mekan ismi (isSpecificVenue=true ise)
+- activityType: breakfast/lunch/dinner/sightseeing/shopping/activity
+- metrics: {{"ambiance": 80, "accessibility": 85, "popularity": 90}}
+
+Toplam {day_count * ACTIVITIES_PER_DAY} aktivite döndür. SADECE JSON ARRAY, başka açıklama yok.
+"""
+
+
+def parse_activities(response_text: str, days: DayRange) -> List[dict]:
+    """Gemini cevabını parse et; id / category / itineraryDay alanlarını düzelt."""
+    response_text = response_text.strip()
+    if '```json' in response_text:
+        response_text = response_text.split('```json')[1].split('```')[0].strip()
+    elif '```' in response_text:
+        response_text = response_text.split('```')[1].split('```')[0].strip()
+
+    first, last = days
+    experiences = json.loads(response_text)
+    for exp in experiences:
+        if 'id' not in exp:
+            exp['id'] = f"exp_{random.randint(1000, 9999)}"
+        exp['category'] = 'Tatil'
+        # Gün numarası yoksa ya da aralık dışındaysa aralığın ilk gününe al
+        if not isinstance(exp.get('itineraryDay'), int) or not first <= exp['itineraryDay'] <= last:
+            exp['itineraryDay'] = first
+    return experiences
+
+
+def generate_day_range(model, query: str, duration: int, days: DayRange) -> List[dict]:
+    with span('gemini.itinerary'):
+        response = model.generate_content(build_itinerary_prompt(query, duration, days))
+    return parse_activities(response.text, days)
+
+
+def _cached_chunks(cached: List[dict], duration: int) -> Iterator[Tuple[DayRange, List[dict]]]:
+    for days in day_ranges(duration):
+        yield days, [exp for exp in cached if days[0] <= exp.get('itineraryDay', 1) <= days[1]]
+
+
+def _submit_chunks(pool: ThreadPoolExecutor, model, query: str, duration: int, ranges: List[DayRange]) -> List[Future]:
+    logger.info("🏖️ Tatil rotası üretiliyor: %s (%s gün, %s paralel aralık)", query, duration, len(ranges))
+    return [pool.submit(bind(generate_day_range), model, query, duration, days) for days in ranges]
+
+
+def iter_itinerary(model, location: dict, trip_duration, filters: dict) -> Iterator[Tuple[DayRange, List[dict]]]:
+    """
+    Rotayı (gün aralığı, aktiviteler) olarak gün sırasıyla ver. Cache'te varsa oradan;
+    yoksa aralıklar paralel üretilir ve her aralık, öncekiler hazır olur olmaz verilir.
+    Tüm aralıklar başarıyla bitince rota cache'e yazılır; hata çağırana yükselir.
+    """
+    duration = trip_days(trip_duration)
+    cache_key = itinerary_cache_key(location, duration, filters)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        logger.info("📦 ITINERARY CACHE HIT - %s (%s gün)", location_query(location), duration)
+        yield from _cached_chunks(cached, duration)
+        return
+
+    ranges = day_ranges(duration)
+    activities = []
+    with ThreadPoolExecutor(max_workers=min(MAX_CHUNK_CONCURRENCY, len(ranges))) as pool:
+        futures = _submit_chunks(pool, model, location_query(location), duration, ranges)
+        try:
+            for days, future in zip(ranges, futures):
+                chunk = future.result()
+                activities.extend(chunk)
+                yield days, chunk
+        finally:
+            # İstemci stream'i yarıda bıraktıysa / hata olduysa kuyruktaki aralıkları başlatma
+            for future in futures:
+                future.cancel()
+
+    cache.set(cache_key, activities, ITINERARY_CACHE_TTL)
+
+
+async def aiter_itinerary(model, location: dict, trip_duration, filters: dict) -> AsyncIterator[Tuple[DayRange, List[dict]]]:
+    """
+    iter_itinerary'nin ASGI karşılığı: Gemini çağrıları yine thread pool'da, ama sonuçlar
+    asyncio.wrap_future ile beklenir; stream boyunca event loop ya da bir worker thread'i bloklanmaz.
+    """
+    duration = trip_days(trip_duration)
+    cache_key = itinerary_cache_key(location, duration, filters)
+    cached = await cache.aget(cache_key)
+    if cached is not None:
+        logger.info("📦 ITINERARY CACHE HIT - %s (%s gün)", location_query(location), duration)
+        for days, chunk in _cached_chunks(cached, duration):
+            yield days, chunk
+        return
+
+    ranges = day_ranges(duration)
+    activities = []
+    pool = ThreadPoolExecutor(max_workers=min(MAX_CHUNK_CONCURRENCY, len(ranges)))
+    futures = _submit_chunks(pool, model, location_query(location), duration, ranges)
+    try:
+        for days, future in zip(ranges, futures):
+            chunk = await asyncio.wrap_future(future)
+            activities.extend(chunk)
+            yield days, chunk
+    finally:
+        for future in futures:
+            future.cancel()
+        # Çalışan aralığı beklemeden kapat (event loop'ta join edilmez)
+        pool.shutdown(wait=False)
+
+    await cache.aset(cache_key, activities, ITINERARY_CACHE_TTL)
+
+
+# ===== NDJSON STREAM SATIRLARI (views.stream_vacation_itinerary / async_views) =====
+
+def chunk_line(days: DayRange, activities: List[dict]) -> str:
+    return json.dumps({'days': list(days), 'activities': activities}, ensure_ascii=False) + '\n'
+
+
+def done_line(total: int) -> str:
+    return json.dumps({'done': True, 'total': total}) + '\n'
+
+
+def error_line(error: Exception) -> str:
+    logger.error("❌ Vacation itinerary stream error: %s", error)
+    return json.dumps({'error': f'Tatil deneyimi oluşturulurken hata: {str(error)}'}, ensure_ascii=False) + '\n'
+
+
+def build_itinerary(model, location: dict, trip_duration, filters: dict) -> List[dict]:
+    """Tüm rota (gün sırasıyla tek liste)."""
+    return [exp for _, chunk in iter_itinerary(model, location, trip_duration, filters) for exp in chunk]
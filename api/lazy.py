@@ -0,0 +1,51 @@
+"""
+Lazy import yardımcıları.
+
+Ağır SDK'lar (googlemaps, google.generativeai) ve büyük statik veri setleri
+(popular_venues_data, gault_millau_data, michelin_data) cold start'ta değil,
+ilk kullanıldıkları anda yüklenir.
+"""
+
+import functools
+import importlib
+
+
+def lazy_callable(module_path: str, attr: str):
+    """
+    `module_path.attr` fonksiyonunu ilk çağrıda import eden bir proxy döndürür.
+    Çağrı yerleri normal fonksiyon çağırır gibi kullanmaya devam eder.
+    """
+    target = None
+
+    def proxy(*args, **kwargs):
+        nonlocal target
+        if target is None:
+            target = getattr(importlib.import_module(module_path), attr)
+        return target(*args, **kwargs)
+
+    proxy.__name__ = attr
+    proxy.__qualname__ = attr
+    proxy.__doc__ = f"Lazy proxy: {module_path}.{attr}"
+    return proxy
+
+
+def lazy_view(dotted_path: str):
+    """
+    URLconf için lazy view: view modülü ilk istekte import edilir.
+    Tüm API view'ları DRF @api_view olduğu için csrf_exempt işaretlenir
+    (CsrfViewMiddleware view modülü yüklenmeden önce bu bayrağa bakar).
+    """
+    module_path, attr = dotted_path.rsplit('.', 1)
+
+    @functools.lru_cache(maxsize=None)
+    def resolve():
+        return getattr(importlib.import_module(module_path), attr)
+
+    def view(request, *args, **kwargs):
+        return resolve()(request, *args, **kwargs)
+
+    view.__name__ = attr
+    view.__qualname__ = attr
+    view.__module__ = module_path
+    view.csrf_exempt = True
+    return view
@@ -0,0 +1,141 @@
+"""
+Logging altyapısı: async/buffered handler, REJECT log rate limit'i, JSON formatter.
+
+settings.LOGGING içinden dictConfig ile kullanılır. Modüller sadece
+`logger = logging.getLogger(__name__)` tanımlar ve lazy formatlama kullanır:
+    logger.debug("❌ RATING REJECT - %s: rating=%s", name, rating)
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+
+
+class AsyncStreamHandler(logging.handlers.QueueHandler):
+    """
+    Log kayıtlarını bellekteki sınırlı bir kuyruğa atar; stream'e yazma ve flush
+    (syscall) işini ayrı bir listener thread yapar. İstek thread'i I/O beklemez.
+
+    gunicorn preload_app fork'undan sonra listener thread child process'e geçmez;
+    bu yüzden listener her process'te ilk log'da (pid kontrolü ile) başlatılır.
+    Kuyruk doluysa kayıt düşürülür ve sayılır (log yükü latency'ye dönüşmesin).
+    """
+
+    def __init__(self, stream=None, queue_size=10000):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.queue_size = queue_size
+        self.target = logging.StreamHandler(stream or sys.stderr)
+        self.dropped = 0
+        self._listener = None
+        self._listener_pid = None
+        self._start_lock = threading.Lock()
+
+    def setFormatter(self, fmt):
+        # Formatlama listener thread'inde, hedef handler üzerinde yapılır
+        self.target.setFormatter(fmt)
+
+    def _ensure_listener(self):
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._start_lock:
+            if self._listener_pid == pid:
+                return
+            if self._listener_pid is not None:
+                # Fork sonrası: parent'ın kuyruğu/thread'i bu process'te geçersiz
+                self.queue = queue.Queue(maxsize=self.queue_size)
+            self._listener = logging.handlers.QueueListener(self.queue, self.target)
+            self._listener.start()
+            self._listener_pid = pid
+            atexit.register(self._stop_listener, self._listener)
+
+    @staticmethod
+    def _stop_listener(listener):
+        try:
+            listener.stop()
+        except Exception:
+            pass
+
+    def prepare(self, record):
+        # Sadece mesaj interpolasyonu (args mutable olabilir); format listener'da
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        self._ensure_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RejectRateLimitFilter(logging.Filter):
+    """
+    Aday bazlı "REJECT" loglarını çağrı yeri (dosya:satır) başına sınırlar.
+    Her pencere içinde ilk `burst` kayıt geçer, kalanlar bastırılır; bir sonraki
+    pencerede geçen ilk kayda bastırılan sayısı eklenir.
+    Lazy formatlama sayesinde record.msg şablon olduğu için anahtar sabittir.
+    """
+
+    def __init__(self, burst=20, window_seconds=60, marker='REJECT'):
+        super().__init__()
+        self.burst = int(burst)
+        self.window_seconds = float(window_seconds)
+        self.marker = marker
+        self._state = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        msg = record.msg if isinstance(record.msg, str) else ''
+        if self.marker not in msg:
+            return True
+
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            window_start, count, suppressed = self._state.get(key, (now, 0, 0))
+            if now - window_start >= self.window_seconds:
+                window_start, count = now, 0
+            count += 1
+            if count > self.burst:
+                self._state[key] = (window_start, count, suppressed + 1)
+                return False
+            self._state[key] = (window_start, count, 0)
+
+        if suppressed:
+            record.msg = f"{record.msg} (+{suppressed} benzer kayıt bastırıldı)"
+        return True
+
+
+_STANDARD_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """Tek satır JSON log; `extra={...}` ile verilen alanlar da eklenir."""
+
+    def format(self, record):
+        payload = {
+            'ts': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_RECORD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_text:
+            payload['exc'] = record.exc_text
+        elif record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
@@ -0,0 +1,93 @@
+"""
+Autocomplete indeksi benchmark'ı (api/autocomplete.py).
+
+LOCATION_DATA ilçe / semtleri + n sentetik mekan ismiyle AutocompleteIndex kurar ve şunları ölçer:
+
+- build     → toplu ekleme + tek sıralama
+- insert    → cache yazımı sonrası tek mekan ekleme (bisect + list.insert)
+- keystroke → gerçek bir ismin 2..len harflik prefix'leri için search (yazarken her tuş)
+
+DB kullanılmaz; ölçülen süre sadece indeks (view / DRF maliyeti hariç).
+
+Kullanım:
+    python manage.py benchmark_autocomplete
+    python manage.py benchmark_autocomplete --sizes 1000 20000 100000 --samples 300
+"""
+
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.autocomplete import DEFAULT_LIMIT, AutocompleteIndex, Suggestion
+from api.location_data import LOCATION_DATA
+from api.management.commands.benchmark_cache import percentile
+from api.venue_search import tokens
+
+
+_NAME_PARTS = ('Asmalı', 'Moda', 'Kadıköy', 'Cafe', 'Meyhane', 'Balık', 'Evi', 'Bistro', 'Şişli', 'Bahçe',
+               'Kahve', 'Dünyası', 'Çınaraltı', 'Ocakbaşı', 'Sofrası', 'Terrace', 'Lokanta', 'Fırın', 'Bar', 'Köşk')
+
+
+def build_names(rnd: random.Random, n: int) -> list:
+    return [f"{' '.join(rnd.sample(_NAME_PARTS, rnd.randint(2, 3)))} {i}" for i in range(n)]
+
+
+class Command(BaseCommand):
+    help = 'Autocomplete indeksinin kurulum, ekleme ve tuş başı sorgu sürelerini ölç'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 20000], help='Mekan ismi sayıları')
+        parser.add_argument('--samples', type=int, default=200, help='Prefix sorgusu yapılacak isim sayısı')
+        parser.add_argument('--seed', type=int, default=17)
+        parser.add_argument('--json', dest='json_path', default='', help='Sonuçları JSON olarak bu dosyaya yaz')
+
+    def handle(self, *args, **options):
+        rnd = random.Random(options['seed'])
+        results = {}
+        for n in options['sizes']:
+            names = build_names(rnd, n)
+            started = time.perf_counter()
+            index = AutocompleteIndex()
+            for city_key, city_data in LOCATION_DATA.items():
+                for district in city_data['ilceler']:
+                    index.add(f"district:{district['isim']}", Suggestion(district['isim'], 'district', city_key), bulk=True)
+                    for semt in district['semtler']:
+                        index.add(f"neighborhood:{semt}", Suggestion(semt, 'neighborhood', city_key), bulk=True)
+            for i, name in enumerate(names):
+                index.add(f"venue:{i}", Suggestion(name, 'venue', 'istanbul', place_id=f"p{i}"), bulk=True)
+            index.sort()
+            build_ms = (time.perf_counter() - started) * 1000
+
+            insert_ms = []
+            for i, name in enumerate(build_names(rnd, 50)):
+                started = time.perf_counter()
+                index.add(f"venue:new{i}", Suggestion(name, 'venue', 'istanbul', place_id=f"new{i}"))
+                insert_ms.append((time.perf_counter() - started) * 1000)
+
+            keystroke_ms = []
+            for name in rnd.sample(names, min(options['samples'], n)):
+                typed = ' '.join(tokens(name)[:2])    # suggest() ile aynı normalizasyon
+                for end in range(2, len(typed) + 1):
+                    started = time.perf_counter()
+                    index.search(typed[:end].strip(), None, DEFAULT_LIMIT)
+                    keystroke_ms.append((time.perf_counter() - started) * 1000)
+
+            row = results[n] = {
+                'keys': index.key_count,
+                'build_ms': round(build_ms, 1),
+                'insert_p50_ms': round(percentile(insert_ms, 50), 3),
+                'keystroke_p50_ms': round(percentile(keystroke_ms, 50), 3),
+                'keystroke_p99_ms': round(percentile(keystroke_ms, 99), 3),
+            }
+            self.stdout.write(
+                f"📊 n={n:,} ({row['keys']:,} anahtar)  kurulum={row['build_ms']:>7.1f}ms  "
+                f"ekleme p50={row['insert_p50_ms']:.3f}ms  tuş p50={row['keystroke_p50_ms']:.3f}ms "
+                f"p99={row['keystroke_p99_ms']:.3f}ms"
+            )
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"JSON sonuçları yazıldı: {options['json_path']}")
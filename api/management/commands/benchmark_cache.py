@@ -0,0 +1,194 @@
+"""
+Cache katmanı benchmark'ı (api/cache_service.py + cache_clear_invalid).
+
+Mevcut veritabanındaki (tercihen generate_cache_dataset ile doldurulmuş) CachedVenue
+tablosu üzerinde şu işlemleri ölçer:
+
+- get_venues_with_swr        → rastgele kategori/şehir/ilçe kombinasyonları, excludeIds'li ve excludeIds'siz
+- save_venues_to_cache_swr   → mevcut kayıtların güncellenmesi (upsert) ve yeni kayıtlar
+- get_cache_stats            → monitoring endpoint'inin sorguları
+- clear_expired_cache        → 72+ saatlik kayıtların silinmesi
+- cache_clear_invalid        → geçersiz kayıt taraması ve silme
+
+Yıkıcı işlemler (silme / yazma) transaction içinde çalışıp geri alınır, böylece aynı
+veri setiyle tekrar tekrar ölçüm yapılabilir. Dış servis çağrıları (Instagram CSE)
+gecikmesiz stub'larla karşılanır; ölçülen süre DB + Python maliyetidir.
+
+Kullanım:
+    python manage.py benchmark_cache
+    python manage.py benchmark_cache --samples 50 --only swr stats
+    python manage.py benchmark_cache --explain                     # SWR sorgusunun query plan'ı
+    DATABASE_URL=postgres://... python manage.py benchmark_cache   # PostgreSQL üzerinde
+"""
+
+import json
+import math
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+
+OPERATIONS = ('swr', 'swr_exclude', 'save', 'stats', 'clear_expired', 'clear_invalid')
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'SWR cache fonksiyonlarını mevcut CachedVenue veri seti üzerinde benchmark et'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--samples', type=int, default=20, help='Okuma işlemleri için örnek sayısı')
+        parser.add_argument('--destructive-samples', type=int, default=3, help='Silme / yazma işlemleri için örnek sayısı')
+        parser.add_argument('--only', nargs='+', choices=OPERATIONS, help='Sadece bu işlemleri ölç')
+        parser.add_argument('--save-batch', type=int, default=10, help='save_venues_to_cache_swr çağrısı başına venue')
+        parser.add_argument('--explain', action='store_true', help='SWR okuma sorgusunun query plan\'ını yazdır')
+        parser.add_argument('--seed', type=int, default=7)
+        parser.add_argument('--json', dest='json_path', default='', help='Sonuçları JSON olarak bu dosyaya yaz')
+
+    def handle(self, *args, **options):
+        from api.models import CachedVenue
+        from api.outbound_stubs import install_stubs
+
+        install_stubs(mode='replay')
+        rnd = random.Random(options['seed'])
+
+        total_rows = CachedVenue.objects.count()
+        if not total_rows:
+            raise CommandError('CachedVenue tablosu boş; önce generate_cache_dataset çalıştırın')
+        locations = list(
+            CachedVenue.objects.order_by().values_list('category', 'city', 'district').distinct()[:5000]
+        )
+        self.stdout.write(f"📊 {connection.vendor} | {total_rows:,} satır | {len(locations):,} lokasyon örneği")
+
+        operations = options['only'] or OPERATIONS
+        results = {}
+        for op in operations:
+            timings = getattr(self, f'_bench_{op}')(rnd, locations, options)
+            results[op] = {
+                'samples': len(timings),
+                'p50_ms': round(percentile(timings, 50), 2),
+                'p95_ms': round(percentile(timings, 95), 2),
+                'mean_ms': round(statistics.mean(timings), 2) if timings else 0.0,
+                'max_ms': round(max(timings), 2) if timings else 0.0,
+            }
+            row = results[op]
+            self.stdout.write(
+                f"  {op:<15} n={row['samples']:<4} p50={row['p50_ms']:>10.2f}ms  p95={row['p95_ms']:>10.2f}ms  max={row['max_ms']:>10.2f}ms"
+            )
+
+        if options['explain']:
+            self._explain(rnd, locations)
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump({'vendor': connection.vendor, 'rows': total_rows, 'results': results}, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"JSON sonuçları yazıldı: {options['json_path']}")
+
+    # ===== ÖLÇÜM YARDIMCILARI =====
+
+    @staticmethod
+    def _timed(fn) -> float:
+        started = time.perf_counter()
+        fn()
+        return (time.perf_counter() - started) * 1000
+
+    def _timed_rollback(self, fn) -> float:
+        """fn'i transaction içinde ölç ve değişiklikleri geri al."""
+        elapsed = 0.0
+        try:
+            with transaction.atomic():
+                elapsed = self._timed(fn)
+                raise _Rollback
+        except _Rollback:
+            pass
+        return elapsed
+
+    # ===== İŞLEMLER =====
+
+    def _bench_swr(self, rnd, locations, options, exclude=False):
+        from api.cache_service import get_venues_with_swr
+        from api.models import CachedVenue
+        from api.task_queue import wait_for_idle
+
+        # İlk çağrı G&M / Instagram veri setlerini lazy yükler; ölçüme dahil edilmez
+        category, city, district = locations[0]
+        get_venues_with_swr(category_name=category, city=city, district=district or None, limit=10)
+        wait_for_idle(timeout=30)
+
+        timings = []
+        for _ in range(options['samples']):
+            category, city, district = rnd.choice(locations)
+            exclude_ids = None
+            if exclude:
+                ids = list(CachedVenue.objects.filter(category=category, city=city, district=district)
+                           .values_list('place_id', flat=True)[:30])
+                exclude_ids = set(rnd.sample(ids, min(len(ids), 20)))
+            timings.append(self._timed(lambda: get_venues_with_swr(
+                category_name=category, city=city, district=district or None, exclude_ids=exclude_ids, limit=10,
+            )))
+            # last_accessed güncellemesi (defer) bir sonraki ölçümü etkilemesin
+            wait_for_idle(timeout=30)
+        return timings
+
+    def _bench_swr_exclude(self, rnd, locations, options):
+        return self._bench_swr(rnd, locations, options, exclude=True)
+
+    def _bench_save(self, rnd, locations, options):
+        from api.cache_service import save_venues_to_cache_swr
+        from api.models import CachedVenue
+
+        timings = []
+        for i in range(options['destructive_samples']):
+            category, city, district = rnd.choice(locations)
+            existing = list(CachedVenue.objects.filter(category=category, city=city, district=district)
+                            .values_list('venue_data', flat=True)[:options['save_batch'] // 2])
+            fresh = [
+                dict(existing[0] if existing else {}, id=f"bench_new_{i}_{n}", name=f"Bench Mekan {n}")
+                for n in range(options['save_batch'] - len(existing))
+            ]
+            venues = existing + fresh
+            timings.append(self._timed_rollback(
+                lambda: save_venues_to_cache_swr(venues, category, city, district or None)
+            ))
+        return timings
+
+    def _bench_stats(self, rnd, locations, options):
+        from api.cache_service import get_cache_stats
+
+        return [self._timed(get_cache_stats) for _ in range(max(1, options['samples'] // 4))]
+
+    def _bench_clear_expired(self, rnd, locations, options):
+        from api.cache_service import clear_expired_cache
+
+        return [self._timed_rollback(lambda: clear_expired_cache(older_than_hours=72))
+                for _ in range(options['destructive_samples'])]
+
+    def _bench_clear_invalid(self, rnd, locations, options):
+        from rest_framework.test import APIRequestFactory
+
+        from api.views import cache_clear_invalid
+
+        factory = APIRequestFactory()
+        return [self._timed_rollback(lambda: cache_clear_invalid(factory.post('/api/cache/clear-invalid/')))
+                for _ in range(options['destructive_samples'])]
+
+    def _explain(self, rnd, locations):
+        from api.models import CachedVenue
+
+        category, city, district = rnd.choice(locations)
+        query = CachedVenue.objects.filter(category=category, city__iexact=city, district__iexact=district)
+        self.stdout.write('')
+        self.stdout.write(f"🔎 SWR sorgusu ({category} / {city} / {district}):")
+        self.stdout.write(query.explain())
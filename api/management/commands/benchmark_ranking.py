@@ -0,0 +1,143 @@
+"""
+Sıralama motoru benchmark'ı (api/ranking.py).
+
+Sentetik venue listeleri üzerinde her profil için vektörel sıralamayı (feature matrisi +
+X @ w + stabil argsort) eski Python tuple key'li sorted() karşılığıyla karşılaştırır ve
+iki sıranın birebir aynı olduğunu doğrular. Feature matrisi ve rank adımları ayrı ölçülür.
+
+Kullanım:
+    python manage.py benchmark_ranking
+    python manage.py benchmark_ranking --sizes 50 500 5000 50000 --samples 50
+    python manage.py benchmark_ranking --json ranking.json
+"""
+
+import json
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.management.commands.benchmark_cache import percentile
+from api.ranking import CONTEXT, FINE_DINING, MICHELIN_GM, RATING_REVIEWS, build_feature_matrix, rank
+
+
+CONTEXT_KEY = 'friends_hangout'
+
+
+# ===== ESKİ PYTHON KARŞILIKLARI (views.py / venue_pipeline.py) =====
+
+def _michelin_gm_key(venue):
+    rating = venue.get('googleRating', 0) or 0
+    if venue.get('isMichelinStarred', False) and venue.get('michelinStars', 0) > 0:
+        return (0, -venue.get('michelinStars', 0), -rating)
+    if venue.get('isBibGourmand', False):
+        return (1, 0, -rating)
+    return (2, -(venue.get('gaultMillauToques', 0) or 0), -rating)
+
+
+def _fine_dining_key(venue):
+    rating = venue.get('googleRating', 0) or 0
+    if venue.get('isMichelinStarred', False) and venue.get('michelinStars', 0) > 0:
+        return (0, -venue.get('michelinStars', 0), -rating)
+    if venue.get('isBibGourmand', False):
+        return (1, 0, -rating)
+    if venue.get('gaultMillauToques') is not None:
+        return (2, -(venue.get('gaultMillauToques', 0) or 0), -rating)
+    return (3, 0, -rating)
+
+
+def _python_michelin_gm(venues):
+    return sorted(range(len(venues)), key=lambda i: _michelin_gm_key(venues[i]))
+
+
+def _python_fine_dining(venues):
+    return sorted(range(len(venues)), key=lambda i: _fine_dining_key(venues[i]))
+
+
+def _python_context(venues):
+    kept = [i for i in range(len(venues)) if venues[i].get('contextScore', {}).get(CONTEXT_KEY, 75) >= 50]
+    return sorted(kept, key=lambda i: venues[i].get('contextScore', {}).get(CONTEXT_KEY, 75), reverse=True)
+
+
+def _python_rating_reviews(venues):
+    return sorted(range(len(venues)), key=lambda i: (venues[i]['googleRating'], venues[i]['googleReviewCount']), reverse=True)
+
+
+PROFILES = {
+    'michelin_gm': (MICHELIN_GM, _python_michelin_gm),
+    'fine_dining': (FINE_DINING, _python_fine_dining),
+    'context': (CONTEXT, _python_context),
+    'rating_reviews': (RATING_REVIEWS, _python_rating_reviews),
+}
+
+
+def build_venues(rnd: random.Random, n: int) -> list:
+    """Gerçek listelere benzer dağılım: az sayıda Michelin / Bib, bir kısmı G&M, çoğu düz mekan."""
+    venues = []
+    for i in range(n):
+        roll = rnd.random()
+        venue = {
+            'id': f"bench_{i}",
+            'googleRating': round(rnd.uniform(3.5, 4.9), 1),
+            'googleReviewCount': rnd.randint(10, 20000),
+            'contextScore': {CONTEXT_KEY: rnd.randint(30, 98)} if rnd.random() > 0.1 else {},
+            'distanceKm': round(rnd.uniform(0.1, 6.0), 2) if rnd.random() > 0.05 else None,
+        }
+        if roll < 0.03:
+            venue.update(isMichelinStarred=True, michelinStars=rnd.randint(1, 3))
+        elif roll < 0.08:
+            venue['isBibGourmand'] = True
+        if rnd.random() < 0.3:
+            venue['gaultMillauToques'] = rnd.randint(0, 4)
+        venues.append(venue)
+    return venues
+
+
+class Command(BaseCommand):
+    help = 'Vektörel sıralama motorunu Python sorted() karşılığıyla benchmark et ve sıraları doğrula'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[50, 500, 5000], help='Aday listesi boyutları')
+        parser.add_argument('--samples', type=int, default=30, help='Boyut × profil başına ölçüm sayısı')
+        parser.add_argument('--seed', type=int, default=11)
+        parser.add_argument('--json', dest='json_path', default='', help='Sonuçları JSON olarak bu dosyaya yaz')
+
+    def handle(self, *args, **options):
+        rnd = random.Random(options['seed'])
+        results = {}
+        for n in options['sizes']:
+            venues = build_venues(rnd, n)
+            results[n] = {}
+            self.stdout.write(f"📊 n={n:,}")
+            for name, (profile, python_order) in PROFILES.items():
+                matrix_ms, rank_ms, python_ms = [], [], []
+                for _ in range(options['samples']):
+                    started = time.perf_counter()
+                    X = build_feature_matrix(venues, context_key=CONTEXT_KEY)
+                    built = time.perf_counter()
+                    order, _ = rank(X, profile)
+                    ranked = time.perf_counter()
+                    expected = python_order(venues)
+                    finished = time.perf_counter()
+                    matrix_ms.append((built - started) * 1000)
+                    rank_ms.append((ranked - built) * 1000)
+                    python_ms.append((finished - ranked) * 1000)
+                if order.tolist() != expected:
+                    raise CommandError(f"{name} (n={n}): vektörel sıra Python sırasından farklı")
+
+                row = results[n][name] = {
+                    'matrix_p50_ms': round(percentile(matrix_ms, 50), 3),
+                    'rank_p50_ms': round(percentile(rank_ms, 50), 3),
+                    'python_p50_ms': round(percentile(python_ms, 50), 3),
+                    'rank_mean_ms': round(statistics.mean(rank_ms), 3),
+                }
+                self.stdout.write(
+                    f"  {name:<15} matris={row['matrix_p50_ms']:>8.3f}ms  rank={row['rank_p50_ms']:>8.3f}ms  "
+                    f"python sorted={row['python_p50_ms']:>8.3f}ms  ✅ sıra aynı"
+                )
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"JSON sonuçları yazıldı: {options['json_path']}")
@@ -0,0 +1,105 @@
+"""
+Yerel benzerlik indeksi benchmark'ı (api/similarity.py).
+
+generate_cache_dataset'in sentetik venue_data'sı (vibeTags, priceRange, practicalInfo,
+atmosphereSummary, kategori) üzerinde bir şehir indeksi kurar ve şunları ölçer:
+
+- build     → n mekan için token'lama + hash'leme + TF-IDF / normalizasyon
+- update    → save_venues_to_cache_swr sonrası tipik artımlı güncelleme (--update-batch mekan)
+- query     → tek mekan için top-k komşu (matris × vektör + argpartition)
+
+Ayrıca sorgulanan mekanla en yakın komşusunun ortak vibe tag oranını raporlar (rastgele
+çiftlerle karşılaştırmalı), böylece indeksin anlamlı sonuç verdiği görülür. DB kullanılmaz.
+
+Kullanım:
+    python manage.py benchmark_similarity
+    python manage.py benchmark_similarity --sizes 500 5000 20000 --samples 200 --k 10
+    python manage.py benchmark_similarity --json similarity.json
+"""
+
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.management.commands.benchmark_cache import percentile
+from api.management.commands.generate_cache_dataset import build_venue_data
+from api.similarity import CityIndex
+
+
+CATEGORIES = ('Kafe', 'İlk Buluşma', 'Meyhane', 'Fine Dining', 'Bar')
+
+
+def build_rows(rnd: random.Random, n: int, prefix: str = 'sim') -> list:
+    rows = []
+    for i in range(n):
+        category = rnd.choice(CATEGORIES)
+        place_id = f"{prefix}_{i}"
+        venue = build_venue_data(rnd, place_id, f"Mekan {i}", category, 'İstanbul', 'Kadıköy', payload_kb=1)
+        venue['contextScore'] = {'first_date': rnd.randint(30, 98), 'friends_hangout': rnd.randint(30, 98)}
+        rows.append((place_id, category, venue))
+    return rows
+
+
+def _tag_overlap(a: dict, b: dict) -> float:
+    return len(set(a['vibeTags']) & set(b['vibeTags'])) / 3
+
+
+class Command(BaseCommand):
+    help = 'Yerel benzerlik indeksinin kurulum, artımlı güncelleme ve top-k sorgu sürelerini ölç'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[500, 5000], help='Şehir başına mekan sayıları')
+        parser.add_argument('--samples', type=int, default=100, help='Sorgu örnek sayısı')
+        parser.add_argument('--k', type=int, default=10)
+        parser.add_argument('--update-batch', type=int, default=10, help='Artımlı güncellemede yazılan mekan sayısı')
+        parser.add_argument('--seed', type=int, default=13)
+        parser.add_argument('--json', dest='json_path', default='', help='Sonuçları JSON olarak bu dosyaya yaz')
+
+    def handle(self, *args, **options):
+        rnd = random.Random(options['seed'])
+        results = {}
+        for n in options['sizes']:
+            rows = build_rows(rnd, n)
+            index = CityIndex()
+            started = time.perf_counter()
+            index.upsert(rows)
+            build_ms = (time.perf_counter() - started) * 1000
+
+            update_ms = []
+            for round_ in range(5):
+                batch = rnd.sample(rows, options['update_batch'])
+                batch = [(pid, cat, {**venue, 'vibeTags': rnd.sample(venue['vibeTags'], 3)}) for pid, cat, venue in batch]
+                batch += build_rows(rnd, 2, prefix=f"new{round_}")
+                started = time.perf_counter()
+                index.upsert(batch)
+                update_ms.append((time.perf_counter() - started) * 1000)
+
+            query_ms, nearest_overlap, random_overlap = [], [], []
+            for _ in range(options['samples']):
+                place_id, _, venue = rnd.choice(rows)
+                started = time.perf_counter()
+                neighbours = index.neighbours(place_id, options['k'])
+                query_ms.append((time.perf_counter() - started) * 1000)
+                nearest_overlap.append(_tag_overlap(venue, neighbours[0][0]))
+                random_overlap.append(_tag_overlap(venue, rnd.choice(rows)[2]))
+
+            row = results[n] = {
+                'build_ms': round(build_ms, 1),
+                'update_p50_ms': round(percentile(update_ms, 50), 3),
+                'query_p50_ms': round(percentile(query_ms, 50), 3),
+                'query_p95_ms': round(percentile(query_ms, 95), 3),
+                'nearest_tag_overlap': round(sum(nearest_overlap) / len(nearest_overlap), 3),
+                'random_tag_overlap': round(sum(random_overlap) / len(random_overlap), 3),
+            }
+            self.stdout.write(
+                f"📊 n={n:,}  kurulum={row['build_ms']:>8.1f}ms  güncelleme p50={row['update_p50_ms']:>7.3f}ms  "
+                f"sorgu p50={row['query_p50_ms']:>6.3f}ms p95={row['query_p95_ms']:>6.3f}ms  "
+                f"ortak tag: en yakın={row['nearest_tag_overlap']:.2f} rastgele={row['random_tag_overlap']:.2f}"
+            )
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"JSON sonuçları yazıldı: {options['json_path']}")
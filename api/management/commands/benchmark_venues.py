@@ -0,0 +1,222 @@
+"""
+Uçtan uca latency benchmark'ı (record/replay stub'ları üzerinde).
+
+Her kategori dalını (Fine Dining, Bar, Eğlence & Parti, 3. Nesil Kahveci, Sokak
+Lezzeti, Yerel Festivaller, Tatil, Piknik, varsayılan yol) önce soğuk (cache'ler boş), sonra
+sıcak olarak Django test client ile çalıştırır ve her senaryo için p50/p95 latency,
+istek başına dış çağrı sayısı (servis bazında) ve DB sorgu sayısını raporlar.
+--memory ile her istek tracemalloc altında çalışır ve istek başına tepe bellek raporlanır
+(tracemalloc yavaştır; bellek ölçümünde latency değerleri karşılaştırılmamalıdır).
+
+Varsayılan olarak izole bir test veritabanı kullanılır (gerçek DB'ye yazılmaz).
+
+Kullanım:
+    python manage.py benchmark_venues                          # Sentetik/kayıtlı yanıtlar, gecikmesiz
+    python manage.py benchmark_venues --latency "places=250,geocode=80,cse=300,gemini=2500"
+    python manage.py benchmark_venues --iterations 10 --only Bar "Fine Dining"
+    python manage.py benchmark_venues --record                 # Canlı key'lerle fixture kaydet
+    python manage.py benchmark_venues --json /tmp/bench.json   # Sonuçları dosyaya yaz
+    python manage.py benchmark_venues --memory --only Meyhane  # İstek başına tracemalloc tepe bellek
+"""
+
+import json
+import math
+import statistics
+import time
+import tracemalloc
+from collections import Counter
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+
+# (etiket, category payload, ek alanlar)
+SCENARIOS = [
+    ('Fine Dining', {'id': '2', 'name': 'Fine Dining'}, {}),
+    ('Bar', {'id': 'bar', 'name': 'İş Çıkışı Bira & Kokteyl'}, {}),
+    ('Eğlence & Parti', {'id': 'party', 'name': 'Eğlence & Parti'}, {}),
+    ('3. Nesil Kahveci', {'id': '23', 'name': '3. Nesil Kahveci'}, {}),
+    ('Sokak Lezzeti', {'id': 'sokak-lezzeti', 'name': 'Sokak Lezzeti'}, {}),
+    ('Yerel Festivaller', {'id': 'festivals', 'name': 'Yerel Festivaller'}, {}),
+    ('Tatil', {'id': 'vacation', 'name': 'Tatil'}, {'tripDuration': 3}),
+    ('Piknik', {'id': 'picnic', 'name': 'Piknik'}, {}),
+    ('Varsayılan (Meyhane)', {'id': '24', 'name': 'Meyhane'}, {}),
+]
+
+DEFAULT_LOCATION = {'city': 'İstanbul', 'districts': ['Kadıköy'], 'neighborhoods': []}
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile (küçük örneklemlerde de deterministik)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def reset_caches():
+    """Soğuk çalıştırma: Django cache, SWR cache tablosu ve process içi cache'ler."""
+    from api.models import CachedVenue
+
+    cache.clear()
+    CachedVenue.objects.all().delete()
+    try:
+        from api.instagram_service import clear_instagram_cache
+        clear_instagram_cache()
+    except ImportError:
+        pass
+
+
+class Command(BaseCommand):
+    help = 'Kategori dallarını stub\'lanmış dış servislerle soğuk/sıcak benchmark et (p50/p95, çağrı ve sorgu sayıları)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=5, help='Sıcak tekrar sayısı (varsayılan 5)')
+        parser.add_argument('--only', nargs='+', help='Sadece bu senaryoları çalıştır (etiket veya kategori adı)')
+        parser.add_argument('--city', default=DEFAULT_LOCATION['city'])
+        parser.add_argument('--district', default=DEFAULT_LOCATION['districts'][0])
+        parser.add_argument('--latency', default='', help='Servis gecikmeleri (ms): "places=250,gemini=2500,default=50"')
+        parser.add_argument('--fixtures', default='', help='Fixture dizini (varsayılan api/fixtures/outbound)')
+        parser.add_argument('--no-synthetic', action='store_true', help='Fixture yoksa sentetik yanıt üretme (599 döner)')
+        parser.add_argument('--record', action='store_true', help='Gerçek servisleri çağır ve yanıtları fixture olarak kaydet')
+        parser.add_argument('--real-db', action='store_true', help='İzole test DB yerine ayarlı veritabanını kullan')
+        parser.add_argument('--json', dest='json_path', default='', help='Sonuçları JSON olarak bu dosyaya yaz')
+        parser.add_argument('--memory', action='store_true', help='İstek başına tracemalloc tepe belleğini ölç')
+
+    def handle(self, *args, **options):
+        from api.outbound_stubs import install_stubs, parse_latency_spec
+
+        if options['iterations'] < 1:
+            raise CommandError('--iterations en az 1 olmalı')
+        self.trace_memory = options['memory']
+
+        stubs = install_stubs(
+            mode='record' if options['record'] else 'replay',
+            fixtures_dir=options['fixtures'] or None,
+            latency_ms=parse_latency_spec(options['latency']),
+            synthetic=not options['no_synthetic'],
+        )
+
+        scenarios = SCENARIOS
+        if options['only']:
+            wanted = set(options['only'])
+            scenarios = [s for s in SCENARIOS if s[0] in wanted or s[1]['name'] in wanted]
+            if not scenarios:
+                raise CommandError(f"Senaryo bulunamadı: {', '.join(wanted)}")
+
+        setup_test_environment()
+        runner = old_config = None
+        if not options['real_db']:
+            from django.test.runner import DiscoverRunner
+            runner = DiscoverRunner(verbosity=0, interactive=False)
+            old_config = runner.setup_databases()
+        try:
+            location = {'city': options['city'], 'districts': [options['district']], 'neighborhoods': []}
+            results = [self._run_scenario(stubs, scenario, location, options['iterations']) for scenario in scenarios]
+        finally:
+            if runner is not None:
+                runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        self._report(results, stubs)
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump({'latency': options['latency'], 'results': results}, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"JSON sonuçları yazıldı: {options['json_path']}")
+
+    def _request(self, client, stubs, payload):
+        from api.task_queue import wait_for_idle
+
+        queries = Counter()
+
+        def count_queries(execute, sql, params, many, context):
+            queries['db'] += 1
+            return execute(sql, params, many, context)
+
+        before = Counter(stubs.stats()['calls'])
+        if self.trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        with connection.execute_wrapper(count_queries):
+            # secure=True: SECURE_SSL_REDIRECT açıkken düz HTTP 301 döner ve view hiç çalışmaz
+            response = client.post('/api/venues/generate/', payload, content_type='application/json', secure=True)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        peak_kb = 0.0
+        if self.trace_memory:
+            peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+        # After-response görevleri (cache kaydı vb.) sıcak çalıştırmadan önce bitsin
+        wait_for_idle(timeout=30)
+
+        calls = Counter(stubs.stats()['calls'])
+        calls.subtract(before)
+        return {
+            'ms': elapsed_ms,
+            'status': response.status_code,
+            'items': len(response.json()) if response.status_code == 200 and isinstance(response.json(), list) else 0,
+            'calls': {k: v for k, v in calls.items() if v},
+            'db_queries': queries['db'],
+            'peak_kb': peak_kb,
+        }
+
+    def _run_scenario(self, stubs, scenario, location, iterations):
+        label, category, extra = scenario
+        payload = {'category': category, 'location': location, 'filters': {}, **extra}
+        client = Client()
+
+        reset_caches()
+        cold = self._request(client, stubs, payload)
+        warm = [self._request(client, stubs, payload) for _ in range(iterations)]
+        # Hata yanıtlarının latency'si anlamsız: 2xx olmayan senaryo benchmark'ı düşürür
+        failed = [run['status'] for run in [cold, *warm] if not 200 <= run['status'] < 300]
+        if failed:
+            raise CommandError(f"{label}: 2xx olmayan yanıt (HTTP {', '.join(map(str, sorted(set(failed))))})")
+        warm_ms = [run['ms'] for run in warm]
+
+        warm_calls = Counter()
+        for run in warm:
+            warm_calls.update(run['calls'])
+
+        return {
+            'scenario': label,
+            'status': cold['status'],
+            'items': cold['items'],
+            'cold_ms': round(cold['ms'], 1),
+            'warm_p50_ms': round(percentile(warm_ms, 50), 1),
+            'warm_p95_ms': round(percentile(warm_ms, 95), 1),
+            'cold_calls': cold['calls'],
+            'warm_calls_per_request': {k: round(v / iterations, 1) for k, v in warm_calls.items()},
+            'cold_db_queries': cold['db_queries'],
+            'warm_db_queries': round(statistics.mean(run['db_queries'] for run in warm), 1),
+            'cold_peak_kb': round(cold['peak_kb'], 1),
+            'warm_peak_kb_p50': round(percentile([run['peak_kb'] for run in warm], 50), 1),
+        }
+
+    def _report(self, results, stubs):
+        header = f"{'Senaryo':<24}{'HTTP':>5}{'Adet':>6}{'Soğuk':>10}{'p50':>10}{'p95':>10}{'DB s/ı':>9}{'DB ı/s':>9}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for r in results:
+            self.stdout.write(
+                f"{r['scenario']:<24}{r['status']:>5}{r['items']:>6}{r['cold_ms']:>9.0f}ms"
+                f"{r['warm_p50_ms']:>8.0f}ms{r['warm_p95_ms']:>8.0f}ms{r['cold_db_queries']:>9}{r['warm_db_queries']:>9}"
+            )
+        if self.trace_memory:
+            self.stdout.write('')
+            self.stdout.write('Tepe bellek (tracemalloc, istek başına):')
+            for r in results:
+                self.stdout.write(f"  {r['scenario']:<22} soğuk={r['cold_peak_kb']:>9.0f} KB  sıcak p50={r['warm_peak_kb_p50']:>9.0f} KB")
+        self.stdout.write('')
+        self.stdout.write('Dış çağrılar (soğuk | sıcak istek başına):')
+        for r in results:
+            services = sorted(set(r['cold_calls']) | set(r['warm_calls_per_request']))
+            breakdown = ', '.join(
+                f"{s}={r['cold_calls'].get(s, 0)}|{r['warm_calls_per_request'].get(s, 0)}" for s in services
+            ) or '-'
+            self.stdout.write(f"  {r['scenario']:<22} {breakdown}")
+        self.stdout.write('')
+        self.stdout.write(f"Yanıt kaynakları: {stubs.stats()['sources']}")
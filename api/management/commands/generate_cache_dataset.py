@@ -0,0 +1,215 @@
+"""
+Sentetik CachedVenue veri seti üretici (cache katmanı benchmark'ları için).
+
+Şehir × ilçe × kategori × lokasyon başına venue kombinasyonlarıyla, gerçek
+pipeline çıktısına benzer boyutta venue_data içeren kayıtlar üretir. last_api_call
+değerleri fresh / stale / expired aralıklarına yayılır; bir kısmı cache_clear_invalid'in
+silmesi gereken kayıtlardır (eksik alan, kapanmış yorum, zincir mekan).
+
+Kullanım:
+    python manage.py generate_cache_dataset                       # ~42 ilçe × 16 kategori × 20 = ~13k
+    python manage.py generate_cache_dataset --venues-per-location 1500   # ~1M satır
+    python manage.py generate_cache_dataset --cities istanbul --categories 4 --clear
+    python manage.py generate_cache_dataset --payload-kb 8 --invalid-ratio 0.1
+    DATABASE_URL=postgres://... python manage.py generate_cache_dataset   # PostgreSQL üzerinde
+"""
+
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from api.cache_service import CACHE_FRESH_HOURS, CACHE_STALE_HOURS, generate_location_key
+from api.location_data import LOCATION_DATA
+from api.models import CachedVenue
+from api.venue_flags import compute_flags
+from api.venue_search import build_search_text
+
+
+CITY_NAMES = {'istanbul': 'İstanbul', 'izmir': 'İzmir', 'mugla': 'Muğla'}
+CATEGORIES = [
+    'Fine Dining', 'Meyhane', 'Balıkçı', 'Ocakbaşı', 'Kahvaltı', 'Brunch', 'Tatlıcı',
+    'Romantik Akşam', 'Kebapçı', 'Sokak Lezzeti', 'İş Çıkışı Bira & Kokteyl', '3. Nesil Kahveci',
+    'Eğlence & Parti', 'İlk Buluşma', 'Özel Gün', 'Kafe',
+]
+SYNTHETIC_PREFIX = 'synthetic_'      # --clear sadece bu önekli place_id'leri siler
+_REVIEW_SENTENCES = (
+    'Servis hızlı ve güler yüzlüydü.', 'Mezeler taze, porsiyonlar doyurucu.', 'Akşam saatlerinde oldukça kalabalık oluyor.',
+    'Manzarası harika, rezervasyon şart.', 'Fiyatlar biraz yüksek ama kaliteye değer.', 'Müzik seviyesi sohbet için ideal.',
+    'Tatlıları mutlaka deneyin.', 'Otopark sorunu var, toplu taşıma önerilir.', 'Çalışanlar çok ilgili.',
+)
+_INVALID_KINDS = ('missing_fields', 'closed_review', 'chain_store')
+
+
+def build_venue_data(rnd: random.Random, place_id: str, name: str, category: str, city: str,
+                     district: str, payload_kb: float, invalid_kind: str = '') -> dict:
+    """Pipeline'ın cache'e yazdığı venue objesine benzer (alan adları ve boyut) sentetik kayıt."""
+    rating = round(rnd.uniform(3.8, 4.9), 1)
+    review_count = rnd.randint(20, 5000)
+    reviews = []
+    # Hedef boyuta ulaşana kadar yorum ekle (yorumlar venue_data'nın çoğunu oluşturur)
+    budget = max(int(payload_kb * 1024) - 1400, 200)
+    while budget > 0 and len(reviews) < 10:
+        text = ' '.join(rnd.choice(_REVIEW_SENTENCES) for _ in range(rnd.randint(3, 8)))
+        reviews.append({
+            'authorName': f"Misafir {rnd.randint(1, 9999)}",
+            'rating': rnd.randint(3, 5),
+            'text': text,
+            'relativeTime': f"{rnd.randint(1, 11)} ay önce",
+        })
+        budget -= len(text.encode('utf-8')) + 80
+    if invalid_kind == 'closed_review':
+        reviews[0]['text'] = 'Maalesef burası kalıcı olarak kapandı.'
+
+    data = {
+        'id': place_id,
+        'name': name,
+        'description': f"{district} bölgesinde {category.lower()} deneyimi sunan sevilen bir mekan.",
+        'imageUrl': f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference=synthetic{rnd.getrandbits(64):x}",
+        'category': category,
+        'vibeTags': rnd.sample(['#Samimi', '#Romantik', '#Canlı', '#Sakin', '#Manzaralı', '#Şık', '#BütçeDostu'], 3),
+        'address': f"{district}, {city}",
+        'priceRange': rnd.choice(['$', '$$', '$$$', '$$$$']),
+        'googleRating': rating,
+        'googleReviewCount': review_count,
+        'matchScore': rnd.randint(70, 98),
+        'noiseLevel': rnd.randint(20, 80),
+        'metrics': {'ambiance': rnd.randint(60, 95), 'accessibility': rnd.randint(60, 95), 'popularity': rnd.randint(60, 95)},
+        'googleMapsUrl': f"https://www.google.com/maps/place/?q=place_id:{place_id}",
+        'practicalInfo': {
+            'reservationNeeded': rnd.choice(['Önerilir', 'Gerekli Değil', 'Şart']),
+            'crowdLevel': rnd.choice(['Sakin', 'Orta', 'Kalabalık']),
+            'parking': rnd.choice(['Kolay', 'Zor', 'Vale var']),
+            'alcoholOptions': rnd.choice(['Full Bar', 'Yok', 'Bira & Şarap']),
+        },
+        'atmosphereSummary': {
+            'noiseLevel': rnd.choice(['Sessiz', 'Sohbet Dostu', 'Canlı']),
+            'lighting': rnd.choice(['Loş', 'Yumuşak', 'Aydınlık']),
+            'privacy': rnd.choice(['Açık Alan', 'Yarı Özel', 'Özel']),
+            'energy': rnd.choice(['Sakin', 'Dengeli', 'Enerjik']),
+            'idealFor': rnd.sample(['İlk Buluşma', 'Arkadaş Buluşması', 'İş Yemeği', 'Aile'], 2),
+            'shortDescription': 'Keyifli ve samimi bir ortam.',
+        },
+        'googleReviews': reviews,
+        'website': f"https://example.com/{place_id}",
+        'phoneNumber': f"0{rnd.randint(212, 252)} {rnd.randint(100, 999)} {rnd.randint(10, 99)} {rnd.randint(10, 99)}",
+        'hours': '10:00–23:00',
+        'weeklyHours': [f"{day}: 10:00–23:00" for day in ('Pazartesi', 'Salı', 'Çarşamba', 'Perşembe', 'Cuma', 'Cumartesi', 'Pazar')],
+        'isOpenNow': rnd.random() > 0.3,
+        'instagramUrl': f"https://instagram.com/synthetic{rnd.getrandbits(32):x}" if rnd.random() > 0.4 else '',
+    }
+    if invalid_kind == 'missing_fields':
+        del data['practicalInfo']
+    return data
+
+
+class Command(BaseCommand):
+    help = 'Cache benchmark\'ları için sentetik CachedVenue veri seti üret (şehir × ilçe × kategori ölçekli)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cities', nargs='+', default=list(LOCATION_DATA), help=f"Şehir anahtarları ({', '.join(LOCATION_DATA)})")
+        parser.add_argument('--districts-per-city', type=int, default=0, help='Şehir başına ilçe sayısı (0 = hepsi)')
+        parser.add_argument('--categories', type=int, default=len(CATEGORIES), help=f'Kategori sayısı (en fazla {len(CATEGORIES)})')
+        parser.add_argument('--venues-per-location', type=int, default=20, help='Kategori × ilçe başına venue sayısı')
+        parser.add_argument('--payload-kb', type=float, default=5.0, help='Ortalama venue_data boyutu (KB)')
+        parser.add_argument('--invalid-ratio', type=float, default=0.05, help='cache_clear_invalid\'in sileceği kayıt oranı')
+        parser.add_argument('--max-age-hours', type=float, default=CACHE_STALE_HOURS * 1.5, help='last_api_call yaşı üst sınırı')
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--clear', action='store_true', help='Önce mevcut sentetik kayıtları sil')
+        parser.add_argument('--seed', type=int, default=1)
+
+    def handle(self, *args, **options):
+        unknown = set(options['cities']) - set(LOCATION_DATA)
+        if unknown:
+            raise CommandError(f"Bilinmeyen şehir: {', '.join(sorted(unknown))}")
+
+        rnd = random.Random(options['seed'])
+        categories = CATEGORIES[:max(1, min(options['categories'], len(CATEGORIES)))]
+        locations = []
+        for city_key in options['cities']:
+            districts = [d['isim'] for d in LOCATION_DATA[city_key]['ilceler']]
+            if options['districts_per_city']:
+                districts = districts[:options['districts_per_city']]
+            locations.extend((CITY_NAMES.get(city_key, city_key.title()), district) for district in districts)
+
+        total = len(locations) * len(categories) * options['venues_per_location']
+        self.stdout.write(
+            f"🧪 {len(locations)} ilçe × {len(categories)} kategori × {options['venues_per_location']} venue = {total:,} kayıt "
+            f"(~{options['payload_kb']:.1f} KB venue_data, {connection.vendor})"
+        )
+
+        if options['clear']:
+            deleted, _ = CachedVenue.objects.filter(place_id__startswith=SYNTHETIC_PREFIX).delete()
+            self.stdout.write(f"🗑️ {deleted:,} sentetik kayıt silindi")
+
+        now = timezone.now()
+        # Yaş dağılımı: %60 fresh, %25 stale, %15 expired (gerçek trafiğe yakın)
+        age_buckets = [
+            (0.60, 0, CACHE_FRESH_HOURS),
+            (0.25, CACHE_FRESH_HOURS, CACHE_STALE_HOURS),
+            (0.15, CACHE_STALE_HOURS, options['max_age_hours']),
+        ]
+        started = time.perf_counter()
+        written = 0
+        batch = []
+        ages = []
+
+        def flush():
+            nonlocal written
+            with transaction.atomic():
+                CachedVenue.objects.bulk_create(batch, batch_size=options['batch_size'])
+                # last_api_call auto_now_add olduğu için yaşlar insert sonrası, saat gruplarıyla güncellenir
+                by_hour = {}
+                for obj, age in zip(batch, ages):
+                    by_hour.setdefault(round(age), []).append(obj.place_id)
+                for age_hours, place_ids in by_hour.items():
+                    stamp = now - timedelta(hours=age_hours)
+                    CachedVenue.objects.filter(place_id__in=place_ids).update(
+                        last_api_call=stamp, updated_at=stamp, last_accessed=stamp
+                    )
+            written += len(batch)
+            batch.clear()
+            ages.clear()
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"  {written:,}/{total:,} ({written / elapsed:,.0f} satır/s)", ending='\r')
+            self.stdout.flush()
+
+        for city, district in locations:
+            for category in categories:
+                location_key = generate_location_key(category, city, district)
+                for i in range(options['venues_per_location']):
+                    place_id = f"{SYNTHETIC_PREFIX}{location_key}_{i}"
+                    invalid_kind = rnd.choice(_INVALID_KINDS) if rnd.random() < options['invalid_ratio'] else ''
+                    name = f"Zincir Starbucks {district} {i}" if invalid_kind == 'chain_store' else f"{district} {category} {i + 1}"
+                    venue_data = build_venue_data(rnd, place_id, name, category, city, district, options['payload_kb'], invalid_kind)
+                    roll, age = rnd.random(), 0.0
+                    for share, low, high in age_buckets:
+                        if roll < share:
+                            age = rnd.uniform(low, high)
+                            break
+                        roll -= share
+                    batch.append(CachedVenue(
+                        place_id=place_id,
+                        name=name,
+                        category=category,
+                        city=city,
+                        district=district,
+                        location_key=location_key,
+                        venue_data=venue_data,
+                        search_text=build_search_text(venue_data, category, city, district),
+                        google_rating=venue_data['googleRating'],
+                        google_review_count=venue_data['googleReviewCount'],
+                        **compute_flags(venue_data, category)._asdict(),
+                    ))
+                    ages.append(age)
+                    if len(batch) >= options['batch_size']:
+                        flush()
+        if batch:
+            flush()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f"✅ {written:,} kayıt {elapsed:.1f}s içinde yazıldı ({written / max(elapsed, 1e-9):,.0f} satır/s)"))
@@ -0,0 +1,144 @@
+"""
+Cold start import süresi raporu (`python -X importtime` çıktısını parse eder).
+
+Temiz bir alt süreçte Django'yu ayağa kaldırıp URLconf'u yükler ve
+modül bazında import sürelerini raporlar. Bütçe aşılırsa veya URLconf
+yüklenirken ağır modüllerden biri import edilirse hata koduyla çıkar
+(CI'da import-time regresyon kontrolü olarak kullanılır). Aynı kontrolü
+api/tests.py, URLCONF_IMPORT_BUDGET_MS ile her iki ASYNC_VIEWS modunda çalıştırır.
+
+Kullanım:
+    python manage.py import_time_report                  # Rapor (ilk 25 modül)
+    python manage.py import_time_report --top 50
+    python manage.py import_time_report --budget-ms 1500 # Bütçe kontrolü
+    python manage.py import_time_report --target api.views  # Tek modülün maliyeti
+    python manage.py test api                                # Bütçe + lazy modül testi
+"""
+
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# URLconf yüklenirken import EDİLMEMESİ gereken modüller (ilk kullanımda yüklenir)
+DEFAULT_FORBIDDEN_MODULES = [
+    'api.views',
+    'googlemaps',
+    'google.generativeai',
+    'google.genai',
+    'api.popular_venues_data',
+    'api.gault_millau_data',
+    'api.michelin_data',
+    'numpy',
+]
+
+# api.urls cumulative import bütçesi (lokalde ~190 ms; lazy import öncesi ~790 ms)
+URLCONF_IMPORT_BUDGET_MS = 400
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+
+def parse_importtime(stderr: str):
+    """
+    `-X importtime` çıktısını (module, self_us, cumulative_us, depth) listesine çevirir.
+    Aynı modül birden fazla görünürse ilk (gerçek) import kaydı alınır.
+    """
+    records = []
+    seen = set()
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        if module in seen:
+            continue
+        seen.add(module)
+        records.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return records
+
+
+def measure_imports(target: str, env_overrides: Optional[Dict[str, str]] = None):
+    """Temiz alt süreçte django.setup() + `import target`; parse_importtime kayıtlarını döndürür."""
+    if not re.fullmatch(r'[A-Za-z_][\w.]*', target):
+        raise RuntimeError(f'Geçersiz modül adı: {target}')
+    # NOT: importlib.import_module -X importtime'da görünmez, import ifadesi kullanılmalı
+    script = f"import django; django.setup(); import {target}"
+    env = dict(os.environ)
+    env.setdefault('DJANGO_SETTINGS_MODULE', 'maksat_backend.settings')
+    env.update(env_overrides or {})
+
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        cwd=str(settings.BASE_DIR), env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f'Alt süreç başarısız oldu:\n{proc.stderr[-2000:]}')
+    return parse_importtime(proc.stderr)
+
+
+def import_failures(records, target: str, budget_ms: Optional[float] = None, allow_heavy: bool = False) -> List[str]:
+    """Ağır modül ve bütçe ihlallerini açıklayan mesajlar (boşsa kontrol geçti)."""
+    by_module = {module: cum_us for module, _, cum_us, _ in records}
+    failures = []
+    if not allow_heavy and target == 'api.urls':
+        loaded_heavy = [m for m in DEFAULT_FORBIDDEN_MODULES if m in by_module]
+        if loaded_heavy:
+            failures.append(f'URLconf yüklenirken ağır modüller import edildi: {", ".join(loaded_heavy)}')
+
+    if budget_ms is not None and target in by_module:
+        target_ms = by_module[target] / 1000
+        if target_ms > budget_ms:
+            failures.append(f'{target} import süresi {target_ms:.1f} ms > bütçe {budget_ms:.1f} ms')
+    return failures
+
+
+class Command(BaseCommand):
+    help = 'Cold start import sürelerini ölç ve raporla (python -X importtime)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', type=str, default='api.urls',
+                            help='Ölçülecek modül (varsayılan: api.urls, yani URLconf)')
+        parser.add_argument('--top', type=int, default=25,
+                            help='Cumulative süreye göre gösterilecek modül sayısı')
+        parser.add_argument('--budget-ms', type=float, default=None,
+                            help='Hedef modülün cumulative import bütçesi (ms); aşılırsa hata')
+        parser.add_argument('--allow-heavy', action='store_true',
+                            help='Ağır modül (SDK / veri seti) import kontrolünü atla')
+
+    def handle(self, *args, **options):
+        target = options['target']
+        try:
+            records = measure_imports(target)
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        by_module = {module: (self_us, cum_us) for module, self_us, cum_us, _ in records}
+        total_us = sum(self_us for _, self_us, _, _ in records)
+
+        self.stdout.write(f'Hedef: {target}')
+        self.stdout.write(f'Toplam import süresi (django.setup + hedef): {total_us / 1000:.1f} ms, {len(records)} modül')
+        if target in by_module:
+            self.stdout.write(f'{target} cumulative: {by_module[target][1] / 1000:.1f} ms')
+
+        self.stdout.write('')
+        self.stdout.write(f'{"cumulative ms":>14} {"self ms":>9}  modül')
+        for module, self_us, cum_us, depth in sorted(records, key=lambda r: r[2], reverse=True)[:options['top']]:
+            self.stdout.write(f'{cum_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {module}')
+
+        api_modules = [(m, s) for m, s, _, _ in records if m == 'api' or m.startswith('api.')]
+        if api_modules:
+            self.stdout.write('')
+            self.stdout.write('api.* modülleri (self ms):')
+            for module, self_us in sorted(api_modules, key=lambda r: r[1], reverse=True):
+                self.stdout.write(f'{self_us / 1000:>9.1f}  {module}')
+
+        failures = import_failures(records, target, options['budget_ms'], options['allow_heavy'])
+        if failures:
+            raise CommandError('\n'.join(failures))
+
+        self.stdout.write(self.style.SUCCESS('Import-time kontrolü geçti'))
@@ -0,0 +1,347 @@
+"""
+Load-test harness: lokal çalışan sunucuya gerçekçi trafik karışımı uygular.
+
+Sunucu stub'larla ayağa kaldırılır (dış servislere gidilmez), ardından bu komut
+sanal kullanıcılarla (thread) belirtilen süre boyunca trafik üretir:
+
+    OUTBOUND_STUBS=replay OUTBOUND_STUBS_LATENCY="places=250,geocode=80,cse=300,gemini=2500" \\
+        gunicorn maksat_backend.wsgi:application -c gunicorn.conf.py
+    python manage.py load_test --url http://127.0.0.1:10000 --users 8 --duration 120
+
+Trafik karışımı (ağırlıklar --mix ile değiştirilebilir):
+- generate      → kategori / şehir / ilçe kombinasyonları (İstanbul ağırlıklı)
+- load_more     → aynı kullanıcının son aramasına büyüyen excludeIds ile tekrar istek
+- shortlink_get → daha önce oluşturulmuş linklere erişim (önizleme botları gibi)
+- shortlink_new → sonuçlardan bir venue için kısa link oluşturma
+- favorites     → token'lı kullanıcının favori listeleme / ekleme
+
+Rapor: throughput, tip bazında p50/p95/p99, hata ve timeout oranı, worker doygunluğu.
+Doygunluk iki sinyalle ölçülür: (1) ortalama eşzamanlı istek / kapasite
+(workers × threads), (2) kuyrukta bekleme = istemci süresi − Server-Timing total
+(istek gunicorn backlog'unda bekliyorsa bu fark büyür).
+"""
+
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.location_data import LOCATION_DATA
+
+
+DEFAULT_MIX = 'generate=40,load_more=20,shortlink_get=20,shortlink_new=5,favorites=15'
+CITY_WEIGHTS = (('İstanbul', 'istanbul', 70), ('İzmir', 'izmir', 20), ('Muğla', 'mugla', 10))
+CATEGORIES = (
+    ({'id': '2', 'name': 'Fine Dining'}, 8),
+    ({'id': 'bar', 'name': 'İş Çıkışı Bira & Kokteyl'}, 14),
+    ({'id': 'party', 'name': 'Eğlence & Parti'}, 10),
+    ({'id': '23', 'name': '3. Nesil Kahveci'}, 14),
+    ({'id': 'sokak-lezzeti', 'name': 'Sokak Lezzeti'}, 10),
+    ({'id': '24', 'name': 'Meyhane'}, 10),
+    ({'id': '4', 'name': 'Kahvaltı'}, 12),
+    ({'id': '1', 'name': 'Romantik Akşam'}, 8),
+    ({'id': 'festivals', 'name': 'Yerel Festivaller'}, 4),
+)
+SERVER_TIMING_TOTAL = re.compile(r'total;dur=([\d.]+)')
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))]
+
+
+def parse_mix(spec: str) -> dict:
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        if name.strip():
+            mix[name.strip()] = float(weight or 1)
+    unknown = set(mix) - {'generate', 'load_more', 'shortlink_get', 'shortlink_new', 'favorites'}
+    if unknown:
+        raise CommandError(f"Bilinmeyen trafik tipi: {', '.join(sorted(unknown))}")
+    return mix
+
+
+class LoadStats:
+    """Thread-safe sonuç toplayıcı + eşzamanlılık (in-flight) takibi."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.queue_waits = []
+        self.errors = defaultdict(int)
+        self.timeouts = defaultdict(int)
+        self.statuses = defaultdict(int)
+        self.in_flight = 0
+        self._busy_integral = 0.0       # Σ in_flight × dt
+        self._last_change = time.perf_counter()
+        self.started = self._last_change
+
+    def _advance(self):
+        now = time.perf_counter()
+        self._busy_integral += self.in_flight * (now - self._last_change)
+        self._last_change = now
+
+    def begin(self):
+        with self._lock:
+            self._advance()
+            self.in_flight += 1
+
+    def end(self, kind: str, elapsed_ms: float, status_code, server_ms=None, timeout=False, error=False):
+        with self._lock:
+            self._advance()
+            self.in_flight -= 1
+            self.latencies[kind].append(elapsed_ms)
+            self.statuses[status_code] += 1
+            if timeout:
+                self.timeouts[kind] += 1
+            elif error:
+                self.errors[kind] += 1
+            if server_ms is not None:
+                self.queue_waits.append(max(0.0, elapsed_ms - server_ms))
+
+    def mean_concurrency(self) -> float:
+        with self._lock:
+            self._advance()
+            elapsed = self._last_change - self.started
+            return self._busy_integral / elapsed if elapsed else 0.0
+
+
+class VirtualUser:
+    """Tek bir istemci: kendi oturumu, son araması ve (varsa) token'ı vardır."""
+
+    def __init__(self, index: int, base_url: str, timeout: float, stats: LoadStats, shared: dict, rnd: random.Random):
+        import requests
+
+        self.session = requests.Session()
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.stats = stats
+        self.shared = shared
+        self.rnd = rnd
+        self.index = index
+        self.token = None
+        self.last_search = None          # (payload, seen_ids)
+
+    # --- HTTP ---
+
+    def request(self, kind: str, method: str, path: str, **kwargs):
+        import requests
+
+        headers = kwargs.pop('headers', {})
+        if self.token:
+            headers['Authorization'] = f'Token {self.token}'
+        self.stats.begin()
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, self.base_url + path, headers=headers, timeout=self.timeout, **kwargs)
+        except requests.Timeout:
+            self.stats.end(kind, (time.perf_counter() - started) * 1000, 'timeout', timeout=True)
+            return None
+        except requests.RequestException:
+            self.stats.end(kind, (time.perf_counter() - started) * 1000, 'conn_error', error=True)
+            return None
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        match = SERVER_TIMING_TOTAL.search(response.headers.get('Server-Timing', ''))
+        self.stats.end(kind, elapsed_ms, response.status_code,
+                       server_ms=float(match.group(1)) if match else None,
+                       error=response.status_code >= 500)
+        return response
+
+    # --- senaryolar ---
+
+    def _location(self):
+        city, key, _ = self.rnd.choices(CITY_WEIGHTS, weights=[w for *_, w in CITY_WEIGHTS])[0]
+        districts = LOCATION_DATA[key]['ilceler']
+        # Popüler ilçeler daha sık (liste başı ağırlıklı, Zipf benzeri)
+        district = self.rnd.choices(districts, weights=[1 / (i + 1) for i in range(len(districts))])[0]
+        return {'city': city, 'districts': [district['isim']], 'neighborhoods': []}
+
+    def generate(self):
+        category = self.rnd.choices([c for c, _ in CATEGORIES], weights=[w for _, w in CATEGORIES])[0]
+        payload = {'category': category, 'location': self._location(), 'filters': {}, 'excludeIds': []}
+        self._search('generate', payload, set())
+
+    def load_more(self):
+        if not self.last_search:
+            return self.generate()
+        payload, seen = self.last_search
+        payload = dict(payload, excludeIds=sorted(seen))
+        self._search('load_more', payload, seen)
+
+    def _search(self, kind: str, payload: dict, seen: set):
+        response = self.request(kind, 'POST', '/api/venues/generate/', json=payload)
+        if response is None or response.status_code != 200:
+            return
+        try:
+            venues = response.json()
+        except ValueError:
+            return
+        if isinstance(venues, list):
+            seen |= {v.get('id') for v in venues if isinstance(v, dict) and v.get('id')}
+            self.last_search = (payload, seen)
+            if venues:
+                with self.shared['lock']:
+                    self.shared['venues'].append(venues[0])
+                    del self.shared['venues'][:-200]
+
+    def shortlink_new(self):
+        with self.shared['lock']:
+            venue = self.rnd.choice(self.shared['venues']) if self.shared['venues'] else {'id': f'load-{uuid.uuid4().hex[:8]}', 'name': 'Load Test Mekan'}
+        response = self.request('shortlink_new', 'POST', '/api/shortlink/', json={'venue_data': venue})
+        if response is not None and response.status_code == 201:
+            with self.shared['lock']:
+                self.shared['codes'].append(response.json()['code'])
+
+    def shortlink_get(self):
+        with self.shared['lock']:
+            code = self.rnd.choice(self.shared['codes']) if self.shared['codes'] else None
+        if code is None:
+            return self.shortlink_new()
+        self.request('shortlink_get', 'GET', f'/api/shortlink/{code}/')
+
+    def favorites(self):
+        if self.token is None:
+            username = f"load_{uuid.uuid4().hex[:10]}"
+            response = self.request('favorites', 'POST', '/api/auth/register/', json={
+                'username': username, 'email': f'{username}@example.com',
+                'password': 'LoadTest!12345', 'password_confirm': 'LoadTest!12345',
+            })
+            if response is None or response.status_code != 201:
+                return
+            self.token = response.json()['token']
+        if self.rnd.random() < 0.7:
+            self.request('favorites', 'GET', '/api/favorites/')
+        else:
+            self.request('favorites', 'POST', '/api/favorites/', json={
+                'place_id': f'load_{uuid.uuid4().hex[:12]}', 'name': 'Load Test Mekan', 'address': 'İstanbul', 'rating': 4.5,
+            })
+
+
+class Command(BaseCommand):
+    help = 'Lokal sunucuya gerçekçi trafik karışımıyla yük testi uygula (throughput, tail latency, doygunluk)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:10000', help='Sunucu adresi')
+        parser.add_argument('--users', type=int, default=8, help='Eşzamanlı sanal kullanıcı sayısı')
+        parser.add_argument('--duration', type=float, default=60, help='Test süresi (saniye)')
+        parser.add_argument('--ramp-up', type=float, default=5, help='Kullanıcıların kademeli başlama süresi (saniye)')
+        parser.add_argument('--think-time', type=float, default=1.0, help='İstekler arası ortalama bekleme (saniye, üstel)')
+        parser.add_argument('--timeout', type=float, default=120, help='İstemci timeout (gunicorn timeout ile aynı)')
+        parser.add_argument('--mix', default=DEFAULT_MIX, help=f'Trafik ağırlıkları (varsayılan "{DEFAULT_MIX}")')
+        parser.add_argument('--capacity', type=int, default=0, help='Sunucu kapasitesi (workers × threads); varsayılan gunicorn.conf.py')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--json', dest='json_path', default='', help='Sonuçları JSON olarak bu dosyaya yaz')
+
+    def handle(self, *args, **options):
+        import requests
+
+        mix = parse_mix(options['mix'])
+        capacity = options['capacity'] or self._gunicorn_capacity()
+        try:
+            requests.get(options['url'].rstrip('/') + '/api/health/', timeout=10)
+        except requests.RequestException as e:
+            raise CommandError(f"Sunucuya ulaşılamadı ({options['url']}): {e}")
+
+        stats = LoadStats()
+        shared = {'lock': threading.Lock(), 'venues': [], 'codes': []}
+        deadline = time.monotonic() + options['duration']
+        kinds, weights = list(mix), list(mix.values())
+
+        def run_user(index: int):
+            rnd = random.Random(options['seed'] + index)
+            user = VirtualUser(index, options['url'], options['timeout'], stats, shared, rnd)
+            time.sleep(options['ramp_up'] * index / max(options['users'], 1))
+            while time.monotonic() < deadline:
+                getattr(user, rnd.choices(kinds, weights=weights)[0])()
+                if options['think_time'] > 0:
+                    time.sleep(min(rnd.expovariate(1 / options['think_time']), max(0.0, deadline - time.monotonic())))
+
+        self.stdout.write(f"🚦 {options['users']} kullanıcı, {options['duration']:.0f}s, kapasite {capacity} → {options['url']}")
+        threads = [threading.Thread(target=run_user, args=(i,), daemon=True) for i in range(options['users'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=options['duration'] + options['timeout'] + options['ramp_up'] + 5)
+
+        report = self._build_report(stats, capacity)
+        self._print_report(report)
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"JSON sonuçları yazıldı: {options['json_path']}")
+
+    @staticmethod
+    def _gunicorn_capacity() -> int:
+        from django.conf import settings
+
+        config = {}
+        try:
+            with open(settings.BASE_DIR / 'gunicorn.conf.py', encoding='utf-8') as f:
+                exec(compile(f.read(), 'gunicorn.conf.py', 'exec'), config)
+        except OSError:
+            return 1
+        return int(config.get('workers', 1)) * int(config.get('threads', 1))
+
+    @staticmethod
+    def _build_report(stats: LoadStats, capacity: int) -> dict:
+        elapsed = time.perf_counter() - stats.started
+        total = sum(len(v) for v in stats.latencies.values())
+        per_kind = {}
+        for kind, values in sorted(stats.latencies.items()):
+            per_kind[kind] = {
+                'count': len(values),
+                'p50_ms': round(percentile(values, 50), 1),
+                'p95_ms': round(percentile(values, 95), 1),
+                'p99_ms': round(percentile(values, 99), 1),
+                'max_ms': round(max(values), 1),
+                'errors': stats.errors[kind],
+                'timeouts': stats.timeouts[kind],
+            }
+        concurrency = stats.mean_concurrency()
+        return {
+            'duration_s': round(elapsed, 1),
+            'requests': total,
+            'throughput_rps': round(total / elapsed, 2) if elapsed else 0.0,
+            'error_rate': round(sum(stats.errors.values()) / total, 4) if total else 0.0,
+            'timeout_rate': round(sum(stats.timeouts.values()) / total, 4) if total else 0.0,
+            'statuses': {str(k): v for k, v in stats.statuses.items()},
+            'capacity': capacity,
+            'mean_concurrency': round(concurrency, 2),
+            'saturation': round(concurrency / capacity, 2) if capacity else 0.0,
+            'queue_wait_p50_ms': round(percentile(stats.queue_waits, 50), 1),
+            'queue_wait_p95_ms': round(percentile(stats.queue_waits, 95), 1),
+            'by_kind': per_kind,
+        }
+
+    def _print_report(self, report: dict):
+        self.stdout.write('')
+        self.stdout.write(
+            f"İstek: {report['requests']} / {report['duration_s']}s → {report['throughput_rps']} req/s | "
+            f"hata %{report['error_rate'] * 100:.1f} | timeout %{report['timeout_rate'] * 100:.1f}"
+        )
+        self.stdout.write(f"Durum kodları: {report['statuses']}")
+        self.stdout.write(
+            f"Doygunluk: ort. eşzamanlı {report['mean_concurrency']} / kapasite {report['capacity']} "
+            f"(%{report['saturation'] * 100:.0f}) | kuyruk bekleme p50 {report['queue_wait_p50_ms']:.0f}ms "
+            f"p95 {report['queue_wait_p95_ms']:.0f}ms"
+        )
+        self.stdout.write('')
+        header = f"{'Tip':<15}{'Adet':>7}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}{'Hata':>6}{'T/O':>6}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for kind, row in report['by_kind'].items():
+            self.stdout.write(
+                f"{kind:<15}{row['count']:>7}{row['p50_ms']:>8.0f}ms{row['p95_ms']:>8.0f}ms"
+                f"{row['p99_ms']:>8.0f}ms{row['max_ms']:>8.0f}ms{row['errors']:>6}{row['timeouts']:>6}"
+            )
+        if report['saturation'] >= 0.9 or report['queue_wait_p95_ms'] > 1000:
+            self.stdout.write(self.style.WARNING('⚠️ Worker havuzu doygun: istekler kuyrukta bekliyor'))
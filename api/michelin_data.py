@@ -0,0 +1,142 @@
+"""
+Türkiye Michelin Rehberi Restoranları (2024-2025)
+
+Yıldızlı ve Bib Gourmand restoranların normalize isim listesi.
+views.py tarafından ilk kullanımda (lazy) yüklenir.
+"""
+
+# Türkiye'deki Michelin yıldızlı ve Bib Gourmand restoranlar (2024-2025)
+# Normalized isimler - küçük harf ve Türkçe karakterler normalize edilmiş
+MICHELIN_STARRED_RESTAURANTS = {
+    # İstanbul - Michelin Yıldızlı (2 yıldız)
+    'turk fatih tutak': {'stars': 2, 'city': 'İstanbul'},
+    # İstanbul - Michelin Yıldızlı (1 yıldız)
+    'neolokal': {'stars': 1, 'city': 'İstanbul'},
+    'mikla': {'stars': 1, 'city': 'İstanbul'},
+    'nicole': {'stars': 1, 'city': 'İstanbul'},
+    'araka': {'stars': 1, 'city': 'İstanbul'},
+    'arkestra': {'stars': 1, 'city': 'İstanbul'},
+    'default': {'stars': 1, 'city': 'İstanbul'},
+    'esmae': {'stars': 1, 'city': 'İstanbul'},
+    'mürver': {'stars': 1, 'city': 'İstanbul'},
+    'murver': {'stars': 1, 'city': 'İstanbul'},
+    'octo': {'stars': 1, 'city': 'İstanbul'},
+    'azra': {'stars': 1, 'city': 'İstanbul'},
+    'esmee': {'stars': 1, 'city': 'İstanbul'},
+    # İstanbul - Bib Gourmand
+    'aheste': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    'aman da bravo': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    'casa lavanda': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    'cuma': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    'kantin': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    'privato cafe': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    'yeni lokanta': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    'gram': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    'karakoy lokantasi': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    'karaköy lokantası': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    'datli maya': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    'tatlı maya': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
+    # Bodrum - Michelin Yıldızlı (1 yıldız)
+    'kitchen bodrum': {'stars': 1, 'city': 'Bodrum'},
+    'iki sandal': {'stars': 1, 'city': 'Bodrum'},
+    # Not: Maçakızı ve Zuma Bodrum yıldızlı DEĞİL, sadece Michelin Selected
+    # Ankara - Bib Gourmand
+    'mikado': {'stars': 0, 'bib': True, 'city': 'Ankara'},
+    # İzmir - Michelin Yıldızlı & Bib Gourmand
+    'oi filoi': {'stars': 1, 'city': 'İzmir'},
+    'hiç': {'stars': 1, 'city': 'İzmir'},  # Hiç Lokanta - Urla
+    'hic': {'stars': 1, 'city': 'İzmir'},
+    'hiç lokanta': {'stars': 1, 'city': 'İzmir'},
+    'hic lokanta': {'stars': 1, 'city': 'İzmir'},
+    'vino locale': {'stars': 0, 'bib': True, 'city': 'İzmir'},
+    'asma yaprağı': {'stars': 0, 'bib': True, 'city': 'İzmir'},
+    'asma yapragi': {'stars': 0, 'bib': True, 'city': 'İzmir'},
+    # Alaçatı / Çeşme - Michelin
+    'agrilia': {'stars': 1, 'city': 'İzmir'},
+    'ferdi baba': {'stars': 0, 'bib': True, 'city': 'İzmir'},
+    # Antalya
+    'seraser': {'stars': 0, 'bib': True, 'city': 'Antalya'},
+}
+
+# Şehir bazlı Michelin restoran isimleri (Google Places araması için)
+MICHELIN_RESTAURANTS_BY_CITY = {
+    'İstanbul': [
+        'Türk Fatih Tutak', 'Neolokal', 'Mikla', 'Nicole Restaurant', 'Araka',
+        'Arkestra', 'Default Restaurant', 'Mürver', 'Octo', 'Azra',
+        'Aheste', 'Yeni Lokanta', 'Karaköy Lokantası', 'Gram', 'Casa Lavanda'
+    ],
+    'İzmir': [
+        'Hiç Lokanta Urla', 'Oi Filoi İzmir', 'Agrilia Alaçatı', 'Vino Locale',
+        'Asma Yaprağı', 'Ferdi Baba Alaçatı'
+    ],
+    'Bodrum': ['Kitchen Bodrum', 'İki Sandal'],
+    'Ankara': ['Mikado Ankara'],
+    'Antalya': ['Seraser Fine Dining'],
+}
+
+# Michelin Guide Türkiye 2024 - şehir bazlı rehber listesi (Fine Dining önce bunları gösterir)
+MICHELIN_GUIDE_BY_CITY = {
+    "İstanbul": [
+        {"name": "Turk Fatih Tutak", "district": "Şişli", "status": "2 Yıldız", "cuisine": "Modern Türk"},
+        {"name": "Neolokal", "district": "Beyoğlu", "status": "1 Yıldız", "cuisine": "Modern Türk"},
+        {"name": "Nicole", "district": "Beyoğlu", "status": "1 Yıldız", "cuisine": "Akdeniz"},
+        {"name": "Mikla", "district": "Beyoğlu", "status": "1 Yıldız", "cuisine": "Modern Türk"},
+        {"name": "Araka", "district": "Beyoğlu", "status": "1 Yıldız", "cuisine": "Modern Türk"},
+        {"name": "Arkestra", "district": "Beşiktaş", "status": "1 Yıldız", "cuisine": "Modern"},
+        {"name": "Sankai by Nagaya", "district": "Beşiktaş", "status": "1 Yıldız", "cuisine": "Japon"},
+        {"name": "Casa Lavanda", "district": "Kadıköy", "status": "1 Yıldız", "cuisine": "İtalyan"},
+        {"name": "Aida - vino e cucina", "district": "Beyoğlu", "status": "Bib Gourmand", "cuisine": "İtalyan"},
+        {"name": "Foxy Nişantaşı", "district": "Şişli", "status": "Bib Gourmand", "cuisine": "Asya Füzyon"},
+        {"name": "The Red Balloon", "district": "Kadıköy", "status": "Bib Gourmand", "cuisine": "Modern"},
+        {"name": "Alaf", "district": "Beşiktaş", "status": "Bib Gourmand", "cuisine": "Anadolu"},
+        {"name": "Yeni Lokanta", "district": "Beyoğlu", "status": "Selected", "cuisine": "Modern Türk"},
+        {"name": "Sunset Grill & Bar", "district": "Beşiktaş", "status": "Selected", "cuisine": "Uluslararası"},
+        {"name": "Ulus 29", "district": "Beşiktaş", "status": "Selected", "cuisine": "Türk"},
+        {"name": "Zuma İstanbul", "district": "Beşiktaş", "status": "Selected", "cuisine": "Japon"},
+    ],
+    "Muğla": [
+        {"name": "Kitchen", "district": "Bodrum", "status": "1 Yıldız", "cuisine": "Modern Türk"},
+        {"name": "İki Sandal", "district": "Bodrum", "status": "1 Yıldız", "cuisine": "Deniz Ürünleri"},
+        {"name": "Otantik Ocakbaşı", "district": "Bodrum", "status": "Bib Gourmand", "cuisine": "Kebap"},
+        {"name": "Zuma Bodrum", "district": "Bodrum", "status": "Selected", "cuisine": "Japon"},
+        {"name": "Maçakızı", "district": "Bodrum", "status": "Selected", "cuisine": "Akdeniz"},
+    ],
+    "İzmir": [
+        {"name": "OD Urla", "district": "Urla", "status": "1 Yıldız", "cuisine": "Modern Türk"},
+        {"name": "Teruar Urla", "district": "Urla", "status": "1 Yıldız", "cuisine": "Modern Türk"},
+        {"name": "Vino Locale", "district": "Urla", "status": "1 Yıldız", "cuisine": "Modern Türk"},
+        {"name": "Hiç Lokanta", "district": "Urla", "status": "Bib Gourmand", "cuisine": "Modern Türk"},
+        {"name": "LA Mahzen", "district": "Urla", "status": "Bib Gourmand", "cuisine": "Şarap Evi"},
+        {"name": "SOTA Alaçatı", "district": "Çeşme", "status": "Selected", "cuisine": "Modern"},
+        {"name": "Ferdi Baba", "district": "Çeşme", "status": "Selected", "cuisine": "Deniz Ürünleri"},
+    ],
+    "Ankara": [
+        {"name": "Trilye", "district": "Çankaya", "status": "Selected", "cuisine": "Deniz Ürünleri"},
+    ],
+    "Antalya": [
+        {"name": "Seraser Fine Dining", "district": "Muratpaşa", "status": "Selected", "cuisine": "Akdeniz"},
+    ],
+}
+
+
+def is_michelin_restaurant(venue_name):
+    """
+    Restoran isminin Michelin yıldızlı veya Bib Gourmand olup olmadığını kontrol eder.
+    Returns: {'isMichelin': bool, 'stars': int, 'isBib': bool} veya None
+    """
+    # İsmi normalize et
+    normalized = venue_name.lower().strip()
+    normalized = normalized.replace('ı', 'i').replace('ş', 's').replace('ç', 'c')
+    normalized = normalized.replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
+
+    # Direkt eşleşme kontrolü
+    for michelin_name, info in MICHELIN_STARRED_RESTAURANTS.items():
+        # Hem direkt eşleşme hem de içerme kontrolü yap
+        if michelin_name in normalized or normalized in michelin_name:
+            return {
+                'isMichelin': True,
+                'stars': info.get('stars', 0),
+                'isBib': info.get('bib', False)
+            }
+
+    return None
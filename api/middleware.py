@@ -1,22 +1,89 @@
 """
-Security middleware for adding HTTP security headers.
+Project middleware: HTTP security headers, request timing, admin-only profiling
+and after-response task dispatch.
+
+Every class here is both sync and async capable: under ASGI (maksat_backend/asgi.py)
+Django calls __acall__ directly instead of adapting the chain onto a thread, so a
+request only holds a thread where a sync view or ORM call actually needs one.
 """
 
+import logging
+import threading
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 from django.conf import settings
+from django.http import HttpResponse
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from .profiling import create_profiler, is_profiling_admin, requested_mode, store_profile
+from .task_queue import begin_request, end_request
+from .timing import install_db_timing, install_requests_timing, log_slow_request, request_timer
+
+logger = logging.getLogger(__name__)
 
 
-class SecurityHeadersMiddleware:
+class HybridMiddleware:
     """
-    Middleware to add security headers to responses.
-    Only applies in production (when DEBUG=False).
+    Base for middleware with a sync __call__ and an async __acall__ path.
+    Subclasses implement handle(request) and __acall__(request).
     """
+    sync_capable = True
+    async_capable = True
 
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
-        response = self.get_response(request)
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.handle(request)
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise with an async path (WhiteNoise itself is sync-only, which would put
+    the whole ASGI chain below it on a thread). Static lookups are an in-memory dict
+    hit; only autorefresh mode (DEBUG) touches the filesystem per request.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file, thread_sensitive=False)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
 
+class SecurityHeadersMiddleware(HybridMiddleware):
+    """
+    Middleware to add security headers to responses.
+    Only applies in production (when DEBUG=False).
+    """
+
+    def handle(self, request):
+        return self.add_headers(self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.add_headers(await self.get_response(request))
+
+    @staticmethod
+    def add_headers(response):
         # Only add security headers in production
         if not settings.DEBUG:
             # Content Security Policy
@@ -41,3 +108,155 @@ class SecurityHeadersMiddleware:
             )
 
         return response
+
+
+class AfterResponseMiddleware(HybridMiddleware):
+    """
+    Opens a per-request task list for api.task_queue.defer() and hands the
+    collected tasks to the background worker when the response is closed,
+    i.e. after the body has been sent to the client.
+    """
+
+    def handle(self, request):
+        pending = begin_request()
+        return self.dispatch_on_close(self.get_response(request), pending)
+
+    async def __acall__(self, request):
+        pending = begin_request()
+        return self.dispatch_on_close(await self.get_response(request), pending)
+
+    @staticmethod
+    def dispatch_on_close(response, pending):
+        if pending:
+            # WSGI/ASGI handlers call response.close() after the body is sent
+            close = response.close
+
+            def close_and_dispatch():
+                try:
+                    close()
+                finally:
+                    end_request(pending)
+
+            response.close = close_and_dispatch
+        return response
+
+
+class ServerTimingMiddleware(HybridMiddleware):
+    """
+    Opens a request-scoped timer (api.timing), adds a Server-Timing header with
+    the collected spans and logs a one-line breakdown for slow requests.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.slow_request_ms = getattr(settings, 'SLOW_REQUEST_MS', 3000)
+        self.header_enabled = getattr(settings, 'SERVER_TIMING_HEADER', True)
+        install_requests_timing()
+        # DB span'leri bağlantı başına wrapper ile: ASGI'de sorgular sync_to_async thread'lerinde çalışır
+        install_db_timing()
+
+    def handle(self, request):
+        with request_timer() as timer:
+            return self.finish(request, self.get_response(request), timer)
+
+    async def __acall__(self, request):
+        with request_timer() as timer:
+            return self.finish(request, await self.get_response(request), timer)
+
+    def finish(self, request, response, timer):
+        if self.header_enabled:
+            response['Server-Timing'] = timer.server_timing_header()
+        log_slow_request(request, response, timer, self.slow_request_ms)
+        return response
+
+
+class ProfilingMiddleware(HybridMiddleware):
+    """
+    Runs a request under a profiler when a staff user asks for it via the
+    X-Profile header or ?__profile= (see api.profiling). Requests without the
+    header/param skip straight to the view. Under ASGI cProfile only sees the
+    event loop thread; the sampling profiler covers every thread.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.enabled = getattr(settings, 'PROFILING_ENABLED', True)
+        self.profile_dir = getattr(settings, 'PROFILE_DIR', '/tmp/maksat-profiles')
+        self.interval_ms = getattr(settings, 'PROFILE_SAMPLE_INTERVAL_MS', 5)
+        self.slots = threading.BoundedSemaphore(getattr(settings, 'PROFILE_MAX_CONCURRENT', 1))
+
+    def handle(self, request):
+        mode = requested_mode(request) if self.enabled else None
+        if mode is None or not is_profiling_admin(request):
+            return self.get_response(request)
+
+        profiler = self.start_profiler(mode)
+        if profiler is None:
+            return self.mark_busy(self.get_response(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            self.stop_profiler(profiler)
+        return self.finish(request, response, profiler, mode)
+
+    async def __acall__(self, request):
+        mode = requested_mode(request) if self.enabled else None
+        # Session / token doğrulaması DB'ye gider; sadece profil istenen isteklerde
+        if mode is None or not await sync_to_async(is_profiling_admin)(request):
+            return await self.get_response(request)
+
+        profiler = self.start_profiler(mode)
+        if profiler is None:
+            return self.mark_busy(await self.get_response(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.stop_profiler(profiler)
+        return await sync_to_async(self.finish)(request, response, profiler, mode)
+
+    def start_profiler(self, mode):
+        """Slot ve profiler al; biri meşgulse None."""
+        if not self.slots.acquire(blocking=False):
+            return None
+        try:
+            profiler = create_profiler(mode, self.interval_ms)
+            profiler.start()
+        except ValueError:
+            # cProfile: aynı process'te başka bir profiler zaten aktif
+            self.slots.release()
+            return None
+        except Exception:
+            self.slots.release()
+            raise
+        return profiler
+
+    def stop_profiler(self, profiler):
+        try:
+            profiler.stop()
+        finally:
+            self.slots.release()
+
+    @staticmethod
+    def mark_busy(response):
+        response['X-Profile-Status'] = 'busy'
+        return response
+
+    def finish(self, request, response, profiler, mode):
+        if request.META.get('HTTP_X_PROFILE_OUTPUT', 'store').lower() == 'inline':
+            inline = HttpResponse(profiler.render(), content_type='text/plain; charset=utf-8')
+            inline['X-Profile-Status'] = 'inline'
+            inline['X-Profile-Original-Status'] = str(response.status_code)
+            response.close()
+            return inline
+
+        try:
+            profile_id = store_profile(profiler, request, self.profile_dir)
+        except OSError as e:
+            logger.error("❌ PROFILE - Profil yazılamadı: %s", e)
+            response['X-Profile-Status'] = 'error'
+            return response
+
+        logger.info("🔬 PROFILE - %s %s (%s) -> %s", request.method, request.path, mode, profile_id)
+        response['X-Profile-Status'] = 'stored'
+        response['X-Profile-Id'] = profile_id
+        return response
@@ -0,0 +1,54 @@
+# Generated by Django 5.0.8 on 2026-10-19 18:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_gaultmillauvenue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Event',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_key', models.CharField(max_length=32, unique=True)),
+                ('kind', models.CharField(choices=[('festival', 'Yerel Festival'), ('concert', 'Konser'), ('performing_arts', 'Sahne Sanatları')], max_length=20)),
+                ('city', models.CharField(max_length=100)),
+                ('genre', models.CharField(blank=True, default='', max_length=50)),
+                ('name', models.CharField(max_length=255)),
+                ('start_date', models.DateField(blank=True, null=True)),
+                ('end_date', models.DateField()),
+                ('event_data', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Event',
+                'verbose_name_plural': 'Events',
+                'ordering': ['start_date', 'id'],
+                'indexes': [models.Index(fields=['kind', 'city', 'genre', 'start_date'], name='api_event_kind_568489_idx'), models.Index(fields=['kind', 'city', 'genre', 'end_date'], name='api_event_kind_0fe153_idx'), models.Index(fields=['end_date'], name='api_event_end_dat_6602df_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='EventCoverage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('festival', 'Yerel Festival'), ('concert', 'Konser'), ('performing_arts', 'Sahne Sanatları')], max_length=20)),
+                ('city', models.CharField(max_length=100)),
+                ('genre', models.CharField(blank=True, default='', max_length=50)),
+                ('window_start', models.DateField()),
+                ('window_end', models.DateField()),
+                ('event_count', models.IntegerField(default=0)),
+                ('fetched_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Event Coverage',
+                'verbose_name_plural': 'Event Coverage',
+                'ordering': ['-fetched_at'],
+                'indexes': [models.Index(fields=['kind', 'city', 'genre', 'fetched_at'], name='api_eventco_kind_134d7b_idx')],
+            },
+        ),
+    ]
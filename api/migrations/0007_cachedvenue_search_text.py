@@ -0,0 +1,102 @@
+# Generated by Django 5.0.8 on 2026-10-19 18:36
+
+import re
+
+from django.db import DatabaseError, migrations, models
+
+
+# Migration'lar uygulama koduna bağlanmaz: api/venue_search.py'deki build_search_text ve indeks
+# SQL'inin bu migration anındaki dondurulmuş kopyası.
+FTS_TABLE = 'api_cachedvenue_fts'
+MIN_TOKEN_LEN = 2
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def fold(text):
+    return (text.lower().replace('\u0307', '').replace('ı', 'i').replace('ş', 's').replace('ç', 'c')
+            .replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u'))
+
+
+def tokens(text):
+    return [t for t in _TOKEN_RE.findall(fold(text or '')) if len(t) >= MIN_TOKEN_LEN]
+
+
+def build_search_text(venue, category, city, district='', neighborhood=''):
+    atmosphere = venue.get('atmosphereSummary') or {}
+    practical = venue.get('practicalInfo') or {}
+    parts = (
+        venue.get('name', ''),
+        venue.get('address', ''),
+        category, city, district or '', neighborhood or '',
+        ' '.join(tag for tag in venue.get('vibeTags') or () if isinstance(tag, str)),
+        (atmosphere.get('oneLiner') or atmosphere.get('shortDescription') or '') if isinstance(atmosphere, dict) else '',
+        (practical.get('mustTry') or '') if isinstance(practical, dict) else '',
+    )
+    return ' '.join(token for part in parts if isinstance(part, str) for token in tokens(part))
+
+
+SQLITE_INDEX_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(search_text, content='api_cachedvenue', content_rowid='id')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON api_cachedvenue BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON api_cachedvenue BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF search_text ON api_cachedvenue BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text); "
+    f"INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+)
+SQLITE_DROP_SQL = tuple(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}" for suffix in ('ai', 'ad', 'au')) + (
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+)
+POSTGRES_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS api_cachedvenue_search_gin ON api_cachedvenue "
+    "USING GIN (to_tsvector('simple', search_text))",
+)
+POSTGRES_DROP_SQL = ("DROP INDEX IF EXISTS api_cachedvenue_search_gin",)
+
+
+def backfill_search_text(apps, schema_editor):
+    CachedVenue = apps.get_model('api', 'CachedVenue')
+    batch = []
+    for venue in CachedVenue.objects.only('id', 'category', 'city', 'district', 'neighborhood', 'venue_data').iterator(chunk_size=500):
+        venue.search_text = build_search_text(venue.venue_data or {}, venue.category, venue.city, venue.district, venue.neighborhood)
+        batch.append(venue)
+        if len(batch) >= 500:
+            CachedVenue.objects.bulk_update(batch, ['search_text'])
+            batch = []
+    if batch:
+        CachedVenue.objects.bulk_update(batch, ['search_text'])
+
+
+def create_index(apps, schema_editor):
+    statements = {'sqlite': SQLITE_INDEX_SQL, 'postgresql': POSTGRES_INDEX_SQL}.get(schema_editor.connection.vendor, ())
+    try:
+        for sql in statements:
+            schema_editor.execute(sql)
+    except DatabaseError:
+        # FTS5'siz SQLite derlemesi: arama contains filtresine düşer
+        pass
+
+
+def remove_index(apps, schema_editor):
+    statements = {'sqlite': SQLITE_DROP_SQL, 'postgresql': POSTGRES_DROP_SQL}.get(schema_editor.connection.vendor, ())
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_event'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachedvenue',
+            name='search_text',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_index, remove_index),
+    ]
@@ -0,0 +1,145 @@
+# Generated by Django 5.0.8 on 2026-10-19 18:48
+
+import re
+
+from django.db import DatabaseError, migrations, models
+
+
+# Migration'lar uygulama koduna bağlanmaz: api/venue_flags.py'deki compute_flags ve
+# api/venue_search.py'deki FTS5 indeks SQL'inin bu migration anındaki dondurulmuş kopyası.
+REVIEW_SAMPLE = 5
+ROMANTIC_CATEGORIES = frozenset({'İlk Buluşma', 'Özel Gün', 'Fine Dining', 'Romantik Akşam'})
+BAR_CATEGORY = 'İş Çıkışı Bira & Kokteyl'
+ENRICHMENT_EXEMPT_CATEGORIES = frozenset({'Piknik'})
+FLAG_FIELDS = ('is_closed', 'is_chain', 'is_non_bar', 'missing_enrichment')
+
+CLOSED_REVIEW_KEYWORDS = (
+    'kalıcı olarak kapan', 'kalıcı olarak kapatıl', 'artık kapalı',
+    'kapandı', 'kapanmış', 'kapatıldı', 'kapatılmış',
+    'permanently closed', 'closed permanently',
+    'yeni işletme', 'isim değişti', 'yerine açıldı', 'burası artık',
+)
+CHAIN_STORE_BLACKLIST = (
+    # Kahve zincirleri
+    'starbucks', 'gloria jeans', 'caribou', 'coffee bean', 'espresso lab',
+    # Fast food
+    'mcdonalds', 'burger king', 'wendys', 'kfc', 'popeyes', 'dominos', 'pizza hut',
+    'little caesars', 'papa johns', 'sbarro', 'arbys', 'taco bell', 'subway',
+    # Türk zincirleri - kafe
+    'mado', 'the house cafe', 'house cafe', 'big chefs', 'bigchefs', 'midpoint',
+    'baylan', 'divan', 'kahve dunyasi', 'kahve dünyası', 'nero', 'costa coffee',
+    # Türk zincirleri - fast food/restoran
+    'simit sarayi', 'simit sarayı', 'tavuk dunyasi', 'tavuk dünyası', 'usta donerci',
+    'komagene', 'baydoner', 'bay döner', 'burger lab', 'zuma', 'etiler', 'nusr-et',
+    # Pastane/tatlıcı zincirleri
+    'dunkin', 'krispy kreme', 'cinnabon', 'hafiz mustafa', 'hafız mustafa',
+    'incir', 'saray muhallebicisi', 'pelit', 'faruk gulluoglu', 'faruk güllüoğlu',
+    # Diğer zincirler
+    'wok to walk', 'wagamama', 'nandos', 'tgi fridays', 'chilis', 'applebees',
+    'hard rock cafe', 'planet hollywood', 'rainforest cafe', 'cheesecake factory',
+    'petra roasting', 'walter\'s coffee',
+)
+
+BAR_NAME_KEYWORDS = ('pub', 'bar', 'beer', 'bira', 'ale', 'cocktail', 'kokteyl', 'blues', 'rock', 'jazz', 'lounge')
+NON_BAR_NAME_KEYWORDS = ('meyhane', 'meze', 'fasil', 'türkü', 'turku', 'ocakbasi', 'kebap', 'köfte', 'kofte',
+                         'lokanta', 'restoran', 'balık', 'balik', 'cafe', 'kahve', '%100', 'more', 'konak pier')
+
+
+def normalize_tr(text):
+    return (text.lower().replace('\u0307', '').replace('ı', 'i').replace('ş', 's').replace('ç', 'c')
+            .replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u'))
+
+
+def _pattern(words):
+    normalized = sorted({normalize_tr(w) for w in words}, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, normalized)))
+
+
+_CLOSED_RE = _pattern(CLOSED_REVIEW_KEYWORDS)
+_CHAIN_RE = _pattern(CHAIN_STORE_BLACKLIST)
+_BAR_RE = _pattern(BAR_NAME_KEYWORDS)
+_NON_BAR_RE = _pattern(NON_BAR_NAME_KEYWORDS)
+
+
+def compute_flags(venue, category):
+    name_norm = normalize_tr(venue.get('name') or '')
+    reviews = venue.get('googleReviews') or ()
+    return {
+        'is_closed': any(_CLOSED_RE.search(normalize_tr((r or {}).get('text') or '')) for r in reviews[:REVIEW_SAMPLE]),
+        'is_chain': category in ROMANTIC_CATEGORIES and _CHAIN_RE.search(name_norm) is not None,
+        'is_non_bar': category == BAR_CATEGORY and _NON_BAR_RE.search(name_norm) is not None and _BAR_RE.search(name_norm) is None,
+        'missing_enrichment': category not in ENRICHMENT_EXEMPT_CATEGORIES and not (
+            venue.get('practicalInfo') and venue.get('atmosphereSummary')),
+    }
+
+
+FTS_TABLE = 'api_cachedvenue_fts'
+SQLITE_INDEX_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(search_text, content='api_cachedvenue', content_rowid='id')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON api_cachedvenue BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON api_cachedvenue BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF search_text ON api_cachedvenue BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text); "
+    f"INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+)
+
+
+def backfill_flags(apps, schema_editor):
+    CachedVenue = apps.get_model('api', 'CachedVenue')
+    batch = []
+    for venue in CachedVenue.objects.only('id', 'category', 'venue_data').iterator(chunk_size=500):
+        for field, value in compute_flags(venue.venue_data or {}, venue.category).items():
+            setattr(venue, field, value)
+        batch.append(venue)
+        if len(batch) >= 500:
+            CachedVenue.objects.bulk_update(batch, FLAG_FIELDS)
+            batch = []
+    if batch:
+        CachedVenue.objects.bulk_update(batch, FLAG_FIELDS)
+
+
+def reinstall_search_index(apps, schema_editor):
+    # SQLite AddField tabloyu yeniden kurar; FTS trigger'ları (0007) düşer
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    try:
+        for sql in SQLITE_INDEX_SQL:
+            schema_editor.execute(sql)
+    except DatabaseError:
+        # FTS5'siz SQLite derlemesi: arama contains filtresine düşer
+        pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_cachedvenue_search_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachedvenue',
+            name='is_chain',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AddField(
+            model_name='cachedvenue',
+            name='is_closed',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AddField(
+            model_name='cachedvenue',
+            name='is_non_bar',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AddField(
+            model_name='cachedvenue',
+            name='missing_enrichment',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.RunPython(backfill_flags, migrations.RunPython.noop),
+        migrations.RunPython(reinstall_search_index, migrations.RunPython.noop),
+    ]
@@ -65,6 +65,16 @@ class CachedVenue(models.Model):
     # Tüm venue verisi JSON olarak
     venue_data = models.JSONField()  # Gemini'den gelen tüm venue objesi
 
+    # Full-text arama metni (venue_search.build_search_text) - SQLite FTS5 / Postgres GIN ile indekslenir
+    search_text = models.TextField(blank=True, default='')
+
+    # Cache yazımında bir kez hesaplanan geçersizlik bayrakları (venue_flags.compute_flags)
+    # cache_clear_invalid bunlarla toplu silme yapar, SWR okuması WHERE ile eler
+    is_closed = models.BooleanField(default=False, db_index=True)  # Yorumlarda kalıcı kapanma ifadesi
+    is_chain = models.BooleanField(default=False, db_index=True)  # Romantik kategoride zincir mekan
+    is_non_bar = models.BooleanField(default=False, db_index=True)  # Bira & Kokteyl kategorisinde bar olmayan mekan
+    missing_enrichment = models.BooleanField(default=False, db_index=True)  # practicalInfo / atmosphereSummary eksik
+
     # Google Places verileri (ayrı tutuyoruz çünkü güncellenebilir)
     google_rating = models.FloatField(null=True, blank=True)
     google_review_count = models.IntegerField(null=True, blank=True)
@@ -165,3 +175,64 @@ class GaultMillauVenue(models.Model):
         if self.categories and len(self.categories) > 0:
             return self.categories[0]
         return "Fine Dining"
+
+
+class Event(models.Model):
+    """
+    Google Search grounding ile bulunan etkinlikler (festival, konser, sahne sanatları).
+    Şehir / tür / tarih penceresi başına saklanır; bitiş tarihi geçince silinir (api/event_store.py).
+    """
+    KIND_CHOICES = [
+        ('festival', 'Yerel Festival'),
+        ('concert', 'Konser'),
+        ('performing_arts', 'Sahne Sanatları'),
+    ]
+
+    event_key = models.CharField(max_length=32, unique=True)  # kind:city:genre:isim:başlangıç hash'i (upsert)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    city = models.CharField(max_length=100)
+    genre = models.CharField(max_length=50, blank=True, default='')  # musicGenre / performanceGenre filtresi ('' = Any)
+    name = models.CharField(max_length=255)
+
+    start_date = models.DateField(null=True, blank=True)
+    end_date = models.DateField()  # Tek günlük etkinliklerde start_date; tarihsizlerde bulunduğu gün
+
+    event_data = models.JSONField()  # Response'taki etkinlik objesi
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['start_date', 'id']
+        verbose_name = 'Event'
+        verbose_name_plural = 'Events'
+        indexes = [
+            models.Index(fields=['kind', 'city', 'genre', 'start_date']),
+            models.Index(fields=['kind', 'city', 'genre', 'end_date']),
+            models.Index(fields=['end_date']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.kind} - {self.city} - {self.start_date})"
+
+
+class EventCoverage(models.Model):
+    """Bir şehir / tür için grounded aramanın kapsadığı tarih penceresi (ne zaman yenilendi)."""
+    kind = models.CharField(max_length=20, choices=Event.KIND_CHOICES)
+    city = models.CharField(max_length=100)
+    genre = models.CharField(max_length=50, blank=True, default='')
+    window_start = models.DateField()
+    window_end = models.DateField()
+    event_count = models.IntegerField(default=0)
+    fetched_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-fetched_at']
+        verbose_name = 'Event Coverage'
+        verbose_name_plural = 'Event Coverage'
+        indexes = [
+            models.Index(fields=['kind', 'city', 'genre', 'fetched_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.city} {self.genre or 'Any'}: {self.window_start} → {self.window_end}"
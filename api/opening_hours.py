@@ -0,0 +1,228 @@
+"""
+Açılış Saatleri: Ingest'te Aralıklar, Servis Anında "Şu An Açık"
+
+Cache'teki venue'lar isOpenNow'ı çekildikleri andan taşıyordu; 24-96 saatlik SWR penceresinin
+çoğunda yanlıştı ve düzeltmenin tek yolu yeniden çekmekti. Artık:
+
+1. Ingest (VenueCandidate.to_venue, save_venues_to_cache_swr): Places opening_hours.periods ya
+   da weeklyHours (weekday_text) bir kez parse edilip venue['openIntervals'] olarak saklanır:
+   haftanın dakikası cinsinden sıralı [başlangıç, bitiş] çiftleri (Pazartesi 00:00 = 0,
+   WEEK_MINUTES = 10080). Gece yarısını geçen aralıklar ertesi güne taşar, Pazar → Pazartesi
+   bölünür. Saat bilgisi yoksa None.
+2. Servis (get_venues_with_swr): isOpenNow ve openUntil ("HH:MM") SERVE_TIMEZONE'da o anki
+   zamana göre hesaplanır (bisect, mekan başına O(log n)).
+3. filter_open_now: "şu an açık" filtresi; an bir kez hesaplanır, tüm adaylara toplu uygulanır.
+4. public_venue: openIntervals response'lardan (generate_venues, more-like-this, shortlink) çıkarılır.
+
+Kullanım:
+    venue['openIntervals'] = intervals_from_opening_hours(place.get('opening_hours'))
+    apply_open_status(venues)                   # isOpenNow / openUntil günceller
+    venues = filter_open_now(venues)
+    return Response([public_venue(v) for v in venues])
+"""
+
+import bisect
+import re
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+from .venue_categories import normalize_tr
+
+
+# ===== CONFIGURATION =====
+SERVE_TIMEZONE = ZoneInfo('Europe/Istanbul')
+DAY_MINUTES = 24 * 60
+WEEK_MINUTES = 7 * DAY_MINUTES
+
+# weekday_text gün adları (Türkçe normalize + İngilizce) → Pazartesi=0
+DAY_INDEX = {
+    'pazartesi': 0, 'sali': 1, 'carsamba': 2, 'persembe': 3, 'cuma': 4, 'cumartesi': 5, 'pazar': 6,
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3, 'friday': 4, 'saturday': 5, 'sunday': 6,
+}
+CLOSED_WORDS = ('kapali', 'closed')
+ALWAYS_OPEN_WORDS = ('24 saat', '24 hours')
+
+Interval = List[int]     # [başlangıç, bitiş) - haftanın dakikası (JSON'da liste olarak saklanır)
+
+_TIME_RE = re.compile(r'(\d{1,2})(?:[:.](\d{2}))?\s*(am|pm|oo|os)?')
+_RANGE_SPLIT_RE = re.compile(r'\s*[–—-]\s*')
+
+
+class OpenStatus(NamedTuple):
+    is_open: bool
+    open_until: Optional[str]       # "HH:MM"; 7/24 açık ya da kapalıysa None
+
+
+def _merge(intervals: List[Interval]) -> List[Interval]:
+    """Haftaya sığdır (Pazar → Pazartesi taşmasını böl), sırala, çakışanları birleştir."""
+    split: List[Interval] = []
+    for start, end in intervals:
+        if end > WEEK_MINUTES:
+            split.append([start, WEEK_MINUTES])
+            split.append([0, end - WEEK_MINUTES])
+        else:
+            split.append([start, end])
+    merged: List[Interval] = []
+    for start, end in sorted(split):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _span(day: int, open_minute: int, close_minute: int) -> Interval:
+    start = day * DAY_MINUTES + open_minute
+    # Kapanış açılıştan önce / eşitse ertesi güne taşar (18:00–02:00)
+    end = day * DAY_MINUTES + close_minute + (DAY_MINUTES if close_minute <= open_minute else 0)
+    return [start, end]
+
+
+def intervals_from_periods(periods: Sequence[dict]) -> Optional[List[Interval]]:
+    """Places opening_hours.periods (day: 0=Pazar, time: "HHMM") → aralıklar."""
+    intervals = []
+    for period in periods or ():
+        opening = period.get('open') or {}
+        closing = period.get('close')
+        if 'day' not in opening:
+            continue
+        day = (opening['day'] + 6) % 7
+        open_time = str(opening.get('time', '0000'))
+        open_minute = int(open_time[:2]) * 60 + int(open_time[2:4])
+        if closing is None:
+            return [[0, WEEK_MINUTES]]    # Places: close'suz tek period = 7/24 açık
+        close_day = (closing.get('day', opening['day']) + 6) % 7
+        close_time = str(closing.get('time', '0000'))
+        end = close_day * DAY_MINUTES + int(close_time[:2]) * 60 + int(close_time[2:4])
+        start = day * DAY_MINUTES + open_minute
+        if end <= start:
+            end += WEEK_MINUTES
+        intervals.append([start, end])
+    return _merge(intervals) if intervals else None
+
+
+def _parse_time(text: str, suffix_hint: str = '') -> Optional[tuple]:
+    match = _TIME_RE.search(text)
+    if not match:
+        return None
+    hour, minute = int(match.group(1)), int(match.group(2) or 0)
+    return hour, minute, match.group(3) or suffix_hint
+
+
+def _to_minute(hour: int, minute: int, suffix: str) -> int:
+    if suffix in ('pm', 'os') and hour < 12:
+        hour += 12
+    elif suffix in ('am', 'oo') and hour == 12:
+        hour = 0
+    return (hour % 24) * 60 + minute
+
+
+def intervals_from_weekday_text(lines: Sequence[str]) -> Optional[List[Interval]]:
+    """
+    weekday_text ("Pazartesi: 10:00–23:00", "Cuma: 12:00–15:00, 18:00–02:00", "Pazar: Kapalı",
+    "Monday: 9:00 AM – 5:00 PM", "Open 24 hours") → aralıklar. Hiçbir gün parse edilemezse None.
+    """
+    intervals: List[Interval] = []
+    parsed_days = 0
+    for line in lines or ():
+        if not isinstance(line, str) or ':' not in line:
+            continue
+        day_name, body = line.split(':', 1)
+        day = DAY_INDEX.get(normalize_tr(day_name.strip()))
+        if day is None:
+            continue
+        # Google çıktısındaki dar / bölünmez boşluklar ve Türkçe ÖÖ / ÖS
+        body = normalize_tr(re.sub(r'[\u00a0\u202f\u2009]', ' ', body))
+        parsed_days += 1
+        if any(word in body for word in CLOSED_WORDS):
+            continue
+        if any(word in body for word in ALWAYS_OPEN_WORDS):
+            intervals.append([day * DAY_MINUTES, (day + 1) * DAY_MINUTES])
+            continue
+        for time_range in body.split(','):
+            parts = _RANGE_SPLIT_RE.split(time_range.strip(), maxsplit=1)
+            if len(parts) != 2:
+                continue
+            close = _parse_time(parts[1])
+            open_ = _parse_time(parts[0], suffix_hint=close[2] if close else '')
+            if not open_ or not close:
+                continue
+            open_minute = _to_minute(*open_)
+            # "9:00 – 11:00 PM": başlangıç kapanışın son ekini alır; kapanıştan sonraya düşerse sabahtır
+            if close[2] and not _TIME_RE.search(parts[0]).group(3) and open_minute > _to_minute(*close):
+                open_minute = _to_minute(open_[0], open_[1], 'am')
+            intervals.append(_span(day, open_minute, _to_minute(*close)))
+    if not parsed_days:
+        return None
+    return _merge(intervals)
+
+
+def intervals_from_opening_hours(opening_hours: Optional[dict]) -> Optional[List[Interval]]:
+    """Places opening_hours: periods varsa onlar (kesin), yoksa weekday_text."""
+    opening_hours = opening_hours or {}
+    return (intervals_from_periods(opening_hours.get('periods'))
+            or intervals_from_weekday_text(opening_hours.get('weekday_text')))
+
+
+def venue_intervals(venue: dict) -> Optional[List[Interval]]:
+    """Ingest'te saklanan aralıklar; eski cache kayıtlarında weeklyHours'tan parse edilir."""
+    if 'openIntervals' in venue:
+        return venue['openIntervals']
+    return intervals_from_weekday_text(venue.get('weeklyHours'))
+
+
+def week_minute(now: Optional[datetime] = None) -> int:
+    local = (now or datetime.now(SERVE_TIMEZONE)).astimezone(SERVE_TIMEZONE)
+    return local.weekday() * DAY_MINUTES + local.hour * 60 + local.minute
+
+
+def open_status(intervals: Sequence[Interval], minute: int) -> OpenStatus:
+    position = bisect.bisect_right(intervals, [minute, WEEK_MINUTES + 1]) - 1
+    if position < 0 or minute >= intervals[position][1]:
+        return OpenStatus(False, None)
+    end = intervals[position][1]
+    if end == WEEK_MINUTES and intervals[0][0] == 0:
+        if intervals[0][1] == WEEK_MINUTES:
+            return OpenStatus(True, None)    # 7/24
+        end = intervals[0][1]                # Pazar gecesinden Pazartesi'ye taşan aralık
+    end %= DAY_MINUTES
+    return OpenStatus(True, f"{end // 60:02d}:{end % 60:02d}")
+
+
+def apply_open_status(venues: List[dict], now: Optional[datetime] = None) -> List[dict]:
+    """isOpenNow / openUntil'i şu ana göre yaz; saat bilgisi olmayan venue'lara dokunmaz."""
+    minute = week_minute(now)
+    for venue in venues:
+        intervals = venue_intervals(venue)
+        if intervals is None:
+            continue
+        status = open_status(intervals, minute)
+        venue['isOpenNow'] = status.is_open
+        venue['openUntil'] = status.open_until
+    return venues
+
+
+def filter_open_now(venues: Sequence[dict], now: Optional[datetime] = None) -> List[dict]:
+    """Şu an açık olanlar (saat bilgisi yoksa saklanan isOpenNow'a bakılır)."""
+    minute = week_minute(now)
+    kept = []
+    for venue in venues:
+        intervals = venue_intervals(venue)
+        if intervals is None:
+            if venue.get('isOpenNow'):
+                kept.append(venue)
+            continue
+        status = open_status(intervals, minute)
+        if status.is_open:
+            venue['isOpenNow'] = True
+            venue['openUntil'] = status.open_until
+            kept.append(venue)
+    return kept
+
+
+def public_venue(venue):
+    """Response'a giden kopya: openIntervals sadece sunucu içi (cache / filtre), istemciye gitmez."""
+    if isinstance(venue, dict) and 'openIntervals' in venue:
+        return {key: value for key, value in venue.items() if key != 'openIntervals'}
+    return venue
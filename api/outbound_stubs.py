@@ -0,0 +1,633 @@
+"""
+Outbound Record / Replay Stubs
+
+Canlı API key'leri olmadan generate_venues ve diğer endpoint'leri benchmark etmek
+için transport seviyesinde bir stand-in katmanı. Şunları yakalar:
+
+- requests.Session.send     → Places (nearby/text/details), Geocode, CSE, Instagram
+                              (googlemaps client ve modül seviyesindeki requests.get dahil)
+- httpx Client/AsyncClient  → async view'lardaki Places çağrıları
+- google.generativeai       → GenerativeModel.generate_content(_async)
+- google.genai              → Models.generate_content (Google Search grounding'li çağrılar)
+
+Modlar:
+- replay → kayıtlı fixture varsa onu, yoksa deterministik sentetik yanıt döner;
+           ağa hiçbir istek çıkmaz
+- record → gerçek çağrıyı yapar ve yanıtı fixture olarak kaydeder (canlı key gerekir)
+
+Her servis için yapay gecikme eklenebilir (ör. "places=250,gemini=2500,default=50"),
+böylece benchmark'lar production'daki I/O profiline yakın ölçülür. Çağrı sayıları
+servis bazında tutulur (stats()).
+
+Sunucu sürecinde açmak için: OUTBOUND_STUBS=replay (bkz. settings / ApiConfig.ready).
+Bu modda google SDK'ları app yüklenirken import edilir; production'da kapalıdır.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from .timing import classify_url
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'outbound')
+STUB_API_KEY = 'AIzaStub-local-benchmark-key-000000000'   # googlemaps 'AIza' önekini şart koşar
+RESULTS_PER_PAGE = 20
+MAX_PAGES = 3
+LATENCY_JITTER = 0.2                # Gecikmeye ±%20 rastgele sapma
+_IGNORED_PARAMS = {'key', 'cx'}     # Fixture anahtarına girmeyen parametreler
+
+_NAME_PREFIXES = ('Köşe', 'Eski', 'Yeni', 'Mavi', 'Bahçe', 'Liman', 'Çınar', 'Ada', 'Kule', 'Han')
+_NAME_SUFFIXES = ('Lokanta', 'Kafe', 'Bar', 'Meyhane', 'Bistro', 'Mutfak', 'Sofrası', 'Evi', 'Durağı', 'Köşkü')
+_REVIEW_TEXTS = (
+    'Harika bir yer, servis çok hızlıydı.',
+    'Yemekler lezzetli, fiyatlar makul.',
+    'Atmosfer çok güzel, tekrar geleceğiz.',
+    'Kalabalık ama beklemeye değer.',
+    'Personel ilgili, mekan temiz.',
+)
+
+
+def parse_latency_spec(spec: Optional[str]) -> Dict[str, float]:
+    """'places=250,gemini=2500,default=50' → {'places': 250.0, ...} (ms)."""
+    latency: Dict[str, float] = {}
+    for part in (spec or '').split(','):
+        if '=' not in part:
+            continue
+        name, value = part.split('=', 1)
+        latency[name.strip()] = float(value)
+    return latency
+
+
+def _seed(*parts) -> int:
+    return int(hashlib.sha1('|'.join(str(p) for p in parts).encode('utf-8')).hexdigest()[:12], 16)
+
+
+def _normalize_prompt(prompt: str) -> str:
+    # Tarih, rating gibi sayılar her gün değişir; fixture anahtarı bunlardan bağımsız olsun
+    return re.sub(r'\d+', '#', prompt)
+
+
+class _GeminiText:
+    """generate_content yanıtının kullanılan kısmı (.text)."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.candidates = []
+
+
+# ===== SENTETİK YANITLAR =====
+
+class SyntheticResponses:
+    """Fixture bulunmadığında kullanılan deterministik, gerçekçi boyutlu yanıtlar."""
+
+    def http(self, service: str, url: str, params: dict) -> Tuple[int, object]:
+        if service == 'geocode':
+            return 200, self.geocode(params.get('address', ''))
+        if service in ('places.nearbysearch', 'places.textsearch'):
+            return 200, self.search(service, params)
+        if service == 'places.details':
+            return 200, self.details(params.get('place_id', ''))
+        if service == 'places.findplacefromtext':
+            places = self.search(service, {'query': params.get('input', '')})['results'][:1]
+            return 200, {'status': 'OK', 'candidates': places}
+        if service == 'places.v1':
+            return 200, {'places': []}
+        if service.startswith('places.'):
+            return 200, {'status': 'OK', 'results': []}
+        if service == 'cse':
+            return 200, self.cse(params.get('q', ''))
+        return 200, '<html><head><title>stub</title></head><body></body></html>'
+
+    def geocode(self, address: str) -> dict:
+        rnd = random.Random(_seed('geocode', address))
+        lat, lng = 36.5 + rnd.random() * 5.5, 26.5 + rnd.random() * 17.5
+        locality = address.split(',')[-2].strip() if address.count(',') >= 1 else address
+        return {
+            'status': 'OK',
+            'results': [{
+                'formatted_address': f"{address}",
+                'geometry': {
+                    'location': {'lat': lat, 'lng': lng},
+                    'location_type': 'APPROXIMATE',
+                    # İlçe ölçeğinde viewport (~5-6 km); api/geo.py alan poligonu olarak kullanır
+                    'viewport': {
+                        'northeast': {'lat': lat + 0.025, 'lng': lng + 0.03},
+                        'southwest': {'lat': lat - 0.025, 'lng': lng - 0.03},
+                    },
+                },
+                'address_components': [{'long_name': locality, 'short_name': locality, 'types': ['locality', 'political']}],
+                'place_id': f"stub_geo_{_seed(address):x}",
+                'types': ['locality', 'political'],
+            }],
+        }
+
+    def _place(self, seed: int, index: int, keyword: str, place_type: str, lat: float, lng: float,
+               spread: float = 0.02) -> dict:
+        rnd = random.Random(seed + index)
+        name = f"{rnd.choice(_NAME_PREFIXES)} {keyword.title() if keyword else rnd.choice(_NAME_SUFFIXES)} {rnd.choice(_NAME_SUFFIXES)} {index + 1}"
+        types = [place_type, 'food', 'point_of_interest', 'establishment'] if place_type else ['restaurant', 'food', 'point_of_interest', 'establishment']
+        return {
+            'place_id': f"stub_{seed:x}_{index}",
+            'name': name,
+            'rating': round(3.8 + rnd.random() * 1.1, 1),
+            'user_ratings_total': rnd.randint(20, 3000),
+            'price_level': rnd.randint(1, 4),
+            'types': types,
+            'vicinity': f"Stub Sk. No:{rnd.randint(1, 120)}",
+            'formatted_address': f"Stub Sk. No:{rnd.randint(1, 120)}, Türkiye",
+            'business_status': 'OPERATIONAL',
+            'geometry': {'location': {'lat': lat + rnd.uniform(-spread, spread), 'lng': lng + rnd.uniform(-spread, spread)}},
+            'opening_hours': {'open_now': rnd.random() > 0.3},
+            'photos': [{'photo_reference': f"stubphoto{seed:x}{index}", 'width': 800, 'height': 600, 'html_attributions': []}],
+            'plus_code': {'compound_code': 'STUB+00 Türkiye'},
+        }
+
+    def search(self, service: str, params: dict) -> dict:
+        token = params.get('pagetoken')
+        lat, lng = 41.0, 29.0
+        if token:
+            # Sonraki sayfalar ilk sorgunun konumunu ve yarıçapını token'da taşır
+            _, seed_hex, page, location, radius = token.split(':')
+            seed, page = int(seed_hex, 16), int(page)
+            params = {'location': location, 'radius': radius} if location else {}
+        else:
+            seed, page = _seed(service, sorted(params.items())), 0
+        keyword = params.get('keyword') or params.get('query') or ''
+        if params.get('location'):
+            try:
+                lat, lng = (float(v) for v in params['location'].split(','))
+            except ValueError:
+                pass
+        # Sonuçlar arama yarıçapı kadar (derece cinsinden) dağılır; bir kısmı alan dışına düşer
+        spread = float(params['radius']) / 111_000 if params.get('radius') else 0.02
+        start = page * RESULTS_PER_PAGE
+        results = [
+            self._place(seed, start + i, keyword.split(' in ')[0][:20], params.get('type', ''), lat, lng, spread)
+            for i in range(RESULTS_PER_PAGE)
+        ]
+        data = {'status': 'OK', 'results': results, 'html_attributions': []}
+        if page + 1 < MAX_PAGES:
+            data['next_page_token'] = f"stub:{seed:x}:{page + 1}:{params.get('location', '')}:{params.get('radius', '')}"
+        return data
+
+    def details(self, place_id: str) -> dict:
+        seed = _seed('details', place_id)
+        rnd = random.Random(seed)
+        now = int(time.time())
+        place = self._place(seed, 0, '', 'restaurant', 41.0, 29.0)
+        place['place_id'] = place_id
+        place.update({
+            'formatted_phone_number': f"0212 {rnd.randint(100, 999)} {rnd.randint(10, 99)} {rnd.randint(10, 99)}",
+            'international_phone_number': '+90 212 000 00 00',
+            'website': f"https://example.com/{place_id}",
+            'url': f"https://maps.google.com/?cid={seed}",
+            'editorial_summary': {'overview': 'Semtin sevilen mekanlarından biri.'},
+            'reviews': [
+                {
+                    'author_name': f"Misafir {i + 1}",
+                    'rating': rnd.randint(3, 5),
+                    'text': rnd.choice(_REVIEW_TEXTS) * rnd.randint(1, 4),
+                    'time': now - rnd.randint(1, 60) * 86400,
+                    'relative_time_description': 'bir ay önce',
+                    'language': 'tr',
+                }
+                for i in range(5)
+            ],
+            'opening_hours': {
+                'open_now': True,
+                'periods': [{'open': {'day': d, 'time': '1000'}, 'close': {'day': d, 'time': '2300'}} for d in range(7)],
+                'weekday_text': [f"{day}: 10:00–23:00" for day in ('Pazartesi', 'Salı', 'Çarşamba', 'Perşembe', 'Cuma', 'Cumartesi', 'Pazar')],
+            },
+            'serves_beer': rnd.random() > 0.5,
+            'serves_wine': rnd.random() > 0.5,
+            'serves_breakfast': rnd.random() > 0.5,
+            'reservable': rnd.random() > 0.5,
+            'outdoor_seating': rnd.random() > 0.5,
+        })
+        return {'status': 'OK', 'result': place, 'html_attributions': []}
+
+    def cse(self, query: str) -> dict:
+        rnd = random.Random(_seed('cse', query))
+        slug = re.sub(r'[^a-z0-9]+', '', query.lower())[:20] or 'stub'
+        return {
+            'items': [
+                {
+                    'link': f"https://www.instagram.com/{slug}{'' if i == 0 else i}/",
+                    'title': f"{slug} (@{slug}) • Instagram photos and videos",
+                    'snippet': f"{rnd.randint(1, 50)}K Followers, {rnd.randint(100, 900)} Following",
+                }
+                for i in range(3)
+            ],
+        }
+
+    def gemini(self, prompt: str) -> str:
+        """Prompt'taki numaralı mekan listesinden (varsa) JSON array üretir."""
+        if 'tatil rotası' in prompt:
+            return self.itinerary(prompt)
+        if "vibe'ını analiz et" in prompt:
+            return self.vibes(prompt)
+        names = re.findall(r'^\s*\d+[.)]\s+([^|\n]+?)(?:\s+\||\s+-\s|\n|$)', prompt, re.MULTILINE)
+        start = (date.today() + timedelta(days=7)).isoformat()
+        end = (date.today() + timedelta(days=9)).isoformat()
+        if not names:
+            names = [f"Stub Etkinlik {i + 1}" for i in range(6)]
+        items = [
+            {
+                'name': name.strip(),
+                'title': name.strip(),
+                'description': f"{name.strip()} için kısa açıklama.",
+                'atmosphereSummary': 'Sakin, samimi ve keyifli bir ortam.',
+                'vibeTags': ['#Samimi', '#Keyifli'],
+                'practicalInfo': 'Hafta sonu rezervasyon önerilir.',
+                'instagramUsername': None,
+                'location': 'Merkez',
+                'venue': 'Stub Sahne',
+                'address': 'Stub Sk. No:1',
+                'startDate': start,
+                'endDate': end,
+                'date': start,
+                'time': '20:00',
+                'price': '250 TL',
+                'ticketUrl': 'https://example.com/bilet',
+                'category': 'Etkinlik',
+                'duration': '2 saat',
+                'bestTime': 'Akşam',
+            }
+            for name in names
+        ]
+        return json.dumps(items, ensure_ascii=False)
+
+    def vibes(self, prompt: str) -> str:
+        """Vibe batch prompt'u: numaralı her mekan için deterministik skorlar."""
+        indexes = [int(i) for i in re.findall(r'^(\d+)\. ', prompt, re.MULTILINE)]
+        keys = ('romantic', 'casual', 'professional', 'social', 'quiet', 'energetic')
+        return json.dumps([
+            {'index': i, **{key: _seed(prompt, i, key) % 11 for key in keys}}
+            for i in indexes
+        ])
+
+    def itinerary(self, prompt: str) -> str:
+        """Tatil rotası prompt'u: istenen gün aralığı için gün başına 6 aktivite."""
+        scope = re.search(r'SADECE (\d+)-(\d+)\. günlerini', prompt)
+        if scope:
+            first, last = int(scope.group(1)), int(scope.group(2))
+        else:
+            first, last = 1, int(re.search(r'(\d+) günlük', prompt).group(1))
+        slots = ('breakfast', 'sightseeing', 'lunch', 'activity', 'dinner', 'activity')
+        items = [
+            {
+                'id': f"day{day}_{slot + 1}",
+                'name': f"Stub Aktivite {day}.{slot + 1}",
+                'description': 'Kısa açıklama.',
+                'category': 'Tatil',
+                'vibeTags': ['#Gezi', '#Keşif', '#Lezzet'],
+                'address': 'Stub Sk. No:1',
+                'priceRange': '$$',
+                'googleRating': 4.5,
+                'itineraryDay': day,
+                'timeSlot': f"{8 + slot * 2:02d}:30-{9 + slot * 2:02d}:30",
+                'activityType': activity,
+            }
+            for day in range(first, last + 1)
+            for slot, activity in enumerate(slots)
+        ]
+        return json.dumps(items, ensure_ascii=False)
+
+
+# ===== STUB KATMANI =====
+
+class OutboundStubs:
+    """requests / httpx / Gemini çağrılarını kayıtlı veya sentetik yanıtlarla karşılar."""
+
+    def __init__(self, mode: str = 'replay', fixtures_dir: str = DEFAULT_FIXTURES_DIR,
+                 latency_ms: Optional[Dict[str, float]] = None, synthetic: bool = True):
+        if mode not in ('replay', 'record'):
+            raise ValueError(f"Geçersiz stub modu: {mode}")
+        self.mode = mode
+        self.fixtures_dir = fixtures_dir
+        self.latency_ms = latency_ms or {}
+        self.synthetic = synthetic
+        self.generator = SyntheticResponses()
+        self._calls: Counter = Counter()
+        self._sources: Counter = Counter()     # fixture / synthetic / live / missing
+        self._lock = threading.Lock()
+        self._fixtures: Dict[str, Optional[dict]] = {}
+        self._originals = []
+
+    # --- metrikler ---
+
+    def _count(self, service: str, source: str):
+        with self._lock:
+            self._calls[service] += 1
+            self._sources[source] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'calls': dict(self._calls), 'sources': dict(self._sources)}
+
+    def reset_stats(self):
+        with self._lock:
+            self._calls.clear()
+            self._sources.clear()
+
+    # --- gecikme ---
+
+    def delay_for(self, service: str) -> float:
+        ms = self.latency_ms.get(service)
+        if ms is None:
+            ms = self.latency_ms.get(service.split('.', 1)[0], self.latency_ms.get('default', 0))
+        if not ms:
+            return 0.0
+        return ms * random.uniform(1 - LATENCY_JITTER, 1 + LATENCY_JITTER) / 1000
+
+    # --- fixture'lar ---
+
+    def fixture_key(self, service: str, *parts) -> str:
+        return hashlib.sha1(json.dumps([service, *parts], sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def _fixture_path(self, service: str, key: str) -> str:
+        return os.path.join(self.fixtures_dir, service, f"{key}.json")
+
+    def load_fixture(self, service: str, key: str) -> Optional[dict]:
+        if key not in self._fixtures:
+            path = self._fixture_path(service, key)
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self._fixtures[key] = json.load(f)
+            except FileNotFoundError:
+                self._fixtures[key] = None
+        return self._fixtures[key]
+
+    def save_fixture(self, service: str, key: str, payload: dict):
+        path = self._fixture_path(service, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, indent=1)
+        self._fixtures[key] = payload
+
+    # --- HTTP ---
+
+    def _http_key(self, service: str, method: str, url: str, body) -> Tuple[str, dict]:
+        parts = urlsplit(url)
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        keyed = {k: v for k, v in params.items() if k not in _IGNORED_PARAMS}
+        if isinstance(body, bytes):
+            body = body.decode('utf-8', 'replace')
+        return self.fixture_key(service, method, parts.netloc + parts.path, keyed, body or ''), params
+
+    def replay_http(self, method: str, url: str, body=None) -> Tuple[str, int, str, bytes]:
+        """(service, status, content_type, body) döndürür; gecikmeyi çağıran uygular."""
+        service = classify_url(url)
+        key, params = self._http_key(service, method, url, body)
+        fixture = self.load_fixture(service, key)
+        if fixture is not None:
+            self._count(service, 'fixture')
+            return service, fixture['status'], fixture['content_type'], fixture['body'].encode('utf-8')
+        if not self.synthetic:
+            self._count(service, 'missing')
+            return service, 599, 'application/json', b'{"error": "stub fixture missing"}'
+        self._count(service, 'synthetic')
+        status, payload = self.generator.http(service, url, params)
+        if isinstance(payload, str):
+            return service, status, 'text/html; charset=utf-8', payload.encode('utf-8')
+        return service, status, 'application/json; charset=utf-8', json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+    def record_http(self, method: str, url: str, body, status: int, content_type: str, content: bytes):
+        service = classify_url(url)
+        key, _ = self._http_key(service, method, url, body)
+        self._count(service, 'live')
+        self.save_fixture(service, key, {
+            'status': status,
+            'content_type': content_type,
+            'body': content.decode('utf-8', 'replace'),
+            'request': {'method': method, 'url': re.sub(r'([?&]key=)[^&]+', r'\1***', url)},
+        })
+
+    # --- Gemini ---
+
+    def replay_gemini(self, service: str, prompt: str) -> str:
+        key = self.fixture_key(service, _normalize_prompt(prompt))
+        fixture = self.load_fixture(service, key)
+        if fixture is not None:
+            self._count(service, 'fixture')
+            return fixture['text']
+        self._count(service, 'synthetic' if self.synthetic else 'missing')
+        return self.generator.gemini(prompt) if self.synthetic else ''
+
+    def record_gemini(self, service: str, prompt: str, text: str):
+        self._count(service, 'live')
+        key = self.fixture_key(service, _normalize_prompt(prompt))
+        self.save_fixture(service, key, {'text': text, 'prompt_head': prompt[:300]})
+
+    # --- kurulum ---
+
+    def _patch(self, owner, name: str, replacement):
+        self._originals.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, replacement)
+
+    def install(self):
+        self._install_requests()
+        self._install_httpx()
+        self._install_gemini()
+        logger.info("🧪 OUTBOUND STUBS - %s modu aktif (fixtures: %s)", self.mode, self.fixtures_dir)
+        return self
+
+    def uninstall(self):
+        while self._originals:
+            owner, name, original = self._originals.pop()
+            setattr(owner, name, original)
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
+
+    def _install_requests(self):
+        import requests
+
+        stubs = self
+        original_send = requests.Session.send
+
+        @functools.wraps(original_send)
+        def send(session, request, **kwargs):
+            if stubs.mode == 'record':
+                response = original_send(session, request, **kwargs)
+                stubs.record_http(request.method, request.url, request.body, response.status_code,
+                                  response.headers.get('Content-Type', ''), response.content)
+                return response
+            service, status_code, content_type, content = stubs.replay_http(request.method, request.url, request.body)
+            time.sleep(stubs.delay_for(service))
+            response = requests.Response()
+            response.status_code = status_code
+            response._content = content
+            response.headers['Content-Type'] = content_type
+            response.encoding = 'utf-8'
+            response.url = request.url
+            response.request = request
+            return response
+
+        self._patch(requests.Session, 'send', send)
+
+    def _install_httpx(self):
+        try:
+            import httpx
+        except ImportError:
+            return
+
+        stubs = self
+        original_async_send = httpx.AsyncClient.send
+        original_send = httpx.Client.send
+
+        def build(request, status_code, content_type, content):
+            return httpx.Response(status_code, headers={'Content-Type': content_type}, content=content, request=request)
+
+        @functools.wraps(original_async_send)
+        async def async_send(client, request, **kwargs):
+            import asyncio
+
+            if stubs.mode == 'record':
+                response = await original_async_send(client, request, **kwargs)
+                await response.aread()
+                stubs.record_http(request.method, str(request.url), request.content, response.status_code,
+                                  response.headers.get('Content-Type', ''), response.content)
+                return response
+            service, status_code, content_type, content = stubs.replay_http(request.method, str(request.url), request.content)
+            await asyncio.sleep(stubs.delay_for(service))
+            return build(request, status_code, content_type, content)
+
+        @functools.wraps(original_send)
+        def sync_send(client, request, **kwargs):
+            if stubs.mode == 'record':
+                response = original_send(client, request, **kwargs)
+                response.read()
+                stubs.record_http(request.method, str(request.url), request.content, response.status_code,
+                                  response.headers.get('Content-Type', ''), response.content)
+                return response
+            service, status_code, content_type, content = stubs.replay_http(request.method, str(request.url), request.content)
+            time.sleep(stubs.delay_for(service))
+            return build(request, status_code, content_type, content)
+
+        self._patch(httpx.AsyncClient, 'send', async_send)
+        self._patch(httpx.Client, 'send', sync_send)
+
+    def _install_gemini(self):
+        stubs = self
+
+        try:
+            import google.generativeai as generativeai
+        except ImportError:
+            generativeai = None
+        if generativeai is not None:
+            model_cls = generativeai.GenerativeModel
+            original = model_cls.generate_content
+            original_async = model_cls.generate_content_async
+
+            @functools.wraps(original)
+            def generate_content(model, contents, *args, **kwargs):
+                prompt = contents if isinstance(contents, str) else json.dumps(contents, default=str, ensure_ascii=False)
+                if stubs.mode == 'record':
+                    response = original(model, contents, *args, **kwargs)
+                    stubs.record_gemini('gemini', prompt, response.text)
+                    return response
+                text = stubs.replay_gemini('gemini', prompt)
+                time.sleep(stubs.delay_for('gemini'))
+                return _GeminiText(text)
+
+            @functools.wraps(original_async)
+            async def generate_content_async(model, contents, *args, **kwargs):
+                import asyncio
+
+                prompt = contents if isinstance(contents, str) else json.dumps(contents, default=str, ensure_ascii=False)
+                if stubs.mode == 'record':
+                    response = await original_async(model, contents, *args, **kwargs)
+                    stubs.record_gemini('gemini', prompt, response.text)
+                    return response
+                text = stubs.replay_gemini('gemini', prompt)
+                await asyncio.sleep(stubs.delay_for('gemini'))
+                return _GeminiText(text)
+
+            self._patch(model_cls, 'generate_content', generate_content)
+            self._patch(model_cls, 'generate_content_async', generate_content_async)
+
+        try:
+            from google.genai import models as genai_models
+        except ImportError:
+            return
+        original_search = genai_models.Models.generate_content
+
+        @functools.wraps(original_search)
+        def search_generate_content(models, *, model, contents, config=None, **kwargs):
+            prompt = contents if isinstance(contents, str) else json.dumps(contents, default=str, ensure_ascii=False)
+            if stubs.mode == 'record':
+                response = original_search(models, model=model, contents=contents, config=config, **kwargs)
+                stubs.record_gemini('gemini.search', prompt, response.text or '')
+                return response
+            text = stubs.replay_gemini('gemini.search', prompt)
+            time.sleep(stubs.delay_for('gemini.search'))
+            return _GeminiText(text)
+
+        self._patch(genai_models.Models, 'generate_content', search_generate_content)
+
+
+_active: Optional[OutboundStubs] = None
+_active_lock = threading.Lock()
+
+
+def active_stubs() -> Optional[OutboundStubs]:
+    return _active
+
+
+def install_stubs(mode: str = 'replay', fixtures_dir: Optional[str] = None,
+                  latency_ms: Optional[Dict[str, float]] = None, synthetic: bool = True) -> OutboundStubs:
+    """
+    Stub katmanını process genelinde kur (idempotent). Replay modunda eksik API
+    key'leri sahte bir değerle doldurulur ki key kontrolleri erken dönmesin.
+    """
+    global _active
+    with _active_lock:
+        if _active is not None:
+            return _active
+        from django.conf import settings
+
+        if mode == 'replay':
+            for name in ('GOOGLE_MAPS_API_KEY', 'GEMINI_API_KEY'):
+                if not getattr(settings, name, ''):
+                    setattr(settings, name, STUB_API_KEY)
+            os.environ.setdefault('GOOGLE_MAPS_API_KEY', STUB_API_KEY)
+            os.environ.setdefault('GOOGLE_CSE_ID', 'stub-cse')
+            instagram_service = sys.modules.get('api.instagram_service')
+            if instagram_service is not None:
+                instagram_service.GOOGLE_API_KEY = instagram_service.GOOGLE_API_KEY or STUB_API_KEY
+                instagram_service.GOOGLE_CSE_ID = instagram_service.GOOGLE_CSE_ID or 'stub-cse'
+        _active = OutboundStubs(mode, fixtures_dir or DEFAULT_FIXTURES_DIR, latency_ms, synthetic).install()
+        return _active
+
+
+def install_from_settings():
+    """settings.OUTBOUND_STUBS ayarlıysa stub katmanını kur (ApiConfig.ready çağırır)."""
+    from django.conf import settings
+
+    mode = getattr(settings, 'OUTBOUND_STUBS', '')
+    if not mode:
+        return None
+    return install_stubs(
+        mode=mode,
+        fixtures_dir=getattr(settings, 'OUTBOUND_STUBS_DIR', '') or None,
+        latency_ms=parse_latency_spec(getattr(settings, 'OUTBOUND_STUBS_LATENCY', '')),
+    )
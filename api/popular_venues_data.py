@@ -16,8 +16,10 @@ Kategoriler:
 - Tatlıcı / Pastane
 """
 
+import logging
 from typing import Dict, List, Optional
-import sys
+
+logger = logging.getLogger(__name__)
 
 
 # Popüler mekanlar veritabanı
@@ -1175,9 +1177,9 @@ def enrich_venue_with_instagram(
             )
             if instagram_url:
                 venue["instagramUrl"] = instagram_url
-                print(f"🔗 INSTAGRAM ENRICH (Google CSE) - {name}: {instagram_url}", file=sys.stderr, flush=True)
+                logger.info("🔗 INSTAGRAM ENRICH (Google CSE) - %s: %s", name, instagram_url)
         except Exception as e:
-            print(f"⚠️ INSTAGRAM ENRICH error for {name}: {e}", file=sys.stderr, flush=True)
+            logger.warning("⚠️ INSTAGRAM ENRICH error for %s: %s", name, e)
 
     return venue
 
@@ -1209,6 +1211,6 @@ def enrich_venues_with_instagram(
             enriched_count += 1
 
     if enriched_count > 0:
-        print(f"✨ INSTAGRAM BATCH ENRICH - {enriched_count}/{len(venues)} venue zenginleştirildi", file=sys.stderr, flush=True)
+        logger.info("✨ INSTAGRAM BATCH ENRICH - %s/%s venue zenginleştirildi", enriched_count, len(venues))
 
     return venues
@@ -0,0 +1,167 @@
+"""
+On-Demand Request Profiling (sadece admin)
+
+Production'da yavaş bir kategori/lokasyonu yerinde profillemek için:
+
+    X-Profile: cprofile | stacks          (veya ?__profile=cprofile)
+    X-Profile-Output: store | inline      (varsayılan: store)
+    Authorization: Token <staff kullanıcı token'ı>
+
+Modlar:
+- cprofile → deterministik profiler (cProfile); sadece istek thread'ini ölçer,
+  .prof dosyası snakeviz / pstats ile açılabilir
+- stacks   → örnekleyici (sampling) profiler; PROFILE_SAMPLE_INTERVAL_MS'de bir tüm
+  thread'lerin stack'ini toplar (pipeline pool thread'leri dahil), çıktı flamegraph.pl /
+  speedscope ile uyumlu "collapsed stacks" formatındadır
+
+store modunda profil PROFILE_DIR altına yazılır ve dosya adı X-Profile-Id header'ında
+döner; inline modunda response gövdesi profil metniyle değiştirilir.
+
+Aynı anda en fazla PROFILE_MAX_CONCURRENT istek profillenir; limit doluysa istek
+normal çalışır ve X-Profile-Status: busy döner. Header/param taşımayan isteklerin
+maliyeti tek bir dict lookup'tır.
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+PROFILE_OUTPUT_HEADER = 'HTTP_X_PROFILE_OUTPUT'
+PROFILE_QUERY_PARAM = '__profile'
+PROFILE_MODES = ('cprofile', 'stacks')
+PSTATS_INLINE_LIMIT = 80                # inline cProfile çıktısında gösterilen satır sayısı
+MAX_STACK_DEPTH = 128                   # collapsed stack başına en fazla frame
+
+
+def requested_mode(request) -> Optional[str]:
+    """İstek profil istiyorsa modu döndür (ucuz kontrol; auth yapılmaz)."""
+    mode = request.META.get(PROFILE_HEADER)
+    if mode is None and PROFILE_QUERY_PARAM in request.GET:
+        mode = request.GET.get(PROFILE_QUERY_PARAM) or 'cprofile'
+    if mode is None:
+        return None
+    mode = mode.strip().lower()
+    return mode if mode in PROFILE_MODES else None
+
+
+def is_profiling_admin(request) -> bool:
+    """Session (Django admin) veya DRF Token ile giriş yapmış staff kullanıcı mı?"""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated and user.is_staff:
+        return True
+
+    from rest_framework.authentication import TokenAuthentication
+    from rest_framework.exceptions import AuthenticationFailed
+
+    try:
+        result = TokenAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return False
+    return bool(result and result[0].is_staff)
+
+
+# ===== PROFILERS =====
+
+class CProfileSession:
+    """cProfile: istek thread'inde çalışan tüm Python çağrıları (deterministik)."""
+
+    suffix = 'prof'
+
+    def __init__(self, interval_ms: float):
+        self._profiler = cProfile.Profile()
+
+    def start(self):
+        self._profiler.enable()
+
+    def stop(self):
+        self._profiler.disable()
+
+    def dump(self, path: str):
+        self._profiler.dump_stats(path)
+
+    def render(self) -> str:
+        out = io.StringIO()
+        stats = pstats.Stats(self._profiler, stream=out)
+        stats.sort_stats('cumulative').print_stats(PSTATS_INLINE_LIMIT)
+        return out.getvalue()
+
+
+class StackSampler:
+    """
+    Sampling profiler: ayrı bir daemon thread belirli aralıklarla sys._current_frames()
+    ile tüm thread'lerin stack'ini alır ve collapsed formatta sayar.
+    """
+
+    suffix = 'collapsed'
+
+    def __init__(self, interval_ms: float):
+        self.interval = max(interval_ms, 1) / 1000
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            for thread in threading.enumerate():
+                names[thread.ident] = thread.name
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                self.samples[self._collapse(names.get(thread_id, str(thread_id)), frame)] += 1
+
+    @staticmethod
+    def _collapse(thread_name: str, frame) -> str:
+        stack = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        stack.append(thread_name)
+        return ';'.join(reversed(stack))
+
+    def render(self) -> str:
+        return ''.join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def dump(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+
+
+_PROFILERS = {'cprofile': CProfileSession, 'stacks': StackSampler}
+
+
+def create_profiler(mode: str, interval_ms: float):
+    return _PROFILERS[mode](interval_ms)
+
+
+def store_profile(profiler, request, profile_dir: str) -> str:
+    """Profili PROFILE_DIR altına yaz, dosya adını (profil id) döndür."""
+    os.makedirs(profile_dir, exist_ok=True)
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', request.path).strip('-') or 'root'
+    profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{slug}.{profiler.suffix}"
+    profiler.dump(os.path.join(profile_dir, profile_id))
+    return profile_id
@@ -0,0 +1,208 @@
+"""
+Vektörel Mekan Sıralama Motoru
+
+Sıralama kuralları eskiden view'lara dağılmıştı: sort_venues_by_context (contextScore ile
+Python sort), birkaç kopya michelin_gm_sort_key / fine_dining_sort_key tuple'ı ve ad-hoc
+rating filtreleri (googleRating >= 3.9). Burada tek bir yerde toplanır:
+
+1. build_feature_matrix: aday listesi için (n × len(FEATURES)) float64 matris - venue
+   dict'lerinden tek geçişte okunur.
+2. RankingProfile: kategori başına ağırlıklar + sert eşikler (min_rating, min_context).
+3. rank: skor = X @ w (tek vektörel geçiş), eşik maskesi ve stabil argsort → sıralı indeksler.
+   Saf sözlük sırası gereken profillerde (sort_keys) ağırlık yerine np.lexsort kullanılır.
+
+Michelin > Bib Gourmand > G&M önceliği (eski tuple key'ler) katmanlı feature'lar ve baskın
+ağırlıklarla aynı sırayı üretir: yıldız sütunu sadece yıldızlı mekanlarda, bib sütunu sadece
+yıldızsız bib'lerde, toque sütunu sadece ikisi de olmayanlarda dolu. Eşit skorlarda giriş
+sırası korunur (Python sorted ile aynı).
+
+Kategori ağırlıkları settings.RANKING_WEIGHTS ile ezilebilir:
+    RANKING_WEIGHTS = {'Meyhane': {'context': 1.0, 'log_reviews': 2.0}}
+"""
+
+import math
+import time
+from dataclasses import dataclass, field, replace
+from typing import Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from django.conf import settings
+
+from .geo import haversine_km
+
+# ===== CONFIGURATION =====
+DEFAULT_CONTEXT_SCORE = 75       # contextScore yoksa (Gemini dönmediyse)
+FRESHNESS_HORIZON_DAYS = 365     # Son yorum bu kadar eskiyse freshness = 0
+
+FEATURES = (
+    'rating',           # googleRating
+    'reviews',          # googleReviewCount (ham)
+    'log_reviews',      # log1p(googleReviewCount)
+    'context',          # contextScore[context_key]
+    'michelin_stars',   # Michelin yıldızı (sadece yıldızlı mekanlarda)
+    'bib',              # Bib Gourmand (yıldızsız)
+    'gm_toques',        # G&M toque (yıldızsız ve bib olmayan)
+    'gm_listed',        # G&M listesinde (yıldızsız ve bib olmayan)
+    'distance_km',      # distanceKm (api/geo.py) - yoksa ortalama
+    'freshness',        # Son yorum tazeliği (1 = bugün, 0 = FRESHNESS_HORIZON_DAYS+)
+)
+_COLUMN = {name: i for i, name in enumerate(FEATURES)}
+
+
+@dataclass(frozen=True)
+class RankingProfile:
+    """Bir kategori / bağlam için ağırlıklar ve sert eşikler."""
+    name: str
+    weights: Mapping[str, float] = field(default_factory=dict)
+    min_rating: Optional[float] = None      # googleRating bunun altındaysa elenir
+    min_context: Optional[float] = None     # context skoru bunun altındaysa elenir
+    sort_keys: Tuple[str, ...] = ()         # Verilirse skor yerine bu sütunlarla azalan sözlük sırası
+
+    def vector(self) -> np.ndarray:
+        unknown = (set(self.weights) | set(self.sort_keys)) - set(_COLUMN)
+        if unknown:
+            raise ValueError(f"Bilinmeyen ranking feature: {', '.join(sorted(unknown))}")
+        w = np.zeros(len(FEATURES))
+        for name, value in self.weights.items():
+            w[_COLUMN[name]] = value
+        return w
+
+
+# ===== PROFİLLER =====
+# Baskın ağırlıklar eski tuple key'lerin sözlük sırasını korur:
+# yıldız (1e4/yıldız) > bib (5e3) > toque (100/toque) > G&M listesi (50) > rating (≤ 5)
+
+# Michelin yıldızlı > Bib Gourmand > G&M (toque sayısı), eşitlikte rating
+MICHELIN_GM = RankingProfile('michelin_gm', {'michelin_stars': 1e4, 'bib': 5e3, 'gm_toques': 100, 'rating': 1})
+
+# Fine Dining: Michelin > Bib > G&M (toque) > diğerleri, eşitlikte rating
+FINE_DINING = RankingProfile('fine_dining', {'michelin_stars': 1e4, 'bib': 5e3, 'gm_toques': 100, 'gm_listed': 50, 'rating': 1})
+
+# Gemini contextScore (matchScore), 50 altı elenir
+CONTEXT = RankingProfile('context', {'context': 1}, min_context=50)
+
+# (rating, yorum sayısı) sözlük sırası - Nearby Search kategorileri
+RATING_REVIEWS = RankingProfile('rating_reviews', sort_keys=('rating', 'reviews'))
+
+# generate_venues son listesine uygulanan kategori profilleri. Ağırlıksız profil sırayı korur,
+# sadece eşikleri uygular (Gemini prompt'u takip etmese bile).
+CATEGORY_PROFILES = {
+    'Ocakbaşı': RankingProfile('ocakbasi', min_rating=3.9),
+}
+
+
+def profile_for(category_name: str) -> Optional[RankingProfile]:
+    """Kategori profili; settings.RANKING_WEIGHTS varsa ağırlıklar onunla ezilir (yoksa None)."""
+    profile = CATEGORY_PROFILES.get(category_name)
+    overrides = getattr(settings, 'RANKING_WEIGHTS', {}).get(category_name)
+    if overrides:
+        profile = replace(profile or RankingProfile(category_name), weights={**(profile.weights if profile else {}), **overrides})
+    return profile
+
+
+# ===== FEATURE MATRİSİ =====
+
+def _latest_review_time(venue: dict) -> float:
+    latest = 0.0
+    for review in venue.get('googleReviews') or ():
+        ts = review.get('time') if isinstance(review, dict) else None
+        if isinstance(ts, (int, float)) and ts > latest:
+            latest = ts
+    return latest
+
+
+def build_feature_matrix(venues: Sequence[dict], context_key: str = 'friends_hangout',
+                         center: Optional[Tuple[float, float]] = None,
+                         coordinates: Optional[np.ndarray] = None,
+                         now: Optional[float] = None) -> np.ndarray:
+    """
+    Venue dict'lerinden (n × len(FEATURES)) feature matrisi.
+
+    Args:
+        context_key: contextScore içindeki bağlam (CATEGORY_TO_CONTEXT)
+        coordinates: (n × 2) lat/lng - verilirse mesafe center'dan hesaplanır, verilmezse venue['distanceKm']
+        center: (lat, lng) - verilmezse koordinatların ortalaması (centroid)
+        now: freshness için referans zaman (epoch)
+    """
+    n = len(venues)
+    rows = []
+    for v in venues:
+        stars = v.get('michelinStars', 0) or 0
+        starred = bool(v.get('isMichelinStarred')) and stars > 0
+        toques = v.get('gaultMillauToques')
+        rows.append((
+            v.get('googleRating', 0) or 0,
+            v.get('googleReviewCount', 0) or 0,
+            (v.get('contextScore') or {}).get(context_key, DEFAULT_CONTEXT_SCORE),
+            stars if starred else 0,
+            1.0 if v.get('isBibGourmand') and not starred else 0.0,
+            math.nan if toques is None else toques,
+            _latest_review_time(v),
+            math.nan if v.get('distanceKm') is None else v['distanceKm'],
+        ))
+    raw = np.array(rows, dtype=float).reshape(n, 8)
+
+    X = np.zeros((n, len(FEATURES)))
+    if not n:
+        return X
+    X[:, _COLUMN['rating']] = raw[:, 0]
+    X[:, _COLUMN['reviews']] = raw[:, 1]
+    X[:, _COLUMN['log_reviews']] = np.log1p(raw[:, 1])
+    X[:, _COLUMN['context']] = raw[:, 2]
+    X[:, _COLUMN['michelin_stars']] = raw[:, 3]
+    X[:, _COLUMN['bib']] = raw[:, 4]
+    plain = (raw[:, 3] == 0) & (raw[:, 4] == 0)
+    listed = ~np.isnan(raw[:, 5])
+    X[:, _COLUMN['gm_toques']] = np.where(plain & listed, np.nan_to_num(raw[:, 5]), 0.0)
+    X[:, _COLUMN['gm_listed']] = (plain & listed).astype(float)
+
+    distance = raw[:, 7]
+    if coordinates is not None:
+        latlng = np.asarray(coordinates, dtype=float)
+        has_coords = ~np.isnan(latlng).any(axis=1)
+        distance = np.full(n, np.nan)
+        if has_coords.any():
+            if center is None:
+                center = tuple(latlng[has_coords].mean(axis=0))
+            distance[has_coords] = haversine_km(latlng[has_coords, 0], latlng[has_coords, 1], center)
+    known = ~np.isnan(distance)
+    if known.any():
+        # Mesafesi bilinmeyenler ortalama mesafede kabul edilir (ne ödül ne ceza)
+        X[:, _COLUMN['distance_km']] = np.where(known, distance, distance[known].mean())
+
+    reviewed = raw[:, 6] > 0
+    age_days = ((now or time.time()) - raw[:, 6]) / 86400
+    X[:, _COLUMN['freshness']] = np.where(reviewed, np.clip(1 - age_days / FRESHNESS_HORIZON_DAYS, 0.0, 1.0), 0.0)
+    return X
+
+
+# ===== SIRALAMA =====
+
+def rank(X: np.ndarray, profile: RankingProfile) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Feature matrisinden sıralı indeksler ve skorlar.
+    Eşik altındakiler indekslerde yer almaz; eşit skorlarda giriş sırası korunur.
+    """
+    scores = X @ profile.vector()
+    keep = np.ones(len(X), dtype=bool)
+    if profile.min_rating is not None:
+        keep &= X[:, _COLUMN['rating']] >= profile.min_rating
+    if profile.min_context is not None:
+        keep &= X[:, _COLUMN['context']] >= profile.min_context
+    candidates = np.flatnonzero(keep)
+    if profile.sort_keys:
+        # np.lexsort son anahtarı birincil alır ve stabildir; negatif sütunlar → azalan sıra
+        keys = [-X[candidates, _COLUMN[name]] for name in reversed(profile.sort_keys)]
+        order = candidates[np.lexsort(keys)]
+    else:
+        order = candidates[np.argsort(-scores[candidates], kind='stable')]
+    return order, scores
+
+
+def rank_venues(venues: Sequence[dict], profile: RankingProfile, context_key: str = 'friends_hangout') -> list:
+    """Venue listesini profile göre sırala (eşik altındakiler çıkarılır)."""
+    if not venues:
+        return []
+    X = build_feature_matrix(venues, context_key=context_key)
+    order, _ = rank(X, profile)
+    return [venues[i] for i in order]
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from .itinerary import MAX_TRIP_DAYS
 from .models import FavoriteVenue, SearchHistory, UserProfile
 
 
@@ -91,6 +92,8 @@ class FiltersSerializer(serializers.Serializer):
     musicGenre = serializers.CharField(required=False)
     performanceGenre = serializers.CharField(required=False)
     sportType = serializers.CharField(required=False)
+    # Sadece şu an açık mekanlar (cache'teki openIntervals'tan hesaplanır)
+    openNow = serializers.BooleanField(required=False)
 
 
 class VenueGenerateSerializer(serializers.Serializer):
@@ -98,5 +101,5 @@ class VenueGenerateSerializer(serializers.Serializer):
     category = CategorySerializer(required=True)
     location = LocationSerializer(required=True)
     filters = FiltersSerializer(required=False, default=dict)
-    tripDuration = serializers.IntegerField(required=False)
+    tripDuration = serializers.IntegerField(required=False, min_value=1, max_value=MAX_TRIP_DAYS)
     excludeIds = serializers.ListField(child=serializers.CharField(), required=False, default=list)
@@ -0,0 +1,148 @@
+"""
+Shortlink Read Cache & Buffered Access Counter
+
+Kurallar:
+- ShortLink.venue_data oluşturulduktan sonra değişmez, bu yüzden okumalar cache'ten servis edilir
+- access_count her okumada DB'ye yazılmaz; bellekte biriktirilir ve periyodik olarak
+  F() ile toplu (batched) UPDATE olarak flush edilir
+- Her link için içerikten türetilen sabit bir ETag üretilir (If-None-Match -> 304)
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+
+from django.core.cache import cache
+from django.db.models import F
+
+from .models import ShortLink
+from .opening_hours import public_venue
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+SHORTLINK_CACHE_TTL = 60 * 60 * 24          # 24 saat - venue_data immutable
+SHORTLINK_CACHE_PREFIX = 'shortlink:'
+SHORTLINK_NEGATIVE_TTL = 60                 # Bulunamayan kodlar için kısa negatif cache
+ACCESS_FLUSH_INTERVAL_SECONDS = 30          # Periyodik flush aralığı
+ACCESS_FLUSH_THRESHOLD = 500                # Bu kadar birikince interval beklemeden flush
+
+_MISSING = '__missing__'
+
+# In-memory access counter buffer: code -> pending increment
+_pending_access: Dict[str, int] = defaultdict(int)
+_pending_lock = threading.Lock()
+_flush_timer: Optional[threading.Timer] = None
+
+
+def compute_etag(venue_data) -> str:
+    """venue_data içeriğinden deterministik (strong) ETag üret."""
+    payload = json.dumps(venue_data, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return '"' + hashlib.md5(payload.encode('utf-8')).hexdigest() + '"'
+
+
+def get_shortlink_payload(code: str) -> Optional[Tuple[dict, str]]:
+    """
+    Kısa kod için (venue_data, etag) döndür.
+    Önce cache'e bakar, yoksa DB'den okuyup cache'e yazar.
+    Link yoksa None döner (kısa süreli negatif cache ile).
+    """
+    cache_key = f"{SHORTLINK_CACHE_PREFIX}{code}"
+    cached = cache.get(cache_key)
+    if cached == _MISSING:
+        return None
+    if cached is not None:
+        return cached
+
+    venue_data = ShortLink.objects.filter(code=code).values_list('venue_data', flat=True).first()
+    if venue_data is None:
+        cache.set(cache_key, _MISSING, SHORTLINK_NEGATIVE_TTL)
+        return None
+    # Eski linkler openIntervals ile kaydedilmiş olabilir; istemciye gitmez
+    venue_data = public_venue(venue_data)
+
+    payload = (venue_data, compute_etag(venue_data))
+    cache.set(cache_key, payload, SHORTLINK_CACHE_TTL)
+    return payload
+
+
+def prime_shortlink_cache(code: str, venue_data) -> None:
+    """Yeni oluşturulan link'i cache'e yaz (ilk okuma da DB'ye gitmesin)."""
+    cache.set(f"{SHORTLINK_CACHE_PREFIX}{code}", (venue_data, compute_etag(venue_data)), SHORTLINK_CACHE_TTL)
+
+
+def record_access(code: str) -> None:
+    """Erişimi bellekte biriktir; eşik aşılırsa hemen flush et."""
+    with _pending_lock:
+        _pending_access[code] += 1
+        pending_total = sum(_pending_access.values())
+
+    if pending_total >= ACCESS_FLUSH_THRESHOLD:
+        flush_access_counts()
+    else:
+        _ensure_flush_timer()
+
+
+def flush_access_counts() -> int:
+    """
+    Biriken access_count artışlarını DB'ye yaz.
+    Aynı artış miktarına sahip kodlar tek bir UPDATE ... SET access_count = access_count + n
+    sorgusunda gruplanır. Yazılan toplam erişim sayısını döndürür.
+    """
+    with _pending_lock:
+        if not _pending_access:
+            return 0
+        snapshot = dict(_pending_access)
+        _pending_access.clear()
+
+    by_increment: Dict[int, list] = defaultdict(list)
+    for code, increment in snapshot.items():
+        by_increment[increment].append(code)
+
+    flushed = 0
+    try:
+        for increment, codes in by_increment.items():
+            ShortLink.objects.filter(code__in=codes).update(access_count=F('access_count') + increment)
+            flushed += increment * len(codes)
+        logger.info("🔗 SHORTLINK - %s erişim %s link için flush edildi", flushed, len(snapshot))
+    except Exception as e:
+        # Yazılamayan sayaçları kaybetmemek için buffer'a geri koy
+        with _pending_lock:
+            for code, increment in snapshot.items():
+                _pending_access[code] += increment
+        logger.error("❌ SHORTLINK - access_count flush hatası: %s", e)
+
+    return flushed
+
+
+def get_pending_access_count() -> int:
+    """Henüz DB'ye yazılmamış erişim sayısı (monitoring için)."""
+    with _pending_lock:
+        return sum(_pending_access.values())
+
+
+def _timer_flush():
+    global _flush_timer
+    with _pending_lock:
+        _flush_timer = None
+    flush_access_counts()
+
+
+def _ensure_flush_timer():
+    """Bekleyen bir flush zamanlayıcısı yoksa başlat (daemon thread)."""
+    global _flush_timer
+    with _pending_lock:
+        if _flush_timer is not None and _flush_timer.is_alive():
+            return
+        _flush_timer = threading.Timer(ACCESS_FLUSH_INTERVAL_SECONDS, _timer_flush)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+# Worker kapanırken bekleyen sayaçları yaz
+atexit.register(flush_access_counts)
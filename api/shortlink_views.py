@@ -0,0 +1,70 @@
+"""
+Shortlink endpoint'leri (paylaşım linkleri).
+Ağır SDK'ları ve veri setlerini import etmez.
+"""
+
+import secrets
+
+from rest_framework import status, permissions
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from .models import ShortLink
+from .opening_hours import public_venue
+from .shortlink_service import (
+    get_shortlink_payload, prime_shortlink_cache, record_access, SHORTLINK_CACHE_TTL
+)
+
+
+def generate_short_code():
+    """6 karakterlik benzersiz kısa kod üret."""
+    while True:
+        code = secrets.token_urlsafe(4)[:6]
+        if not ShortLink.objects.filter(code=code).exists():
+            return code
+
+
+@api_view(['POST'])
+@permission_classes([permissions.AllowAny])
+def create_shortlink(request):
+    """Venue verisi için kısa link oluştur."""
+    venue_data = request.data.get('venue_data')
+    if not venue_data:
+        return Response({'error': 'venue_data gerekli'}, status=status.HTTP_400_BAD_REQUEST)
+
+    code = generate_short_code()
+    shortlink = ShortLink.objects.create(code=code, venue_data=public_venue(venue_data))
+    prime_shortlink_cache(shortlink.code, shortlink.venue_data)
+
+    return Response({
+        'code': shortlink.code,
+        'url': f"https://maksat.app/s/{shortlink.code}"
+    }, status=status.HTTP_201_CREATED)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+def get_shortlink(request, code):
+    """
+    Kısa kod ile venue verisini getir.
+    Cache'ten servis edilir; access_count bellekte biriktirilip toplu yazılır.
+    If-None-Match ETag ile eşleşirse 304 döner (link önizleme botları için).
+    """
+    payload = get_shortlink_payload(code)
+    if payload is None:
+        return Response({'error': 'Link bulunamadı'}, status=status.HTTP_404_NOT_FOUND)
+
+    venue_data, etag = payload
+    record_access(code)
+
+    # If-None-Match zayıf karşılaştırma kullanır: W/"..." de aynı ETag sayılır
+    if_none_match = request.headers.get('If-None-Match', '')
+    client_etags = [t.strip().removeprefix('W/') for t in if_none_match.split(',')]
+    if if_none_match and (if_none_match.strip() == '*' or etag.removeprefix('W/') in client_etags):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(venue_data, status=status.HTTP_200_OK)
+
+    response['ETag'] = etag
+    response['Cache-Control'] = f'public, max-age={SHORTLINK_CACHE_TTL}'
+    return response
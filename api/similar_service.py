@@ -0,0 +1,102 @@
+"""
+Benzer Mekanlar Servisi (get_similar_venues)
+
+get_similar_venues eskiden her aday için ayrı bir Gemini çağrısıyla (8 sıralı completion)
+2 cümlelik açıklama + 3 vibe tag üretiyordu ve hiçbir şey cache'lenmiyordu. Artık:
+
+- Tüm adaylar için tek batch prompt: numaralı mekan listesi → index'li JSON array.
+- Açıklamalar (venue_type, place_id) bazında cache'lenir (SIMILAR_DESCRIPTION_TTL); prompt
+  türe bağlı olduğundan bir türde üretilen açıklama başka türde kullanılmaz. Sadece cache'te
+  olmayan mekanlar prompt'a girer (batch / cache akışı api/gemini_batch.py'de).
+- Endpoint sonucu (location_query, venue_type) anahtarıyla cache'lenir (SIMILAR_RESULT_TTL);
+  aynı şehir + tür için tekrar eden aramalar Places'a da Gemini'ye de gitmez.
+
+Kullanım:
+    cached = get_cached_similar(location_query, venue_type)
+    ai_data = describe_places(model, places, venue_type)          # {place_id: {...}}
+    ai_data = await describe_places_async(model, places, venue_type)
+    cache_similar(location_query, venue_type, similar_venues)
+"""
+
+import functools
+import hashlib
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence
+
+from django.core.cache import cache
+
+from .gemini_batch import PlaceBatch, run_batch, run_batch_async
+from .venue_categories import normalize_tr
+
+
+# ===== CONFIGURATION =====
+SIMILAR_RESULT_TTL = 60 * 60 * 24               # 24 saat - Text Search sonuçları yavaş değişir
+SIMILAR_DESCRIPTION_TTL = 60 * 60 * 24 * 30     # 30 gün - mekan açıklaması nadiren değişir
+SIMILAR_RESULT_PREFIX = 'similar:'
+SIMILAR_DESCRIPTION_PREFIX = 'similar_desc:'
+
+Description = Dict[str, object]   # {"description": "...", "vibeTags": [...]}
+
+
+def _result_key(location_query: str, venue_type: Optional[str]) -> str:
+    location = normalize_tr(location_query.strip())
+    canonical = f"{location}:{venue_type or ''}"
+    return SIMILAR_RESULT_PREFIX + hashlib.md5(canonical.encode()).hexdigest()
+
+
+def get_cached_similar(location_query: str, venue_type: Optional[str]) -> Optional[List[dict]]:
+    return cache.get(_result_key(location_query, venue_type))
+
+
+def cache_similar(location_query: str, venue_type: Optional[str], similar_venues: List[dict]) -> None:
+    cache.set(_result_key(location_query, venue_type), similar_venues, SIMILAR_RESULT_TTL)
+
+
+def build_description_batch_prompt(places: Sequence[dict], venue_type: Optional[str] = None) -> str:
+    """Text Search sonuçları için tek açıklama + vibe tag prompt'u."""
+    lines = "\n".join(
+        f"{i}. {p.get('name', '')} | Adres: {p.get('formatted_address', '')} | Rating: {p.get('rating', 0)}"
+        for i, p in enumerate(places, 1)
+    )
+    return f"""
+Kategori: {venue_type}
+
+Mekanlar:
+{lines}
+
+Her mekan için:
+1. 2 cümlelik Türkçe açıklama yaz (neden bu mekana gidilmeli?)
+2. 3 adet vibe tag öner (örn: #Romantik, #Yerel, #Lüks)
+
+SADECE JSON ARRAY döndür, her mekan için bir obje, listedeki sırayla:
+[{{"index": 1, "description": "...", "vibeTags": ["#Tag1", "#Tag2", "#Tag3"]}}, ...]
+"""
+
+
+def parse_description_item(item: dict) -> Optional[Description]:
+    if not item.get('description'):
+        return None
+    return {'description': item['description'], 'vibeTags': item.get('vibeTags') or []}
+
+
+DESCRIPTIONS = PlaceBatch('similar', SIMILAR_DESCRIPTION_PREFIX, SIMILAR_DESCRIPTION_TTL, build_description_batch_prompt, parse_description_item)
+
+
+def _batch_for(venue_type: Optional[str]) -> PlaceBatch:
+    """Türe özel prompt + cache anahtarı: similar_desc:<tür hash>:<place_id>."""
+    type_key = hashlib.md5(normalize_tr((venue_type or '').strip()).encode()).hexdigest()[:12]
+    return replace(
+        DESCRIPTIONS,
+        cache_prefix=f"{SIMILAR_DESCRIPTION_PREFIX}{type_key}:",
+        build_prompt=functools.partial(build_description_batch_prompt, venue_type=venue_type),
+    )
+
+
+def describe_places(model, places: Sequence[dict], venue_type: Optional[str]) -> Dict[str, Description]:
+    """place_id → açıklama; cache'te olmayanlar için tek Gemini çağrısı."""
+    return run_batch(_batch_for(venue_type), model, places)
+
+
+async def describe_places_async(model, places: Sequence[dict], venue_type: Optional[str]) -> Dict[str, Description]:
+    """describe_places'ın async (ASGI) karşılığı."""
+    return await run_batch_async(_batch_for(venue_type), model, places)
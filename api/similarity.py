@@ -0,0 +1,327 @@
+"""
+Yerel Benzerlik İndeksi ("buna benzer mekanlar")
+
+get_similar_venues Places + Gemini ile çalışır. Oysa CachedVenue'da binlerce zenginleştirilmiş
+mekan var (vibeTags, atmosphereSummary, practicalInfo, priceRange, contextScore). Burada bu
+alanlardan şehir başına bir benzerlik indeksi tutulur:
+
+1. venue_tokens: her mekan için token'lar - kategori, vibe tag, fiyat, atmosfer / pratik bilgi
+   alanları (anahtar:değer), uzun metinlerin kelimeleri, contextScore kovaları.
+2. Token'lar HASH_DIM boyutlu vektöre hash'lenir (crc32); log1p(sayı) değerleri (n × HASH_DIM)
+   NumPy matrisinde, doküman frekansları ayrı dizide artımlı tutulur. TF-IDF ağırlığı + L2
+   normalizasyon tek vektörel geçiştir.
+3. neighbours: sorgu satırı × matris (kosinüs), argpartition ile top-k. Dış çağrı yok.
+   Güncelleme her ağırlıklandırmada değişmez bir IndexSnapshot yayınlar; sorgular kilit almaz.
+
+Artımlı güncelleme: save_venues_to_cache_swr yazdığı venue'ları note_cache_write ile bildirir;
+indeks bir sonraki sorguda sadece değişen satırları yeniden token'lar (pahalı Python kısmı),
+IDF / normalizasyon vektörel olarak yeniden hesaplanır. Bayraklı kayıtlar (SERVE_EXCLUDE_Q)
+indekse girmez, sonradan bayraklanan kayıt düşer; cache'ten silinen kayıtlar note_cache_delete
+ile düşer.
+
+Kurulum global kilidin dışında yapılır: şehrin ilk kurulumunu sadece o şehrin sorguları bekler,
+INDEX_MAX_AGE_SECONDS dolunca yeniden kurulum task_queue.defer ile arka planda çalışır ve hazır
+olunca kilit altında değiştirilir; o sırada eski indeks servis edilmeye devam eder.
+
+Kullanım:
+    source, neighbours = more_like_this(place_id, k=10)   # neighbours: [(venue_data, skor), ...]
+    note_cache_write(venues, category_name, city)          # save_venues_to_cache_swr'dan
+    note_cache_delete(place_ids)                            # toplu silmelerden
+"""
+
+import logging
+import re
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .task_queue import defer
+from .venue_categories import normalize_tr
+from .venue_flags import SERVE_EXCLUDE_Q, is_served
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+HASH_DIM = 1024                     # Hash'lenmiş feature boyutu (5k mekan ≈ 20 MB float32)
+CATEGORY_WEIGHT = 2.0               # Kategori ve vibe tag token'larının ağırlığı
+TAG_WEIGHT = 2.0
+CONTEXT_BUCKET = 20                 # contextScore 0-100 → 5 kova
+SHORT_VALUE_CHARS = 40              # Bundan kısa metin alanları tek token (anahtar:değer)
+MIN_WORD_LEN = 3
+INDEX_MAX_AGE_SECONDS = 6 * 3600    # Periyodik tam kurulum (arka planda)
+DEFAULT_NEIGHBOURS = 10
+MAX_NEIGHBOURS = 50
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_STOPWORDS = frozenset({'bir', 've', 'ile', 'icin', 'cok', 'gibi', 'daha', 'olan', 'bu', 'da', 'de', 'the', 'and'})
+
+_indexes: Dict[str, 'CityIndex'] = {}
+_pending: Dict[str, Dict[str, Optional[Tuple[str, dict]]]] = {}   # şehir → place_id → (kategori, venue_data) ya da None (düşür)
+_building: Set[str] = set()         # Kurulumu süren şehirler (yazımlar _pending'e düşer)
+_lock = threading.Lock()
+_build_locks: Dict[str, threading.Lock] = {}
+
+
+def _city_key(city: str) -> str:
+    return normalize_tr(city.strip())
+
+
+def _words(text: str) -> List[str]:
+    return [w for w in _WORD_RE.findall(normalize_tr(text)) if len(w) >= MIN_WORD_LEN and w not in _STOPWORDS]
+
+
+def _field_tokens(prefix: str, data) -> Iterable[Tuple[str, float]]:
+    """atmosphereSummary / practicalInfo: kısa değerler anahtar:değer, listeler eleman eleman, uzun metin kelime kelime."""
+    if isinstance(data, str):
+        for word in _words(data):
+            yield f"{prefix}:{word}", 1.0
+        return
+    if not isinstance(data, dict):
+        return
+    for key, value in data.items():
+        if isinstance(value, str):
+            if len(value) <= SHORT_VALUE_CHARS:
+                yield f"{prefix}:{key}:{normalize_tr(value)}", 1.0
+            else:
+                for word in _words(value):
+                    yield f"{prefix}:{word}", 1.0
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, str):
+                    yield f"{prefix}:{key}:{normalize_tr(item)}", 1.0
+        elif isinstance(value, bool):
+            yield f"{prefix}:{key}:{value}", 1.0
+
+
+def venue_tokens(category: str, venue: dict) -> Iterable[Tuple[str, float]]:
+    """Benzerlikte kullanılan (token, ağırlık) çiftleri."""
+    yield f"cat:{normalize_tr(category or venue.get('category', ''))}", CATEGORY_WEIGHT
+    for tag in venue.get('vibeTags') or ():
+        if isinstance(tag, str):
+            yield f"tag:{normalize_tr(tag.lstrip('#'))}", TAG_WEIGHT
+    if venue.get('priceRange'):
+        yield f"price:{venue['priceRange']}", 1.0
+    yield from _field_tokens('atm', venue.get('atmosphereSummary'))
+    yield from _field_tokens('info', venue.get('practicalInfo'))
+    for context, score in (venue.get('contextScore') or {}).items():
+        if isinstance(score, (int, float)):
+            yield f"ctx:{context}:{int(score) // CONTEXT_BUCKET}", 1.0
+
+
+def term_vector(category: str, venue: dict) -> np.ndarray:
+    """Token'ları HASH_DIM boyutlu sayı vektörüne hash'le."""
+    row = np.zeros(HASH_DIM, dtype=np.float32)
+    for token, weight in venue_tokens(category, venue):
+        row[zlib.crc32(token.encode('utf-8')) % HASH_DIM] += weight
+    return row
+
+
+class IndexSnapshot(NamedTuple):
+    """_reweight'te yayınlanan değişmez görünüm; neighbours kilitsiz okur (upsert yerinde değiştirmez)."""
+    matrix: np.ndarray                  # TF-IDF ağırlıklı, normalize (n × HASH_DIM)
+    categories: np.ndarray              # Satır kategorileri (kategori maskesi için)
+    venues: Tuple[dict, ...]
+    row_of: Dict[str, int]
+
+
+class CityIndex:
+    """Bir şehrin mekanları: alt-doğrusal TF matrisi + doküman frekansları + TF-IDF ağırlıklı, normalize matris."""
+
+    def __init__(self):
+        self.place_ids: List[str] = []
+        self.categories: List[str] = []
+        self.venues: List[dict] = []
+        self.row_of: Dict[str, int] = {}
+        self.tf = np.zeros((0, HASH_DIM), dtype=np.float32)
+        self.df = np.zeros(HASH_DIM, dtype=np.int64)
+        self.snapshot = IndexSnapshot(self.tf, np.array([], dtype=object), (), {})
+        self.built_at = time.monotonic()
+
+    def upsert(self, rows: Sequence[Tuple[str, str, dict]]) -> None:
+        """(place_id, kategori, venue_data) satırlarını ekle / güncelle ve ağırlıkları yeniden hesapla."""
+        existing = len(self.tf)
+        new_rows = []
+        for place_id, category, venue in rows:
+            vector = np.log1p(term_vector(category, venue))     # Alt-doğrusal TF
+            index = self.row_of.get(place_id)
+            if index is None:
+                self.row_of[place_id] = len(self.place_ids)
+                new_rows.append(vector)
+                self.place_ids.append(place_id)
+                self.categories.append(category)
+                self.venues.append(venue)
+                continue
+            if index < existing:
+                self.df += (vector > 0).astype(np.int64) - (self.tf[index] > 0)
+                self.tf[index] = vector
+            else:
+                new_rows[index - existing] = vector     # Aynı batch'te iki kez gelen yeni mekan
+            self.categories[index] = category
+            self.venues[index] = venue
+        if new_rows:
+            added = np.asarray(new_rows, dtype=np.float32)
+            self.df += np.count_nonzero(added, axis=0)
+            self.tf = np.vstack([self.tf, added])
+        self._reweight()
+
+    def remove(self, place_ids: Iterable[str]) -> None:
+        """Satırları düşür (bayraklanan / silinen kayıtlar); doküman frekansları ve ağırlıklar güncellenir."""
+        drop = {self.row_of[place_id] for place_id in place_ids if place_id in self.row_of}
+        if not drop:
+            return
+        keep = np.array([i not in drop for i in range(len(self.place_ids))], dtype=bool)
+        self.df -= np.count_nonzero(self.tf[~keep], axis=0)
+        self.tf = self.tf[keep]
+        self.place_ids = [p for i, p in enumerate(self.place_ids) if keep[i]]
+        self.categories = [c for i, c in enumerate(self.categories) if keep[i]]
+        self.venues = [v for i, v in enumerate(self.venues) if keep[i]]
+        self.row_of = {place_id: i for i, place_id in enumerate(self.place_ids)}
+        if len(self.tf):
+            self._reweight()
+        else:
+            self.snapshot = IndexSnapshot(self.tf, np.array([], dtype=object), (), {})
+
+    def _reweight(self) -> None:
+        """IDF değişince tüm satırlar yeniden ağırlıklanır: tek çarpım + satır normu (vektörel)."""
+        n = len(self.tf)
+        if not n:
+            return
+        idf = (np.log((1 + n) / (1 + self.df)) + 1).astype(np.float32)
+        weighted = self.tf * idf
+        norms = np.sqrt(np.einsum('ij,ij->i', weighted, weighted))
+        weighted /= np.maximum(norms, 1e-12)[:, None]
+        # Tek atama: eşzamanlı neighbours ya eski ya yeni görünümü tam görür
+        self.snapshot = IndexSnapshot(weighted, np.array(self.categories, dtype=object), tuple(self.venues), dict(self.row_of))
+
+    def neighbours(self, place_id: str, k: int, category: Optional[str] = None) -> List[Tuple[dict, float]]:
+        """Kosinüs benzerliğine göre en yakın k mekan (kendisi hariç)."""
+        snapshot = self.snapshot
+        index = snapshot.row_of.get(place_id)
+        if index is None:
+            return []
+        scores = snapshot.matrix @ snapshot.matrix[index]
+        scores[index] = -np.inf
+        if category:
+            scores[snapshot.categories != category] = -np.inf
+        k = min(k, int(np.isfinite(scores).sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(snapshot.venues[i], round(float(scores[i]), 4)) for i in top]
+
+
+def _load_city(city: str) -> CityIndex:
+    from .models import CachedVenue
+
+    # city__iexact SQLite'ta 'İzmir' / 'izmir' / 'IZMIR' yazımlarını eşleştirmez: şehir değerleri
+    # indeks anahtarıyla (normalize_tr) eşlenir, satırlar city__in ile indeksli çekilir
+    key = _city_key(city)
+    spellings = [value for value in CachedVenue.objects.values_list('city', flat=True).distinct() if _city_key(value) == key]
+    index = CityIndex()
+    rows = (CachedVenue.objects.filter(city__in=spellings).exclude(SERVE_EXCLUDE_Q)
+            .values_list('place_id', 'category', 'venue_data'))
+    index.upsert([(place_id, category, venue or {}) for place_id, category, venue in rows.iterator(chunk_size=2000)])
+    logger.info("🧭 Benzerlik indeksi kuruldu: %s (%s mekan)", city, len(index.place_ids))
+    return index
+
+
+def _build_lock(key: str) -> threading.Lock:
+    with _lock:
+        return _build_locks.setdefault(key, threading.Lock())
+
+
+def _rebuild(city: str) -> None:
+    """Yeni indeksi kilitsiz kur, kilit altında değiştir; kurulum sırasındaki yazımlar _pending'de bekler."""
+    key = _city_key(city)
+    try:
+        index = _load_city(city)
+        with _lock:
+            _indexes[key] = index
+    finally:
+        with _lock:
+            _building.discard(key)
+
+
+def _first_build(city: str) -> None:
+    key = _city_key(city)
+    with _build_lock(key):      # Aynı şehrin eşzamanlı ilk sorguları tek kurulum bekler
+        with _lock:
+            if key in _indexes:
+                return
+            _building.add(key)
+        _rebuild(city)
+
+
+def city_index(city: str) -> CityIndex:
+    """Şehrin indeksi; yoksa DB'den kurulur, eskiyse arka planda yenilenir, bekleyen yazımlar uygulanır."""
+    key = _city_key(city)
+    with _lock:
+        index = _indexes.get(key)
+        if index is not None and time.monotonic() - index.built_at > INDEX_MAX_AGE_SECONDS and key not in _building:
+            _building.add(key)
+            defer(_rebuild, city)
+    if index is None:
+        _first_build(city)
+    with _lock:
+        index = _indexes[key]
+        pending = _pending.pop(key, None)
+        if pending:
+            rows = [(place_id, *row) for place_id, row in pending.items() if row is not None]
+            index.remove([place_id for place_id, row in pending.items() if row is None])
+            if rows:
+                index.upsert(rows)
+            logger.info("🧭 Benzerlik indeksi güncellendi: %s (+%s / -%s mekan)", city, len(rows), len(pending) - len(rows))
+        return index
+
+
+def note_cache_write(venues: Sequence[dict], category_name: str, city: str) -> None:
+    """save_venues_to_cache_swr'dan: yazılan venue'ları (indeks kuruluysa) bir sonraki sorguya beklet."""
+    key = _city_key(city)
+    with _lock:
+        if key not in _indexes and key not in _building:
+            return  # İndeks ilk sorguda DB'den kurulacak
+        pending = _pending.setdefault(key, {})
+        for venue in venues:
+            if venue.get('id'):
+                # Bayraklanan kayıt (kapanmış / zincir / bar olmayan) indeksten düşer
+                served = is_served(venue, category_name)
+                pending[venue['id']] = (category_name, venue) if served else None   # CachedVenue.category ile aynı
+
+
+def note_cache_delete(place_ids: Iterable[str]) -> None:
+    """Cache'ten silinen kayıtları (şehri bilinmediği için) tüm kurulu indekslerden düşür."""
+    place_ids = list(place_ids)
+    with _lock:
+        for key in set(_indexes) | _building:
+            pending = _pending.setdefault(key, {})
+            for place_id in place_ids:
+                pending[place_id] = None
+
+
+def more_like_this(place_id: str, k: int = DEFAULT_NEIGHBOURS,
+                   same_category: bool = False) -> Optional[Tuple[dict, List[Tuple[dict, float]]]]:
+    """(kaynak mekan, [(komşu venue_data, skor), ...]); mekan cache'te yoksa None."""
+    from .models import CachedVenue
+
+    source = (CachedVenue.objects.filter(place_id=place_id).exclude(SERVE_EXCLUDE_Q)
+              .values('city', 'category', 'venue_data').first())
+    if source is None:
+        return None
+    index = city_index(source['city'])
+    if place_id not in index.snapshot.row_of:
+        # İndeks kurulduktan sonra bildirimsiz yazılan kayıt: kaynağı indekse ekle
+        with _lock:
+            index.upsert([(place_id, source['category'], source['venue_data'] or {})])
+    k = max(1, min(k, MAX_NEIGHBOURS))
+    category = source['category'] if same_category else None
+    return source['venue_data'], index.neighbours(place_id, k, category)
+
+
+def index_stats() -> Dict[str, int]:
+    with _lock:
+        return {key: len(index.place_ids) for key, index in _indexes.items()}
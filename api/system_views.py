@@ -0,0 +1,86 @@
+"""
+Sistem endpoint'leri: health check, cache monitoring, admin/debug.
+Health check cold start'ta en hızlı cevap vermesi gereken endpoint olduğu için
+bu modül ağır SDK'ları ve veri setlerini import etmez.
+"""
+
+from rest_framework import status, permissions
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from .cache_service import get_cache_stats
+from .candidate_rules import get_filter_stats
+from .task_queue import get_task_queue_stats
+
+
+# Health check endpoint for Render cold start optimization
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+def health_check(request):
+    """Simple health check endpoint to keep the service warm."""
+    return Response({'status': 'ok'}, status=status.HTTP_200_OK)
+
+
+# Cache stats endpoint for monitoring
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+def cache_stats(request):
+    """
+    Cache statistics endpoint for monitoring SWR cache system.
+    Shows freshness distribution, category counts, and ongoing refreshes.
+    """
+    stats = get_cache_stats()
+    return Response(stats, status=status.HTTP_200_OK)
+
+
+# After-response task queue metrikleri
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+def task_queue_stats(request):
+    """
+    After-response task kuyruğunun metrikleri (kuyruk derinliği, düşürülen,
+    başarısız ve ortalama çalışma süresi). Worker process başına değerlerdir.
+    """
+    return Response(get_task_queue_stats(), status=status.HTTP_200_OK)
+
+
+# Phase 1 aday filtresi kural başına red sayaçları
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+def filter_stats(request):
+    """
+    generate_venues Phase 1 kural motorunun sayaçları: değerlendirilen / geçen aday
+    sayısı ve kural başına red adedi. Kural eşiklerini ayarlamak için kullanılır.
+    Worker process başına değerlerdir.
+    """
+    return Response(get_filter_stats(), status=status.HTTP_200_OK)
+
+
+# =====================================================
+# ADMIN / DEBUG ENDPOINT'LERİ
+# =====================================================
+
+@api_view(['POST'])
+def clear_instagram_cache_view(request):
+    """
+    Instagram in-memory cache'ini temizle.
+    Google CSE ile yeni arama yapılmasını sağlar.
+
+    Kullanım: POST /api/admin/clear-instagram-cache/
+    """
+    from .instagram_service import clear_instagram_cache
+    result = clear_instagram_cache()
+    return Response(result, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+def instagram_cse_status(request):
+    """
+    Google CSE yapılandırma durumunu göster.
+    Debug için kullanılır.
+
+    Kullanım: GET /api/admin/instagram-cse-status/
+    """
+    from .instagram_service import get_cse_status
+    cse_status = get_cse_status()
+    return Response(cse_status, status=status.HTTP_200_OK)
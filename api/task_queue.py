@@ -0,0 +1,168 @@
+"""
+After-Response Task Queue
+
+Kritik yolda olmayan DB yazımları (cache kaydı, arama geçmişi, G&M sync,
+last_accessed güncellemesi) response kullanıcıya gönderildikten SONRA çalışır.
+
+Kurallar:
+- View içinde defer(func, ...) çağrılır; istek sırasında görev sadece listeye eklenir
+- Response kapanınca (response.close) görevler sınırlı kuyruğa (bounded queue) aktarılır
+- Tek bir daemon worker thread kuyruğu sırayla tüketir
+- Kuyruk doluysa görev düşürülür (bellek sınırsız büyümesin) ve metrikte sayılır
+- İstek dışında (arka plan thread, management command) defer() direkt kuyruğa ekler
+"""
+
+import atexit
+import contextvars
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+TASK_QUEUE_MAX_SIZE = 1000          # Kuyruk kapasitesi (dolarsa yeni görevler düşürülür)
+SHUTDOWN_DRAIN_SECONDS = 5          # Process kapanırken kuyruğu boşaltmak için bekleme süresi
+
+# İstek kapsamındaki bekleyen görevler (middleware tarafından her istekte sıfırlanır)
+_request_tasks: contextvars.ContextVar[Optional[List[tuple]]] = contextvars.ContextVar('after_response_tasks', default=None)
+
+_queue: 'queue.Queue[tuple]' = queue.Queue(maxsize=TASK_QUEUE_MAX_SIZE)
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+_metrics_lock = threading.Lock()
+_metrics: Dict[str, float] = {
+    'deferred': 0,          # defer() ile kaydedilen görev
+    'enqueued': 0,          # Kuyruğa giren görev
+    'dropped': 0,           # Kuyruk dolu olduğu için düşürülen görev
+    'completed': 0,         # Başarıyla çalışan görev
+    'failed': 0,            # Exception fırlatan görev
+    'total_run_ms': 0.0,    # Görevlerin toplam çalışma süresi
+    'max_run_ms': 0.0,      # En uzun görev süresi
+    'max_queue_depth': 0,   # Gözlenen en yüksek kuyruk derinliği
+}
+
+
+def _incr(key: str, value: float = 1):
+    with _metrics_lock:
+        _metrics[key] += value
+
+
+def _task_name(func: Callable) -> str:
+    return getattr(func, '__qualname__', None) or getattr(func, '__name__', repr(func))
+
+
+def defer(func: Callable, *args, **kwargs) -> None:
+    """
+    func(*args, **kwargs) çağrısını response gönderildikten sonra çalıştır.
+    İstek kapsamı yoksa direkt arka plan kuyruğuna ekler.
+    """
+    _incr('deferred')
+    pending = _request_tasks.get()
+    if pending is not None:
+        pending.append((func, args, kwargs))
+    else:
+        _enqueue(func, args, kwargs)
+
+
+def _enqueue(func: Callable, args: tuple, kwargs: dict) -> bool:
+    _ensure_worker()
+    try:
+        _queue.put_nowait((func, args, kwargs))
+    except queue.Full:
+        _incr('dropped')
+        logger.warning("⚠️ TASK QUEUE - Kuyruk dolu, görev düşürüldü: %s", _task_name(func))
+        return False
+
+    _incr('enqueued')
+    depth = _queue.qsize()
+    with _metrics_lock:
+        if depth > _metrics['max_queue_depth']:
+            _metrics['max_queue_depth'] = depth
+    return True
+
+
+def begin_request() -> List[tuple]:
+    """Yeni istek için boş görev listesi aç (middleware çağırır)."""
+    pending: List[tuple] = []
+    _request_tasks.set(pending)
+    return pending
+
+
+def end_request(pending: List[tuple]) -> None:
+    """Response kapandığında istek görevlerini kuyruğa aktar."""
+    tasks = list(pending)
+    pending.clear()
+    for func, args, kwargs in tasks:
+        _enqueue(func, args, kwargs)
+
+
+def _run_worker():
+    while True:
+        func, args, kwargs = _queue.get()
+        started = time.perf_counter()
+        try:
+            close_old_connections()
+            func(*args, **kwargs)
+            _incr('completed')
+        except Exception as e:
+            _incr('failed')
+            logger.error("❌ TASK QUEUE - %s hatası: %s", _task_name(func), e)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with _metrics_lock:
+                _metrics['total_run_ms'] += elapsed_ms
+                if elapsed_ms > _metrics['max_run_ms']:
+                    _metrics['max_run_ms'] = elapsed_ms
+            close_old_connections()
+            _queue.task_done()
+
+
+def _ensure_worker():
+    """Worker thread'i ilk ihtiyaçta başlat (preload_app fork'undan sonra her worker'da ayrı)."""
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is not None and _worker.is_alive():
+            return
+        _worker = threading.Thread(target=_run_worker, name='after-response-worker', daemon=True)
+        _worker.start()
+
+
+def wait_for_idle(timeout: float = SHUTDOWN_DRAIN_SECONDS) -> bool:
+    """Kuyruktaki tüm görevler bitene kadar bekle (benchmark / management command için)."""
+    deadline = time.monotonic() + timeout
+    while _queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return not _queue.unfinished_tasks
+
+
+def get_task_queue_stats() -> dict:
+    """Monitoring için kuyruk metrikleri."""
+    with _metrics_lock:
+        stats = dict(_metrics)
+    finished = stats['completed'] + stats['failed']
+    stats['avg_run_ms'] = round(stats['total_run_ms'] / finished, 2) if finished else 0.0
+    stats['total_run_ms'] = round(stats['total_run_ms'], 2)
+    stats['max_run_ms'] = round(stats['max_run_ms'], 2)
+    stats['queue_depth'] = _queue.qsize()
+    stats['queue_capacity'] = TASK_QUEUE_MAX_SIZE
+    stats['worker_alive'] = bool(_worker and _worker.is_alive())
+    return stats
+
+
+def _drain_on_exit():
+    """Process kapanırken bekleyen görevlere kısa bir süre tanı."""
+    deadline = time.monotonic() + SHUTDOWN_DRAIN_SECONDS
+    while not _queue.empty() and time.monotonic() < deadline and _worker and _worker.is_alive():
+        time.sleep(0.05)
+
+
+atexit.register(_drain_on_exit)
@@ -0,0 +1,29 @@
+"""
+Import-time bütçesi: URLconf soğuk başlangıçta ağır SDK / veri seti modüllerini
+yüklememeli ve URLCONF_IMPORT_BUDGET_MS içinde kalmalı (WSGI ve ASGI modları).
+
+Kullanım:
+    python manage.py test api
+"""
+
+from django.test import SimpleTestCase
+
+from api.management.commands.import_time_report import (
+    DEFAULT_FORBIDDEN_MODULES,
+    URLCONF_IMPORT_BUDGET_MS,
+    import_failures,
+    measure_imports,
+)
+
+
+class UrlconfImportTimeTests(SimpleTestCase):
+
+    def test_urlconf_stays_lazy_and_within_budget(self):
+        for async_views in ('False', 'True'):
+            with self.subTest(ASYNC_VIEWS=async_views):
+                records = measure_imports('api.urls', {'ASYNC_VIEWS': async_views})
+                modules = {module for module, _, _, _ in records}
+
+                self.assertIn('api.urls', modules)
+                self.assertEqual(sorted(modules & set(DEFAULT_FORBIDDEN_MODULES)), [])
+                self.assertEqual(import_failures(records, 'api.urls', URLCONF_IMPORT_BUDGET_MS), [])
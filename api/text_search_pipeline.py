@@ -0,0 +1,520 @@
+"""
+Varsayılan Mekan Akışı (generate_venues)
+
+Registry'de (venue_categories.CATEGORY_REGISTRY) ve özel dallarda olmayan tüm mekan
+kategorileri bu stage'lerden geçer; motor venue_pipeline.VenuePipeline'dır:
+
+    cache    → G&M öncelikli mekanlar + hybrid cache (load more ve cache-only cevapları burada döner)
+    fetch    → geocode + tek Nearby Search (boşsa Text Search fallback) ya da location bias'lı Text Search
+    filter   → CandidateFilter Phase 1 kuralları (api/candidate_rules.py), alan geçişi ve mesafe
+    details  → Place Details (paralel) + yorum tabanlı kurallar (with_details)
+    enrich   → contextScore döndüren tek Gemini batch'i + Instagram discovery (paralel)
+    rank     → matchScore sırası ve venue dict'leri (VenueCandidate.to_venue)
+    persist  → cache'e kayıt + cache / API / G&M birleştirme, arama geçmişi, kategori profili
+
+Kategoriye özgü sorgu / talimat tabloları venue_categories.text_search_config'tedir.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from rest_framework.response import Response
+
+from .candidate_rules import CandidateFilter, FilterContext, build_candidate, with_details
+from .candidates import DEFAULT_MATCH_SCORE, VenueCandidate
+from .geo import measure
+from .lazy import lazy_callable
+from .models import SearchHistory
+from .opening_hours import filter_open_now
+from .ranking import profile_for, rank_venues
+from .task_queue import defer
+from .timing import bind
+from .venue_categories import (
+    ALCOHOL_INSTRUCTIONS,
+    PRACTICAL_REVIEW_KEYWORDS,
+    TEXT_SEARCH_PROMPT_SCHEMA,
+    TextSearchConfig,
+    text_search_config,
+)
+from .venue_pipeline import (
+    COMBINED_LIMIT,
+    DETAILS_CONCURRENCY,
+    INSTAGRAM_CONCURRENCY,
+    PipelineContext,
+    VenuePipeline,
+    _ai_by_name,
+    _geocode,
+    _nearby_query,
+    _paged_search,
+    prioritized_gm_venues,
+    review_excerpt,
+    run_pipeline,
+)
+from .venue_sources import (
+    CACHE_VENUES_LIMIT,
+    CACHE_VENUES_LIMIT_LOAD_MORE,
+    CATEGORY_ID_TO_NAME,
+    CATEGORY_NAME_TO_ID,
+    discover_instagram_url,
+    enrich_cached_venues_with_instagram,
+    get_cached_venues_for_hybrid,
+    get_genai_model,
+    get_gm_venues_for_category,
+    get_gmaps_client,
+    get_place_details_records,
+    is_michelin_restaurant,
+    save_venues_to_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+# Ağır modüller ilk kullanımda yüklenir (cold start optimizasyonu)
+find_instagram_simple = lazy_callable('api.instagram_service', 'find_instagram_simple')
+enrich_venues_with_gault_millau = lazy_callable('api.gault_millau_data', 'enrich_venues_with_gault_millau')
+enrich_venues_with_instagram = lazy_callable('api.popular_venues_data', 'enrich_venues_with_instagram')
+
+
+# ===== CONFIGURATION =====
+TEXT_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+GM_ONLY_MIN_VENUES = 10             # Bu kadar G&M mekan varsa sadece onlar döner (API / cache atlanır)
+CACHE_ONLY_MIN_VENUES = 50          # Cache'te bu kadar mekan varsa API çağrısı atlanır
+LOAD_MORE_PAGE_MIN = 5              # Load more: cache'te en az bu kadar yeni mekan varsa sayfa dolu sayılır
+LOAD_MORE_PAGE_SIZE = 10
+PLACES_LIMIT = 50                   # Phase 1'e giren / Gemini'ye gönderilen mekan üst sınırı
+NEARBY_FALLBACK_RADIUS_M = 5000     # Nearby 0 sonuç döndürürse Text Search fallback yarıçapı
+
+# Place Details foodServices → Gemini prompt etiketi
+FOOD_SERVICE_LABELS = (
+    ('servesBeer', 'Bira'),
+    ('servesWine', 'Şarap'),
+    ('servesVegetarianFood', 'Vejetaryen'),
+    ('servesBreakfast', 'Kahvaltı'),
+    ('servesBrunch', 'Brunch'),
+    ('servesLunch', 'Öğle'),
+    ('servesDinner', 'Akşam'),
+    ('reservable', 'Rezervasyon'),
+    ('takeout', 'Paket'),
+    ('delivery', 'Teslimat'),
+)
+
+
+class TextSearchContext(PipelineContext):
+    """PipelineContext + varsayılan yolun istek durumu (kategori ID'si, kullanıcı, Phase 1 kayıtları)."""
+
+    def __init__(self, config: TextSearchConfig, category: dict, location: dict, filters: dict, exclude_ids, user=None):
+        super().__init__(config, location, filters, exclude_ids)
+        self.category_id = category.get('id', '')
+        self.user = user
+        # Load More kontrolü orijinal excludeIds'e göre (G&M ID'leri eklenmeden önce)
+        self.is_load_more = bool(self.exclude_ids)
+        self.skip_ids = set(self.exclude_ids)   # Places sonuçlarında atlanacak ID'ler (excludeIds + G&M)
+        self.search_query = ''
+        self.is_nearby_search = False           # Nearby Search kullanıldıysa ilçe adres kontrolü atlanır
+        self.places: List[dict] = []
+        self.candidate_filter: Optional[CandidateFilter] = None
+        self.records: List[VenueCandidate] = []
+
+
+def _finish(ctx: TextSearchContext, result):
+    ctx.result = result
+    ctx.done = True
+
+
+# ===== CACHE =====
+
+def _gm_category_id(ctx: TextSearchContext) -> Optional[str]:
+    """G&M desteği olan kategoriler (mapping'de tanımlı olanlar); kategori ID yoksa adından bulunur."""
+    name = ctx.config.name
+    if ctx.category_id in CATEGORY_ID_TO_NAME or name in CATEGORY_NAME_TO_ID:
+        return ctx.category_id or CATEGORY_NAME_TO_ID[name]
+    return None
+
+
+def _load_more_response(ctx: TextSearchContext):
+    """Load more cevabı sadece cache'ten (API aynı mekanları döndürür)."""
+    cached = ctx.cached_venues
+    if len(cached) >= LOAD_MORE_PAGE_MIN:
+        logger.info("✅ LOAD MORE CACHE HIT - %s yeni mekan cache'ten döndürülüyor!", len(cached))
+        return enrich_cached_venues_with_instagram(cached[:LOAD_MORE_PAGE_SIZE], ctx.city, ctx.district, ctx.neighborhood)
+    if cached:
+        logger.warning("⚠️ LOAD MORE - Son %s mekan döndürülüyor, hasMore=false", len(cached))
+        venues = enrich_cached_venues_with_instagram(cached, ctx.city, ctx.district, ctx.neighborhood)
+        return {'venues': venues, 'hasMore': False}
+    logger.warning("⚠️ LOAD MORE - Cache'te gösterilmemiş mekan kalmadı")
+    return {'venues': [], 'hasMore': False}
+
+
+def cache_stage(ctx: TextSearchContext):
+    config = ctx.config
+    gm_category_id = _gm_category_id(ctx)
+    if gm_category_id:
+        ctx.gm_venues = get_gm_venues_for_category(
+            category_id=gm_category_id,
+            category_name=config.name,
+            city=ctx.city,
+            exclude_ids=ctx.skip_ids,
+            district=ctx.district
+        )
+        if ctx.gm_venues:
+            logger.info("🏆 G&M ÖNCELİK - %s G&M restoran bulundu, listenin başına ekleniyor", len(ctx.gm_venues))
+            if len(ctx.gm_venues) >= GM_ONLY_MIN_VENUES:
+                gm_venues = prioritized_gm_venues(ctx.gm_venues[:GM_ONLY_MIN_VENUES], config.name)
+                if ctx.filters.get('openNow'):
+                    gm_venues = filter_open_now(gm_venues)
+                return _finish(ctx, gm_venues)
+            # G&M place_id'leri tekrar çekilmez
+            ctx.skip_ids |= {v.get('id') for v in ctx.gm_venues if v.get('id')}
+
+    ctx.cached_venues, all_cached_ids = get_cached_venues_for_hybrid(
+        category_name=config.name,
+        city=ctx.city,
+        district=ctx.district,
+        neighborhood=ctx.neighborhood,
+        exclude_ids=ctx.skip_ids,
+        limit=CACHE_VENUES_LIMIT_LOAD_MORE if ctx.is_load_more else CACHE_VENUES_LIMIT,
+        open_now=bool(ctx.filters.get('openNow'))
+    )
+    ctx.api_exclude_ids = ctx.skip_ids | all_cached_ids
+    logger.info("🔀 HYBRID - Cache: %s venue, API exclude: %s ID, LoadMore: %s", len(ctx.cached_venues), len(ctx.api_exclude_ids), ctx.is_load_more)
+
+    if ctx.is_load_more:
+        return _finish(ctx, _load_more_response(ctx))
+
+    if len(ctx.cached_venues) >= CACHE_ONLY_MIN_VENUES:
+        logger.info("✅ CACHE HIT - %s venue cache'ten döndürülüyor, API çağrısı atlandı!", len(ctx.cached_venues))
+        venues = enrich_cached_venues_with_instagram(ctx.cached_venues, ctx.city, ctx.district, ctx.neighborhood)
+        if ctx.gm_venues:
+            gm_venues = prioritized_gm_venues(ctx.gm_venues, config.name)
+            gm_ids = {v.get('id') for v in gm_venues if v.get('id')}
+            venues = gm_venues + [v for v in venues if v.get('id') not in gm_ids][:COMBINED_LIMIT - len(gm_venues)]
+            if ctx.filters.get('openNow'):
+                venues = filter_open_now(venues)
+        return _finish(ctx, venues)
+
+
+# ===== FETCH =====
+
+def _nearby_places(ctx: TextSearchContext) -> List[dict]:
+    config = ctx.config
+    area = _geocode(ctx.search_location, ctx.api_key, config.radius / 1000)
+    if not area:
+        logger.warning("⚠️ Geocode sonuç bulunamadı: %s", ctx.search_location)
+        return []
+    ctx.area = area
+    logger.info("🗺️ Nearby Search - %s: %s -> (%s, %s) r=%.1fkm", config.name, ctx.search_location, area.center[0], area.center[1], area.radius_km)
+
+    places = _nearby_query(config, area, config.keyword, ctx.api_key)
+    if places:
+        ctx.is_nearby_search = True
+        logger.info("✅ Nearby Search toplam: %s mekan", len(places))
+        return places
+
+    logger.warning("⚠️ Nearby Search 0 sonuç, Text Search fallback yapılıyor...")
+    params = {
+        "query": f"{ctx.search_query} in {ctx.search_location}, Turkey",
+        "language": "tr",
+        "key": ctx.api_key,
+        "location": f"{area.center[0]},{area.center[1]}",
+        "radius": NEARBY_FALLBACK_RADIUS_M
+    }
+    return _paged_search(TEXT_SEARCH_URL, params, ctx.api_key, 1, 'Text Search fallback')
+
+
+def _text_search_places(ctx: TextSearchContext) -> List[dict]:
+    config = ctx.config
+    params = {
+        "query": f"{ctx.search_query} in {ctx.search_location}, Turkey",
+        "language": "tr",
+        "key": ctx.api_key
+    }
+    # Location bias (koordinatlar alındıysa); yarıçap alanın boyutundan, en az config.radius
+    area = _geocode(ctx.search_location, ctx.api_key, config.radius / 1000)
+    if area:
+        ctx.area = area
+        params["location"] = f"{area.center[0]},{area.center[1]}"
+        params["radius"] = area.search_radius_m(config.radius)
+        logger.info("🗺️ Text Search location bias: %s -> (%s, %s)", ctx.search_location, area.center[0], area.center[1])
+
+    places = _paged_search(TEXT_SEARCH_URL, params, ctx.api_key, config.max_pages, 'Text Search')
+    logger.info("✅ Text Search toplam: %s sonuç", len(places))
+    return places
+
+
+def fetch_stage(ctx: TextSearchContext):
+    config = ctx.config
+    ctx.search_query = config.search_query(ctx.filters.get('alcohol', 'Any'))
+    if ctx.filters.get('vibes'):
+        ctx.search_query += f" {' '.join(ctx.filters['vibes'])}"
+    logger.debug("DEBUG - Search Location: %s, Exclude IDs count: %s", ctx.search_location, len(ctx.skip_ids))
+
+    places = []
+    if get_gmaps_client():
+        places = _nearby_places(ctx) if config.nearby else _text_search_places(ctx)
+    # Google Places sonuç bulamadıysa boş liste dön (mock data ASLA kullanılmaz)
+    if not places:
+        logger.warning("⚠️ NO RESULTS - Google Places sonuç bulamadı: %s / %s", config.name, ctx.search_location)
+        return _finish(ctx, [])
+    ctx.places = places[:PLACES_LIMIT]
+    ctx.count('fetched', len(places))
+
+
+# ===== FILTER =====
+
+def filter_stage(ctx: TextSearchContext):
+    # Red kuralları istek parametreleri için bir kez derlenir (api/candidate_rules.py). Lokasyon
+    # koordinatla kontrol edilir; Nearby Search vicinity'si ilçe adını içermediği için orada adres kontrolü atlanır.
+    ctx.candidate_filter = CandidateFilter(FilterContext(
+        category=ctx.config.name,
+        alcohol=ctx.filters.get('alcohol', 'Any'),
+        budget=ctx.filters.get('budget') or '',
+        district=ctx.district if ctx.district and not ctx.is_nearby_search else '',
+        neighborhood=ctx.neighborhood or '',
+    ))
+    # Tüm batch için tek vektörel mesafe + alan geçişi (api/geo.py)
+    placement = measure(ctx.places, ctx.area) if ctx.area else None
+
+    for idx, place in enumerate(ctx.places):
+        if place.get('place_id', f"place_{idx}") in ctx.skip_ids:
+            logger.debug("⏭️ EXCLUDE REJECT - %s: zaten gösterildi", place.get('name', ''))
+            continue
+        candidate = build_candidate(place, in_area=placement.in_area(idx) if placement else None)
+        reject = ctx.candidate_filter.check(candidate)
+        if reject:
+            ctx.count('rejected')
+            logger.debug("❌ %s REJECT - %s (types: %s)", reject, place.get('name', ''), place.get('types', []))
+            continue
+        record = VenueCandidate(idx, place, candidate)
+        record.distance_km = placement.distance(idx) if placement else None
+        ctx.records.append(record)
+
+    # Ham Places yanıtları artık gerekmiyor; kayıtlar sadece kullandıkları alanlara referans tutar
+    ctx.places = []
+    ctx.count('candidates', len(ctx.records))
+
+
+# ===== DETAILS =====
+
+def details_stage(ctx: TextSearchContext):
+    gmaps = get_gmaps_client()
+
+    def load(record):
+        return get_place_details_records(gmaps, record.place_id) if record.place_id else ((), {})
+
+    with ThreadPoolExecutor(max_workers=DETAILS_CONCURRENCY) as pool:
+        details = list(pool.map(bind(load), ctx.records))
+
+    # Eski yorum / kapanmış mekan (yorum içeriği): Legacy Text Search yorum döndürmediği için Place Details'ten sonra
+    accepted = []
+    for record, (reviews, food_services) in zip(ctx.records, details):
+        reject = ctx.candidate_filter.check(with_details(record.features, reviews), stage='details')
+        if reject:
+            ctx.count('rejected')
+            logger.debug("❌ %s REJECT - %s", reject, record.name)
+            continue
+        record.reviews = reviews
+        record.food_services = food_services
+        accepted.append(record)
+    ctx.candidate_filter.finish()
+    ctx.records = accepted
+    ctx.count('detailed', len(details))
+
+
+# ===== ENRICH =====
+
+def _preferences(ctx: TextSearchContext) -> List[str]:
+    """Kullanıcı tercihleri - kategori bazlı (Spor / etkinlik / deneyim kategorilerinde mekan filtreleri atlanır)."""
+    filters = ctx.filters
+    preferences = []
+    if not ctx.config.skip_venue_filters:
+        for key, label in (('groupSize', 'Grup'), ('alcohol', 'ALKOL'), ('liveMusic', 'CANLI MÜZİK'),
+                           ('smoking', 'SİGARA'), ('environment', 'ORTAM')):
+            if filters.get(key) and filters[key] != 'Any':
+                preferences.append(f"{label}: {filters[key]}")
+    if ctx.config.name == 'Spor' and filters.get('sportType') and filters['sportType'] != 'Any':
+        preferences.append(f"SPOR TÜRÜ: {filters['sportType']}")
+    return preferences
+
+
+def _place_line(i: int, record: VenueCandidate) -> str:
+    reviews_text = review_excerpt([review.text or '' for review in record.reviews], PRACTICAL_REVIEW_KEYWORDS)
+    services = [f"{label}:✓" for key, label in FOOD_SERVICE_LABELS if record.food_services.get(key)]
+    services_text = f" | Google Servisler: {' '.join(services)}" if services else ""
+    return f"{i+1}. {record.name} | Tip: {', '.join(record.types[:2])} | Rating: {record.rating}{services_text}{reviews_text}"
+
+
+def build_text_search_prompt(records: List[VenueCandidate], config: TextSearchConfig, preferences: List[str], alcohol: Optional[str]) -> str:
+    """Tüm mekanlar yorumlarıyla tek prompt'ta; kategori ve alkol talimatları tercihlere göre eklenir."""
+    instruction = config.alcoholic_instruction if alcohol == 'Alcoholic' and config.alcoholic_instruction else config.instruction
+    instruction += ALCOHOL_INSTRUCTIONS.get(alcohol, '')
+    places_list = "\n".join(_place_line(i, record) for i, record in enumerate(records))
+    return (
+        f"Kategori: {config.name}\n"
+        f"Kullanıcı Tercihleri: {', '.join(preferences) or 'Özel tercih yok'}\n"
+        f"{instruction}\n\n"
+        f"Mekanlar ve Yorumları:\n{places_list}\n\n" + TEXT_SEARCH_PROMPT_SCHEMA
+    )
+
+
+def _discover_instagram(ctx: TextSearchContext, records: List[VenueCandidate], existing: List[Optional[str]]):
+    """Kayıtların Instagram URL'leri (paralel; sıra korunur) ve Michelin işareti."""
+    config = ctx.config
+
+    def find(item):
+        record, existing_instagram = item
+        if config.simple_instagram:
+            url = find_instagram_simple(venue_name=record.name, neighborhood=ctx.neighborhood, city=ctx.city)
+        else:
+            url = discover_instagram_url(
+                venue_name=record.name,
+                city=ctx.city,
+                website=None,
+                existing_instagram=existing_instagram,
+                district=ctx.district,
+                neighborhood=ctx.neighborhood
+            )
+        return url or ''
+
+    with ThreadPoolExecutor(max_workers=INSTAGRAM_CONCURRENCY) as pool:
+        urls = list(pool.map(bind(find), zip(records, existing)))
+    for record, url in zip(records, urls):
+        record.instagram_url = url
+        record.is_michelin = is_michelin_restaurant(record.name) is not None
+
+
+def enrich_stage(ctx: TextSearchContext):
+    config = ctx.config
+    records = ctx.records[:PLACES_LIMIT]
+    if not records:
+        return
+
+    preferences = _preferences(ctx)
+    # Alkol talimatı sadece alkol tercihi prompt'a girdiyse eklenir
+    alcohol = None if config.skip_venue_filters else ctx.filters.get('alcohol')
+    logger.info("📋 Gemini BATCH çağrısı - %s mekan, filtreler: %s", len(records), ', '.join(preferences) or 'Özel tercih yok')
+
+    ai_by_name = None
+    try:
+        model = get_genai_model()
+        if model:
+            response = model.generate_content(build_text_search_prompt(records, config, preferences, alcohol))
+            ai_by_name = _ai_by_name(config, response.text)
+    except Exception as e:
+        logger.error("❌ Gemini batch hatası: %s", e)
+
+    if ai_by_name is None:
+        # Fallback: Gemini olmadan mekanları ekle
+        for record in records:
+            record.ai = None
+            record.match_score = DEFAULT_MATCH_SCORE
+        _discover_instagram(ctx, records, [None] * len(records))
+        ctx.records = records
+        return
+
+    relevant, existing = [], []
+    for record in records:
+        ai_data = ai_by_name.get(record.name.lower(), {})
+        # Uygun değilse skip
+        if ai_data and not ai_data.get('isRelevant', True):
+            continue
+        # matchScore kategorinin context skorundan
+        record.attach_ai(ai_data, config.context_key)
+        relevant.append(record)
+        existing.append(ai_data.get('instagramUrl'))
+    _discover_instagram(ctx, relevant, existing)
+    ctx.records = relevant
+    logger.info("✅ Gemini batch sonucu: %s mekan", len(relevant))
+
+
+# ===== RANK =====
+
+def rank_stage(ctx: TextSearchContext):
+    # Match score'a göre sırala (stabil), venue dict'leri sadece sıralanmış kayıtlar için üretilir
+    ctx.records.sort(key=lambda record: record.match_score, reverse=True)
+    ctx.venues = [record.to_venue(ctx.config.name, ctx.api_key) for record in ctx.records]
+
+
+# ===== PERSIST =====
+
+def _merge_cached_and_api(cached_venues: List[dict], venues: List[dict]) -> List[dict]:
+    """Önce cache'ten gelenlerin hepsi, sonra API'den gelenler (ID ve isim bazlı duplicate kontrolü)."""
+    combined = list(cached_venues[:COMBINED_LIMIT])
+    existing_ids = {v.get('id') for v in combined}
+    existing_names = {v.get('name', '').lower().strip() for v in combined}
+    for venue in venues:
+        name = venue.get('name', '').lower().strip()
+        if len(combined) < COMBINED_LIMIT and venue.get('id') not in existing_ids and name not in existing_names:
+            combined.append(venue)
+            existing_ids.add(venue.get('id'))
+            existing_names.add(name)
+    return combined
+
+
+def persist_stage(ctx: TextSearchContext):
+    config = ctx.config
+    if ctx.venues:
+        save_venues_to_cache(
+            venues=ctx.venues,
+            category_name=config.name,
+            city=ctx.city,
+            district=ctx.district,
+            neighborhood=ctx.neighborhood
+        )
+
+    combined = _merge_cached_and_api(ctx.cached_venues, ctx.venues)
+    logger.info("🔀 HYBRID RESULT - Cache: %s, API: %s, Combined: %s", len(ctx.cached_venues), len(ctx.venues), len(combined))
+
+    # G&M venue'ları Michelin öncelikli sıralanıp başa eklenir (ID ve isim bazlı duplicate önleme)
+    if ctx.gm_venues:
+        gm_venues = prioritized_gm_venues(ctx.gm_venues, config.name)
+        gm_ids = {v.get('id') for v in gm_venues if v.get('id')}
+        gm_names = {v.get('name', '').lower().strip() for v in gm_venues}
+        combined = [v for v in combined if v.get('id') not in gm_ids and v.get('name', '').lower().strip() not in gm_names]
+        combined = gm_venues + combined[:COMBINED_LIMIT - len(gm_venues)]
+        logger.info("🏆 G&M PREPEND (HYBRID) - %s G&M venue başa eklendi (Michelin: %s)", len(gm_venues), sum(1 for v in gm_venues if v.get('isMichelinStarred')))
+
+    if ctx.user is not None and ctx.user.is_authenticated:
+        defer(
+            SearchHistory.objects.create,
+            user=ctx.user,
+            query=ctx.search_query,
+            intent=config.name,
+            location=ctx.search_location,
+            results_count=len(combined)
+        )
+
+    combined = enrich_venues_with_gault_millau(combined)
+    # Instagram URL ekle (eksikse) - Google CSE ile arama
+    combined = enrich_venues_with_instagram(combined, ctx.city, ctx.district, ctx.neighborhood)
+
+    # Kategori profili: sert eşikler / ağırlıklar (örn. Ocakbaşı 3.9 altı; api/ranking.py CATEGORY_PROFILES)
+    profile = profile_for(config.name)
+    if profile is not None:
+        original_count = len(combined)
+        combined = rank_venues(combined, profile, context_key=config.context_key)
+        if original_count > len(combined):
+            logger.info("🔒 %s HARD FİLTER - %s mekan çıkarıldı (profil: %s)", config.name, original_count - len(combined), profile.name)
+
+    # "Şu an açık": cache tarafı zaten filtreli; G&M ve API'den gelen mekanlar birleşik listede elenir
+    if ctx.filters.get('openNow'):
+        combined = filter_open_now(combined)
+    ctx.result = combined
+
+
+# ===== ENGINE =====
+
+TEXT_SEARCH_STAGES = (
+    ('cache', cache_stage),
+    ('fetch', fetch_stage),
+    ('filter', filter_stage),
+    ('details', details_stage),
+    ('enrich', enrich_stage),
+    ('rank', rank_stage),
+    ('persist', persist_stage),
+)
+
+
+def run_text_search_pipeline(category: dict, location: dict, filters: dict, exclude_ids, user=None) -> Response:
+    """generate_venues varsayılan yolu için giriş noktası."""
+    config = text_search_config(category['name'])
+    return run_pipeline(VenuePipeline(TEXT_SEARCH_STAGES), TextSearchContext(config, category, location, filters, exclude_ids, user))
@@ -0,0 +1,222 @@
+"""
+Request-Scoped Timing (Server-Timing + yavaş istek kırılımı)
+
+Her istek için bir RequestTimer açılır (ServerTimingMiddleware). İstek süresince:
+- Pipeline stage'leri ve açıkça işaretlenen bloklar `span('isim')` ile,
+- `requests` üzerinden giden tüm dış çağrılar (Places, Geocode, Details, CSE) otomatik,
+- Gemini çağrıları `timed_model()` proxy'si ile,
+- DB sorguları her bağlantıya bir kez eklenen execute_wrapper ile (install_db_timing)
+span olarak kaydedilir. Aynı isimli span'ler toplanır (toplam süre + çağrı sayısı).
+
+Response'a `Server-Timing` header'ı eklenir; SLOW_REQUEST_MS'i aşan istekler için
+tek satırlık yapılandırılmış bir kırılım loglanır. Aktif timer yoksa (management
+command, arka plan thread) span'ler hiçbir şey yapmaz.
+"""
+
+import contextvars
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+_current: contextvars.ContextVar[Optional['RequestTimer']] = contextvars.ContextVar('request_timer', default=None)
+
+
+class RequestTimer:
+    """Bir isteğin span'lerini toplar (thread-safe; pool thread'leri de yazar)."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._spans: Dict[str, List[float]] = {}   # name -> [toplam_ms, çağrı_sayısı]
+
+    def record(self, name: str, duration_ms: float):
+        with self._lock:
+            entry = self._spans.setdefault(name, [0.0, 0])
+            entry[0] += duration_ms
+            entry[1] += 1
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def spans(self) -> Dict[str, dict]:
+        with self._lock:
+            return {name: {'ms': round(ms, 1), 'count': count} for name, (ms, count) in self._spans.items()}
+
+    def server_timing_header(self) -> str:
+        parts = []
+        for name, data in self.spans().items():
+            parts.append(f'{name};dur={data["ms"]};desc="{data["count"]}x"')
+        parts.append(f'total;dur={round(self.elapsed_ms, 1)}')
+        return ', '.join(parts)
+
+
+def current_timer() -> Optional[RequestTimer]:
+    return _current.get()
+
+
+@contextmanager
+def request_timer():
+    """İstek süresince aktif timer'ı aç (middleware kullanır)."""
+    timer = RequestTimer()
+    token = _current.set(timer)
+    try:
+        yield timer
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def span(name: str):
+    """Bloğun süresini aktif isteğin timer'ına yaz (timer yoksa no-op)."""
+    timer = _current.get()
+    if timer is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.record(name, (time.perf_counter() - started) * 1000)
+
+
+def bind(fn: Callable) -> Callable:
+    """
+    ThreadPoolExecutor'a verilecek fonksiyonu aktif timer'a bağla.
+    Pool thread'leri contextvar'ları miras almadığı için gerekli.
+    """
+    timer = _current.get()
+    if timer is None:
+        return fn
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        token = _current.set(timer)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current.reset(token)
+    return run
+
+
+# ===== DIŞ ÇAĞRI SINIFLANDIRMA =====
+
+def classify_url(url: str) -> str:
+    """Dış çağrı URL'sini kısa bir span adına çevir."""
+    parts = urlsplit(url)
+    host, path = parts.netloc, parts.path
+    if host == 'maps.googleapis.com':
+        if '/geocode/' in path:
+            return 'geocode'
+        if '/place/' in path:
+            endpoint = path.split('/place/', 1)[1].split('/', 1)[0]
+            return f'places.{endpoint}'
+        return 'maps'
+    if host == 'places.googleapis.com':
+        return 'places.v1'
+    if host == 'www.googleapis.com' and path.startswith('/customsearch'):
+        return 'cse'
+    if host == 'generativelanguage.googleapis.com':
+        return 'gemini'
+    return 'http.other'
+
+
+_requests_patched = False
+
+
+def install_requests_timing():
+    """
+    requests.Session.send'i bir kez sarar: aktif timer varsa her HTTP çağrısı
+    hedefine göre span olarak kaydedilir. googlemaps client ve modül seviyesindeki
+    requests.get/post çağrıları da Session.send'den geçer.
+    """
+    global _requests_patched
+    if _requests_patched:
+        return
+    import requests
+
+    original_send = requests.Session.send
+
+    @functools.wraps(original_send)
+    def send(self, request, **kwargs):
+        timer = _current.get()
+        if timer is None:
+            return original_send(self, request, **kwargs)
+        started = time.perf_counter()
+        try:
+            return original_send(self, request, **kwargs)
+        finally:
+            timer.record(classify_url(request.url), (time.perf_counter() - started) * 1000)
+
+    requests.Session.send = send
+    _requests_patched = True
+
+
+class TimedModel:
+    """GenerativeModel proxy'si: generate_content çağrılarını 'gemini' span'i olarak ölçer."""
+
+    def __init__(self, model):
+        self._model = model
+
+    def generate_content(self, *args, **kwargs):
+        with span('gemini'):
+            return self._model.generate_content(*args, **kwargs)
+
+    async def generate_content_async(self, *args, **kwargs):
+        with span('gemini'):
+            return await self._model.generate_content_async(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
+
+
+def timed_model(model):
+    return TimedModel(model) if model is not None else None
+
+
+def db_execute_wrapper(execute, sql, params, many, context):
+    """connection.execute_wrapper hook'u: her sorgu 'db' span'i."""
+    with span('db'):
+        return execute(sql, params, many, context)
+
+
+def _add_db_wrapper(connection):
+    if db_execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(db_execute_wrapper)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    _add_db_wrapper(connection)
+
+
+def install_db_timing():
+    """
+    db_execute_wrapper'ı her DB bağlantısına bir kez ekler (aktif timer yoksa span no-op).
+    Bağlantılar thread başına olduğu için istek başına connection.execute_wrapper ASGI'de
+    sorguların koştuğu sync_to_async thread'lerini görmezdi.
+    """
+    from django.db import connections
+    from django.db.backends.signals import connection_created
+
+    connection_created.connect(_on_connection_created, dispatch_uid='api.timing.db')
+    for connection in connections.all(initialized_only=True):
+        _add_db_wrapper(connection)
+
+
+def log_slow_request(request, response, timer: RequestTimer, threshold_ms: float):
+    elapsed = timer.elapsed_ms
+    if elapsed < threshold_ms:
+        return
+    spans = timer.spans()
+    breakdown = ' '.join(f"{name}={data['ms']}ms/{data['count']}" for name, data in sorted(spans.items(), key=lambda kv: -kv[1]['ms']))
+    logger.warning(
+        "🐢 SLOW REQUEST - %s %s %s %.0fms | %s",
+        request.method, request.path, getattr(response, 'status_code', '-'), elapsed, breakdown,
+        extra={'path': request.path, 'method': request.method, 'duration_ms': round(elapsed, 1), 'spans': spans},
+    )
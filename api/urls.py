@@ -1,40 +1,58 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import account_views, shortlink_views, system_views
+from .lazy import lazy_view
+
+# api/views.py (venue üretimi) ağır SDK'ları ve veri setlerini kullanır;
+# ilk ilgili istekte yüklenir, böylece health check ve auth cold start'ta hızlı cevap verir.
+if settings.ASYNC_VIEWS:
+    # ASGI modunda yavaş venue endpoint'leri async versiyonlarla servis edilir
+    from .async_views import generate_venues, search_venues, get_similar_venues, stream_vacation_itinerary
+else:
+    generate_venues = lazy_view('api.views.generate_venues')
+    search_venues = lazy_view('api.views.search_venues')
+    get_similar_venues = lazy_view('api.views.get_similar_venues')
+    stream_vacation_itinerary = lazy_view('api.views.stream_vacation_itinerary')
 
 router = DefaultRouter()
-router.register(r'favorites', views.FavoriteVenueViewSet, basename='favorite')
-router.register(r'search-history', views.SearchHistoryViewSet, basename='search-history')
-router.register(r'profile', views.UserProfileViewSet, basename='profile')
+router.register(r'favorites', account_views.FavoriteVenueViewSet, basename='favorite')
+router.register(r'search-history', account_views.SearchHistoryViewSet, basename='search-history')
+router.register(r'profile', account_views.UserProfileViewSet, basename='profile')
 
 urlpatterns = [
     # Health check (for Render cold start)
-    path('health/', views.health_check, name='health-check'),
+    path('health/', system_views.health_check, name='health-check'),
 
     # Cache monitoring
-    path('cache/stats/', views.cache_stats, name='cache-stats'),
-    path('cache/clear-invalid/', views.cache_clear_invalid, name='cache-clear-invalid'),
-    path('cache/clear-category/', views.cache_clear_category, name='cache-clear-category'),
+    path('cache/stats/', system_views.cache_stats, name='cache-stats'),
+    path('cache/clear-invalid/', lazy_view('api.views.cache_clear_invalid'), name='cache-clear-invalid'),
+    path('cache/clear-category/', lazy_view('api.views.cache_clear_category'), name='cache-clear-category'),
+    path('tasks/stats/', system_views.task_queue_stats, name='task-queue-stats'),
+    path('filters/stats/', system_views.filter_stats, name='filter-stats'),
 
     # Authentication
-    path('auth/register/', views.register, name='register'),
-    path('auth/login/', views.login, name='login'),
-    path('auth/logout/', views.logout, name='logout'),
-    path('auth/google/', views.google_login, name='google-login'),
+    path('auth/register/', account_views.register, name='register'),
+    path('auth/login/', account_views.login, name='login'),
+    path('auth/logout/', account_views.logout, name='logout'),
+    path('auth/google/', account_views.google_login, name='google-login'),
 
     # Venue endpoints
-    path('venues/generate/', views.generate_venues, name='generate-venues'),
-    path('venues/search/', views.search_venues, name='search-venues'),
-    path('venues/similar/', views.get_similar_venues, name='similar-venues'),
-    path('venues/suggest-instagram/', views.suggest_instagram, name='suggest-instagram'),
+    path('venues/generate/', generate_venues, name='generate-venues'),
+    path('venues/search/', search_venues, name='search-venues'),
+    path('venues/similar/', get_similar_venues, name='similar-venues'),
+    path('venues/autocomplete/', lazy_view('api.views.autocomplete'), name='autocomplete'),
+    path('venues/more-like-this/<str:place_id>/', lazy_view('api.views.more_like_this_venue'), name='more-like-this'),
+    path('venues/vacation/stream/', stream_vacation_itinerary, name='stream-vacation-itinerary'),
+    path('venues/suggest-instagram/', lazy_view('api.views.suggest_instagram'), name='suggest-instagram'),
 
     # Shortlink endpoints
-    path('shortlink/', views.create_shortlink, name='create-shortlink'),
-    path('shortlink/<str:code>/', views.get_shortlink, name='get-shortlink'),
+    path('shortlink/', shortlink_views.create_shortlink, name='create-shortlink'),
+    path('shortlink/<str:code>/', shortlink_views.get_shortlink, name='get-shortlink'),
 
     # Admin / Debug endpoints
-    path('admin/clear-instagram-cache/', views.clear_instagram_cache_view, name='clear-instagram-cache'),
-    path('admin/instagram-cse-status/', views.instagram_cse_status, name='instagram-cse-status'),
+    path('admin/clear-instagram-cache/', system_views.clear_instagram_cache_view, name='clear-instagram-cache'),
+    path('admin/instagram-cse-status/', system_views.instagram_cse_status, name='instagram-cse-status'),
 
     # Router URLs
     path('', include(router.urls)),
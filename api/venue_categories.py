@@ -0,0 +1,1134 @@
+"""
+Venue Kategori Registry'si
+
+Nearby Search tabanlı kategoriler (Bar, Sokak Lezzeti, 3. Nesil Kahveci, Eğlence & Parti)
+ayrı ayrı 500 satırlık fonksiyonlar yerine burada birer CategoryConfig olarak tanımlanır.
+Akışın kendisi (geocode → Nearby Search → filtre → detay → Gemini → Instagram → cache)
+venue_pipeline.py içindeki stage'lerde tek bir yerde çalışır.
+
+Registry'de olmayan mekan kategorileri generate_venues'un varsayılan yoluna düşer; onların
+sorgu / talimat tabloları da burada tutulur ve text_search_config ile TextSearchConfig'e çevrilir
+(akış: api/text_search_pipeline.py).
+
+Bu modül sadece veri ve saf Python kurallar içerir; ağır SDK import etmez.
+"""
+
+import urllib.parse
+from dataclasses import dataclass
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+def normalize_tr(text: str) -> str:
+    """Küçük harf + Türkçe karakter sadeleştirme (ı→i, İ→i, ş→s, ...)."""
+    # 'İ'.lower() → 'i' + birleşik nokta (U+0307); nokta burada bir kez atılır
+    return (text.lower().replace('\u0307', '').replace('ı', 'i').replace('ş', 's').replace('ç', 'c')
+            .replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u'))
+
+
+class PlaceText(NamedTuple):
+    """Filtre kurallarının ortak kullandığı, bir kez hesaplanan metinler."""
+    lower: str          # place name .lower()
+    norm: str           # normalize_tr(place name)
+    types: List[str]    # place types
+    types_str: str      # ' '.join(types).lower()
+
+
+# Kural: (place, text) -> None (geçti) ya da log'a yazılacak REJECT etiketi
+RejectRule = Callable[[dict, PlaceText], Optional[str]]
+
+
+@dataclass(frozen=True)
+class CategoryConfig:
+    """Bir Nearby Search kategorisinin pipeline ayarları."""
+    name: str                                   # Kategori adı (cache anahtarı ve response 'category')
+    emoji: str
+    queries: Tuple[Tuple[str, str], ...]        # (Nearby keyword, tür etiketi)
+    place_type: str                             # Nearby Search 'type' parametresi
+    label_field: str                            # Tür etiketinin venue'daki alanı (barType, foodType, ...)
+    build_venue: Callable[[dict, str, 'CategoryConfig', dict], dict]
+    default_atmosphere: dict                    # Gemini atmosphereSummary dönmezse
+    fallback_atmosphere: dict                   # Gemini tamamen başarısız olursa
+    error_message: str
+    min_rating: float = 0
+    min_reviews: int = 0
+    reject_rules: Tuple[RejectRule, ...] = ()
+    gm_category_id: Optional[str] = None        # G&M öncelikli mekanlar (yoksa G&M adımı atlanır)
+    gm_enrich: bool = False                     # G&M mekanlarını Gemini + Michelin sırası ile zenginleştir
+    radius: int = 2000
+    max_pages: int = 3
+    per_query_limit: Optional[int] = None       # Tür başına en fazla mekan (çeşitlilik)
+    max_candidates: Optional[int] = None        # Details filtresinden (eski yorum / kapanmış) geçen mekan üst sınırı
+    sort_by_rating: bool = True                 # (rating, yorum sayısı) sıralaması
+    api_limit: int = 10                         # Gemini'ye giden / response'a eklenen API mekan sayısı
+    details_budget: int = 20                    # Place Details çağrılacak aday üst sınırı
+    extended_details: bool = False              # get_place_details_extended (foodServices) kullan
+    after_details: Optional[Callable[[dict, list, 'CategoryConfig'], None]] = None
+    prompt_builder: Optional[Callable[[list, 'CategoryConfig', dict], str]] = None
+    prompt_preferences: str = ''
+    prompt_label: str = 'Tür'
+    prompt_schema: str = ''
+    practical_keywords: Tuple[str, ...] = ()
+    default_vibe_tag: str = ''
+
+
+# ===== ORTAK KURALLAR =====
+
+def reject_closed_status(place: dict, text: PlaceText) -> Optional[str]:
+    if place.get('business_status', 'OPERATIONAL') in ('CLOSED_PERMANENTLY', 'CLOSED_TEMPORARILY'):
+        return 'KAPALI MEKAN'
+    return None
+
+
+_TEKEL_KEYWORDS = ('tekel', 'market', 'bakkal', 'büfe', 'süpermarket', 'grocery', 'liquor store', 'convenience')
+_TEKEL_TYPES = ('liquor_store', 'convenience_store', 'grocery_store', 'supermarket')
+
+
+def reject_tekel(place: dict, text: PlaceText) -> Optional[str]:
+    if any(t in text.types_str for t in _TEKEL_TYPES) or any(k in text.norm for k in _TEKEL_KEYWORDS):
+        return 'TEKEL'
+    return None
+
+
+def photo_url_for(place: dict, api_key: str) -> Optional[str]:
+    photos = place.get('photos') or []
+    photo_ref = photos[0].get('photo_reference', '') if photos else ''
+    if not photo_ref:
+        return None
+    return f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={api_key}"
+
+
+def maps_search_url(name: str, address: str) -> str:
+    maps_query = urllib.parse.quote(f"{name} {address}")
+    return f"https://www.google.com/maps/search/?api=1&query={maps_query}"
+
+
+def review_match_score(rating: float, review_count: int) -> int:
+    return min(95, int(rating * 20 + min(review_count / 50, 10)))
+
+
+# ===== İŞ ÇIKIŞI BİRA & KOKTEYL =====
+
+_BAR_EXCLUDED_KEYWORDS = ('meyhane', 'ocakbaşı', 'kebap', 'kebapçı', 'köfte', 'balık', 'fasıl', 'türkü', 'lokanta', 'restoran', 'restaurant')
+
+
+def _reject_bar_keyword(place: dict, text: PlaceText) -> Optional[str]:
+    if any(kw in text.lower for kw in _BAR_EXCLUDED_KEYWORDS):
+        return 'BAR FILTER'
+    return None
+
+
+def _build_bar_venue(place: dict, bar_type: str, config: CategoryConfig, ctx: dict) -> dict:
+    place_id = place.get('place_id', '')
+    place_name = place.get('name', '')
+    rating = place.get('rating', 0)
+    review_count = place.get('user_ratings_total', 0)
+    price_map = {0: '₺', 1: '₺₺', 2: '₺₺₺', 3: '₺₺₺₺', 4: '₺₺₺₺₺'}
+    return {
+        'id': place_id,
+        'name': place_name,
+        'base_description': f"{place_name}, {bar_type.lower()} konseptinde iş çıkışı için ideal bir mekan.",
+        'imageUrl': photo_url_for(place, ctx['api_key']) or 'https://images.unsplash.com/photo-1514933651103-005eec06c04b?w=800',
+        'category': config.name,
+        'barType': bar_type,
+        'vibeTags': ['#İşÇıkışı', f'#{bar_type.replace(" ", "").replace("/", "")}', '#AfterWork'],
+        'address': place.get('formatted_address', '') or place.get('vicinity', ''),
+        'priceRange': price_map.get(place.get('price_level', 2), '₺₺₺'),
+        'googleRating': rating,
+        'googleReviewCount': review_count,
+        'matchScore': review_match_score(rating, review_count),
+        'noiseLevel': 65,
+        'googleMapsUrl': f"https://www.google.com/maps/place/?q=place_id:{place_id}",
+        'website': '',
+        'hours': place.get('opening_hours', {}).get('weekday_text', []),
+    }
+
+
+BAR_CONFIG = CategoryConfig(
+    name='İş Çıkışı Bira & Kokteyl',
+    emoji='🍺',
+    queries=(
+        ('pub', 'Pub'),
+        ('irish pub', 'Irish Pub'),
+        ('craft beer bar', 'Craft Beer'),
+        ('cocktail bar', 'Kokteyl Bar'),
+        ('blues bar rock bar', 'Blues/Rock Bar'),
+        ('gastropub', 'Gastropub'),
+        ('beer garden bira bahçesi', 'Bira Bahçesi'),
+        ('sports bar', 'Sports Bar'),
+        ('live music bar canlı müzik bar', 'Canlı Müzik'),
+    ),
+    place_type='bar',
+    label_field='barType',
+    build_venue=_build_bar_venue,
+    min_rating=3.8,
+    min_reviews=20,
+    reject_rules=(_reject_bar_keyword,),
+    max_candidates=15,
+    sort_by_rating=False,
+    default_vibe_tag='#AfterWork',
+    default_atmosphere={
+        'noiseLevel': 'Canlı',
+        'lighting': 'Loş',
+        'energy': 'Enerjik',
+        'idealFor': ['iş çıkışı', 'arkadaşlarla'],
+        'notIdealFor': [],
+        'oneLiner': 'İş çıkışı için ideal bir bar.'
+    },
+    fallback_atmosphere={
+        'noiseLevel': 'Canlı',
+        'lighting': 'Loş',
+        'energy': 'Enerjik',
+        'idealFor': ['iş çıkışı'],
+        'notIdealFor': [],
+        'oneLiner': 'İş çıkışı için ideal bir bar.'
+    },
+    error_message='Bar mekanları getirilirken hata',
+    prompt_preferences='İş çıkışı, bira, kokteyl, pub, after-work drinks',
+    practical_keywords=('rezervasyon', 'fiyat', 'pahalı', 'ucuz', 'servis', 'garson', 'atmosfer',
+                        'müzik', 'kalabalık', 'sakin', 'happy hour', 'canlı', 'kokteyl', 'bira'),
+    prompt_schema="""Her mekan için analiz yap ve JSON döndür:
+{
+  "name": "Mekan Adı",
+  "description": "2 cümle Türkçe - mekanın öne çıkan özelliği, atmosferi",
+  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
+  "instagramUsername": "kullanici_adi" | null,
+  "practicalInfo": {
+    "reservationNeeded": "Tavsiye Edilir" | "Şart" | "Gerekli Değil" | null,
+    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
+    "happyHour": "Var" | "Yok" | null,
+    "outdoorSeating": true | false | null,
+    "liveMusic": true | false | null,
+    "sportsTv": true | false | null,
+    "mustTry": "Önerilen içecek" | null
+  },
+  "atmosphereSummary": {
+    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı" | "Gürültülü",
+    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
+    "energy": "Sakin" | "Dengeli" | "Enerjik",
+    "idealFor": ["iş çıkışı", "arkadaşlarla buluşma"],
+    "notIdealFor": ["romantik akşam"],
+    "oneLiner": "Bir cümle özet"
+  }
+}
+
+instagramUsername Kuralları:
+- Mekanın resmi Instagram hesabını bul (@ işareti olmadan sadece kullanıcı adı)
+- Türkiye'deki barların Instagram'ı genellikle bar_ismi, barismi, barismi_sehir formatındadır
+- Örnek: "Reset Pub" → "resetpub", "Varuna Gezgin" → "varunagezgin"
+- Bilinen popüler barların Instagram'ını ver. Emin olmadığın için null yaz.
+
+SADECE JSON array döndür, başka açıklama ekleme. [{}, {}, ...]""",
+)
+
+
+# ===== SOKAK LEZZETİ =====
+
+def _build_street_food_venue(place: dict, food_type: str, config: CategoryConfig, ctx: dict) -> dict:
+    place_name = place.get('name', '')
+    # Nearby Search'te vicinity, Text Search'te formatted_address
+    place_address = place.get('vicinity', '') or place.get('formatted_address', '')
+    rating = place.get('rating', 0)
+    review_count = place.get('user_ratings_total', 0)
+    opening_hours = place.get('opening_hours', {})
+    price_map = {0: '$', 1: '$', 2: '$$', 3: '$$$', 4: '$$$$'}
+    return {
+        'id': place.get('place_id', ''),
+        'name': place_name,
+        'base_description': f"{place_name}, {food_type.lower()} konusunda bölgenin en sevilen sokak lezzeti duraklarından biri.",
+        'imageUrl': photo_url_for(place, ctx['api_key']) or 'https://images.unsplash.com/photo-1565299624946-b28f40a0ae38?w=800',
+        'category': config.name,
+        'vibeTags': ['#SokakLezzeti', f'#{food_type.replace(" ", "")}', '#Yerel'],
+        'address': place_address,
+        'priceRange': price_map.get(place.get('price_level', 1), '$'),
+        'googleRating': rating,
+        'googleReviewCount': review_count,
+        'matchScore': review_match_score(rating, review_count),
+        'noiseLevel': 55,
+        'googleMapsUrl': maps_search_url(place_name, place_address),
+        'foodType': food_type,
+        'weeklyHours': opening_hours.get('weekday_text', []),
+        'isOpenNow': opening_hours.get('open_now', None),
+        'website': '',
+        'phoneNumber': ''
+    }
+
+
+STREET_FOOD_CONFIG = CategoryConfig(
+    name='Sokak Lezzeti',
+    emoji='🌯',
+    queries=(
+        ('kokoreç', 'Kokoreç'),
+        ('tantuni', 'Tantuni'),
+        ('midye dolma', 'Midye'),
+        ('lahmacun', 'Lahmacun'),
+        ('pide', 'Pide'),
+        ('döner dürüm', 'Döner'),
+        ('balık ekmek', 'Balık Ekmek'),
+        ('çiğ köfte', 'Çiğ Köfte'),
+        ('ciğer kebap', 'Ciğer'),
+        ('söğüş işkembe', 'Söğüş'),
+    ),
+    place_type='restaurant',
+    label_field='foodType',
+    build_venue=_build_street_food_venue,
+    min_rating=4.2,
+    min_reviews=20,
+    reject_rules=(reject_tekel,),
+    gm_category_id='sokak-lezzeti',
+    gm_enrich=True,
+    default_vibe_tag='#SokakLezzeti',
+    default_atmosphere={
+        'noiseLevel': 'Canlı',
+        'lighting': 'Aydınlık',
+        'privacy': 'Açık Alan',
+        'energy': 'Enerjik',
+        'idealFor': ['hızlı öğün', 'gece atıştırmalığı'],
+        'notIdealFor': ['romantik akşam'],
+        'oneLiner': 'Sokak lezzeti deneyimi sunan popüler bir mekan.'
+    },
+    fallback_atmosphere={
+        'noiseLevel': 'Canlı',
+        'lighting': 'Aydınlık',
+        'privacy': 'Açık Alan',
+        'energy': 'Enerjik',
+        'idealFor': ['hızlı öğün'],
+        'notIdealFor': [],
+        'oneLiner': 'Sokak lezzeti deneyimi sunan popüler bir mekan.'
+    },
+    error_message='Sokak lezzetleri getirilirken hata',
+    prompt_preferences='Sokak lezzeti, hızlı yemek, yerel lezzetler',
+    prompt_label='Lezzet',
+    practical_keywords=('otopark', 'park', 'vale', 'valet', 'rezervasyon', 'bekle', 'sıra', 'kuyruk',
+                        'kalabalık', 'sakin', 'sessiz', 'gürültü', 'çocuk', 'bebek', 'aile',
+                        'vejetaryen', 'vegan', 'alkol', 'rakı', 'şarap', 'bira', 'servis',
+                        'hızlı', 'yavaş', 'pahalı', 'ucuz', 'fiyat', 'hesap', 'bahçe', 'teras', 'dış mekan', 'nakit'),
+    prompt_schema="""Her mekan için analiz yap ve JSON döndür:
+{
+  "name": "Mekan Adı",
+  "description": "2 cümle Türkçe - mekanın öne çıkan özelliği, imza lezzeti",
+  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
+  "instagramUsername": "kullanici_adi" | null,
+  "practicalInfo": {
+    "reservationNeeded": null,
+    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
+    "waitTime": "Bekleme yok" | "10-15 dk" | "20-30 dk" | null,
+    "parking": "Kolay" | "Zor" | "Otopark var" | "Yok" | null,
+    "hasValet": true | false | null,
+    "outdoorSeating": true | false | null,
+    "kidFriendly": true | false | null,
+    "vegetarianOptions": true | false | null,
+    "alcoholServed": false,
+    "serviceSpeed": "Hızlı" | "Normal" | "Yavaş" | null,
+    "priceFeeling": "Fiyatına Değer" | "Biraz Pahalı" | "Uygun" | null,
+    "mustTry": "İmza yemek" | null,
+    "headsUp": "Önemli uyarı (sadece nakit, vs.)" | null
+  },
+  "atmosphereSummary": {
+    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı" | "Gürültülü",
+    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
+    "privacy": "Özel" | "Yarı Özel" | "Açık Alan",
+    "energy": "Sakin" | "Dengeli" | "Enerjik",
+    "idealFor": ["hızlı öğün", "gece atıştırmalığı", "arkadaş buluşması"],
+    "notIdealFor": ["romantik akşam"],
+    "oneLiner": "Tek cümle Türkçe atmosfer özeti"
+  }
+}
+
+practicalInfo Kuralları (YORUMLARDAN ÇIKAR):
+- reservationNeeded: Sokak lezzeti için genelde null (rezervasyon olmaz)
+- crowdLevel: "Kalabalık", "sıra var" → "Kalabalık". "Sakin" → "Sakin"
+- waitTime: "Sıra", "kuyruk", "bekledik" → süreyi tahmin et
+- parking: "Otopark", "park yeri" → "Otopark var". "Park zor", "park yok" → "Zor". "Park kolay" → "Kolay". Sokak lezzeti genelde "Zor" veya null
+- hasValet: "Vale", "valet" → true. Sokak lezzeti için genelde null
+- serviceSpeed: Sokak lezzeti genelde "Hızlı"
+- priceFeeling: "Ucuz", "uygun" → "Uygun". "Pahalı" → "Biraz Pahalı"
+- mustTry: Yorumlarda en çok övülen yemek
+- headsUp: Sadece nakit, temizlik uyarısı vb.
+
+atmosphereSummary Kuralları:
+- noiseLevel: Sokak lezzeti genelde "Canlı" veya "Gürültülü"
+- lighting: Sokak lezzeti genelde "Aydınlık"
+- privacy: Sokak lezzeti genelde "Açık Alan"
+- energy: Sokak lezzeti genelde "Enerjik"
+- idealFor: Max 3 - "hızlı öğün", "gece atıştırmalığı", "arkadaş buluşması", "ekonomik yemek"
+- notIdealFor: Max 2 - "romantik akşam", "iş yemeği", "özel gün"
+- oneLiner: Tek cümle atmosfer özeti
+
+instagramUsername Kuralları:
+- Mekanın resmi Instagram hesabını bul (@ işareti olmadan sadece kullanıcı adı)
+- Türkiye'deki mekanların Instagram'ı genellikle mekan_ismi, mekanadi, mekanismi_sehir formatındadır
+- Örnek: "Şampiyon Kokoreç" → "sampiyonkokorec" veya "sampiyon_kokorec"
+- Bilinen popüler mekanların Instagram'ını ver. Emin olmadığın için null yaz.
+
+SADECE JSON ARRAY döndür, başka açıklama yazma.""",
+)
+
+
+# ===== 3. NESİL KAHVECİ =====
+
+_CHAIN_COFFEE_KEYWORDS = ('starbucks', 'kahve dunyasi', 'tchibo', 'gloria jeans', 'caribou', 'costa coffee', 'dunkin', 'mcdonald', 'burger king')
+
+
+def _reject_chain_coffee(place: dict, text: PlaceText) -> Optional[str]:
+    if any(k in text.norm for k in _CHAIN_COFFEE_KEYWORDS):
+        return 'CHAIN'
+    return None
+
+
+def _build_coffee_venue(place: dict, coffee_type: str, config: CategoryConfig, ctx: dict) -> dict:
+    place_name = place.get('name', '')
+    place_address = place.get('vicinity', '') or place.get('formatted_address', '')
+    price_map = {0: '$', 1: '$', 2: '$$', 3: '$$$', 4: '$$$$'}
+    return {
+        'id': place.get('place_id', ''),
+        'name': place_name,
+        'tagline': f'{coffee_type} Coffee',
+        'base_description': f'{place_name} - Nitelikli kahve deneyimi sunan özel kahveci.',
+        'address': place_address,
+        'priceRange': price_map.get(place.get('price_level', 2), '$$'),
+        'imageUrl': photo_url_for(place, ctx['api_key']),
+        'googleMapsUrl': maps_search_url(place_name, place_address),
+        'googleRating': place.get('rating', 0),
+        'googleReviewCount': place.get('user_ratings_total', 0),
+        'coffeeType': coffee_type,
+        'category': config.name,
+        'matchScore': 85,
+        'noiseLevel': 'Sakin',
+        'vibeTags': ['#SpecialtyCoffee', '#ThirdWave', '#Kahveci'],
+    }
+
+
+def _build_coffee_prompt(venues: list, config: CategoryConfig, ctx: dict) -> str:
+    venue_names = ', '.join(v['name'] for v in venues)
+    return f"""Sen bir specialty coffee uzmanısın. Aşağıdaki kahveciler için detaylı Türkçe bilgiler ver.
+
+Kahveciler: {venue_names}
+Şehir: {ctx['city']}
+
+""" + config.prompt_schema
+
+
+SPECIALTY_COFFEE_CONFIG = CategoryConfig(
+    name='3. Nesil Kahveci',
+    emoji='☕',
+    queries=(
+        ('specialty coffee', 'Specialty'),
+        ('third wave coffee', 'Third Wave'),
+        ('coffee roastery', 'Roastery'),
+        ('artisan coffee', 'Artisan'),
+        ('butik kahveci', 'Butik'),
+        ('filter coffee', 'Filter'),
+        ('pour over coffee', 'Pour Over'),
+    ),
+    place_type='cafe',
+    label_field='coffeeType',
+    build_venue=_build_coffee_venue,
+    min_rating=4.0,
+    min_reviews=10,
+    reject_rules=(reject_closed_status, _reject_chain_coffee),
+    gm_category_id='23',
+    per_query_limit=3,
+    sort_by_rating=False,
+    extended_details=True,
+    default_vibe_tag='#SpecialtyCoffee',
+    default_atmosphere={},
+    fallback_atmosphere={},
+    error_message='Specialty coffee mekanları getirilirken hata',
+    prompt_builder=_build_coffee_prompt,
+    prompt_schema="""Her kahveci için JSON formatında şu bilgileri ver:
+{
+  "name": "Mekan adı",
+  "instagramUsername": "Instagram kullanıcı adı (@ olmadan, bilmiyorsan null)",
+  "description": "Kahveci hakkında kısa açıklama (max 150 karakter)",
+  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
+  "practicalInfo": {
+    "mustTry": "Mutlaka denenmesi gereken içecek/yiyecek",
+    "headsUp": "Dikkat edilmesi gereken bir şey varsa (yoksa null)"
+  },
+  "atmosphereSummary": {
+    "noiseLevel": "Sessiz/Sakin/Canlı/Gürültülü",
+    "lighting": "Loş/Yumuşak/Aydınlık",
+    "privacy": "Mahrem/Yarı Açık/Açık Alan",
+    "energy": "Dingin/Dengeli/Enerjik",
+    "idealFor": ["kahve molası", "çalışma", "arkadaş buluşması"],
+    "notIdealFor": ["iş yemeği", "aile yemeği"],
+    "oneLiner": "Tek cümlelik atmosfer özeti"
+  }
+}
+
+Kahveci için uygun vibeTags örnekleri: #SpecialtyCoffee, #V60, #Chemex, #FilterKahve, #Espresso, #LatteSanatı, #KahveMolası, #ÇalışmaDostu, #SakinOrtam, #KitapKahve
+
+ÖNEMLİ: Instagram kullanıcı adını biliyorsan yaz (örn: "kronotropcoffee", "petraroastingco"), bilmiyorsan null yaz.
+
+SADECE JSON ARRAY döndür, başka açıklama yazma.""",
+)
+
+
+# ===== EĞLENCE & PARTİ =====
+
+# NOT: "gazino" kaldırıldı - Türk kültüründe geleneksel eğlence mekanları (canlı müzik, fasıl)
+_PAVYON_KEYWORDS = (
+    'pavyon', 'konsomatris', 'casino', 'kabare', 'cabaret',
+    'gece alemi', 'eglence merkezi', 'dans bar', 'show bar',
+    'strip', 'striptiz', 'hostess', 'escort', 'masaj salonu',
+    'gentlemen', 'club 18', 'club18', 'adult', 'yetiskin'
+)
+_DANCE_SCHOOL_KEYWORDS = (
+    'dans kursu', 'dans okulu', 'dans toplulugu', 'dans atolyesi',
+    'dance school', 'dance studio', 'dance class', 'dance academy',
+    'salsa kursu', 'tango kursu', 'bale', 'ballet', 'zumba',
+    'latin dans', 'halk danslari', 'folklor', 'halk dansi', 'tango egitimi',
+    'dans egitimi', 'dans dersi', 'swing', 'bachata', 'kizomba',
+    'ksk-d', 'kskd'  # Karşıyaka Spor Kulübü Dans
+)
+_DANCE_TYPES = ('dance_studio', 'dance_school', 'gym', 'fitness_center')
+_OUTDOOR_KEYWORDS = (
+    'sahil', 'sahili', 'plaj', 'plaji', 'beach', 'koy', 'koyu',
+    'park', 'parki', 'bahce', 'bahcesi', 'garden',
+    'kordon', 'iskele', 'marina', 'liman'
+)
+_OUTDOOR_TYPES = ('park', 'natural_feature', 'tourist_attraction', 'beach')
+_MUSIC_SCHOOL_KEYWORDS = (
+    'muzik merkezi', 'müzik merkezi', 'muzik okulu', 'müzik okulu',
+    'konservatuar', 'conservatory', 'music school', 'music center',
+    'muzik kursu', 'müzik kursu', 'enstruman', 'enstrüman',
+    'piyano kursu', 'gitar kursu', 'keman kursu', 'bateri kursu',
+    'ses egitimi', 'vokal', 'koro', 'choir'
+)
+_PARTY_STORE_KEYWORDS = (
+    'parti malzemeleri', 'parti malzemesi', 'party malzemeleri',
+    'dogum gunu malzemeleri', 'doğum günü malzemeleri', 'dogum gunu',
+    'parti evi', 'party evi', 'party store', 'party shop',
+    'balon', 'baloncu', 'balloon', 'parti susleme', 'parti süsleme',
+    'kostum', 'kostüm', 'costume', 'maske', 'parti aksesuar',
+    'parti dekor', 'dekorasyon malzemesi', 'kutlama malzemeleri'
+)
+_PARTY_STORE_TYPES = ('store', 'shopping_mall', 'home_goods_store', 'furniture_store')
+_PARTY_POSITIVE_TYPES = ('night_club', 'casino')
+_PARTY_POSITIVE_KEYWORDS = ('club', 'lounge', 'dj', 'party', 'disco', 'gece', 'beach', 'plaj')
+_NON_PARTY_TYPES = ('restaurant', 'cafe', 'meal_takeaway', 'bakery')
+_SERVICE_KEYWORDS = (
+    'dj team', 'dj hizmeti', 'dj kiralama', 'düğün dj', 'dugun dj',
+    'organizasyon', 'event planner', 'etkinlik', 'after party',
+    'ses sistemi', 'ışık sistemi', 'isik sistemi', 'sahne kiralama',
+    'catering', 'ikram hizmeti', 'parti organizasyon'
+)
+_SERVICE_TYPES = ('event_planner', 'wedding_service', 'catering_service')
+
+
+def _reject_pavyon(place: dict, text: PlaceText) -> Optional[str]:
+    if any(k in text.norm for k in _PAVYON_KEYWORDS) or any(k in text.types_str for k in _PAVYON_KEYWORDS):
+        return 'PAVYON'
+    return None
+
+
+def _reject_dance_school(place: dict, text: PlaceText) -> Optional[str]:
+    is_dance_school = any(k in text.norm for k in _DANCE_SCHOOL_KEYWORDS)
+    is_dance_type = any(t in text.types_str for t in _DANCE_TYPES)
+    if is_dance_school or (is_dance_type and 'bar' not in text.types_str and 'night_club' not in text.types_str):
+        return 'DANS KURSU'
+    return None
+
+
+def _reject_music_school(place: dict, text: PlaceText) -> Optional[str]:
+    if any(k in text.norm for k in _MUSIC_SCHOOL_KEYWORDS):
+        return 'MÜZİK OKULU'
+    return None
+
+
+def _reject_party_store(place: dict, text: PlaceText) -> Optional[str]:
+    by_name = any(k in text.norm for k in _PARTY_STORE_KEYWORDS)
+    by_type = any(t in text.types_str for t in _PARTY_STORE_TYPES) and not any(t in text.types_str for t in ('bar', 'night_club', 'restaurant'))
+    if by_name or (by_type and 'malzeme' in text.norm):
+        return 'PARTİ MALZEMELERİ DÜKKANI'
+    return None
+
+
+def _reject_outdoor(place: dict, text: PlaceText) -> Optional[str]:
+    # Beach club, plaj club gibi mekanlar OK - sadece "sahil", "plaj" gibi açık alanlar reject
+    is_outdoor = any(k in text.norm for k in _OUTDOOR_KEYWORDS) or any(t in text.types_str for t in _OUTDOOR_TYPES)
+    has_club_keyword = 'club' in text.norm or 'kulup' in text.norm
+    if is_outdoor and not has_club_keyword and 'bar' not in text.types_str and 'night_club' not in text.types_str:
+        return 'SAHİL/PARK'
+    return None
+
+
+def _reject_just_restaurant(place: dict, text: PlaceText) -> Optional[str]:
+    is_party_type = any(t in text.types_str for t in _PARTY_POSITIVE_TYPES)
+    has_party_keyword = any(k in text.norm for k in _PARTY_POSITIVE_KEYWORDS)
+    is_just_restaurant = any(t in text.types_str for t in _NON_PARTY_TYPES) and not is_party_type and not has_party_keyword
+    if is_just_restaurant and 'bar' not in text.types_str:
+        return 'RESTORAN/KAFE'
+    return None
+
+
+def _reject_service_company(place: dict, text: PlaceText) -> Optional[str]:
+    by_name = any(k in text.norm for k in _SERVICE_KEYWORDS)
+    by_type = any(t in text.types for t in _SERVICE_TYPES)
+    # "DJ" kelimesi + night_club/bar tipi yoksa hizmet firması
+    is_actual_venue = any(t in text.types for t in ('night_club', 'bar', 'restaurant', 'cafe'))
+    if by_name or by_type or ('dj' in text.norm and not is_actual_venue):
+        return 'HİZMET FİRMASI'
+    return None
+
+
+def _build_party_venue(place: dict, venue_type: str, config: CategoryConfig, ctx: dict) -> dict:
+    place_name = place.get('name', '')
+    place_address = place.get('vicinity', '') or place.get('formatted_address', '')
+    opening_hours = place.get('opening_hours', {})
+    hours_list = opening_hours.get('weekday_text', [])
+    price_map = {0: '$$', 1: '$$', 2: '$$', 3: '$$$', 4: '$$$$'}
+    vibe_tags = ['#Eğlence', f'#{venue_type.replace(" ", "")}', '#GeceHayatı']
+    if venue_type == 'Beach Club':
+        vibe_tags.append('#BeachClub')
+    return {
+        'id': place.get('place_id', ''),
+        'name': place_name,
+        'base_description': f"{place_name}, {ctx['search_location']} bölgesinin popüler {venue_type.lower()} mekanlarından biri.",
+        'imageUrl': photo_url_for(place, ctx['api_key']) or 'https://images.unsplash.com/photo-1566737236500-c8ac43014a67?w=800',
+        'category': config.name,
+        'vibeTags': vibe_tags,
+        'address': place_address,
+        'priceRange': price_map.get(place.get('price_level', 2), '$$'),
+        'googleRating': place.get('rating', 0),
+        'googleReviewCount': place.get('user_ratings_total', 0),
+        'matchScore': 0,  # Yorumlar geldikten sonra _party_after_details hesaplar
+        'noiseLevel': 75,
+        'googleMapsUrl': maps_search_url(place_name, place_address),
+        'website': '',  # Legacy API Nearby Search'te website gelmez
+        'phoneNumber': '',
+        'hours': hours_list[0] if hours_list else '',
+        'weeklyHours': hours_list,
+        'isOpenNow': opening_hours.get('open_now', None),
+        'venueType': venue_type
+    }
+
+
+_PARTY_REVIEW_KEYWORDS = ('parti', 'party', 'dj', 'eğlence', 'dans', 'dance', 'canlı müzik', 'gece')
+
+
+def _party_after_details(venue: dict, reviews: list, config: CategoryConfig) -> None:
+    """Yorumlardaki parti sinyallerinden bonus puan ve vibe tag'leri türet."""
+    texts = [r.get('text', '').lower() for r in reviews]
+    party_keyword_matches = sum(1 for t in texts if any(kw in t for kw in _PARTY_REVIEW_KEYWORDS))
+    party_bonus = min(15, party_keyword_matches * 3)  # Her keyword için +3, max +15
+
+    rating = venue.get('googleRating', 0)
+    review_count = venue.get('googleReviewCount', 0)
+    venue['matchScore'] = min(98, int(rating * 18 + min(review_count / 100, 15) + party_bonus))
+
+    all_review_text = ' '.join(texts)
+    if 'dj' in all_review_text:
+        venue['vibeTags'].append('#DJ')
+    if 'canlı müzik' in all_review_text or 'canli muzik' in all_review_text or 'live music' in all_review_text:
+        venue['vibeTags'].append('#CanlıMüzik')
+    if 'dans' in all_review_text or 'dance' in all_review_text:
+        venue['vibeTags'].append('#Dans')
+
+
+PARTY_CONFIG = CategoryConfig(
+    name='Eğlence & Parti',
+    emoji='🪩',
+    queries=(
+        ('nightclub gece kulübü club', 'Gece Kulübü'),
+        ('DJ party club', 'DJ & Party'),
+        ('beach club party', 'Beach Club'),
+        ('dance club elektronik müzik', 'Dans Kulübü'),
+        ('rooftop bar party', 'Rooftop'),
+        ('club lounge DJ', 'Lounge Club'),
+    ),
+    place_type='night_club',
+    label_field='venueType',
+    build_venue=_build_party_venue,
+    min_rating=3.5,
+    min_reviews=5,
+    reject_rules=(
+        reject_closed_status, _reject_pavyon, _reject_dance_school, _reject_music_school,
+        _reject_party_store, _reject_outdoor, _reject_just_restaurant, reject_tekel, _reject_service_company,
+    ),
+    after_details=_party_after_details,
+    default_vibe_tag='#Eğlence',
+    default_atmosphere={
+        'noiseLevel': 'Gürültülü',
+        'lighting': 'Loş',
+        'privacy': 'Açık Alan',
+        'energy': 'Enerjik',
+        'idealFor': ['parti gecesi', 'dans'],
+        'notIdealFor': ['romantik akşam'],
+        'oneLiner': 'Enerjik parti atmosferi sunan popüler bir mekan.'
+    },
+    fallback_atmosphere={
+        'noiseLevel': 'Gürültülü',
+        'lighting': 'Loş',
+        'privacy': 'Açık Alan',
+        'energy': 'Enerjik',
+        'idealFor': ['parti gecesi'],
+        'notIdealFor': [],
+        'oneLiner': 'Enerjik parti atmosferi sunan popüler bir mekan.'
+    },
+    error_message='Eğlence mekanları getirilirken hata',
+    prompt_preferences='Gece hayatı, dans, parti, eğlence',
+    practical_keywords=('otopark', 'park', 'vale', 'valet', 'rezervasyon', 'bekle', 'sıra', 'kuyruk',
+                        'kalabalık', 'sakin', 'sessiz', 'gürültü', 'dress code', 'yaş', 'giriş',
+                        'alkol', 'kokteyl', 'bira', 'servis', 'dj', 'müzik', 'dans',
+                        'hızlı', 'yavaş', 'pahalı', 'ucuz', 'fiyat', 'hesap', 'bahçe', 'teras'),
+    prompt_schema="""Her mekan için analiz yap ve JSON döndür:
+{
+  "name": "Mekan Adı",
+  "description": "2 cümle Türkçe - mekanın parti atmosferi, DJ/müzik tarzı",
+  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
+  "instagramUsername": "kullanici_adi" | null,
+  "practicalInfo": {
+    "reservationNeeded": "Tavsiye Edilir" | "Şart" | "Gerekli Değil" | null,
+    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
+    "waitTime": "Bekleme yok" | "10-15 dk" | "20-30 dk" | null,
+    "parking": "Kolay" | "Zor" | "Otopark var" | "Yok" | null,
+    "hasValet": true | false | null,
+    "outdoorSeating": true | false | null,
+    "kidFriendly": false,
+    "vegetarianOptions": null,
+    "alcoholServed": true,
+    "serviceSpeed": "Hızlı" | "Normal" | "Yavaş" | null,
+    "priceFeeling": "Fiyatına Değer" | "Biraz Pahalı" | "Uygun" | null,
+    "mustTry": "İmza kokteyl veya deneyim" | null,
+    "headsUp": "Önemli uyarı (dress code, yaş sınırı, vs.)" | null
+  },
+  "atmosphereSummary": {
+    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı" | "Gürültülü",
+    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
+    "privacy": "Özel" | "Yarı Özel" | "Açık Alan",
+    "energy": "Sakin" | "Dengeli" | "Enerjik",
+    "idealFor": ["parti gecesi", "dans", "arkadaş grubu"],
+    "notIdealFor": ["romantik akşam", "sessiz sohbet"],
+    "oneLiner": "Tek cümle Türkçe atmosfer özeti"
+  }
+}
+
+practicalInfo Kuralları (YORUMLARDAN ÇIKAR):
+- reservationNeeded: VIP/masa için "Şart", genel giriş için "Gerekli Değil"
+- crowdLevel: Gece kulübü genelde "Kalabalık"
+- parking: "Otopark", "park yeri" → "Otopark var". "Park zor", "park yok" → "Zor". Gece kulübü genelde "Zor"
+- hasValet: "Vale", "valet" → true. Yoksa null veya false
+- kidFriendly: Gece kulübü/bar için HER ZAMAN false
+- alcoholServed: Gece kulübü/bar için HER ZAMAN true
+- headsUp: Dress code, yaş sınırı (21+), giriş ücreti vb.
+
+atmosphereSummary Kuralları:
+- noiseLevel: Gece kulübü genelde "Gürültülü", lounge "Canlı"
+- lighting: Gece kulübü genelde "Loş"
+- privacy: Genelde "Açık Alan" veya "Yarı Özel"
+- energy: Parti mekanı genelde "Enerjik"
+- idealFor: Max 3 - "parti gecesi", "dans", "arkadaş grubu", "bekarlığa veda", "DJ gecesi"
+- notIdealFor: Max 2 - "romantik akşam", "sessiz sohbet", "aile yemeği"
+- oneLiner: Tek cümle atmosfer özeti
+
+instagramUsername Kuralları:
+- Mekanın resmi Instagram hesabını bul (@ işareti olmadan sadece kullanıcı adı)
+- Gece kulüpleri genellikle: mekanadi, mekan_official, mekanistanbul formatında
+- Örnek: "Sortie" → "sortieistanbul" veya "sortie_official"
+- Bilinen popüler mekanların Instagram'ını ver. Emin olmadığın için null yaz.
+
+SADECE JSON ARRAY döndür, başka açıklama yazma.""",
+)
+
+
+# ===== VARSAYILAN YOL (TEK NEARBY / TEXT SEARCH SORGUSU) =====
+# Registry'de olmayan mekan kategorileri generate_venues'un varsayılan yolundan geçer
+# (api/text_search_pipeline.py): tek arama sorgusu, CandidateFilter (api/candidate_rules.py)
+# ve contextScore döndüren tek Gemini batch'i. Kategoriye özgü her şey aşağıdaki tablolardadır.
+
+# Kategori -> Context mapping (context-based venue matching için)
+CATEGORY_TO_CONTEXT = {
+    "Fine Dining": "fine_dining",
+    "İlk Buluşma": "first_date",
+    "İş Yemeği": "business_meal",
+    "Muhabbet": "casual_hangout",
+    "Özel Gün": "special_occasion",
+    "Kahvaltı & Brunch": "breakfast_brunch",
+    "Aile Yemeği": "family_meal",
+    "Romantik Akşam": "romantic_dinner",
+    "İş Çıkışı Bira & Kokteyl": "after_work",
+    "Eğlence & Parti": "friends_hangout",
+    "Kafa Dinleme": "casual_hangout",
+    "3. Nesil Kahveci": "casual_hangout",
+    "Meyhane": "friends_hangout",
+    "Balıkçı": "fine_dining",
+}
+
+TEXT_SEARCH_QUERIES: Dict[str, Dict[str, str]] = {
+    # Alkollü mekan seçilirse SADECE bar, pub, restaurant, wine bar ara
+    'Alcoholic': {
+        'İlk Buluşma': 'romantic restaurant wine bar cocktail bar date night fine dining lounge rooftop',
+        'İş Yemeği': 'restaurant bar hotel lounge business lunch',
+        'Muhabbet': 'bar pub lounge restaurant wine bar',
+        'İş Çıkışı Bira & Kokteyl': 'bar pub cocktail bar beer garden',
+        'Eğlence & Parti': 'nightclub bar pub dance club beach club rooftop bar live music lounge',
+        'Özel Gün': 'fine dining restaurant wine bar romantic rooftop',
+        'Kahvaltı & Brunch': 'kahvaltı brunch restaurant bar mimosa serpme kahvaltı',
+        'Kafa Dinleme': 'lounge bar quiet restaurant',
+        'Odaklanma': 'bar restaurant lounge',
+        'Aile Yemeği': 'restaurant bar casual dining',
+        '3. Nesil Kahveci': 'butik kahveci 3. nesil kahve specialty coffee roastery kahve kavurucu',
+        'Konserler': 'live music venue concert hall bar',
+        'Sahne Sanatları': 'theater venue performance hall',
+        'Yerel Festivaller': 'festival event venue',
+        'Müze': 'museum',
+        'Galeri': 'art gallery contemporary art gallery sanat galerisi',
+        'Hafta Sonu Gezintisi': 'winery vineyard restaurant',
+        'Piknik': 'park garden outdoor',
+        'Beach Club': 'beach club bar restaurant',
+        'Plaj': 'beach bar restaurant',
+        'Adrenalin': 'adventure sports extreme',
+        'Spor': 'gym fitness yoga studio',
+        'Fine Dining': 'fine dining restaurant wine bar michelin gourmet upscale luxury tasting menu rooftop',
+        'Balıkçı': 'balık restoranı seafood restaurant rakı balık',
+        'Meyhane': 'meyhane rakı meze',
+        'Ocakbaşı': 'ocakbaşı kebap ızgara restoran mangal',
+    },
+    # Alkolsüz mekan seçilirse SADECE cafe, bakery, coffee shop ara
+    'Non-Alcoholic': {
+        'İlk Buluşma': 'romantic cafe restaurant patisserie brunch spot cozy restaurant date spot rooftop',
+        'İş Yemeği': 'business lunch cafe restaurant coffee shop',
+        'Muhabbet': 'cafe coffee shop tea house quiet cafe',
+        'İş Çıkışı Bira & Kokteyl': 'cafe coffee shop juice bar',
+        'Eğlence & Parti': 'entertainment center arcade bowling',
+        'Özel Gün': 'restaurant cafe patisserie rooftop',
+        'Kahvaltı & Brunch': 'kahvaltı breakfast brunch cafe serpme kahvaltı',
+        'Kafa Dinleme': 'quiet cafe tea house peaceful spot',
+        'Odaklanma': 'coworking space cafe library quiet study',
+        'Aile Yemeği': 'family restaurant cafe casual dining',
+        '3. Nesil Kahveci': 'butik kahveci 3. nesil kahve specialty coffee roastery kahve kavurucu',
+        'Konserler': 'concert hall music venue',
+        'Sahne Sanatları': 'theater venue performance hall',
+        'Yerel Festivaller': 'festival event venue',
+        'Müze': 'museum exhibition',
+        'Galeri': 'art gallery contemporary art gallery sanat galerisi',
+        'Hafta Sonu Gezintisi': 'scenic spot nature walk daytrip',
+        'Piknik': 'park garden picnic area',
+        'Beach Club': 'beach club resort',
+        'Plaj': 'beach seaside',
+        'Adrenalin': 'adventure sports extreme activities',
+        'Spor': 'gym fitness yoga studio pilates',
+        'Fine Dining': 'fine dining restaurant gourmet upscale rooftop',
+        'Ocakbaşı': 'ocakbaşı kebap ızgara restoran mangal',
+    },
+    # Any seçilirse her türlü mekan (varsayılan)
+    'Any': {
+        'İlk Buluşma': 'romantic restaurant cafe wine bar date spot fine dining cozy bistro rooftop',
+        'İş Yemeği': 'business lunch restaurant cafe meeting spot',
+        'Muhabbet': 'cafe bar lounge restaurant cozy spot conversation friendly',
+        'İş Çıkışı Bira & Kokteyl': 'bar pub cocktail bar beer garden after work drinks',
+        'Eğlence & Parti': 'nightclub bar pub dance club beach club rooftop bar live music lounge entertainment',
+        'Özel Gün': 'fine dining restaurant romantic celebration rooftop',
+        'Kahvaltı & Brunch': 'kahvaltı breakfast brunch cafe serpme kahvaltı',
+        'Kafa Dinleme': 'quiet cafe lounge peaceful spot relaxing',
+        'Odaklanma': 'coworking space cafe library quiet study',
+        'Aile Yemeği': 'family restaurant casual dining kid friendly',
+        '3. Nesil Kahveci': 'butik kahveci 3. nesil kahve specialty coffee roastery kahve kavurucu',
+        'Konserler': 'live music venue concert hall',
+        'Sahne Sanatları': 'theater venue stand up comedy performance',
+        'Yerel Festivaller': 'festival event food festival',
+        'Müze': 'museum art exhibition',
+        'Galeri': 'art gallery contemporary art gallery sanat galerisi modern art',
+        'Hafta Sonu Gezintisi': 'scenic spot nature daytrip excursion',
+        'Piknik': 'park garden picnic area green space',
+        'Beach Club': 'beach club resort pool bar',
+        'Plaj': 'beach seaside coast',
+        'Adrenalin': 'adventure sports extreme activities outdoor',
+        'Spor': 'gym fitness yoga studio pilates wellness',
+        'Fine Dining': 'fine dining restaurant upscale gourmet michelin luxury tasting menu rooftop',
+        'Meyhane': 'meyhane restaurant turkish tavern rakı meze',
+        'Balıkçı': 'balık restoranı seafood restaurant balık lokantası',
+        'Sokak Lezzeti': 'kokoreç midye balık ekmek tantuni lahmacun pide söğüş çiğköfte döner',
+        'Burger & Fast': 'burger hamburger fast food',
+        'Pizzacı': 'pizza pizzeria italian pizza',
+        'Ocakbaşı': 'ocakbaşı kebap ızgara restoran mangal',
+    },
+}
+
+NEARBY_SEARCH_TYPES: Dict[str, Tuple[str, str]] = {
+    'İlk Buluşma': ('restaurant', 'romantic restaurant wine bar rooftop'),
+    'Özel Gün': ('restaurant', 'fine dining romantic celebration rooftop'),
+    'İş Yemeği': ('restaurant', 'business lunch restaurant'),
+    'Muhabbet': ('restaurant', 'cafe bar lounge restaurant'),
+    'Kafa Dinleme': ('cafe', 'quiet cafe lounge peaceful'),
+    'Aile Yemeği': ('restaurant', 'family restaurant casual dining'),
+    'Meyhane': ('restaurant', 'meyhane turkish tavern meze'),
+    'Balıkçı': ('restaurant', 'seafood fish restaurant balık'),
+    'Ocakbaşı': ('restaurant', 'ocakbaşı kebab grill'),
+    'Kahvaltı & Brunch': ('restaurant', 'breakfast brunch kahvaltı'),
+    'İş Çıkışı Bira & Kokteyl': ('bar', 'bar pub cocktail'),
+    'Burger & Fast': ('restaurant', 'burger hamburger fast food'),
+    'Pizzacı': ('restaurant', 'pizza pizzeria'),
+    'Müze': ('museum', 'museum'),
+    'Galeri': ('art_gallery', 'art gallery'),
+    'Beach Club': ('restaurant', 'beach club'),
+    'Plaj': ('natural_feature', 'beach'),
+    'Spor': ('gym', 'gym fitness'),
+    'Odaklanma': ('cafe', 'coworking cafe quiet'),
+}
+
+# İlgisiz filtreleri atla: Spor, Etkinlik ve Deneyim kategorileri
+SKIP_VENUE_FILTER_CATEGORIES = frozenset({
+    'Spor', 'Konserler', 'Konser', 'Sahne Sanatları', 'Tiyatro', 'Yerel Festivaller',
+    'Beach Club', 'Plaj', 'Hafta Sonu Gezintisi', 'Hafta Sonu Kaçamağı', 'Piknik',
+    'Müze', 'Galeri', 'Adrenalin'
+})
+
+# Instagram'ı sadece isim + mahalle ile arayan kategoriler (diğerleri Google CSE discovery)
+SIMPLE_INSTAGRAM_CATEGORIES = frozenset({'Meyhane'})
+
+# Pratik bilgi içeren yorumlar prompt'a öncelikli seçilir (Fine Dining de kullanır)
+PRACTICAL_REVIEW_KEYWORDS = (
+    'otopark', 'park', 'vale', 'valet', 'rezervasyon', 'bekle', 'sıra', 'kuyruk',
+    'kalabalık', 'sakin', 'sessiz', 'gürültü', 'çocuk', 'bebek', 'aile',
+    'vejetaryen', 'vegan', 'alkol', 'rakı', 'şarap', 'bira', 'servis',
+    'hızlı', 'yavaş', 'pahalı', 'ucuz', 'fiyat', 'hesap', 'bahçe', 'teras', 'dış mekan',
+)
+
+# Kategori özel Gemini talimatları
+CATEGORY_INSTRUCTIONS: Dict[str, str] = {
+    # Meyhane kategorisi için özel talimat - place_types tabanlı filtreleme sonrası AI değerlendirmesi
+    'Meyhane': """
+ÖNEMLİ UYARI - MEYHANE KATEGORİSİ DEĞERLENDİRMESİ:
+Bu kategori için meyhane karakteri taşıyan mekanları değerlendir. DİKKATLİCE incele:
+- İsminde "meyhane" geçmese bile meyhane karakteri taşıyan barlar ve restoranlar (rakı/meze servisi, canlı fasıl, geleneksel atmosfer) KABUL ET (isRelevant: true)
+- Yorumlarda "rakı", "meze", "fasıl", "canlı müzik", "saz" gibi ifadeler meyhane karakterini gösterir
+- Geleneksel Türk içki kültürünü yansıtan mekanları KABUL ET
+- Sadece bar/pub konseptinde olup meyhane atmosferi olmayan yerleri REDDET (isRelevant: false)
+- Fast food, cafe, tatlıcı gibi alakasız mekanları REDDET (isRelevant: false)
+- "Leke", "Balıkçı", "Fasıl", "Meyhane" gibi kelimeler genellikle meyhane karakteri taşır
+""",
+    'İş Çıkışı Bira & Kokteyl': """
+ÖNEMLİ UYARI - İŞ ÇIKIŞI BİRA & KOKTEYL KATEGORİSİ DEĞERLENDİRMESİ:
+Bu kategori için SADECE bar, pub, bira evi, kokteyl bar konseptinde mekanları değerlendir. DİKKATLİCE filtrele:
+
+KABUL EDİLECEK MEKANLAR (isRelevant: true):
+- Pub, bar, bira evi, gastropub, craft beer bar
+- Kokteyl barları, speakeasy barlar
+- Canlı müzikli rock/blues barları
+- After-work drinks için uygun mekanlar
+- "Pub", "Bar", "Blues", "Rock", "Beer", "Bira", "Ale", "Cocktail" gibi isimler
+
+KESINLIKLE REDDEDİLECEK MEKANLAR (isRelevant: false):
+- MEYHANE, meze evi, rakı sofraları (bunlar Meyhane kategorisine aittir!)
+- Ocakbaşı, kebapçı, ızgara restoranları
+- Balık restoranları, balıkçılar
+- Geleneksel Türk mutfağı lokantaları
+- Cafe, kahveci, tatlıcı
+- Fast food restoranları
+- "Meyhane", "Meze", "Fasıl", "Ocakbaşı", "Kebap", "Balık" içeren isimler
+
+ÖRNEKLER:
+✅ Reset Pub, Varuna Gezgin, rePublic, Mississippi Blues Bar, Craft Beer Lab → KABUL
+❌ Argo Meyhane, Alsancak Olive Meyhane, Ateş Ocakbaşı → REDDET (meyhane/ocakbaşı)
+""",
+    # Ocakbaşı kategorisi için özel talimat - isminde "ocakbaşı" geçen mekanlar
+    'Ocakbaşı': """
+ÖNEMLİ UYARI - OCAKBAŞI KATEGORİSİ DEĞERLENDİRMESİ:
+Bu kategori için SADECE isminde "Ocakbaşı" geçen VE Google rating'i 3.9 ve üzeri olan restoranları kabul et!
+
+KABUL EDİLECEK MEKANLAR (isRelevant: true):
+- İsminde "Ocakbaşı" kelimesi GEÇEN restoranlar
+- Google rating'i 3.9 veya üzeri olan mekanlar
+- Örnek: "Ateş Ocakbaşı" (4.2), "Ali Baba Ocakbaşı" (4.0), "Tarihi Ocakbaşı" (4.5) vb.
+
+KESINLIKLE REDDEDİLECEK MEKANLAR (isRelevant: false):
+- İsminde "Ocakbaşı" kelimesi GEÇMEYEN restoranlar
+- Google rating'i 3.9'un ALTINDA olan mekanlar (düşük puanlı yerler)
+- Sadece kebapçı, ızgara, mangal konseptli ama isminde Ocakbaşı yazmayan yerler
+- Meyhane, balık restoranı, cafe, bar
+- Örnek: "Adana Kebap", "Köfteci Ali", "Mangal Evi" → REDDET (isminde ocakbaşı yok!)
+
+ÖRNEKLER:
+✅ Ateş Ocakbaşı (4.2 rating), Ali Ocakbaşı (4.0 rating) → KABUL (isminde "Ocakbaşı" var VE rating >= 3.9)
+❌ Ucuz Ocakbaşı (3.5 rating) → REDDET (rating 3.9'un altında!)
+❌ Adana Sofrası, Kebapçı Mahmut → REDDET (isminde "Ocakbaşı" yok)
+""",
+}
+
+# Sadece kullanıcı ALKOLLÜ mekan istediğinde eklenen kategori talimatları
+ALCOHOLIC_CATEGORY_INSTRUCTIONS: Dict[str, str] = {
+    'Balıkçı': """
+ÖNEMLİ UYARI - BALIKÇI KATEGORİSİ ALKOL FİLTRESİ:
+Kullanıcı ALKOLLÜ balık restoranı istiyor. Aşağıdaki mekanları DİKKATLİCE değerlendir:
+- "Google Servisler:" bölümünde "Bira:✓" veya "Şarap:✓" varsa → KABUL ET (alkol servisi doğrulanmış)
+- Google verisi yoksa yorumlara bak: "rakı", "şarap", "bira", "kokteyl" → alkol var demektir
+- Sade balık lokantaları, balık evi, balıkçı dükkanı gibi alkol servisi OLMAYAN yerleri REDDET (isRelevant: false)
+- Rakı/şarap ile balık yenebilecek kaliteli restoranları tercih et
+- "Vedat'ın Balık Evi", "Çarşı Balık", "Girne Balık Evi" gibi sade balık lokantaları genellikle ALKOLSÜZ'dür, dikkat et!
+""",
+}
+
+# Alkol filtresi için genel talimat (tüm kategoriler için)
+ALCOHOL_INSTRUCTIONS: Dict[str, str] = {
+    'Alcoholic': """
+ALKOL FİLTRESİ TALİMATI (Kullanıcı ALKOLLÜ mekan istiyor):
+- "Google Servisler:" bölümünde "Bira:✓" veya "Şarap:✓" varsa → kesinlikle alcoholServed: true yaz
+- Google verisi yoksa yorumlarda "rakı", "bira", "şarap", "kokteyl" geçiyorsa → alcoholServed: true
+- Kahveci, pastane, tatlıcı, fast food gibi alkol servisi olmayan mekanlar için isRelevant: false yaz
+""",
+    'Non-Alcoholic': """
+ALKOLSÜZ FİLTRE TALİMATI (Kullanıcı ALKOLSÜZ mekan istiyor):
+- "Google Servisler:" bölümünde "Bira:✓" veya "Şarap:✓" varsa → bu mekan ALKOLLÜ, dikkatli ol
+- Bar, pub, meyhane, gece kulübü gibi alkol odaklı mekanlar için isRelevant: false yaz
+- Kafe, kahveci, pastane, aile restoranı gibi alkolsüz mekanları tercih et
+""",
+}
+
+TEXT_SEARCH_PROMPT_SCHEMA = """Her mekan için analiz yap ve JSON döndür:
+{
+  "name": "Mekan Adı",
+  "isRelevant": true/false,
+  "description": "2 cümle Türkçe - mekanın öne çıkan özelliği",
+  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
+  "instagramUrl": "https://instagram.com/kullanici_adi" | null,
+  "contextScore": {
+    "first_date": 0-100,
+    "business_meal": 0-100,
+    "casual_hangout": 0-100,
+    "fine_dining": 0-100,
+    "romantic_dinner": 0-100,
+    "friends_hangout": 0-100,
+    "family_meal": 0-100,
+    "special_occasion": 0-100,
+    "breakfast_brunch": 0-100,
+    "after_work": 0-100
+  },
+  "practicalInfo": {
+    "reservationNeeded": "Tavsiye Edilir" | "Şart" | "Gerekli Değil" | null,
+    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
+    "waitTime": "Bekleme yok" | "10-15 dk" | "20-30 dk" | null,
+    "parking": "Kolay" | "Zor" | "Otopark var" | "Yok" | null,
+    "hasValet": true | false | null,
+    "outdoorSeating": true | false | null,
+    "kidFriendly": true | false | null,
+    "vegetarianOptions": true | false | null,
+    "alcoholServed": true | false | null,
+    "hasDelivery": true | false | null,
+    "hasTakeout": true | false | null,
+    "servesBreakfast": true | false | null,
+    "servesBrunch": true | false | null,
+    "serviceSpeed": "Hızlı" | "Normal" | "Yavaş" | null,
+    "priceFeeling": "Fiyatına Değer" | "Biraz Pahalı" | "Uygun" | null,
+    "mustTry": "Yorumlarda öne çıkan yemek/içecek" | null,
+    "headsUp": "Bilmeniz gereken önemli uyarı" | null
+  },
+  "atmosphereSummary": {
+    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı" | "Gürültülü",
+    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
+    "privacy": "Özel" | "Yarı Özel" | "Açık Alan",
+    "energy": "Sakin" | "Dengeli" | "Enerjik",
+    "idealFor": ["romantik akşam", "ilk buluşma", "arkadaş buluşması"],
+    "notIdealFor": ["aile yemeği"],
+    "oneLiner": "Tek cümle Türkçe atmosfer özeti"
+  }
+}
+
+Context Skorlama Kuralları:
+- first_date: Gürültü düşük, mahremiyet yüksek, görsel olarak etkileyici mekanlar.
+- business_meal: Sessiz, hızlı servis, profesyonel atmosfer.
+- casual_hangout: Rahat, samimi, arkadaş ortamı.
+- fine_dining: Sunum kalitesi, servis, atmosfer, craft/artisan yaklaşımı. El yapımı lezzetler, butik mekan, şef konsepti = yüksek skor.
+- romantic_dinner: Loş ışık, mahremiyet, özel atmosfer.
+- friends_hangout: Enerjik, sosyal, rahat.
+- family_meal: Çocuk dostu, geniş alan, rahat menü.
+- special_occasion: Kutlama için uygun, özel deneyim sunan.
+- breakfast_brunch: Kahvaltı/brunch için uygunluk.
+- after_work: İş çıkışı için uygun, rahatlatıcı.
+
+practicalInfo Kuralları (GOOGLE SERVİSLERİ + YORUMLAR):
+ÖNEMLİ: "Google Servisler:" bölümünde yer alan bilgiler Google Places API'den geliyor ve doğrulanmış bilgidir. Bu bilgileri öncelikli kullan!
+
+- reservationNeeded: Google'da "Rezervasyon:✓" varsa "Tavsiye Edilir". Yorumlarda "şart", "çok kalabalık" → "Şart"
+- crowdLevel: "Sakin", "sessiz", "rahat" → "Sakin". "Kalabalık", "gürültülü", "dolu" → "Kalabalık"
+- waitTime: "Bekledik", "sıra", "kuyruk" → süreyi tahmin et. Hiç bahsedilmemişse null
+- parking: "Otopark", "park yeri" → "Otopark var". "Park zor", "park yok" → "Zor". "Park kolay" → "Kolay". Hiç bahsedilmemişse null
+- hasValet: "Vale", "valet" → true. Yoksa null
+- outdoorSeating: "Bahçe", "dış mekan", "teras" → true
+- kidFriendly: "Çocuklu", "aile", "çocuk menüsü" → true. "Bar", "gece kulübü" → false
+- vegetarianOptions: Google'da "Vejetaryen:✓" varsa KESİNLİKLE true yaz! Yoksa yorumlardan çıkar
+- alcoholServed: Google'da "Bira:✓" veya "Şarap:✓" varsa KESİNLİKLE true yaz! Yoksa yorumlardan "rakı", "bira", "şarap", "kokteyl" gibi kelimeler varsa true
+- serviceSpeed: "Hızlı", "geç geldi", "bekledik" → ilgili değeri seç
+- priceFeeling: "Pahalı", "ucuz", "fiyatına değer" → seç
+- mustTry: Yorumlarda en çok övülen yemek/içecek (varsa)
+- headsUp: Önemli uyarılar (nakit, kredi kartı, köpek yasak, vb.)
+- hasDelivery: Google'da "Teslimat:✓" varsa true
+- hasTakeout: Google'da "Paket:✓" varsa true
+- servesBreakfast: Google'da "Kahvaltı:✓" varsa true
+- servesBrunch: Google'da "Brunch:✓" varsa true
+
+atmosphereSummary Kuralları:
+- noiseLevel: "Sessiz" (fısıltıyla konuşulur), "Sohbet Dostu" (rahat sohbet), "Canlı" (biraz ses), "Gürültülü" (zor duyulur)
+- lighting: "Loş" (mum ışığı, romantik), "Yumuşak" (orta aydınlık), "Aydınlık" (net görüş)
+- privacy: "Özel" (köşe masalar, separeler), "Yarı Özel" (normal düzen), "Açık Alan" (yakın masalar)
+- energy: "Sakin" (dinlendirici), "Dengeli" (orta tempo), "Enerjik" (hareketli)
+- idealFor: Max 3 seçenek - "romantik akşam", "ilk buluşma", "iş yemeği", "arkadaş buluşması", "aile yemeği", "sessiz sohbet", "kutlama", "solo yemek"
+- notIdealFor: Max 2 seçenek - yukarıdaki listeden
+- oneLiner: Tek cümle Türkçe - atmosfer + kime uygun özeti. Örnek: "Loş ışıklı, samimi köşeleriyle romantik akşam yemekleri için ideal"
+
+Önemli:
+- Bir mekan birden fazla context'te yüksek skor alabilir
+- isRelevant=false olanları JSON'a DAHİL ETME
+- Skor 50'nin altındaysa o context için uygun değil demektir
+- Yorumları dikkate al (atmosfer, kalabalık, servis hakkında ipuçları içerir)
+- vibeTags Türkçe ve # ile başlamalı
+- practicalInfo: ÖNCELİKLE "Google Servisler:" bilgilerini kullan (alcoholServed, vegetarianOptions için). Yoksa yorumlardan çıkar, hiçbiri yoksa null yaz
+- instagramUrl: Mekanın resmi Instagram hesabını bul. Türkiye'deki mekanların Instagram'ı genellikle mekan_ismi, mekanadi, mekanismişehir formatındadır. Örnek: "Atakent Meyhanesi" → "https://instagram.com/atakent_meyhanesi". Bilinen popüler mekanların Instagram'ını ver. Emin olmadığın veya çok küçük/yerel mekanlar için null yaz.
+
+SADECE JSON ARRAY döndür, başka açıklama yazma."""
+
+
+@dataclass(frozen=True)
+class TextSearchConfig:
+    """Varsayılan yoldaki bir kategorinin ayarları (text_search_config ile tablolardan üretilir)."""
+    name: str
+    queries: Dict[str, str]                     # Alkol filtresi ('Any', 'Alcoholic', 'Non-Alcoholic') → Text Search sorgusu
+    place_type: str = ''                        # Nearby Search 'type' (boşsa Text Search + location bias)
+    keyword: str = ''                           # Nearby Search 'keyword'
+    radius: int = 2000
+    max_pages: int = 3
+    context_key: str = 'friends_hangout'        # contextScore içindeki bağlam (matchScore ve profil sıralaması)
+    skip_venue_filters: bool = False            # Grup / alkol / müzik / sigara / ortam tercihleri prompt'a eklenmez
+    instruction: str = ''
+    alcoholic_instruction: str = ''             # Kullanıcı ALKOLLÜ mekan istiyorsa instruction yerine
+    simple_instagram: bool = False              # find_instagram_simple (isim + mahalle) kullan
+    emoji: str = '🔍'
+    error_message: str = 'Mekan önerisi oluşturulurken hata'
+
+    @property
+    def nearby(self) -> bool:
+        """Nearby Search kullanılıyor mu (kesin lokasyon filtrelemesi için; Text Search location bias yeterli değil)."""
+        return bool(self.place_type)
+
+    def search_query(self, alcohol: str) -> str:
+        return self.queries.get(alcohol, self.queries['Any'])
+
+
+def text_search_config(category_name: str) -> TextSearchConfig:
+    """Varsayılan yol için kategori config'i; tabloda olmayan kategori adı sorgu olarak kullanılır."""
+    place_type, keyword = NEARBY_SEARCH_TYPES.get(category_name, ('', ''))
+    return TextSearchConfig(
+        name=category_name,
+        queries={alcohol: queries.get(category_name, category_name) for alcohol, queries in TEXT_SEARCH_QUERIES.items()},
+        place_type=place_type,
+        keyword=keyword,
+        radius=3000 if place_type else 2000,
+        context_key=CATEGORY_TO_CONTEXT.get(category_name, 'friends_hangout'),
+        skip_venue_filters=category_name in SKIP_VENUE_FILTER_CATEGORIES,
+        instruction=CATEGORY_INSTRUCTIONS.get(category_name, ''),
+        alcoholic_instruction=ALCOHOLIC_CATEGORY_INSTRUCTIONS.get(category_name, ''),
+        simple_instagram=category_name in SIMPLE_INSTAGRAM_CATEGORIES,
+    )
+
+
+# ===== REGISTRY =====
+CATEGORY_REGISTRY: Dict[str, CategoryConfig] = {
+    config.name: config
+    for config in (BAR_CONFIG, STREET_FOOD_CONFIG, SPECIALTY_COFFEE_CONFIG, PARTY_CONFIG)
+}
+
+
+def get_category_config(category_name: str) -> Optional[CategoryConfig]:
+    """Kategori pipeline ile servis ediliyorsa config'ini döndür."""
+    return CATEGORY_REGISTRY.get(category_name)
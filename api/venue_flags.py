@@ -0,0 +1,151 @@
+"""
+Ingest'te Hesaplanan Mekan Bayrakları (kapanmış / zincir / bar olmayan / eksik zenginleştirme)
+
+cache_clear_invalid tüm CachedVenue tablosunu Python'da dolaşıp her satırın googleReviews'ını
+kapanma ifadeleri, ismini zincir listesi için yeniden tarıyordu; aynı taramalar generator'ların
+Phase 1'inde de kopyalanmıştı. Artık:
+
+1. compute_flags: venue cache'e yazılırken (save_venues_to_cache_swr, generate_cache_dataset)
+   bayraklar bir kez hesaplanır ve CachedVenue'nun indeksli boolean kolonlarına yazılır.
+   Bayraklar kategoriye bağlıdır (zincir kontrolü sadece romantik kategorilerde, bar kontrolü
+   sadece BAR_CATEGORY'de); kategori değişirse yazımda yeniden hesaplanır.
+2. cache_clear_invalid: INVALID_Q ile tek bir toplu DELETE.
+3. Servis yolları: SERVE_EXCLUDE_Q (get_venues_with_swr, similarity, autocomplete) ya da aynı
+   koşulun SQL karşılığı SERVE_SQL (venue_search FTS5 / GIN sorguları) WHERE'de uygulanır;
+   bellekteki indeksler note_cache_write'ta is_served ile bayraklı kayıtları düşer.
+4. closed_review_keyword: cache bayrağı için kapanma taraması (tam liste).
+   generator_closed_keyword: generator'ların aday elemesi için dar liste (GENERATOR_CLOSED_KEYWORDS).
+
+Kullanım:
+    defaults.update(compute_flags(venue, category_name)._asdict())
+    CachedVenue.objects.filter(INVALID_Q).delete()
+    queryset = queryset.exclude(SERVE_EXCLUDE_Q)
+    served = [v for v in venues if is_served(v, category_name)]
+"""
+
+import operator
+import re
+from functools import reduce
+from typing import Iterable, NamedTuple, Optional, Sequence
+
+from django.db.models import Q
+
+from .venue_categories import normalize_tr
+
+
+# ===== CONFIGURATION =====
+REVIEW_SAMPLE = 5                   # Kapanma taramasında bakılan yorum sayısı (en güncel ilk 5)
+ROMANTIC_CATEGORIES = frozenset({'İlk Buluşma', 'Özel Gün', 'Fine Dining', 'Romantik Akşam'})
+BAR_CATEGORY = 'İş Çıkışı Bira & Kokteyl'
+ENRICHMENT_EXEMPT_CATEGORIES = frozenset({'Piknik'})    # Gemini'siz oluşturulur (practicalInfo / atmosphereSummary yok)
+
+CLOSED_REVIEW_KEYWORDS = (
+    'kalıcı olarak kapan', 'kalıcı olarak kapatıl', 'artık kapalı',
+    'kapandı', 'kapanmış', 'kapatıldı', 'kapatılmış',
+    'permanently closed', 'closed permanently',
+    'yeni işletme', 'isim değişti', 'yerine açıldı', 'burası artık',
+)
+# Aday elemesi (candidate_rules, venue_pipeline, Fine Dining): 'yeni işletme' / 'isim değişti' açık
+# mekanların yorumlarında da geçer, generator'lar bunlarla aday düşürmez
+GENERATOR_CLOSED_KEYWORDS = tuple(
+    k for k in CLOSED_REVIEW_KEYWORDS if k not in ('yeni işletme', 'isim değişti')
+)
+
+CHAIN_STORE_BLACKLIST = (
+    # Kahve zincirleri
+    'starbucks', 'gloria jeans', 'caribou', 'coffee bean', 'espresso lab',
+    # Fast food
+    'mcdonalds', 'burger king', 'wendys', 'kfc', 'popeyes', 'dominos', 'pizza hut',
+    'little caesars', 'papa johns', 'sbarro', 'arbys', 'taco bell', 'subway',
+    # Türk zincirleri - kafe
+    'mado', 'the house cafe', 'house cafe', 'big chefs', 'bigchefs', 'midpoint',
+    'baylan', 'divan', 'kahve dunyasi', 'kahve dünyası', 'nero', 'costa coffee',
+    # Türk zincirleri - fast food/restoran
+    'simit sarayi', 'simit sarayı', 'tavuk dunyasi', 'tavuk dünyası', 'usta donerci',
+    'komagene', 'baydoner', 'bay döner', 'burger lab', 'zuma', 'etiler', 'nusr-et',
+    # Pastane/tatlıcı zincirleri
+    'dunkin', 'krispy kreme', 'cinnabon', 'hafiz mustafa', 'hafız mustafa',
+    'incir', 'saray muhallebicisi', 'pelit', 'faruk gulluoglu', 'faruk güllüoğlu',
+    # Diğer zincirler
+    'wok to walk', 'wagamama', 'nandos', 'tgi fridays', 'chilis', 'applebees',
+    'hard rock cafe', 'planet hollywood', 'rainforest cafe', 'cheesecake factory',
+    'petra roasting', 'walter\'s coffee',
+)
+
+# BAR_CATEGORY: isimde bar olmayan kelime varsa VE bar kelimesi yoksa bayraklanır
+BAR_NAME_KEYWORDS = ('pub', 'bar', 'beer', 'bira', 'ale', 'cocktail', 'kokteyl', 'blues', 'rock', 'jazz', 'lounge')
+NON_BAR_NAME_KEYWORDS = ('meyhane', 'meze', 'fasil', 'türkü', 'turku', 'ocakbasi', 'kebap', 'köfte', 'kofte',
+                         'lokanta', 'restoran', 'balık', 'balik', 'cafe', 'kahve', '%100', 'more', 'konak pier')
+
+
+def _pattern(words: Iterable[str]):
+    # Uzun kelimeler önce: eşleşen anahtar kelime loglarda en spesifik hâliyle görünür
+    normalized = sorted({normalize_tr(w) for w in words}, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, normalized)))
+
+
+_CLOSED_RE = _pattern(CLOSED_REVIEW_KEYWORDS)
+_GENERATOR_CLOSED_RE = _pattern(GENERATOR_CLOSED_KEYWORDS)
+_CHAIN_RE = _pattern(CHAIN_STORE_BLACKLIST)
+_BAR_RE = _pattern(BAR_NAME_KEYWORDS)
+_NON_BAR_RE = _pattern(NON_BAR_NAME_KEYWORDS)
+
+
+class VenueFlags(NamedTuple):
+    """Alan adları CachedVenue kolonlarıyla aynı (_asdict() doğrudan defaults'a girer)."""
+    is_closed: bool
+    is_chain: bool
+    is_non_bar: bool
+    missing_enrichment: bool
+
+
+# Servis anında gösterilmeyecekler; eksik zenginleştirme gösterilir, cache_clear_invalid siler
+SERVE_EXCLUDE_FIELDS = ('is_closed', 'is_chain', 'is_non_bar')
+SERVE_EXCLUDE_Q = reduce(operator.or_, (Q(**{field: True}) for field in SERVE_EXCLUDE_FIELDS))
+SERVE_SQL = ' AND '.join(f'NOT api_cachedvenue.{field}' for field in SERVE_EXCLUDE_FIELDS)
+INVALID_Q = SERVE_EXCLUDE_Q | Q(missing_enrichment=True)
+
+
+def _closed_keyword(reviews: Optional[Sequence[dict]], pattern) -> Optional[str]:
+    for review in (reviews or ())[:REVIEW_SAMPLE]:
+        match = pattern.search(normalize_tr((review or {}).get('text') or ''))
+        if match:
+            return match.group(0)
+    return None
+
+
+def closed_review_keyword(reviews: Optional[Sequence[dict]]) -> Optional[str]:
+    """İlk REVIEW_SAMPLE yorumda kalıcı kapanma ifadesi varsa eşleşen (normalize) kelime."""
+    return _closed_keyword(reviews, _CLOSED_RE)
+
+
+def generator_closed_keyword(reviews: Optional[Sequence[dict]]) -> Optional[str]:
+    """closed_review_keyword'ün GENERATOR_CLOSED_KEYWORDS ile aday elemesi için olanı."""
+    return _closed_keyword(reviews, _GENERATOR_CLOSED_RE)
+
+
+def is_chain_name(name: str) -> bool:
+    return _CHAIN_RE.search(normalize_tr(name or '')) is not None
+
+
+def is_non_bar_name(name: str) -> bool:
+    name_norm = normalize_tr(name or '')
+    return _NON_BAR_RE.search(name_norm) is not None and _BAR_RE.search(name_norm) is None
+
+
+def is_served(venue: dict, category: str) -> bool:
+    """compute_flags'e göre SERVE_EXCLUDE_Q dışında kalır mı (bellekteki indeksler için)."""
+    flags = compute_flags(venue, category)
+    return not any(getattr(flags, field) for field in SERVE_EXCLUDE_FIELDS)
+
+
+def compute_flags(venue: dict, category: str) -> VenueFlags:
+    """Cache'e yazılan venue objesi + cache kategorisi → bayraklar."""
+    name = venue.get('name', '')
+    return VenueFlags(
+        is_closed=closed_review_keyword(venue.get('googleReviews')) is not None,
+        is_chain=category in ROMANTIC_CATEGORIES and is_chain_name(name),
+        is_non_bar=category == BAR_CATEGORY and is_non_bar_name(name),
+        missing_enrichment=category not in ENRICHMENT_EXEMPT_CATEGORIES and not (
+            venue.get('practicalInfo') and venue.get('atmosphereSummary')),
+    )
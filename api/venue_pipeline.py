@@ -0,0 +1,773 @@
+"""
+Venue Pipeline Engine
+
+Nearby Search tabanlı kategoriler için ortak, stage'li akış:
+
+    fetch    → geocode (alan) + kategori sorguları (paralel) ‖ G&M + SWR cache (DB)
+    filter   → dedupe, exclude, alan dışı (api/geo.py), rating/yorum eşiği, kategori REJECT kuralları
+    details  → Place Details (paralel) + eski yorum / kapanmış mekan kontrolü
+    rank     → sıralama ve API limiti
+    enrich   → tek Gemini batch çağrısı + Instagram discovery (paralel)
+    persist  → cache'e kayıt (after-response) + G&M / cache / API birleştirme
+
+ASGI'de (async_views.generate_venues) aynı stage'ler AsyncVenuePipeline ile çalışır: fetch ve
+details Places çağrılarını httpx.AsyncClient, enrich Gemini batch'ini generate_content_async ile
+bekler (thread tutmaz). Filtre / sıralama kodu ortaktır; DB adımları (G&M + SWR cache okuma,
+persist) ve Instagram discovery sync_to_async ile kısa süreli pool thread'inde çalışır.
+
+Kategoriye özgü her şey venue_categories.CategoryConfig içinde tanımlıdır;
+bir performans düzeltmesi burada bir kez yapılır ve tüm kategorilere uygulanır.
+Her stage'in süresi ctx.timings'e yazılır ve istek sonunda tek satır loglanır.
+Google / Gemini / cache yardımcıları api/venue_sources.py'den gelir; views'a bağımlılık yoktur.
+
+Aynı motor, kendi stage'leriyle iki akışı daha çalıştırır (ortak yardımcılar buradan gelir):
+    api/fine_dining_pipeline.py  → Fine Dining (Michelin rehberi + Nearby Search + G&M birleştirme)
+    api/text_search_pipeline.py  → generate_venues varsayılan yolu (tek Nearby / Text Search sorgusu,
+                                   CandidateFilter, contextScore döndüren Gemini batch'i)
+Bu iki akış sadece sync çalışır; async_views onları sync view'a devreder.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework import status
+from rest_framework.response import Response
+
+from .geo import GeoArea, area_from_geocode, measure
+from .opening_hours import filter_open_now
+from .ranking import MICHELIN_GM, RATING_REVIEWS, rank_venues
+from .timing import bind, span
+from .venue_categories import CategoryConfig, PlaceText, normalize_tr
+from .venue_flags import generator_closed_keyword
+from .venue_sources import (
+    aget_place_details_extended,
+    clean_json_string,
+    discover_instagram_url,
+    enrich_gm_venues_with_gemini,
+    get_cached_venues_for_hybrid,
+    get_genai_model,
+    get_gm_venues_for_category,
+    get_gmaps_client,
+    get_place_details_extended,
+    get_place_reviews,
+    is_michelin_restaurant,
+    save_venues_to_cache,
+    CACHE_VENUES_LIMIT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+NEARBY_URL = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
+HTTP_TIMEOUT_SECONDS = 10
+NEXT_PAGE_DELAY_SECONDS = 2         # next_page_token Google tarafında hemen geçerli olmuyor
+FETCH_CONCURRENCY = 6               # Aynı anda çalışan Nearby Search sorgusu
+DETAILS_CONCURRENCY = 8             # Aynı anda çalışan Place Details çağrısı
+INSTAGRAM_CONCURRENCY = 5           # Aynı anda çalışan Instagram discovery
+STALE_REVIEW_DAYS = 210             # Az yorumlu mekanda son yorum bundan eskiyse reject
+STALE_REVIEW_MAX_COUNT = 50         # Eski yorum kontrolü bu yorum sayısının altında uygulanır
+COMBINED_LIMIT = 50                 # Response'taki toplam venue üst sınırı
+
+
+class PipelineContext:
+    """Bir pipeline çalışmasının durumu; stage'ler sırayla okuyup yazar."""
+
+    def __init__(self, config: CategoryConfig, location: dict, filters: dict, exclude_ids):
+        self.config = config
+        self.filters = filters or {}
+        self.exclude_ids = set(exclude_ids) if exclude_ids else set()
+
+        self.city = location['city']
+        districts = location.get('districts', [])
+        neighborhoods = location.get('neighborhoods', [])
+        self.district = districts[0] if districts else None
+        self.neighborhood = neighborhoods[0] if neighborhoods else None
+        if self.neighborhood:
+            self.search_location = f"{self.neighborhood}, {self.district}, {self.city}"
+        elif self.district:
+            self.search_location = f"{self.district}, {self.city}"
+        else:
+            self.search_location = self.city
+
+        self.api_key = settings.GOOGLE_MAPS_API_KEY
+        self.area: Optional[GeoArea] = None     # Geocode alanı (api/geo.py) - arama yarıçapı ve alan filtresi
+        self.gm_venues: List[dict] = []
+        self.cached_venues: List[dict] = []
+        self.api_exclude_ids = set(self.exclude_ids)
+        self.query_results: List[Tuple[str, List[dict]]] = []
+        self.candidates: List[dict] = []
+        self.venues: List[dict] = []
+        self.result: Optional[List[dict]] = None
+        self.done = False                       # True ise kalan stage'ler atlanır
+        self.timings: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.http = None                        # httpx.AsyncClient (sadece AsyncVenuePipeline)
+
+    @property
+    def builder_ctx(self) -> dict:
+        """build_venue / prompt_builder'a verilen sade sözlük."""
+        return {'api_key': self.api_key, 'city': self.city, 'search_location': self.search_location}
+
+    def count(self, key: str, value: int = 1):
+        self.counters[key] = self.counters.get(key, 0) + value
+
+
+# ===== FETCH =====
+
+def _area_from_response(response, default_radius_km: float) -> Optional[GeoArea]:
+    if response.status_code == 200:
+        results = response.json().get('results')
+        if results:
+            return area_from_geocode(results[0], default_radius_km)
+    return None
+
+
+def _geocode(search_location: str, api_key: str, default_radius_km: float) -> Optional[GeoArea]:
+    import requests
+
+    try:
+        response = requests.get(
+            GEOCODE_URL,
+            params={"address": f"{search_location}, Turkey", "key": api_key},
+            timeout=HTTP_TIMEOUT_SECONDS
+        )
+        return _area_from_response(response, default_radius_km)
+    except Exception as e:
+        logger.warning("⚠️ Geocode hatası: %s", e)
+    return None
+
+
+def _nearby_params(config: CategoryConfig, area: GeoArea, keyword: str, api_key: str) -> dict:
+    return {
+        'location': f"{area.center[0]},{area.center[1]}",
+        'radius': area.search_radius_m(config.radius),   # Alan yarıçapı (en az config.radius, şehir seviyesinde sınırlı)
+        'type': config.place_type,
+        'keyword': keyword,
+        'language': 'tr',
+        'key': api_key
+    }
+
+
+def _paged_search(url: str, params: dict, api_key: str, max_pages: int, label: str) -> List[dict]:
+    """Places Nearby / Text Search sorgusu (next_page_token ile en fazla max_pages sayfa)."""
+    import requests
+
+    try:
+        response = requests.get(url, params=params, timeout=HTTP_TIMEOUT_SECONDS)
+        if response.status_code != 200:
+            logger.warning("⚠️ API hatası (%s): %s", label, response.status_code)
+            return []
+        data = response.json()
+        places = data.get('results', [])
+
+        for _ in range(max_pages - 1):
+            next_page_token = data.get('next_page_token')
+            if not next_page_token:
+                break
+            with span('places.page_wait'):
+                time.sleep(NEXT_PAGE_DELAY_SECONDS)
+            next_response = requests.get(
+                url, params={"pagetoken": next_page_token, "key": api_key}, timeout=HTTP_TIMEOUT_SECONDS
+            )
+            if next_response.status_code != 200:
+                break
+            data = next_response.json()
+            places.extend(data.get('results', []))
+        return places
+    except Exception as e:
+        logger.warning("⚠️ %s sorgusu hatası: %s", label, e)
+        return []
+
+
+def _nearby_query(config: CategoryConfig, area: GeoArea, keyword: str, api_key: str) -> List[dict]:
+    """Tek bir Nearby Search sorgusu (sayfalama dahil)."""
+    return _paged_search(NEARBY_URL, _nearby_params(config, area, keyword, api_key), api_key, config.max_pages, keyword)
+
+
+def _fetch_places(ctx: PipelineContext):
+    """Arka plan thread'i: geocode, ardından tüm kategori sorguları paralel."""
+    area = _geocode(ctx.search_location, ctx.api_key, ctx.config.radius / 1000)
+    if not area:
+        return None, []
+    queries = ctx.config.queries
+    with ThreadPoolExecutor(max_workers=min(FETCH_CONCURRENCY, len(queries)) or 1) as pool:
+        pages = list(pool.map(bind(lambda q: _nearby_query(ctx.config, area, q[0], ctx.api_key)), queries))
+    # Sorgu sırası korunur (dedupe önceliği ve çeşitlilik aynı kalsın)
+    return area, [(label, places) for (_, label), places in zip(queries, pages)]
+
+
+def _load_known_venues(ctx: PipelineContext):
+    """G&M öncelikli mekanlar + SWR cache (DB; istek thread'inde çalışır)."""
+    config = ctx.config
+    exclude = set(ctx.exclude_ids)
+    if config.gm_category_id:
+        ctx.gm_venues = get_gm_venues_for_category(
+            category_id=config.gm_category_id,
+            category_name=config.name,
+            city=ctx.city,
+            exclude_ids=exclude,
+            district=ctx.district
+        )
+        if ctx.gm_venues:
+            logger.info("🏆 G&M - %s kategorisinde %s G&M mekan bulundu (%s)", config.name, len(ctx.gm_venues), ctx.city)
+            exclude |= {v.get('id') for v in ctx.gm_venues if v.get('id')}
+
+    ctx.cached_venues, all_cached_ids = get_cached_venues_for_hybrid(
+        category_name=config.name,
+        city=ctx.city,
+        district=ctx.district,
+        neighborhood=ctx.neighborhood,
+        exclude_ids=exclude,
+        limit=CACHE_VENUES_LIMIT,
+        open_now=bool(ctx.filters.get('openNow'))
+    )
+    ctx.api_exclude_ids = exclude | all_cached_ids
+    logger.info("🔀 HYBRID - %s Cache: %s, API exclude: %s", config.name, len(ctx.cached_venues), len(ctx.api_exclude_ids))
+
+
+def fetch_stage(ctx: PipelineContext):
+    logger.info("%s %s (Multi-Query): %s", ctx.config.emoji, ctx.config.name, ctx.search_location)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        places_future = pool.submit(bind(_fetch_places), ctx)
+        _load_known_venues(ctx)
+        ctx.area, ctx.query_results = places_future.result()
+    _check_fetched(ctx)
+
+
+def _check_fetched(ctx: PipelineContext):
+    if not ctx.area:
+        logger.warning("⚠️ %s: Koordinat bulunamadı, arama yapılamıyor", ctx.config.name)
+        ctx.result = []
+        ctx.done = True
+        return
+    ctx.count('fetched', sum(len(places) for _, places in ctx.query_results))
+
+
+# ===== FILTER =====
+
+def _passes_filters(ctx: PipelineContext, place: dict) -> bool:
+    config = ctx.config
+    place_name = place.get('name', '')
+    types = place.get('types', [])
+    text = PlaceText(lower=place_name.lower(), norm=normalize_tr(place_name), types=types, types_str=' '.join(types).lower())
+
+    for rule in config.reject_rules:
+        reason = rule(place, text)
+        if reason:
+            ctx.count('rejected')
+            logger.debug("❌ %s REJECT - %s", reason, place_name)
+            return False
+
+    rating = place.get('rating', 0)
+    if rating < config.min_rating:
+        ctx.count('rejected')
+        logger.debug("❌ RATING REJECT - %s: %s < %s", place_name, rating, config.min_rating)
+        return False
+    review_count = place.get('user_ratings_total', 0)
+    if review_count < config.min_reviews:
+        ctx.count('rejected')
+        logger.debug("❌ REVIEW COUNT REJECT - %s: %s < %s", place_name, review_count, config.min_reviews)
+        return False
+    return True
+
+
+def filter_stage(ctx: PipelineContext):
+    config = ctx.config
+    seen = set(ctx.api_exclude_ids)
+    per_label: Dict[str, int] = {}
+    builder_ctx = ctx.builder_ctx
+    candidates = []
+
+    for label, places in ctx.query_results:
+        # Sorgu sonucunun tamamı için tek vektörel mesafe + alan geçişi (api/geo.py)
+        placement = measure(places, ctx.area)
+        for i, place in enumerate(places):
+            if config.per_query_limit and per_label.get(label, 0) >= config.per_query_limit:
+                break
+            place_id = place.get('place_id', '')
+            if not place_id or place_id in seen:
+                continue
+            if placement.in_area(i) is False:
+                ctx.count('rejected')
+                logger.debug("❌ ALAN DIŞI REJECT - %s: %.1f km", place.get('name', ''), placement.distance_km[i])
+                continue
+            if not _passes_filters(ctx, place):
+                continue
+            seen.add(place_id)
+            per_label[label] = per_label.get(label, 0) + 1
+            venue = config.build_venue(place, label, config, builder_ctx)
+            distance_km = placement.distance(i)
+            if distance_km is not None:
+                venue['distanceKm'] = distance_km
+            candidates.append(venue)
+
+    if config.sort_by_rating:
+        candidates = rank_venues(candidates, RATING_REVIEWS)
+    # Place Details en pahalı adım: sadece sıralamada öne çıkan adaylar için çağrılır
+    ctx.candidates = candidates[:config.details_budget]
+    ctx.count('candidates', len(candidates))
+
+
+# ===== DETAILS =====
+
+def _is_stale(reviews: list) -> Optional[datetime]:
+    """Son yorum STALE_REVIEW_DAYS'ten eskiyse son yorum zamanını döndür."""
+    latest = None
+    for review in reviews:
+        timestamp = review.get('time')
+        if not timestamp:
+            continue
+        try:
+            review_time = datetime.fromtimestamp(timestamp)
+        except (TypeError, ValueError, OverflowError, OSError):
+            continue
+        if latest is None or review_time > latest:
+            latest = review_time
+    if latest and latest < datetime.now() - timedelta(days=STALE_REVIEW_DAYS):
+        return latest
+    return None
+
+
+def details_stage(ctx: PipelineContext):
+    config = ctx.config
+    gmaps = get_gmaps_client()
+
+    def load(venue):
+        if config.extended_details:
+            return get_place_details_extended(gmaps, venue['id']).get('reviews', [])
+        return get_place_reviews(gmaps, venue['id'])
+
+    with ThreadPoolExecutor(max_workers=DETAILS_CONCURRENCY) as pool:
+        all_reviews = list(pool.map(bind(load), ctx.candidates))
+    _accept_details(ctx, all_reviews)
+
+
+def _accept_details(ctx: PipelineContext, all_reviews: Sequence[list]):
+    """Yorumlar geldikten sonra eski yorum / kapanmış elemesi ve kategori after_details'i."""
+    config = ctx.config
+    venues = []
+    for venue, reviews in zip(ctx.candidates, all_reviews):
+        # Üst sınır eski yorum / kapanmış elemesinden SONRA sayılır (reddedilen aday kota yemez)
+        if config.max_candidates and len(venues) >= config.max_candidates:
+            break
+        if reviews and venue.get('googleReviewCount', 0) < STALE_REVIEW_MAX_COUNT:
+            latest = _is_stale(reviews)
+            if latest:
+                ctx.count('rejected')
+                logger.debug("❌ ESKİ YORUM REJECT - %s: son yorum %s", venue['name'], latest.strftime('%Y-%m-%d'))
+                continue
+        keyword = generator_closed_keyword(reviews)
+        if keyword:
+            ctx.count('rejected')
+            logger.debug("❌ KAPANMIŞ MEKAN REJECT - %s: yorumda '%s' bulundu", venue['name'], keyword)
+            continue
+
+        venue['googleReviews'] = reviews
+        venue['google_reviews'] = reviews  # Gemini prompt'u için (response'tan çıkarılır)
+        if config.after_details:
+            config.after_details(venue, reviews, config)
+        venues.append(venue)
+        logger.debug("✅ EKLENDI - %s (%s): ⭐%s (%s yorum)", venue['name'], venue.get(config.label_field), venue.get('googleRating'), venue.get('googleReviewCount'))
+
+    ctx.venues = venues
+    ctx.count('detailed', len(ctx.candidates))
+
+
+# ===== RANK =====
+
+def rank_stage(ctx: PipelineContext):
+    if ctx.config.sort_by_rating:
+        ctx.venues = rank_venues(ctx.venues, RATING_REVIEWS)
+    ctx.venues = ctx.venues[:ctx.config.api_limit]
+    logger.info("%s Toplam %s %s mekanı bulundu, Gemini ile zenginleştiriliyor...", ctx.config.emoji, len(ctx.venues), ctx.config.name)
+
+
+# ===== ENRICH =====
+
+def review_excerpt(texts: Sequence[str], practical_keywords: Sequence[str]) -> str:
+    """Prompt satırı için yorum özeti: pratik bilgi içeren 3 + diğer 2 yorum (her biri en fazla 350 karakter)."""
+    practical, other = [], []
+    for text in texts:
+        (practical if any(kw in text.lower() for kw in practical_keywords) else other).append(text)
+    top_reviews = [text[:350] for text in practical[:3] + other[:2] if text]
+    return f" | Yorumlar: {' /// '.join(top_reviews)}" if top_reviews else ""
+
+
+def build_review_batch_prompt(venues: list, config: CategoryConfig, builder_ctx: dict) -> str:
+    """Yorum tabanlı tek Gemini batch prompt'u (pratik bilgi içeren yorumlar öncelikli)."""
+    items = []
+    for i, v in enumerate(venues):
+        reviews_text = review_excerpt([r.get('text', '') for r in v.get('google_reviews') or []], config.practical_keywords)
+        items.append(f"{i+1}. {v['name']} | Rating: {v.get('googleRating', 'N/A')} | {config.prompt_label}: {v.get(config.label_field, '')}{reviews_text}")
+
+    return (
+        f"Kategori: {config.name}\n"
+        f"Kullanıcı Tercihleri: {config.prompt_preferences}\n\n"
+        f"Mekanlar ve Yorumları:\n" + "\n".join(items) + "\n\n" + config.prompt_schema
+    )
+
+
+def _parse_ai_array(response_text: str) -> list:
+    response_text = clean_json_string(response_text)
+    try:
+        return json.loads(response_text)
+    except json.JSONDecodeError:
+        match = re.search(r'\[.*\]', response_text, re.DOTALL)
+        return json.loads(match.group()) if match else []
+
+
+def _discover_instagram(ctx: PipelineContext, venues: list):
+    missing = [v for v in venues if not v.get('instagramUrl')]
+    if not missing:
+        return
+
+    def discover(venue):
+        return discover_instagram_url(
+            venue_name=venue['name'],
+            city=ctx.city,
+            website=venue.get('website'),
+            existing_instagram=None,
+            district=ctx.district,
+            neighborhood=ctx.neighborhood,
+            return_verified=True
+        )
+
+    with ThreadPoolExecutor(max_workers=INSTAGRAM_CONCURRENCY) as pool:
+        results = list(pool.map(bind(discover), missing))
+    for venue, (instagram_url, is_verified) in zip(missing, results):
+        if instagram_url:
+            venue['instagramUrl'] = instagram_url
+            venue['instagramEstimated'] = not is_verified
+            logger.debug("📸 %s Instagram (%s): %s -> %s", ctx.config.name, "verified" if is_verified else "estimated", venue['name'], instagram_url)
+
+
+def enrich_stage(ctx: PipelineContext):
+    config = ctx.config
+    venues = ctx.venues
+    if not venues:
+        return
+
+    ai_by_name = None
+    try:
+        model = get_genai_model()
+        if model:
+            response = model.generate_content(_enrich_prompt(ctx))
+            ai_by_name = _ai_by_name(config, response.text)
+    except Exception as e:
+        logger.error("❌ Gemini %s hatası: %s", config.name, e)
+
+    _apply_enrichment(ctx, ai_by_name)
+    # Gemini Instagram bulamadıysa, Google CSE + tahmin ile bul
+    _discover_instagram(ctx, venues)
+    if ai_by_name is not None:
+        logger.info("✅ Gemini ile %s %s mekan zenginleştirildi", len(venues), config.name)
+
+
+def _enrich_prompt(ctx: PipelineContext) -> str:
+    prompt_builder = ctx.config.prompt_builder or build_review_batch_prompt
+    return prompt_builder(ctx.venues, ctx.config, ctx.builder_ctx)
+
+
+def _ai_by_name(config: CategoryConfig, response_text: str) -> dict:
+    ai_results = _parse_ai_array(response_text.strip())
+    if not ai_results:
+        logger.warning("⚠️ %s Gemini JSON parse edilemedi, fallback kullanılıyor", config.name)
+    return {r.get('name', '').lower(): r for r in ai_results if isinstance(r, dict)}
+
+
+def _apply_enrichment(ctx: PipelineContext, ai_by_name: Optional[dict]):
+    """Gemini sonuçlarını (None → fallback alanları) venue'lara yaz."""
+    config = ctx.config
+    for venue in ctx.venues:
+        base_description = venue.pop('base_description', venue.get('description', ''))
+        venue.pop('google_reviews', None)
+        if ai_by_name is None:
+            venue['description'] = base_description
+            venue['practicalInfo'] = {}
+            venue['atmosphereSummary'] = dict(config.fallback_atmosphere)
+            continue
+
+        ai_data = ai_by_name.get(venue['name'].lower(), {})
+        venue['description'] = ai_data.get('description', base_description)
+        venue['vibeTags'] = ai_data.get('vibeTags', venue.get('vibeTags') or [config.default_vibe_tag])
+        venue['practicalInfo'] = ai_data.get('practicalInfo', {})
+        venue['atmosphereSummary'] = ai_data.get('atmosphereSummary', dict(config.default_atmosphere))
+        instagram_username = ai_data.get('instagramUsername')
+        if instagram_username and instagram_username != 'null':
+            venue['instagramUrl'] = f"https://instagram.com/{instagram_username}"
+            venue['instagramEstimated'] = False  # Gemini buldu, doğrulanmış
+
+
+# ===== PERSIST =====
+
+def badge_gm_venues(gm_venues: Sequence[dict], category_name: str) -> list:
+    """G&M mekanlarını Gemini ile zenginleştir; hem G&M hem Michelin olanlara Michelin badge ekle."""
+    enriched_gm = enrich_gm_venues_with_gemini(gm_venues, category_name)
+    for gv in enriched_gm:
+        michelin_check = is_michelin_restaurant(gv.get('name', ''))
+        if michelin_check:
+            gv['isMichelinStarred'] = True
+            gv['michelinStars'] = michelin_check.get('stars', 0)
+            gv['isBibGourmand'] = michelin_check.get('isBib', False)
+    return enriched_gm
+
+
+def prioritized_gm_venues(gm_venues: Sequence[dict], category_name: str) -> list:
+    """Zenginleştirilmiş G&M mekanları, Michelin > Bib Gourmand > G&M (toque) sırasıyla."""
+    return rank_venues(badge_gm_venues(gm_venues, category_name), MICHELIN_GM)
+
+
+def _prioritized_gm_venues(ctx: PipelineContext) -> list:
+    if not ctx.gm_venues or not ctx.config.gm_enrich:
+        return ctx.gm_venues
+    return prioritized_gm_venues(ctx.gm_venues, ctx.config.name)
+
+
+def merge_hybrid(*sources: Sequence[dict], limit: int = COMBINED_LIMIT) -> list:
+    """Kaynakları öncelik sırasıyla birleştir; ID ve isim bazlı duplicate kontrolü."""
+    combined = []
+    existing_ids = set()
+    existing_names = set()
+    for source in sources:
+        for venue in source:
+            if len(combined) >= limit:
+                return combined
+            name = venue.get('name', '').lower().strip()
+            if venue.get('id') in existing_ids or name in existing_names:
+                continue
+            combined.append(venue)
+            existing_ids.add(venue.get('id'))
+            existing_names.add(name)
+    return combined
+
+
+def persist_stage(ctx: PipelineContext):
+    config = ctx.config
+    if ctx.venues:
+        save_venues_to_cache(
+            venues=ctx.venues,
+            category_name=config.name,
+            city=ctx.city,
+            district=ctx.district,
+            neighborhood=ctx.neighborhood
+        )
+    gm_venues = _prioritized_gm_venues(ctx)
+    ctx.result = merge_hybrid(gm_venues, ctx.cached_venues, ctx.venues)
+    if ctx.filters.get('openNow'):
+        ctx.result = filter_open_now(ctx.result)
+    logger.info(
+        "🔀 HYBRID RESULT - %s G&M: %s, Cache: %s, API: %s, Combined: %s",
+        config.name, len(gm_venues), len(ctx.cached_venues), len(ctx.venues), len(ctx.result)
+    )
+
+
+# ===== ENGINE =====
+
+Stage = Tuple[str, Callable[[PipelineContext], None]]
+
+DEFAULT_STAGES: Tuple[Stage, ...] = (
+    ('fetch', fetch_stage),
+    ('filter', filter_stage),
+    ('details', details_stage),
+    ('rank', rank_stage),
+    ('enrich', enrich_stage),
+    ('persist', persist_stage),
+)
+
+
+class VenuePipeline:
+    """Stage'leri sırayla çalıştırır ve her birinin süresini ölçer."""
+
+    def __init__(self, stages: Sequence[Stage] = DEFAULT_STAGES):
+        self.stages = tuple(stages)
+
+    def run(self, ctx: PipelineContext) -> PipelineContext:
+        for name, stage in self.stages:
+            if ctx.done:
+                break
+            started = time.perf_counter()
+            try:
+                with span(f'stage.{name}'):
+                    stage(ctx)
+            finally:
+                ctx.timings[name] = round((time.perf_counter() - started) * 1000, 1)
+        _log_run(ctx)
+        return ctx
+
+
+def _log_run(ctx: PipelineContext):
+    logger.info(
+        "⏱️ PIPELINE - %s: %s | %s",
+        ctx.config.name,
+        ' '.join(f"{name}={ms}ms" for name, ms in ctx.timings.items()),
+        ' '.join(f"{key}={value}" for key, value in ctx.counters.items()),
+    )
+
+
+def run_pipeline(pipeline: VenuePipeline, ctx: PipelineContext) -> Response:
+    """Pipeline'ı çalıştırıp Response döndür; hata config.error_message ile 500 olur."""
+    try:
+        ctx = pipeline.run(ctx)
+        return Response(ctx.result or [], status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.exception("❌ %s generation error: %s", ctx.config.name, e)
+        return Response(
+            {'error': f'{ctx.config.error_message}: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+def run_category_pipeline(config: CategoryConfig, location: dict, filters: dict, exclude_ids) -> Response:
+    """generate_venues için giriş noktası: config'e göre pipeline'ı çalıştırıp Response döndür."""
+    return run_pipeline(VenuePipeline(), PipelineContext(config, location, filters, exclude_ids))
+
+
+# ===== ASYNC (ASGI) =====
+# Aynı stage'lerin I/O'su beklenir; filtre / sıralama / kabul kodu yukarıdakilerle ortak.
+
+async def _ageocode(ctx: PipelineContext) -> Optional[GeoArea]:
+    try:
+        response = await ctx.http.get(GEOCODE_URL, params={"address": f"{ctx.search_location}, Turkey", "key": ctx.api_key})
+        return _area_from_response(response, ctx.config.radius / 1000)
+    except Exception as e:
+        logger.warning("⚠️ Geocode hatası: %s", e)
+    return None
+
+
+async def _anearby_query(ctx: PipelineContext, area: GeoArea, keyword: str, semaphore: asyncio.Semaphore) -> List[dict]:
+    """_nearby_query'nin httpx.AsyncClient karşılığı; sayfa bekleme süresi de event loop'ta geçer."""
+    config = ctx.config
+    try:
+        async with semaphore:
+            response = await ctx.http.get(NEARBY_URL, params=_nearby_params(config, area, keyword, ctx.api_key))
+            if response.status_code != 200:
+                logger.warning("⚠️ API hatası (%s): %s", keyword, response.status_code)
+                return []
+            data = response.json()
+            places = data.get('results', [])
+
+            for _ in range(config.max_pages - 1):
+                next_page_token = data.get('next_page_token')
+                if not next_page_token:
+                    break
+                with span('places.page_wait'):
+                    await asyncio.sleep(NEXT_PAGE_DELAY_SECONDS)
+                next_response = await ctx.http.get(NEARBY_URL, params={"pagetoken": next_page_token, "key": ctx.api_key})
+                if next_response.status_code != 200:
+                    break
+                data = next_response.json()
+                places.extend(data.get('results', []))
+            return places
+    except Exception as e:
+        logger.warning("⚠️ %s sorgusu hatası: %s", keyword, e)
+        return []
+
+
+async def _afetch_places(ctx: PipelineContext):
+    area = await _ageocode(ctx)
+    if not area:
+        return None, []
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    queries = ctx.config.queries
+    pages = await asyncio.gather(*(_anearby_query(ctx, area, keyword, semaphore) for keyword, _ in queries))
+    return area, [(label, places) for (_, label), places in zip(queries, pages)]
+
+
+async def afetch_stage(ctx: PipelineContext):
+    logger.info("%s %s (Multi-Query, async): %s", ctx.config.emoji, ctx.config.name, ctx.search_location)
+    (ctx.area, ctx.query_results), _ = await asyncio.gather(
+        _afetch_places(ctx),
+        sync_to_async(_load_known_venues, thread_sensitive=False)(ctx),
+    )
+    _check_fetched(ctx)
+
+
+async def adetails_stage(ctx: PipelineContext):
+    semaphore = asyncio.Semaphore(DETAILS_CONCURRENCY)
+
+    async def load(venue):
+        async with semaphore:
+            details = await aget_place_details_extended(ctx.http, venue['id'])
+        return details['reviews']
+
+    _accept_details(ctx, await asyncio.gather(*(load(venue) for venue in ctx.candidates)))
+
+
+async def aenrich_stage(ctx: PipelineContext):
+    config = ctx.config
+    venues = ctx.venues
+    if not venues:
+        return
+
+    ai_by_name = None
+    try:
+        model = get_genai_model()
+        if model:
+            response = await model.generate_content_async(_enrich_prompt(ctx))
+            ai_by_name = _ai_by_name(config, response.text)
+    except Exception as e:
+        logger.error("❌ Gemini %s hatası: %s", config.name, e)
+
+    _apply_enrichment(ctx, ai_by_name)
+    # Instagram discovery (Google CSE, requests tabanlı) kısa süreli pool thread'inde
+    await sync_to_async(_discover_instagram, thread_sensitive=False)(ctx, venues)
+    if ai_by_name is not None:
+        logger.info("✅ Gemini ile %s %s mekan zenginleştirildi", len(venues), config.name)
+
+
+async def apersist_stage(ctx: PipelineContext):
+    # Cache yazımı (after-response) + G&M Gemini zenginleştirmesi: DB / sync SDK
+    await sync_to_async(persist_stage, thread_sensitive=False)(ctx)
+
+
+ASYNC_STAGES: Tuple[Stage, ...] = (
+    ('fetch', afetch_stage),
+    ('filter', filter_stage),
+    ('details', adetails_stage),
+    ('rank', rank_stage),
+    ('enrich', aenrich_stage),
+    ('persist', apersist_stage),
+)
+
+
+class AsyncVenuePipeline(VenuePipeline):
+    """VenuePipeline'ın ASGI karşılığı: coroutine stage'ler beklenir, diğerleri (CPU) inline çalışır."""
+
+    def __init__(self, stages: Sequence[Stage] = ASYNC_STAGES):
+        super().__init__(stages)
+
+    async def run(self, ctx: PipelineContext) -> PipelineContext:
+        import httpx
+
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS) as client:
+            ctx.http = client
+            for name, stage in self.stages:
+                if ctx.done:
+                    break
+                started = time.perf_counter()
+                try:
+                    with span(f'stage.{name}'):
+                        if asyncio.iscoroutinefunction(stage):
+                            await stage(ctx)
+                        else:
+                            stage(ctx)
+                finally:
+                    ctx.timings[name] = round((time.perf_counter() - started) * 1000, 1)
+        _log_run(ctx)
+        return ctx
+
+
+async def arun_category_pipeline(config: CategoryConfig, location: dict, filters: dict, exclude_ids) -> List[dict]:
+    """async_views.generate_venues için giriş noktası; hata çağırana yükselir."""
+    ctx = await AsyncVenuePipeline().run(PipelineContext(config, location, filters, exclude_ids))
+    return ctx.result or []
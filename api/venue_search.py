@@ -0,0 +1,213 @@
+"""
+Cache'teki Mekanlar Üzerinde Full-Text Arama (search_venues)
+
+search_venues her sorguda Google Places'a (Text Search + 10 Place Details) gidiyordu; oysa
+"meyhane moda" gibi sorgular için CachedVenue'da zengin veri zaten var. Burada:
+
+1. build_search_text: isim, adres, kategori, şehir / ilçe / semt, vibe tag'ler, atmosfer özeti
+   (oneLiner) ve mustTry Türkçe normalize edilip (ı→i, ş→s, İ→i, ...) tek metne çevrilir;
+   CachedVenue.search_text kolonuna cache yazımında (save_venues_to_cache_swr) yazılır.
+2. İndeks DB tarafında artımlı tutulur:
+   - SQLite: FTS5 tablosu (api_cachedvenue_fts), INSERT / UPDATE / DELETE trigger'ları ile
+   - PostgreSQL: to_tsvector('simple', search_text) üzerinde GIN index
+   Diğer backend'lerde (ya da FTS5 yoksa) token başına contains filtresine düşülür.
+3. search_cached_venues: sorgu token'larının hepsi (prefix) + lokasyon parçalarından biri
+   eşleşmeli. LOCAL_MIN_RESULTS'tan az sonuç varsa None döner, çağıran Places'a gider.
+
+Kullanım:
+    results = search_cached_venues(query, location)     # [search_venues sonucu, ...] ya da None
+    defaults['search_text'] = build_search_text(venue, category, city, district, neighborhood)
+"""
+
+import logging
+import re
+from typing import Iterable, List, Optional
+
+from django.db import DatabaseError, connection
+
+from .venue_categories import normalize_tr
+from .venue_flags import SERVE_EXCLUDE_Q, SERVE_SQL
+
+logger = logging.getLogger(__name__)
+
+
+# ===== CONFIGURATION =====
+LOCAL_MIN_RESULTS = 5               # Bundan az yerel sonuç varsa Places'a gidilir
+LOCAL_RESULT_LIMIT = 10             # Places akışıyla aynı (ilk 10 sonuç)
+MIN_TOKEN_LEN = 2
+MAX_QUERY_TOKENS = 8
+FTS_TABLE = 'api_cachedvenue_fts'
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def fold(text: str) -> str:
+    """Türkçe küçük harf + ASCII sadeleştirme; 'Kadıköy' ve 'kadikoy' aynı token olur."""
+    return normalize_tr(text)
+
+
+def tokens(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall(fold(text or '')) if len(t) >= MIN_TOKEN_LEN]
+
+
+def build_search_text(venue: dict, category: str, city: str, district: str = '', neighborhood: str = '') -> str:
+    """İndekslenen metin (normalize token'lar, boşlukla ayrılmış)."""
+    atmosphere = venue.get('atmosphereSummary') or {}
+    practical = venue.get('practicalInfo') or {}
+    parts: Iterable[str] = (
+        venue.get('name', ''),
+        venue.get('address', ''),
+        category, city, district or '', neighborhood or '',
+        ' '.join(tag for tag in venue.get('vibeTags') or () if isinstance(tag, str)),
+        (atmosphere.get('oneLiner') or atmosphere.get('shortDescription') or '') if isinstance(atmosphere, dict) else '',
+        (practical.get('mustTry') or '') if isinstance(practical, dict) else '',
+    )
+    return ' '.join(token for part in parts if isinstance(part, str) for token in tokens(part))
+
+
+def _location_tokens(location: str) -> List[str]:
+    """'Kadıköy, İstanbul' → ['kadikoy', 'istanbul']; 'Turkey' gibi parçalar da OR ile eklenir."""
+    return [t for part in (location or '').split(',') for t in tokens(part)]
+
+
+# ===== İNDEKS KURULUMU (migration'lar) =====
+# SQLite şema değişikliklerinde tabloyu yeniden kurar (_remake_table) ve trigger'lar düşer;
+# api_cachedvenue'yu değiştiren sonraki migration'lar install_search_index'i tekrar çalıştırmalı.
+
+_SQLITE_INDEX_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(search_text, content='api_cachedvenue', content_rowid='id')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON api_cachedvenue BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON api_cachedvenue BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text); END",
+    # Sadece search_text değişince (last_accessed dokunuşları indeksi yeniden yazmaz)
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF search_text ON api_cachedvenue BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text); "
+    f"INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+)
+_SQLITE_DROP_SQL = tuple(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}" for suffix in ('ai', 'ad', 'au')) + (
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+)
+_POSTGRES_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS api_cachedvenue_search_gin ON api_cachedvenue "
+    "USING GIN (to_tsvector('simple', search_text))",
+)
+_POSTGRES_DROP_SQL = ("DROP INDEX IF EXISTS api_cachedvenue_search_gin",)
+
+
+def install_search_index(schema_editor) -> None:
+    """Backend'e göre FTS5 tablosu + trigger'lar ya da GIN index (idempotent)."""
+    statements = {'sqlite': _SQLITE_INDEX_SQL, 'postgresql': _POSTGRES_INDEX_SQL}.get(schema_editor.connection.vendor, ())
+    try:
+        for sql in statements:
+            schema_editor.execute(sql)
+    except DatabaseError as e:
+        # FTS5'siz SQLite derlemesi: arama contains filtresiyle çalışmaya devam eder
+        logger.warning("⚠️ Full-text index kurulamadı: %s", e)
+
+
+def drop_search_index(schema_editor) -> None:
+    statements = {'sqlite': _SQLITE_DROP_SQL, 'postgresql': _POSTGRES_DROP_SQL}.get(schema_editor.connection.vendor, ())
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+# ===== BACKEND SORGULARI =====
+# Token'lar sadece [a-z0-9] içerir, FTS5 / tsquery sözdizimine güvenle gömülebilir.
+# Bayraklı (kapanmış / zincir / bar olmayan) kayıtlar SERVE_SQL ile LIMIT'ten önce elenir.
+
+def _search_sqlite(terms: List[str], places: List[str], limit: int) -> List[int]:
+    match = ' AND '.join(f'{t}*' for t in terms)
+    if places:
+        match += ' AND (' + ' OR '.join(f'{t}*' for t in places) + ')'
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT {FTS_TABLE}.rowid FROM {FTS_TABLE} JOIN api_cachedvenue ON api_cachedvenue.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s AND {SERVE_SQL} ORDER BY bm25({FTS_TABLE}) LIMIT %s",
+            [match, limit],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _search_postgres(terms: List[str], places: List[str], limit: int) -> List[int]:
+    tsquery = ' & '.join(f'{t}:*' for t in terms)
+    if places:
+        tsquery += ' & (' + ' | '.join(f'{t}:*' for t in places) + ')'
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT id FROM api_cachedvenue "
+            "WHERE to_tsvector('simple', search_text) @@ to_tsquery('simple', %s) "
+            f"AND {SERVE_SQL} "
+            "ORDER BY ts_rank(to_tsvector('simple', search_text), to_tsquery('simple', %s)) DESC, "
+            "google_rating DESC NULLS LAST LIMIT %s",
+            [tsquery, tsquery, limit],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _search_fallback(terms: List[str], places: List[str], limit: int) -> List[int]:
+    from django.db.models import Q
+    from .models import CachedVenue
+
+    queryset = CachedVenue.objects.exclude(SERVE_EXCLUDE_Q)
+    for term in terms:
+        queryset = queryset.filter(search_text__contains=term)
+    if places:
+        location_filter = Q()
+        for term in places:
+            location_filter |= Q(search_text__contains=term)
+        queryset = queryset.filter(location_filter)
+    return list(queryset.order_by('-google_rating').values_list('id', flat=True)[:limit])
+
+
+_BACKENDS = {'sqlite': _search_sqlite, 'postgresql': _search_postgres}
+
+
+def to_search_result(place_id: str, venue: dict) -> dict:
+    """Cache'teki venue_data → build_search_venue_data formatı."""
+    price_range = venue.get('priceRange') or ''
+    return {
+        'place_id': place_id,
+        'name': venue.get('name', ''),
+        'address': venue.get('address', ''),
+        'rating': venue.get('googleRating'),
+        'photo_url': venue.get('imageUrl'),
+        'types': venue.get('types') or [venue.get('category', '')],
+        'price_level': len(price_range) if price_range else None,
+    }
+
+
+def search_cached_venues(query: str, location: str, limit: int = LOCAL_RESULT_LIMIT) -> Optional[List[dict]]:
+    """
+    Sorguyu yerel indeksten cevapla. Yeterli sonuç (LOCAL_MIN_RESULTS) yoksa None;
+    vibe skorları sadece vibe cache'inden gelir (Gemini çağrılmaz).
+    """
+    from .models import CachedVenue
+    from .vibe_service import analyze_vibes
+
+    terms = tokens(query)[:MAX_QUERY_TOKENS]
+    if not terms:
+        return None
+    places = _location_tokens(location)
+
+    search = _BACKENDS.get(connection.vendor, _search_fallback)
+    try:
+        ids = search(terms, places, limit)
+    except DatabaseError as e:
+        # FTS5 derlenmemiş SQLite vb. - indekssiz filtreye düş
+        logger.warning("⚠️ FTS sorgusu başarısız, contains filtresine düşülüyor: %s", e)
+        ids = _search_fallback(terms, places, limit)
+
+    if len(ids) < LOCAL_MIN_RESULTS:
+        logger.info("🔎 LOCAL SEARCH MISS - '%s' @ %s (%s sonuç)", query, location, len(ids))
+        return None
+
+    rows = {pk: (place_id, venue) for pk, place_id, venue in
+            CachedVenue.objects.filter(id__in=ids).exclude(SERVE_EXCLUDE_Q).values_list('id', 'place_id', 'venue_data')}
+    results = [to_search_result(rows[pk][0], rows[pk][1] or {}) for pk in ids if pk in rows]
+    vibes = analyze_vibes(None, results)
+    for result in results:
+        result['vibe_score'] = vibes.get(result['place_id'], {})
+    logger.info("🔎 LOCAL SEARCH HIT - '%s' @ %s (%s sonuç)", query, location, len(results))
+    return results
@@ -0,0 +1,722 @@
+"""
+Paylaşılan Mekan Kaynakları (Google Places / Gault & Millau / Gemini / cache yardımcıları)
+
+Bu yardımcılar views.py içindeydi; venue_pipeline (kategori pipeline'ı) da onları views'tan
+import ettiği için views <-> venue_pipeline arasında döngüsel bir bağımlılık vardı. Artık
+hem views hem venue_pipeline (ve async_views) buradan import eder; views eski isimleri
+geriye uyumluluk için yeniden dışa verir.
+
+Kullanım:
+    from .venue_sources import get_gmaps_client, get_place_details_extended, save_venues_to_cache
+    gmaps = get_gmaps_client()
+    details = get_place_details_extended(gmaps, place_id)
+    details = await aget_place_details_extended(client, place_id)     # httpx.AsyncClient (ASGI)
+"""
+
+import copy
+import logging
+import re
+
+from django.conf import settings
+
+from .cache_service import get_cached_venues_for_hybrid_swr, save_venues_to_cache_swr
+from .candidates import Review
+from .lazy import lazy_callable
+from .models import GaultMillauVenue
+from .task_queue import defer
+from .timing import span, timed_model
+
+logger = logging.getLogger(__name__)
+
+# Ağır modüller ilk kullanımda yüklenir (cold start optimizasyonu)
+discover_instagram_url = lazy_callable('api.instagram_service', 'discover_instagram_url')
+get_static_gm_restaurants = lazy_callable('api.gault_millau_data', 'get_gm_restaurants_for_category')
+is_michelin_restaurant = lazy_callable('api.michelin_data', 'is_michelin_restaurant')
+
+
+# ===== CONFIGURATION =====
+PLACES_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+# Atmosphere SKU alanları - reviews zaten alınıyordu, diğerlerini ekliyoruz (ek maliyet yok)
+PLACE_DETAILS_FIELDS = (
+    'reviews',
+    'serves_breakfast', 'serves_lunch', 'serves_dinner', 'serves_brunch',
+    'serves_beer', 'serves_wine', 'serves_vegetarian_food',
+    'dine_in', 'takeout', 'delivery', 'reservable',
+)
+
+
+def clean_json_string(json_str: str) -> str:
+    """
+    Gemini'den dönen JSON string'ini temizler.
+    - Trailing comma'ları kaldırır (,] ve ,} pattern'leri)
+    - Markdown code block'ları temizler
+    """
+    # Markdown code block temizle
+    json_str = re.sub(r'```json\s*|\s*```', '', json_str)
+    json_str = json_str.strip()
+
+    # Trailing comma'ları temizle: ,] -> ] ve ,} -> }
+    json_str = re.sub(r',\s*]', ']', json_str)
+    json_str = re.sub(r',\s*}', '}', json_str)
+
+    return json_str
+
+
+# Initialize APIs - lazy load to avoid errors during startup
+def get_gmaps_client():
+    if not settings.GOOGLE_MAPS_API_KEY:
+        return None
+    import googlemaps
+    return googlemaps.Client(key=settings.GOOGLE_MAPS_API_KEY)
+
+
+def _fetch_place_details(gmaps, place_id: str) -> dict:
+    """Place Details ham 'result' alanı (yorumlar + yemek servis alanları). Hata → {}."""
+    if not gmaps or not place_id:
+        return {}
+
+    try:
+        details = gmaps.place(place_id, fields=list(PLACE_DETAILS_FIELDS), language='tr')
+        return details.get('result', {})
+    except Exception as e:
+        logger.warning("⚠️ Place details error for %s: %s", place_id, e)
+        return {}
+
+
+def _parse_food_services(result: dict) -> dict:
+    food_services = {
+        'servesBreakfast': result.get('serves_breakfast'),
+        'servesLunch': result.get('serves_lunch'),
+        'servesDinner': result.get('serves_dinner'),
+        'servesBrunch': result.get('serves_brunch'),
+        'servesBeer': result.get('serves_beer'),
+        'servesWine': result.get('serves_wine'),
+        'servesVegetarianFood': result.get('serves_vegetarian_food'),
+        'dineIn': result.get('dine_in'),
+        'takeout': result.get('takeout'),
+        'delivery': result.get('delivery'),
+        'reservable': result.get('reservable'),
+    }
+
+    # None değerleri temizle
+    return {k: v for k, v in food_services.items() if v is not None}
+
+
+def get_place_details_extended(gmaps, place_id: str, max_reviews: int = 5) -> dict:
+    """
+    Place Details API ile yorumları ve yemek servis bilgilerini al.
+    Legacy API'de textsearch bu bilgileri döndürmez, bu fonksiyon ile alınır.
+
+    Args:
+        gmaps: Google Maps client
+        place_id: Mekan place_id
+        max_reviews: Maksimum yorum sayısı (default 5, API limiti de 5)
+
+    Returns:
+        {'reviews': [...], 'foodServices': {...}}
+    """
+    return _details_from_result(_fetch_place_details(gmaps, place_id), max_reviews)
+
+
+def _details_from_result(result: dict, max_reviews: int) -> dict:
+    return {
+        'reviews': [Review.from_details(review).to_dict() for review in (result.get('reviews') or [])[:max_reviews]],
+        'foodServices': _parse_food_services(result),
+    }
+
+
+async def aget_place_details_extended(client, place_id: str, max_reviews: int = 5) -> dict:
+    """get_place_details_extended'in httpx.AsyncClient karşılığı (aynı alanlar, aynı çıktı). Hata → boş."""
+    result = {}
+    if settings.GOOGLE_MAPS_API_KEY and place_id:
+        try:
+            with span('places.details'):
+                response = await client.get(PLACES_DETAILS_URL, params={
+                    'place_id': place_id,
+                    'fields': ','.join(PLACE_DETAILS_FIELDS),
+                    'language': 'tr',
+                    'key': settings.GOOGLE_MAPS_API_KEY,
+                })
+            response.raise_for_status()
+            result = response.json().get('result', {})
+        except Exception as e:
+            logger.warning("⚠️ Place details error for %s: %s", place_id, e)
+    return _details_from_result(result, max_reviews)
+
+
+def get_place_details_records(gmaps, place_id: str, max_reviews: int = 5) -> tuple:
+    """
+    get_place_details_extended'in kayıt döndüren hali: (Review kayıtları, foodServices).
+    generate_venues varsayılan yolu yorumları JSON dict'ine sadece serialization'da çevirir.
+    """
+    result = _fetch_place_details(gmaps, place_id)
+    reviews = tuple(Review.from_details(review) for review in (result.get('reviews') or [])[:max_reviews])
+    return reviews, _parse_food_services(result)
+
+
+def get_place_reviews(gmaps, place_id: str, max_reviews: int = 5) -> list:
+    """
+    Place Details API ile yorumları al (geriye uyumluluk için).
+    Legacy API'de textsearch yorumları döndürmez, bu fonksiyon ile alınır.
+    """
+    result = get_place_details_extended(gmaps, place_id, max_reviews)
+    return result.get('reviews', [])
+
+
+def search_google_places(query, max_results=1):
+    """
+    Google Places API ile mekan araması yapar.
+    Website, telefon, çalışma saatleri ve yorumları döndürür.
+    """
+    gmaps = get_gmaps_client()
+    if not gmaps:
+        return []
+
+    try:
+        # Text Search ile mekan bul
+        places_result = gmaps.places(query=query)
+
+        if not places_result.get('results'):
+            return []
+
+        results = []
+        for place in places_result['results'][:max_results]:
+            place_id = place.get('place_id')
+
+            # Place Details ile detaylı bilgi al
+            if place_id:
+                details = gmaps.place(
+                    place_id=place_id,
+                    fields=[
+                        'name', 'formatted_address', 'formatted_phone_number',
+                        'website', 'opening_hours', 'rating', 'user_ratings_total',
+                        'reviews', 'photo', 'geometry'
+                    ]
+                )
+
+                detail_result = details.get('result', {})
+
+                # Fotoğraf URL'i oluştur
+                image_url = None
+                photos = detail_result.get('photos') or detail_result.get('photo')
+                if photos:
+                    photo_list = photos if isinstance(photos, list) else [photos]
+                    if photo_list and photo_list[0].get('photo_reference'):
+                        photo_ref = photo_list[0].get('photo_reference')
+                        image_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
+
+                # Çalışma saatlerini işle
+                hours = ''
+                weekly_hours = []
+                is_open_now = None
+                opening_hours = detail_result.get('opening_hours', {})
+                if opening_hours:
+                    weekly_hours = opening_hours.get('weekday_text', [])
+                    is_open_now = opening_hours.get('open_now', None)
+                    if weekly_hours:
+                        # Bugünün çalışma saatini bul
+                        from datetime import datetime
+                        today_idx = datetime.now().weekday()
+                        if today_idx < len(weekly_hours):
+                            hours = weekly_hours[today_idx]
+
+                # Google Reviews'ları işle
+                google_reviews = []
+                if detail_result.get('reviews'):
+                    for review in detail_result['reviews'][:5]:
+                        google_reviews.append({
+                            'authorName': review.get('author_name', ''),
+                            'rating': review.get('rating', 5),
+                            'text': review.get('text', ''),
+                            'relativeTime': review.get('relative_time_description', ''),
+                            'profilePhotoUrl': review.get('profile_photo_url', '')
+                        })
+
+                results.append({
+                    'name': detail_result.get('name', place.get('name')),
+                    'address': detail_result.get('formatted_address', place.get('formatted_address', '')),
+                    'formatted_phone_number': detail_result.get('formatted_phone_number', ''),
+                    'website': detail_result.get('website', ''),
+                    'hours': hours,
+                    'weeklyHours': weekly_hours,
+                    'isOpenNow': is_open_now,
+                    'rating': detail_result.get('rating', place.get('rating')),
+                    'user_ratings_total': detail_result.get('user_ratings_total', place.get('user_ratings_total', 0)),
+                    'reviews': google_reviews,
+                    'imageUrl': image_url,
+                    'geometry': detail_result.get('geometry', place.get('geometry'))
+                })
+
+        return results
+
+    except Exception as e:
+        logger.warning("⚠️ Google Places API error: %s", e)
+        return []
+
+
+# ===== GAULT & MILLAU HELPER FONKSİYONLARI =====
+# Kategori ID -> Kategori adı eşleştirmesi
+CATEGORY_ID_TO_NAME = {
+    "2": "Fine Dining",
+    "24": "Meyhane",
+    "26": "Balıkçı",
+    "ocakbasi": "Ocakbaşı",
+    "4": "Kahvaltı",
+    "25": "Brunch",
+    "11": "Tatlıcı",
+    "1": "Romantik Akşam",
+    "14": "Kebapçı",
+    "sokak-lezzeti": "Sokak Lezzeti",
+}
+
+# Kategori adı -> ID eşleştirmesi (ters lookup)
+CATEGORY_NAME_TO_ID = {v: k for k, v in CATEGORY_ID_TO_NAME.items()}
+
+
+def save_gm_venue_record(restaurant_name: str, defaults: dict):
+    """Statik listeden Places ile bulunan G&M restoranını veritabanına yazar (after-response task)."""
+    try:
+        GaultMillauVenue.objects.update_or_create(name=restaurant_name, defaults=defaults)
+        logger.info("✅ G&M SYNC - %s veritabanına kaydedildi", restaurant_name)
+    except Exception as db_err:
+        logger.warning("⚠️ G&M DB kayıt hatası (%s): %s", restaurant_name, db_err)
+
+
+def get_gm_venues_for_category(category_id: str, category_name: str, city: str, exclude_ids: set = None, district: str = None) -> list:
+    """
+    Belirli bir kategori için Gault & Millau restoranlarını döner.
+    1. Önce veritabanından sync edilmiş restoranları çeker
+    2. Veritabanında yoksa statik listeden alır ve Google Places ile arar
+
+    Args:
+        category_id: Kategori ID'si (örn: "24" for Meyhane)
+        category_name: Kategori adı (örn: "Meyhane")
+        city: Şehir adı
+        exclude_ids: Hariç tutulacak place_id'ler
+        district: İlçe adı (opsiyonel) - adres bazlı filtreleme için
+
+    Returns:
+        G&M venue_data listesi (sıralanmış - yüksek toque önce)
+    """
+
+    venues_data = []
+
+    try:
+        # 1. Önce veritabanından sync edilmiş G&M restoranlarını çek
+        gm_venues = GaultMillauVenue.objects.filter(
+            is_active=True,
+            is_synced=True,
+            city__iexact=city
+        ).order_by('-toques', 'name')
+
+        for gm_venue in gm_venues:
+            # Kategori kontrolü - Python tarafında
+            if category_id not in (gm_venue.categories or []):
+                continue
+            # Exclude ID kontrolü
+            if exclude_ids and gm_venue.place_id in exclude_ids:
+                continue
+
+            # venue_data varsa kullan
+            if gm_venue.venue_data:
+                venue = gm_venue.venue_data.copy()
+
+                # İlçe kontrolü - adres içinde ilçe adı var mı?
+                if district:
+                    venue_address = venue.get('address', '').lower()
+                    district_lower = district.lower()
+                    # Türkçe karakterleri normalize et
+                    district_normalized = district_lower.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
+                    address_normalized = venue_address.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
+
+                    if district_lower not in venue_address and district_normalized not in address_normalized:
+                        logger.debug("❌ G&M İLÇE REJECT - %s: adres '%s' içermiyor", venue.get('name'), district)
+                        continue
+
+                venue['gaultMillauToques'] = gm_venue.toques
+                if gm_venue.award:
+                    venue['gaultMillauAward'] = gm_venue.award
+                # googleMapsUrl yoksa ekle
+                if not venue.get('googleMapsUrl') and gm_venue.place_id:
+                    venue['googleMapsUrl'] = f"https://www.google.com/maps/place/?q=place_id:{gm_venue.place_id}"
+                venues_data.append(venue)
+
+        if venues_data:
+            logger.info("🏆 G&M DB - %s kategorisinde %s G&M restoran bulundu (%s)", category_name, len(venues_data), city)
+            return venues_data
+
+    except Exception as e:
+        logger.warning("⚠️ G&M DB sorgusu hatası: %s", e)
+
+    # 2. Veritabanında yoksa statik listeden al ve Google Places ile ara
+    try:
+        # Şehir mapping (statik listede İstanbul -> Istanbul olarak kayıtlı)
+        city_mapping = {
+            'İstanbul': 'Istanbul',
+            'istanbul': 'Istanbul',
+            'İzmir': 'Izmir',
+            'izmir': 'Izmir',
+            'Ankara': 'Ankara',
+            'ankara': 'Ankara',
+        }
+        normalized_city = city_mapping.get(city, city)
+
+        static_restaurants = get_static_gm_restaurants(category_id, normalized_city)
+
+        if not static_restaurants:
+            logger.info("📋 G&M STATİK - %s kategorisinde restoran bulunamadı (%s)", category_name, city)
+            return []
+
+        logger.info("📋 G&M STATİK - %s restoran bulundu, Google Places ile aranıyor...", len(static_restaurants))
+
+        # Google Places API ile ara
+        gmaps = get_gmaps_client()
+        if not gmaps:
+            logger.warning("⚠️ Google Maps API key eksik")
+            return []
+
+        for restaurant in static_restaurants[:5]:  # İlk 5 restoran
+            restaurant_name = restaurant.get('name', '')
+
+            # Exclude kontrolü (isim bazlı)
+            if exclude_ids:
+                skip = False
+                for exc_id in exclude_ids:
+                    if restaurant_name.lower() in str(exc_id).lower():
+                        skip = True
+                        break
+                if skip:
+                    continue
+
+            try:
+                # Google Places ile ara
+                search_query = f"{restaurant_name} restoran {city}"
+                places_result = gmaps.places(query=search_query, language='tr')
+
+                if places_result.get('results'):
+                    place = places_result['results'][0]
+                    place_id = place.get('place_id')
+
+                    # İsim eşleşme kontrolü - Google'ın döndürdüğü isim G&M restoranıyla eşleşmeli
+                    google_name = place.get('name', '').lower()
+                    search_name = restaurant_name.lower()
+                    # Normalize et
+                    google_name_norm = google_name.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
+                    search_name_norm = search_name.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
+
+                    # İsim eşleşme kontrolü - aranan kelimelerin çoğunluğu Google sonucunda olmalı
+                    search_words = set(search_name_norm.split())
+                    google_words = set(google_name_norm.split())
+                    common_words = search_words & google_words
+
+                    # 2+ kelimelik aramalarda en az %80 eşleşme, tek kelimede tam eşleşme
+                    min_match_ratio = 0.8 if len(search_words) >= 2 else 1.0
+                    if len(common_words) < len(search_words) * min_match_ratio:
+                        logger.debug("❌ G&M İSİM REJECT - Aranan: '%s', Bulunan: '%s' - eşleşmiyor", restaurant_name, place.get('name'))
+                        continue
+
+                    # Detay bilgisi al
+                    details = gmaps.place(
+                        place_id,
+                        fields=['name', 'formatted_address', 'rating', 'photo', 'price_level',
+                                'opening_hours', 'website', 'formatted_phone_number', 'geometry'],
+                        language='tr'
+                    )
+                    place_details = details.get('result', {})
+
+                    # Fotoğraf URL'si
+                    photo_url = None
+                    if place_details.get('photos'):
+                        photo_ref = place_details['photos'][0].get('photo_reference')
+                        if photo_ref:
+                            photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
+
+                    # Fiyat seviyesi
+                    price_level = place_details.get('price_level', 2)
+                    price_map = {0: '$', 1: '$', 2: '$$', 3: '$$$', 4: '$$$$'}
+
+                    venue_address = place_details.get('formatted_address', '')
+
+                    # İlçe kontrolü - adres içinde ilçe adı var mı?
+                    if district:
+                        address_lower = venue_address.lower()
+                        district_lower = district.lower()
+                        # Türkçe karakterleri normalize et
+                        district_normalized = district_lower.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
+                        address_normalized = address_lower.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
+
+                        if district_lower not in address_lower and district_normalized not in address_normalized:
+                            logger.debug("❌ G&M İLÇE REJECT - %s: adres '%s' içermiyor (%s)", restaurant_name, district, venue_address)
+                            continue
+
+                    venue_data = {
+                        'id': place_id,
+                        'name': place_details.get('name', restaurant_name),
+                        'address': venue_address,
+                        'imageUrl': photo_url or 'https://images.unsplash.com/photo-1517248135467-4c7edcad34c4',
+                        'googleRating': place_details.get('rating', 4.5),
+                        'priceRange': price_map.get(price_level, '$$'),
+                        'website': place_details.get('website'),
+                        'phone': place_details.get('formatted_phone_number'),
+                        'googleMapsUrl': f"https://www.google.com/maps/place/?q=place_id:{place_id}",
+                        'gaultMillauToques': restaurant.get('toques', 2),
+                        'gaultMillauAward': restaurant.get('award'),
+                        'instagramUrl': f"https://instagram.com/{restaurant.get('instagram')}" if restaurant.get('instagram') else None,
+                        'vibeTags': ['#GaultMillau', f"#{restaurant.get('toques', 2)}Toque"],
+                        'matchScore': 95,
+                    }
+
+                    venues_data.append(venue_data)
+
+                    # Veritabanına kaydet (response sonrası, kritik yolun dışında)
+                    defer(save_gm_venue_record, restaurant_name, {
+                        'place_id': place_id,
+                        'toques': restaurant.get('toques', 2),
+                        'award': restaurant.get('award'),
+                        'chef': restaurant.get('chef'),
+                        'categories': restaurant.get('categories', []),
+                        'city': city,
+                        'venue_data': venue_data,
+                        'instagram': restaurant.get('instagram'),
+                        'is_synced': True,
+                        'is_active': True
+                    })
+
+            except Exception as place_err:
+                logger.warning("⚠️ G&M Places hatası (%s): %s", restaurant_name, place_err)
+                continue
+
+        if venues_data:
+            logger.info("🏆 G&M STATİK->API - %s restoran bulundu ve sync edildi", len(venues_data))
+
+        return venues_data
+
+    except Exception as e:
+        logger.warning("⚠️ G&M statik liste hatası: %s", e)
+        return []
+
+
+def enrich_gm_venues_with_gemini(gm_venues: list, category_name: str) -> list:
+    """
+    G&M mekanlarını Gemini ile zenginleştirir.
+    practicalInfo, atmosphereSummary, description ve vibeTags ekler.
+    """
+    import json
+    import re
+
+    if not gm_venues:
+        return []
+
+    try:
+        model = get_genai_model()
+        if not model:
+            logger.warning("⚠️ Gemini model bulunamadı, G&M mekanları zenginleştirilmeden döndürülüyor")
+            return gm_venues
+
+        # G&M mekanlarını Gemini'ye gönderilecek formata çevir
+        places_list_items = []
+        for i, v in enumerate(gm_venues[:10]):
+            gm_info = ""
+            if v.get('gaultMillauToques'):
+                gm_info = f" | G&M: {v['gaultMillauToques']} Toque"
+            if v.get('gaultMillauAward'):
+                gm_info += f" ({v['gaultMillauAward']})"
+
+            places_list_items.append(
+                f"{i+1}. {v['name']} | Rating: {v.get('googleRating', 'N/A')} | Fiyat: {v.get('priceRange', '$$')}{gm_info}"
+            )
+        places_list = "\n".join(places_list_items)
+
+        batch_prompt = f"""Kategori: {category_name}
+Bu mekanlar Gault & Millau ödüllü prestijli restoranlardır.
+
+Mekanlar:
+{places_list}
+
+Her mekan için analiz yap ve JSON döndür:
+{{
+  "name": "Mekan Adı",
+  "description": "2-3 cümle Türkçe - mekanın öne çıkan özelliği ve neden G&M ödülü aldığı",
+  "vibeTags": ["#GaultMillau", "#Tag2", "#Tag3"],
+  "practicalInfo": {{
+    "reservationNeeded": "Şart" | "Tavsiye Edilir" | null,
+    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
+    "parking": "Kolay" | "Zor" | "Otopark var" | null,
+    "hasValet": true | false | null,
+    "outdoorSeating": true | false | null,
+    "alcoholServed": true | false | null,
+    "priceFeeling": "Fiyatına Değer" | "Premium" | null,
+    "mustTry": "Şefin imza yemeği veya öne çıkan lezzet" | null,
+    "headsUp": "Bilmeniz gereken önemli bilgi" | null
+  }},
+  "atmosphereSummary": {{
+    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı",
+    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
+    "privacy": "Özel" | "Yarı Özel" | "Açık Alan",
+    "energy": "Sakin" | "Dengeli" | "Enerjik",
+    "idealFor": ["özel gün", "iş yemeği", "romantik akşam"],
+    "notIdealFor": ["hızlı yemek"],
+    "oneLiner": "Tek cümle Türkçe atmosfer özeti"
+  }}
+}}
+
+Kurallar:
+- G&M ödüllü mekanlar genellikle fine dining, yüksek kalite ve özel deneyim sunar
+- vibeTags'ta mutlaka #GaultMillau olsun, toque sayısına göre #2Toque, #3Toque ekle
+- Türkiye'nin en prestijli restoranları - buna göre değerlendir
+- reservationNeeded genellikle "Şart" veya "Tavsiye Edilir" olmalı
+
+SADECE JSON ARRAY döndür, başka açıklama yazma."""
+
+        logger.info("🏆 G&M Gemini zenginleştirme başlıyor (%s mekan)...", len(gm_venues))
+
+        response = model.generate_content(batch_prompt)
+        response_text = response.text.strip()
+
+        # Markdown code block temizle
+        response_text = re.sub(r'```json\s*|\s*```', '', response_text)
+        response_text = response_text.strip()
+
+        try:
+            ai_results = json.loads(response_text)
+        except json.JSONDecodeError:
+            # Array bulmaya çalış
+            match = re.search(r'\[.*\]', response_text, re.DOTALL)
+            if match:
+                ai_results = json.loads(match.group())
+            else:
+                logger.warning("⚠️ G&M Gemini JSON parse edilemedi")
+                return gm_venues
+
+        # AI sonuçlarını mekanlarla eşleştir
+        ai_by_name = {r.get('name', '').lower(): r for r in ai_results}
+
+        enriched_venues = []
+        for venue in gm_venues:
+            ai_data = ai_by_name.get(venue['name'].lower(), {})
+
+            # Zenginleştirilmiş veriyi ekle
+            enriched = venue.copy()
+
+            if ai_data.get('description'):
+                enriched['description'] = ai_data['description']
+
+            if ai_data.get('vibeTags'):
+                # Mevcut #GaultMillau tag'ini koru, yenilerini ekle
+                existing_tags = set(enriched.get('vibeTags', []))
+                new_tags = set(ai_data['vibeTags'])
+                enriched['vibeTags'] = list(existing_tags | new_tags)
+
+            if ai_data.get('practicalInfo'):
+                enriched['practicalInfo'] = ai_data['practicalInfo']
+
+            if ai_data.get('atmosphereSummary'):
+                enriched['atmosphereSummary'] = ai_data['atmosphereSummary']
+
+            enriched_venues.append(enriched)
+
+        logger.info("✅ G&M Gemini ile %s mekan zenginleştirildi", len(enriched_venues))
+        return enriched_venues
+
+    except Exception as e:
+        logger.warning("⚠️ G&M Gemini zenginleştirme hatası: %s", e)
+        return gm_venues
+
+
+# ===== CACHE HELPER FONKSİYONLARI (SWR - Stale-While-Revalidate) =====
+CACHE_VENUES_LIMIT = 50  # Cache'ten alınacak venue sayısı (normal istek için)
+CACHE_VENUES_LIMIT_LOAD_MORE = 50  # Load More için daha fazla venue çek
+
+
+def get_cached_venues_for_hybrid(category_name: str, city: str, district: str = None, neighborhood: str = None, exclude_ids: set = None, limit: int = 5, refresh_callback=None, open_now: bool = False):
+    """
+    Hybrid sistem için cache'ten venue'ları çeker (SWR stratejisi ile).
+
+    Freshness Rules:
+    - 0-24 saat: FRESH (direkt cache'ten dön)
+    - 24-96 saat: STALE (cache'ten dön, arka planda refresh başlat)
+    - 96+ saat: EXPIRED (API'ye git, yeni cache oluştur)
+
+    Returns: (venues_list, all_cached_place_ids)
+    """
+    venues_data, all_cached_ids, freshness = get_cached_venues_for_hybrid_swr(
+        category_name=category_name,
+        city=city,
+        district=district,
+        neighborhood=neighborhood,
+        exclude_ids=exclude_ids,
+        limit=limit,
+        refresh_callback=refresh_callback,
+        open_now=open_now
+    )
+
+    # Backward compatibility - return tuple without freshness
+    return venues_data, all_cached_ids
+
+
+def enrich_cached_venues_with_instagram(venues: list, city: str, district: str = None, neighborhood: str = None) -> list:
+    """
+    Cache'den dönen venue'lara Instagram URL discovery uygula.
+    Sadece instagramUrl'si boş olan venue'lar için Google CSE ile arama yapar.
+
+    Args:
+        venues: Venue listesi
+        city: Şehir adı
+        district: İlçe/semt adı (opsiyonel) - örn: "Konak"
+        neighborhood: Mahalle adı (opsiyonel) - örn: "Alsancak"
+    """
+    if not venues:
+        return venues
+
+    enriched_count = 0
+    for venue in venues:
+        # Instagram URL'si zaten varsa atla
+        existing_instagram = venue.get('instagramUrl', '')
+        if existing_instagram and 'instagram.com/' in existing_instagram:
+            continue
+
+        # Instagram URL'si yok, discovery yap
+        instagram_url = discover_instagram_url(
+            venue_name=venue.get('name', ''),
+            city=city,
+            website=venue.get('website'),
+            existing_instagram=existing_instagram if existing_instagram else None,
+            district=district,
+            neighborhood=neighborhood
+        )
+
+        if instagram_url:
+            venue['instagramUrl'] = instagram_url
+            enriched_count += 1
+            logger.debug("🔗 INSTAGRAM ENRICH - %s: %s", venue.get('name'), instagram_url)
+
+    if enriched_count > 0:
+        logger.info("✨ INSTAGRAM ENRICH - %s/%s venue zenginleştirildi", enriched_count, len(venues))
+
+    return venues
+
+
+def save_venues_to_cache(venues: list, category_name: str, city: str, district: str = None, neighborhood: str = None):
+    """
+    Venue'ları cache'e kaydeder (SWR metadata ile).
+    Yazım response gönderildikten sonra after-response kuyruğunda yapılır.
+    Venue dict'leri burada kopyalanır: view response'a kadar onları zenginleştirmeye
+    (isOpenNow, distanceKm, Instagram...) devam eder, cache o anki hâli yazmalı.
+    """
+    defer(
+        save_venues_to_cache_swr,
+        venues=copy.deepcopy(list(venues)),
+        category_name=category_name,
+        city=city,
+        district=district,
+        neighborhood=neighborhood
+    )
+
+
+def get_genai_model():
+    if settings.GEMINI_API_KEY:
+        import google.generativeai as genai
+        genai.configure(api_key=settings.GEMINI_API_KEY)
+        # Gemini 2.0 Flash - Render free tier için optimize
+        return timed_model(genai.GenerativeModel('gemini-2.0-flash'))
+    return None
@@ -0,0 +1,69 @@
+"""
+Vibe Skoru Servisi (search_venues)
+
+search_venues eskiden her sonuç için ayrı bir Gemini vibe çağrısı yapıyordu (10 sonuç → 10
+sıralı completion). Artık:
+
+- Tüm sonuçlar için tek bir batch prompt: numaralı mekan listesi → index'li JSON array.
+- Skorlar place_id bazında Django cache'te tutulur (VIBE_CACHE_TTL); sadece cache'te
+  olmayan mekanlar prompt'a girer, hepsi cache'teyse Gemini çağrılmaz.
+- Prompt Text Search sonucundan (isim, adres, tür, rating) kurulur; böylece Gemini çağrısı
+  Place Details çağrılarıyla aynı anda çalışabilir.
+- Batch / cache akışı api/gemini_batch.py'de; burada sadece prompt ve skor parse'ı var.
+
+Kullanım:
+    vibes = analyze_vibes(model, venues)                    # {place_id: {"romantic": 8, ...}}
+    vibes = await analyze_vibes_async(model, venues)        # ASGI
+"""
+
+from typing import Dict, Sequence
+
+from .gemini_batch import PlaceBatch, run_batch, run_batch_async
+
+
+# ===== CONFIGURATION =====
+VIBE_CACHE_TTL = 60 * 60 * 24 * 30      # 30 gün - mekanın vibe'ı nadiren değişir
+VIBE_CACHE_PREFIX = 'vibe:'
+VIBE_KEYS = ('romantic', 'casual', 'professional', 'social', 'quiet', 'energetic')
+
+VibeScores = Dict[str, int]
+
+
+def build_vibe_batch_prompt(venues: Sequence[dict]) -> str:
+    """Birden fazla mekan için tek Gemini vibe analizi prompt'u (build_search_venue_data formatı)."""
+    lines = "\n".join(
+        f"{i}. {v['name']} | Adres: {v['address']} | Kategoriler: {', '.join(v['types'][:5])} | Rating: {v['rating']}"
+        for i, v in enumerate(venues, 1)
+    )
+    return f"""
+Aşağıdaki mekanların vibe'ını analiz et ve her biri için şu kategorilerde 0-10 arası puan ver:
+- romantic (romantik)
+- casual (rahat, gündelik)
+- professional (iş toplantısı için uygun)
+- social (arkadaşlarla takılmak için)
+- quiet (sessiz, sakin)
+- energetic (enerjik, hareketli)
+
+Mekanlar:
+{lines}
+
+SADECE JSON ARRAY döndür, her mekan için bir obje, listedeki sırayla:
+[{{"index": 1, "romantic": 8, "casual": 5, "professional": 3, "social": 7, "quiet": 4, "energetic": 6}}, ...]
+"""
+
+
+def parse_vibe_item(item: dict) -> VibeScores:
+    return {key: item[key] for key in VIBE_KEYS if key in item}
+
+
+VIBES = PlaceBatch('vibe', VIBE_CACHE_PREFIX, VIBE_CACHE_TTL, build_vibe_batch_prompt, parse_vibe_item)
+
+
+def analyze_vibes(model, venues: Sequence[dict]) -> Dict[str, VibeScores]:
+    """place_id → vibe skorları; cache'te olmayanlar için tek Gemini çağrısı."""
+    return run_batch(VIBES, model, venues)
+
+
+async def analyze_vibes_async(model, venues: Sequence[dict]) -> Dict[str, VibeScores]:
+    """analyze_vibes'ın async (ASGI) karşılığı."""
+    return await run_batch_async(VIBES, model, venues)
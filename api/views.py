@@ -1,150 +1,43 @@
-from rest_framework import viewsets, status, permissions
-from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework import status, permissions
+from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.authtoken.models import Token
-from django.contrib.auth import authenticate
-from django.contrib.auth.models import User
 from django.conf import settings
-import googlemaps
-import google.generativeai as genai
+from django.http import StreamingHttpResponse
+import functools
+import logging
 import urllib.parse
 import time
-from .instagram_service import discover_instagram_url, find_instagram_simple, clear_instagram_cache, get_cse_status
-from .gault_millau_data import enrich_venues_with_gault_millau, get_gm_restaurants_for_category as get_static_gm_restaurants
-from .popular_venues_data import enrich_venues_with_instagram
-
-# Türkiye'deki Michelin yıldızlı ve Bib Gourmand restoranlar (2024-2025)
-# Normalized isimler - küçük harf ve Türkçe karakterler normalize edilmiş
-MICHELIN_STARRED_RESTAURANTS = {
-    # İstanbul - Michelin Yıldızlı (2 yıldız)
-    'turk fatih tutak': {'stars': 2, 'city': 'İstanbul'},
-    # İstanbul - Michelin Yıldızlı (1 yıldız)
-    'neolokal': {'stars': 1, 'city': 'İstanbul'},
-    'mikla': {'stars': 1, 'city': 'İstanbul'},
-    'nicole': {'stars': 1, 'city': 'İstanbul'},
-    'araka': {'stars': 1, 'city': 'İstanbul'},
-    'arkestra': {'stars': 1, 'city': 'İstanbul'},
-    'default': {'stars': 1, 'city': 'İstanbul'},
-    'esmae': {'stars': 1, 'city': 'İstanbul'},
-    'mürver': {'stars': 1, 'city': 'İstanbul'},
-    'murver': {'stars': 1, 'city': 'İstanbul'},
-    'octo': {'stars': 1, 'city': 'İstanbul'},
-    'azra': {'stars': 1, 'city': 'İstanbul'},
-    'esmee': {'stars': 1, 'city': 'İstanbul'},
-    # İstanbul - Bib Gourmand
-    'aheste': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    'aman da bravo': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    'casa lavanda': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    'cuma': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    'kantin': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    'privato cafe': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    'yeni lokanta': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    'gram': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    'karakoy lokantasi': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    'karaköy lokantası': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    'datli maya': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    'tatlı maya': {'stars': 0, 'bib': True, 'city': 'İstanbul'},
-    # Bodrum - Michelin Yıldızlı (1 yıldız)
-    'kitchen bodrum': {'stars': 1, 'city': 'Bodrum'},
-    'iki sandal': {'stars': 1, 'city': 'Bodrum'},
-    # Not: Maçakızı ve Zuma Bodrum yıldızlı DEĞİL, sadece Michelin Selected
-    # Ankara - Bib Gourmand
-    'mikado': {'stars': 0, 'bib': True, 'city': 'Ankara'},
-    # İzmir - Michelin Yıldızlı & Bib Gourmand
-    'oi filoi': {'stars': 1, 'city': 'İzmir'},
-    'hiç': {'stars': 1, 'city': 'İzmir'},  # Hiç Lokanta - Urla
-    'hic': {'stars': 1, 'city': 'İzmir'},
-    'hiç lokanta': {'stars': 1, 'city': 'İzmir'},
-    'hic lokanta': {'stars': 1, 'city': 'İzmir'},
-    'vino locale': {'stars': 0, 'bib': True, 'city': 'İzmir'},
-    'asma yaprağı': {'stars': 0, 'bib': True, 'city': 'İzmir'},
-    'asma yapragi': {'stars': 0, 'bib': True, 'city': 'İzmir'},
-    # Alaçatı / Çeşme - Michelin
-    'agrilia': {'stars': 1, 'city': 'İzmir'},
-    'ferdi baba': {'stars': 0, 'bib': True, 'city': 'İzmir'},
-    # Antalya
-    'seraser': {'stars': 0, 'bib': True, 'city': 'Antalya'},
-}
-
-# Şehir bazlı Michelin restoran isimleri (Google Places araması için)
-MICHELIN_RESTAURANTS_BY_CITY = {
-    'İstanbul': [
-        'Türk Fatih Tutak', 'Neolokal', 'Mikla', 'Nicole Restaurant', 'Araka',
-        'Arkestra', 'Default Restaurant', 'Mürver', 'Octo', 'Azra',
-        'Aheste', 'Yeni Lokanta', 'Karaköy Lokantası', 'Gram', 'Casa Lavanda'
-    ],
-    'İzmir': [
-        'Hiç Lokanta Urla', 'Oi Filoi İzmir', 'Agrilia Alaçatı', 'Vino Locale',
-        'Asma Yaprağı', 'Ferdi Baba Alaçatı'
-    ],
-    'Bodrum': ['Kitchen Bodrum', 'İki Sandal'],
-    'Ankara': ['Mikado Ankara'],
-    'Antalya': ['Seraser Fine Dining'],
-}
-
-def is_michelin_restaurant(venue_name):
-    """
-    Restoran isminin Michelin yıldızlı veya Bib Gourmand olup olmadığını kontrol eder.
-    Returns: {'isMichelin': bool, 'stars': int, 'isBib': bool} veya None
-    """
-    # İsmi normalize et
-    normalized = venue_name.lower().strip()
-    normalized = normalized.replace('ı', 'i').replace('ş', 's').replace('ç', 'c')
-    normalized = normalized.replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-
-    # Direkt eşleşme kontrolü
-    for michelin_name, info in MICHELIN_STARRED_RESTAURANTS.items():
-        # Hem direkt eşleşme hem de içerme kontrolü yap
-        if michelin_name in normalized or normalized in michelin_name:
-            return {
-                'isMichelin': True,
-                'stars': info.get('stars', 0),
-                'isBib': info.get('bib', False)
-            }
-
-    return None
+from .task_queue import defer
+from .timing import bind, span
+from .venue_categories import CATEGORY_TO_CONTEXT, get_category_config
 
-from .models import FavoriteVenue, SearchHistory, UserProfile, CachedVenue, GaultMillauVenue
-from django.utils import timezone
-from datetime import timedelta
-import re
+logger = logging.getLogger(__name__)
 
-def clean_json_string(json_str: str) -> str:
-    """
-    Gemini'den dönen JSON string'ini temizler.
-    - Trailing comma'ları kaldırır (,] ve ,} pattern'leri)
-    - Markdown code block'ları temizler
-    """
-    # Markdown code block temizle
-    json_str = re.sub(r'```json\s*|\s*```', '', json_str)
-    json_str = json_str.strip()
-
-    # Trailing comma'ları temizle: ,] -> ] ve ,} -> }
-    json_str = re.sub(r',\s*]', ']', json_str)
-    json_str = re.sub(r',\s*}', '}', json_str)
-
-    return json_str
+from .models import SearchHistory, CachedVenue
+from django.db.models import Count, Q
 
+from .venue_sources import (
+    get_genai_model,
+    get_gmaps_client,
+    save_venues_to_cache,
+    search_google_places,
+)
+from .event_store import serve_from_event_store
+from .itinerary import build_itinerary, chunk_line, done_line, error_line, iter_itinerary
+from .similar_service import cache_similar, describe_places, get_cached_similar
+from .similarity import DEFAULT_NEIGHBOURS, more_like_this
+from .autocomplete import DEFAULT_LIMIT as AUTOCOMPLETE_LIMIT, suggest
+from .vibe_service import analyze_vibes
+from .venue_search import search_cached_venues
+from .venue_flags import INVALID_Q
+from .opening_hours import filter_open_now, intervals_from_opening_hours, public_venue
+from .ranking import CONTEXT, rank_venues
 from .cache_service import (
+    delete_venues,
     get_cached_venues_for_hybrid_swr,
     save_venues_to_cache_swr,
-    generate_location_key,
-    get_cache_stats
-)
-from .serializers import (
-    UserSerializer, UserRegistrationSerializer,
-    FavoriteVenueSerializer, SearchHistorySerializer,
-    UserProfileSerializer, VenueSearchSerializer,
-    VenueGenerateSerializer
 )
-
-
-# Health check endpoint for Render cold start optimization
-@api_view(['GET'])
-@permission_classes([permissions.AllowAny])
-def health_check(request):
-    """Simple health check endpoint to keep the service warm."""
-    return Response({'status': 'ok'}, status=status.HTTP_200_OK)
+from .serializers import VenueSearchSerializer, VenueGenerateSerializer
 
 
 # Instagram suggestion endpoint
@@ -155,7 +48,6 @@ def suggest_instagram(request):
     Kullanıcıdan gelen Instagram öneri/düzeltmelerini kaydet.
     Bu veriler daha sonra manuel olarak doğrulanıp popular_venues_data.py'ye eklenebilir.
     """
-    import sys
 
     venue_id = request.data.get('venueId', '')
     venue_name = request.data.get('venueName', '')
@@ -165,10 +57,10 @@ def suggest_instagram(request):
         return Response({'error': 'Instagram kullanıcı adı gerekli'}, status=status.HTTP_400_BAD_REQUEST)
 
     # Öneriyi logla (daha sonra veritabanına kaydedilebilir)
-    print(f"📸 INSTAGRAM ÖNERİSİ:", file=sys.stderr, flush=True)
-    print(f"   Mekan: {venue_name} (ID: {venue_id})", file=sys.stderr, flush=True)
-    print(f"   Önerilen: @{suggested_instagram}", file=sys.stderr, flush=True)
-    print(f"   URL: https://instagram.com/{suggested_instagram}", file=sys.stderr, flush=True)
+    logger.info("📸 INSTAGRAM ÖNERİSİ:")
+    logger.info("   Mekan: %s (ID: %s)", venue_name, venue_id)
+    logger.info("   Önerilen: @%s", suggested_instagram)
+    logger.info("   URL: https://instagram.com/%s", suggested_instagram)
 
     # İleride: InstagramSuggestion modeline kaydet
     # InstagramSuggestion.objects.create(
@@ -180,60 +72,6 @@ def suggest_instagram(request):
     return Response({'success': True, 'message': 'Öneri kaydedildi'}, status=status.HTTP_200_OK)
 
 
-# ===== SHORTLINK ENDPOINTS =====
-import secrets
-from .models import ShortLink
-
-def generate_short_code():
-    """6 karakterlik benzersiz kısa kod üret."""
-    while True:
-        code = secrets.token_urlsafe(4)[:6]
-        if not ShortLink.objects.filter(code=code).exists():
-            return code
-
-
-@api_view(['POST'])
-@permission_classes([permissions.AllowAny])
-def create_shortlink(request):
-    """Venue verisi için kısa link oluştur."""
-    venue_data = request.data.get('venue_data')
-    if not venue_data:
-        return Response({'error': 'venue_data gerekli'}, status=status.HTTP_400_BAD_REQUEST)
-
-    code = generate_short_code()
-    shortlink = ShortLink.objects.create(code=code, venue_data=venue_data)
-
-    return Response({
-        'code': shortlink.code,
-        'url': f"https://maksat.app/s/{shortlink.code}"
-    }, status=status.HTTP_201_CREATED)
-
-
-@api_view(['GET'])
-@permission_classes([permissions.AllowAny])
-def get_shortlink(request, code):
-    """Kısa kod ile venue verisini getir."""
-    try:
-        shortlink = ShortLink.objects.get(code=code)
-        shortlink.access_count += 1
-        shortlink.save(update_fields=['access_count'])
-        return Response(shortlink.venue_data, status=status.HTTP_200_OK)
-    except ShortLink.DoesNotExist:
-        return Response({'error': 'Link bulunamadı'}, status=status.HTTP_404_NOT_FOUND)
-
-
-# Cache stats endpoint for monitoring
-@api_view(['GET'])
-@permission_classes([permissions.AllowAny])
-def cache_stats(request):
-    """
-    Cache statistics endpoint for monitoring SWR cache system.
-    Shows freshness distribution, category counts, and ongoing refreshes.
-    """
-    stats = get_cache_stats()
-    return Response(stats, status=status.HTTP_200_OK)
-
-
 # Cache clear endpoint - practicalInfo/atmosphereSummary eksik venue'ları temizler
 @api_view(['POST'])
 @permission_classes([permissions.AllowAny])
@@ -243,126 +81,37 @@ def cache_clear_invalid(request):
     Ayrıca yorumlarda 'kapandı', 'el değişti' gibi ifadeler olan mekanları da siler.
     Romantik kategorilerdeki zincir mekanları da temizler.
     Bu, eski format venue'ların yeniden API'den çekilmesini sağlar.
+
+    Bayraklar cache yazımında hesaplanır (api/venue_flags.py); burada yorum / isim taranmaz,
+    sayım tek bir aggregate, silme tek bir toplu DELETE'tir.
     """
-    import sys
 
     deleted_count = 0
-    deleted_closed = 0
-    deleted_missing = 0
-    deleted_chains = 0
-    deleted_non_bar = 0
 
     # HIZLI FIX: İş Çıkışı Bira & Kokteyl kategorisindeki TÜM mekanları sil
     # Bu kategori yanlış mekanlarla dolu, tamamen temizlenmeli
-    deleted_bar_category = CachedVenue.objects.filter(category='İş Çıkışı Bira & Kokteyl').delete()[0]
+    deleted_bar_category = delete_venues(CachedVenue.objects.filter(category='İş Çıkışı Bira & Kokteyl'))
     if deleted_bar_category > 0:
-        print(f"🗑️ CACHE DELETE - İş Çıkışı Bira & Kokteyl kategorisi tamamen temizlendi: {deleted_bar_category} venue", file=sys.stderr, flush=True)
+        logger.info("🗑️ CACHE DELETE - İş Çıkışı Bira & Kokteyl kategorisi tamamen temizlendi: %s venue", deleted_bar_category)
         deleted_count += deleted_bar_category
 
-    venues = CachedVenue.objects.all()
-
-    # Kapanmış mekan tespiti için anahtar kelimeler
-    # NOT: "el değiştir" kaldırıldı - el değiştirmek kapanmak anlamına gelmiyor
-    closed_keywords = [
-        'kalıcı olarak kapan', 'kalici olarak kapan',
-        'kalıcı olarak kapatıl', 'kalici olarak kapatil',
-        'artık kapalı', 'artik kapali',
-        'kapandı', 'kapandi',
-        'kapanmış', 'kapanmis',
-        'kapatıldı', 'kapatildi',
-        'kapatılmış', 'kapatilmis',
-        'permanently closed', 'closed permanently',
-        'yeni işletme', 'yeni isletme',
-        'isim değişti', 'isim degisti',
-        'yerine açıldı', 'yerine acildi',
-        'burası artık', 'burasi artik'
-    ]
-
-    # Romantik kategorilerde istenmeyecek zincir mekanlar
-    chain_store_blacklist = [
-        'starbucks', 'gloria jeans', 'caribou', 'coffee bean', 'espresso lab',
-        'mcdonalds', 'burger king', 'wendys', 'kfc', 'popeyes', 'dominos', 'pizza hut',
-        'little caesars', 'papa johns', 'sbarro', 'arbys', 'taco bell', 'subway',
-        'mado', 'the house cafe', 'house cafe', 'big chefs', 'bigchefs', 'midpoint',
-        'baylan', 'divan', 'kahve dunyasi', 'kahve dünyası', 'nero', 'costa coffee',
-        'simit sarayi', 'simit sarayı', 'tavuk dunyasi', 'tavuk dünyası', 'usta donerci',
-        'komagene', 'baydoner', 'bay döner', 'burger lab', 'zuma', 'etiler', 'nusr-et',
-        'dunkin', 'krispy kreme', 'cinnabon', 'hafiz mustafa', 'hafız mustafa',
-        'incir', 'saray muhallebicisi', 'pelit', 'faruk gulluoglu', 'faruk güllüoğlu',
-        'wok to walk', 'wagamama', 'nandos', 'tgi fridays', 'chilis', 'applebees',
-        'hard rock cafe', 'planet hollywood', 'rainforest cafe', 'cheesecake factory',
-        'petra roasting', "walter's coffee"
-    ]
+    # Birden fazla bayrağı olan kayıt tek sebepte sayılır (öncelik: eksik alan > kapanmış > bar olmayan > zincir)
+    invalid = CachedVenue.objects.filter(INVALID_Q)
+    counts = invalid.aggregate(
+        missing=Count('id', filter=Q(missing_enrichment=True)),
+        closed=Count('id', filter=Q(missing_enrichment=False, is_closed=True)),
+        non_bar=Count('id', filter=Q(missing_enrichment=False, is_closed=False, is_non_bar=True)),
+        chains=Count('id', filter=Q(missing_enrichment=False, is_closed=False, is_non_bar=False, is_chain=True)),
+    )
+    deleted_invalid = delete_venues(invalid)
+    if deleted_invalid:
+        logger.info("🗑️ CACHE DELETE - %s geçersiz venue (%s)", deleted_invalid, counts)
+    deleted_count += deleted_invalid
 
-    romantic_categories = ['İlk Buluşma', 'Özel Gün', 'Fine Dining', 'Romantik Akşam']
-
-    for venue in venues:
-        venue_data = venue.venue_data
-        should_delete = False
-        delete_reason = ""
-
-        # 1. practicalInfo/atmosphereSummary eksik mi kontrol et
-        has_practical = 'practicalInfo' in venue_data and venue_data['practicalInfo']
-        has_atmosphere = 'atmosphereSummary' in venue_data and venue_data['atmosphereSummary']
-
-        if not has_practical or not has_atmosphere:
-            should_delete = True
-            delete_reason = "missing_fields"
-
-        # 2. Yorumlarda kapanmış mekan belirtisi var mı kontrol et
-        if not should_delete:
-            reviews = venue_data.get('googleReviews', [])
-            for review in reviews[:5]:  # Son 5 yorumu kontrol et
-                review_text = review.get('text', '').lower()
-                review_text_normalized = review_text.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-
-                for keyword in closed_keywords:
-                    keyword_normalized = keyword.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                    if keyword_normalized in review_text_normalized:
-                        should_delete = True
-                        delete_reason = f"closed_venue:{keyword}"
-                        break
-                if should_delete:
-                    break
-
-        # 3. İş Çıkışı Bira & Kokteyl kategorisinde bar/pub olmayan mekanları sil
-        if not should_delete and venue.category == 'İş Çıkışı Bira & Kokteyl':
-            venue_name_lower = venue.name.lower().replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-            # Bar/pub olduğunu gösteren kelimeler
-            bar_keywords = ['pub', 'bar', 'beer', 'bira', 'ale', 'cocktail', 'kokteyl', 'blues', 'rock', 'jazz', 'lounge']
-            # Bar/pub olmadığını gösteren kelimeler (bunlar varsa sil)
-            non_bar_keywords = ['meyhane', 'meze', 'fasil', 'türkü', 'turku', 'ocakbasi', 'kebap', 'köfte', 'kofte', 'lokanta', 'restoran', 'balık', 'balik', 'cafe', 'kahve', '%100', 'more', 'konak pier']
-
-            has_bar_keyword = any(kw in venue_name_lower for kw in bar_keywords)
-            has_non_bar_keyword = any(kw in venue_name_lower for kw in non_bar_keywords)
-
-            # Non-bar keyword varsa VE bar keyword yoksa sil
-            if has_non_bar_keyword and not has_bar_keyword:
-                should_delete = True
-                delete_reason = f"non_bar_venue:{venue.name}"
-
-        # 4. Romantik kategorilerde zincir mekan mı kontrol et
-        if not should_delete and venue.category in romantic_categories:
-            venue_name_lower = venue.name.lower().replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-            for chain in chain_store_blacklist:
-                chain_normalized = chain.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                if chain_normalized in venue_name_lower:
-                    should_delete = True
-                    delete_reason = f"chain_store:{chain}"
-                    break
-
-        if should_delete:
-            print(f"🗑️ CACHE DELETE - {venue.name}: {delete_reason}", file=sys.stderr, flush=True)
-            venue.delete()
-            deleted_count += 1
-            if delete_reason == "missing_fields":
-                deleted_missing += 1
-            elif delete_reason.startswith("closed_venue"):
-                deleted_closed += 1
-            elif delete_reason.startswith("chain_store"):
-                deleted_chains += 1
-            elif delete_reason.startswith("non_bar_venue"):
-                deleted_non_bar += 1
+    deleted_missing = counts['missing']
+    deleted_closed = counts['closed']
+    deleted_chains = counts['chains']
+    deleted_non_bar = counts['non_bar']
 
     return Response({
         'deleted': deleted_count,
@@ -382,7 +131,6 @@ def cache_clear_category(request):
     Belirli bir kategorinin cache'ini tamamen siler.
     Body: { "category": "İş Çıkışı Bira & Kokteyl", "city": "İzmir" (optional) }
     """
-    import sys
 
     category = request.data.get('category')
     city = request.data.get('city')
@@ -400,7 +148,7 @@ def cache_clear_category(request):
     query.delete()
 
     location_info = f"{category}" + (f" / {city}" if city else "")
-    print(f"🗑️ CACHE CLEAR CATEGORY - {location_info}: {count} venue silindi", file=sys.stderr, flush=True)
+    logger.info("🗑️ CACHE CLEAR CATEGORY - %s: %s venue silindi", location_info, count)
 
     return Response({
         'deleted': count,
@@ -410,653 +158,44 @@ def cache_clear_category(request):
     }, status=status.HTTP_200_OK)
 
 
-# Initialize APIs - lazy load to avoid errors during startup
-def get_gmaps_client():
-    return googlemaps.Client(key=settings.GOOGLE_MAPS_API_KEY) if settings.GOOGLE_MAPS_API_KEY else None
-
-
-def get_place_details_extended(gmaps, place_id: str, max_reviews: int = 5) -> dict:
-    """
-    Place Details API ile yorumları ve yemek servis bilgilerini al.
-    Legacy API'de textsearch bu bilgileri döndürmez, bu fonksiyon ile alınır.
-
-    Args:
-        gmaps: Google Maps client
-        place_id: Mekan place_id
-        max_reviews: Maksimum yorum sayısı (default 5, API limiti de 5)
-
-    Returns:
-        {'reviews': [...], 'foodServices': {...}}
-    """
-    import sys
-    if not gmaps or not place_id:
-        return {'reviews': [], 'foodServices': {}}
-
-    try:
-        # Atmosphere SKU alanları - reviews zaten alınıyordu, diğerlerini ekliyoruz (ek maliyet yok)
-        details = gmaps.place(
-            place_id,
-            fields=[
-                'reviews',
-                'serves_breakfast', 'serves_lunch', 'serves_dinner', 'serves_brunch',
-                'serves_beer', 'serves_wine', 'serves_vegetarian_food',
-                'dine_in', 'takeout', 'delivery', 'reservable'
-            ],
-            language='tr'
+def generate_vacation_experiences(location, trip_duration, filters):
+    """Tatil kategorisi için deneyim odaklı öneri sistemi (gün aralıkları paralel, rota cache'li - api/itinerary.py)"""
+    # Gemini AI ile deneyim bazlı tatil planı oluştur
+    model = get_genai_model()
+    if not model:
+        return Response(
+            {'error': 'Gemini API key eksik'},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
         )
 
-        result = details.get('result', {})
-
-        # Yorumları parse et
-        reviews = []
-        if result.get('reviews'):
-            for review in result['reviews'][:max_reviews]:
-                reviews.append({
-                    'authorName': review.get('author_name', ''),
-                    'rating': review.get('rating', 5),
-                    'text': review.get('text', ''),
-                    'relativeTime': review.get('relative_time_description', ''),
-                    'profilePhotoUrl': review.get('profile_photo_url', ''),
-                    'time': review.get('time')  # UNIX timestamp for stale review check
-                })
-
-        # Yemek servis bilgilerini parse et
-        food_services = {
-            'servesBreakfast': result.get('serves_breakfast'),
-            'servesLunch': result.get('serves_lunch'),
-            'servesDinner': result.get('serves_dinner'),
-            'servesBrunch': result.get('serves_brunch'),
-            'servesBeer': result.get('serves_beer'),
-            'servesWine': result.get('serves_wine'),
-            'servesVegetarianFood': result.get('serves_vegetarian_food'),
-            'dineIn': result.get('dine_in'),
-            'takeout': result.get('takeout'),
-            'delivery': result.get('delivery'),
-            'reservable': result.get('reservable'),
-        }
-
-        # None değerleri temizle
-        food_services = {k: v for k, v in food_services.items() if v is not None}
-
-        return {'reviews': reviews, 'foodServices': food_services}
-    except Exception as e:
-        print(f"⚠️ Place details error for {place_id}: {e}", file=sys.stderr, flush=True)
-        return {'reviews': [], 'foodServices': {}}
-
-
-def get_place_reviews(gmaps, place_id: str, max_reviews: int = 5) -> list:
-    """
-    Place Details API ile yorumları al (geriye uyumluluk için).
-    Legacy API'de textsearch yorumları döndürmez, bu fonksiyon ile alınır.
-    """
-    result = get_place_details_extended(gmaps, place_id, max_reviews)
-    return result.get('reviews', [])
-
-
-# ===== GAULT & MILLAU HELPER FONKSİYONLARI =====
-# Kategori ID -> Kategori adı eşleştirmesi
-CATEGORY_ID_TO_NAME = {
-    "2": "Fine Dining",
-    "24": "Meyhane",
-    "26": "Balıkçı",
-    "ocakbasi": "Ocakbaşı",
-    "4": "Kahvaltı",
-    "25": "Brunch",
-    "11": "Tatlıcı",
-    "1": "Romantik Akşam",
-    "14": "Kebapçı",
-    "sokak-lezzeti": "Sokak Lezzeti",
-}
-
-# Kategori adı -> ID eşleştirmesi (ters lookup)
-CATEGORY_NAME_TO_ID = {v: k for k, v in CATEGORY_ID_TO_NAME.items()}
-
-
-def get_gm_venues_for_category(category_id: str, category_name: str, city: str, exclude_ids: set = None, district: str = None) -> list:
-    """
-    Belirli bir kategori için Gault & Millau restoranlarını döner.
-    1. Önce veritabanından sync edilmiş restoranları çeker
-    2. Veritabanında yoksa statik listeden alır ve Google Places ile arar
-
-    Args:
-        category_id: Kategori ID'si (örn: "24" for Meyhane)
-        category_name: Kategori adı (örn: "Meyhane")
-        city: Şehir adı
-        exclude_ids: Hariç tutulacak place_id'ler
-        district: İlçe adı (opsiyonel) - adres bazlı filtreleme için
-
-    Returns:
-        G&M venue_data listesi (sıralanmış - yüksek toque önce)
-    """
-    import sys
-
-    venues_data = []
-
-    try:
-        # 1. Önce veritabanından sync edilmiş G&M restoranlarını çek
-        gm_venues = GaultMillauVenue.objects.filter(
-            is_active=True,
-            is_synced=True,
-            city__iexact=city
-        ).order_by('-toques', 'name')
-
-        for gm_venue in gm_venues:
-            # Kategori kontrolü - Python tarafında
-            if category_id not in (gm_venue.categories or []):
-                continue
-            # Exclude ID kontrolü
-            if exclude_ids and gm_venue.place_id in exclude_ids:
-                continue
-
-            # venue_data varsa kullan
-            if gm_venue.venue_data:
-                venue = gm_venue.venue_data.copy()
-
-                # İlçe kontrolü - adres içinde ilçe adı var mı?
-                if district:
-                    venue_address = venue.get('address', '').lower()
-                    district_lower = district.lower()
-                    # Türkçe karakterleri normalize et
-                    district_normalized = district_lower.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                    address_normalized = venue_address.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-
-                    if district_lower not in venue_address and district_normalized not in address_normalized:
-                        print(f"❌ G&M İLÇE REJECT - {venue.get('name')}: adres '{district}' içermiyor", file=sys.stderr, flush=True)
-                        continue
-
-                venue['gaultMillauToques'] = gm_venue.toques
-                if gm_venue.award:
-                    venue['gaultMillauAward'] = gm_venue.award
-                # googleMapsUrl yoksa ekle
-                if not venue.get('googleMapsUrl') and gm_venue.place_id:
-                    venue['googleMapsUrl'] = f"https://www.google.com/maps/place/?q=place_id:{gm_venue.place_id}"
-                venues_data.append(venue)
-
-        if venues_data:
-            print(f"🏆 G&M DB - {category_name} kategorisinde {len(venues_data)} G&M restoran bulundu ({city})", file=sys.stderr, flush=True)
-            return venues_data
-
-    except Exception as e:
-        print(f"⚠️ G&M DB sorgusu hatası: {e}", file=sys.stderr, flush=True)
-
-    # 2. Veritabanında yoksa statik listeden al ve Google Places ile ara
-    try:
-        # Şehir mapping (statik listede İstanbul -> Istanbul olarak kayıtlı)
-        city_mapping = {
-            'İstanbul': 'Istanbul',
-            'istanbul': 'Istanbul',
-            'İzmir': 'Izmir',
-            'izmir': 'Izmir',
-            'Ankara': 'Ankara',
-            'ankara': 'Ankara',
-        }
-        normalized_city = city_mapping.get(city, city)
-
-        static_restaurants = get_static_gm_restaurants(category_id, normalized_city)
-
-        if not static_restaurants:
-            print(f"📋 G&M STATİK - {category_name} kategorisinde restoran bulunamadı ({city})", file=sys.stderr, flush=True)
-            return []
-
-        print(f"📋 G&M STATİK - {len(static_restaurants)} restoran bulundu, Google Places ile aranıyor...", file=sys.stderr, flush=True)
-
-        # Google Places API ile ara
-        gmaps = get_gmaps_client()
-        if not gmaps:
-            print(f"⚠️ Google Maps API key eksik", file=sys.stderr, flush=True)
-            return []
-
-        for restaurant in static_restaurants[:5]:  # İlk 5 restoran
-            restaurant_name = restaurant.get('name', '')
-
-            # Exclude kontrolü (isim bazlı)
-            if exclude_ids:
-                skip = False
-                for exc_id in exclude_ids:
-                    if restaurant_name.lower() in str(exc_id).lower():
-                        skip = True
-                        break
-                if skip:
-                    continue
-
-            try:
-                # Google Places ile ara
-                search_query = f"{restaurant_name} restoran {city}"
-                places_result = gmaps.places(query=search_query, language='tr')
-
-                if places_result.get('results'):
-                    place = places_result['results'][0]
-                    place_id = place.get('place_id')
-
-                    # İsim eşleşme kontrolü - Google'ın döndürdüğü isim G&M restoranıyla eşleşmeli
-                    google_name = place.get('name', '').lower()
-                    search_name = restaurant_name.lower()
-                    # Normalize et
-                    google_name_norm = google_name.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                    search_name_norm = search_name.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-
-                    # İsim eşleşme kontrolü - aranan kelimelerin çoğunluğu Google sonucunda olmalı
-                    search_words = set(search_name_norm.split())
-                    google_words = set(google_name_norm.split())
-                    common_words = search_words & google_words
-
-                    # 2+ kelimelik aramalarda en az %80 eşleşme, tek kelimede tam eşleşme
-                    min_match_ratio = 0.8 if len(search_words) >= 2 else 1.0
-                    if len(common_words) < len(search_words) * min_match_ratio:
-                        print(f"❌ G&M İSİM REJECT - Aranan: '{restaurant_name}', Bulunan: '{place.get('name')}' - eşleşmiyor", file=sys.stderr, flush=True)
-                        continue
-
-                    # Detay bilgisi al
-                    details = gmaps.place(
-                        place_id,
-                        fields=['name', 'formatted_address', 'rating', 'photo', 'price_level',
-                                'opening_hours', 'website', 'formatted_phone_number', 'geometry'],
-                        language='tr'
-                    )
-                    place_details = details.get('result', {})
-
-                    # Fotoğraf URL'si
-                    photo_url = None
-                    if place_details.get('photos'):
-                        photo_ref = place_details['photos'][0].get('photo_reference')
-                        if photo_ref:
-                            photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
-
-                    # Fiyat seviyesi
-                    price_level = place_details.get('price_level', 2)
-                    price_map = {0: '$', 1: '$', 2: '$$', 3: '$$$', 4: '$$$$'}
-
-                    venue_address = place_details.get('formatted_address', '')
-
-                    # İlçe kontrolü - adres içinde ilçe adı var mı?
-                    if district:
-                        address_lower = venue_address.lower()
-                        district_lower = district.lower()
-                        # Türkçe karakterleri normalize et
-                        district_normalized = district_lower.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                        address_normalized = address_lower.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-
-                        if district_lower not in address_lower and district_normalized not in address_normalized:
-                            print(f"❌ G&M İLÇE REJECT - {restaurant_name}: adres '{district}' içermiyor ({venue_address})", file=sys.stderr, flush=True)
-                            continue
-
-                    venue_data = {
-                        'id': place_id,
-                        'name': place_details.get('name', restaurant_name),
-                        'address': venue_address,
-                        'imageUrl': photo_url or 'https://images.unsplash.com/photo-1517248135467-4c7edcad34c4',
-                        'googleRating': place_details.get('rating', 4.5),
-                        'priceRange': price_map.get(price_level, '$$'),
-                        'website': place_details.get('website'),
-                        'phone': place_details.get('formatted_phone_number'),
-                        'googleMapsUrl': f"https://www.google.com/maps/place/?q=place_id:{place_id}",
-                        'gaultMillauToques': restaurant.get('toques', 2),
-                        'gaultMillauAward': restaurant.get('award'),
-                        'instagramUrl': f"https://instagram.com/{restaurant.get('instagram')}" if restaurant.get('instagram') else None,
-                        'vibeTags': ['#GaultMillau', f"#{restaurant.get('toques', 2)}Toque"],
-                        'matchScore': 95,
-                    }
-
-                    venues_data.append(venue_data)
-
-                    # Veritabanına kaydet (arka plan sync için)
-                    try:
-                        GaultMillauVenue.objects.update_or_create(
-                            name=restaurant_name,
-                            defaults={
-                                'place_id': place_id,
-                                'toques': restaurant.get('toques', 2),
-                                'award': restaurant.get('award'),
-                                'chef': restaurant.get('chef'),
-                                'categories': restaurant.get('categories', []),
-                                'city': city,
-                                'venue_data': venue_data,
-                                'instagram': restaurant.get('instagram'),
-                                'is_synced': True,
-                                'is_active': True
-                            }
-                        )
-                        print(f"✅ G&M SYNC - {restaurant_name} veritabanına kaydedildi", file=sys.stderr, flush=True)
-                    except Exception as db_err:
-                        print(f"⚠️ G&M DB kayıt hatası ({restaurant_name}): {db_err}", file=sys.stderr, flush=True)
-
-            except Exception as place_err:
-                print(f"⚠️ G&M Places hatası ({restaurant_name}): {place_err}", file=sys.stderr, flush=True)
-                continue
-
-        if venues_data:
-            print(f"🏆 G&M STATİK->API - {len(venues_data)} restoran bulundu ve sync edildi", file=sys.stderr, flush=True)
-
-        return venues_data
-
-    except Exception as e:
-        print(f"⚠️ G&M statik liste hatası: {e}", file=sys.stderr, flush=True)
-        return []
-
-
-def enrich_gm_venues_with_gemini(gm_venues: list, category_name: str) -> list:
-    """
-    G&M mekanlarını Gemini ile zenginleştirir.
-    practicalInfo, atmosphereSummary, description ve vibeTags ekler.
-    """
-    import sys
-    import json
-    import re
-
-    if not gm_venues:
-        return []
-
     try:
-        model = get_genai_model()
-        if not model:
-            print(f"⚠️ Gemini model bulunamadı, G&M mekanları zenginleştirilmeden döndürülüyor", file=sys.stderr, flush=True)
-            return gm_venues
-
-        # G&M mekanlarını Gemini'ye gönderilecek formata çevir
-        places_list_items = []
-        for i, v in enumerate(gm_venues[:10]):
-            gm_info = ""
-            if v.get('gaultMillauToques'):
-                gm_info = f" | G&M: {v['gaultMillauToques']} Toque"
-            if v.get('gaultMillauAward'):
-                gm_info += f" ({v['gaultMillauAward']})"
-
-            places_list_items.append(
-                f"{i+1}. {v['name']} | Rating: {v.get('googleRating', 'N/A')} | Fiyat: {v.get('priceRange', '$$')}{gm_info}"
-            )
-        places_list = "\n".join(places_list_items)
-
-        batch_prompt = f"""Kategori: {category_name}
-Bu mekanlar Gault & Millau ödüllü prestijli restoranlardır.
-
-Mekanlar:
-{places_list}
-
-Her mekan için analiz yap ve JSON döndür:
-{{
-  "name": "Mekan Adı",
-  "description": "2-3 cümle Türkçe - mekanın öne çıkan özelliği ve neden G&M ödülü aldığı",
-  "vibeTags": ["#GaultMillau", "#Tag2", "#Tag3"],
-  "practicalInfo": {{
-    "reservationNeeded": "Şart" | "Tavsiye Edilir" | null,
-    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
-    "parking": "Kolay" | "Zor" | "Otopark var" | null,
-    "hasValet": true | false | null,
-    "outdoorSeating": true | false | null,
-    "alcoholServed": true | false | null,
-    "priceFeeling": "Fiyatına Değer" | "Premium" | null,
-    "mustTry": "Şefin imza yemeği veya öne çıkan lezzet" | null,
-    "headsUp": "Bilmeniz gereken önemli bilgi" | null
-  }},
-  "atmosphereSummary": {{
-    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı",
-    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
-    "privacy": "Özel" | "Yarı Özel" | "Açık Alan",
-    "energy": "Sakin" | "Dengeli" | "Enerjik",
-    "idealFor": ["özel gün", "iş yemeği", "romantik akşam"],
-    "notIdealFor": ["hızlı yemek"],
-    "oneLiner": "Tek cümle Türkçe atmosfer özeti"
-  }}
-}}
-
-Kurallar:
-- G&M ödüllü mekanlar genellikle fine dining, yüksek kalite ve özel deneyim sunar
-- vibeTags'ta mutlaka #GaultMillau olsun, toque sayısına göre #2Toque, #3Toque ekle
-- Türkiye'nin en prestijli restoranları - buna göre değerlendir
-- reservationNeeded genellikle "Şart" veya "Tavsiye Edilir" olmalı
-
-SADECE JSON ARRAY döndür, başka açıklama yazma."""
-
-        print(f"🏆 G&M Gemini zenginleştirme başlıyor ({len(gm_venues)} mekan)...", file=sys.stderr, flush=True)
-
-        response = model.generate_content(batch_prompt)
-        response_text = response.text.strip()
-
-        # Markdown code block temizle
-        response_text = re.sub(r'```json\s*|\s*```', '', response_text)
-        response_text = response_text.strip()
-
-        try:
-            ai_results = json.loads(response_text)
-        except json.JSONDecodeError:
-            # Array bulmaya çalış
-            match = re.search(r'\[.*\]', response_text, re.DOTALL)
-            if match:
-                ai_results = json.loads(match.group())
-            else:
-                print(f"⚠️ G&M Gemini JSON parse edilemedi", file=sys.stderr, flush=True)
-                return gm_venues
-
-        # AI sonuçlarını mekanlarla eşleştir
-        ai_by_name = {r.get('name', '').lower(): r for r in ai_results}
-
-        enriched_venues = []
-        for venue in gm_venues:
-            ai_data = ai_by_name.get(venue['name'].lower(), {})
-
-            # Zenginleştirilmiş veriyi ekle
-            enriched = venue.copy()
-
-            if ai_data.get('description'):
-                enriched['description'] = ai_data['description']
-
-            if ai_data.get('vibeTags'):
-                # Mevcut #GaultMillau tag'ini koru, yenilerini ekle
-                existing_tags = set(enriched.get('vibeTags', []))
-                new_tags = set(ai_data['vibeTags'])
-                enriched['vibeTags'] = list(existing_tags | new_tags)
-
-            if ai_data.get('practicalInfo'):
-                enriched['practicalInfo'] = ai_data['practicalInfo']
-
-            if ai_data.get('atmosphereSummary'):
-                enriched['atmosphereSummary'] = ai_data['atmosphereSummary']
-
-            enriched_venues.append(enriched)
-
-        print(f"✅ G&M Gemini ile {len(enriched_venues)} mekan zenginleştirildi", file=sys.stderr, flush=True)
-        return enriched_venues
+        experiences = build_itinerary(model, location, trip_duration, filters)
+        return Response(experiences, status=status.HTTP_200_OK)
 
     except Exception as e:
-        print(f"⚠️ G&M Gemini zenginleştirme hatası: {e}", file=sys.stderr, flush=True)
-        return gm_venues
-
-
-# ===== CACHE HELPER FONKSİYONLARI (SWR - Stale-While-Revalidate) =====
-CACHE_VENUES_LIMIT = 50  # Cache'ten alınacak venue sayısı (normal istek için)
-CACHE_VENUES_LIMIT_LOAD_MORE = 50  # Load More için daha fazla venue çek
-
-
-def get_cached_venues_for_hybrid(category_name: str, city: str, district: str = None, neighborhood: str = None, exclude_ids: set = None, limit: int = 5, refresh_callback=None):
-    """
-    Hybrid sistem için cache'ten venue'ları çeker (SWR stratejisi ile).
-
-    Freshness Rules:
-    - 0-24 saat: FRESH (direkt cache'ten dön)
-    - 24-96 saat: STALE (cache'ten dön, arka planda refresh başlat)
-    - 96+ saat: EXPIRED (API'ye git, yeni cache oluştur)
-
-    Returns: (venues_list, all_cached_place_ids)
-    """
-    venues_data, all_cached_ids, freshness = get_cached_venues_for_hybrid_swr(
-        category_name=category_name,
-        city=city,
-        district=district,
-        neighborhood=neighborhood,
-        exclude_ids=exclude_ids,
-        limit=limit,
-        refresh_callback=refresh_callback
-    )
-
-    # Backward compatibility - return tuple without freshness
-    return venues_data, all_cached_ids
-
-
-def enrich_cached_venues_with_instagram(venues: list, city: str, district: str = None, neighborhood: str = None) -> list:
-    """
-    Cache'den dönen venue'lara Instagram URL discovery uygula.
-    Sadece instagramUrl'si boş olan venue'lar için Google CSE ile arama yapar.
-
-    Args:
-        venues: Venue listesi
-        city: Şehir adı
-        district: İlçe/semt adı (opsiyonel) - örn: "Konak"
-        neighborhood: Mahalle adı (opsiyonel) - örn: "Alsancak"
-    """
-    if not venues:
-        return venues
-
-    enriched_count = 0
-    for venue in venues:
-        # Instagram URL'si zaten varsa atla
-        existing_instagram = venue.get('instagramUrl', '')
-        if existing_instagram and 'instagram.com/' in existing_instagram:
-            continue
-
-        # Instagram URL'si yok, discovery yap
-        instagram_url = discover_instagram_url(
-            venue_name=venue.get('name', ''),
-            city=city,
-            website=venue.get('website'),
-            existing_instagram=existing_instagram if existing_instagram else None,
-            district=district,
-            neighborhood=neighborhood
+        logger.error("❌ Vacation experience generation error: %s", e)
+        import traceback
+        logger.error("%s", traceback.format_exc())
+        return Response(
+            {'error': f'Tatil deneyimi oluşturulurken hata: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-        if instagram_url:
-            venue['instagramUrl'] = instagram_url
-            enriched_count += 1
-            print(f"🔗 INSTAGRAM ENRICH - {venue.get('name')}: {instagram_url}", file=sys.stderr, flush=True)
-
-    if enriched_count > 0:
-        print(f"✨ INSTAGRAM ENRICH - {enriched_count}/{len(venues)} venue zenginleştirildi", file=sys.stderr, flush=True)
 
-    return venues
-
-
-def save_venues_to_cache(venues: list, category_name: str, city: str, district: str = None, neighborhood: str = None):
-    """
-    Venue'ları cache'e kaydeder (SWR metadata ile).
-    """
-    save_venues_to_cache_swr(
-        venues=venues,
-        category_name=category_name,
-        city=city,
-        district=district,
-        neighborhood=neighborhood
-    )
-
-def search_google_places(query, max_results=1):
+@api_view(['POST'])
+@permission_classes([permissions.AllowAny])
+def stream_vacation_itinerary(request):
     """
-    Google Places API ile mekan araması yapar.
-    Website, telefon, çalışma saatleri ve yorumları döndürür.
+    Tatil rotasını gün aralıkları hazır oldukça NDJSON olarak stream et.
+    Her satır: {"days": [1, 2], "activities": [...]}; son satır {"done": true, "total": N}
+    ya da {"error": "..."}. 1. gün, son gün hazır olmadan gönderilir.
+    WSGI yolu; ASGI'de async_views.stream_vacation_itinerary servis edilir.
     """
-    import requests
-
-    gmaps = get_gmaps_client()
-    if not gmaps:
-        return []
-
-    try:
-        # Text Search ile mekan bul
-        places_result = gmaps.places(query=query)
-
-        if not places_result.get('results'):
-            return []
-
-        results = []
-        for place in places_result['results'][:max_results]:
-            place_id = place.get('place_id')
-
-            # Place Details ile detaylı bilgi al
-            if place_id:
-                details = gmaps.place(
-                    place_id=place_id,
-                    fields=[
-                        'name', 'formatted_address', 'formatted_phone_number',
-                        'website', 'opening_hours', 'rating', 'user_ratings_total',
-                        'reviews', 'photo', 'geometry'
-                    ]
-                )
-
-                detail_result = details.get('result', {})
-
-                # Fotoğraf URL'i oluştur
-                image_url = None
-                photos = detail_result.get('photos') or detail_result.get('photo')
-                if photos:
-                    photo_list = photos if isinstance(photos, list) else [photos]
-                    if photo_list and photo_list[0].get('photo_reference'):
-                        photo_ref = photo_list[0].get('photo_reference')
-                        image_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
-
-                # Çalışma saatlerini işle
-                hours = ''
-                weekly_hours = []
-                is_open_now = None
-                opening_hours = detail_result.get('opening_hours', {})
-                if opening_hours:
-                    weekly_hours = opening_hours.get('weekday_text', [])
-                    is_open_now = opening_hours.get('open_now', None)
-                    if weekly_hours:
-                        # Bugünün çalışma saatini bul
-                        from datetime import datetime
-                        today_idx = datetime.now().weekday()
-                        if today_idx < len(weekly_hours):
-                            hours = weekly_hours[today_idx]
-
-                # Google Reviews'ları işle
-                google_reviews = []
-                if detail_result.get('reviews'):
-                    for review in detail_result['reviews'][:5]:
-                        google_reviews.append({
-                            'authorName': review.get('author_name', ''),
-                            'rating': review.get('rating', 5),
-                            'text': review.get('text', ''),
-                            'relativeTime': review.get('relative_time_description', ''),
-                            'profilePhotoUrl': review.get('profile_photo_url', '')
-                        })
-
-                results.append({
-                    'name': detail_result.get('name', place.get('name')),
-                    'address': detail_result.get('formatted_address', place.get('formatted_address', '')),
-                    'formatted_phone_number': detail_result.get('formatted_phone_number', ''),
-                    'website': detail_result.get('website', ''),
-                    'hours': hours,
-                    'weeklyHours': weekly_hours,
-                    'isOpenNow': is_open_now,
-                    'rating': detail_result.get('rating', place.get('rating')),
-                    'user_ratings_total': detail_result.get('user_ratings_total', place.get('user_ratings_total', 0)),
-                    'reviews': google_reviews,
-                    'imageUrl': image_url,
-                    'geometry': detail_result.get('geometry', place.get('geometry'))
-                })
-
-        return results
-
-    except Exception as e:
-        import sys
-        print(f"⚠️ Google Places API error: {e}", file=sys.stderr, flush=True)
-        return []
-
-def get_genai_model():
-    if settings.GEMINI_API_KEY:
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        # Gemini 2.0 Flash - Render free tier için optimize
-        return genai.GenerativeModel('gemini-2.0-flash')
-    return None
-
-def generate_vacation_experiences(location, trip_duration, filters):
-    """Tatil kategorisi için deneyim odaklı öneri sistemi"""
-    import json
-    import random
-
-    city = location['city']
-    districts = location.get('districts', [])
-    location_query = f"{districts[0]}, {city}" if districts else city
-    duration = trip_duration if trip_duration else 3  # Varsayılan 3 gün
+    serializer = VenueGenerateSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    # Gemini AI ile deneyim bazlı tatil planı oluştur
+    data = serializer.validated_data
     model = get_genai_model()
     if not model:
         return Response(
@@ -1064,75 +203,26 @@ def generate_vacation_experiences(location, trip_duration, filters):
             status=status.HTTP_503_SERVICE_UNAVAILABLE
         )
 
-    try:
-        # Kısa ve öz tatil prompt'u
-        experience_prompt = f"""
-Sen "{location_query}" için {duration} günlük tatil rotası hazırlayan bir seyahat uzmanısın.
-
-Her gün için 6 aktivite öner: kahvaltı, sabah gezisi, öğle yemeği, öğleden sonra aktivitesi, akşam yemeği, gece aktivitesi.
-
-JSON ARRAY formatında döndür. Her aktivite şu alanlara sahip olmalı:
-- id: "day1_1", "day1_2" formatında
-- name: Aktivite adı (örn: "Pantheon'u ziyaret et")
-- description: 1-2 cümle açıklama
-- imageUrl: Unsplash URL (https://images.unsplash.com/photo-...)
-- category: "Tatil"
-- vibeTags: 3 hashtag array
-- address: Tam adres
-- priceRange: "$", "$$" veya "$$$"
-- googleRating: 4.0-5.0 arası
-- noiseLevel: 30-70 arası
-- matchScore: 75-95 arası
-- itineraryDay: Gün numarası (1, 2, 3...)
-- timeSlot: "08:30-09:30" formatında
-- duration: "1 saat" formatında
-- isSpecificVenue: true/false
-- venueName: Mekan ismi (isSpecificVenue=true ise)
-- activityType: breakfast/lunch/dinner/sightseeing/shopping/activity
-- metrics: {{"ambiance": 80, "accessibility": 85, "popularity": 90}}
-
-Toplam {duration * 6} aktivite döndür. SADECE JSON ARRAY, başka açıklama yok.
-"""
-
-        response = model.generate_content(experience_prompt)
-        response_text = response.text.strip()
-
-        # JSON parse et
-        if '```json' in response_text:
-            response_text = response_text.split('```json')[1].split('```')[0].strip()
-        elif '```' in response_text:
-            response_text = response_text.split('```')[1].split('```')[0].strip()
-
-        experiences = json.loads(response_text)
-
-        # Validate ve düzenle
-        for exp in experiences:
-            # ID yoksa ekle
-            if 'id' not in exp:
-                exp['id'] = f"exp_{random.randint(1000, 9999)}"
-            # Category zorla
-            exp['category'] = 'Tatil'
-            # ItineraryDay yoksa hesapla
-            if 'itineraryDay' not in exp:
-                exp['itineraryDay'] = 1
-
-        return Response(experiences, status=status.HTTP_200_OK)
+    def lines():
+        total = 0
+        try:
+            for days, activities in iter_itinerary(model, data['location'], data.get('tripDuration'), data.get('filters', {})):
+                total += len(activities)
+                yield chunk_line(days, activities)
+        except Exception as e:
+            yield error_line(e)
+            return
+        yield done_line(total)
 
-    except Exception as e:
-        import sys
-        print(f"❌ Vacation experience generation error: {e}", file=sys.stderr, flush=True)
-        import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
-        return Response(
-            {'error': f'Tatil deneyimi oluşturulurken hata: {str(e)}'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+    response = StreamingHttpResponse(lines(), content_type='application/x-ndjson; charset=utf-8')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx / Render proxy buffer'lamasın
+    return response
 
 
 def generate_michelin_restaurants(location, filters):
     """Michelin Yıldızlı kategorisi - Statik liste + Google Places API"""
     import json
-    import sys
 
     city = location['city']
     districts = location.get('districts', [])
@@ -1268,7 +358,7 @@ def generate_michelin_restaurants(location, filters):
         if district:
             city_restaurants = [r for r in city_restaurants if r['district'].lower() == district.lower()]
 
-        print(f"🍽️ Michelin restoran listesi: {city} ({len(city_restaurants)} adet)", file=sys.stderr, flush=True)
+        logger.info("🍽️ Michelin restoran listesi: %s (%s adet)", city, len(city_restaurants))
 
         # Google Places API ile zenginleştir
         restaurants = []
@@ -1311,709 +401,43 @@ def generate_michelin_restaurants(location, filters):
                     if place.get('reviews'):
                         restaurant['googleReviews'] = place['reviews'][:5]
             except Exception as e:
-                print(f"⚠️ Google Places error for {r['name']}: {e}", file=sys.stderr, flush=True)
+                logger.warning("⚠️ Google Places error for %s: %s", r['name'], e)
                 restaurant['googleRating'] = 4.5
                 restaurant['googleReviewCount'] = 0
 
             restaurants.append(restaurant)
 
-        print(f"✅ {len(restaurants)} Michelin restoran bulundu", file=sys.stderr, flush=True)
+        logger.info("✅ %s Michelin restoran bulundu", len(restaurants))
 
         return Response(restaurants, status=status.HTTP_200_OK)
 
     except Exception as e:
-        print(f"❌ Michelin restaurant generation error: {e}", file=sys.stderr, flush=True)
+        logger.error("❌ Michelin restaurant generation error: %s", e)
         import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
+        logger.error("%s", traceback.format_exc())
         return Response(
             {'error': f'Michelin restoranları getirilirken hata: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
 
-def generate_fine_dining_with_michelin(location, filters, exclude_ids=None):
-    """Fine Dining kategorisi - önce Michelin restoranları, sonra diğer fine dining mekanlar
-    Gemini ile practicalInfo, atmosphereSummary ve enriched description eklenir.
-    """
+@serve_from_event_store('festival')
+def generate_local_festivals(location, filters):
+    """Yerel Festivaller kategorisi için gerçek festival ve etkinlik listesi - Google Search grounding ile"""
     import json
-    import sys
-    import requests
     import re
+    from datetime import datetime, timedelta
+    from google import genai
+    from google.genai import types
 
-    gmaps = get_gmaps_client()
     city = location['city']
-    districts = location.get('districts', [])
-    neighborhoods = location.get('neighborhoods', [])
-    selected_district = districts[0] if districts else None
-    selected_neighborhood = neighborhoods[0] if neighborhoods else None
-
-    # ===== HYBRID CACHE SİSTEMİ =====
-    exclude_ids_set = set(exclude_ids) if exclude_ids else set()
-    cached_venues, all_cached_ids = get_cached_venues_for_hybrid(
-        category_name='Fine Dining',
-        city=city,
-        district=selected_district,
-        neighborhood=selected_neighborhood,
-        exclude_ids=exclude_ids_set,
-        limit=CACHE_VENUES_LIMIT
-    )
-    # API exclude için cache'teki ID'leri ekle
-    api_exclude_ids = exclude_ids_set | all_cached_ids
-    print(f"🔀 HYBRID - Fine Dining Cache: {len(cached_venues)}, API exclude: {len(api_exclude_ids)}", file=sys.stderr, flush=True)
-
-    # ===== GAULT & MILLAU ENTEGRASYONU =====
-    gm_venues = get_gm_venues_for_category(
-        category_id='2',  # CATEGORY_FINE_DINING
-        category_name='Fine Dining',
-        city=city,
-        exclude_ids=api_exclude_ids,
-        district=selected_district
-    )
-    if gm_venues:
-        print(f"🏆 G&M - Fine Dining kategorisinde {len(gm_venues)} G&M restoran bulundu ({city})", file=sys.stderr, flush=True)
-        gm_place_ids = {v.get('id') for v in gm_venues if v.get('id')}
-        api_exclude_ids = api_exclude_ids | gm_place_ids
-
-    # Birden fazla ilçe için search locations oluştur
-    search_locations = []
-    if districts:
-        for d in districts:
-            search_locations.append(f"{d}, {city}")
-    else:
-        search_locations.append(city)
-
-    print(f"🍽️ Fine Dining + Michelin araması: {search_locations}", file=sys.stderr, flush=True)
+    today = datetime.now()
+    current_date = today.strftime("%d %B %Y")
+    current_date_iso = today.strftime("%Y-%m-%d")
+    current_year = today.year
 
-    # Her lokasyon için koordinatları al (location bias için)
-    location_coords_map = {}
-    for search_loc in search_locations:
-        try:
-            geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
-            geocode_params = {
-                "address": f"{search_loc}, Turkey",
-                "key": settings.GOOGLE_MAPS_API_KEY
-            }
-            geocode_response = requests.get(geocode_url, params=geocode_params)
-            if geocode_response.status_code == 200:
-                geocode_data = geocode_response.json()
-                if geocode_data.get('results'):
-                    coords = geocode_data['results'][0]['geometry']['location']
-                    location_coords_map[search_loc] = (coords['lat'], coords['lng'])
-                    print(f"🗺️ Fine Dining location bias: {search_loc} -> ({coords['lat']}, {coords['lng']})", file=sys.stderr, flush=True)
-        except Exception as e:
-            print(f"⚠️ Geocode hatası ({search_loc}): {e}", file=sys.stderr, flush=True)
-
-    # Michelin Guide Türkiye 2024 - İlgili şehir için
-    MICHELIN_DATABASE = {
-        "İstanbul": [
-            {"name": "Turk Fatih Tutak", "district": "Şişli", "status": "2 Yıldız", "cuisine": "Modern Türk"},
-            {"name": "Neolokal", "district": "Beyoğlu", "status": "1 Yıldız", "cuisine": "Modern Türk"},
-            {"name": "Nicole", "district": "Beyoğlu", "status": "1 Yıldız", "cuisine": "Akdeniz"},
-            {"name": "Mikla", "district": "Beyoğlu", "status": "1 Yıldız", "cuisine": "Modern Türk"},
-            {"name": "Araka", "district": "Beyoğlu", "status": "1 Yıldız", "cuisine": "Modern Türk"},
-            {"name": "Arkestra", "district": "Beşiktaş", "status": "1 Yıldız", "cuisine": "Modern"},
-            {"name": "Sankai by Nagaya", "district": "Beşiktaş", "status": "1 Yıldız", "cuisine": "Japon"},
-            {"name": "Casa Lavanda", "district": "Kadıköy", "status": "1 Yıldız", "cuisine": "İtalyan"},
-            {"name": "Aida - vino e cucina", "district": "Beyoğlu", "status": "Bib Gourmand", "cuisine": "İtalyan"},
-            {"name": "Foxy Nişantaşı", "district": "Şişli", "status": "Bib Gourmand", "cuisine": "Asya Füzyon"},
-            {"name": "The Red Balloon", "district": "Kadıköy", "status": "Bib Gourmand", "cuisine": "Modern"},
-            {"name": "Alaf", "district": "Beşiktaş", "status": "Bib Gourmand", "cuisine": "Anadolu"},
-            {"name": "Yeni Lokanta", "district": "Beyoğlu", "status": "Selected", "cuisine": "Modern Türk"},
-            {"name": "Sunset Grill & Bar", "district": "Beşiktaş", "status": "Selected", "cuisine": "Uluslararası"},
-            {"name": "Ulus 29", "district": "Beşiktaş", "status": "Selected", "cuisine": "Türk"},
-            {"name": "Zuma İstanbul", "district": "Beşiktaş", "status": "Selected", "cuisine": "Japon"},
-        ],
-        "Muğla": [
-            {"name": "Kitchen", "district": "Bodrum", "status": "1 Yıldız", "cuisine": "Modern Türk"},
-            {"name": "İki Sandal", "district": "Bodrum", "status": "1 Yıldız", "cuisine": "Deniz Ürünleri"},
-            {"name": "Otantik Ocakbaşı", "district": "Bodrum", "status": "Bib Gourmand", "cuisine": "Kebap"},
-            {"name": "Zuma Bodrum", "district": "Bodrum", "status": "Selected", "cuisine": "Japon"},
-            {"name": "Maçakızı", "district": "Bodrum", "status": "Selected", "cuisine": "Akdeniz"},
-        ],
-        "İzmir": [
-            {"name": "OD Urla", "district": "Urla", "status": "1 Yıldız", "cuisine": "Modern Türk"},
-            {"name": "Teruar Urla", "district": "Urla", "status": "1 Yıldız", "cuisine": "Modern Türk"},
-            {"name": "Vino Locale", "district": "Urla", "status": "1 Yıldız", "cuisine": "Modern Türk"},
-            {"name": "Hiç Lokanta", "district": "Urla", "status": "Bib Gourmand", "cuisine": "Modern Türk"},
-            {"name": "LA Mahzen", "district": "Urla", "status": "Bib Gourmand", "cuisine": "Şarap Evi"},
-            {"name": "SOTA Alaçatı", "district": "Çeşme", "status": "Selected", "cuisine": "Modern"},
-            {"name": "Ferdi Baba", "district": "Çeşme", "status": "Selected", "cuisine": "Deniz Ürünleri"},
-        ],
-        "Ankara": [
-            {"name": "Trilye", "district": "Çankaya", "status": "Selected", "cuisine": "Deniz Ürünleri"},
-        ],
-        "Antalya": [
-            {"name": "Seraser Fine Dining", "district": "Muratpaşa", "status": "Selected", "cuisine": "Akdeniz"},
-        ],
-    }
-
-    try:
-        # Tüm mekanları toplama listesi (Gemini'ye gönderilecek)
-        all_venues_for_gemini = []
-        added_names = set()
-
-        # 1. ADIM: Şehirdeki Michelin restoranlarını al
-        city_michelin = MICHELIN_DATABASE.get(city, [])
-
-        # İlçe filtresi varsa uygula (birden fazla ilçe destekli)
-        if districts:
-            districts_lower = [d.lower() for d in districts]
-            city_michelin = [r for r in city_michelin if r['district'].lower() in districts_lower]
-
-        # Michelin restoranları ekle (yıldız sayısına göre sırala)
-        def michelin_sort_key(r):
-            if '2 Yıldız' in r['status']:
-                return 0
-            elif '1 Yıldız' in r['status']:
-                return 1
-            elif 'Bib Gourmand' in r['status']:
-                return 2
-            else:
-                return 3
-
-        city_michelin.sort(key=michelin_sort_key)
-
-        for idx, r in enumerate(city_michelin[:8]):  # Max 8 Michelin restoran
-            search_query = f"{r['name']} {r['district']} {city} restaurant"
-
-            # Badge sadece yıldızlı veya Bib Gourmand için gösterilecek (Selected için değil)
-            is_starred_or_bib = 'Yıldız' in r['status'] or 'Bib' in r['status']
-
-            venue_data = {
-                'id': f"michelin_fd_{idx+1}",
-                'name': r['name'],
-                'base_description': f"{r['cuisine']} mutfağı sunan {r['status']} ödüllü restoran.",
-                'imageUrl': 'https://images.unsplash.com/photo-1414235077428-338989a2e8c0?w=800',
-                'category': 'Fine Dining',
-                'vibeTags': ['#MichelinGuide', f"#{r['status'].replace(' ', '')}", f"#{r['cuisine'].replace(' ', '')}"],
-                'address': f"{r['district']}, {city}",
-                'priceRange': '$$$' if r['status'] == 'Selected' else '$$$$',
-                'matchScore': 98 if '2 Yıldız' in r['status'] else 95 if '1 Yıldız' in r['status'] else 92 if 'Bib' in r['status'] else 88,
-                'noiseLevel': 30,
-                'googleMapsUrl': f"https://www.google.com/maps/search/?api=1&query={urllib.parse.quote(search_query)}",
-                'isMichelinStarred': is_starred_or_bib,
-                'google_reviews': [],  # Gemini için
-                'michelin_status': r['status'],
-                'cuisine': r['cuisine']
-            }
-
-            # Google Places API ile detay al
-            try:
-                places_data = search_google_places(search_query, 1)
-                if places_data:
-                    place = places_data[0]
-                    venue_data['googleRating'] = place.get('rating', 4.5)
-                    venue_data['googleReviewCount'] = place.get('user_ratings_total', 0)
-                    venue_data['website'] = place.get('website', '')
-                    venue_data['phoneNumber'] = place.get('formatted_phone_number', '')
-                    venue_data['hours'] = place.get('hours', '')
-                    venue_data['weeklyHours'] = place.get('weeklyHours', [])
-                    venue_data['isOpenNow'] = place.get('isOpenNow', None)
-                    if place.get('imageUrl'):
-                        venue_data['imageUrl'] = place['imageUrl']
-                    if place.get('reviews'):
-                        venue_data['google_reviews'] = place['reviews'][:5]
-                        venue_data['googleReviews'] = place['reviews'][:5]
-            except Exception as e:
-                print(f"⚠️ Google Places error for {r['name']}: {e}", file=sys.stderr, flush=True)
-                venue_data['googleRating'] = 4.5
-                venue_data['googleReviewCount'] = 0
-
-            all_venues_for_gemini.append(venue_data)
-            added_names.add(r['name'].lower())
-
-        print(f"✅ {len(all_venues_for_gemini)} Michelin restoran eklendi", file=sys.stderr, flush=True)
-
-        # 2. ADIM: Google Places'dan ek fine dining restoranlar
-        if len(all_venues_for_gemini) < 50:
-            remaining_slots = 50 - len(all_venues_for_gemini)
-
-            # Nearby Search API - kesin lokasyon filtrelemesi yapar
-            nearby_url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
-
-            # Fine dining için keyword'ler
-            keywords = [
-                "fine dining",
-                "gourmet restaurant",
-                "upscale restaurant",
-                "tasting menu",
-                "rooftop restaurant",
-            ]
-
-            all_places = []
-            for search_loc in search_locations:
-                if search_loc not in location_coords_map:
-                    continue
-
-                lat, lng = location_coords_map[search_loc]
-
-                for keyword in keywords:
-                    if len(all_places) >= remaining_slots + 15:
-                        break
-
-                    params = {
-                        "location": f"{lat},{lng}",
-                        "radius": 2000,  # 2km yarıçap - kesin filtreleme
-                        "type": "restaurant",
-                        "keyword": keyword,
-                        "language": "tr",
-                        "key": settings.GOOGLE_MAPS_API_KEY
-                    }
-
-                    print(f"🔍 Fine dining Nearby Search: {keyword} @ {search_loc} (lat:{lat}, lng:{lng})", file=sys.stderr, flush=True)
-
-                    try:
-                        response = requests.get(nearby_url, params=params)
-                        if response.status_code == 200:
-                            places_data = response.json()
-                            places_list = places_data.get('results', [])
-
-                            # Pagination: 2. ve 3. sayfaları da al
-                            for page_num in range(2, 4):
-                                next_page_token = places_data.get('next_page_token')
-                                if not next_page_token:
-                                    break
-                                time.sleep(2)
-                                next_params = {"pagetoken": next_page_token, "key": settings.GOOGLE_MAPS_API_KEY}
-                                next_response = requests.get(nearby_url, params=next_params)
-                                if next_response.status_code == 200:
-                                    next_data = next_response.json()
-                                    places_list.extend(next_data.get('results', []))
-                                    places_data = next_data
-
-                            for place in places_list:
-                                place_name = place.get('name', '')
-                                place_name_lower = place_name.lower()
-                                # Nearby Search'te vicinity, Text Search'te formatted_address
-                                place_address = place.get('vicinity', '') or place.get('formatted_address', '')
-                                place_rating = place.get('rating', 0)
-                                place_types = place.get('types', [])
-
-                                if place_name_lower in added_names:
-                                    continue
-
-                                # NOT: İlçe kontrolü kaldırıldı - Nearby Search zaten koordinat + radius bazlı
-                                # vicinity alanı ilçe adını içermiyor (sadece mahalle/sokak)
-
-                                if place_rating < 4.2:
-                                    continue
-
-                                excluded_keywords = [
-                                    'pastane', 'pasta atölyesi', 'butik pasta', 'patisserie',
-                                    'bakery', 'fırın', 'börek', 'simit', 'kafeterya'
-                                ]
-                                excluded_types = ['bakery', 'cafe', 'meal_takeaway', 'fast_food_restaurant']
-
-                                is_excluded_name = any(kw in place_name_lower for kw in excluded_keywords)
-                                is_excluded_type = any(t in place_types for t in excluded_types) and 'restaurant' not in place_types
-
-                                if is_excluded_name or is_excluded_type:
-                                    print(f"❌ Fine Dining REJECT - {place_name}: uygun değil", file=sys.stderr, flush=True)
-                                    continue
-
-                                all_places.append(place)
-                                added_names.add(place_name_lower)
-
-                    except Exception as e:
-                        print(f"⚠️ Fine dining sorgu hatası: {e}", file=sys.stderr, flush=True)
-
-            print(f"📊 Toplam {len(all_places)} unique Google Places mekan bulundu", file=sys.stderr, flush=True)
-
-            # Rating'e göre sırala
-            all_places.sort(key=lambda x: x.get('rating', 0), reverse=True)
-
-            for idx, place in enumerate(all_places[:remaining_slots]):
-                place_name = place.get('name', '')
-                place_address = place.get('formatted_address', '')
-                place_rating = place.get('rating', 0)
-
-                photo_url = 'https://images.unsplash.com/photo-1414235077428-338989a2e8c0?w=800'
-                if place.get('photos'):
-                    photo_ref = place['photos'][0].get('photo_reference', '')
-                    if photo_ref:
-                        photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
-
-                michelin_info = is_michelin_restaurant(place_name)
-
-                # Place Details ile yorumları al
-                place_id = place.get('place_id')
-                google_reviews = get_place_reviews(gmaps, place_id) if place_id else []
-                place_review_count = place.get('user_ratings_total', 0)
-
-                # ===== ESKİ YORUM KONTROLÜ =====
-                if place_review_count < 50 and google_reviews:
-                    from datetime import datetime, timedelta
-                    seven_months_ago = datetime.now() - timedelta(days=210)
-                    latest_review_time = None
-                    for review in google_reviews:
-                        review_timestamp = review.get('time')
-                        if review_timestamp:
-                            try:
-                                review_time = datetime.fromtimestamp(review_timestamp)
-                                if latest_review_time is None or review_time > latest_review_time:
-                                    latest_review_time = review_time
-                            except:
-                                pass
-                    if latest_review_time and latest_review_time < seven_months_ago:
-                        print(f"❌ ESKİ YORUM REJECT - {place_name}: son yorum {latest_review_time.strftime('%Y-%m-%d')}", file=sys.stderr, flush=True)
-                        continue
-
-                # ===== KAPANMIŞ MEKAN KONTROLÜ (YORUM İÇERİĞİ) =====
-                if google_reviews:
-                    closed_keywords = ['kapandı', 'kapandi', 'kapanmış', 'kapanmis', 'kapatıldı', 'kapatildi', 'kapatılmış', 'kapatilmis',
-                                      'kalıcı olarak kapan', 'kalici olarak kapan', 'kalıcı olarak kapatıl', 'kalici olarak kapatil',
-                                      'artık kapalı', 'artik kapali', 'permanently closed', 'yerine açıldı', 'yerine acildi', 'burası artık', 'burasi artik']
-                    is_closed = False
-                    for review in google_reviews[:5]:
-                        review_text = review.get('text', '').lower().replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                        for kw in closed_keywords:
-                            if kw.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u') in review_text:
-                                is_closed = True
-                                print(f"❌ KAPANMIŞ MEKAN REJECT - {place_name}: yorumda '{kw}' bulundu", file=sys.stderr, flush=True)
-                                break
-                        if is_closed:
-                            break
-                    if is_closed:
-                        continue
-
-                opening_hours = place.get('opening_hours', {})
-
-                venue_data = {
-                    'id': place_id or f"fd_{idx+1}",
-                    'name': place_name,
-                    'base_description': f"Fine dining deneyimi sunan şık ve kaliteli bir restoran.",
-                    'imageUrl': photo_url,
-                    'category': 'Fine Dining',
-                    'vibeTags': ['#FineDining', '#Gourmet'],
-                    'address': place_address,
-                    'priceRange': '$$$',
-                    'googleRating': place_rating,
-                    'googleReviewCount': place.get('user_ratings_total', 0),
-                    'matchScore': 85,
-                    'noiseLevel': 35,
-                    'googleMapsUrl': f"https://www.google.com/maps/search/?api=1&query={urllib.parse.quote(place_name + ' ' + city)}",
-                    'isMichelinStarred': michelin_info is not None,
-                    'weeklyHours': opening_hours.get('weekday_text', []),
-                    'isOpenNow': opening_hours.get('open_now', None),
-                    'website': '',  # Legacy API textsearch'ta website gelmez
-                    'phoneNumber': '',  # Legacy API textsearch'ta telefon gelmez
-                    'google_reviews': google_reviews,
-                    'googleReviews': google_reviews
-                }
-
-                all_venues_for_gemini.append(venue_data)
-
-        print(f"✅ Gemini'ye gönderilecek toplam {len(all_venues_for_gemini)} mekan", file=sys.stderr, flush=True)
-
-        # 3. ADIM: Gemini ile practicalInfo ve atmosphereSummary ekle
-        venues = []
-        if all_venues_for_gemini:
-            # Pratik bilgi içeren yorumları öncelikli seç
-            practical_keywords = ['otopark', 'park', 'vale', 'valet', 'rezervasyon', 'bekle', 'sıra', 'kuyruk',
-                                  'kalabalık', 'sakin', 'sessiz', 'gürültü', 'çocuk', 'bebek', 'aile',
-                                  'vejetaryen', 'vegan', 'alkol', 'rakı', 'şarap', 'bira', 'servis',
-                                  'hızlı', 'yavaş', 'pahalı', 'ucuz', 'fiyat', 'hesap', 'bahçe', 'teras', 'dış mekan']
-
-            # Gemini için mekan listesi oluştur
-            places_list_items = []
-            for i, v in enumerate(all_venues_for_gemini[:10]):
-                reviews_text = ""
-                if v.get('google_reviews'):
-                    all_reviews = v['google_reviews']
-                    practical_reviews = []
-                    other_reviews = []
-                    for r in all_reviews:
-                        text = r.get('text', '').lower()
-                        if any(kw in text for kw in practical_keywords):
-                            practical_reviews.append(r)
-                        else:
-                            other_reviews.append(r)
-                    selected_reviews = practical_reviews[:3] + other_reviews[:2]
-                    top_reviews = [r.get('text', '')[:350] for r in selected_reviews if r.get('text')]
-                    if top_reviews:
-                        reviews_text = f" | Yorumlar: {' /// '.join(top_reviews)}"
-
-                michelin_note = f" | Michelin: {v.get('michelin_status', '')}" if v.get('michelin_status') else ""
-                places_list_items.append(
-                    f"{i+1}. {v['name']} | Rating: {v.get('googleRating', 'N/A')}{michelin_note}{reviews_text}"
-                )
-            places_list = "\n".join(places_list_items)
-
-            batch_prompt = f"""Kategori: Fine Dining
-Kullanıcı Tercihleri: Fine dining deneyimi, kaliteli restoran
-
-Mekanlar ve Yorumları:
-{places_list}
-
-Her mekan için analiz yap ve JSON döndür:
-{{
-  "name": "Mekan Adı",
-  "description": "2 cümle Türkçe - mekanın öne çıkan özelliği, fine dining atmosferi",
-  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
-  "practicalInfo": {{
-    "reservationNeeded": "Tavsiye Edilir" | "Şart" | "Gerekli Değil" | null,
-    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
-    "waitTime": "Bekleme yok" | "10-15 dk" | "20-30 dk" | null,
-    "parking": "Kolay" | "Zor" | "Otopark var" | "Yok" | null,
-    "hasValet": true | false | null,
-    "outdoorSeating": true | false | null,
-    "kidFriendly": true | false | null,
-    "vegetarianOptions": true | false | null,
-    "alcoholServed": true | false | null,
-    "hasDelivery": true | false | null,
-    "hasTakeout": true | false | null,
-    "servesBreakfast": true | false | null,
-    "servesBrunch": true | false | null,
-    "serviceSpeed": "Hızlı" | "Normal" | "Yavaş" | null,
-    "priceFeeling": "Fiyatına Değer" | "Biraz Pahalı" | "Uygun" | null,
-    "mustTry": "Yorumlarda öne çıkan yemek/içecek" | null,
-    "headsUp": "Bilmeniz gereken önemli uyarı" | null
-  }},
-  "atmosphereSummary": {{
-    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı" | "Gürültülü",
-    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
-    "privacy": "Özel" | "Yarı Özel" | "Açık Alan",
-    "energy": "Sakin" | "Dengeli" | "Enerjik",
-    "idealFor": ["romantik akşam", "iş yemeği", "özel gün"],
-    "notIdealFor": ["aile yemeği"],
-    "oneLiner": "Tek cümle Türkçe atmosfer özeti"
-  }}
-}}
-
-practicalInfo Kuralları (YORUMLARDAN ÇIKAR):
-- reservationNeeded: Fine dining genelde "Şart" veya "Tavsiye Edilir"
-- crowdLevel: "Sakin", "sessiz", "rahat" → "Sakin". "Kalabalık", "gürültülü" → "Kalabalık"
-- parking: "Otopark", "park yeri" → "Otopark var". "Park zor", "park yok" → "Zor". "Park kolay" → "Kolay"
-- hasValet: "Vale", "valet" → true. Yoksa null
-- outdoorSeating: "Bahçe", "dış mekan", "teras" → true
-- kidFriendly: Fine dining genelde false, özellikle belirtilmemişse null
-- alcoholServed: Fine dining genelde true (şarap listesi vb.)
-- mustTry: Yorumlarda en çok övülen yemek/tasting menu
-- headsUp: Önemli uyarılar (dress code, nakit kabul etmeme vb.)
-
-atmosphereSummary Kuralları:
-- noiseLevel: Fine dining genelde "Sessiz" veya "Sohbet Dostu"
-- lighting: Fine dining genelde "Loş" veya "Yumuşak"
-- privacy: Fine dining genelde "Özel" veya "Yarı Özel"
-- energy: Fine dining genelde "Sakin" veya "Dengeli"
-- idealFor: Max 3 - "romantik akşam", "iş yemeği", "özel gün", "kutlama", "ilk buluşma"
-- notIdealFor: Max 2 - "aile yemeği", "hızlı yemek", "çocuklu gelmek"
-- oneLiner: Tek cümle atmosfer özeti
-
-SADECE JSON ARRAY döndür, başka açıklama yazma."""
-
-            try:
-                model = get_genai_model()
-                if model:
-                    response = model.generate_content(batch_prompt)
-                    response_text = response.text.strip()
-
-                    # Güvenli JSON parse
-                    response_text = re.sub(r'```json\s*|\s*```', '', response_text)
-                    response_text = response_text.strip()
-
-                    try:
-                        ai_results = json.loads(response_text)
-                    except json.JSONDecodeError:
-                        match = re.search(r'\[.*\]', response_text, re.DOTALL)
-                        if match:
-                            ai_results = json.loads(match.group())
-                        else:
-                            print(f"⚠️ Fine Dining JSON parse edilemedi, fallback kullanılıyor", file=sys.stderr, flush=True)
-                            ai_results = []
-
-                    # AI sonuçlarını mekanlarla eşleştir
-                    ai_by_name = {r.get('name', '').lower(): r for r in ai_results}
-
-                    for venue_data in all_venues_for_gemini[:10]:
-                        ai_data = ai_by_name.get(venue_data['name'].lower(), {})
-
-                        venue = {
-                            'id': venue_data['id'],
-                            'name': venue_data['name'],
-                            'description': ai_data.get('description', venue_data['base_description']),
-                            'imageUrl': venue_data['imageUrl'],
-                            'category': 'Fine Dining',
-                            'vibeTags': ai_data.get('vibeTags', venue_data.get('vibeTags', ['#FineDining', '#Gourmet'])),
-                            'address': venue_data['address'],
-                            'priceRange': venue_data['priceRange'],
-                            'googleRating': venue_data.get('googleRating', 4.5),
-                            'googleReviewCount': venue_data.get('googleReviewCount', 0),
-                            'matchScore': venue_data['matchScore'],
-                            'noiseLevel': venue_data['noiseLevel'],
-                            'googleMapsUrl': venue_data['googleMapsUrl'],
-                            'isMichelinStarred': venue_data.get('isMichelinStarred', False),
-                            'googleReviews': venue_data.get('googleReviews', []),
-                            'website': venue_data.get('website', ''),
-                            'phoneNumber': venue_data.get('phoneNumber', ''),
-                            'hours': venue_data.get('hours', ''),
-                            'weeklyHours': venue_data.get('weeklyHours', []),
-                            'isOpenNow': venue_data.get('isOpenNow', None),
-                            'practicalInfo': ai_data.get('practicalInfo', {}),
-                            'atmosphereSummary': ai_data.get('atmosphereSummary', {
-                                'noiseLevel': 'Sessiz',
-                                'lighting': 'Loş',
-                                'privacy': 'Özel',
-                                'energy': 'Sakin',
-                                'idealFor': ['romantik akşam', 'özel gün'],
-                                'notIdealFor': [],
-                                'oneLiner': 'Fine dining deneyimi sunan şık bir mekan.'
-                            })
-                        }
-
-                        venues.append(venue)
-
-                    print(f"✅ Gemini ile {len(venues)} Fine Dining mekan zenginleştirildi", file=sys.stderr, flush=True)
-
-            except Exception as e:
-                print(f"❌ Gemini Fine Dining hatası: {e}", file=sys.stderr, flush=True)
-                # Fallback: Gemini olmadan mekanları ekle
-                for venue_data in all_venues_for_gemini[:10]:
-                    venue = {
-                        'id': venue_data['id'],
-                        'name': venue_data['name'],
-                        'description': venue_data['base_description'],
-                        'imageUrl': venue_data['imageUrl'],
-                        'category': 'Fine Dining',
-                        'vibeTags': venue_data.get('vibeTags', ['#FineDining', '#Gourmet']),
-                        'address': venue_data['address'],
-                        'priceRange': venue_data['priceRange'],
-                        'googleRating': venue_data.get('googleRating', 4.5),
-                        'googleReviewCount': venue_data.get('googleReviewCount', 0),
-                        'matchScore': venue_data['matchScore'],
-                        'noiseLevel': venue_data['noiseLevel'],
-                        'googleMapsUrl': venue_data['googleMapsUrl'],
-                        'isMichelinStarred': venue_data.get('isMichelinStarred', False),
-                        'googleReviews': venue_data.get('googleReviews', []),
-                        'website': venue_data.get('website', ''),
-                        'phoneNumber': venue_data.get('phoneNumber', ''),
-                        'hours': venue_data.get('hours', ''),
-                        'weeklyHours': venue_data.get('weeklyHours', []),
-                        'isOpenNow': venue_data.get('isOpenNow', None),
-                        'practicalInfo': {},
-                        'atmosphereSummary': {
-                            'noiseLevel': 'Sessiz',
-                            'lighting': 'Loş',
-                            'privacy': 'Özel',
-                            'energy': 'Sakin',
-                            'idealFor': ['romantik akşam', 'özel gün'],
-                            'notIdealFor': [],
-                            'oneLiner': 'Fine dining deneyimi sunan şık bir mekan.'
-                        }
-                    }
-                    venues.append(venue)
-
-        print(f"✅ API'den {len(venues)} fine dining restoran geldi", file=sys.stderr, flush=True)
-
-        # ===== CACHE'E KAYDET =====
-        if venues:
-            save_venues_to_cache(
-                venues=venues,
-                category_name='Fine Dining',
-                city=city,
-                district=selected_district
-            )
-
-        # ===== HYBRID: MICHELIN + GM + CACHE + API VENUE'LARINI BİRLEŞTİR =====
-        # Öncelik sırası: 1. Michelin, 2. G&M (Michelin olmayanlar), 3. Diğerleri
-        combined_venues = []
-        existing_ids = set()
-
-        # Tüm venue'ları tek listede topla
-        all_venues = []
-        added_venue_names = set()  # İsim bazlı duplicate kontrolü için
-
-        # G&M restoranları
-        enriched_gm = []
-        if gm_venues:
-            enriched_gm = enrich_gm_venues_with_gemini(gm_venues, 'Fine Dining')
-            for gv in enriched_gm:
-                gv['_source'] = 'gm'
-                # Michelin kontrolü - hem G&M hem Michelin ise Michelin öncelikli
-                michelin_check = is_michelin_restaurant(gv.get('name', ''))
-                if michelin_check:
-                    gv['isMichelinStarred'] = True
-                    gv['michelinStars'] = michelin_check.get('stars', 0)
-                    gv['isBibGourmand'] = michelin_check.get('isBib', False)
-                all_venues.append(gv)
-                added_venue_names.add(gv.get('name', '').lower().strip())
-
-        # Cache'deki mekanlar - isim ve ID bazlı duplicate kontrolü
-        for cv in cached_venues:
-            cv_name = cv.get('name', '').lower().strip()
-            if cv.get('id') not in {v.get('id') for v in all_venues} and cv_name not in added_venue_names:
-                cv['_source'] = 'cache'
-                all_venues.append(cv)
-                added_venue_names.add(cv_name)
-
-        # API'den gelen mekanlar - isim ve ID bazlı duplicate kontrolü
-        for av in venues:
-            av_name = av.get('name', '').lower().strip()
-            if av.get('id') not in {v.get('id') for v in all_venues} and av_name not in added_venue_names:
-                av['_source'] = 'api'
-                all_venues.append(av)
-                added_venue_names.add(av_name)
-
-        # Sıralama: Michelin > G&M > Diğerleri
-        def fine_dining_sort_key(venue):
-            is_michelin = venue.get('isMichelinStarred', False)
-            michelin_stars = venue.get('michelinStars', 0)
-            is_bib = venue.get('isBibGourmand', False)
-            has_gm = venue.get('gaultMillauToques') is not None
-            gm_toques = venue.get('gaultMillauToques', 0) or 0
-            rating = venue.get('googleRating', 0) or 0
-
-            # Öncelik: Michelin yıldız (çoktan aza) > Bib Gourmand > G&M (toque'a göre) > Diğer (rating'e göre)
-            if is_michelin and michelin_stars > 0:
-                return (0, -michelin_stars, -rating)
-            elif is_bib:
-                return (1, 0, -rating)
-            elif has_gm:
-                return (2, -gm_toques, -rating)
-            else:
-                return (3, 0, -rating)
-
-        all_venues.sort(key=fine_dining_sort_key)
-
-        # İlk 50'yi al
-        for venue in all_venues[:50]:
-            venue.pop('_source', None)  # Geçici alanı temizle
-            combined_venues.append(venue)
-            existing_ids.add(venue.get('id'))
-
-        michelin_count = sum(1 for v in combined_venues if v.get('isMichelinStarred'))
-        gm_count = sum(1 for v in combined_venues if v.get('gaultMillauToques') and not v.get('isMichelinStarred'))
-        print(f"🔀 HYBRID Fine Dining - Michelin: {michelin_count}, G&M: {gm_count}, Cache: {len(cached_venues)}, API: {len(venues)}, Combined: {len(combined_venues)}", file=sys.stderr, flush=True)
-
-        return Response(combined_venues, status=status.HTTP_200_OK)
-
-    except Exception as e:
-        print(f"❌ Fine Dining generation error: {e}", file=sys.stderr, flush=True)
-        import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
-        return Response(
-            {'error': f'Fine Dining restoranları getirilirken hata: {str(e)}'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-
-
-def generate_local_festivals(location, filters):
-    """Yerel Festivaller kategorisi için gerçek festival ve etkinlik listesi - Google Search grounding ile"""
-    import json
-    import sys
-    import re
-    from datetime import datetime, timedelta
-    from google import genai
-    from google.genai import types
-
-    city = location['city']
-    today = datetime.now()
-    current_date = today.strftime("%d %B %Y")
-    current_date_iso = today.strftime("%Y-%m-%d")
-    current_year = today.year
-
-    # dateRange filtresine göre tarih aralığını belirle
-    date_range = filters.get('dateRange', 'Any')
+    # dateRange filtresine göre tarih aralığını belirle
+    date_range = filters.get('dateRange', 'Any')
 
     if date_range == 'Today':
         end_date = today
@@ -2045,8 +469,8 @@ def generate_local_festivals(location, filters):
     try:
         client = genai.Client(api_key=settings.GEMINI_API_KEY)
 
-        print(f"🎪 Yerel Festivaller (Google Search): {city} - {search_date} ({date_range})", file=sys.stderr, flush=True)
-        print(f"📅 Tarih aralığı: {current_date_iso} -> {end_date_iso}", file=sys.stderr, flush=True)
+        logger.info("🎪 Yerel Festivaller (Google Search): %s - %s (%s)", city, search_date, date_range)
+        logger.info("📅 Tarih aralığı: %s -> %s", current_date_iso, end_date_iso)
 
         festival_prompt = f"""
 {city} şehrinde {search_date} düzenlenecek festival ve etkinlikleri internetten ara ve listele.
@@ -2081,20 +505,21 @@ JSON ARRAY formatında döndür. Her festival için:
 
 SADECE JSON ARRAY döndür."""
 
-        response = client.models.generate_content(
-            model='gemini-2.0-flash',
-            contents=festival_prompt,
-            config=types.GenerateContentConfig(
-                tools=[
-                    types.Tool(
-                        google_search=types.GoogleSearch()
-                    )
-                ]
+        with span('gemini.search'):
+            response = client.models.generate_content(
+                model='gemini-2.0-flash',
+                contents=festival_prompt,
+                config=types.GenerateContentConfig(
+                    tools=[
+                        types.Tool(
+                            google_search=types.GoogleSearch()
+                        )
+                    ]
+                )
             )
-        )
 
         response_text = response.text.strip()
-        print(f"📝 Response length: {len(response_text)}", file=sys.stderr, flush=True)
+        logger.info("📝 Response length: %s", len(response_text))
 
         # JSON parse et
         if '```json' in response_text:
@@ -2169,7 +594,7 @@ SADECE JSON ARRAY döndür."""
             festival_name_lower = festival.get('name', '').lower()
             is_excluded = any(keyword in festival_name_lower for keyword in excluded_keywords)
             if is_excluded:
-                print(f"⏭️ Kurumsal etkinlik elendi: {festival.get('name')}", file=sys.stderr, flush=True)
+                logger.debug("⏭️ Kurumsal etkinlik elendi: %s", festival.get('name'))
                 continue
 
             # startDate varsa kullan, yoksa eventDate'den çıkar
@@ -2192,12 +617,12 @@ SADECE JSON ARRAY döndür."""
 
             # Filtreleme: Bitmiş festivalleri çıkar
             if end_date_fest and end_date_fest.date() < today.date():
-                print(f"⏭️ Bitmiş festival atlandı: {festival.get('name')} (bitiş: {end_date_fest})", file=sys.stderr, flush=True)
+                logger.debug("⏭️ Bitmiş festival atlandı: %s (bitiş: %s)", festival.get('name'), end_date_fest)
                 continue
 
             # Filtreleme: Seçilen tarih aralığı dışındakileri çıkar
             if start_date and start_date.date() > end_date.date():
-                print(f"⏭️ Tarih aralığı dışında: {festival.get('name')} (başlangıç: {start_date})", file=sys.stderr, flush=True)
+                logger.debug("⏭️ Tarih aralığı dışında: %s (başlangıç: %s)", festival.get('name'), start_date)
                 continue
 
             # Sıralama için sort_date ekle
@@ -2213,24 +638,24 @@ SADECE JSON ARRAY döndür."""
             search_query = urllib.parse.quote(f"{festival['name']} {city} {current_year}")
             festival['googleMapsUrl'] = f"https://www.google.com/maps/search/?api=1&query={search_query}"
 
-        print(f"✅ {len(filtered_festivals)} festival bulundu (filtreleme sonrası)", file=sys.stderr, flush=True)
+        logger.info("✅ %s festival bulundu (filtreleme sonrası)", len(filtered_festivals))
 
         return Response(filtered_festivals, status=status.HTTP_200_OK)
 
     except Exception as e:
-        print(f"❌ Festival generation error: {e}", file=sys.stderr, flush=True)
+        logger.error("❌ Festival generation error: %s", e)
         import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
+        logger.error("%s", traceback.format_exc())
         return Response(
             {'error': f'Festivaller getirilirken hata: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
 
+@serve_from_event_store('concert')
 def generate_concerts(location, filters):
     """Konserler kategorisi için canlı müzik etkinlikleri - Google Search grounding ile"""
     import json
-    import sys
     import re
     from datetime import datetime, timedelta
     from google import genai
@@ -2303,8 +728,8 @@ def generate_concerts(location, filters):
     try:
         client = genai.Client(api_key=settings.GEMINI_API_KEY)
 
-        print(f"🎸 Konserler (Google Search): {city} - {search_date} ({date_range}) - {music_genre}", file=sys.stderr, flush=True)
-        print(f"📅 Tarih aralığı: {current_date_iso} -> {end_date_iso}", file=sys.stderr, flush=True)
+        logger.info("🎸 Konserler (Google Search): %s - %s (%s) - %s", city, search_date, date_range, music_genre)
+        logger.info("📅 Tarih aralığı: %s -> %s", current_date_iso, end_date_iso)
 
         concert_prompt = f"""
 {city} şehrinde {search_date} gerçekleşecek {genre_search} etkinliklerini internetten ara ve listele.
@@ -2342,20 +767,21 @@ JSON ARRAY formatında döndür. Her konser için:
 
 SADECE JSON ARRAY döndür."""
 
-        response = client.models.generate_content(
-            model='gemini-2.0-flash',
-            contents=concert_prompt,
-            config=types.GenerateContentConfig(
-                tools=[
-                    types.Tool(
-                        google_search=types.GoogleSearch()
-                    )
-                ]
+        with span('gemini.search'):
+            response = client.models.generate_content(
+                model='gemini-2.0-flash',
+                contents=concert_prompt,
+                config=types.GenerateContentConfig(
+                    tools=[
+                        types.Tool(
+                            google_search=types.GoogleSearch()
+                        )
+                    ]
+                )
             )
-        )
 
         response_text = response.text.strip()
-        print(f"📝 Response length: {len(response_text)}", file=sys.stderr, flush=True)
+        logger.info("📝 Response length: %s", len(response_text))
 
         # JSON parse et
         if '```json' in response_text:
@@ -2412,12 +838,12 @@ SADECE JSON ARRAY döndür."""
 
             # Filtreleme: Bitmiş konserleri çıkar
             if start_date and start_date.date() < today.date():
-                print(f"⏭️ Geçmiş konser atlandı: {concert.get('name')} ({start_date})", file=sys.stderr, flush=True)
+                logger.debug("⏭️ Geçmiş konser atlandı: %s (%s)", concert.get('name'), start_date)
                 continue
 
             # Filtreleme: Seçilen tarih aralığı dışındakileri çıkar
             if start_date and start_date.date() > end_date.date():
-                print(f"⏭️ Tarih aralığı dışında: {concert.get('name')} ({start_date})", file=sys.stderr, flush=True)
+                logger.debug("⏭️ Tarih aralığı dışında: %s (%s)", concert.get('name'), start_date)
                 continue
 
             concert['_sort_date'] = start_date or datetime(2099, 12, 31)
@@ -2433,14 +859,14 @@ SADECE JSON ARRAY döndür."""
             search_query = urllib.parse.quote(f"{venue_name} {city} konser")
             concert['googleMapsUrl'] = f"https://www.google.com/maps/search/?api=1&query={search_query}"
 
-        print(f"✅ {len(filtered_concerts)} konser bulundu (filtreleme sonrası)", file=sys.stderr, flush=True)
+        logger.info("✅ %s konser bulundu (filtreleme sonrası)", len(filtered_concerts))
 
         return Response(filtered_concerts, status=status.HTTP_200_OK)
 
     except Exception as e:
-        print(f"❌ Concert generation error: {e}", file=sys.stderr, flush=True)
+        logger.error("❌ Concert generation error: %s", e)
         import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
+        logger.error("%s", traceback.format_exc())
         return Response(
             {'error': f'Konserler getirilirken hata: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -2450,7 +876,6 @@ SADECE JSON ARRAY döndür."""
 def generate_adrenaline_experiences(location, filters):
     """Adrenalin kategorisi için deneyim bazlı öneri sistemi"""
     import json
-    import sys
 
     city = location['city']
     districts = location.get('districts', [])
@@ -2489,7 +914,7 @@ JSON ARRAY formatında döndür. Her deneyim:
 
 SADECE JSON ARRAY döndür. Minimum 10 deneyim."""
 
-        print(f"🏔️ Adrenalin deneyimleri araması: {location_query}", file=sys.stderr, flush=True)
+        logger.info("🏔️ Adrenalin deneyimleri araması: %s", location_query)
 
         response = model.generate_content(adrenaline_prompt)
         response_text = response.text.strip()
@@ -2507,14 +932,14 @@ SADECE JSON ARRAY döndür. Minimum 10 deneyim."""
             search_query = urllib.parse.quote(f"{exp['name']} {city}")
             exp['googleMapsUrl'] = f"https://www.google.com/maps/search/?api=1&query={search_query}"
 
-        print(f"✅ {len(experiences)} adrenalin deneyimi bulundu", file=sys.stderr, flush=True)
+        logger.info("✅ %s adrenalin deneyimi bulundu", len(experiences))
 
         return Response(experiences, status=status.HTTP_200_OK)
 
     except Exception as e:
-        print(f"❌ Adrenaline experience generation error: {e}", file=sys.stderr, flush=True)
+        logger.error("❌ Adrenaline experience generation error: %s", e)
         import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
+        logger.error("%s", traceback.format_exc())
         return Response(
             {'error': f'Adrenalin deneyimleri getirilirken hata: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -2524,7 +949,6 @@ SADECE JSON ARRAY döndür. Minimum 10 deneyim."""
 def generate_weekend_trip_experiences(location, filters):
     """Hafta Sonu Gezintisi kategorisi için deneyim bazlı öneri sistemi"""
     import json
-    import sys
 
     city = location['city']
     districts = location.get('districts', [])
@@ -2563,7 +987,7 @@ JSON ARRAY formatında döndür. Her deneyim:
 
 SADECE JSON ARRAY döndür. Minimum 10 deneyim."""
 
-        print(f"🌲 Hafta Sonu Gezintisi araması: {location_query}", file=sys.stderr, flush=True)
+        logger.info("🌲 Hafta Sonu Gezintisi araması: %s", location_query)
 
         response = model.generate_content(weekend_prompt)
         response_text = response.text.strip()
@@ -2581,49 +1005,162 @@ SADECE JSON ARRAY döndür. Minimum 10 deneyim."""
             search_query = urllib.parse.quote(f"{exp['name']} {city}")
             exp['googleMapsUrl'] = f"https://www.google.com/maps/search/?api=1&query={search_query}"
 
-        print(f"✅ {len(experiences)} hafta sonu deneyimi bulundu", file=sys.stderr, flush=True)
+        logger.info("✅ %s hafta sonu deneyimi bulundu", len(experiences))
 
         return Response(experiences, status=status.HTTP_200_OK)
 
     except Exception as e:
-        print(f"❌ Weekend trip generation error: {e}", file=sys.stderr, flush=True)
+        logger.error("❌ Weekend trip generation error: %s", e)
         import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
+        logger.error("%s", traceback.format_exc())
         return Response(
             {'error': f'Hafta sonu gezintileri getirilirken hata: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
 
-def generate_picnic_experiences(location, filters):
-    """Piknik kategorisi için Google Places API ile gerçek tabiat parkları, mesire alanları"""
-    import sys
-    import os
+# Piknik: Text Search sorguları ve Place Details çağrıları paralel, sonuç SWR cache'te (uzun pencere)
+PICNIC_CATEGORY = 'Piknik'
+PICNIC_VENUE_LIMIT = 15             # Detaylandırılan / dönen park sayısı
+PICNIC_FETCH_CONCURRENCY = 5        # Aynı anda çalışan Text Search sorgusu
+PICNIC_DETAILS_CONCURRENCY = 8      # Aynı anda çalışan Place Details çağrısı
+PICNIC_HTTP_TIMEOUT_SECONDS = 10
+
+
+def _picnic_text_search(query, location_lat, location_lng, google_api_key):
+    """Tek bir piknik Text Search sorgusu (2. ve 3. sayfalar dahil)."""
     import requests
+
+    search_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+    search_params = {
+        'query': query,
+        'key': google_api_key,
+        'language': 'tr',
+        'type': 'park'  # Park türünde yerler
+    }
+
+    # Location bias ekle (koordinatlar alındıysa)
+    if location_lat and location_lng:
+        search_params["location"] = f"{location_lat},{location_lng}"
+        search_params["radius"] = 10000  # 10km yarıçap (piknik alanları daha geniş alanda olabilir)
+
+    try:
+        response = requests.get(search_url, params=search_params, timeout=PICNIC_HTTP_TIMEOUT_SECONDS)
+        if response.status_code != 200:
+            return []
+        data = response.json()
+        places = data.get('results', [])
+
+        # Pagination: 2. ve 3. sayfaları da al
+        for page_num in range(2, 4):
+            next_page_token = data.get('next_page_token')
+            if not next_page_token:
+                break
+            with span('places.page_wait'):
+                time.sleep(2)
+            next_params = {"pagetoken": next_page_token, "key": google_api_key}
+            next_response = requests.get(search_url, params=next_params, timeout=PICNIC_HTTP_TIMEOUT_SECONDS)
+            if next_response.status_code != 200:
+                break
+            data = next_response.json()
+            places.extend(data.get('results', []))
+        return places
+    except Exception as e:
+        logger.warning("⚠️ Piknik sorgusu hatası (%s): %s", query, e)
+        return []
+
+
+def _build_picnic_venue(place, google_api_key):
+    """Place Details ile piknik alanı venue'su (detay alınamazsa None)."""
     import random
+    import requests
 
-    city = location['city']
-    districts = location.get('districts', [])
-    neighborhoods = location.get('neighborhoods', [])
-    district = districts[0] if districts else None
-    neighborhood = neighborhoods[0] if neighborhoods else None
+    place_id = place.get('place_id')
 
-    # Lokasyon string oluştur
-    if neighborhood:
-        location_query = f"{neighborhood}, {district}, {city}"
-    elif district:
-        location_query = f"{district}, {city}"
-    else:
-        location_query = city
+    # Place Details API ile detaylı bilgi al
+    details_url = "https://maps.googleapis.com/maps/api/place/details/json"
+    details_params = {
+        'place_id': place_id,
+        'key': google_api_key,
+        'language': 'tr',
+        'fields': 'name,formatted_address,rating,user_ratings_total,photos,reviews,opening_hours,website,formatted_phone_number,geometry,types'
+    }
 
-    google_api_key = os.environ.get('GOOGLE_MAPS_API_KEY')
-    if not google_api_key:
-        return Response(
-            {'error': 'Google Maps API key eksik'},
-            status=status.HTTP_503_SERVICE_UNAVAILABLE
-        )
+    try:
+        details_response = requests.get(details_url, params=details_params, timeout=PICNIC_HTTP_TIMEOUT_SECONDS)
+    except Exception as e:
+        logger.warning("⚠️ Piknik detay hatası (%s): %s", place_id, e)
+        return None
+    if details_response.status_code != 200:
+        return None
+
+    details = details_response.json().get('result', {})
+
+    # Fotoğraf URL'leri
+    photos = details.get('photos', [])
+    image_url = ''
+    if photos:
+        photo_ref = photos[0].get('photo_reference')
+        if photo_ref:
+            image_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={google_api_key}"
+
+    # Yorumları al
+    reviews = details.get('reviews', [])
+    google_reviews = []
+    for review in reviews[:5]:
+        google_reviews.append({
+            'authorName': review.get('author_name', ''),
+            'rating': review.get('rating', 0),
+            'text': review.get('text', ''),
+            'relativeTime': review.get('relative_time_description', ''),
+            'profilePhotoUrl': review.get('profile_photo_url', '')
+        })
+
+    # Çalışma saatleri
+    hours = details.get('opening_hours', {})
+    weekly_hours = hours.get('weekday_text', [])
+    is_open_now = hours.get('open_now', None)
+
+    # Google Maps URL
+    lat = details.get('geometry', {}).get('location', {}).get('lat', 0)
+    lng = details.get('geometry', {}).get('location', {}).get('lng', 0)
+    maps_url = f"https://www.google.com/maps/search/?api=1&query={lat},{lng}"
+
+    return {
+        # place_id: cache anahtarı (CachedVenue.place_id) ve excludeIds ile uyumlu
+        'id': place_id,
+        'name': details.get('name', place.get('name', '')),
+        'description': f"Doğa ile iç içe piknik alanı. {details.get('formatted_address', '')}",
+        'imageUrl': image_url,
+        'category': PICNIC_CATEGORY,
+        'vibeTags': ['#Doğa', '#Piknik', '#Açıkhava'],
+        'noiseLevel': random.randint(15, 35),
+        'matchScore': random.randint(80, 95),
+        'address': details.get('formatted_address', place.get('formatted_address', '')),
+        'priceRange': '$',
+        'googleMapsUrl': maps_url,
+        'website': details.get('website', ''),
+        'phoneNumber': details.get('formatted_phone_number', ''),
+        'weeklyHours': weekly_hours,
+        'isOpenNow': is_open_now,
+        'openIntervals': intervals_from_opening_hours(hours),
+        'googleRating': details.get('rating', 0),
+        'googleReviewCount': details.get('user_ratings_total', 0),
+        'googleReviews': google_reviews,
+        'metrics': {
+            'noise': random.randint(10, 30),
+            'light': random.randint(70, 95),
+            'privacy': random.randint(60, 90),
+            'service': random.randint(30, 60),
+            'energy': random.randint(20, 50)
+        }
+    }
 
-    print(f"🌲 Piknik alanı araması (Google Places): {location_query}", file=sys.stderr, flush=True)
+
+def fetch_picnic_venues(location_query, google_api_key):
+    """Geocode → 5 Text Search sorgusu (paralel) → dedupe → Place Details (paralel)."""
+    import requests
+    from concurrent.futures import ThreadPoolExecutor
 
     # Lokasyonun koordinatlarını al (location bias için)
     location_lat, location_lng = None, None
@@ -2633,167 +1170,124 @@ def generate_picnic_experiences(location, filters):
             "address": f"{location_query}, Turkey",
             "key": google_api_key
         }
-        geocode_response = requests.get(geocode_url, params=geocode_params)
+        geocode_response = requests.get(geocode_url, params=geocode_params, timeout=PICNIC_HTTP_TIMEOUT_SECONDS)
         if geocode_response.status_code == 200:
             geocode_data = geocode_response.json()
             if geocode_data.get('results'):
                 location_coords = geocode_data['results'][0]['geometry']['location']
                 location_lat, location_lng = location_coords['lat'], location_coords['lng']
-                print(f"🗺️ Piknik location bias: {location_query} -> ({location_lat}, {location_lng})", file=sys.stderr, flush=True)
+                logger.info("🗺️ Piknik location bias: %s -> (%s, %s)", location_query, location_lat, location_lng)
     except Exception as e:
-        print(f"⚠️ Geocode hatası: {e}", file=sys.stderr, flush=True)
+        logger.warning("⚠️ Geocode hatası: %s", e)
+
+    # Piknik için aranacak yer türleri - birden fazla sorgu yapalım
+    picnic_queries = [
+        f"tabiat parkı {location_query}",
+        f"mesire alanı {location_query}",
+        f"piknik alanı {location_query}",
+        f"orman parkı {location_query}",
+        f"milli park {location_query}",
+    ]
 
-    try:
-        # Piknik için aranacak yer türleri - birden fazla sorgu yapalım
-        picnic_queries = [
-            f"tabiat parkı {location_query}",
-            f"mesire alanı {location_query}",
-            f"piknik alanı {location_query}",
-            f"orman parkı {location_query}",
-            f"milli park {location_query}",
-        ]
+    with ThreadPoolExecutor(max_workers=PICNIC_FETCH_CONCURRENCY) as pool:
+        pages = list(pool.map(bind(lambda q: _picnic_text_search(q, location_lat, location_lng, google_api_key)), picnic_queries))
 
-        all_places = []
-        seen_place_ids = set()
-
-        for query in picnic_queries:
-            # Google Places Text Search API
-            search_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-            search_params = {
-                'query': query,
-                'key': google_api_key,
-                'language': 'tr',
-                'type': 'park'  # Park türünde yerler
-            }
+    # Sorgu sırası korunur (dedupe önceliği aynı kalsın)
+    all_places = []
+    seen_place_ids = set()
+    for places in pages:
+        for place in places:
+            place_id = place.get('place_id')
+            if place_id and place_id not in seen_place_ids:
+                seen_place_ids.add(place_id)
+                all_places.append(place)
 
-            # Location bias ekle (koordinatlar alındıysa)
-            if location_lat and location_lng:
-                search_params["location"] = f"{location_lat},{location_lng}"
-                search_params["radius"] = 10000  # 10km yarıçap (piknik alanları daha geniş alanda olabilir)
+    logger.info("📍 %s piknik alanı bulundu", len(all_places))
 
-            response = requests.get(search_url, params=search_params)
-            if response.status_code == 200:
-                data = response.json()
-                places = data.get('results', [])
+    selected = all_places[:PICNIC_VENUE_LIMIT]
+    with ThreadPoolExecutor(max_workers=min(PICNIC_DETAILS_CONCURRENCY, len(selected)) or 1) as pool:
+        venues = [v for v in pool.map(bind(lambda place: _build_picnic_venue(place, google_api_key)), selected) if v]
 
-                # Pagination: 2. ve 3. sayfaları da al
-                for page_num in range(2, 4):
-                    next_page_token = data.get('next_page_token')
-                    if not next_page_token:
-                        break
-                    time.sleep(2)
-                    next_params = {"pagetoken": next_page_token, "key": google_api_key}
-                    next_response = requests.get(search_url, params=next_params)
-                    if next_response.status_code == 200:
-                        next_data = next_response.json()
-                        places.extend(next_data.get('results', []))
-                        data = next_data
-
-                for place in places:
-                    place_id = place.get('place_id')
-                    if place_id and place_id not in seen_place_ids:
-                        seen_place_ids.add(place_id)
-                        all_places.append(place)
-
-        print(f"📍 {len(all_places)} piknik alanı bulundu", file=sys.stderr, flush=True)
-
-        # Sonuçları işle
-        venues = []
-        for i, place in enumerate(all_places[:15]):  # Max 15 sonuç
-            place_id = place.get('place_id')
+    logger.info("✅ %s piknik alanı detaylandırıldı", len(venues))
+    return venues
 
-            # Place Details API ile detaylı bilgi al
-            details_url = "https://maps.googleapis.com/maps/api/place/details/json"
-            details_params = {
-                'place_id': place_id,
-                'key': google_api_key,
-                'language': 'tr',
-                'fields': 'name,formatted_address,rating,user_ratings_total,photos,reviews,opening_hours,website,formatted_phone_number,geometry,types'
-            }
 
-            details_response = requests.get(details_url, params=details_params)
-            if details_response.status_code != 200:
-                continue
+def generate_picnic_experiences(location, filters, exclude_ids=None):
+    """Piknik kategorisi için Google Places API ile gerçek tabiat parkları, mesire alanları (SWR cache'li)"""
+    import os
 
-            details = details_response.json().get('result', {})
-
-            # Fotoğraf URL'leri
-            photos = details.get('photos', [])
-            image_url = ''
-            if photos:
-                photo_ref = photos[0].get('photo_reference')
-                if photo_ref:
-                    image_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={google_api_key}"
-
-            # Yorumları al
-            reviews = details.get('reviews', [])
-            google_reviews = []
-            for review in reviews[:5]:
-                google_reviews.append({
-                    'authorName': review.get('author_name', ''),
-                    'rating': review.get('rating', 0),
-                    'text': review.get('text', ''),
-                    'relativeTime': review.get('relative_time_description', ''),
-                    'profilePhotoUrl': review.get('profile_photo_url', '')
-                })
-
-            # Çalışma saatleri
-            hours = details.get('opening_hours', {})
-            weekly_hours = hours.get('weekday_text', [])
-            is_open_now = hours.get('open_now', None)
-
-            # Google Maps URL
-            lat = details.get('geometry', {}).get('location', {}).get('lat', 0)
-            lng = details.get('geometry', {}).get('location', {}).get('lng', 0)
-            maps_url = f"https://www.google.com/maps/search/?api=1&query={lat},{lng}"
-
-            venue = {
-                'id': f"picnic_{i+1}",
-                'name': details.get('name', place.get('name', '')),
-                'description': f"Doğa ile iç içe piknik alanı. {details.get('formatted_address', '')}",
-                'imageUrl': image_url,
-                'category': 'Piknik',
-                'vibeTags': ['#Doğa', '#Piknik', '#Açıkhava'],
-                'noiseLevel': random.randint(15, 35),
-                'matchScore': random.randint(80, 95),
-                'address': details.get('formatted_address', place.get('formatted_address', '')),
-                'priceRange': '$',
-                'googleMapsUrl': maps_url,
-                'website': details.get('website', ''),
-                'phoneNumber': details.get('formatted_phone_number', ''),
-                'weeklyHours': weekly_hours,
-                'isOpenNow': is_open_now,
-                'googleRating': details.get('rating', 0),
-                'googleReviewCount': details.get('user_ratings_total', 0),
-                'googleReviews': google_reviews,
-                'metrics': {
-                    'noise': random.randint(10, 30),
-                    'light': random.randint(70, 95),
-                    'privacy': random.randint(60, 90),
-                    'service': random.randint(30, 60),
-                    'energy': random.randint(20, 50)
-                }
-            }
-            venues.append(venue)
+    exclude_ids = set(exclude_ids or ())
+
+    city = location['city']
+    districts = location.get('districts', [])
+    neighborhoods = location.get('neighborhoods', [])
+    district = districts[0] if districts else None
+    neighborhood = neighborhoods[0] if neighborhoods else None
+
+    # Lokasyon string oluştur
+    if neighborhood:
+        location_query = f"{neighborhood}, {district}, {city}"
+    elif district:
+        location_query = f"{district}, {city}"
+    else:
+        location_query = city
+
+    google_api_key = os.environ.get('GOOGLE_MAPS_API_KEY')
+    if not google_api_key:
+        return Response(
+            {'error': 'Google Maps API key eksik'},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    def refresh(category_name, refresh_city, refresh_district):
+        venues = fetch_picnic_venues(location_query, google_api_key)
+        save_venues_to_cache_swr(venues, category_name, refresh_city, refresh_district, neighborhood)
+        return venues
+
+    # Fresh / stale cache → direkt dön (stale ise arka planda yenilenir); Places sadece cache
+    # yoksa ya da süresi dolduysa çağrılır (14 günlük Piknik CachePolicy)
+    cached_venues, _, freshness = get_cached_venues_for_hybrid_swr(
+        category_name=PICNIC_CATEGORY,
+        city=city,
+        district=district,
+        neighborhood=neighborhood,
+        exclude_ids=exclude_ids,
+        limit=PICNIC_VENUE_LIMIT,
+        refresh_callback=refresh,
+        open_now=bool(filters.get('openNow'))
+    )
+    if freshness in ('fresh', 'stale'):
+        if cached_venues:
+            return Response(cached_venues, status=status.HTTP_200_OK)
+        # Havuz dolu ama excludeIds hepsini eledi: Places aynı alanları döndürür, tekrar çekilmez
+        logger.info("🌲 Piknik LOAD MORE - cache'te gösterilmemiş alan kalmadı (%s)", location_query)
+        return Response({'venues': [], 'hasMore': False}, status=status.HTTP_200_OK)
 
-        print(f"✅ {len(venues)} piknik alanı detaylandırıldı", file=sys.stderr, flush=True)
+    logger.info("🌲 Piknik alanı araması (Google Places): %s", location_query)
 
+    try:
+        venues = fetch_picnic_venues(location_query, google_api_key)
+        # Cache'e tüm alanlar yazılır; kullanıcının daha önce gördükleri (excludeIds) sadece cevaptan çıkar
+        save_venues_to_cache(venues, PICNIC_CATEGORY, city, district, neighborhood)
+        venues = [v for v in venues if v['id'] not in exclude_ids]
+        if filters.get('openNow'):
+            venues = filter_open_now(venues)
         return Response(venues, status=status.HTTP_200_OK)
 
     except Exception as e:
-        print(f"❌ Picnic generation error: {e}", file=sys.stderr, flush=True)
+        logger.error("❌ Picnic generation error: %s", e)
         import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
+        logger.error("%s", traceback.format_exc())
         return Response(
             {'error': f'Piknik alanları getirilirken hata: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
 
+@serve_from_event_store('performing_arts')
 def generate_performing_arts_events(location, filters):
     """Sahne Sanatları kategorisi için tiyatro, stand-up, opera, bale etkinlikleri - Google Search grounding ile"""
     import json
-    import sys
     import re
     from datetime import datetime, timedelta
     from google import genai
@@ -2860,8 +1354,8 @@ def generate_performing_arts_events(location, filters):
     try:
         client = genai.Client(api_key=settings.GEMINI_API_KEY)
 
-        print(f"🎭 Sahne Sanatları (Google Search): {city} - {search_date} ({date_range}) - {performance_genre}", file=sys.stderr, flush=True)
-        print(f"📅 Tarih aralığı: {current_date_iso} -> {end_date_iso}", file=sys.stderr, flush=True)
+        logger.info("🎭 Sahne Sanatları (Google Search): %s - %s (%s) - %s", city, search_date, date_range, performance_genre)
+        logger.info("📅 Tarih aralığı: %s -> %s", current_date_iso, end_date_iso)
 
         arts_prompt = f"""
 {city} şehrinde {search_date} gerçekleşecek {genre_search} etkinliklerini internetten ara ve listele.
@@ -2898,21 +1392,22 @@ JSON ARRAY formatında döndür. Her etkinlik için:
 
 SADECE JSON ARRAY döndür."""
 
-        response = client.models.generate_content(
-            model='gemini-2.0-flash',
-            contents=arts_prompt,
-            config=types.GenerateContentConfig(
-                tools=[
-                    types.Tool(
-                        google_search=types.GoogleSearch()
-                    )
-                ]
+        with span('gemini.search'):
+            response = client.models.generate_content(
+                model='gemini-2.0-flash',
+                contents=arts_prompt,
+                config=types.GenerateContentConfig(
+                    tools=[
+                        types.Tool(
+                            google_search=types.GoogleSearch()
+                        )
+                    ]
+                )
             )
-        )
 
         response_text = response.text.strip()
-        print(f"📝 Response length: {len(response_text)}", file=sys.stderr, flush=True)
-        print(f"📝 Response preview: {response_text[:500]}...", file=sys.stderr, flush=True)
+        logger.info("📝 Response length: %s", len(response_text))
+        logger.info("📝 Response preview: %s...", response_text[:500])
 
         # JSON parse et
         if '```json' in response_text:
@@ -2927,14 +1422,14 @@ SADECE JSON ARRAY döndür."""
                 response_text = response_text[start_idx:end_idx + 1]
             else:
                 # JSON array bulunamadı - boş liste döndür
-                print(f"⚠️ JSON array bulunamadı, boş liste döndürülüyor", file=sys.stderr, flush=True)
+                logger.warning("⚠️ JSON array bulunamadı, boş liste döndürülüyor")
                 return Response([], status=status.HTTP_200_OK)
 
         try:
             events = json.loads(response_text)
         except json.JSONDecodeError as je:
-            print(f"⚠️ JSON parse hatası: {je}", file=sys.stderr, flush=True)
-            print(f"⚠️ Parsed text: {response_text[:500]}", file=sys.stderr, flush=True)
+            logger.warning("⚠️ JSON parse hatası: %s", je)
+            logger.warning("⚠️ Parsed text: %s", response_text[:500])
 
             # Kesilmiş JSON'u kurtarmaya çalış
             # Son tamamlanmış objeyi bul
@@ -2972,9 +1467,9 @@ SADECE JSON ARRAY döndür."""
                 truncated_json = response_text[:last_complete_idx + 1] + ']'
                 try:
                     events = json.loads(truncated_json)
-                    print(f"✅ Kesilmiş JSON kurtarıldı - {len(events)} etkinlik", file=sys.stderr, flush=True)
+                    logger.info("✅ Kesilmiş JSON kurtarıldı - %s etkinlik", len(events))
                 except json.JSONDecodeError as je2:
-                    print(f"⚠️ JSON kurtarma başarısız: {je2}", file=sys.stderr, flush=True)
+                    logger.warning("⚠️ JSON kurtarma başarısız: %s", je2)
                     events = []
 
             if not events:
@@ -3021,12 +1516,12 @@ SADECE JSON ARRAY döndür."""
 
             # Filtreleme: Bitmiş etkinlikleri çıkar
             if start_date and start_date.date() < today.date():
-                print(f"⏭️ Geçmiş etkinlik atlandı: {event.get('name')} ({start_date})", file=sys.stderr, flush=True)
+                logger.debug("⏭️ Geçmiş etkinlik atlandı: %s (%s)", event.get('name'), start_date)
                 continue
 
             # Filtreleme: Seçilen tarih aralığı dışındakileri çıkar
             if start_date and start_date.date() > end_date.date():
-                print(f"⏭️ Tarih aralığı dışında: {event.get('name')} ({start_date})", file=sys.stderr, flush=True)
+                logger.debug("⏭️ Tarih aralığı dışında: %s (%s)", event.get('name'), start_date)
                 continue
 
             event['_sort_date'] = start_date or datetime(2099, 12, 31)
@@ -3042,2326 +1537,68 @@ SADECE JSON ARRAY döndür."""
             search_query = urllib.parse.quote(f"{venue_name} {city}")
             event['googleMapsUrl'] = f"https://www.google.com/maps/search/?api=1&query={search_query}"
 
-        print(f"✅ {len(filtered_events)} sahne sanatları etkinliği bulundu (filtreleme sonrası)", file=sys.stderr, flush=True)
+        logger.info("✅ %s sahne sanatları etkinliği bulundu (filtreleme sonrası)", len(filtered_events))
 
         return Response(filtered_events, status=status.HTTP_200_OK)
 
     except Exception as e:
-        print(f"❌ Performing arts generation error: {e}", file=sys.stderr, flush=True)
+        logger.error("❌ Performing arts generation error: %s", e)
         import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
+        logger.error("%s", traceback.format_exc())
         return Response(
             {'error': f'Sahne sanatları etkinlikleri getirilirken hata: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
 
-def generate_bar_venues(location, filters, exclude_ids):
-    """İş Çıkışı Bira & Kokteyl kategorisi için çoklu sorgu - her bar türü için ayrı arama yaparak çeşitlilik sağla
-    Gemini ile practicalInfo, atmosphereSummary ve enriched description eklenir.
-    """
-    import json
-    import sys
-    import requests
-    import re
-    import os
-
-    google_api_key = os.environ.get('GOOGLE_MAPS_API_KEY')
-    gmaps = get_gmaps_client()
+def extract_website(url):
+    """Instagram ve sosyal medya linklerini website'den ayırır"""
+    if not url:
+        return ''
+    # Instagram, Facebook, Twitter linkleri website değil
+    social_media_domains = ['instagram.com', 'facebook.com', 'twitter.com', 'tiktok.com', 'youtube.com']
+    for domain in social_media_domains:
+        if domain in url.lower():
+            return ''
+    return url
 
-    city = location['city']
-    districts = location.get('districts', [])
-    neighborhoods = location.get('neighborhoods', [])
-    selected_district = districts[0] if districts else None
-    selected_neighborhood = neighborhoods[0] if neighborhoods else None
+def extract_instagram(url):
+    """URL'den Instagram linkini çıkarır"""
+    if not url:
+        return ''
+    if 'instagram.com' in url.lower():
+        return url
+    return ''
 
-    # ===== HYBRID CACHE SİSTEMİ =====
-    exclude_ids_set = set(exclude_ids) if exclude_ids else set()
-    cached_venues, all_cached_ids = get_cached_venues_for_hybrid(
-        category_name='İş Çıkışı Bira & Kokteyl',
-        city=city,
-        district=selected_district,
-        neighborhood=selected_neighborhood,
-        exclude_ids=exclude_ids_set,
-        limit=CACHE_VENUES_LIMIT
-    )
-    api_exclude_ids = exclude_ids_set | all_cached_ids
-    print(f"🔀 HYBRID - İş Çıkışı Bira & Kokteyl Cache: {len(cached_venues)}, API exclude: {len(api_exclude_ids)}", file=sys.stderr, flush=True)
-
-    # Lokasyon string'i oluştur
-    if selected_neighborhood:
-        search_location = f"{selected_neighborhood}, {selected_district}, {city}"
-    elif selected_district:
-        search_location = f"{selected_district}, {city}"
-    else:
-        search_location = city
-
-    print(f"🍺 İş Çıkışı Bira & Kokteyl (Multi-Query): {search_location}", file=sys.stderr, flush=True)
-
-    # Her bar türü için ayrı sorgu - çeşitlilik sağlamak için
-    bar_queries = [
-        ('pub', 'Pub'),
-        ('irish pub', 'Irish Pub'),
-        ('craft beer bar', 'Craft Beer'),
-        ('cocktail bar', 'Kokteyl Bar'),
-        ('blues bar rock bar', 'Blues/Rock Bar'),
-        ('gastropub', 'Gastropub'),
-        ('beer garden bira bahçesi', 'Bira Bahçesi'),
-        ('sports bar', 'Sports Bar'),
-        ('live music bar canlı müzik bar', 'Canlı Müzik'),
-    ]
 
-    all_venues = []
-    seen_place_ids = set(api_exclude_ids)  # Duplicate önleme
+def sort_venues_by_context(venues, category_name):
+    """Context skoruna göre mekanları sıralar ve 50 altını filtreler (ranking.CONTEXT profili)"""
+    context_key = CATEGORY_TO_CONTEXT.get(category_name, "friends_hangout")
+    sorted_venues = rank_venues(venues, CONTEXT, context_key=context_key)
+    for v in sorted_venues:
+        v['matchScore'] = v.get('contextScore', {}).get(context_key, 75)  # matchScore'u context skoruyla güncelle
+    return sorted_venues
 
-    # Lokasyonun koordinatlarını al (location bias için)
-    location_lat, location_lng = None, None
-    try:
-        geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
-        geocode_params = {
-            "address": f"{search_location}, Turkey",
-            "key": google_api_key
-        }
-        geocode_response = requests.get(geocode_url, params=geocode_params)
-        if geocode_response.status_code == 200:
-            geocode_data = geocode_response.json()
-            if geocode_data.get('results'):
-                location_coords = geocode_data['results'][0]['geometry']['location']
-                location_lat, location_lng = location_coords['lat'], location_coords['lng']
-                print(f"🗺️ İş Çıkışı Bar location bias: {search_location} -> ({location_lat}, {location_lng})", file=sys.stderr, flush=True)
-    except Exception as e:
-        print(f"⚠️ Geocode hatası: {e}", file=sys.stderr, flush=True)
 
-    try:
-        # Koordinatlar yoksa arama yapamayız
-        if not location_lat or not location_lng:
-            print(f"⚠️ İş Çıkışı Bar: Koordinat bulunamadı, arama yapılamıyor", file=sys.stderr, flush=True)
-            return Response([], status=status.HTTP_200_OK)
-
-        # Nearby Search API - kesin lokasyon filtrelemesi
-        nearby_url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
-
-        for query_term, bar_type in bar_queries:
-            if len(all_venues) >= 15:  # Yeterli mekan bulundu
-                break
-
-            print(f"🔍 Bar Nearby Search: {query_term} @ {search_location}", file=sys.stderr, flush=True)
-
-            params = {
-                'location': f"{location_lat},{location_lng}",
-                'radius': 2000,  # 2km yarıçap - kesin filtreleme
-                'type': 'bar',
-                'keyword': query_term,
-                'language': 'tr',
-                'key': google_api_key
-            }
-
-            try:
-                response = requests.get(nearby_url, params=params, timeout=10)
-                if response.status_code != 200:
-                    print(f"⚠️ Bar API error for {bar_type}: {response.status_code}", file=sys.stderr, flush=True)
-                    continue
-
-                data = response.json()
-                places = data.get('results', [])
-
-                # Pagination: 2. ve 3. sayfaları da al
-                for page_num in range(2, 4):
-                    next_page_token = data.get('next_page_token')
-                    if not next_page_token:
-                        break
-                    time.sleep(2)
-                    next_params = {"pagetoken": next_page_token, "key": google_api_key}
-                    next_response = requests.get(nearby_url, params=next_params, timeout=10)
-                    if next_response.status_code == 200:
-                        next_data = next_response.json()
-                        places.extend(next_data.get('results', []))
-                        data = next_data
-
-                for place in places:
-                    place_id = place.get('place_id', '')
-                    if place_id in seen_place_ids:
-                        continue
-
-                    # Temel filtreler
-                    place_types = place.get('types', [])
-                    place_name = place.get('name', '')
-                    place_rating = place.get('rating', 0)
-                    place_review_count = place.get('user_ratings_total', 0)
-
-                    # Meyhane, ocakbaşı, kebap gibi yerleri filtrele
-                    excluded_keywords = ['meyhane', 'ocakbaşı', 'kebap', 'kebapçı', 'köfte', 'balık', 'fasıl', 'türkü', 'lokanta', 'restoran', 'restaurant']
-                    name_lower = place_name.lower()
-                    if any(kw in name_lower for kw in excluded_keywords):
-                        print(f"❌ BAR FILTER - {place_name}: excluded keyword", file=sys.stderr, flush=True)
-                        continue
-
-                    # Minimum kalite
-                    if place_rating < 3.8 or place_review_count < 20:
-                        continue
-
-                    seen_place_ids.add(place_id)
-
-                    # Fotoğraf URL
-                    photos = place.get('photos', [])
-                    photo_url = None
-                    if photos:
-                        photo_ref = photos[0].get('photo_reference', '')
-                        if photo_ref:
-                            photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={google_api_key}"
-
-                    # Price level (Legacy API: 0-4 integer)
-                    price_level = place.get('price_level', 2)
-                    price_map = {0: '₺', 1: '₺₺', 2: '₺₺₺', 3: '₺₺₺₺', 4: '₺₺₺₺₺'}
-                    price_range = price_map.get(price_level, '₺₺₺')
-
-                    # Place Details ile yorumları al
-                    google_reviews = get_place_reviews(gmaps, place_id) if place_id else []
-
-                    # ===== ESKİ YORUM KONTROLÜ =====
-                    if place_review_count < 50 and google_reviews:
-                        from datetime import datetime, timedelta
-                        seven_months_ago = datetime.now() - timedelta(days=210)
-                        latest_review_time = None
-                        for review in google_reviews:
-                            review_timestamp = review.get('time')
-                            if review_timestamp:
-                                try:
-                                    review_time = datetime.fromtimestamp(review_timestamp)
-                                    if latest_review_time is None or review_time > latest_review_time:
-                                        latest_review_time = review_time
-                                except:
-                                    pass
-                        if latest_review_time and latest_review_time < seven_months_ago:
-                            print(f"❌ ESKİ YORUM REJECT - {place_name}: son yorum {latest_review_time.strftime('%Y-%m-%d')}", file=sys.stderr, flush=True)
-                            continue
-
-                    # ===== KAPANMIŞ MEKAN KONTROLÜ (YORUM İÇERİĞİ) =====
-                    if google_reviews:
-                        closed_keywords = ['kapandı', 'kapandi', 'kapanmış', 'kapanmis', 'kapatıldı', 'kapatildi', 'kapatılmış', 'kapatilmis',
-                                          'kalıcı olarak kapan', 'kalici olarak kapan', 'kalıcı olarak kapatıl', 'kalici olarak kapatil',
-                                          'artık kapalı', 'artik kapali', 'permanently closed', 'yerine açıldı', 'yerine acildi', 'burası artık', 'burasi artik']
-                        is_closed = False
-                        for review in google_reviews[:5]:
-                            review_text = review.get('text', '').lower().replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                            for kw in closed_keywords:
-                                if kw.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u') in review_text:
-                                    is_closed = True
-                                    print(f"❌ KAPANMIŞ MEKAN REJECT - {place_name}: yorumda '{kw}' bulundu", file=sys.stderr, flush=True)
-                                    break
-                            if is_closed:
-                                break
-                        if is_closed:
-                            continue
-
-                    # Vibe tags
-                    vibe_tags = ['#İşÇıkışı', f'#{bar_type.replace(" ", "").replace("/", "")}', '#AfterWork']
-
-                    venue = {
-                        'id': place_id,
-                        'name': place_name,
-                        'base_description': f"{place_name}, {bar_type.lower()} konseptinde iş çıkışı için ideal bir mekan.",
-                        'imageUrl': photo_url or 'https://images.unsplash.com/photo-1514933651103-005eec06c04b?w=800',
-                        'category': 'İş Çıkışı Bira & Kokteyl',
-                        'barType': bar_type,
-                        'vibeTags': vibe_tags,
-                        'address': place.get('formatted_address', ''),
-                        'priceRange': price_range,
-                        'googleRating': place_rating,
-                        'googleReviewCount': place_review_count,
-                        'matchScore': min(95, int(place_rating * 20 + min(place_review_count / 50, 10))),
-                        'noiseLevel': 65,
-                        'googleMapsUrl': f"https://www.google.com/maps/place/?q=place_id:{place_id}",
-                        'googleReviews': google_reviews,
-                        'google_reviews': google_reviews,
-                        'website': '',
-                        'hours': place.get('opening_hours', {}).get('weekday_text', []),
-                    }
-                    all_venues.append(venue)
-                    print(f"✅ Bar Found: {place_name} ({bar_type}) - {place_rating}⭐", file=sys.stderr, flush=True)
-
-            except Exception as e:
-                print(f"⚠️ Bar query error for {bar_type}: {e}", file=sys.stderr, flush=True)
-                continue
-
-        venues = all_venues[:10]  # En fazla 10 venue
-
-        # ===== GEMİNİ İLE ZENGİNLEŞTİRME =====
-        if venues:
-            try:
-                gemini_api_key = settings.GEMINI_API_KEY
-                gemini_url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={gemini_api_key}"
-
-                # Pratik bilgi içeren yorumları seç
-                practical_keywords = ['rezervasyon', 'fiyat', 'pahalı', 'ucuz', 'servis', 'garson', 'atmosfer',
-                                     'müzik', 'kalabalık', 'sakin', 'happy hour', 'canlı', 'kokteyl', 'bira']
-
-                places_list_items = []
-                for i, v in enumerate(venues[:10]):
-                    reviews_text = ""
-                    if v.get('google_reviews'):
-                        practical_reviews = []
-                        other_reviews = []
-                        for r in v['google_reviews']:
-                            text = r.get('text', '').lower()
-                            if any(kw in text for kw in practical_keywords):
-                                practical_reviews.append(r)
-                            else:
-                                other_reviews.append(r)
-                        selected_reviews = practical_reviews[:3] + other_reviews[:2]
-                        top_reviews = [r.get('text', '')[:350] for r in selected_reviews if r.get('text')]
-                        if top_reviews:
-                            reviews_text = f" | Yorumlar: {' /// '.join(top_reviews)}"
-
-                    bar_note = f" | Tür: {v.get('barType', '')}"
-                    places_list_items.append(
-                        f"{i+1}. {v['name']} | Rating: {v.get('googleRating', 'N/A')}{bar_note}{reviews_text}"
-                    )
-                places_list = "\n".join(places_list_items)
-
-                batch_prompt = f"""Kategori: İş Çıkışı Bira & Kokteyl
-Kullanıcı Tercihleri: İş çıkışı, bira, kokteyl, pub, after-work drinks
-
-Mekanlar ve Yorumları:
-{places_list}
-
-Her mekan için analiz yap ve JSON döndür:
-{{
-  "name": "Mekan Adı",
-  "description": "2 cümle Türkçe - mekanın öne çıkan özelliği, atmosferi",
-  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
-  "instagramUsername": "kullanici_adi" | null,
-  "practicalInfo": {{
-    "reservationNeeded": "Tavsiye Edilir" | "Şart" | "Gerekli Değil" | null,
-    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
-    "happyHour": "Var" | "Yok" | null,
-    "outdoorSeating": true | false | null,
-    "liveMusic": true | false | null,
-    "sportsTv": true | false | null,
-    "mustTry": "Önerilen içecek" | null
-  }},
-  "atmosphereSummary": {{
-    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı" | "Gürültülü",
-    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
-    "energy": "Sakin" | "Dengeli" | "Enerjik",
-    "idealFor": ["iş çıkışı", "arkadaşlarla buluşma"],
-    "notIdealFor": ["romantik akşam"],
-    "oneLiner": "Bir cümle özet"
-  }}
-}}
-
-instagramUsername Kuralları:
-- Mekanın resmi Instagram hesabını bul (@ işareti olmadan sadece kullanıcı adı)
-- Türkiye'deki barların Instagram'ı genellikle bar_ismi, barismi, barismi_sehir formatındadır
-- Örnek: "Reset Pub" → "resetpub", "Varuna Gezgin" → "varunagezgin"
-- Bilinen popüler barların Instagram'ını ver. Emin olmadığın için null yaz.
-
-SADECE JSON array döndür, başka açıklama ekleme. [{{}}, {{}}, ...]"""
-
-                gemini_body = {
-                    "contents": [{"parts": [{"text": batch_prompt}]}],
-                    "generationConfig": {"temperature": 0.3, "maxOutputTokens": 4000}
-                }
-
-                gemini_response = requests.post(gemini_url, json=gemini_body, timeout=30)
-
-                if gemini_response.status_code == 200:
-                    gemini_data = gemini_response.json()
-                    response_text = gemini_data.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '[]')
-                    response_text = re.sub(r'```json\s*|\s*```', '', response_text).strip()
-
-                    try:
-                        ai_results = json.loads(response_text)
-                    except json.JSONDecodeError:
-                        match = re.search(r'\[.*\]', response_text, re.DOTALL)
-                        if match:
-                            ai_results = json.loads(match.group())
-                        else:
-                            print(f"⚠️ Bar Gemini JSON parse edilemedi, fallback kullanılıyor", file=sys.stderr, flush=True)
-                            ai_results = []
-
-                    ai_by_name = {r.get('name', '').lower(): r for r in ai_results}
-
-                    final_venues = []
-                    for venue_data in venues[:10]:
-                        ai_data = ai_by_name.get(venue_data['name'].lower(), {})
-
-                        venue = {
-                            'id': venue_data['id'],
-                            'name': venue_data['name'],
-                            'description': ai_data.get('description', venue_data['base_description']),
-                            'imageUrl': venue_data['imageUrl'],
-                            'category': 'İş Çıkışı Bira & Kokteyl',
-                            'vibeTags': ai_data.get('vibeTags', venue_data.get('vibeTags', ['#AfterWork'])),
-                            'address': venue_data['address'],
-                            'priceRange': venue_data['priceRange'],
-                            'googleRating': venue_data.get('googleRating', 4.0),
-                            'googleReviewCount': venue_data.get('googleReviewCount', 0),
-                            'matchScore': venue_data['matchScore'],
-                            'noiseLevel': venue_data['noiseLevel'],
-                            'googleMapsUrl': venue_data['googleMapsUrl'],
-                            'googleReviews': venue_data.get('googleReviews', []),
-                            'website': venue_data.get('website', ''),
-                            'hours': venue_data.get('hours', []),
-                            'practicalInfo': ai_data.get('practicalInfo', {}),
-                            'atmosphereSummary': ai_data.get('atmosphereSummary', {
-                                'noiseLevel': 'Canlı',
-                                'lighting': 'Loş',
-                                'energy': 'Enerjik',
-                                'idealFor': ['iş çıkışı', 'arkadaşlarla'],
-                                'notIdealFor': [],
-                                'oneLiner': 'İş çıkışı için ideal bir bar.'
-                            })
-                        }
-
-                        # Instagram username'i ekle (Gemini'dan)
-                        instagram_username = ai_data.get('instagramUsername')
-                        if instagram_username and instagram_username != 'null' and instagram_username is not None:
-                            venue['instagramUrl'] = f"https://instagram.com/{instagram_username}"
-                            venue['instagramEstimated'] = False  # Gemini buldu, doğrulanmış
-
-                        final_venues.append(venue)
-
-                    # Gemini Instagram bulamadıysa, Google CSE + tahmin ile bul
-                    for venue in final_venues:
-                        if not venue.get('instagramUrl'):
-                            instagram_url, is_verified = discover_instagram_url(
-                                venue_name=venue['name'],
-                                city=city,
-                                website=venue.get('website'),
-                                existing_instagram=None,
-                                district=selected_district,
-                                neighborhood=selected_neighborhood,
-                                return_verified=True
-                            )
-                            if instagram_url:
-                                venue['instagramUrl'] = instagram_url
-                                venue['instagramEstimated'] = not is_verified
-                                insta_status = "verified" if is_verified else "estimated"
-                                print(f"📸 Bar Instagram ({insta_status}): {venue['name']} -> {instagram_url}", file=sys.stderr, flush=True)
-
-                    print(f"✅ Gemini ile {len(final_venues)} Bar mekanı zenginleştirildi", file=sys.stderr, flush=True)
-
-                    # ===== CACHE'E KAYDET =====
-                    if final_venues:
-                        save_venues_to_cache(
-                            venues=final_venues,
-                            category_name='İş Çıkışı Bira & Kokteyl',
-                            city=city,
-                            district=selected_district,
-                            neighborhood=selected_neighborhood
-                        )
-
-                    # ===== HYBRID: CACHE + API BİRLEŞTİR =====
-                    combined_venues = []
-                    existing_names = set()  # İsim bazlı duplicate kontrolü
-                    for cv in cached_venues:
-                        if len(combined_venues) < 50:
-                            combined_venues.append(cv)
-                            existing_names.add(cv.get('name', '').lower().strip())
-                    existing_ids = {v.get('id') for v in combined_venues}
-                    for av in final_venues:
-                        av_name = av.get('name', '').lower().strip()
-                        if len(combined_venues) < 50 and av.get('id') not in existing_ids and av_name not in existing_names:
-                            combined_venues.append(av)
-                            existing_ids.add(av.get('id'))
-                            existing_names.add(av_name)
-
-                    print(f"🔀 HYBRID RESULT - Bar Cache: {len(cached_venues)}, API: {len(final_venues)}, Combined: {len(combined_venues)}", file=sys.stderr, flush=True)
-                    return Response(combined_venues, status=status.HTTP_200_OK)
-
-            except Exception as e:
-                print(f"❌ Gemini Bar hatası: {e}", file=sys.stderr, flush=True)
-                for venue_data in venues:
-                    venue_data['description'] = venue_data.pop('base_description', venue_data.get('description', ''))
-                    venue_data['practicalInfo'] = {}
-                    venue_data['atmosphereSummary'] = {
-                        'noiseLevel': 'Canlı',
-                        'lighting': 'Loş',
-                        'energy': 'Enerjik',
-                        'idealFor': ['iş çıkışı'],
-                        'notIdealFor': [],
-                        'oneLiner': 'İş çıkışı için ideal bir bar.'
-                    }
-
-        # ===== CACHE'E KAYDET (Gemini başarısız olursa) =====
-        if venues:
-            save_venues_to_cache(
-                venues=venues,
-                category_name='İş Çıkışı Bira & Kokteyl',
-                city=city,
-                district=selected_district,
-                neighborhood=selected_neighborhood
-            )
-
-        # ===== HYBRID: CACHE + API =====
-        combined_venues = []
-        existing_names = set()  # İsim bazlı duplicate kontrolü
-        for cv in cached_venues:
-            if len(combined_venues) < 50:
-                combined_venues.append(cv)
-                existing_names.add(cv.get('name', '').lower().strip())
-        existing_ids = {v.get('id') for v in combined_venues}
-        for av in venues:
-            av_name = av.get('name', '').lower().strip()
-            if len(combined_venues) < 50 and av.get('id') not in existing_ids and av_name not in existing_names:
-                combined_venues.append(av)
-                existing_ids.add(av.get('id'))
-                existing_names.add(av_name)
-
-        print(f"🔀 HYBRID RESULT - Bar Cache: {len(cached_venues)}, API: {len(venues)}, Combined: {len(combined_venues)}", file=sys.stderr, flush=True)
-        return Response(combined_venues, status=status.HTTP_200_OK)
-
-    except Exception as e:
-        print(f"❌ Bar generation error: {e}", file=sys.stderr, flush=True)
-        import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
-        return Response(
-            {'error': f'Bar mekanları getirilirken hata: {str(e)}'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-
-
-def generate_street_food_places(location, filters, exclude_ids):
-    """Sokak Lezzeti kategorisi için çoklu sorgu - her yemek türü için ayrı arama yaparak çeşitlilik sağla
-    Gemini ile practicalInfo, atmosphereSummary ve enriched description eklenir.
-    """
-    import json
-    import sys
-    import requests
-    import re
-
-    gmaps = get_gmaps_client()
-    city = location['city']
-    districts = location.get('districts', [])
-    neighborhoods = location.get('neighborhoods', [])
-    selected_district = districts[0] if districts else None
-    selected_neighborhood = neighborhoods[0] if neighborhoods else None
-
-    # ===== G&M VENUE'LARI ÖNCELİKLİ OLARAK ÇEK =====
-    exclude_ids_set = set(exclude_ids) if exclude_ids else set()
-    gm_venues = get_gm_venues_for_category(
-        category_id='sokak-lezzeti',
-        category_name='Sokak Lezzeti',
-        city=city,
-        exclude_ids=exclude_ids_set,
-        district=selected_district  # İlçe filtresi
-    )
-    if gm_venues:
-        print(f"🏆 G&M - Sokak Lezzeti kategorisinde {len(gm_venues)} G&M restoran bulundu ({city})", file=sys.stderr, flush=True)
-        # G&M place_id'lerini exclude listesine ekle
-        gm_place_ids = {v.get('id') for v in gm_venues if v.get('id')}
-        exclude_ids_set = exclude_ids_set | gm_place_ids
-
-    # ===== HYBRID CACHE SİSTEMİ =====
-    cached_venues, all_cached_ids = get_cached_venues_for_hybrid(
-        category_name='Sokak Lezzeti',
-        city=city,
-        district=selected_district,
-        neighborhood=selected_neighborhood,
-        exclude_ids=exclude_ids_set,
-        limit=CACHE_VENUES_LIMIT
-    )
-    api_exclude_ids = exclude_ids_set | all_cached_ids
-    print(f"🔀 HYBRID - Sokak Lezzeti Cache: {len(cached_venues)}, API exclude: {len(api_exclude_ids)}", file=sys.stderr, flush=True)
-
-    # Lokasyon string'i oluştur
-    if selected_neighborhood:
-        search_location = f"{selected_neighborhood}, {selected_district}, {city}"
-    elif selected_district:
-        search_location = f"{selected_district}, {city}"
-    else:
-        search_location = city
-
-    print(f"🌯 Sokak Lezzeti (Multi-Query): {search_location}", file=sys.stderr, flush=True)
-
-    # Her yemek türü için ayrı sorgu - çeşitlilik sağlamak için
-    street_food_queries = [
-        ('kokoreç', 'Kokoreç'),
-        ('tantuni', 'Tantuni'),
-        ('midye dolma', 'Midye'),
-        ('lahmacun', 'Lahmacun'),
-        ('pide', 'Pide'),
-        ('döner dürüm', 'Döner'),
-        ('balık ekmek', 'Balık Ekmek'),
-        ('çiğ köfte', 'Çiğ Köfte'),
-        ('ciğer kebap', 'Ciğer'),
-        ('söğüş işkembe', 'Söğüş'),
-    ]
-
-    venues = []
-    added_ids = set()
-
-    # Lokasyonun koordinatlarını al (location bias için)
-    location_lat, location_lng = None, None
-    try:
-        geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
-        geocode_params = {
-            "address": f"{search_location}, Turkey",
-            "key": settings.GOOGLE_MAPS_API_KEY
-        }
-        geocode_response = requests.get(geocode_url, params=geocode_params)
-        if geocode_response.status_code == 200:
-            geocode_data = geocode_response.json()
-            if geocode_data.get('results'):
-                location_coords = geocode_data['results'][0]['geometry']['location']
-                location_lat, location_lng = location_coords['lat'], location_coords['lng']
-                print(f"🗺️ Sokak Lezzeti location bias: {search_location} -> ({location_lat}, {location_lng})", file=sys.stderr, flush=True)
-    except Exception as e:
-        print(f"⚠️ Geocode hatası: {e}", file=sys.stderr, flush=True)
-
-    try:
-        # Koordinatlar yoksa arama yapamayız
-        if not location_lat or not location_lng:
-            print(f"⚠️ Sokak Lezzeti: Koordinat bulunamadı, arama yapılamıyor", file=sys.stderr, flush=True)
-            return Response([], status=status.HTTP_200_OK)
-
-        # Nearby Search API - kesin lokasyon filtrelemesi
-        nearby_url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
-
-        for query_term, food_type in street_food_queries:
-            try:
-                params = {
-                    "location": f"{location_lat},{location_lng}",
-                    "radius": 2000,  # 2km yarıçap - kesin filtreleme
-                    "type": "restaurant",
-                    "keyword": query_term,
-                    "language": "tr",
-                    "key": settings.GOOGLE_MAPS_API_KEY
-                }
-
-                print(f"🔍 Sokak Lezzeti Nearby Search: {query_term} @ {search_location}", file=sys.stderr, flush=True)
-
-                response = requests.get(nearby_url, params=params)
-
-                if response.status_code != 200:
-                    print(f"⚠️ API hatası ({query_term}): {response.status_code}", file=sys.stderr, flush=True)
-                    continue
-
-                places_data = response.json()
-                places = places_data.get('results', [])
-
-                # Pagination: 2. ve 3. sayfaları da al
-                for page_num in range(2, 4):
-                    next_page_token = places_data.get('next_page_token')
-                    if not next_page_token:
-                        break
-                    time.sleep(2)
-                    next_params = {"pagetoken": next_page_token, "key": settings.GOOGLE_MAPS_API_KEY}
-                    next_response = requests.get(nearby_url, params=next_params)
-                    if next_response.status_code == 200:
-                        next_data = next_response.json()
-                        places.extend(next_data.get('results', []))
-                        places_data = next_data
-
-                for place in places:
-                    place_id = place.get('place_id', '')
-                    place_name = place.get('name', '')
-                    # Nearby Search'te vicinity, Text Search'te formatted_address
-                    place_address = place.get('vicinity', '') or place.get('formatted_address', '')
-                    place_rating = place.get('rating', 0)
-                    place_review_count = place.get('user_ratings_total', 0)
-                    place_types = place.get('types', [])
-
-                    # Daha önce eklendiyse atla
-                    if place_id in added_ids:
-                        continue
-
-                    # Exclude IDs kontrolü
-                    if place_id in exclude_ids:
-                        print(f"⏭️ EXCLUDE - {place_name}: zaten gösterildi", file=sys.stderr, flush=True)
-                        continue
-
-                    # Rating filtresi - 4.2 ve üzeri
-                    if place_rating < 4.2:
-                        print(f"❌ RATING REJECT - {place_name}: {place_rating} < 4.2", file=sys.stderr, flush=True)
-                        continue
-
-                    # Review count filtresi - minimum 20
-                    if place_review_count < 20:
-                        print(f"❌ REVIEW COUNT REJECT - {place_name}: {place_review_count} < 20", file=sys.stderr, flush=True)
-                        continue
-
-                    # NOT: İlçe kontrolü kaldırıldı - Nearby Search zaten koordinat + radius bazlı
-                    # vicinity alanı ilçe adını içermiyor (sadece mahalle/sokak), bu yüzden kontrol yapılmıyor
-
-                    # Tekel/Market filtresi
-                    place_name_lower = place_name.lower().replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                    place_types_str = ' '.join(place_types).lower()
-                    tekel_keywords = ['tekel', 'market', 'bakkal', 'büfe', 'süpermarket', 'grocery', 'liquor store', 'convenience']
-                    tekel_types = ['liquor_store', 'convenience_store', 'grocery_store', 'supermarket']
-
-                    if any(t in place_types_str for t in tekel_types) or any(k in place_name_lower for k in tekel_keywords):
-                        print(f"❌ TEKEL REJECT - {place_name}", file=sys.stderr, flush=True)
-                        continue
-
-                    # Fotoğraf URL'si (Legacy API)
-                    photo_url = None
-                    if place.get('photos') and len(place['photos']) > 0:
-                        photo_ref = place['photos'][0].get('photo_reference', '')
-                        if photo_ref:
-                            photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
-
-                    # Google Maps URL
-                    maps_query = urllib.parse.quote(f"{place_name} {place_address}")
-                    google_maps_url = f"https://www.google.com/maps/search/?api=1&query={maps_query}"
-
-                    # Fiyat aralığı (Legacy API: 0-4 integer)
-                    price_level = place.get('price_level', 1)
-                    price_map = {0: '$', 1: '$', 2: '$$', 3: '$$$', 4: '$$$$'}
-                    price_range = price_map.get(price_level, '$')
-
-                    # Place Details ile yorumları al
-                    google_reviews = get_place_reviews(gmaps, place_id) if place_id else []
-
-                    # ===== ESKİ YORUM KONTROLÜ =====
-                    if place_review_count < 50 and google_reviews:
-                        from datetime import datetime, timedelta
-                        seven_months_ago = datetime.now() - timedelta(days=210)
-                        latest_review_time = None
-                        for review in google_reviews:
-                            review_timestamp = review.get('time')
-                            if review_timestamp:
-                                try:
-                                    review_time = datetime.fromtimestamp(review_timestamp)
-                                    if latest_review_time is None or review_time > latest_review_time:
-                                        latest_review_time = review_time
-                                except:
-                                    pass
-                        if latest_review_time and latest_review_time < seven_months_ago:
-                            print(f"❌ ESKİ YORUM REJECT - {place_name}: son yorum {latest_review_time.strftime('%Y-%m-%d')}", file=sys.stderr, flush=True)
-                            continue
-
-                    # ===== KAPANMIŞ MEKAN KONTROLÜ (YORUM İÇERİĞİ) =====
-                    if google_reviews:
-                        closed_keywords = ['kapandı', 'kapandi', 'kapanmış', 'kapanmis', 'kapatıldı', 'kapatildi', 'kapatılmış', 'kapatilmis',
-                                          'kalıcı olarak kapan', 'kalici olarak kapan', 'kalıcı olarak kapatıl', 'kalici olarak kapatil',
-                                          'artık kapalı', 'artik kapali', 'permanently closed', 'yerine açıldı', 'yerine acildi', 'burası artık', 'burasi artik']
-                        is_closed = False
-                        for review in google_reviews[:5]:
-                            review_text = review.get('text', '').lower().replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                            for kw in closed_keywords:
-                                if kw.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u') in review_text:
-                                    is_closed = True
-                                    print(f"❌ KAPANMIŞ MEKAN REJECT - {place_name}: yorumda '{kw}' bulundu", file=sys.stderr, flush=True)
-                                    break
-                            if is_closed:
-                                break
-                        if is_closed:
-                            continue
-
-                    # Vibe tags
-                    vibe_tags = ['#SokakLezzeti', f'#{food_type.replace(" ", "")}', '#Yerel']
-
-                    # Çalışma saatleri
-                    opening_hours = place.get('opening_hours', {})
-
-                    venue = {
-                        'id': place_id,
-                        'name': place_name,
-                        'base_description': f"{place_name}, {food_type.lower()} konusunda bölgenin en sevilen sokak lezzeti duraklarından biri.",
-                        'imageUrl': photo_url or 'https://images.unsplash.com/photo-1565299624946-b28f40a0ae38?w=800',
-                        'category': 'Sokak Lezzeti',
-                        'vibeTags': vibe_tags,
-                        'address': place_address,
-                        'priceRange': price_range,
-                        'googleRating': place_rating,
-                        'googleReviewCount': place_review_count,
-                        'matchScore': min(95, int(place_rating * 20 + min(place_review_count / 50, 10))),
-                        'noiseLevel': 55,
-                        'googleMapsUrl': google_maps_url,
-                        'googleReviews': google_reviews,
-                        'google_reviews': google_reviews,  # Gemini için
-                        'foodType': food_type,
-                        'weeklyHours': opening_hours.get('weekday_text', []),
-                        'isOpenNow': opening_hours.get('open_now', None),
-                        'website': '',
-                        'phoneNumber': ''
-                    }
-
-                    venues.append(venue)
-                    added_ids.add(place_id)
-                    print(f"✅ EKLENDI - {place_name} ({food_type}): ⭐{place_rating} ({place_review_count} yorum)", file=sys.stderr, flush=True)
-
-            except Exception as e:
-                print(f"⚠️ {query_term} sorgusu hatası: {e}", file=sys.stderr, flush=True)
-                continue
-
-        # Puana ve yorum sayısına göre sırala
-        venues.sort(key=lambda x: (x['googleRating'], x['googleReviewCount']), reverse=True)
-
-        print(f"🌯 Toplam {len(venues)} sokak lezzeti mekanı bulundu, Gemini ile zenginleştiriliyor...", file=sys.stderr, flush=True)
-
-        # Gemini ile practicalInfo ve atmosphereSummary ekle
-        if venues:
-            # Pratik bilgi içeren yorumları öncelikli seç
-            practical_keywords = ['otopark', 'park', 'vale', 'valet', 'rezervasyon', 'bekle', 'sıra', 'kuyruk',
-                                  'kalabalık', 'sakin', 'sessiz', 'gürültü', 'çocuk', 'bebek', 'aile',
-                                  'vejetaryen', 'vegan', 'alkol', 'rakı', 'şarap', 'bira', 'servis',
-                                  'hızlı', 'yavaş', 'pahalı', 'ucuz', 'fiyat', 'hesap', 'bahçe', 'teras', 'dış mekan', 'nakit']
-
-            places_list_items = []
-            for i, v in enumerate(venues[:10]):
-                reviews_text = ""
-                if v.get('google_reviews'):
-                    all_reviews = v['google_reviews']
-                    practical_reviews = []
-                    other_reviews = []
-                    for r in all_reviews:
-                        text = r.get('text', '').lower()
-                        if any(kw in text for kw in practical_keywords):
-                            practical_reviews.append(r)
-                        else:
-                            other_reviews.append(r)
-                    selected_reviews = practical_reviews[:3] + other_reviews[:2]
-                    top_reviews = [r.get('text', '')[:350] for r in selected_reviews if r.get('text')]
-                    if top_reviews:
-                        reviews_text = f" | Yorumlar: {' /// '.join(top_reviews)}"
-
-                food_note = f" | Lezzet: {v.get('foodType', '')}"
-                places_list_items.append(
-                    f"{i+1}. {v['name']} | Rating: {v.get('googleRating', 'N/A')}{food_note}{reviews_text}"
-                )
-            places_list = "\n".join(places_list_items)
-
-            batch_prompt = f"""Kategori: Sokak Lezzeti
-Kullanıcı Tercihleri: Sokak lezzeti, hızlı yemek, yerel lezzetler
-
-Mekanlar ve Yorumları:
-{places_list}
-
-Her mekan için analiz yap ve JSON döndür:
-{{
-  "name": "Mekan Adı",
-  "description": "2 cümle Türkçe - mekanın öne çıkan özelliği, imza lezzeti",
-  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
-  "instagramUsername": "kullanici_adi" | null,
-  "practicalInfo": {{
-    "reservationNeeded": null,
-    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
-    "waitTime": "Bekleme yok" | "10-15 dk" | "20-30 dk" | null,
-    "parking": "Kolay" | "Zor" | "Otopark var" | "Yok" | null,
-    "hasValet": true | false | null,
-    "outdoorSeating": true | false | null,
-    "kidFriendly": true | false | null,
-    "vegetarianOptions": true | false | null,
-    "alcoholServed": false,
-    "serviceSpeed": "Hızlı" | "Normal" | "Yavaş" | null,
-    "priceFeeling": "Fiyatına Değer" | "Biraz Pahalı" | "Uygun" | null,
-    "mustTry": "İmza yemek" | null,
-    "headsUp": "Önemli uyarı (sadece nakit, vs.)" | null
-  }},
-  "atmosphereSummary": {{
-    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı" | "Gürültülü",
-    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
-    "privacy": "Özel" | "Yarı Özel" | "Açık Alan",
-    "energy": "Sakin" | "Dengeli" | "Enerjik",
-    "idealFor": ["hızlı öğün", "gece atıştırmalığı", "arkadaş buluşması"],
-    "notIdealFor": ["romantik akşam"],
-    "oneLiner": "Tek cümle Türkçe atmosfer özeti"
-  }}
-}}
-
-practicalInfo Kuralları (YORUMLARDAN ÇIKAR):
-- reservationNeeded: Sokak lezzeti için genelde null (rezervasyon olmaz)
-- crowdLevel: "Kalabalık", "sıra var" → "Kalabalık". "Sakin" → "Sakin"
-- waitTime: "Sıra", "kuyruk", "bekledik" → süreyi tahmin et
-- parking: "Otopark", "park yeri" → "Otopark var". "Park zor", "park yok" → "Zor". "Park kolay" → "Kolay". Sokak lezzeti genelde "Zor" veya null
-- hasValet: "Vale", "valet" → true. Sokak lezzeti için genelde null
-- serviceSpeed: Sokak lezzeti genelde "Hızlı"
-- priceFeeling: "Ucuz", "uygun" → "Uygun". "Pahalı" → "Biraz Pahalı"
-- mustTry: Yorumlarda en çok övülen yemek
-- headsUp: Sadece nakit, temizlik uyarısı vb.
-
-atmosphereSummary Kuralları:
-- noiseLevel: Sokak lezzeti genelde "Canlı" veya "Gürültülü"
-- lighting: Sokak lezzeti genelde "Aydınlık"
-- privacy: Sokak lezzeti genelde "Açık Alan"
-- energy: Sokak lezzeti genelde "Enerjik"
-- idealFor: Max 3 - "hızlı öğün", "gece atıştırmalığı", "arkadaş buluşması", "ekonomik yemek"
-- notIdealFor: Max 2 - "romantik akşam", "iş yemeği", "özel gün"
-- oneLiner: Tek cümle atmosfer özeti
-
-instagramUsername Kuralları:
-- Mekanın resmi Instagram hesabını bul (@ işareti olmadan sadece kullanıcı adı)
-- Türkiye'deki mekanların Instagram'ı genellikle mekan_ismi, mekanadi, mekanismi_sehir formatındadır
-- Örnek: "Şampiyon Kokoreç" → "sampiyonkokorec" veya "sampiyon_kokorec"
-- Bilinen popüler mekanların Instagram'ını ver. Emin olmadığın için null yaz.
-
-SADECE JSON ARRAY döndür, başka açıklama yazma."""
-
-            try:
-                model = get_genai_model()
-                if model:
-                    response = model.generate_content(batch_prompt)
-                    response_text = response.text.strip()
-
-                    # Güvenli JSON parse
-                    response_text = re.sub(r'```json\s*|\s*```', '', response_text)
-                    response_text = response_text.strip()
-
-                    try:
-                        ai_results = json.loads(response_text)
-                    except json.JSONDecodeError:
-                        match = re.search(r'\[.*\]', response_text, re.DOTALL)
-                        if match:
-                            ai_results = json.loads(match.group())
-                        else:
-                            print(f"⚠️ Sokak Lezzeti JSON parse edilemedi, fallback kullanılıyor", file=sys.stderr, flush=True)
-                            ai_results = []
-
-                    # AI sonuçlarını mekanlarla eşleştir
-                    ai_by_name = {r.get('name', '').lower(): r for r in ai_results}
-
-                    final_venues = []
-                    for venue_data in venues[:10]:
-                        ai_data = ai_by_name.get(venue_data['name'].lower(), {})
-
-                        venue = {
-                            'id': venue_data['id'],
-                            'name': venue_data['name'],
-                            'description': ai_data.get('description', venue_data['base_description']),
-                            'imageUrl': venue_data['imageUrl'],
-                            'category': 'Sokak Lezzeti',
-                            'vibeTags': ai_data.get('vibeTags', venue_data.get('vibeTags', ['#SokakLezzeti'])),
-                            'address': venue_data['address'],
-                            'priceRange': venue_data['priceRange'],
-                            'googleRating': venue_data.get('googleRating', 4.0),
-                            'googleReviewCount': venue_data.get('googleReviewCount', 0),
-                            'matchScore': venue_data['matchScore'],
-                            'noiseLevel': venue_data['noiseLevel'],
-                            'googleMapsUrl': venue_data['googleMapsUrl'],
-                            'googleReviews': venue_data.get('googleReviews', []),
-                            'website': venue_data.get('website', ''),
-                            'phoneNumber': venue_data.get('phoneNumber', ''),
-                            'weeklyHours': venue_data.get('weeklyHours', []),
-                            'isOpenNow': venue_data.get('isOpenNow', None),
-                            'foodType': venue_data.get('foodType', ''),
-                            'practicalInfo': ai_data.get('practicalInfo', {}),
-                            'atmosphereSummary': ai_data.get('atmosphereSummary', {
-                                'noiseLevel': 'Canlı',
-                                'lighting': 'Aydınlık',
-                                'privacy': 'Açık Alan',
-                                'energy': 'Enerjik',
-                                'idealFor': ['hızlı öğün', 'gece atıştırmalığı'],
-                                'notIdealFor': ['romantik akşam'],
-                                'oneLiner': 'Sokak lezzeti deneyimi sunan popüler bir mekan.'
-                            })
-                        }
-
-                        # Instagram username'i ekle (Gemini'dan)
-                        instagram_username = ai_data.get('instagramUsername')
-                        if instagram_username and instagram_username != 'null' and instagram_username is not None:
-                            venue['instagramUrl'] = f"https://instagram.com/{instagram_username}"
-                            venue['instagramEstimated'] = False  # Gemini buldu, doğrulanmış
-
-                        final_venues.append(venue)
-
-                    # Gemini Instagram bulamadıysa, Google CSE + tahmin ile bul
-                    for venue in final_venues:
-                        if not venue.get('instagramUrl'):
-                            instagram_url, is_verified = discover_instagram_url(
-                                venue_name=venue['name'],
-                                city=city,
-                                website=venue.get('website'),
-                                existing_instagram=None,
-                                district=selected_district,
-                                neighborhood=selected_neighborhood,
-                                return_verified=True
-                            )
-                            if instagram_url:
-                                venue['instagramUrl'] = instagram_url
-                                venue['instagramEstimated'] = not is_verified
-                                insta_status = "verified" if is_verified else "estimated"
-                                print(f"📸 Sokak Lezzeti Instagram ({insta_status}): {venue['name']} -> {instagram_url}", file=sys.stderr, flush=True)
-
-                    print(f"✅ Gemini ile {len(final_venues)} Sokak Lezzeti mekan zenginleştirildi", file=sys.stderr, flush=True)
-
-                    # ===== G&M VENUE'LARI MICHELIN ÖNCELİKLİ SIRALA VE BAŞA EKLE =====
-                    if gm_venues:
-                        # G&M mekanlarını Gemini ile zenginleştir
-                        enriched_gm = enrich_gm_venues_with_gemini(gm_venues, 'Sokak Lezzeti')
-
-                        # Hem G&M hem Michelin olan mekanlara Michelin badge ekle
-                        for gv in enriched_gm:
-                            michelin_check = is_michelin_restaurant(gv.get('name', ''))
-                            if michelin_check:
-                                gv['isMichelinStarred'] = True
-                                gv['michelinStars'] = michelin_check.get('stars', 0)
-                                gv['isBibGourmand'] = michelin_check.get('isBib', False)
-
-                        # Michelin > G&M sıralaması
-                        def michelin_gm_sort_key(venue):
-                            is_michelin = venue.get('isMichelinStarred', False)
-                            michelin_stars = venue.get('michelinStars', 0)
-                            is_bib = venue.get('isBibGourmand', False)
-                            gm_toques = venue.get('gaultMillauToques', 0) or 0
-                            rating = venue.get('googleRating', 0) or 0
-                            if is_michelin and michelin_stars > 0:
-                                return (0, -michelin_stars, -rating)
-                            elif is_bib:
-                                return (1, 0, -rating)
-                            else:
-                                return (2, -gm_toques, -rating)
-
-                        enriched_gm.sort(key=michelin_gm_sort_key)
-
-                        combined_result = []
-                        existing_ids = set()
-                        # 1. Önce G&M venue'larını ekle (Michelin öncelikli sıralanmış)
-                        for gv in enriched_gm:
-                            if len(combined_result) < 50:
-                                combined_result.append(gv)
-                                existing_ids.add(gv.get('id'))
-                        # 2. Sonra Gemini-enriched venue'ları ekle
-                        for fv in final_venues:
-                            if len(combined_result) < 50 and fv.get('id') not in existing_ids:
-                                combined_result.append(fv)
-                                existing_ids.add(fv.get('id'))
-                        michelin_in_gm = sum(1 for v in enriched_gm if v.get('isMichelinStarred'))
-                        print(f"🔀 HYBRID RESULT - G&M: {len(enriched_gm)} (Michelin: {michelin_in_gm}), Gemini: {len(final_venues)}, Combined: {len(combined_result)}", file=sys.stderr, flush=True)
-                        return Response(combined_result, status=status.HTTP_200_OK)
-                    return Response(final_venues, status=status.HTTP_200_OK)
-
-            except Exception as e:
-                print(f"❌ Gemini Sokak Lezzeti hatası: {e}", file=sys.stderr, flush=True)
-                # Fallback: Gemini olmadan mekanları döndür
-                for venue_data in venues:
-                    venue_data['description'] = venue_data.pop('base_description', venue_data.get('description', ''))
-                    venue_data['practicalInfo'] = {}
-                    venue_data['atmosphereSummary'] = {
-                        'noiseLevel': 'Canlı',
-                        'lighting': 'Aydınlık',
-                        'privacy': 'Açık Alan',
-                        'energy': 'Enerjik',
-                        'idealFor': ['hızlı öğün'],
-                        'notIdealFor': [],
-                        'oneLiner': 'Sokak lezzeti deneyimi sunan popüler bir mekan.'
-                    }
-
-        # ===== CACHE'E KAYDET (sadece API'den gelen yeni venue'lar) =====
-        if venues:
-            save_venues_to_cache(
-                venues=venues,
-                category_name='Sokak Lezzeti',
-                city=city,
-                district=selected_district,
-                neighborhood=selected_neighborhood
-            )
-
-        # ===== HYBRID: G&M + CACHE + API VENUE'LARINI BİRLEŞTİR =====
-        combined_venues = []
-        existing_ids = set()
-        existing_names = set()  # İsim bazlı duplicate kontrolü
-
-        # 1. Önce G&M venue'larını ekle (en yüksek öncelik)
-        for gv in gm_venues:
-            if len(combined_venues) < 50:
-                combined_venues.append(gv)
-                existing_ids.add(gv.get('id'))
-                existing_names.add(gv.get('name', '').lower().strip())
-
-        # 2. Sonra cache'ten gelenleri ekle (ID ve isim bazlı duplicate kontrolü)
-        for cv in cached_venues:
-            cv_name = cv.get('name', '').lower().strip()
-            if len(combined_venues) < 50 and cv.get('id') not in existing_ids and cv_name not in existing_names:
-                combined_venues.append(cv)
-                existing_ids.add(cv.get('id'))
-                existing_names.add(cv_name)
-
-        # 3. Son olarak API'den gelenleri ekle (ID ve isim bazlı duplicate kontrolü)
-        for av in venues:
-            av_name = av.get('name', '').lower().strip()
-            if len(combined_venues) < 50 and av.get('id') not in existing_ids and av_name not in existing_names:
-                combined_venues.append(av)
-                existing_ids.add(av.get('id'))
-                existing_names.add(av_name)
-
-        print(f"🔀 HYBRID RESULT - Sokak Lezzeti G&M: {len(gm_venues)}, Cache: {len(cached_venues)}, API: {len(venues)}, Combined: {len(combined_venues)}", file=sys.stderr, flush=True)
-        return Response(combined_venues, status=status.HTTP_200_OK)
-
-    except Exception as e:
-        print(f"❌ Street food generation error: {e}", file=sys.stderr, flush=True)
-        import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
-        return Response(
-            {'error': f'Sokak lezzetleri getirilirken hata: {str(e)}'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-
-
-def generate_specialty_coffee_places(location, filters, exclude_ids):
-    """3. Nesil Kahveci kategorisi için çoklu sorgu - farklı specialty coffee terimleriyle arama yaparak çeşitlilik sağla
-    Gemini ile practicalInfo, atmosphereSummary ve enriched description eklenir.
-    """
-    import json
-    import sys
-    import requests
-    import re
-
-    gmaps = get_gmaps_client()
-    city = location['city']
-    districts = location.get('districts', [])
-    neighborhoods = location.get('neighborhoods', [])
-    selected_district = districts[0] if districts else None
-    selected_neighborhood = neighborhoods[0] if neighborhoods else None
-
-    # ===== G&M VENUE'LARI ÖNCELİKLİ OLARAK ÇEK =====
-    exclude_ids_set = set(exclude_ids) if exclude_ids else set()
-    gm_venues = get_gm_venues_for_category(
-        category_id='23',
-        category_name='3. Nesil Kahveci',
-        city=city,
-        exclude_ids=exclude_ids_set,
-        district=selected_district
-    )
-    if gm_venues:
-        print(f"🏆 G&M - 3. Nesil Kahveci kategorisinde {len(gm_venues)} G&M mekan bulundu ({city})", file=sys.stderr, flush=True)
-        gm_place_ids = {v.get('id') for v in gm_venues if v.get('id')}
-        exclude_ids_set = exclude_ids_set | gm_place_ids
-
-    # ===== HYBRID CACHE SİSTEMİ =====
-    cached_venues, all_cached_ids = get_cached_venues_for_hybrid(
-        category_name='3. Nesil Kahveci',
-        city=city,
-        district=selected_district,
-        neighborhood=selected_neighborhood,
-        exclude_ids=exclude_ids_set,
-        limit=CACHE_VENUES_LIMIT
-    )
-    api_exclude_ids = exclude_ids_set | all_cached_ids
-    print(f"🔀 HYBRID - 3. Nesil Kahveci Cache: {len(cached_venues)}, API exclude: {len(api_exclude_ids)}", file=sys.stderr, flush=True)
-
-    # Lokasyon string'i oluştur
-    if selected_neighborhood:
-        search_location = f"{selected_neighborhood}, {selected_district}, {city}"
-    elif selected_district:
-        search_location = f"{selected_district}, {city}"
-    else:
-        search_location = city
-
-    print(f"☕ 3. Nesil Kahveci (Multi-Query): {search_location}", file=sys.stderr, flush=True)
-
-    # Her specialty coffee türü için ayrı sorgu - çeşitlilik sağlamak için
-    specialty_coffee_queries = [
-        ('specialty coffee', 'Specialty'),
-        ('third wave coffee', 'Third Wave'),
-        ('coffee roastery', 'Roastery'),
-        ('artisan coffee', 'Artisan'),
-        ('butik kahveci', 'Butik'),
-        ('filter coffee', 'Filter'),
-        ('pour over coffee', 'Pour Over'),
-    ]
-
-    venues = []
-    added_ids = set()
-
-    # Lokasyonun koordinatlarını al (location bias için)
-    location_lat, location_lng = None, None
-    try:
-        geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
-        geocode_params = {
-            "address": f"{search_location}, Turkey",
-            "key": settings.GOOGLE_MAPS_API_KEY
-        }
-        geocode_response = requests.get(geocode_url, params=geocode_params)
-        if geocode_response.status_code == 200:
-            geocode_data = geocode_response.json()
-            if geocode_data.get('results'):
-                location_coords = geocode_data['results'][0]['geometry']['location']
-                location_lat, location_lng = location_coords['lat'], location_coords['lng']
-                print(f"🗺️ 3. Nesil Kahveci location bias: {search_location} -> ({location_lat}, {location_lng})", file=sys.stderr, flush=True)
-    except Exception as e:
-        print(f"⚠️ Geocode hatası: {e}", file=sys.stderr, flush=True)
-
-    try:
-        # Koordinatlar yoksa arama yapamayız
-        if not location_lat or not location_lng:
-            print(f"⚠️ 3. Nesil Kahveci: Koordinat bulunamadı, arama yapılamıyor", file=sys.stderr, flush=True)
-            return Response([], status=status.HTTP_200_OK)
-
-        # Nearby Search API - kesin lokasyon filtrelemesi
-        nearby_url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
-
-        for query_term, coffee_type in specialty_coffee_queries:
-            try:
-                params = {
-                    "location": f"{location_lat},{location_lng}",
-                    "radius": 2000,  # 2km yarıçap - kesin filtreleme
-                    "type": "cafe",
-                    "keyword": query_term,
-                    "language": "tr",
-                    "key": settings.GOOGLE_MAPS_API_KEY
-                }
-
-                print(f"🔍 3. Nesil Kahveci Nearby Search: {query_term} @ {search_location}", file=sys.stderr, flush=True)
-
-                response = requests.get(nearby_url, params=params)
-
-                if response.status_code != 200:
-                    print(f"⚠️ API hatası ({query_term}): {response.status_code}", file=sys.stderr, flush=True)
-                    continue
-
-                places_data = response.json()
-                places = places_data.get('results', [])
-
-                # Pagination: 2. ve 3. sayfaları da al
-                for page_num in range(2, 4):
-                    next_page_token = places_data.get('next_page_token')
-                    if not next_page_token:
-                        break
-                    time.sleep(2)
-                    next_params = {"pagetoken": next_page_token, "key": settings.GOOGLE_MAPS_API_KEY}
-                    next_response = requests.get(nearby_url, params=next_params)
-                    if next_response.status_code == 200:
-                        next_data = next_response.json()
-                        places.extend(next_data.get('results', []))
-                        places_data = next_data
-
-                for place in places:
-                    place_id = place.get('place_id', '')
-                    place_name = place.get('name', '')
-                    # Nearby Search'te vicinity, Text Search'te formatted_address
-                    place_address = place.get('vicinity', '') or place.get('formatted_address', '')
-                    place_rating = place.get('rating', 0)
-                    place_review_count = place.get('user_ratings_total', 0)
-                    place_types = place.get('types', [])
-
-                    # Daha önce eklendiyse atla
-                    if place_id in added_ids:
-                        continue
-
-                    # Exclude IDs kontrolü
-                    if place_id in exclude_ids_set:
-                        print(f"⏭️ EXCLUDE - {place_name}: zaten gösterildi", file=sys.stderr, flush=True)
-                        continue
-
-                    # Kalıcı/geçici kapalı mekan kontrolü
-                    business_status = place.get('business_status', 'OPERATIONAL')
-                    if business_status in ['CLOSED_PERMANENTLY', 'CLOSED_TEMPORARILY']:
-                        print(f"❌ KAPALI MEKAN REJECT - {place_name}: {business_status}", file=sys.stderr, flush=True)
-                        continue
-
-                    # Rating filtresi - 4.0 ve üzeri (kahveciler için daha düşük)
-                    if place_rating < 4.0:
-                        print(f"❌ RATING REJECT - {place_name}: {place_rating} < 4.0", file=sys.stderr, flush=True)
-                        continue
-
-                    # Review count filtresi - minimum 10
-                    if place_review_count < 10:
-                        print(f"❌ REVIEW COUNT REJECT - {place_name}: {place_review_count} < 10", file=sys.stderr, flush=True)
-                        continue
-
-                    # NOT: İlçe kontrolü kaldırıldı - Nearby Search zaten koordinat + radius bazlı
-                    # vicinity alanı ilçe adını içermiyor (sadece mahalle/sokak)
-
-                    # Starbucks, zincir kahveciler filtresi - bunları dahil etme
-                    place_name_lower = place_name.lower().replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                    chain_keywords = ['starbucks', 'kahve dunyasi', 'tchibo', 'gloria jeans', 'caribou', 'costa coffee', 'dunkin', 'mcdonald', 'burger king']
-
-                    if any(k in place_name_lower for k in chain_keywords):
-                        print(f"❌ CHAIN REJECT - {place_name}", file=sys.stderr, flush=True)
-                        continue
-
-                    # Fotoğraf URL'si (Legacy API)
-                    photo_url = None
-                    if place.get('photos') and len(place['photos']) > 0:
-                        photo_ref = place['photos'][0].get('photo_reference', '')
-                        if photo_ref:
-                            photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
-
-                    # Google Maps URL
-                    maps_query = urllib.parse.quote(f"{place_name} {place_address}")
-                    google_maps_url = f"https://www.google.com/maps/search/?api=1&query={maps_query}"
-
-                    # Fiyat aralığı
-                    price_level = place.get('price_level', 2)
-                    price_map = {0: '$', 1: '$', 2: '$$', 3: '$$$', 4: '$$$$'}
-                    price_range = price_map.get(price_level, '$$')
-
-                    # Place Details API ile yorumları ve ek bilgileri çek
-                    place_details = get_place_details_extended(gmaps, place_id) if gmaps and place_id else {'reviews': [], 'foodServices': {}}
-                    google_reviews = place_details.get('reviews', [])
-
-                    # ===== ESKİ YORUM KONTROLÜ =====
-                    if place_review_count < 50 and google_reviews:
-                        from datetime import datetime, timedelta
-                        seven_months_ago = datetime.now() - timedelta(days=210)
-                        latest_review_time = None
-                        for review in google_reviews:
-                            review_timestamp = review.get('time')
-                            if review_timestamp:
-                                try:
-                                    review_time = datetime.fromtimestamp(review_timestamp)
-                                    if latest_review_time is None or review_time > latest_review_time:
-                                        latest_review_time = review_time
-                                except:
-                                    pass
-                        if latest_review_time and latest_review_time < seven_months_ago:
-                            print(f"❌ ESKİ YORUM REJECT - {place_name}: son yorum {latest_review_time.strftime('%Y-%m-%d')}", file=sys.stderr, flush=True)
-                            continue
-
-                    # ===== KAPANMIŞ MEKAN KONTROLÜ (YORUM İÇERİĞİ) =====
-                    if google_reviews:
-                        closed_keywords = ['kapandı', 'kapandi', 'kapanmış', 'kapanmis', 'kapatıldı', 'kapatildi', 'kapatılmış', 'kapatilmis',
-                                          'kalıcı olarak kapan', 'kalici olarak kapan', 'kalıcı olarak kapatıl', 'kalici olarak kapatil',
-                                          'artık kapalı', 'artik kapali', 'permanently closed', 'yerine açıldı', 'yerine acildi', 'burası artık', 'burasi artik']
-                        is_closed = False
-                        for review in google_reviews[:5]:
-                            review_text = review.get('text', '').lower().replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                            for kw in closed_keywords:
-                                if kw.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u') in review_text:
-                                    is_closed = True
-                                    print(f"❌ KAPANMIŞ MEKAN REJECT - {place_name}: yorumda '{kw}' bulundu", file=sys.stderr, flush=True)
-                                    break
-                            if is_closed:
-                                break
-                        if is_closed:
-                            continue
-
-                    venue = {
-                        'id': place_id,
-                        'name': place_name,
-                        'tagline': f'{coffee_type} Coffee',
-                        'description': f'{place_name} - Nitelikli kahve deneyimi sunan özel kahveci.',
-                        'address': place_address,
-                        'priceRange': price_range,
-                        'imageUrl': photo_url,
-                        'googleMapsUrl': google_maps_url,
-                        'googleRating': place_rating,
-                        'googleReviewCount': place_review_count,
-                        'coffeeType': coffee_type,
-                        'googleReviews': google_reviews,
-                        'category': '3. Nesil Kahveci',
-                        'matchScore': 85,
-                        'noiseLevel': 'Sakin',
-                        'vibeTags': ['#SpecialtyCoffee', '#ThirdWave', '#Kahveci'],
-                    }
-
-                    venues.append(venue)
-                    added_ids.add(place_id)
-                    print(f"✅ Added: {place_name} ({coffee_type}) - {len(google_reviews)} reviews", file=sys.stderr, flush=True)
-
-                    # Her sorgu türünden en fazla 3 mekan al
-                    if len([v for v in venues if v.get('coffeeType') == coffee_type]) >= 3:
-                        break
-
-            except Exception as e:
-                print(f"⚠️ Query error ({query_term}): {e}", file=sys.stderr, flush=True)
-                continue
-
-        print(f"☕ 3. Nesil Kahveci toplamda {len(venues)} mekan bulundu", file=sys.stderr, flush=True)
-
-        # ===== GEMİNİ İLE ZENGİNLEŞTİRME =====
-        if venues:
-            try:
-                venue_names = [v['name'] for v in venues[:10]]
-                gemini_prompt = f"""Sen bir specialty coffee uzmanısın. Aşağıdaki kahveciler için detaylı Türkçe bilgiler ver.
-
-Kahveciler: {', '.join(venue_names)}
-Şehir: {city}
-
-Her kahveci için JSON formatında şu bilgileri ver:
-{{
-  "name": "Mekan adı",
-  "instagramUsername": "Instagram kullanıcı adı (@ olmadan, bilmiyorsan null)",
-  "description": "Kahveci hakkında kısa açıklama (max 150 karakter)",
-  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
-  "practicalInfo": {{
-    "mustTry": "Mutlaka denenmesi gereken içecek/yiyecek",
-    "headsUp": "Dikkat edilmesi gereken bir şey varsa (yoksa null)"
-  }},
-  "atmosphereSummary": {{
-    "noiseLevel": "Sessiz/Sakin/Canlı/Gürültülü",
-    "lighting": "Loş/Yumuşak/Aydınlık",
-    "privacy": "Mahrem/Yarı Açık/Açık Alan",
-    "energy": "Dingin/Dengeli/Enerjik",
-    "idealFor": ["kahve molası", "çalışma", "arkadaş buluşması"],
-    "notIdealFor": ["iş yemeği", "aile yemeği"],
-    "oneLiner": "Tek cümlelik atmosfer özeti"
-  }}
-}}
-
-Kahveci için uygun vibeTags örnekleri: #SpecialtyCoffee, #V60, #Chemex, #FilterKahve, #Espresso, #LatteSanatı, #KahveMolası, #ÇalışmaDostu, #SakinOrtam, #KitapKahve
-
-ÖNEMLİ: Instagram kullanıcı adını biliyorsan yaz (örn: "kronotropcoffee", "petraroastingco"), bilmiyorsan null yaz.
-
-SADECE JSON ARRAY döndür, başka açıklama yazma."""
-
-                model = get_genai_model()
-                if model:
-                    gemini_response = model.generate_content(gemini_prompt)
-                    response_text = gemini_response.text.strip()
-
-                    # JSON parse
-                    response_text = re.sub(r'```json\s*|\s*```', '', response_text)
-                    response_text = response_text.strip()
-
-                    try:
-                        ai_results = json.loads(response_text)
-                    except json.JSONDecodeError:
-                        match = re.search(r'\[.*\]', response_text, re.DOTALL)
-                        if match:
-                            ai_results = json.loads(match.group())
-                        else:
-                            print(f"⚠️ 3. Nesil Kahveci JSON parse edilemedi", file=sys.stderr, flush=True)
-                            ai_results = []
-
-                    # AI sonuçlarını mekanlarla eşleştir
-                    ai_by_name = {r.get('name', '').lower(): r for r in ai_results}
-
-                    for venue in venues:
-                        ai_data = ai_by_name.get(venue['name'].lower(), {})
-                        if ai_data:
-                            venue['description'] = ai_data.get('description', venue.get('description', ''))
-                            venue['vibeTags'] = ai_data.get('vibeTags', venue.get('vibeTags', []))
-                            venue['practicalInfo'] = ai_data.get('practicalInfo', {})
-                            venue['atmosphereSummary'] = ai_data.get('atmosphereSummary', {})
-                            # Instagram username'i ekle
-                            instagram_username = ai_data.get('instagramUsername')
-                            if instagram_username and instagram_username != 'null' and instagram_username is not None:
-                                venue['instagramUrl'] = f"https://instagram.com/{instagram_username}"
-                                venue['instagramEstimated'] = False  # Gemini buldu, doğrulanmış
-
-                    # Gemini Instagram bulamadıysa, Google CSE + tahmin ile bul
-                    for venue in venues:
-                        if not venue.get('instagramUrl'):
-                            # discover_instagram_url artık Google Search'ü öncelikli kullanıyor
-                            # ve doğrulama bilgisini de dönüyor
-                            instagram_url, is_verified = discover_instagram_url(
-                                venue_name=venue['name'],
-                                city=city,
-                                website=venue.get('website'),
-                                existing_instagram=None,
-                                district=selected_district,
-                                neighborhood=selected_neighborhood,
-                                return_verified=True
-                            )
-                            if instagram_url:
-                                venue['instagramUrl'] = instagram_url
-                                venue['instagramEstimated'] = not is_verified  # Doğrulanmamışsa True
-                                insta_status = "verified" if is_verified else "estimated"
-                                print(f"📸 3. Nesil Kahveci Instagram ({insta_status}): {venue['name']} -> {instagram_url}", file=sys.stderr, flush=True)
-
-                    print(f"✅ Gemini enrichment completed for {len(venues)} venues", file=sys.stderr, flush=True)
-
-            except Exception as e:
-                print(f"⚠️ Gemini enrichment error: {e}", file=sys.stderr, flush=True)
-
-        # ===== CACHE'E KAYDET =====
-        if venues:
-            save_venues_to_cache(
-                venues=venues,
-                category_name='3. Nesil Kahveci',
-                city=city,
-                district=selected_district,
-                neighborhood=selected_neighborhood
-            )
-
-        # ===== HYBRID: G&M + CACHE + API VENUE'LARINI BİRLEŞTİR =====
-        combined_venues = []
-        existing_ids = set()
-        existing_names = set()  # İsim bazlı duplicate kontrolü
-
-        # 1. Önce G&M venue'larını ekle
-        for gv in gm_venues:
-            if len(combined_venues) < 50:
-                combined_venues.append(gv)
-                existing_ids.add(gv.get('id'))
-                existing_names.add(gv.get('name', '').lower().strip())
-
-        # 2. Sonra cache'ten gelenleri ekle (ID ve isim bazlı duplicate kontrolü)
-        for cv in cached_venues:
-            cv_name = cv.get('name', '').lower().strip()
-            if len(combined_venues) < 50 and cv.get('id') not in existing_ids and cv_name not in existing_names:
-                combined_venues.append(cv)
-                existing_ids.add(cv.get('id'))
-                existing_names.add(cv_name)
-
-        # 3. Son olarak API'den gelenleri ekle (ID ve isim bazlı duplicate kontrolü)
-        for av in venues:
-            av_name = av.get('name', '').lower().strip()
-            if len(combined_venues) < 50 and av.get('id') not in existing_ids and av_name not in existing_names:
-                combined_venues.append(av)
-                existing_ids.add(av.get('id'))
-                existing_names.add(av_name)
-
-        print(f"🔀 HYBRID RESULT - 3. Nesil Kahveci G&M: {len(gm_venues)}, Cache: {len(cached_venues)}, API: {len(venues)}, Combined: {len(combined_venues)}", file=sys.stderr, flush=True)
-        return Response(combined_venues, status=status.HTTP_200_OK)
-
-    except Exception as e:
-        print(f"❌ Specialty coffee generation error: {e}", file=sys.stderr, flush=True)
-        import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
-        return Response(
-            {'error': f'Specialty coffee mekanları getirilirken hata: {str(e)}'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-
-
-def generate_party_venues(location, filters, exclude_ids):
-    """Eğlence & Parti kategorisi için çoklu sorgu - her mekan türü için ayrı arama yaparak çeşitlilik sağla
-    Gemini ile practicalInfo, atmosphereSummary ve enriched description eklenir.
-    """
-    import json
-    import sys
-    import requests
-    import re
-
-    gmaps = get_gmaps_client()
-    city = location['city']
-    districts = location.get('districts', [])
-    neighborhoods = location.get('neighborhoods', [])
-    selected_district = districts[0] if districts else None
-    selected_neighborhood = neighborhoods[0] if neighborhoods else None
-
-    # ===== HYBRID CACHE SİSTEMİ =====
-    exclude_ids_set = set(exclude_ids) if exclude_ids else set()
-    cached_venues, all_cached_ids = get_cached_venues_for_hybrid(
-        category_name='Eğlence & Parti',
-        city=city,
-        district=selected_district,
-        neighborhood=selected_neighborhood,
-        exclude_ids=exclude_ids_set,
-        limit=CACHE_VENUES_LIMIT
-    )
-    api_exclude_ids = exclude_ids_set | all_cached_ids
-    print(f"🔀 HYBRID - Eğlence & Parti Cache: {len(cached_venues)}, API exclude: {len(api_exclude_ids)}", file=sys.stderr, flush=True)
-
-    # Lokasyon string'i oluştur
-    if selected_neighborhood:
-        search_location = f"{selected_neighborhood}, {selected_district}, {city}"
-    elif selected_district:
-        search_location = f"{selected_district}, {city}"
-    else:
-        search_location = city
-
-    print(f"🪩 Eğlence & Parti (Multi-Query): {search_location}", file=sys.stderr, flush=True)
-
-    # Her mekan türü için ayrı sorgu - dans, DJ, parti odaklı
-    party_queries = [
-        ('nightclub gece kulübü club', 'Gece Kulübü'),
-        ('DJ party club', 'DJ & Party'),
-        ('beach club party', 'Beach Club'),
-        ('dance club elektronik müzik', 'Dans Kulübü'),
-        ('rooftop bar party', 'Rooftop'),
-        ('club lounge DJ', 'Lounge Club'),
-    ]
-
-    venues = []
-    added_ids = set()
-
-    # Pavyon/konsomatris filtresi için keywords
-    # NOT: "gazino" kaldırıldı - Türk kültüründe geleneksel eğlence mekanları (canlı müzik, fasıl)
-    pavyon_keywords = [
-        'pavyon', 'konsomatris', 'casino', 'kabare', 'cabaret',
-        'gece alemi', 'eglence merkezi', 'dans bar', 'show bar',
-        'strip', 'striptiz', 'hostess', 'escort', 'masaj salonu',
-        'gentlemen', 'club 18', 'club18', 'adult', 'yetiskin'
-    ]
-
-    # Dans kursu/topluluk filtresi için keywords
-    dance_school_keywords = [
-        'dans kursu', 'dans okulu', 'dans toplulugu', 'dans atolyesi',
-        'dance school', 'dance studio', 'dance class', 'dance academy',
-        'salsa kursu', 'tango kursu', 'bale', 'ballet', 'zumba',
-        'latin dans', 'halk danslari', 'folklor', 'halk dansi', 'tango egitimi',
-        'dans egitimi', 'dans dersi', 'swing', 'bachata', 'kizomba',
-        'ksk-d', 'kskd'  # Karşıyaka Spor Kulübü Dans
-    ]
-
-    # Sahil/Plaj/Park filtresi - açık alan mekanlar parti mekanı değil
-    outdoor_location_keywords = [
-        'sahil', 'sahili', 'plaj', 'plaji', 'beach', 'koy', 'koyu',
-        'park', 'parki', 'bahce', 'bahcesi', 'garden',
-        'kordon', 'iskele', 'marina', 'liman'
-    ]
-    outdoor_location_types = ['park', 'natural_feature', 'tourist_attraction', 'beach']
-
-    # Müzik okulu/merkezi filtresi - parti mekanı değil
-    music_school_keywords = [
-        'muzik merkezi', 'müzik merkezi', 'muzik okulu', 'müzik okulu',
-        'konservatuar', 'conservatory', 'music school', 'music center',
-        'muzik kursu', 'müzik kursu', 'enstruman', 'enstrüman',
-        'piyano kursu', 'gitar kursu', 'keman kursu', 'bateri kursu',
-        'ses egitimi', 'vokal', 'koro', 'choir'
-    ]
-
-    # Parti malzemeleri dükkanı filtresi - eğlence mekanı değil, mağaza
-    party_store_keywords = [
-        'parti malzemeleri', 'parti malzemesi', 'party malzemeleri',
-        'dogum gunu malzemeleri', 'doğum günü malzemeleri', 'dogum gunu',
-        'parti evi', 'party evi', 'party store', 'party shop',
-        'balon', 'baloncu', 'balloon', 'parti susleme', 'parti süsleme',
-        'kostum', 'kostüm', 'costume', 'maske', 'parti aksesuar',
-        'parti dekor', 'dekorasyon malzemesi', 'kutlama malzemeleri'
-    ]
-    party_store_types = ['store', 'shopping_mall', 'home_goods_store', 'furniture_store']
-
-    # Lokasyonun koordinatlarını al (location bias için)
-    location_lat, location_lng = None, None
-    try:
-        geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
-        geocode_params = {
-            "address": f"{search_location}, Turkey",
-            "key": settings.GOOGLE_MAPS_API_KEY
-        }
-        geocode_response = requests.get(geocode_url, params=geocode_params)
-        if geocode_response.status_code == 200:
-            geocode_data = geocode_response.json()
-            if geocode_data.get('results'):
-                location_coords = geocode_data['results'][0]['geometry']['location']
-                location_lat, location_lng = location_coords['lat'], location_coords['lng']
-                print(f"🗺️ Eğlence & Parti location bias: {search_location} -> ({location_lat}, {location_lng})", file=sys.stderr, flush=True)
-    except Exception as e:
-        print(f"⚠️ Geocode hatası: {e}", file=sys.stderr, flush=True)
-
-    try:
-        # Koordinatlar yoksa arama yapamayız
-        if not location_lat or not location_lng:
-            print(f"⚠️ Eğlence & Parti: Koordinat bulunamadı, arama yapılamıyor", file=sys.stderr, flush=True)
-            return Response([], status=status.HTTP_200_OK)
-
-        # Nearby Search API - kesin lokasyon filtrelemesi
-        nearby_url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
-
-        for query_term, venue_type in party_queries:
-            try:
-                params = {
-                    "location": f"{location_lat},{location_lng}",
-                    "radius": 2000,  # 2km yarıçap - kesin filtreleme
-                    "type": "night_club",
-                    "keyword": query_term,
-                    "language": "tr",
-                    "key": settings.GOOGLE_MAPS_API_KEY
-                }
-
-                print(f"🔍 Eğlence & Parti Nearby Search: {query_term} @ {search_location}", file=sys.stderr, flush=True)
-
-                response = requests.get(nearby_url, params=params)
-
-                if response.status_code != 200:
-                    print(f"⚠️ API hatası ({query_term}): {response.status_code}", file=sys.stderr, flush=True)
-                    continue
-
-                places_data = response.json()
-                places = places_data.get('results', [])
-
-                # Pagination: 2. ve 3. sayfaları da al
-                for page_num in range(2, 4):
-                    next_page_token = places_data.get('next_page_token')
-                    if not next_page_token:
-                        break
-                    time.sleep(2)
-                    next_params = {"pagetoken": next_page_token, "key": settings.GOOGLE_MAPS_API_KEY}
-                    next_response = requests.get(nearby_url, params=next_params)
-                    if next_response.status_code == 200:
-                        next_data = next_response.json()
-                        places.extend(next_data.get('results', []))
-                        places_data = next_data
-
-                for place in places:
-                    place_id = place.get('place_id', '')
-                    place_name = place.get('name', '')
-                    # Nearby Search'te vicinity, Text Search'te formatted_address
-                    place_address = place.get('vicinity', '') or place.get('formatted_address', '')
-                    place_rating = place.get('rating', 0)
-                    place_review_count = place.get('user_ratings_total', 0)
-                    place_types = place.get('types', [])
-
-                    # Daha önce eklendiyse atla
-                    if place_id in added_ids:
-                        continue
-
-                    # Exclude IDs kontrolü
-                    if place_id in exclude_ids:
-                        print(f"⏭️ EXCLUDE - {place_name}: zaten gösterildi", file=sys.stderr, flush=True)
-                        continue
-
-                    # Kalıcı/geçici kapalı mekan kontrolü (Legacy API: business_status alanı)
-                    business_status = place.get('business_status', 'OPERATIONAL')
-                    if business_status in ['CLOSED_PERMANENTLY', 'CLOSED_TEMPORARILY']:
-                        print(f"❌ KAPALI MEKAN REJECT - {place_name}: {business_status}", file=sys.stderr, flush=True)
-                        continue
-
-                    # Yorum kontrolü şimdilik atlıyoruz - yorumlar daha sonra alınacak
-
-                    # NOT: İlçe kontrolü kaldırıldı - Nearby Search zaten koordinat + radius bazlı
-                    # vicinity alanı ilçe adını içermiyor (sadece mahalle/sokak)
-
-                    # Pavyon/konsomatris filtresi
-                    place_name_lower = place_name.lower().replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                    place_types_str = ' '.join(place_types).lower()
-
-                    is_pavyon_name = any(keyword in place_name_lower for keyword in pavyon_keywords)
-                    is_pavyon_type = any(keyword in place_types_str for keyword in pavyon_keywords)
-
-                    if is_pavyon_name or is_pavyon_type:
-                        print(f"❌ PAVYON REJECT - {place_name}", file=sys.stderr, flush=True)
-                        continue
-
-                    # Dans kursu/topluluk filtresi
-                    is_dance_school = any(keyword in place_name_lower for keyword in dance_school_keywords)
-                    dance_types = ['dance_studio', 'dance_school', 'gym', 'fitness_center']
-                    is_dance_type = any(t in place_types_str for t in dance_types)
-
-                    if is_dance_school or (is_dance_type and 'bar' not in place_types_str and 'night_club' not in place_types_str):
-                        print(f"❌ DANS KURSU REJECT - {place_name}", file=sys.stderr, flush=True)
-                        continue
-
-                    # Müzik okulu/merkezi filtresi
-                    is_music_school = any(keyword in place_name_lower for keyword in music_school_keywords)
-                    if is_music_school:
-                        print(f"❌ MÜZİK OKULU REJECT - {place_name}", file=sys.stderr, flush=True)
-                        continue
-
-                    # Parti malzemeleri dükkanı filtresi - eğlence mekanı değil, mağaza
-                    is_party_store_by_name = any(keyword in place_name_lower for keyword in party_store_keywords)
-                    is_party_store_by_type = any(t in place_types_str for t in party_store_types) and not any(t in place_types_str for t in ['bar', 'night_club', 'restaurant'])
-
-                    if is_party_store_by_name or (is_party_store_by_type and 'malzeme' in place_name_lower):
-                        print(f"❌ PARTİ MALZEMELERİ DÜKKANI REJECT - {place_name}: mağaza, eğlence mekanı değil", file=sys.stderr, flush=True)
-                        continue
-
-                    # Sahil/Plaj/Park filtresi - açık alan mekanlar parti mekanı değil (beach club hariç)
-                    is_outdoor_by_name = any(keyword in place_name_lower for keyword in outdoor_location_keywords)
-                    is_outdoor_by_type = any(t in place_types_str for t in outdoor_location_types)
-                    has_club_keyword = 'club' in place_name_lower or 'kulup' in place_name_lower or 'kulüp' in place_name_lower
-
-                    # Beach club, plaj club gibi mekanlar OK - sadece "sahil", "plaj" gibi açık alanlar reject
-                    if (is_outdoor_by_name or is_outdoor_by_type) and not has_club_keyword and 'bar' not in place_types_str and 'night_club' not in place_types_str:
-                        print(f"❌ SAHİL/PARK REJECT - {place_name}: açık alan, parti mekanı değil", file=sys.stderr, flush=True)
-                        continue
-
-                    # Parti/eğlence mekanı değilse filtrele (sade restoran, kafe, birahaneler)
-                    # Öncelik: night_club, beach, club, lounge, DJ içeren mekanlar
-                    party_positive_types = ['night_club', 'casino']
-                    party_positive_keywords = ['club', 'lounge', 'dj', 'party', 'disco', 'gece', 'beach', 'plaj']
-                    non_party_types = ['restaurant', 'cafe', 'meal_takeaway', 'bakery']
-
-                    is_party_type = any(t in place_types_str for t in party_positive_types)
-                    has_party_keyword = any(k in place_name_lower for k in party_positive_keywords)
-                    is_just_restaurant = any(t in place_types_str for t in non_party_types) and not is_party_type and not has_party_keyword
-
-                    # Sadece restoran/kafe ise ve parti keyword'ü yoksa reddet
-                    if is_just_restaurant and 'bar' not in place_types_str:
-                        print(f"❌ RESTORAN/KAFE REJECT - {place_name}: parti mekanı değil", file=sys.stderr, flush=True)
-                        continue
-
-                    # Rating filtresi - 3.5 ve üzeri (beach club'lar için esnek)
-                    if place_rating < 3.5:
-                        print(f"❌ RATING REJECT - {place_name}: {place_rating} < 3.5", file=sys.stderr, flush=True)
-                        continue
-
-                    # Review count filtresi - minimum 5
-                    if place_review_count < 5:
-                        print(f"❌ REVIEW COUNT REJECT - {place_name}: {place_review_count} < 5", file=sys.stderr, flush=True)
-                        continue
-
-                    # Tekel/Market filtresi
-                    tekel_keywords = ['tekel', 'market', 'bakkal', 'büfe', 'süpermarket', 'grocery', 'liquor store', 'convenience']
-                    tekel_types = ['liquor_store', 'convenience_store', 'grocery_store', 'supermarket']
-
-                    if any(t in place_types_str for t in tekel_types) or any(k in place_name_lower for k in tekel_keywords):
-                        print(f"❌ TEKEL REJECT - {place_name}", file=sys.stderr, flush=True)
-                        continue
-
-                    # Hizmet firması filtresi (DJ team, organizasyon vb.)
-                    service_keywords = [
-                        'dj team', 'dj hizmeti', 'dj kiralama', 'düğün dj', 'dugun dj',
-                        'organizasyon', 'event planner', 'etkinlik', 'after party',
-                        'ses sistemi', 'ışık sistemi', 'isik sistemi', 'sahne kiralama',
-                        'catering', 'ikram hizmeti', 'parti organizasyon'
-                    ]
-                    service_types = ['event_planner', 'wedding_service', 'catering_service']
-
-                    is_service_by_name = any(keyword in place_name_lower for keyword in service_keywords)
-                    is_service_by_type = any(stype in place_types for stype in service_types)
-
-                    # "DJ" kelimesi + night_club/bar tipi yoksa hizmet firması
-                    has_dj_in_name = 'dj' in place_name_lower
-                    is_actual_venue = any(t in place_types for t in ['night_club', 'bar', 'restaurant', 'cafe'])
-
-                    if is_service_by_name or is_service_by_type or (has_dj_in_name and not is_actual_venue):
-                        print(f"❌ HİZMET FİRMASI REJECT - {place_name}: mekan değil hizmet firması", file=sys.stderr, flush=True)
-                        continue
-
-                    # Fotoğraf URL'si (Legacy API)
-                    photo_url = None
-                    if place.get('photos') and len(place['photos']) > 0:
-                        photo_ref = place['photos'][0].get('photo_reference', '')
-                        if photo_ref:
-                            photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
-
-                    # Google Maps URL
-                    maps_query = urllib.parse.quote(f"{place_name} {place_address}")
-                    google_maps_url = f"https://www.google.com/maps/search/?api=1&query={maps_query}"
-
-                    # Fiyat aralığı (Legacy API: 0-4 integer)
-                    price_level = place.get('price_level', 2)
-                    price_map = {0: '$$', 1: '$$', 2: '$$', 3: '$$$', 4: '$$$$'}
-                    price_range = price_map.get(price_level, '$$')
-
-                    # Place Details ile yorumları al
-                    google_reviews = get_place_reviews(gmaps, place_id) if place_id else []
-
-                    # ===== ESKİ YORUM KONTROLÜ =====
-                    if place_review_count < 50 and google_reviews:
-                        from datetime import datetime, timedelta
-                        seven_months_ago = datetime.now() - timedelta(days=210)
-                        latest_review_time = None
-                        for review in google_reviews:
-                            review_timestamp = review.get('time')
-                            if review_timestamp:
-                                try:
-                                    review_time = datetime.fromtimestamp(review_timestamp)
-                                    if latest_review_time is None or review_time > latest_review_time:
-                                        latest_review_time = review_time
-                                except:
-                                    pass
-                        if latest_review_time and latest_review_time < seven_months_ago:
-                            print(f"❌ ESKİ YORUM REJECT - {place_name}: son yorum {latest_review_time.strftime('%Y-%m-%d')}", file=sys.stderr, flush=True)
-                            continue
-
-                    # ===== KAPANMIŞ MEKAN KONTROLÜ (YORUM İÇERİĞİ) =====
-                    if google_reviews:
-                        closed_keywords = ['kapandı', 'kapandi', 'kapanmış', 'kapanmis', 'kapatıldı', 'kapatildi', 'kapatılmış', 'kapatilmis',
-                                          'kalıcı olarak kapan', 'kalici olarak kapan', 'kalıcı olarak kapatıl', 'kalici olarak kapatil',
-                                          'artık kapalı', 'artik kapali', 'permanently closed', 'yerine açıldı', 'yerine acildi', 'burası artık', 'burasi artik']
-                        is_closed = False
-                        for review in google_reviews[:5]:
-                            review_text = review.get('text', '').lower().replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                            for kw in closed_keywords:
-                                if kw.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u') in review_text:
-                                    is_closed = True
-                                    print(f"❌ KAPANMIŞ MEKAN REJECT - {place_name}: yorumda '{kw}' bulundu", file=sys.stderr, flush=True)
-                                    break
-                            if is_closed:
-                                break
-                        if is_closed:
-                            continue
-
-                    # Yorumlarda parti keyword'leri sayısı ve tüm yorum metni
-                    party_keyword_matches = 0
-                    all_review_text = ' '.join([r.get('text', '').lower() for r in google_reviews])
-                    for review in google_reviews:
-                        review_text = review.get('text', '').lower()
-                        if any(kw in review_text for kw in ['parti', 'party', 'dj', 'eğlence', 'dans', 'dance', 'canlı müzik', 'gece']):
-                            party_keyword_matches += 1
-
-                    # Bonus puan: Yorumlarda parti keyword'leri varsa
-                    party_bonus = min(15, party_keyword_matches * 3)  # Her keyword için +3, max +15
-
-                    # Vibe tags
-                    vibe_tags = ['#Eğlence', f'#{venue_type.replace(" ", "")}', '#GeceHayatı']
-                    if 'beach' in query_term.lower():
-                        vibe_tags.append('#BeachClub')
-
-                    # Yorumlarda DJ/canlı müzik varsa tag ekle
-                    if 'dj' in all_review_text:
-                        vibe_tags.append('#DJ')
-                    if 'canlı müzik' in all_review_text or 'canli muzik' in all_review_text or 'live music' in all_review_text:
-                        vibe_tags.append('#CanlıMüzik')
-                    if 'dans' in all_review_text or 'dance' in all_review_text:
-                        vibe_tags.append('#Dans')
-
-                    # Çalışma saatleri (Legacy API)
-                    opening_hours = place.get('opening_hours', {})
-                    hours_list = opening_hours.get('weekday_text', [])
-                    hours_text = hours_list[0] if hours_list else ''
-                    is_open_now = opening_hours.get('open_now', None)
-
-                    venue = {
-                        'id': place_id,
-                        'name': place_name,
-                        'base_description': f"{place_name}, {search_location} bölgesinin popüler {venue_type.lower()} mekanlarından biri.",
-                        'imageUrl': photo_url or 'https://images.unsplash.com/photo-1566737236500-c8ac43014a67?w=800',
-                        'category': 'Eğlence & Parti',
-                        'vibeTags': vibe_tags,
-                        'address': place_address,
-                        'priceRange': price_range,
-                        'googleRating': place_rating,
-                        'googleReviewCount': place_review_count,
-                        'googleReviews': google_reviews,
-                        'google_reviews': google_reviews,  # Gemini için
-                        'matchScore': min(98, int(place_rating * 18 + min(place_review_count / 100, 15) + party_bonus)),
-                        'noiseLevel': 75,
-                        'googleMapsUrl': google_maps_url,
-                        'website': '',  # Legacy API textsearch'ta website gelmez
-                        'phoneNumber': '',  # Legacy API textsearch'ta telefon gelmez
-                        'hours': hours_text,
-                        'weeklyHours': hours_list,
-                        'isOpenNow': is_open_now,
-                        'venueType': venue_type
-                    }
-
-                    venues.append(venue)
-                    added_ids.add(place_id)
-                    bonus_info = f" [+{party_bonus} parti bonus]" if party_bonus > 0 else ""
-                    print(f"✅ EKLENDI - {place_name} ({venue_type}): ⭐{place_rating} ({place_review_count} yorum){bonus_info}", file=sys.stderr, flush=True)
-
-            except Exception as e:
-                print(f"⚠️ {query_term} sorgusu hatası: {e}", file=sys.stderr, flush=True)
-                continue
-
-        # Puana ve yorum sayısına göre sırala
-        venues.sort(key=lambda x: (x['googleRating'], x['googleReviewCount']), reverse=True)
-
-        print(f"🪩 Toplam {len(venues)} eğlence mekanı bulundu, Gemini ile zenginleştiriliyor...", file=sys.stderr, flush=True)
-
-        # Gemini ile practicalInfo ve atmosphereSummary ekle
-        if venues:
-            # Pratik bilgi içeren yorumları öncelikli seç
-            practical_keywords = ['otopark', 'park', 'vale', 'valet', 'rezervasyon', 'bekle', 'sıra', 'kuyruk',
-                                  'kalabalık', 'sakin', 'sessiz', 'gürültü', 'dress code', 'yaş', 'giriş',
-                                  'alkol', 'kokteyl', 'bira', 'servis', 'dj', 'müzik', 'dans',
-                                  'hızlı', 'yavaş', 'pahalı', 'ucuz', 'fiyat', 'hesap', 'bahçe', 'teras']
-
-            places_list_items = []
-            for i, v in enumerate(venues[:10]):
-                reviews_text = ""
-                if v.get('google_reviews'):
-                    all_reviews = v['google_reviews']
-                    practical_reviews = []
-                    other_reviews = []
-                    for r in all_reviews:
-                        text = r.get('text', '').lower()
-                        if any(kw in text for kw in practical_keywords):
-                            practical_reviews.append(r)
-                        else:
-                            other_reviews.append(r)
-                    selected_reviews = practical_reviews[:3] + other_reviews[:2]
-                    top_reviews = [r.get('text', '')[:350] for r in selected_reviews if r.get('text')]
-                    if top_reviews:
-                        reviews_text = f" | Yorumlar: {' /// '.join(top_reviews)}"
-
-                venue_note = f" | Tür: {v.get('venueType', '')}"
-                places_list_items.append(
-                    f"{i+1}. {v['name']} | Rating: {v.get('googleRating', 'N/A')}{venue_note}{reviews_text}"
-                )
-            places_list = "\n".join(places_list_items)
-
-            batch_prompt = f"""Kategori: Eğlence & Parti
-Kullanıcı Tercihleri: Gece hayatı, dans, parti, eğlence
-
-Mekanlar ve Yorumları:
-{places_list}
-
-Her mekan için analiz yap ve JSON döndür:
-{{
-  "name": "Mekan Adı",
-  "description": "2 cümle Türkçe - mekanın parti atmosferi, DJ/müzik tarzı",
-  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
-  "instagramUsername": "kullanici_adi" | null,
-  "practicalInfo": {{
-    "reservationNeeded": "Tavsiye Edilir" | "Şart" | "Gerekli Değil" | null,
-    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
-    "waitTime": "Bekleme yok" | "10-15 dk" | "20-30 dk" | null,
-    "parking": "Kolay" | "Zor" | "Otopark var" | "Yok" | null,
-    "hasValet": true | false | null,
-    "outdoorSeating": true | false | null,
-    "kidFriendly": false,
-    "vegetarianOptions": null,
-    "alcoholServed": true,
-    "serviceSpeed": "Hızlı" | "Normal" | "Yavaş" | null,
-    "priceFeeling": "Fiyatına Değer" | "Biraz Pahalı" | "Uygun" | null,
-    "mustTry": "İmza kokteyl veya deneyim" | null,
-    "headsUp": "Önemli uyarı (dress code, yaş sınırı, vs.)" | null
-  }},
-  "atmosphereSummary": {{
-    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı" | "Gürültülü",
-    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
-    "privacy": "Özel" | "Yarı Özel" | "Açık Alan",
-    "energy": "Sakin" | "Dengeli" | "Enerjik",
-    "idealFor": ["parti gecesi", "dans", "arkadaş grubu"],
-    "notIdealFor": ["romantik akşam", "sessiz sohbet"],
-    "oneLiner": "Tek cümle Türkçe atmosfer özeti"
-  }}
-}}
-
-practicalInfo Kuralları (YORUMLARDAN ÇIKAR):
-- reservationNeeded: VIP/masa için "Şart", genel giriş için "Gerekli Değil"
-- crowdLevel: Gece kulübü genelde "Kalabalık"
-- parking: "Otopark", "park yeri" → "Otopark var". "Park zor", "park yok" → "Zor". Gece kulübü genelde "Zor"
-- hasValet: "Vale", "valet" → true. Yoksa null veya false
-- kidFriendly: Gece kulübü/bar için HER ZAMAN false
-- alcoholServed: Gece kulübü/bar için HER ZAMAN true
-- headsUp: Dress code, yaş sınırı (21+), giriş ücreti vb.
-
-atmosphereSummary Kuralları:
-- noiseLevel: Gece kulübü genelde "Gürültülü", lounge "Canlı"
-- lighting: Gece kulübü genelde "Loş"
-- privacy: Genelde "Açık Alan" veya "Yarı Özel"
-- energy: Parti mekanı genelde "Enerjik"
-- idealFor: Max 3 - "parti gecesi", "dans", "arkadaş grubu", "bekarlığa veda", "DJ gecesi"
-- notIdealFor: Max 2 - "romantik akşam", "sessiz sohbet", "aile yemeği"
-- oneLiner: Tek cümle atmosfer özeti
-
-instagramUsername Kuralları:
-- Mekanın resmi Instagram hesabını bul (@ işareti olmadan sadece kullanıcı adı)
-- Gece kulüpleri genellikle: mekanadi, mekan_official, mekanistanbul formatında
-- Örnek: "Sortie" → "sortieistanbul" veya "sortie_official"
-- Bilinen popüler mekanların Instagram'ını ver. Emin olmadığın için null yaz.
-
-SADECE JSON ARRAY döndür, başka açıklama yazma."""
-
-            try:
-                model = get_genai_model()
-                if model:
-                    response = model.generate_content(batch_prompt)
-                    response_text = response.text.strip()
-
-                    # Güvenli JSON parse
-                    response_text = re.sub(r'```json\s*|\s*```', '', response_text)
-                    response_text = response_text.strip()
-
-                    try:
-                        ai_results = json.loads(response_text)
-                    except json.JSONDecodeError:
-                        match = re.search(r'\[.*\]', response_text, re.DOTALL)
-                        if match:
-                            ai_results = json.loads(match.group())
-                        else:
-                            print(f"⚠️ Eğlence & Parti JSON parse edilemedi, fallback kullanılıyor", file=sys.stderr, flush=True)
-                            ai_results = []
-
-                    # AI sonuçlarını mekanlarla eşleştir
-                    ai_by_name = {r.get('name', '').lower(): r for r in ai_results}
-
-                    final_venues = []
-                    for venue_data in venues[:10]:
-                        ai_data = ai_by_name.get(venue_data['name'].lower(), {})
-
-                        venue = {
-                            'id': venue_data['id'],
-                            'name': venue_data['name'],
-                            'description': ai_data.get('description', venue_data['base_description']),
-                            'imageUrl': venue_data['imageUrl'],
-                            'category': 'Eğlence & Parti',
-                            'vibeTags': ai_data.get('vibeTags', venue_data.get('vibeTags', ['#Eğlence'])),
-                            'address': venue_data['address'],
-                            'priceRange': venue_data['priceRange'],
-                            'googleRating': venue_data.get('googleRating', 4.0),
-                            'googleReviewCount': venue_data.get('googleReviewCount', 0),
-                            'matchScore': venue_data['matchScore'],
-                            'noiseLevel': venue_data['noiseLevel'],
-                            'googleMapsUrl': venue_data['googleMapsUrl'],
-                            'googleReviews': venue_data.get('googleReviews', []),
-                            'website': venue_data.get('website', ''),
-                            'phoneNumber': venue_data.get('phoneNumber', ''),
-                            'hours': venue_data.get('hours', ''),
-                            'weeklyHours': venue_data.get('weeklyHours', []),
-                            'isOpenNow': venue_data.get('isOpenNow', None),
-                            'venueType': venue_data.get('venueType', ''),
-                            'practicalInfo': ai_data.get('practicalInfo', {}),
-                            'atmosphereSummary': ai_data.get('atmosphereSummary', {
-                                'noiseLevel': 'Gürültülü',
-                                'lighting': 'Loş',
-                                'privacy': 'Açık Alan',
-                                'energy': 'Enerjik',
-                                'idealFor': ['parti gecesi', 'dans'],
-                                'notIdealFor': ['romantik akşam'],
-                                'oneLiner': 'Enerjik parti atmosferi sunan popüler bir mekan.'
-                            })
-                        }
-
-                        # Instagram username'i ekle (Gemini'dan)
-                        instagram_username = ai_data.get('instagramUsername')
-                        if instagram_username and instagram_username != 'null' and instagram_username is not None:
-                            venue['instagramUrl'] = f"https://instagram.com/{instagram_username}"
-                            venue['instagramEstimated'] = False  # Gemini buldu, doğrulanmış
-
-                        final_venues.append(venue)
-
-                    # Gemini Instagram bulamadıysa, Google CSE + tahmin ile bul
-                    for venue in final_venues:
-                        if not venue.get('instagramUrl'):
-                            instagram_url, is_verified = discover_instagram_url(
-                                venue_name=venue['name'],
-                                city=city,
-                                website=venue.get('website'),
-                                existing_instagram=None,
-                                district=selected_district,
-                                neighborhood=selected_neighborhood,
-                                return_verified=True
-                            )
-                            if instagram_url:
-                                venue['instagramUrl'] = instagram_url
-                                venue['instagramEstimated'] = not is_verified
-                                insta_status = "verified" if is_verified else "estimated"
-                                print(f"📸 Eğlence & Parti Instagram ({insta_status}): {venue['name']} -> {instagram_url}", file=sys.stderr, flush=True)
-
-                    print(f"✅ Gemini ile {len(final_venues)} Eğlence & Parti mekan zenginleştirildi", file=sys.stderr, flush=True)
-
-                    # ===== CACHE'E KAYDET (sadece API'den gelen yeni venue'lar) =====
-                    if final_venues:
-                        save_venues_to_cache(
-                            venues=final_venues,
-                            category_name='Eğlence & Parti',
-                            city=city,
-                            district=selected_district,
-                            neighborhood=selected_neighborhood
-                        )
-
-                    # ===== HYBRID: CACHE + API VENUE'LARINI BİRLEŞTİR =====
-                    combined_venues = []
-                    existing_names = set()  # İsim bazlı duplicate kontrolü
-                    for cv in cached_venues:
-                        if len(combined_venues) < 50:
-                            combined_venues.append(cv)
-                            existing_names.add(cv.get('name', '').lower().strip())
-                    existing_ids = {v.get('id') for v in combined_venues}
-                    for av in final_venues:
-                        av_name = av.get('name', '').lower().strip()
-                        if len(combined_venues) < 50 and av.get('id') not in existing_ids and av_name not in existing_names:
-                            combined_venues.append(av)
-                            existing_ids.add(av.get('id'))
-                            existing_names.add(av_name)
-
-                    print(f"🔀 HYBRID RESULT - Eğlence & Parti Cache: {len(cached_venues)}, API: {len(final_venues)}, Combined: {len(combined_venues)}", file=sys.stderr, flush=True)
-                    return Response(combined_venues, status=status.HTTP_200_OK)
-
-            except Exception as e:
-                print(f"❌ Gemini Eğlence & Parti hatası: {e}", file=sys.stderr, flush=True)
-                # Fallback: Gemini olmadan mekanları döndür
-                for venue_data in venues:
-                    venue_data['description'] = venue_data.pop('base_description', venue_data.get('description', ''))
-                    venue_data['practicalInfo'] = {}
-                    venue_data['atmosphereSummary'] = {
-                        'noiseLevel': 'Gürültülü',
-                        'lighting': 'Loş',
-                        'privacy': 'Açık Alan',
-                        'energy': 'Enerjik',
-                        'idealFor': ['parti gecesi'],
-                        'notIdealFor': [],
-                        'oneLiner': 'Enerjik parti atmosferi sunan popüler bir mekan.'
-                    }
-
-        # ===== CACHE'E KAYDET (Fallback - sadece API'den gelen yeni venue'lar) =====
-        if venues:
-            save_venues_to_cache(
-                venues=venues,
-                category_name='Eğlence & Parti',
-                city=city,
-                district=selected_district,
-                neighborhood=selected_neighborhood
-            )
-
-        # ===== HYBRID: CACHE + API VENUE'LARINI BİRLEŞTİR =====
-        combined_venues = []
-        existing_names = set()  # İsim bazlı duplicate kontrolü
-        for cv in cached_venues:
-            if len(combined_venues) < 50:
-                combined_venues.append(cv)
-                existing_names.add(cv.get('name', '').lower().strip())
-        existing_ids = {v.get('id') for v in combined_venues}
-        for av in venues:
-            av_name = av.get('name', '').lower().strip()
-            if len(combined_venues) < 50 and av.get('id') not in existing_ids and av_name not in existing_names:
-                combined_venues.append(av)
-                existing_ids.add(av.get('id'))
-                existing_names.add(av_name)
-
-        print(f"🔀 HYBRID RESULT - Eğlence & Parti (Fallback) Cache: {len(cached_venues)}, API: {len(venues)}, Combined: {len(combined_venues)}", file=sys.stderr, flush=True)
-        return Response(combined_venues, status=status.HTTP_200_OK)
-
-    except Exception as e:
-        print(f"❌ Party venues generation error: {e}", file=sys.stderr, flush=True)
-        import traceback
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
-        return Response(
-            {'error': f'Eğlence mekanları getirilirken hata: {str(e)}'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-
-
-@api_view(['POST'])
-@permission_classes([permissions.AllowAny])
-def register(request):
-    """Kullanıcı kayıt endpoint'i"""
-    serializer = UserRegistrationSerializer(data=request.data)
-    if serializer.is_valid():
-        user = serializer.save()
-        token, _ = Token.objects.get_or_create(user=user)
-        return Response({
-            'token': token.key,
-            'user': UserSerializer(user).data
-        }, status=status.HTTP_201_CREATED)
-    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-
-@api_view(['POST'])
-@permission_classes([permissions.AllowAny])
-def login(request):
-    """Kullanıcı giriş endpoint'i"""
-    username = request.data.get('username')
-    password = request.data.get('password')
-    
-    user = authenticate(username=username, password=password)
-    if user:
-        token, _ = Token.objects.get_or_create(user=user)
-        return Response({
-            'token': token.key,
-            'user': UserSerializer(user).data
-        })
-    return Response({'error': 'Geçersiz kullanıcı adı veya şifre'}, status=status.HTTP_401_UNAUTHORIZED)
-
-
-@api_view(['POST'])
-def logout(request):
-    """Kullanıcı çıkış endpoint'i"""
-    request.user.auth_token.delete()
-    return Response({'message': 'Başarıyla çıkış yapıldı'})
-
-
-@api_view(['POST'])
-@permission_classes([permissions.AllowAny])
-def google_login(request):
-    """Google OAuth ile kullanıcı girişi"""
-    from google.oauth2 import id_token
-    from google.auth.transport import requests as google_requests
-
-    credential = request.data.get('credential')
-
-    if not credential:
-        return Response(
-            {'error': 'Google credential eksik'},
-            status=status.HTTP_400_BAD_REQUEST
-        )
-
-    try:
-        # Google ID token'i dogrula
-        idinfo = id_token.verify_oauth2_token(
-            credential,
-            google_requests.Request(),
-            settings.GOOGLE_OAUTH_CLIENT_ID
-        )
-
-        # Token'dan kullanici bilgilerini al
-        google_id = idinfo['sub']
-        email = idinfo.get('email', '')
-        first_name = idinfo.get('given_name', '')
-        last_name = idinfo.get('family_name', '')
-        picture = idinfo.get('picture', '')
-
-        # Kullaniciyi bul veya olustur (email'e gore)
-        user, created = User.objects.get_or_create(
-            email=email,
-            defaults={
-                'username': email.split('@')[0] + '_' + google_id[:8],
-                'first_name': first_name,
-                'last_name': last_name,
-            }
-        )
-
-        # Mevcut kullanici ise bilgilerini guncelle
-        if not created:
-            user.first_name = first_name or user.first_name
-            user.last_name = last_name or user.last_name
-            user.save()
-
-        # UserProfile olustur/guncelle
-        profile, _ = UserProfile.objects.get_or_create(user=user)
-
-        # Google avatar ve auth bilgilerini kaydet
-        if not profile.preferences:
-            profile.preferences = {}
-        profile.preferences['avatar_url'] = picture
-        profile.preferences['auth_provider'] = 'google'
-        profile.preferences['google_id'] = google_id
-        profile.save()
-
-        # Token olustur
-        token, _ = Token.objects.get_or_create(user=user)
-
-        return Response({
-            'token': token.key,
-            'user': {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'avatar_url': picture,
-            },
-            'created': created
-        }, status=status.HTTP_200_OK)
-
-    except ValueError as e:
-        return Response(
-            {'error': f'Gecersiz Google token: {str(e)}'},
-            status=status.HTTP_401_UNAUTHORIZED
-        )
-    except Exception as e:
-        return Response(
-            {'error': f'Google giris hatasi: {str(e)}'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-
-
-def extract_website(url):
-    """Instagram ve sosyal medya linklerini website'den ayırır"""
-    if not url:
-        return ''
-    # Instagram, Facebook, Twitter linkleri website değil
-    social_media_domains = ['instagram.com', 'facebook.com', 'twitter.com', 'tiktok.com', 'youtube.com']
-    for domain in social_media_domains:
-        if domain in url.lower():
-            return ''
-    return url
-
-def extract_instagram(url):
-    """URL'den Instagram linkini çıkarır"""
-    if not url:
-        return ''
-    if 'instagram.com' in url.lower():
-        return url
-    return ''
-
-
-# Kategori -> Context mapping (context-based venue matching için)
-CATEGORY_TO_CONTEXT = {
-    "Fine Dining": "fine_dining",
-    "İlk Buluşma": "first_date",
-    "İş Yemeği": "business_meal",
-    "Muhabbet": "casual_hangout",
-    "Özel Gün": "special_occasion",
-    "Kahvaltı & Brunch": "breakfast_brunch",
-    "Aile Yemeği": "family_meal",
-    "Romantik Akşam": "romantic_dinner",
-    "İş Çıkışı Bira & Kokteyl": "after_work",
-    "Eğlence & Parti": "friends_hangout",
-    "Kafa Dinleme": "casual_hangout",
-    "3. Nesil Kahveci": "casual_hangout",
-    "Meyhane": "friends_hangout",
-    "Balıkçı": "fine_dining",
-}
-
-def sort_venues_by_context(venues, category_name):
-    """Context skoruna göre mekanları sıralar ve 50 altını filtreler"""
-    context_key = CATEGORY_TO_CONTEXT.get(category_name, "friends_hangout")
-
-    # Context skoru olan mekanları filtrele ve sırala
-    filtered = []
-    for v in venues:
-        context_score = v.get('contextScore', {})
-        score = context_score.get(context_key, 75)  # Default 75 (eğer contextScore yoksa)
-        if score >= 50:
-            v['matchScore'] = score  # matchScore'u context skoruyla güncelle
-            filtered.append(v)
-
-    # Context skoruna göre sırala
-    sorted_venues = sorted(filtered, key=lambda x: x['matchScore'], reverse=True)
-    return sorted_venues
+def public_venues_response(view):
+    """Liste (veya {'venues': [...]}) döndüren view'larda openIntervals'ı response'tan çıkar."""
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        response = view(request, *args, **kwargs)
+        data = getattr(response, 'data', None)
+        if isinstance(data, list):
+            response.data = [public_venue(v) for v in data]
+        elif isinstance(data, dict) and isinstance(data.get('venues'), list):
+            response.data = {**data, 'venues': [public_venue(v) for v in data['venues']]}
+        return response
+    return wrapper
 
 
 @api_view(['POST'])
 @permission_classes([permissions.AllowAny])
+@public_venues_response
 def generate_venues(request):
     """AI destekli mekan önerisi endpoint'i"""
-    import json
-    import random
-
     serializer = VenueGenerateSerializer(data=request.data)
     if not serializer.is_valid():
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -5373,21 +1610,11 @@ def generate_venues(request):
     trip_duration = data.get('tripDuration')
     exclude_ids = set(data.get('excludeIds', []))  # Set for O(1) lookup
 
-    # DEBUG: Log incoming request data (wrapped to prevent BrokenPipeError)
-    import sys
-    try:
-        print(f"\n{'='*60}", file=sys.stderr, flush=True)
-        print(f"🔍 INCOMING REQUEST DEBUG", file=sys.stderr, flush=True)
-        print(f"{'='*60}", file=sys.stderr, flush=True)
-        print(f"Category: {category}", file=sys.stderr, flush=True)
-        print(f"Filters received: {json.dumps(filters, indent=2, ensure_ascii=False)}", file=sys.stderr, flush=True)
-        print(f"Alcohol filter value: {filters.get('alcohol', 'NOT SET')}", file=sys.stderr, flush=True)
-        print(f"Exclude IDs count: {len(exclude_ids)}", file=sys.stderr, flush=True)
-        if exclude_ids:
-            print(f"Exclude IDs: {list(exclude_ids)[:5]}...", file=sys.stderr, flush=True)
-        print(f"{'='*60}\n", file=sys.stderr, flush=True)
-    except BrokenPipeError:
-        pass  # İstemci bağlantıyı kapattı, devam et
+    # Gelen istek özeti (DEBUG seviyesinde, production'da kapalı; formatlama lazy)
+    logger.debug(
+        "🔍 INCOMING REQUEST - category=%s filters=%s alcohol=%s exclude_ids=%d sample=%s",
+        category.get('name'), filters, filters.get('alcohol', 'NOT SET'), len(exclude_ids), list(exclude_ids)[:5]
+    )
 
     try:
         # Tatil kategorisi için özel işlem
@@ -5395,9 +1622,10 @@ def generate_venues(request):
             # Tatil kategorisi için deneyim bazlı öneri sistemi
             return generate_vacation_experiences(location, trip_duration, filters)
 
-        # Fine Dining kategorisi için özel işlem - önce Michelin restoranları
+        # Fine Dining kategorisi için özel işlem - önce Michelin restoranları (api/fine_dining_pipeline.py)
         if category['name'] == 'Fine Dining':
-            return generate_fine_dining_with_michelin(location, filters, exclude_ids)
+            from .fine_dining_pipeline import run_fine_dining_pipeline
+            return run_fine_dining_pipeline(location, filters, exclude_ids)
 
         # Yerel Festivaller kategorisi için özel işlem
         if category['name'] == 'Yerel Festivaller':
@@ -5413,7 +1641,7 @@ def generate_venues(request):
 
         # Piknik kategorisi için özel işlem - tabiat parkları ve büyük doğa alanları
         if category['name'] == 'Piknik':
-            return generate_picnic_experiences(location, filters)
+            return generate_picnic_experiences(location, filters, exclude_ids)
 
         # Sahne Sanatları / Tiyatro kategorisi için özel işlem - etkinlik bazlı
         if category['name'] in ['Sahne Sanatları', 'Tiyatro']:
@@ -5423,1554 +1651,75 @@ def generate_venues(request):
         if category['name'] in ['Konserler', 'Konser']:
             return generate_concerts(location, filters)
 
-        # Sokak Lezzeti kategorisi için özel işlem - Gemini-first arama
-        if category['name'] == 'Sokak Lezzeti':
-            return generate_street_food_places(location, filters, exclude_ids)
-
-        # İş Çıkışı Bira & Kokteyl kategorisi için özel işlem - çoklu sorgu
-        if category['name'] == 'İş Çıkışı Bira & Kokteyl':
-            return generate_bar_venues(location, filters, exclude_ids)
-
-        # Eğlence & Parti kategorisi için özel işlem - çoklu sorgu
-        if category['name'] == 'Eğlence & Parti':
-            return generate_party_venues(location, filters, exclude_ids)
-
-        # 3. Nesil Kahveci kategorisi için özel işlem - çoklu sorgu
-        if category['name'] == '3. Nesil Kahveci':
-            return generate_specialty_coffee_places(location, filters, exclude_ids)
-
-        # ===== GAULT & MILLAU ÖNCELİKLİ SORGU =====
-        # Önce bu kategori için G&M restoranları var mı kontrol et
-        category_id = category.get('id', '')
-        category_name = category.get('name', '')
-        city = location.get('city', 'İstanbul')
-
-        # G&M venue'larını burada tutuyoruz (scope dışına çıkmaması için)
-        gm_venues = []
-
-        # Load More kontrolü için orijinal exclude_ids'i sakla (G&M ID'leri eklemeden önce)
-        original_exclude_ids = exclude_ids.copy() if exclude_ids else set()
-
-        # İlçe bilgisini al (G&M filtresi için)
-        districts = location.get('districts', [])
-        selected_district_for_gm = districts[0] if districts else None
-
-        # G&M desteği olan kategoriler (mapping'de tanımlı olanlar)
-        if category_id in CATEGORY_ID_TO_NAME or category_name in CATEGORY_NAME_TO_ID:
-            # Kategori ID yoksa adından bul
-            if not category_id and category_name in CATEGORY_NAME_TO_ID:
-                category_id = CATEGORY_NAME_TO_ID[category_name]
-
-            gm_venues = get_gm_venues_for_category(
-                category_id=category_id,
-                category_name=category_name,
-                city=city,
-                exclude_ids=exclude_ids,
-                district=selected_district_for_gm  # İlçe filtresi
-            )
-
-            # G&M restoranları varsa bunları öncelikli olarak döndür
-            if gm_venues:
-                gm_count = len(gm_venues)
-                print(f"🏆 G&M ÖNCELİK - {gm_count} G&M restoran bulundu, listenin başına ekleniyor", file=sys.stderr, flush=True)
-
-                # Eğer 10'dan fazla G&M restoran varsa Michelin öncelikli sırala ve ilk 10'u döndür
-                if gm_count >= 10:
-                    # G&M mekanlarını Gemini ile zenginleştir
-                    enriched_gm = enrich_gm_venues_with_gemini(gm_venues[:10], category_name)
-
-                    # Hem G&M hem Michelin olan mekanlara Michelin badge ekle
-                    for gv in enriched_gm:
-                        michelin_check = is_michelin_restaurant(gv.get('name', ''))
-                        if michelin_check:
-                            gv['isMichelinStarred'] = True
-                            gv['michelinStars'] = michelin_check.get('stars', 0)
-                            gv['isBibGourmand'] = michelin_check.get('isBib', False)
-
-                    # Michelin > G&M sıralaması
-                    def michelin_gm_sort_key(venue):
-                        is_michelin = venue.get('isMichelinStarred', False)
-                        michelin_stars = venue.get('michelinStars', 0)
-                        is_bib = venue.get('isBibGourmand', False)
-                        gm_toques = venue.get('gaultMillauToques', 0) or 0
-                        rating = venue.get('googleRating', 0) or 0
-                        if is_michelin and michelin_stars > 0:
-                            return (0, -michelin_stars, -rating)
-                        elif is_bib:
-                            return (1, 0, -rating)
-                        else:
-                            return (2, -gm_toques, -rating)
-
-                    enriched_gm.sort(key=michelin_gm_sort_key)
-                    return Response(enriched_gm, status=status.HTTP_200_OK)
-
-                # 10'dan az G&M restoran var, cache/API ile tamamla
-                # G&M place_id'lerini exclude listesine ekle (tekrar çekmemek için)
-                gm_place_ids = {v.get('id') for v in gm_venues if v.get('id')}
-                if exclude_ids:
-                    exclude_ids = exclude_ids | gm_place_ids
-                else:
-                    exclude_ids = gm_place_ids
-
-        # ===== HYBRID CACHE SİSTEMİ =====
-        # Cache'ten venue'lar + API'den taze venue'lar = Toplam 10 venue
-        city = location.get('city', 'İzmir')
-        districts = location.get('districts', [])
-        neighborhoods = location.get('neighborhoods', [])
-        selected_district = districts[0] if districts else None
-        selected_neighborhood = neighborhoods[0] if neighborhoods else None
-
-        # Load More isteği mi kontrol et (orijinal exclude_ids'e göre, G&M ID'leri dahil değil)
-        is_load_more_request = bool(original_exclude_ids) and len(original_exclude_ids) > 0
-
-        # Load More durumunda cache limitini artır (daha fazla alternatif mekan bul)
-        cache_limit = CACHE_VENUES_LIMIT_LOAD_MORE if is_load_more_request else CACHE_VENUES_LIMIT
-
-        # Cache'ten venue'ları ve tüm cache'li place_id'leri al
-        cached_venues, all_cached_ids = get_cached_venues_for_hybrid(
-            category_name=category['name'],
-            city=city,
-            district=selected_district,
-            neighborhood=selected_neighborhood,
-            exclude_ids=exclude_ids,
-            limit=cache_limit
-        )
-
-        # API çağrısında cache'teki venue'ları exclude et (tekrar çekmemek için)
-        api_exclude_ids = (exclude_ids or set()) | all_cached_ids
-
-        print(f"🔀 HYBRID - Cache: {len(cached_venues)} venue, API exclude: {len(api_exclude_ids)} ID, LoadMore: {is_load_more_request}", file=sys.stderr, flush=True)
-
-        # ===== LOAD MORE: ÖNCE CACHE'TEN YENİ MEKANLAR DENE =====
-        # Cache'te henüz gösterilmemiş mekan varsa bunları döndür (API maliyeti yok!)
-        if is_load_more_request:
-            if len(cached_venues) >= 5:
-                print(f"✅ LOAD MORE CACHE HIT - {len(cached_venues)} yeni mekan cache'ten döndürülüyor!", file=sys.stderr, flush=True)
-                enriched_venues = enrich_cached_venues_with_instagram(cached_venues[:10], city, selected_district, selected_neighborhood)
-                return Response(enriched_venues, status=status.HTTP_200_OK)
-            elif len(cached_venues) > 0:
-                # 1-4 venue kaldı - bunları dön ve hasMore: false de (API aynı mekanları döndürür)
-                print(f"⚠️ LOAD MORE - Son {len(cached_venues)} mekan döndürülüyor, hasMore=false", file=sys.stderr, flush=True)
-                enriched_venues = enrich_cached_venues_with_instagram(cached_venues, city, selected_district, selected_neighborhood)
-                return Response({
-                    'venues': enriched_venues,
-                    'hasMore': False
-                }, status=status.HTTP_200_OK)
-            else:
-                # Cache'te hiç yeni mekan kalmadı
-                print(f"⚠️ LOAD MORE - Cache'te gösterilmemiş mekan kalmadı", file=sys.stderr, flush=True)
-                return Response({
-                    'venues': [],
-                    'hasMore': False
-                }, status=status.HTTP_200_OK)
-
-        # ===== CACHE YETERLI İSE API ÇAĞRISINI ATLA (MALİYET OPTİMİZASYONU) =====
-        # Cache'te 50+ venue varsa direkt döndür, API çağrısı yapma
-        MIN_VENUES_FOR_CACHE_ONLY = 50  # 50 mekan varsa cache yeterli
-
-        if len(cached_venues) >= MIN_VENUES_FOR_CACHE_ONLY and not is_load_more_request:
-            print(f"✅ CACHE HIT - {len(cached_venues)} venue cache'ten döndürülüyor, API çağrısı atlandı!", file=sys.stderr, flush=True)
-            # Instagram URL enrichment - cache'deki eksik Instagram URL'lerini bul
-            enriched_venues = enrich_cached_venues_with_instagram(cached_venues, city, selected_district, selected_neighborhood)
-            # G&M venue'larını Michelin öncelikli sırala ve başa ekle (varsa) - duplicate önleme ile
-            if gm_venues:
-                # G&M mekanlarını Gemini ile zenginleştir
-                enriched_gm = enrich_gm_venues_with_gemini(gm_venues, category_name)
-
-                # Hem G&M hem Michelin olan mekanlara Michelin badge ekle
-                for gv in enriched_gm:
-                    michelin_check = is_michelin_restaurant(gv.get('name', ''))
-                    if michelin_check:
-                        gv['isMichelinStarred'] = True
-                        gv['michelinStars'] = michelin_check.get('stars', 0)
-                        gv['isBibGourmand'] = michelin_check.get('isBib', False)
-
-                # Michelin > G&M sıralaması
-                def michelin_gm_sort_key(venue):
-                    is_michelin = venue.get('isMichelinStarred', False)
-                    michelin_stars = venue.get('michelinStars', 0)
-                    is_bib = venue.get('isBibGourmand', False)
-                    gm_toques = venue.get('gaultMillauToques', 0) or 0
-                    rating = venue.get('googleRating', 0) or 0
-                    if is_michelin and michelin_stars > 0:
-                        return (0, -michelin_stars, -rating)
-                    elif is_bib:
-                        return (1, 0, -rating)
-                    else:
-                        return (2, -gm_toques, -rating)
-
-                enriched_gm.sort(key=michelin_gm_sort_key)
-
-                # G&M venue ID'lerini al
-                gm_ids = {v.get('id') for v in enriched_gm if v.get('id')}
-                # enriched_venues'dan G&M ID'lerini çıkar (duplicate önleme)
-                enriched_venues = [v for v in enriched_venues if v.get('id') not in gm_ids]
-                # G&M'leri başa ekle, kalan slotları doldur
-                remaining_slots = 50 - len(enriched_gm)
-                final_venues = enriched_gm + enriched_venues[:remaining_slots]
-                return Response(final_venues, status=status.HTTP_200_OK)
-            return Response(enriched_venues, status=status.HTTP_200_OK)
-
-        # API'ye gitme gerekiyor - log yaz
-        if is_load_more_request:
-            print(f"🔄 LOAD MORE - Cache'te yetersiz mekan ({len(cached_venues)}), API'ye gidiliyor...", file=sys.stderr, flush=True)
-
-        # Kategori bazlı query mapping (Tatil, Michelin, Festivaller, Adrenalin, Hafta Sonu Gezintisi, Sahne Sanatları, Konserler ve Sokak Lezzeti hariç)
-        # ALKOL FİLTRESİNE GÖRE DİNAMİK QUERY OLUŞTUR
-        alcohol_filter = filters.get('alcohol', 'Any')
-
-        if alcohol_filter == 'Alcoholic':
-            # Alkollü mekan seçilirse SADECE bar, pub, restaurant, wine bar ara
-            category_query_map = {
-                'İlk Buluşma': 'romantic restaurant wine bar cocktail bar date night fine dining lounge rooftop',
-                'İş Yemeği': 'restaurant bar hotel lounge business lunch',
-                'Muhabbet': 'bar pub lounge restaurant wine bar',
-                'İş Çıkışı Bira & Kokteyl': 'bar pub cocktail bar beer garden',
-                'Eğlence & Parti': 'nightclub bar pub dance club beach club rooftop bar live music lounge',
-                'Özel Gün': 'fine dining restaurant wine bar romantic rooftop',
-                'Kahvaltı & Brunch': 'kahvaltı brunch restaurant bar mimosa serpme kahvaltı',
-                'Kafa Dinleme': 'lounge bar quiet restaurant',
-                'Odaklanma': 'bar restaurant lounge',
-                'Aile Yemeği': 'restaurant bar casual dining',
-                '3. Nesil Kahveci': 'butik kahveci 3. nesil kahve specialty coffee roastery kahve kavurucu',
-                'Konserler': 'live music venue concert hall bar',
-                'Sahne Sanatları': 'theater venue performance hall',
-                'Yerel Festivaller': 'festival event venue',
-                'Müze': 'museum',
-                'Galeri': 'art gallery contemporary art gallery sanat galerisi',
-                'Hafta Sonu Gezintisi': 'winery vineyard restaurant',
-                'Piknik': 'park garden outdoor',
-                'Beach Club': 'beach club bar restaurant',
-                'Plaj': 'beach bar restaurant',
-                'Adrenalin': 'adventure sports extreme',
-                'Spor': 'gym fitness yoga studio',
-                'Fine Dining': 'fine dining restaurant wine bar michelin gourmet upscale luxury tasting menu rooftop',
-                'Balıkçı': 'balık restoranı seafood restaurant rakı balık',
-                'Meyhane': 'meyhane rakı meze',
-                'Ocakbaşı': 'ocakbaşı kebap ızgara restoran mangal',
-            }
-        elif alcohol_filter == 'Non-Alcoholic':
-            # Alkolsüz mekan seçilirse SADECE cafe, bakery, coffee shop ara
-            category_query_map = {
-                'İlk Buluşma': 'romantic cafe restaurant patisserie brunch spot cozy restaurant date spot rooftop',
-                'İş Yemeği': 'business lunch cafe restaurant coffee shop',
-                'Muhabbet': 'cafe coffee shop tea house quiet cafe',
-                'İş Çıkışı Bira & Kokteyl': 'cafe coffee shop juice bar',
-                'Eğlence & Parti': 'entertainment center arcade bowling',
-                'Özel Gün': 'restaurant cafe patisserie rooftop',
-                'Kahvaltı & Brunch': 'kahvaltı breakfast brunch cafe serpme kahvaltı',
-                'Kafa Dinleme': 'quiet cafe tea house peaceful spot',
-                'Odaklanma': 'coworking space cafe library quiet study',
-                'Aile Yemeği': 'family restaurant cafe casual dining',
-                '3. Nesil Kahveci': 'butik kahveci 3. nesil kahve specialty coffee roastery kahve kavurucu',
-                'Konserler': 'concert hall music venue',
-                'Sahne Sanatları': 'theater venue performance hall',
-                'Yerel Festivaller': 'festival event venue',
-                'Müze': 'museum exhibition',
-                'Galeri': 'art gallery contemporary art gallery sanat galerisi',
-                'Hafta Sonu Gezintisi': 'scenic spot nature walk daytrip',
-                'Piknik': 'park garden picnic area',
-                'Beach Club': 'beach club resort',
-                'Plaj': 'beach seaside',
-                'Adrenalin': 'adventure sports extreme activities',
-                'Spor': 'gym fitness yoga studio pilates',
-                'Fine Dining': 'fine dining restaurant gourmet upscale rooftop',
-                'Ocakbaşı': 'ocakbaşı kebap ızgara restoran mangal',
-            }
-        else:
-            # Any seçilirse her türlü mekan (varsayılan)
-            category_query_map = {
-                'İlk Buluşma': 'romantic restaurant cafe wine bar date spot fine dining cozy bistro rooftop',
-                'İş Yemeği': 'business lunch restaurant cafe meeting spot',
-                'Muhabbet': 'cafe bar lounge restaurant cozy spot conversation friendly',
-                'İş Çıkışı Bira & Kokteyl': 'bar pub cocktail bar beer garden after work drinks',
-                'Eğlence & Parti': 'nightclub bar pub dance club beach club rooftop bar live music lounge entertainment',
-                'Özel Gün': 'fine dining restaurant romantic celebration rooftop',
-                'Kahvaltı & Brunch': 'kahvaltı breakfast brunch cafe serpme kahvaltı',
-                'Kafa Dinleme': 'quiet cafe lounge peaceful spot relaxing',
-                'Odaklanma': 'coworking space cafe library quiet study',
-                'Aile Yemeği': 'family restaurant casual dining kid friendly',
-                '3. Nesil Kahveci': 'butik kahveci 3. nesil kahve specialty coffee roastery kahve kavurucu',
-                'Konserler': 'live music venue concert hall',
-                'Sahne Sanatları': 'theater venue stand up comedy performance',
-                'Yerel Festivaller': 'festival event food festival',
-                'Müze': 'museum art exhibition',
-                'Galeri': 'art gallery contemporary art gallery sanat galerisi modern art',
-                'Hafta Sonu Gezintisi': 'scenic spot nature daytrip excursion',
-                'Piknik': 'park garden picnic area green space',
-                'Beach Club': 'beach club resort pool bar',
-                'Plaj': 'beach seaside coast',
-                'Adrenalin': 'adventure sports extreme activities outdoor',
-                'Spor': 'gym fitness yoga studio pilates wellness',
-                'Fine Dining': 'fine dining restaurant upscale gourmet michelin luxury tasting menu rooftop',
-                'Meyhane': 'meyhane restaurant turkish tavern rakı meze',
-                'Balıkçı': 'balık restoranı seafood restaurant balık lokantası',
-                'Sokak Lezzeti': 'kokoreç midye balık ekmek tantuni lahmacun pide söğüş çiğköfte döner',
-                'Burger & Fast': 'burger hamburger fast food',
-                'Pizzacı': 'pizza pizzeria italian pizza',
-                'Ocakbaşı': 'ocakbaşı kebap ızgara restoran mangal',
-            }
-
-        # Kategori ve filtrelere göre arama sorgusu oluştur
-        search_query = category_query_map.get(category['name'], category['name'])
-
-        # Filtrelere göre sorguyu genişlet
-        if filters.get('vibes'):
-            search_query += f" {' '.join(filters['vibes'])}"
-
-        # Lokasyon oluştur
-        city = location['city']
-        districts = location.get('districts', [])
-        neighborhoods = location.get('neighborhoods', [])
-        selected_district = districts[0] if districts else None
-        selected_neighborhood = neighborhoods[0] if neighborhoods else None
-
-        # Semt varsa semt ile ara, yoksa ilçe ile ara
-        if selected_neighborhood:
-            search_location = f"{selected_neighborhood}, {selected_district}, {city}"
-        elif selected_district:
-            search_location = f"{selected_district}, {city}"
-        else:
-            search_location = city
-
-        import sys
-        print(f"DEBUG - Selected District: {selected_district}", file=sys.stderr, flush=True)
-        print(f"DEBUG - Selected Neighborhood: {selected_neighborhood}", file=sys.stderr, flush=True)
-        print(f"DEBUG - Search Location: {search_location}", file=sys.stderr, flush=True)
-        print(f"DEBUG - Exclude IDs count: {len(exclude_ids)}", file=sys.stderr, flush=True)
-
-        # Google Places API'den mekan ara
-        gmaps = get_gmaps_client()
-        places_result = {'results': []}
-        is_nearby_search = False  # Nearby Search kullanıldığında True olacak - ilçe kontrolü atlanacak
-
-        # Tüm kategorilerde Nearby Search kullan (kesin lokasyon filtrelemesi için)
-        # Text Search location bias yeterli değil, ilçe dışı mekanlar geliyor
-        nearby_search_categories = [
-            'İlk Buluşma', 'Özel Gün', 'İş Yemeği', 'Muhabbet', 'Kafa Dinleme',
-            'Aile Yemeği', 'Meyhane', 'Balıkçı', 'Ocakbaşı', 'Kahvaltı & Brunch',
-            'İş Çıkışı Bira & Kokteyl', 'Burger & Fast', 'Pizzacı',
-            'Müze', 'Galeri', 'Beach Club', 'Plaj', 'Spor', 'Odaklanma'
-        ]
-
-        # Kategori bazlı included types ve keyword (Google Places API için)
-        category_search_config = {
-            'İlk Buluşma': {'type': 'restaurant', 'keyword': 'romantic restaurant wine bar rooftop'},
-            'Özel Gün': {'type': 'restaurant', 'keyword': 'fine dining romantic celebration rooftop'},
-            'İş Yemeği': {'type': 'restaurant', 'keyword': 'business lunch restaurant'},
-            'Muhabbet': {'type': 'restaurant', 'keyword': 'cafe bar lounge restaurant'},
-            'Kafa Dinleme': {'type': 'cafe', 'keyword': 'quiet cafe lounge peaceful'},
-            'Aile Yemeği': {'type': 'restaurant', 'keyword': 'family restaurant casual dining'},
-            'Meyhane': {'type': 'restaurant', 'keyword': 'meyhane turkish tavern meze'},
-            'Balıkçı': {'type': 'restaurant', 'keyword': 'seafood fish restaurant balık'},
-            'Ocakbaşı': {'type': 'restaurant', 'keyword': 'ocakbaşı kebab grill'},
-            'Kahvaltı & Brunch': {'type': 'restaurant', 'keyword': 'breakfast brunch kahvaltı'},
-            'İş Çıkışı Bira & Kokteyl': {'type': 'bar', 'keyword': 'bar pub cocktail'},
-            'Burger & Fast': {'type': 'restaurant', 'keyword': 'burger hamburger fast food'},
-            'Pizzacı': {'type': 'restaurant', 'keyword': 'pizza pizzeria'},
-            'Müze': {'type': 'museum', 'keyword': 'museum'},
-            'Galeri': {'type': 'art_gallery', 'keyword': 'art gallery'},
-            'Beach Club': {'type': 'restaurant', 'keyword': 'beach club'},
-            'Plaj': {'type': 'natural_feature', 'keyword': 'beach'},
-            'Spor': {'type': 'gym', 'keyword': 'gym fitness'},
-            'Odaklanma': {'type': 'cafe', 'keyword': 'coworking cafe quiet'},
-        }
-
-        if gmaps:
-            try:
-                import requests
-
-                # Tüm kategoriler için Nearby Search kullan (kesin lokasyon filtrelemesi)
-                if category['name'] in nearby_search_categories:
-                    # Önce lokasyonun koordinatlarını al (geocode)
-                    geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
-                    geocode_params = {
-                        "address": f"{search_location}, Turkey",
-                        "key": settings.GOOGLE_MAPS_API_KEY
-                    }
-                    geocode_response = requests.get(geocode_url, params=geocode_params)
-
-                    if geocode_response.status_code == 200:
-                        geocode_data = geocode_response.json()
-                        if geocode_data.get('results'):
-                            location_coords = geocode_data['results'][0]['geometry']['location']
-                            lat, lng = location_coords['lat'], location_coords['lng']
-
-                            print(f"🗺️ Nearby Search - {category['name']}: {search_location} -> ({lat}, {lng})", file=sys.stderr, flush=True)
-
-                            # Legacy Nearby Search API çağrısı - keyword ile
-                            nearby_url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
-                            search_config = category_search_config.get(category['name'], {'type': 'restaurant', 'keyword': ''})
-
-                            nearby_params = {
-                                "location": f"{lat},{lng}",
-                                "radius": 3000,  # 3km yarıçap - ilçe içinde kalması için
-                                "type": search_config['type'],
-                                "keyword": search_config['keyword'],
-                                "language": "tr",
-                                "key": settings.GOOGLE_MAPS_API_KEY
-                            }
-
-                            print(f"🔍 Nearby Search: type={nearby_params['type']}, keyword={nearby_params['keyword']}", file=sys.stderr, flush=True)
-
-                            # İlk sayfa
-                            response = requests.get(nearby_url, params=nearby_params)
-                            all_results = []
-
-                            if response.status_code == 200:
-                                places_data = response.json()
-                                all_results.extend(places_data.get('results', []))
-                                print(f"📄 Nearby Search sayfa 1: {len(places_data.get('results', []))} sonuç", file=sys.stderr, flush=True)
-
-                                # Pagination: 2. ve 3. sayfaları da al
-                                import time
-                                for page_num in range(2, 4):
-                                    next_page_token = places_data.get('next_page_token')
-                                    if not next_page_token:
-                                        break
-
-                                    time.sleep(2)  # Google API requires delay before using next_page_token
-                                    next_params = {
-                                        "pagetoken": next_page_token,
-                                        "key": settings.GOOGLE_MAPS_API_KEY
-                                    }
-                                    next_response = requests.get(nearby_url, params=next_params)
-                                    if next_response.status_code == 200:
-                                        next_data = next_response.json()
-                                        all_results.extend(next_data.get('results', []))
-                                        places_data = next_data
-                                        print(f"📄 Nearby Search sayfa {page_num}: {len(next_data.get('results', []))} sonuç", file=sys.stderr, flush=True)
-                                    else:
-                                        break
-
-                                places_result = {'results': all_results}
-                                is_nearby_search = True  # Nearby Search kullanıldı - ilçe kontrolü atlanacak
-                                print(f"✅ Nearby Search toplam: {len(all_results)} mekan", file=sys.stderr, flush=True)
-
-                                # Nearby Search 0 sonuç döndürdüyse Text Search fallback yap
-                                if len(all_results) == 0:
-                                    print(f"⚠️ Nearby Search 0 sonuç, Text Search fallback yapılıyor...", file=sys.stderr, flush=True)
-                                    url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-                                    params = {
-                                        "query": f"{search_query} in {search_location}, Turkey",
-                                        "language": "tr",
-                                        "key": settings.GOOGLE_MAPS_API_KEY,
-                                        "location": f"{lat},{lng}",
-                                        "radius": 5000  # 5km - daha geniş arama
-                                    }
-                                    fallback_response = requests.get(url, params=params)
-                                    if fallback_response.status_code == 200:
-                                        fallback_data = fallback_response.json()
-                                        places_result = {'results': fallback_data.get('results', [])}
-                                        is_nearby_search = False  # Text Search kullanıldı - ilçe kontrolü yapılacak
-                                        print(f"✅ Text Search fallback: {len(fallback_data.get('results', []))} sonuç", file=sys.stderr, flush=True)
-                                    else:
-                                        print(f"❌ Text Search fallback hatası: {fallback_response.status_code}", file=sys.stderr, flush=True)
-                            else:
-                                print(f"Nearby Search API hatası: {response.status_code} - {response.text}", file=sys.stderr, flush=True)
-                                # Fallback: Text Search kullan (Legacy API) - location bias ile
-                                url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-                                params = {
-                                    "query": f"{search_query} in {search_location}, Turkey",
-                                    "language": "tr",
-                                    "key": settings.GOOGLE_MAPS_API_KEY,
-                                    "location": f"{lat},{lng}",
-                                    "radius": 3000
-                                }
-                                response = requests.get(url, params=params)
-                                if response.status_code == 200:
-                                    places_data = response.json()
-                                    places_result = {'results': places_data.get('results', [])}
-                                else:
-                                    print(f"❌ Text Search fallback hatası: {response.status_code}", file=sys.stderr, flush=True)
-                        else:
-                            print(f"⚠️ Geocode sonuç bulunamadı: {search_location}", file=sys.stderr, flush=True)
-                    else:
-                        print(f"❌ Geocode hatası: {geocode_response.status_code}", file=sys.stderr, flush=True)
-                else:
-                    # Diğer kategoriler için Text Search kullan (Legacy API)
-                    # Önce lokasyonun koordinatlarını al (location bias için)
-                    geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
-                    geocode_params = {
-                        "address": f"{search_location}, Turkey",
-                        "key": settings.GOOGLE_MAPS_API_KEY
-                    }
-                    geocode_response = requests.get(geocode_url, params=geocode_params)
-
-                    location_lat, location_lng = None, None
-                    if geocode_response.status_code == 200:
-                        geocode_data = geocode_response.json()
-                        if geocode_data.get('results'):
-                            location_coords = geocode_data['results'][0]['geometry']['location']
-                            location_lat, location_lng = location_coords['lat'], location_coords['lng']
-                            print(f"🗺️ Text Search location bias: {search_location} -> ({location_lat}, {location_lng})", file=sys.stderr, flush=True)
-
-                    url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-                    params = {
-                        "query": f"{search_query} in {search_location}, Turkey",
-                        "language": "tr",
-                        "key": settings.GOOGLE_MAPS_API_KEY
-                    }
-
-                    # Location bias ekle (koordinatlar alındıysa)
-                    if location_lat and location_lng:
-                        params["location"] = f"{location_lat},{location_lng}"
-                        params["radius"] = 2000  # 2km yarıçap - daha sıkı filtreleme
-
-                    print(f"DEBUG - Google Places API Query: {params['query']} (location bias: {location_lat is not None})", file=sys.stderr, flush=True)
-
-                    all_results = []
-                    response = requests.get(url, params=params)
-
-                    if response.status_code == 200:
-                        places_data = response.json()
-                        all_results.extend(places_data.get('results', []))
-                        print(f"📄 Text Search sayfa 1: {len(places_data.get('results', []))} sonuç", file=sys.stderr, flush=True)
-
-                        # Pagination: 2. ve 3. sayfaları da al (toplam ~60 sonuç için)
-                        import time
-                        for page_num in range(2, 4):  # 2. ve 3. sayfa
-                            next_page_token = places_data.get('next_page_token')
-                            if not next_page_token:
-                                break
-
-                            # Google API next_page_token için kısa bekleme gerektiriyor
-                            time.sleep(2)
-
-                            next_params = {
-                                "pagetoken": next_page_token,
-                                "key": settings.GOOGLE_MAPS_API_KEY
-                            }
-                            next_response = requests.get(url, params=next_params)
-
-                            if next_response.status_code == 200:
-                                next_data = next_response.json()
-                                all_results.extend(next_data.get('results', []))
-                                places_data = next_data  # Sonraki sayfa için token'ı güncelle
-                                print(f"📄 Text Search sayfa {page_num}: {len(next_data.get('results', []))} sonuç", file=sys.stderr, flush=True)
-                            else:
-                                print(f"❌ Text Search sayfa {page_num} hatası: {next_response.status_code}", file=sys.stderr, flush=True)
-                                break
-
-                        places_result = {'results': all_results}
-                        print(f"✅ Text Search toplam: {len(all_results)} sonuç", file=sys.stderr, flush=True)
-                    else:
-                        print(f"❌ Places API hatası: {response.status_code} - {response.text}", file=sys.stderr, flush=True)
-
-            except Exception as e:
-                print(f"❌ Google Places API hatası: {e}", file=sys.stderr, flush=True)
-
-        # Google Places sonuç bulamadıysa boş liste dön (mock data ASLA kullanılmaz)
-        if not places_result.get('results'):
-            print(f"⚠️ NO RESULTS - Google Places sonuç bulamadı: {category.get('name', 'Unknown')} / {location}", file=sys.stderr, flush=True)
-            return Response([], status=status.HTTP_200_OK)
-
-        # ===== PHASE 1: Google Places'dan mekanları topla ve ön-filtrele =====
-        venues = []
-        filtered_places = []
-        alcohol_filter = filters.get('alcohol', 'Any')
-
-        for idx, place in enumerate(places_result.get('results', [])[:50]):
-            place_id = place.get('place_id', f"place_{idx}")
-            place_name = place.get('name', '')
-            # Nearby Search'te formatted_address yok, vicinity var - her ikisini de kontrol et
-            place_address = place.get('formatted_address', '') or place.get('vicinity', '')
-            place_rating = place.get('rating', 0)
-            place_review_count = place.get('user_ratings_total', 0)
-            place_types = place.get('types', [])
-            raw_reviews = place.get('reviews', [])  # Yorumlar - Meyhane kategorisi ve güncellik kontrolü için
-
-            # ===== EXCLUDE IDS FİLTRESİ: Daha önce gösterilen mekanları atla =====
-            if place_id in exclude_ids:
-                print(f"⏭️ EXCLUDE REJECT - {place_name}: zaten gösterildi (ID: {place_id})", file=sys.stderr, flush=True)
-                continue
-
-            # ===== İLÇE FİLTRESİ: Seçilen ilçeye ait olmayan mekanları atla =====
-            # NOT: Nearby Search zaten koordinat + radius bazlı, ilçe kontrolü atlanıyor
-            # Çünkü vicinity alanı ilçe adını içermiyor (sadece mahalle/sokak)
-            if selected_district and not is_nearby_search:
-                # Adres içinde ilçe adı var mı kontrol et (büyük/küçük harf duyarsız)
-                address_lower = place_address.lower()
-                district_lower = selected_district.lower()
-                # Türkçe karakterleri normalize et
-                district_normalized = district_lower.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                address_normalized = address_lower.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-
-                if district_lower not in address_lower and district_normalized not in address_normalized:
-                    print(f"❌ İLÇE REJECT - {place_name} adresi '{selected_district}' içermiyor: {place_address}", file=sys.stderr, flush=True)
-                    continue
-
-            # ===== MAHALLE/SEMT FİLTRESİ: Seçilen mahalleye ait olmayan mekanları atla =====
-            if selected_neighborhood:
-                address_lower = place_address.lower()
-                neighborhood_lower = selected_neighborhood.lower()
-                # Türkçe karakterleri normalize et
-                neighborhood_normalized = neighborhood_lower.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                address_normalized = address_lower.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-
-                if neighborhood_lower not in address_lower and neighborhood_normalized not in address_normalized:
-                    print(f"❌ MAHALLE REJECT - {place_name} adresi '{selected_neighborhood}' içermiyor: {place_address}", file=sys.stderr, flush=True)
-                    continue
-
-            # Fotoğraf URL'si (Legacy API)
-            photo_url = None
-            if place.get('photos') and len(place['photos']) > 0:
-                photo_ref = place['photos'][0].get('photo_reference', '')
-                if photo_ref:
-                    photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
-
-            # Google Maps URL
-            maps_query = urllib.parse.quote(f"{place_name} {place_address}")
-            google_maps_url = f"https://www.google.com/maps/search/?api=1&query={maps_query}"
-
-            # Fiyat aralığı (Legacy API: 0-4 integer)
-            price_level = place.get('price_level', 2)
-            price_map = {0: '$', 1: '$', 2: '$$', 3: '$$$', 4: '$$$$'}
-            price_range = price_map.get(price_level, '$$')
-
-            # Budget filtresine göre kontrol
-            budget_filter = filters.get('budget')
-            if budget_filter:
-                budget_map = {'Ekonomik': [1, 2], 'Orta': [2, 3], 'Lüks': [3, 4]}
-                if budget_filter in budget_map and price_level not in budget_map[budget_filter]:
-                    continue
-
-            # ===== ALKOL FİLTRESİ SERVER-SIDE DOĞRULAMA =====
-            # Mekan ismini küçük harfe çevir (Türkçe karakterleri normalize et)
-            place_name_lower = place_name.lower().replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-            place_types_str = ' '.join(place_types).lower()
-
-            # Balıkçı ve Meyhane kategorilerinde alkol filtresini ATLA - Gemini karar versin
-            category_name = category['name']
-            skip_alcohol_filter = category_name in ['Balıkçı', 'Meyhane']
+        # Nearby Search tabanlı kategoriler (Sokak Lezzeti, Bar, Eğlence & Parti, 3. Nesil Kahveci)
+        # registry'deki config ile ortak pipeline üzerinden çalışır
+        pipeline_config = get_category_config(category['name'])
+        if pipeline_config:
+            from .venue_pipeline import run_category_pipeline
+            return run_category_pipeline(pipeline_config, location, filters, exclude_ids)
 
-            if alcohol_filter == 'Alcoholic' and not skip_alcohol_filter:
-                # Kahve/kafe mekanlarını filtrele - hem types hem isimde kontrol et
-                coffee_keywords = ['cafe', 'coffee', 'kahve', 'kafe', 'bakery', 'tea_house', 'pastry', 'patisserie',
-                                   'firin', 'borek', 'kahveci', 'pastane', 'tatlici', 'muhallebici', 'dondurma',
-                                   'dessert', 'ice_cream', 'sweet', 'catering']
+        # Diğer mekan kategorileri: varsayılan yol (G&M + hybrid cache, tek Nearby / Text Search
+        # sorgusu, CandidateFilter, contextScore döndüren Gemini batch'i - api/text_search_pipeline.py)
+        from .text_search_pipeline import run_text_search_pipeline
+        return run_text_search_pipeline(category, location, filters, exclude_ids, user=request.user)
 
-                # Types içinde varsa filtrele
-                if any(keyword in place_types_str for keyword in coffee_keywords):
-                    print(f"❌ ALKOL REJECT (type) - {place_name}: types={place_types}", file=sys.stderr, flush=True)
-                    continue
-
-                # İsimde kahve/kafe/pastane varsa ve bar/pub içermiyorsa filtrele
-                coffee_name_keywords = ['cafe', 'coffee', 'kahve', 'kafe', 'kahveci', 'pastane', 'tatlici',
-                                        'muhallebici', 'dondurma', 'patisserie', 'bakery', 'firin']
-                is_coffee_name = any(keyword in place_name_lower for keyword in coffee_name_keywords)
-                is_bar_name = any(keyword in place_name_lower for keyword in ['bar', 'pub', 'bira', 'meyhane', 'wine', 'cocktail', 'beer'])
-                if is_coffee_name and not is_bar_name:
-                    print(f"❌ ALKOL REJECT (isim) - {place_name}: kahve/kafe isimli", file=sys.stderr, flush=True)
-                    continue
-
-            elif alcohol_filter == 'Non-Alcoholic' and not skip_alcohol_filter:
-                # Alkollü mekanları filtrele - hem types hem isimde kontrol et
-                alcohol_keywords = ['bar', 'pub', 'nightclub', 'wine_bar', 'liquor', 'cocktail', 'meyhane', 'bira']
-
-                # Types içinde varsa filtrele
-                if any(keyword in place_types_str for keyword in alcohol_keywords):
-                    print(f"❌ ALKOLSÜZ REJECT (type) - {place_name}: types={place_types}", file=sys.stderr, flush=True)
-                    continue
-
-                # İsimde "bar", "pub", "meyhane" varsa filtrele
-                if any(keyword in place_name_lower for keyword in ['bar', 'pub', 'meyhane', 'bira', 'wine', 'cocktail']):
-                    print(f"❌ ALKOLSÜZ REJECT (isim) - {place_name}: alkollü isimli", file=sys.stderr, flush=True)
-                    continue
-
-            # ===== KAPALI MEKAN KONTROLÜ (TÜM KATEGORİLER) =====
-            # Kalıcı veya geçici kapalı mekanları hariç tut
-            business_status = place.get('businessStatus', 'OPERATIONAL')
-            if business_status in ['CLOSED_PERMANENTLY', 'CLOSED_TEMPORARILY']:
-                print(f"❌ KAPALI MEKAN REJECT - {place_name}: {business_status}", file=sys.stderr, flush=True)
-                continue
-
-            # NOT: Eski yorum ve kapanmış mekan (yorum içeriği) kontrolleri
-            # Place Details ile yorumlar çekildikten SONRA yapılıyor (satır ~5542)
-            # Çünkü Legacy Text Search API yorumları döndürmüyor.
-
-            # ===== TEKEL/MARKET FİLTRESİ =====
-            # Tüm kategorilerde tekel, market, bakkal gibi yerleri hariç tut
-            tekel_keywords = [
-                'tekel', 'market', 'bakkal', 'büfe', 'süpermarket', 'grocery',
-                'liquor store', 'convenience', 'mini market', 'minimarket',
-                'alcohol palace', 'içki', 'şarküteri', 'manav', 'kuruyemiş'
-            ]
-
-            # Types içinde liquor_store, convenience_store, grocery_store varsa filtrele
-            tekel_types = ['liquor_store', 'convenience_store', 'grocery_store', 'supermarket']
-            is_tekel_type = any(t_type in place_types_str for t_type in tekel_types)
-            is_tekel_name = any(keyword in place_name_lower for keyword in tekel_keywords)
-
-            if is_tekel_type or is_tekel_name:
-                print(f"❌ TEKEL/MARKET REJECT - {place_name}: types={place_types}", file=sys.stderr, flush=True)
-                continue
-
-            # ===== RESTORAN KALİTE FİLTRESİ =====
-            # Restoran/yemek kategorileri için puan, yorum sayısı ve güncellik kontrolü
-            restaurant_categories = [
-                'İlk Buluşma', 'Fine Dining', 'Özel Gün', 'İş Yemeği', 'Öğlen Yemeği',
-                'Esnaf Lokantası', 'Balıkçı', 'Meyhane', 'Muhabbet', 'Brunch',
-                'İş Çıkışı Bira & Kokteyl', 'Sokak Lezzeti',
-                'Burger & Fast', 'Pizzacı', '3. Nesil Kahveci'
-            ]
-
-            if category_name in restaurant_categories:
-                # 1. Puan filtresi - 4.0 ve üstü kabul
-                if place_rating < 4.0:
-                    print(f"❌ RESTORAN RATING REJECT - {place_name}: rating={place_rating} < 4.0", file=sys.stderr, flush=True)
-                    continue
-
-                # 2. Yorum sayısı filtresi - Sokak Lezzeti için 20, diğerleri için 10
-                min_reviews = 20 if category_name == 'Sokak Lezzeti' else 10
-                if place_review_count < min_reviews:
-                    print(f"❌ RESTORAN REVIEW COUNT REJECT - {place_name}: reviews={place_review_count} < {min_reviews}", file=sys.stderr, flush=True)
-                    continue
-
-                # 3. Güncellik filtresi - En güncel yorum 6 aydan eski olmamalı
-                # NOT: 50+ yorumu olan popüler mekanlar bu kontrolden muaf (sezonluk mekanlar için)
-                if place_review_count < 50 and raw_reviews:  # Sadece 50'den az yorumu olan mekanlar için güncellik kontrolü
-                    from datetime import datetime, timedelta
-                    six_months_ago = datetime.now() - timedelta(days=180)  # 6 ay
-
-                    # En güncel yorumu bul
-                    latest_review_time = None
-                    for review in raw_reviews:
-                        publish_time_str = review.get('publishTime', '')
-                        if publish_time_str:
-                            try:
-                                # Format: "2024-12-10T14:30:00Z"
-                                review_time = datetime.fromisoformat(publish_time_str.replace('Z', '+00:00'))
-                                review_time = review_time.replace(tzinfo=None)  # Remove timezone for comparison
-                                if latest_review_time is None or review_time > latest_review_time:
-                                    latest_review_time = review_time
-                            except:
-                                pass
-
-                    # En güncel yorum 6 aydan eski mi?
-                    if latest_review_time and latest_review_time < six_months_ago:
-                        print(f"❌ RESTORAN ESKİ YORUM REJECT - {place_name}: son yorum {latest_review_time.strftime('%Y-%m-%d')} (6 aydan eski)", file=sys.stderr, flush=True)
-                        continue
-
-            # ===== PAVYON/KONSOMATRIS FİLTRESİ =====
-            # Eğlence & Parti kategorisi için uygunsuz mekanları filtrele
-            if category['name'] == 'Eğlence & Parti':
-                # NOT: "gazino" kaldırıldı - Türk kültüründe geleneksel eğlence mekanları (canlı müzik, fasıl)
-                pavyon_keywords = [
-                    'pavyon', 'konsomatris', 'casino', 'kabare', 'cabaret',
-                    'gece alemi', 'eglence merkezi', 'dans bar', 'show bar',
-                    'strip', 'striptiz', 'hostess', 'escort', 'masaj salonu',
-                    'gentlemen', 'club 18', 'club18', 'adult', 'yetiskin'
-                ]
-
-                # İsimde veya types'da pavyon tarzı kelimeler varsa filtrele
-                is_pavyon_name = any(keyword in place_name_lower for keyword in pavyon_keywords)
-                is_pavyon_type = any(keyword in place_types_str for keyword in pavyon_keywords)
-
-                if is_pavyon_name or is_pavyon_type:
-                    print(f"❌ PAVYON REJECT - {place_name}: uygunsuz mekan", file=sys.stderr, flush=True)
-                    continue
-
-                # ===== HİZMET FİRMASI FİLTRESİ =====
-                # DJ hizmeti, organizasyon firmaları, event planner vb. mekan değil hizmet veren firmalar
-                service_keywords = [
-                    'dj team', 'dj hizmeti', 'dj kiralama', 'düğün dj', 'dugun dj',
-                    'organizasyon', 'event planner', 'etkinlik', 'after party',
-                    'ses sistemi', 'ışık sistemi', 'isik sistemi', 'sahne kiralama',
-                    'catering', 'ikram hizmeti', 'parti organizasyon'
-                ]
-                service_types = ['event_planner', 'wedding_service', 'catering_service']
-
-                is_service_by_name = any(keyword in place_name_lower for keyword in service_keywords)
-                is_service_by_type = any(stype in place_types for stype in service_types)
-
-                # "DJ" kelimesi + night_club/bar tipi yoksa hizmet firması
-                has_dj_in_name = 'dj' in place_name_lower
-                is_actual_venue = any(t in place_types for t in ['night_club', 'bar', 'restaurant', 'cafe'])
-
-                if is_service_by_name or is_service_by_type or (has_dj_in_name and not is_actual_venue):
-                    print(f"❌ HİZMET FİRMASI REJECT - {place_name}: mekan değil hizmet firması (types: {place_types})", file=sys.stderr, flush=True)
-                    continue
-
-                # ===== RATING & REVIEW COUNT FİLTRESİ =====
-                # Eğlence & Parti kategorisi için düşük puanlı ve az yorumlu mekanları filtrele
-                if place_rating < 3.5:
-                    print(f"❌ RATING REJECT - {place_name}: rating={place_rating} < 3.5", file=sys.stderr, flush=True)
-                    continue
-
-                if place_review_count < 5:
-                    print(f"❌ REVIEW REJECT - {place_name}: reviews={place_review_count} < 5", file=sys.stderr, flush=True)
-                    continue
-
-            # ===== MEYHANE KATEGORİSİ FİLTRESİ =====
-            # Meyhane kategorisinde place_types tabanlı filtreleme - Gemini AI karar verecek
-            if category['name'] == 'Meyhane':
-                # İsminde meyhane geçenler direkt kabul
-                meyhane_keywords = ['meyhane', 'meyhanesi', 'rakı', 'fasıl']
-                is_meyhane_by_name = any(keyword in place_name_lower for keyword in meyhane_keywords)
-
-                # Place types ile meyhane olabilecek tipler: bar, restaurant, turkish_restaurant
-                meyhane_compatible_types = ['bar', 'restaurant', 'turkish_restaurant', 'meal_takeaway', 'meal_delivery']
-                is_meyhane_by_type = any(ptype in place_types for ptype in meyhane_compatible_types)
-
-                # Yorumlarda rakı geçenler de kabul edilsin
-                is_meyhane_by_reviews = False
-                meyhane_review_keywords = ['rakı', 'raki', 'meyhane', 'meze', 'fasıl', 'fasil']
-                for review in raw_reviews[:5]:
-                    review_text = review.get('text', {}).get('text', '').lower()
-                    if any(keyword in review_text for keyword in meyhane_review_keywords):
-                        is_meyhane_by_reviews = True
-                        break
-
-                # İsminde, tipinde veya yorumlarında meyhane uyumlu değilse reddet
-                if not is_meyhane_by_name and not is_meyhane_by_type and not is_meyhane_by_reviews:
-                    print(f"❌ MEYHANE REJECT - {place_name}: uygun tip yok (types: {place_types})", file=sys.stderr, flush=True)
-                    continue
-
-                # Gemini AI kararı için devam et - isRelevant kontrolü yapılacak
-                print(f"✅ MEYHANE PASS - {place_name}: name_match={is_meyhane_by_name}, type_match={is_meyhane_by_type}, review_match={is_meyhane_by_reviews}", file=sys.stderr, flush=True)
-
-            # ===== BALIKÇI KATEGORİSİ FİLTRESİ =====
-            # Balıkçı kategorisinde balık pişiricilerini hariç tut
-            if category['name'] == 'Balıkçı':
-                # Rating filtresi - 3.9 altını reddet
-                if place_rating < 3.9:
-                    print(f"❌ BALIKÇI RATING REJECT - {place_name}: rating={place_rating} < 3.9", file=sys.stderr, flush=True)
-                    continue
-
-                # Review count filtresi - 10'dan az yorumu reddet
-                if place_review_count < 10:
-                    print(f"❌ BALIKÇI REVIEW REJECT - {place_name}: reviews={place_review_count} < 10", file=sys.stderr, flush=True)
-                    continue
-
-                # İsim bazlı filtre - balık pişiricileri ve marketleri hariç tut
-                excluded_keywords = ['pişirici', 'balık ekmek', 'balıkekmek', 'tezgah', 'market', 'pazarı', 'hal']
-                is_excluded = any(keyword in place_name_lower for keyword in excluded_keywords)
-
-                if is_excluded:
-                    print(f"❌ BALIKÇI REJECT - {place_name}: balık pişirici/market türü", file=sys.stderr, flush=True)
-                    continue
-
-            # ===== ZİNCİR MAĞAZA FİLTRESİ (ROMANTİK KATEGORİLER) =====
-            # İlk Buluşma, Özel Gün, Fine Dining gibi romantik kategorilerde zincir mekanları filtrele
-            romantic_categories = ['İlk Buluşma', 'Özel Gün', 'Fine Dining', 'Romantik Akşam']
-
-            if category_name in romantic_categories:
-                chain_store_blacklist = [
-                    # Kahve zincirleri
-                    'starbucks', 'gloria jeans', 'caribou', 'coffee bean', 'espresso lab',
-                    # Fast food
-                    'mcdonalds', 'burger king', 'wendys', 'kfc', 'popeyes', 'dominos', 'pizza hut',
-                    'little caesars', 'papa johns', 'sbarro', 'arbys', 'taco bell', 'subway',
-                    # Türk zincirleri - kafe
-                    'mado', 'the house cafe', 'house cafe', 'big chefs', 'bigchefs', 'midpoint',
-                    'baylan', 'divan', 'kahve dunyasi', 'kahve dünyası', 'nero', 'costa coffee',
-                    # Türk zincirleri - fast food/restoran
-                    'simit sarayi', 'simit sarayı', 'tavuk dunyasi', 'tavuk dünyası', 'usta donerci',
-                    'komagene', 'baydoner', 'bay döner', 'burger lab', 'zuma', 'etiler', 'nusr-et',
-                    # Pastane/tatlıcı zincirleri
-                    'dunkin', 'krispy kreme', 'cinnabon', 'hafiz mustafa', 'hafız mustafa',
-                    'incir', 'saray muhallebicisi', 'pelit', 'faruk gulluoglu', 'faruk güllüoğlu',
-                    # Diğer zincirler
-                    'wok to walk', 'wagamama', 'nandos', 'tgi fridays', 'chilis', 'applebees',
-                    'hard rock cafe', 'planet hollywood', 'rainforest cafe', 'cheesecake factory',
-                    'petra roasting', 'walter\'s coffee'
-                ]
-
-                is_chain = any(chain in place_name_lower for chain in chain_store_blacklist)
-
-                if is_chain:
-                    print(f"❌ ZİNCİR MEKAN REJECT - {place_name}: romantik kategori için uygunsuz", file=sys.stderr, flush=True)
-                    continue
-
-            # Place Details ile yorumları ve yemek servis bilgilerini al
-            place_details = get_place_details_extended(gmaps, place_id) if place_id else {'reviews': [], 'foodServices': {}}
-            google_reviews = place_details.get('reviews', [])
-            food_services = place_details.get('foodServices', {})
-
-            # ===== ESKİ YORUM KONTROLÜ (YORUMLAR ÇEKİLDİKTEN SONRA) =====
-            # 7 aydır yorum gelmemişse muhtemelen kapalı - filtrele
-            # NOT: 50+ yorumu olan popüler mekanlar bu kontrolden muaf (sezonluk mekanlar için)
-            if place_review_count < 50 and google_reviews:
-                from datetime import datetime, timedelta
-                seven_months_ago = datetime.now() - timedelta(days=210)  # 7 ay
-
-                # En güncel yorumu bul (UNIX timestamp kullanarak)
-                latest_review_time = None
-                for review in google_reviews:
-                    review_timestamp = review.get('time')
-                    if review_timestamp:
-                        try:
-                            review_time = datetime.fromtimestamp(review_timestamp)
-                            if latest_review_time is None or review_time > latest_review_time:
-                                latest_review_time = review_time
-                        except:
-                            pass
-
-                # En güncel yorum 7 aydan eski mi?
-                if latest_review_time and latest_review_time < seven_months_ago:
-                    print(f"❌ ESKİ YORUM REJECT - {place_name}: son yorum {latest_review_time.strftime('%Y-%m-%d')} (7 aydan eski)", file=sys.stderr, flush=True)
-                    continue
-
-            # ===== KAPANMIŞ MEKAN KONTROLÜ - YORUM İÇERİĞİ (YORUMLAR ÇEKİLDİKTEN SONRA) =====
-            # Google "OPERATIONAL" dese bile yorumlarda "kapandı" yazıyorsa filtrele
-            if google_reviews:
-                closed_keywords = [
-                    'kalıcı olarak kapan', 'kalici olarak kapan',
-                    'kalıcı olarak kapatıl', 'kalici olarak kapatil',
-                    'artık kapalı', 'artik kapali',
-                    'kapandı', 'kapandi',
-                    'kapanmış', 'kapanmis',
-                    'kapatıldı', 'kapatildi',
-                    'kapatılmış', 'kapatilmis',
-                    'permanently closed', 'closed permanently',
-                    'yeni işletme', 'yeni isletme',
-                    'isim değişti', 'isim degisti',
-                    'yerine açıldı', 'yerine acildi',
-                    'burası artık', 'burasi artik'
-                ]
-
-                is_closed_by_reviews = False
-                for review in google_reviews[:5]:  # Son 5 yorumu kontrol et
-                    review_text = review.get('text', '').lower()
-                    review_text_normalized = review_text.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-
-                    for keyword in closed_keywords:
-                        keyword_normalized = keyword.replace('ı', 'i').replace('ş', 's').replace('ç', 'c').replace('ğ', 'g').replace('ö', 'o').replace('ü', 'u')
-                        if keyword_normalized in review_text_normalized:
-                            is_closed_by_reviews = True
-                            print(f"❌ KAPANMIŞ MEKAN (YORUM) REJECT - {place_name}: yorumda '{keyword}' bulundu", file=sys.stderr, flush=True)
-                            break
-                    if is_closed_by_reviews:
-                        break
-
-                if is_closed_by_reviews:
-                    continue
-
-            # Çalışma saatleri - Legacy API format
-            opening_hours = place.get('opening_hours', {})
-            hours_list = opening_hours.get('weekday_text', [])  # 7 günlük liste
-            hours_text = hours_list[0] if hours_list else ''  # Bugünün saati (backward compat)
-            is_open_now = opening_hours.get('open_now', None)  # Şu an açık mı?
-
-            # Filtreyi geçen mekanları topla
-            filtered_places.append({
-                'idx': idx,
-                'name': place_name,
-                'address': place_address,
-                'rating': place_rating,
-                'review_count': place_review_count,
-                'types': place_types,
-                'photo_url': photo_url,
-                'google_maps_url': google_maps_url,
-                'price_range': price_range,
-                'google_reviews': google_reviews,
-                'food_services': food_services,  # Google'dan gelen yemek servis bilgileri
-                'website': '',  # Legacy API textsearch'ta website gelmez
-                'instagram_url': '',  # Legacy API textsearch'ta website gelmez
-                'phone_number': '',  # Legacy API textsearch'ta telefon gelmez
-                'hours': hours_text,
-                'weeklyHours': hours_list,  # Tüm haftalık saatler
-                'isOpenNow': is_open_now  # Şu an açık mı?
-            })
-
-        # ===== PHASE 2: TEK BİR BATCH GEMİNİ ÇAĞRISI =====
-        if filtered_places:
-            # Kullanıcı tercihlerini hazırla - kategori bazlı
-            user_preferences = []
-            category_name = category.get('name', '')
-
-            # İlgisiz filtreleri atla: Spor, Etkinlik ve Deneyim kategorileri
-            skip_venue_filters = category_name in [
-                'Spor', 'Konserler', 'Konser', 'Sahne Sanatları', 'Tiyatro', 'Yerel Festivaller',
-                'Beach Club', 'Plaj', 'Hafta Sonu Gezintisi', 'Hafta Sonu Kaçamağı', 'Piknik',
-                'Müze', 'Galeri', 'Adrenalin'
-            ]
-
-            if not skip_venue_filters:
-                # Standart mekan filtreleri (restoran, bar, kafe vs. için)
-                if filters.get('groupSize') and filters['groupSize'] != 'Any':
-                    user_preferences.append(f"Grup: {filters['groupSize']}")
-                if filters.get('alcohol') and filters['alcohol'] != 'Any':
-                    user_preferences.append(f"ALKOL: {filters['alcohol']}")
-                if filters.get('liveMusic') and filters['liveMusic'] != 'Any':
-                    user_preferences.append(f"CANLI MÜZİK: {filters['liveMusic']}")
-                if filters.get('smoking') and filters['smoking'] != 'Any':
-                    user_preferences.append(f"SİGARA: {filters['smoking']}")
-                if filters.get('environment') and filters['environment'] != 'Any':
-                    user_preferences.append(f"ORTAM: {filters['environment']}")
-
-            # Spor kategorisi için sadece sportType filtresi
-            if category_name == 'Spor' and filters.get('sportType') and filters['sportType'] != 'Any':
-                user_preferences.append(f"SPOR TÜRÜ: {filters['sportType']}")
-
-            preferences_text = ", ".join(user_preferences) if user_preferences else "Özel tercih yok"
-            print(f"📋 Gemini BATCH çağrısı - {len(filtered_places)} mekan, filtreler: {preferences_text}", file=sys.stderr, flush=True)
-
-            # Tüm mekanları tek bir prompt'ta gönder - YORUMLARLA BİRLİKTE
-            # Pratik bilgi içeren yorumları öncelikli seç
-            practical_keywords = ['otopark', 'park', 'vale', 'valet', 'rezervasyon', 'bekle', 'sıra', 'kuyruk',
-                                  'kalabalık', 'sakin', 'sessiz', 'gürültü', 'çocuk', 'bebek', 'aile',
-                                  'vejetaryen', 'vegan', 'alkol', 'rakı', 'şarap', 'bira', 'servis',
-                                  'hızlı', 'yavaş', 'pahalı', 'ucuz', 'fiyat', 'hesap', 'bahçe', 'teras', 'dış mekan']
-
-            places_list_items = []
-            for i, p in enumerate(filtered_places[:50]):
-                reviews_text = ""
-                if p.get('google_reviews'):
-                    all_reviews = p['google_reviews']
-
-                    # Pratik bilgi içeren yorumları bul
-                    practical_reviews = []
-                    other_reviews = []
-                    for r in all_reviews:
-                        text = r.get('text', '').lower()
-                        if any(kw in text for kw in practical_keywords):
-                            practical_reviews.append(r)
-                        else:
-                            other_reviews.append(r)
-
-                    # Pratik bilgi içerenlerden 3 + diğerlerinden en güncel 2 (toplam max 5)
-                    selected_reviews = practical_reviews[:3] + other_reviews[:2]
-                    top_reviews = [r.get('text', '')[:350] for r in selected_reviews if r.get('text')]
-                    if top_reviews:
-                        reviews_text = f" | Yorumlar: {' /// '.join(top_reviews)}"
-
-                # Google Places API food services bilgisini formatla
-                food_services_text = ""
-                fs = p.get('food_services', {})
-                if fs:
-                    fs_items = []
-                    if fs.get('servesBeer'):
-                        fs_items.append("Bira:✓")
-                    if fs.get('servesWine'):
-                        fs_items.append("Şarap:✓")
-                    if fs.get('servesVegetarianFood'):
-                        fs_items.append("Vejetaryen:✓")
-                    if fs.get('servesBreakfast'):
-                        fs_items.append("Kahvaltı:✓")
-                    if fs.get('servesBrunch'):
-                        fs_items.append("Brunch:✓")
-                    if fs.get('servesLunch'):
-                        fs_items.append("Öğle:✓")
-                    if fs.get('servesDinner'):
-                        fs_items.append("Akşam:✓")
-                    if fs.get('reservable'):
-                        fs_items.append("Rezervasyon:✓")
-                    if fs.get('takeout'):
-                        fs_items.append("Paket:✓")
-                    if fs.get('delivery'):
-                        fs_items.append("Teslimat:✓")
-                    if fs_items:
-                        food_services_text = f" | Google Servisler: {' '.join(fs_items)}"
-
-                places_list_items.append(
-                    f"{i+1}. {p['name']} | Tip: {', '.join(p['types'][:2])} | Rating: {p.get('rating', 'N/A')}{food_services_text}{reviews_text}"
-                )
-            places_list = "\n".join(places_list_items)
-
-            # Kategori özel talimatları
-            category_instruction = ""
-
-            # Balıkçı kategorisi için özel talimat
-            if category['name'] == 'Balıkçı' and 'ALKOL: Alcoholic' in preferences_text:
-                category_instruction = """
-ÖNEMLİ UYARI - BALIKÇI KATEGORİSİ ALKOL FİLTRESİ:
-Kullanıcı ALKOLLÜ balık restoranı istiyor. Aşağıdaki mekanları DİKKATLİCE değerlendir:
-- "Google Servisler:" bölümünde "Bira:✓" veya "Şarap:✓" varsa → KABUL ET (alkol servisi doğrulanmış)
-- Google verisi yoksa yorumlara bak: "rakı", "şarap", "bira", "kokteyl" → alkol var demektir
-- Sade balık lokantaları, balık evi, balıkçı dükkanı gibi alkol servisi OLMAYAN yerleri REDDET (isRelevant: false)
-- Rakı/şarap ile balık yenebilecek kaliteli restoranları tercih et
-- "Vedat'ın Balık Evi", "Çarşı Balık", "Girne Balık Evi" gibi sade balık lokantaları genellikle ALKOLSÜZ'dür, dikkat et!
-"""
-            # Meyhane kategorisi için özel talimat - place_types tabanlı filtreleme sonrası AI değerlendirmesi
-            elif category['name'] == 'Meyhane':
-                category_instruction = """
-ÖNEMLİ UYARI - MEYHANE KATEGORİSİ DEĞERLENDİRMESİ:
-Bu kategori için meyhane karakteri taşıyan mekanları değerlendir. DİKKATLİCE incele:
-- İsminde "meyhane" geçmese bile meyhane karakteri taşıyan barlar ve restoranlar (rakı/meze servisi, canlı fasıl, geleneksel atmosfer) KABUL ET (isRelevant: true)
-- Yorumlarda "rakı", "meze", "fasıl", "canlı müzik", "saz" gibi ifadeler meyhane karakterini gösterir
-- Geleneksel Türk içki kültürünü yansıtan mekanları KABUL ET
-- Sadece bar/pub konseptinde olup meyhane atmosferi olmayan yerleri REDDET (isRelevant: false)
-- Fast food, cafe, tatlıcı gibi alakasız mekanları REDDET (isRelevant: false)
-- "Leke", "Balıkçı", "Fasıl", "Meyhane" gibi kelimeler genellikle meyhane karakteri taşır
-"""
-            # İş Çıkışı Bira & Kokteyl kategorisi için özel talimat
-            elif category['name'] == 'İş Çıkışı Bira & Kokteyl':
-                category_instruction = """
-ÖNEMLİ UYARI - İŞ ÇIKIŞI BİRA & KOKTEYL KATEGORİSİ DEĞERLENDİRMESİ:
-Bu kategori için SADECE bar, pub, bira evi, kokteyl bar konseptinde mekanları değerlendir. DİKKATLİCE filtrele:
-
-KABUL EDİLECEK MEKANLAR (isRelevant: true):
-- Pub, bar, bira evi, gastropub, craft beer bar
-- Kokteyl barları, speakeasy barlar
-- Canlı müzikli rock/blues barları
-- After-work drinks için uygun mekanlar
-- "Pub", "Bar", "Blues", "Rock", "Beer", "Bira", "Ale", "Cocktail" gibi isimler
-
-KESINLIKLE REDDEDİLECEK MEKANLAR (isRelevant: false):
-- MEYHANE, meze evi, rakı sofraları (bunlar Meyhane kategorisine aittir!)
-- Ocakbaşı, kebapçı, ızgara restoranları
-- Balık restoranları, balıkçılar
-- Geleneksel Türk mutfağı lokantaları
-- Cafe, kahveci, tatlıcı
-- Fast food restoranları
-- "Meyhane", "Meze", "Fasıl", "Ocakbaşı", "Kebap", "Balık" içeren isimler
-
-ÖRNEKLER:
-✅ Reset Pub, Varuna Gezgin, rePublic, Mississippi Blues Bar, Craft Beer Lab → KABUL
-❌ Argo Meyhane, Alsancak Olive Meyhane, Ateş Ocakbaşı → REDDET (meyhane/ocakbaşı)
-"""
-            # Ocakbaşı kategorisi için özel talimat - isminde "ocakbaşı" geçen mekanlar
-            elif category['name'] == 'Ocakbaşı':
-                category_instruction = """
-ÖNEMLİ UYARI - OCAKBAŞI KATEGORİSİ DEĞERLENDİRMESİ:
-Bu kategori için SADECE isminde "Ocakbaşı" geçen VE Google rating'i 3.9 ve üzeri olan restoranları kabul et!
-
-KABUL EDİLECEK MEKANLAR (isRelevant: true):
-- İsminde "Ocakbaşı" kelimesi GEÇEN restoranlar
-- Google rating'i 3.9 veya üzeri olan mekanlar
-- Örnek: "Ateş Ocakbaşı" (4.2), "Ali Baba Ocakbaşı" (4.0), "Tarihi Ocakbaşı" (4.5) vb.
-
-KESINLIKLE REDDEDİLECEK MEKANLAR (isRelevant: false):
-- İsminde "Ocakbaşı" kelimesi GEÇMEYEN restoranlar
-- Google rating'i 3.9'un ALTINDA olan mekanlar (düşük puanlı yerler)
-- Sadece kebapçı, ızgara, mangal konseptli ama isminde Ocakbaşı yazmayan yerler
-- Meyhane, balık restoranı, cafe, bar
-- Örnek: "Adana Kebap", "Köfteci Ali", "Mangal Evi" → REDDET (isminde ocakbaşı yok!)
-
-ÖRNEKLER:
-✅ Ateş Ocakbaşı (4.2 rating), Ali Ocakbaşı (4.0 rating) → KABUL (isminde "Ocakbaşı" var VE rating >= 3.9)
-❌ Ucuz Ocakbaşı (3.5 rating) → REDDET (rating 3.9'un altında!)
-❌ Adana Sofrası, Kebapçı Mahmut → REDDET (isminde "Ocakbaşı" yok)
-"""
-
-            # Alkol filtresi için genel talimat ekle (tüm kategoriler için)
-            alcohol_instruction = ""
-            if 'ALKOL: Alcoholic' in preferences_text:
-                alcohol_instruction = """
-ALKOL FİLTRESİ TALİMATI (Kullanıcı ALKOLLÜ mekan istiyor):
-- "Google Servisler:" bölümünde "Bira:✓" veya "Şarap:✓" varsa → kesinlikle alcoholServed: true yaz
-- Google verisi yoksa yorumlarda "rakı", "bira", "şarap", "kokteyl" geçiyorsa → alcoholServed: true
-- Kahveci, pastane, tatlıcı, fast food gibi alkol servisi olmayan mekanlar için isRelevant: false yaz
-"""
-            elif 'ALKOL: Non-Alcoholic' in preferences_text:
-                alcohol_instruction = """
-ALKOLSÜZ FİLTRE TALİMATI (Kullanıcı ALKOLSÜZ mekan istiyor):
-- "Google Servisler:" bölümünde "Bira:✓" veya "Şarap:✓" varsa → bu mekan ALKOLLÜ, dikkatli ol
-- Bar, pub, meyhane, gece kulübü gibi alkol odaklı mekanlar için isRelevant: false yaz
-- Kafe, kahveci, pastane, aile restoranı gibi alkolsüz mekanları tercih et
-"""
-
-            # category_instruction ve alcohol_instruction birleştir
-            full_instruction = category_instruction + alcohol_instruction
-
-            batch_prompt = f"""Kategori: {category['name']}
-Kullanıcı Tercihleri: {preferences_text}
-{full_instruction}
-
-Mekanlar ve Yorumları:
-{places_list}
-
-Her mekan için analiz yap ve JSON döndür:
-{{
-  "name": "Mekan Adı",
-  "isRelevant": true/false,
-  "description": "2 cümle Türkçe - mekanın öne çıkan özelliği",
-  "vibeTags": ["#Tag1", "#Tag2", "#Tag3"],
-  "instagramUrl": "https://instagram.com/kullanici_adi" | null,
-  "contextScore": {{
-    "first_date": 0-100,
-    "business_meal": 0-100,
-    "casual_hangout": 0-100,
-    "fine_dining": 0-100,
-    "romantic_dinner": 0-100,
-    "friends_hangout": 0-100,
-    "family_meal": 0-100,
-    "special_occasion": 0-100,
-    "breakfast_brunch": 0-100,
-    "after_work": 0-100
-  }},
-  "practicalInfo": {{
-    "reservationNeeded": "Tavsiye Edilir" | "Şart" | "Gerekli Değil" | null,
-    "crowdLevel": "Sakin" | "Orta" | "Kalabalık" | null,
-    "waitTime": "Bekleme yok" | "10-15 dk" | "20-30 dk" | null,
-    "parking": "Kolay" | "Zor" | "Otopark var" | "Yok" | null,
-    "hasValet": true | false | null,
-    "outdoorSeating": true | false | null,
-    "kidFriendly": true | false | null,
-    "vegetarianOptions": true | false | null,
-    "alcoholServed": true | false | null,
-    "hasDelivery": true | false | null,
-    "hasTakeout": true | false | null,
-    "servesBreakfast": true | false | null,
-    "servesBrunch": true | false | null,
-    "serviceSpeed": "Hızlı" | "Normal" | "Yavaş" | null,
-    "priceFeeling": "Fiyatına Değer" | "Biraz Pahalı" | "Uygun" | null,
-    "mustTry": "Yorumlarda öne çıkan yemek/içecek" | null,
-    "headsUp": "Bilmeniz gereken önemli uyarı" | null
-  }},
-  "atmosphereSummary": {{
-    "noiseLevel": "Sessiz" | "Sohbet Dostu" | "Canlı" | "Gürültülü",
-    "lighting": "Loş" | "Yumuşak" | "Aydınlık",
-    "privacy": "Özel" | "Yarı Özel" | "Açık Alan",
-    "energy": "Sakin" | "Dengeli" | "Enerjik",
-    "idealFor": ["romantik akşam", "ilk buluşma", "arkadaş buluşması"],
-    "notIdealFor": ["aile yemeği"],
-    "oneLiner": "Tek cümle Türkçe atmosfer özeti"
-  }}
-}}
-
-Context Skorlama Kuralları:
-- first_date: Gürültü düşük, mahremiyet yüksek, görsel olarak etkileyici mekanlar.
-- business_meal: Sessiz, hızlı servis, profesyonel atmosfer.
-- casual_hangout: Rahat, samimi, arkadaş ortamı.
-- fine_dining: Sunum kalitesi, servis, atmosfer, craft/artisan yaklaşımı. El yapımı lezzetler, butik mekan, şef konsepti = yüksek skor.
-- romantic_dinner: Loş ışık, mahremiyet, özel atmosfer.
-- friends_hangout: Enerjik, sosyal, rahat.
-- family_meal: Çocuk dostu, geniş alan, rahat menü.
-- special_occasion: Kutlama için uygun, özel deneyim sunan.
-- breakfast_brunch: Kahvaltı/brunch için uygunluk.
-- after_work: İş çıkışı için uygun, rahatlatıcı.
-
-practicalInfo Kuralları (GOOGLE SERVİSLERİ + YORUMLAR):
-ÖNEMLİ: "Google Servisler:" bölümünde yer alan bilgiler Google Places API'den geliyor ve doğrulanmış bilgidir. Bu bilgileri öncelikli kullan!
-
-- reservationNeeded: Google'da "Rezervasyon:✓" varsa "Tavsiye Edilir". Yorumlarda "şart", "çok kalabalık" → "Şart"
-- crowdLevel: "Sakin", "sessiz", "rahat" → "Sakin". "Kalabalık", "gürültülü", "dolu" → "Kalabalık"
-- waitTime: "Bekledik", "sıra", "kuyruk" → süreyi tahmin et. Hiç bahsedilmemişse null
-- parking: "Otopark", "park yeri" → "Otopark var". "Park zor", "park yok" → "Zor". "Park kolay" → "Kolay". Hiç bahsedilmemişse null
-- hasValet: "Vale", "valet" → true. Yoksa null
-- outdoorSeating: "Bahçe", "dış mekan", "teras" → true
-- kidFriendly: "Çocuklu", "aile", "çocuk menüsü" → true. "Bar", "gece kulübü" → false
-- vegetarianOptions: Google'da "Vejetaryen:✓" varsa KESİNLİKLE true yaz! Yoksa yorumlardan çıkar
-- alcoholServed: Google'da "Bira:✓" veya "Şarap:✓" varsa KESİNLİKLE true yaz! Yoksa yorumlardan "rakı", "bira", "şarap", "kokteyl" gibi kelimeler varsa true
-- serviceSpeed: "Hızlı", "geç geldi", "bekledik" → ilgili değeri seç
-- priceFeeling: "Pahalı", "ucuz", "fiyatına değer" → seç
-- mustTry: Yorumlarda en çok övülen yemek/içecek (varsa)
-- headsUp: Önemli uyarılar (nakit, kredi kartı, köpek yasak, vb.)
-- hasDelivery: Google'da "Teslimat:✓" varsa true
-- hasTakeout: Google'da "Paket:✓" varsa true
-- servesBreakfast: Google'da "Kahvaltı:✓" varsa true
-- servesBrunch: Google'da "Brunch:✓" varsa true
-
-atmosphereSummary Kuralları:
-- noiseLevel: "Sessiz" (fısıltıyla konuşulur), "Sohbet Dostu" (rahat sohbet), "Canlı" (biraz ses), "Gürültülü" (zor duyulur)
-- lighting: "Loş" (mum ışığı, romantik), "Yumuşak" (orta aydınlık), "Aydınlık" (net görüş)
-- privacy: "Özel" (köşe masalar, separeler), "Yarı Özel" (normal düzen), "Açık Alan" (yakın masalar)
-- energy: "Sakin" (dinlendirici), "Dengeli" (orta tempo), "Enerjik" (hareketli)
-- idealFor: Max 3 seçenek - "romantik akşam", "ilk buluşma", "iş yemeği", "arkadaş buluşması", "aile yemeği", "sessiz sohbet", "kutlama", "solo yemek"
-- notIdealFor: Max 2 seçenek - yukarıdaki listeden
-- oneLiner: Tek cümle Türkçe - atmosfer + kime uygun özeti. Örnek: "Loş ışıklı, samimi köşeleriyle romantik akşam yemekleri için ideal"
-
-Önemli:
-- Bir mekan birden fazla context'te yüksek skor alabilir
-- isRelevant=false olanları JSON'a DAHİL ETME
-- Skor 50'nin altındaysa o context için uygun değil demektir
-- Yorumları dikkate al (atmosfer, kalabalık, servis hakkında ipuçları içerir)
-- vibeTags Türkçe ve # ile başlamalı
-- practicalInfo: ÖNCELİKLE "Google Servisler:" bilgilerini kullan (alcoholServed, vegetarianOptions için). Yoksa yorumlardan çıkar, hiçbiri yoksa null yaz
-- instagramUrl: Mekanın resmi Instagram hesabını bul. Türkiye'deki mekanların Instagram'ı genellikle mekan_ismi, mekanadi, mekanismişehir formatındadır. Örnek: "Atakent Meyhanesi" → "https://instagram.com/atakent_meyhanesi". Bilinen popüler mekanların Instagram'ını ver. Emin olmadığın veya çok küçük/yerel mekanlar için null yaz.
-
-SADECE JSON ARRAY döndür, başka açıklama yazma."""
-
-            try:
-                model = get_genai_model()
-                if model:
-                    response = model.generate_content(batch_prompt)
-                    response_text = response.text.strip()
+    except Exception as e:
+        import traceback
+        logger.warning("Generate venues hatası: %s", e)
+        logger.error("%s", traceback.format_exc())
+        return Response(
+            {'error': f'Mekan önerisi oluşturulurken hata: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
 
-                    # Güvenli JSON parse - trailing comma ve markdown temizle
-                    response_text = clean_json_string(response_text)
 
-                    try:
-                        ai_results = json.loads(response_text)
-                    except json.JSONDecodeError as je:
-                        print(f"⚠️ JSON parse hatası (ilk deneme): {je}", file=sys.stderr, flush=True)
-                        # Array bulmaya çalış
-                        match = re.search(r'\[.*\]', response_text, re.DOTALL)
-                        if match:
-                            try:
-                                ai_results = json.loads(clean_json_string(match.group()))
-                            except json.JSONDecodeError:
-                                print(f"⚠️ JSON array parse edilemedi, fallback kullanılıyor", file=sys.stderr, flush=True)
-                                ai_results = []
-                        else:
-                            print(f"⚠️ JSON array bulunamadı, fallback kullanılıyor", file=sys.stderr, flush=True)
-                            ai_results = []
-
-                    # AI sonuçlarını mekanlarla eşleştir
-                    ai_by_name = {r.get('name', '').lower(): r for r in ai_results}
-
-                    for place in filtered_places[:50]:
-                        ai_data = ai_by_name.get(place['name'].lower(), {})
-
-                        # Uygun değilse skip
-                        if ai_data and not ai_data.get('isRelevant', True):
-                            continue
-
-                        # contextScore'dan ilgili kategorinin skorunu al
-                        context_scores = ai_data.get('contextScore', {})
-                        context_key = CATEGORY_TO_CONTEXT.get(category['name'], 'friends_hangout')
-                        category_match_score = context_scores.get(context_key, 75)
-
-                        venue = {
-                            'id': f"v{place['idx'] + 1}",
-                            'name': place['name'],
-                            'description': ai_data.get('description', f"{category['name']} için harika bir mekan."),
-                            'imageUrl': place['photo_url'] or 'https://images.unsplash.com/photo-1517248135467-4c7edcad34c4?w=800',
-                            'category': category['name'],
-                            'vibeTags': ai_data.get('vibeTags', ['#Popüler', '#Kaliteli']),
-                            'address': place['address'],
-                            'priceRange': place['price_range'],
-                            'googleRating': place['rating'] if place['rating'] > 0 else 4.0,
-                            'googleReviewCount': place.get('review_count', 0),
-                            'noiseLevel': ai_data.get('noiseLevel', 50),
-                            'matchScore': category_match_score,
-                            'contextScore': context_scores,
-                            'bestTimeSlots': ai_data.get('bestTimeSlots', []),
-                            'googleMapsUrl': place['google_maps_url'],
-                            'googleReviews': place.get('google_reviews', []),
-                            'website': place.get('website', ''),
-                            'instagramUrl': (
-                                find_instagram_simple(
-                                    venue_name=place['name'],
-                                    neighborhood=selected_neighborhood,
-                                    city=city
-                                ) if category['name'] == 'Meyhane' else discover_instagram_url(
-                                    venue_name=place['name'],
-                                    city=city,
-                                    website=place.get('website'),
-                                    existing_instagram=ai_data.get('instagramUrl'),
-                                    district=selected_district,
-                                    neighborhood=selected_neighborhood
-                                )
-                            ) or '',
-                            'phoneNumber': place.get('phone_number', ''),
-                            'hours': place.get('hours', ''),
-                            'weeklyHours': place.get('weeklyHours', []),
-                            'isOpenNow': place.get('isOpenNow', None),
-                            'isMichelinStarred': is_michelin_restaurant(place['name']) is not None,
-                            'practicalInfo': ai_data.get('practicalInfo', {}),
-                            'foodServices': place.get('food_services', {}),  # Google'dan gelen yemek servis bilgileri
-                            'atmosphereSummary': ai_data.get('atmosphereSummary', {
-                                'noiseLevel': 'Sohbet Dostu',
-                                'lighting': 'Yumuşak',
-                                'privacy': 'Yarı Özel',
-                                'energy': 'Dengeli',
-                                'idealFor': [],
-                                'notIdealFor': [],
-                                'oneLiner': ''
-                            })
-                        }
-
-                        # contextScore'dan bestFor oluştur (70+ skorlu context'ler)
-                        best_for = []
-                        context_to_label = {
-                            'first_date': 'İlk Buluşma',
-                            'romantic_dinner': 'Romantik Akşam',
-                            'business_meal': 'İş Yemeği',
-                            'friends_hangout': 'Arkadaşlarla',
-                            'family_meal': 'Aile',
-                            'special_occasion': 'Özel Gün',
-                            'fine_dining': 'Fine Dining',
-                            'breakfast_brunch': 'Kahvaltı',
-                            'after_work': 'İş Çıkışı'
-                        }
-                        for ctx, score in context_scores.items():
-                            if score >= 70 and ctx in context_to_label:
-                                best_for.append(context_to_label[ctx])
-                        venue['bestFor'] = best_for[:4]  # Max 4 tane
-
-                        venues.append(venue)
-
-                    print(f"✅ Gemini batch sonucu: {len(venues)} mekan", file=sys.stderr, flush=True)
+# search_venues Place Details field mask (build_search_venue_data'nın okuduğu alanlar)
+SEARCH_DETAILS_FIELDS = ['name', 'formatted_address', 'rating', 'photo', 'type', 'price_level']
 
-            except Exception as e:
-                print(f"❌ Gemini batch hatası: {e}", file=sys.stderr, flush=True)
-                # Fallback: Gemini olmadan mekanları ekle
-                for place in filtered_places[:50]:
-                    venue = {
-                        'id': f"v{place['idx'] + 1}",
-                        'name': place['name'],
-                        'description': f"{category['name']} için harika bir mekan seçeneği.",
-                        'imageUrl': place['photo_url'] or 'https://images.unsplash.com/photo-1517248135467-4c7edcad34c4?w=800',
-                        'category': category['name'],
-                        'vibeTags': ['#Popüler', '#Kaliteli'],
-                        'address': place['address'],
-                        'priceRange': place['price_range'],
-                        'googleRating': place['rating'] if place['rating'] > 0 else 4.0,
-                        'googleReviewCount': place.get('review_count', 0),
-                        'noiseLevel': 50,
-                        'matchScore': 75,
-                        'googleMapsUrl': place['google_maps_url'],
-                        'googleReviews': place.get('google_reviews', []),
-                        'website': place.get('website', ''),
-                        'instagramUrl': (
-                            find_instagram_simple(
-                                venue_name=place['name'],
-                                neighborhood=selected_neighborhood,
-                                city=city
-                            ) if category['name'] == 'Meyhane' else discover_instagram_url(
-                                venue_name=place['name'],
-                                city=city,
-                                website=place.get('website'),
-                                existing_instagram=None,
-                                district=selected_district,
-                                neighborhood=selected_neighborhood
-                            )
-                        ) or '',
-                        'phoneNumber': place.get('phone_number', ''),
-                        'hours': place.get('hours', ''),
-                        'weeklyHours': place.get('weeklyHours', []),
-                        'isOpenNow': place.get('isOpenNow', None),
-                        'isMichelinStarred': is_michelin_restaurant(place['name']) is not None,
-                        'practicalInfo': {},
-                        'foodServices': place.get('food_services', {}),  # Google'dan gelen yemek servis bilgileri
-                        'atmosphereSummary': {
-                            'noiseLevel': 'Sohbet Dostu',
-                            'lighting': 'Yumuşak',
-                            'privacy': 'Yarı Özel',
-                            'energy': 'Dengeli',
-                            'idealFor': [],
-                            'notIdealFor': [],
-                            'oneLiner': ''
-                        }
-                    }
-                    venues.append(venue)
-
-        # Match score'a göre sırala
-        venues.sort(key=lambda x: x['matchScore'], reverse=True)
-
-        print(f"DEBUG - API'den gelen venues: {len(venues)}", file=sys.stderr, flush=True)
-
-        # ===== API VENUE'LARINI CACHE'E KAYDET =====
-        if venues:
-            neighborhoods = location.get('neighborhoods', [])
-            selected_neighborhood = neighborhoods[0] if neighborhoods else None
-            save_venues_to_cache(
-                venues=venues,
-                category_name=category['name'],
-                city=city,
-                district=selected_district,
-                neighborhood=selected_neighborhood
-            )
 
-        # ===== HYBRID: CACHE + API VENUE'LARINI BİRLEŞTİR =====
-        # Load More durumunda SADECE API'den gelen yeni mekanları döndür
-        # Normal durumda Cache + API birleştir
-        combined_venues = []
-
-        if is_load_more_request:
-            # LOAD MORE: Sadece API'den gelen yeni mekanları döndür
-            # excludeIds zaten cache + mevcut mekanları içeriyor, API sadece yenileri getirir
-            for av in venues:
-                if len(combined_venues) < 50:
-                    combined_venues.append(av)
-            print(f"🔄 LOAD MORE RESULT - API'den {len(combined_venues)} yeni mekan döndürülüyor", file=sys.stderr, flush=True)
-        else:
-            # NORMAL: Önce cache'ten gelenleri ekle
-            existing_names = set()  # İsim bazlı duplicate kontrolü
-            for cv in cached_venues:
-                if len(combined_venues) < 50:
-                    combined_venues.append(cv)
-                    existing_names.add(cv.get('name', '').lower().strip())
-
-            # Sonra API'den gelenleri ekle (ID ve isim bazlı duplicate kontrolü)
-            existing_ids = {v.get('id') for v in combined_venues}
-            for av in venues:
-                av_name = av.get('name', '').lower().strip()
-                if len(combined_venues) < 50 and av.get('id') not in existing_ids and av_name not in existing_names:
-                    combined_venues.append(av)
-                    existing_ids.add(av.get('id'))
-                    existing_names.add(av_name)
-
-            print(f"🔀 HYBRID RESULT - Cache: {len(cached_venues)}, API: {len(venues)}, Combined: {len(combined_venues)}", file=sys.stderr, flush=True)
-
-        # G&M venue'larını Michelin öncelikli sırala ve başa ekle (varsa ve LoadMore değilse)
-        if gm_venues and not is_load_more_request:
-            # G&M mekanlarını Gemini ile zenginleştir
-            enriched_gm = enrich_gm_venues_with_gemini(gm_venues, category_name)
-
-            # Hem G&M hem Michelin olan mekanlara Michelin badge ekle
-            for gv in enriched_gm:
-                michelin_check = is_michelin_restaurant(gv.get('name', ''))
-                if michelin_check:
-                    gv['isMichelinStarred'] = True
-                    gv['michelinStars'] = michelin_check.get('stars', 0)
-                    gv['isBibGourmand'] = michelin_check.get('isBib', False)
-
-            # G&M venue ID ve isimlerini al
-            gm_ids = {v.get('id') for v in enriched_gm if v.get('id')}
-            gm_names = {v.get('name', '').lower().strip() for v in enriched_gm}
-            # combined_venues'dan G&M ID ve isimlerini çıkar (duplicate önleme)
-            combined_venues = [v for v in combined_venues if v.get('id') not in gm_ids and v.get('name', '').lower().strip() not in gm_names]
-
-            # Michelin > G&M sıralaması
-            def michelin_gm_sort_key(venue):
-                is_michelin = venue.get('isMichelinStarred', False)
-                michelin_stars = venue.get('michelinStars', 0)
-                is_bib = venue.get('isBibGourmand', False)
-                gm_toques = venue.get('gaultMillauToques', 0) or 0
-                rating = venue.get('googleRating', 0) or 0
-
-                if is_michelin and michelin_stars > 0:
-                    return (0, -michelin_stars, -rating)
-                elif is_bib:
-                    return (1, 0, -rating)
-                else:
-                    return (2, -gm_toques, -rating)
-
-            enriched_gm.sort(key=michelin_gm_sort_key)
-
-            # G&M'leri başa ekle, kalan slotları doldur
-            remaining_slots = 50 - len(enriched_gm)
-            combined_venues = enriched_gm + combined_venues[:remaining_slots]
-
-            michelin_in_gm = sum(1 for v in enriched_gm if v.get('isMichelinStarred'))
-            print(f"🏆 G&M PREPEND (HYBRID) - {len(enriched_gm)} G&M venue başa eklendi (Michelin: {michelin_in_gm})", file=sys.stderr, flush=True)
-
-        # Arama geçmişine kaydet
-        if request.user.is_authenticated:
-            SearchHistory.objects.create(
-                user=request.user,
-                query=search_query,
-                intent=category['name'],
-                location=search_location,
-                results_count=len(combined_venues)
-            )
+def build_search_venue_data(place_id, place_details):
+    """Place Details sonucunu search_venues response formatına çevirir"""
+    # Fotoğraf URL'si oluştur
+    photo_url = None
+    if place_details.get('photos'):
+        photo_ref = place_details['photos'][0]['photo_reference']
+        photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
 
-        # Gault & Millau bilgisi ekle
-        combined_venues = enrich_venues_with_gault_millau(combined_venues)
-
-        # Instagram URL ekle (eksikse) - Google CSE ile arama
-        combined_venues = enrich_venues_with_instagram(combined_venues, city, selected_district, selected_neighborhood)
-
-        # ===== OCAKBAŞI KATEGORİSİ İÇİN MİNİMUM RATİNG FİLTRESİ =====
-        # Gemini prompt'u takip etmese bile, 3.9 altındaki puanlı mekanları filtrele
-        if category.get('name') == 'Ocakbaşı':
-            original_count = len(combined_venues)
-            combined_venues = [v for v in combined_venues if v.get('googleRating', 0) >= 3.9]
-            filtered_count = original_count - len(combined_venues)
-            if filtered_count > 0:
-                print(f"🔒 OCAKBAŞI HARD FİLTER - {filtered_count} mekan çıkarıldı (rating < 3.9)", file=sys.stderr, flush=True)
+    return {
+        'place_id': place_id,
+        'name': place_details.get('name', ''),
+        'address': place_details.get('formatted_address', ''),
+        'rating': place_details.get('rating'),
+        'photo_url': photo_url,
+        'types': place_details.get('types', []),
+        'price_level': place_details.get('price_level'),
+    }
 
-        return Response(combined_venues, status=status.HTTP_200_OK)
 
-    except Exception as e:
-        import traceback
-        print(f"Generate venues hatası: {e}")
-        print(traceback.format_exc())
-        return Response(
-            {'error': f'Mekan önerisi oluşturulurken hata: {str(e)}'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+def _search_response(request, query, location, venues, source):
+    """Arama geçmişini kaydet (after-response) ve search_venues cevabını döndür."""
+    if request.user.is_authenticated:
+        defer(
+            SearchHistory.objects.create,
+            user=request.user,
+            query=query,
+            intent=query,  # Gemini ile intent analizi yapılabilir
+            location=location,
+            results_count=len(venues)
         )
 
+    return Response({
+        'query': query,
+        'location': location,
+        'source': source,  # 'cache' (yerel full-text indeks) ya da 'places'
+        'results': venues
+    })
+
 
 @api_view(['POST'])
 @permission_classes([permissions.AllowAny])
 def search_venues(request):
-    """Venue arama endpoint'i - Google Places + Gemini entegrasyonu"""
+    """Venue arama endpoint'i - önce yerel full-text indeks, yetersizse Google Places + Gemini"""
     serializer = VenueSearchSerializer(data=request.data)
     if not serializer.is_valid():
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -6980,6 +1729,12 @@ def search_venues(request):
     radius = serializer.validated_data['radius']
 
     try:
+        # Önce cache'teki mekanlar üzerinde full-text arama; yeterli sonuç varsa Places'a gidilmez
+        with span('search.local'):
+            venues = search_cached_venues(query, location)
+        if venues is not None:
+            return _search_response(request, query, location, venues, source='cache')
+
         # Google Places API'den mekan arama
         gmaps = get_gmaps_client()
         if not gmaps:
@@ -6995,86 +1750,28 @@ def search_venues(request):
             language='tr'
         )
 
-        venues = []
-        for place in places_result.get('results', [])[:10]:  # İlk 10 sonuç
-            # Her mekan için detay al
-            place_id = place['place_id']
-            details = gmaps.place(place_id, language='tr')
-            place_details = details.get('result', {})
-
-            # Fotoğraf URL'si oluştur
-            photo_url = None
-            if place_details.get('photos'):
-                photo_ref = place_details['photos'][0]['photo_reference']
-                photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
-
-            venue_data = {
-                'place_id': place_id,
-                'name': place_details.get('name', ''),
-                'address': place_details.get('formatted_address', ''),
-                'rating': place_details.get('rating'),
-                'photo_url': photo_url,
-                'types': place_details.get('types', []),
-                'price_level': place_details.get('price_level'),
-            }
+        places = places_result.get('results', [])[:10]  # İlk 10 sonuç
+        model = get_genai_model()
 
-            # Gemini ile vibe analizi
-            try:
-                vibe_prompt = f"""
-                Mekan: {venue_data['name']}
-                Adres: {venue_data['address']}
-                Kategoriler: {', '.join(venue_data['types'][:5])}
-                Rating: {venue_data['rating']}
-
-                Bu mekanın vibe'ını analiz et ve şu kategorilerde 0-10 arası puan ver:
-                - romantic (romantik)
-                - casual (rahat, gündelik)
-                - professional (iş toplantısı için uygun)
-                - social (arkadaşlarla takılmak için)
-                - quiet (sessiz, sakin)
-                - energetic (enerjik, hareketli)
-
-                JSON formatında döndür: {{"romantic": 8, "casual": 5, ...}}
-                """
-
-                model = get_genai_model()
-                if not model:
-                    raise Exception("Gemini API key eksik")
-                response = model.generate_content(vibe_prompt)
-
-                # JSON parse et (basit versiyon)
-                import json
-                vibe_text = response.text.strip()
-                # JSON'u extract et
-                if '{' in vibe_text and '}' in vibe_text:
-                    json_start = vibe_text.index('{')
-                    json_end = vibe_text.rindex('}') + 1
-                    vibe_scores = json.loads(vibe_text[json_start:json_end])
-                    venue_data['vibe_score'] = vibe_scores
-                else:
-                    venue_data['vibe_score'] = {}
+        def fetch_details(place):
+            return gmaps.place(place['place_id'], fields=SEARCH_DETAILS_FIELDS, language='tr').get('result', {})
 
-            except Exception as e:
-                print(f"Vibe analizi hatası: {e}")
-                venue_data['vibe_score'] = {}
+        # Tüm detay çağrıları ve tek batch vibe çağrısı (Text Search verisiyle) aynı anda
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(places) + 1) as pool:
+            vibes_future = pool.submit(
+                bind(analyze_vibes), model, [build_search_venue_data(p['place_id'], p) for p in places]
+            )
+            details_list = list(pool.map(bind(fetch_details), places))
+            vibes = vibes_future.result()
 
+        venues = []
+        for place, details in zip(places, details_list):
+            venue_data = build_search_venue_data(place['place_id'], details)
+            venue_data['vibe_score'] = vibes.get(place['place_id'], {})
             venues.append(venue_data)
 
-        # Arama geçmişine kaydet
-        if request.user.is_authenticated:
-            SearchHistory.objects.create(
-                user=request.user,
-                query=query,
-                intent=query,  # Gemini ile intent analizi yapılabilir
-                location=location,
-                results_count=len(venues)
-            )
-
-        return Response({
-            'query': query,
-            'location': location,
-            'results': venues
-        })
+        return _search_response(request, query, location, venues, source='places')
 
     except Exception as e:
         return Response(
@@ -7083,12 +1780,66 @@ def search_venues(request):
         )
 
 
+# Venue type -> Places arama sorgusu (benzer mekanlar için)
+SIMILAR_TYPE_QUERY_MAP = {
+    'breakfast': 'breakfast cafe brunch',
+    'lunch': 'lunch restaurant trattoria',
+    'dinner': 'dinner restaurant fine dining',
+    'cafe': 'cafe coffee shop',
+    'bar': 'bar pub cocktail',
+    'dessert': 'dessert gelato pastry',
+    'activity': 'attraction tourist spot',
+}
+
+
+def build_similar_venue(idx, place, venue_type, location_query, ai_data=None):
+    """Text Search sonucunu benzer mekan kartına çevirir"""
+    place_name = place.get('name', '')
+    place_address = place.get('formatted_address', '')
+    place_rating = place.get('rating', 0)
+
+    # Fotoğraf URL'si (Legacy API)
+    photo_url = None
+    if place.get('photos') and len(place['photos']) > 0:
+        photo_ref = place['photos'][0].get('photo_reference', '')
+        if photo_ref:
+            photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
+
+    # Fiyat seviyesi (Legacy API: 0-4 integer)
+    price_level = place.get('price_level', 2)
+    price_map = {0: '$', 1: '$', 2: '$$', 3: '$$$', 4: '$$$$'}
+    price_range = price_map.get(price_level, '$$')
+
+    ai_data = ai_data or {}
+    description = ai_data.get('description', f"{place_name}, {location_query} bölgesinde harika bir {venue_type} seçeneği.")
+    vibe_tags = ai_data.get('vibeTags', ['#Popüler', '#Kaliteli'])
+
+    return {
+        'id': f'similar_{idx + 1}',
+        'name': place_name,
+        'description': description,
+        'imageUrl': photo_url or 'https://images.unsplash.com/photo-1517248135467-4c7edcad34c4',
+        'category': venue_type.capitalize(),
+        'vibeTags': vibe_tags,
+        'address': place_address,
+        'priceRange': price_range,
+        'googleRating': place_rating if place_rating > 0 else 4.0,
+        'noiseLevel': 50,
+        'matchScore': int(place_rating * 20) if place_rating > 0 else 80,
+        'metrics': {
+            'noise': 50,
+            'light': 60,
+            'privacy': 55,
+            'service': 70,
+            'energy': 65
+        }
+    }
+
+
 @api_view(['POST'])
 @permission_classes([permissions.AllowAny])
 def get_similar_venues(request):
     """Tatil aktivitesi için benzer mekanlar getir (Google Places API)"""
-    import json
-
     venue_name = request.data.get('venueName')
     venue_type = request.data.get('venueType')  # 'breakfast', 'lunch', 'dinner', 'cafe', 'bar', etc.
     location_query = request.data.get('location')  # 'Roma, İtalya'
@@ -7099,19 +1850,14 @@ def get_similar_venues(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
+    # Aynı şehir + tür için sonuç cache'i (similar_service)
+    cached = get_cached_similar(location_query, venue_type)
+    if cached is not None:
+        return Response(cached, status=status.HTTP_200_OK)
+
     try:
         # Venue type'a göre arama sorgusu oluştur
-        type_query_map = {
-            'breakfast': 'breakfast cafe brunch',
-            'lunch': 'lunch restaurant trattoria',
-            'dinner': 'dinner restaurant fine dining',
-            'cafe': 'cafe coffee shop',
-            'bar': 'bar pub cocktail',
-            'dessert': 'dessert gelato pastry',
-            'activity': 'attraction tourist spot',
-        }
-
-        search_type = type_query_map.get(venue_type, 'restaurant cafe')
+        search_type = SIMILAR_TYPE_QUERY_MAP.get(venue_type, 'restaurant cafe')
 
         # Google Places API ile benzer mekanlar ara (Legacy API)
         import requests
@@ -7122,7 +1868,7 @@ def get_similar_venues(request):
             "key": settings.GOOGLE_MAPS_API_KEY
         }
 
-        response = requests.get(url, params=params)
+        response = requests.get(url, params=params, timeout=10)
 
         if response.status_code != 200:
             return Response(
@@ -7133,159 +1879,72 @@ def get_similar_venues(request):
         places_data = response.json()
         places = places_data.get('results', [])
 
-        # Her mekan için Gemini ile detaylı analiz
-        similar_venues = []
-        model = get_genai_model()
-
-        for idx, place in enumerate(places[:8]):  # İlk 8 mekan
-            place_name = place.get('name', '')
-            place_address = place.get('formatted_address', '')
-            place_rating = place.get('rating', 0)
-
-            # Fotoğraf URL'si (Legacy API)
-            photo_url = None
-            if place.get('photos') and len(place['photos']) > 0:
-                photo_ref = place['photos'][0].get('photo_reference', '')
-                if photo_ref:
-                    photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={settings.GOOGLE_MAPS_API_KEY}"
-
-            # Fiyat seviyesi (Legacy API: 0-4 integer)
-            price_level = place.get('price_level', 2)
-            price_map = {0: '$', 1: '$', 2: '$$', 3: '$$$', 4: '$$$$'}
-            price_range = price_map.get(price_level, '$$')
-
-            # Gemini ile açıklama oluştur
-            description = f"{place_name}, {location_query} bölgesinde harika bir {venue_type} seçeneği."
-            vibe_tags = ['#Popüler', '#Kaliteli']
+        # Tüm adaylar için tek batch Gemini çağrısı (açıklamalar place_id bazında cache'li)
+        places = places[:8]  # İlk 8 mekan
+        ai_data = describe_places(get_genai_model(), places, venue_type)
 
-            if model:
-                try:
-                    description_prompt = f"""
-                    Mekan: {place_name}
-                    Adres: {place_address}
-                    Kategori: {venue_type}
-                    Rating: {place_rating}
-
-                    Bu mekan için:
-                    1. 2 cümlelik Türkçe açıklama yaz (neden bu mekana gidilmeli?)
-                    2. 3 adet vibe tag öner (örn: #Romantik, #Yerel, #Lüks)
-
-                    JSON formatında döndür:
-                    {{
-                        "description": "...",
-                        "vibeTags": ["#Tag1", "#Tag2", "#Tag3"]
-                    }}
-                    """
-
-                    ai_response = model.generate_content(description_prompt)
-                    ai_text = ai_response.text.strip()
-
-                    if '```json' in ai_text:
-                        ai_text = ai_text.split('```json')[1].split('```')[0].strip()
-                    elif '```' in ai_text:
-                        ai_text = ai_text.split('```')[1].split('```')[0].strip()
-
-                    ai_data = json.loads(ai_text)
-                    description = ai_data.get('description', description)
-                    vibe_tags = ai_data.get('vibeTags', vibe_tags)
-                except:
-                    pass
-
-            venue_obj = {
-                'id': f'similar_{idx + 1}',
-                'name': place_name,
-                'description': description,
-                'imageUrl': photo_url or 'https://images.unsplash.com/photo-1517248135467-4c7edcad34c4',
-                'category': venue_type.capitalize(),
-                'vibeTags': vibe_tags,
-                'address': place_address,
-                'priceRange': price_range,
-                'googleRating': place_rating if place_rating > 0 else 4.0,
-                'noiseLevel': 50,
-                'matchScore': int(place_rating * 20) if place_rating > 0 else 80,
-                'metrics': {
-                    'noise': 50,
-                    'light': 60,
-                    'privacy': 55,
-                    'service': 70,
-                    'energy': 65
-                }
-            }
-
-            similar_venues.append(venue_obj)
+        similar_venues = [
+            build_similar_venue(idx, place, venue_type, location_query, ai_data.get(place.get('place_id')))
+            for idx, place in enumerate(places)
+        ]
+        # Açıklaması eksik (Gemini hatası) sonuç cache'lenmez, bir sonraki istek tekrar dener
+        if len(ai_data) == len(places):
+            cache_similar(location_query, venue_type, similar_venues)
 
         return Response(similar_venues, status=status.HTTP_200_OK)
 
     except Exception as e:
         import traceback
-        print(f"Similar venues hatası: {e}")
-        print(traceback.format_exc())
+        logger.warning("Similar venues hatası: %s", e)
+        logger.error("%s", traceback.format_exc())
         return Response(
             {'error': f'Benzer mekanlar getirilirken hata: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
 
-class FavoriteVenueViewSet(viewsets.ModelViewSet):
-    """Favori mekanlar CRUD işlemleri"""
-    serializer_class = FavoriteVenueSerializer
-    permission_classes = [permissions.IsAuthenticated]
-
-    def get_queryset(self):
-        return FavoriteVenue.objects.filter(user=self.request.user)
-
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
-
-
-class SearchHistoryViewSet(viewsets.ReadOnlyModelViewSet):
-    """Arama geçmişi görüntüleme"""
-    serializer_class = SearchHistorySerializer
-    permission_classes = [permissions.IsAuthenticated]
-
-    def get_queryset(self):
-        return SearchHistory.objects.filter(user=self.request.user)
-
-
-class UserProfileViewSet(viewsets.ModelViewSet):
-    """Kullanıcı profili yönetimi"""
-    serializer_class = UserProfileSerializer
-    permission_classes = [permissions.IsAuthenticated]
-
-    def get_queryset(self):
-        return UserProfile.objects.filter(user=self.request.user)
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+def more_like_this_venue(request, place_id):
+    """
+    Cache'teki bir mekana en çok benzeyen mekanlar (aynı şehir, yerel benzerlik indeksi).
+    Query: k (varsayılan 10, en fazla 50), sameCategory=true → sadece aynı kategori.
+    Dış API çağrısı yapılmaz; mekan cache'te yoksa 404.
+    """
+    try:
+        k = int(request.query_params.get('k', DEFAULT_NEIGHBOURS))
+    except ValueError:
+        return Response({'error': 'k bir sayı olmalı'}, status=status.HTTP_400_BAD_REQUEST)
+    same_category = request.query_params.get('sameCategory', '').lower() == 'true'
 
-    @action(detail=False, methods=['get'])
-    def me(self, request):
-        """Mevcut kullanıcının profilini getir"""
-        profile, _ = UserProfile.objects.get_or_create(user=request.user)
-        serializer = self.get_serializer(profile)
-        return Response(serializer.data)
+    with span('similarity.query'):
+        result = more_like_this(place_id, k, same_category)
+    if result is None:
+        return Response({'error': 'Mekan cache\'te bulunamadı'}, status=status.HTTP_404_NOT_FOUND)
 
+    source, neighbours = result
+    return Response({
+        'venue': public_venue(source),
+        'similar': [{**public_venue(venue), 'similarity': score} for venue, score in neighbours],
+    }, status=status.HTTP_200_OK)
 
-# =====================================================
-# ADMIN / DEBUG ENDPOINT'LERİ
-# =====================================================
 
-@api_view(['POST'])
-def clear_instagram_cache_view(request):
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+def autocomplete(request):
     """
-    Instagram in-memory cache'ini temizle.
-    Google CSE ile yeni arama yapılmasını sağlar.
-
-    Kullanım: POST /api/admin/clear-instagram-cache/
+    Mekan adı / ilçe / semt prefix önerileri (bellekteki sıralı indeks, dış çağrı yok).
+    Query: q (en az 2 karakter), city (opsiyonel filtre), limit (varsayılan 8, en fazla 20).
     """
-    result = clear_instagram_cache()
-    return Response(result, status=status.HTTP_200_OK)
-
+    query = request.query_params.get('q', '')
+    try:
+        limit = int(request.query_params.get('limit', AUTOCOMPLETE_LIMIT))
+    except ValueError:
+        return Response({'error': 'limit bir sayı olmalı'}, status=status.HTTP_400_BAD_REQUEST)
 
-@api_view(['GET'])
-def instagram_cse_status(request):
-    """
-    Google CSE yapılandırma durumunu göster.
-    Debug için kullanılır.
+    suggestions = suggest(query, request.query_params.get('city') or None, limit)
+    return Response({
+        'query': query,
+        'suggestions': [suggestion.to_dict() for suggestion in suggestions],
+    }, status=status.HTTP_200_OK)
 
-    Kullanım: GET /api/admin/instagram-cse-status/
-    """
-    cse_status = get_cse_status()
-    return Response(cse_status, status=status.HTTP_200_OK)
@@ -2,11 +2,14 @@
 # Optimized for free tier cold start issues
 
 import multiprocessing
+import os
 
 # Worker configuration
 workers = 2  # Free tier'da 2 worker yeterli, daha fazla memory kullanır
-worker_class = "sync"  # Sync worker daha stabil
-threads = 2  # Her worker için 2 thread
+# ASGI modu: GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker + maksat_backend.asgi:application
+# Async worker'da Gemini/Places I/O await edilir, yavaş istekler worker'ı kilitlemez
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', "sync")  # Sync worker daha stabil
+threads = 2  # Her worker için 2 thread (sadece sync/gthread worker'da geçerli)
 
 # Timeout configuration
 timeout = 120  # Gemini API çağrıları uzun sürebilir
@@ -0,0 +1,15 @@
+"""
+ASGI config for maksat_backend project.
+
+Async venue endpoint'leri (api/async_views.py) bu entry point ile devreye girer:
+    gunicorn maksat_backend.asgi:application --config gunicorn.conf.py -k uvicorn.workers.UvicornWorker
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'maksat_backend.settings')
+os.environ.setdefault('ASYNC_VIEWS', 'True')
+
+application = get_asgi_application()